@@ -244,6 +244,39 @@ class BrowserAutomation:
         except Exception:
             return False
 
+    def measure_time_to_interactive(self, cold: bool = False, timeout: int = APP_READY_TIMEOUT) -> Optional[float]:
+        """Load the application and time how long it takes to become ready.
+
+        A cold load first clears the HTTP cache and the origin's storage, which
+        holds Brython's compiled-module cache; a warm load reuses both.
+
+        Args:
+            cold: Clear caches before loading.
+            timeout: Maximum seconds to wait for readiness.
+
+        Returns:
+            Milliseconds from navigation start until window.startMatHudTests
+            is defined, or None if the app did not load.
+        """
+        if self.driver is None:
+            raise RuntimeError("Browser not initialized. Call setup() first.")
+
+        if cold:
+            self.driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+            self.driver.execute_cdp_cmd(
+                "Storage.clearDataForOrigin",
+                {"origin": self.base_url, "storageTypes": "all"},
+            )
+        if not self.navigate_to_app():
+            return None
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.05).until(
+                lambda d: d.execute_script("return typeof window.startMatHudTests === 'function'")
+            )
+        except Exception:
+            return None
+        return float(self.driver.execute_script("return performance.now()"))
+
     def wait_for_element(
         self,
         selector: str,
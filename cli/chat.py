@@ -12,7 +12,7 @@ from typing import Any, Optional
 import click
 import requests
 
-from cli.config import DEFAULT_HOST, DEFAULT_PORT
+from cli.config import DEFAULT_HOST, DEFAULT_PORT, SESSION_ENV_VAR, SESSION_HEADER
 from cli.server import ServerManager
 
 
@@ -27,11 +27,17 @@ def check_server(host: str, port: int) -> bool:
     return manager.is_server_running()
 
 
+def session_headers(session: Optional[str]) -> dict[str, str]:
+    """Headers selecting a server-side conversation; without a session the shared one is used."""
+    return {SESSION_HEADER: session} if session else {}
+
+
 def send_message_stream(
     message: str,
     port: int,
     model: Optional[str] = None,
     use_vision: bool = False,
+    session: Optional[str] = None,
 ) -> None:
     """Send a message and stream the response.
 
@@ -40,6 +46,7 @@ def send_message_stream(
         port: Server port number.
         model: Optional AI model to use.
         use_vision: Whether to include canvas snapshot for vision.
+        session: Optional conversation session id.
     """
     base_url = get_api_base(DEFAULT_HOST, port)
 
@@ -59,6 +66,7 @@ def send_message_stream(
         with requests.post(
             f"{base_url}/send_message_stream",
             json=payload,
+            headers=session_headers(session),
             stream=True,
             timeout=300,  # 5 minute timeout for streaming
         ) as response:
@@ -129,6 +137,7 @@ def send_message_sync(
     port: int,
     model: Optional[str] = None,
     use_vision: bool = False,
+    session: Optional[str] = None,
 ) -> dict[str, Any]:
     """Send a message and wait for the complete response.
 
@@ -137,6 +146,7 @@ def send_message_sync(
         port: Server port number.
         model: Optional AI model to use.
         use_vision: Whether to include canvas snapshot for vision.
+        session: Optional conversation session id.
 
     Returns:
         Response data dictionary.
@@ -159,6 +169,7 @@ def send_message_sync(
         response = requests.post(
             f"{base_url}/send_message",
             json=payload,
+            headers=session_headers(session),
             timeout=120,
         )
         response.raise_for_status()
@@ -206,6 +217,12 @@ def chat() -> None:
     is_flag=True,
     help="Output response as JSON (implies --no-stream)",
 )
+@click.option(
+    "--session",
+    "-s",
+    envvar=SESSION_ENV_VAR,
+    help=f"Conversation session id (8-64 of A-Z a-z 0-9 _ -; env: {SESSION_ENV_VAR})",
+)
 def send(
     message: str,
     port: int,
@@ -213,6 +230,7 @@ def send(
     vision: bool,
     no_stream: bool,
     as_json: bool,
+    session: Optional[str],
 ) -> None:
     """Send a message to the AI assistant.
 
@@ -225,6 +243,8 @@ def send(
       mathud chat send "Draw a circle with center A and radius 50" --vision
 
       mathud chat send "What is the derivative of x^2?" --model gpt-4o
+
+      mathud chat send "Plot sin(x)" --session agent-run-01
     """
     if not check_server(DEFAULT_HOST, port):
         click.echo(click.style(f"Server is not running on port {port}", fg="red"), err=True)
@@ -234,7 +254,7 @@ def send(
         no_stream = True
 
     if no_stream:
-        result = send_message_sync(message, port, model=model, use_vision=vision)
+        result = send_message_sync(message, port, model=model, use_vision=vision, session=session)
 
         if as_json:
             click.echo(json.dumps(result, indent=2))
@@ -255,7 +275,7 @@ def send(
                     args = tc.get("arguments", {})
                     click.echo(f"  - {name}: {json.dumps(args)}")
     else:
-        send_message_stream(message, port, model=model, use_vision=vision)
+        send_message_stream(message, port, model=model, use_vision=vision, session=session)
 
 
 @chat.command("new")
@@ -266,7 +286,13 @@ def send(
     type=int,
     help=f"Server port (default: {DEFAULT_PORT})",
 )
-def new_conversation(port: int) -> None:
+@click.option(
+    "--session",
+    "-s",
+    envvar=SESSION_ENV_VAR,
+    help=f"Conversation session id to reset (env: {SESSION_ENV_VAR})",
+)
+def new_conversation(port: int, session: Optional[str]) -> None:
     """Start a new conversation (clear chat history)."""
     if not check_server(DEFAULT_HOST, port):
         click.echo(click.style(f"Server is not running on port {port}", fg="red"), err=True)
@@ -275,6 +301,7 @@ def new_conversation(port: int) -> None:
     try:
         response = requests.post(
             f"{get_api_base(DEFAULT_HOST, port)}/new_conversation",
+            headers=session_headers(session),
             timeout=10,
         )
         response.raise_for_status()
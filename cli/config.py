@@ -16,6 +16,10 @@ DEFAULT_PORT = 5000
 # PID file for tracking server process
 PID_FILE = PROJECT_ROOT / ".mathud_server.pid"
 
+# Conversation session settings (each session id gets its own AI conversation on the server)
+SESSION_HEADER = "X-MatHud-Session"
+SESSION_ENV_VAR = "MATHUD_SESSION"
+
 # Health check settings
 HEALTH_CHECK_TIMEOUT = 5  # seconds
 HEALTH_CHECK_RETRIES = 60  # number of retries when waiting for server (60 seconds max)
@@ -36,6 +40,8 @@ CLIENT_TEST_POLL_INTERVAL = 2  # seconds between polling for results
 DEFAULT_VIEWPORT_WIDTH = 1920
 DEFAULT_VIEWPORT_HEIGHT = 1080
 DEFAULT_SCREENSHOT_FORMAT = "png"
+DEFAULT_RENDER_WIDTH = 800
+DEFAULT_RENDER_HEIGHT = 600
 
 # Workspace directory
 WORKSPACES_DIR = PROJECT_ROOT / "workspaces"
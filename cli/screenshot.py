@@ -1,14 +1,17 @@
 """Screenshot capture commands for the MatHud CLI.
 
-Provides commands for capturing screenshots of the MatHud application.
+Provides commands for capturing screenshots of the MatHud application, and
+for rendering saved canvas states on the server without a browser.
 Screenshots are saved to cli/output/ by default.
 """
 
 from __future__ import annotations
 
+import json
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional
 
 import click
 
@@ -16,6 +19,8 @@ from cli.browser import BrowserAutomation
 from cli.config import (
     CLI_OUTPUT_DIR,
     DEFAULT_PORT,
+    DEFAULT_RENDER_HEIGHT,
+    DEFAULT_RENDER_WIDTH,
     DEFAULT_VIEWPORT_HEIGHT,
     DEFAULT_VIEWPORT_WIDTH,
 )
@@ -115,8 +120,6 @@ def capture(
 
       mathud screenshot capture --width 2560 --height 1440
     """
-    import time
-
     manager = ServerManager(port=port)
     if not manager.is_server_running():
         click.echo(click.style(f"Server is not running on port {port}", fg="red"), err=True)
@@ -166,3 +169,97 @@ def capture(
     except Exception as e:
         click.echo(click.style(f"Error: {e}", fg="red"), err=True)
         raise SystemExit(1)
+
+
+def load_canvas_state(path: Path) -> Dict[str, Any]:
+    """Load a canvas state from a workspace file or a bare canvas-state JSON file.
+
+    Args:
+        path: JSON file saved by the workspace manager (``{"metadata", "state"}``)
+            or containing the canvas state itself.
+
+    Returns:
+        The canvas state dictionary.
+
+    Raises:
+        ValueError: If the file does not contain a JSON object.
+    """
+    data = json.loads(path.read_text(encoding="utf-8"))
+    if isinstance(data, dict) and isinstance(data.get("state"), dict):
+        data = data["state"]
+    if not isinstance(data, dict):
+        raise ValueError(f"{path} does not contain a canvas state object")
+    return data
+
+
+@screenshot.command()
+@click.argument("state_file", type=click.Path(exists=True, dir_okay=False))
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(dir_okay=False, writable=True),
+    help="Output file path; a .svg suffix selects SVG output (default: cli/output/render_<timestamp>.png)",
+)
+@click.option(
+    "--width",
+    "-w",
+    default=DEFAULT_RENDER_WIDTH,
+    type=int,
+    help=f"Canvas width in pixels (default: {DEFAULT_RENDER_WIDTH})",
+)
+@click.option(
+    "--height",
+    "-h",
+    "height",  # Rename to avoid conflict with --help
+    default=DEFAULT_RENDER_HEIGHT,
+    type=int,
+    help=f"Canvas height in pixels (default: {DEFAULT_RENDER_HEIGHT})",
+)
+def render(state_file: str, output: Optional[str], width: int, height: int) -> None:
+    """Render a saved workspace or canvas state without a server or browser.
+
+    Drawables are rebuilt from the state and drawn with the same render plans
+    the browser uses. Drawable types the server renderer does not support are
+    listed and omitted.
+
+    Examples:
+
+      mathud screenshot render workspaces/triangle.json
+
+      mathud screenshot render state.json -o canvas.svg --width 1200 --height 800
+    """
+    try:
+        canvas_state = load_canvas_state(Path(state_file))
+    except (OSError, ValueError) as e:
+        click.echo(click.style(f"Error: {e}", fg="red"), err=True)
+        raise SystemExit(1)
+
+    output_path = Path(output) if output else generate_default_filename("render")
+    if output_path.suffix.lower() not in (".png", ".svg"):
+        output_path = output_path.with_suffix(".png")
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Imported lazily so other screenshot commands do not load the rasterizer.
+    from static.canvas_rasterizer import CanvasRasterizer
+
+    rasterizer = CanvasRasterizer(width, height)
+    skipped = rasterizer.unsupported_buckets(canvas_state)
+    if skipped:
+        click.echo(click.style(f"Not rendered (unsupported): {', '.join(skipped)}", fg="yellow"), err=True)
+
+    start = time.perf_counter()
+    try:
+        if output_path.suffix.lower() == ".svg":
+            output_path.write_text(rasterizer.render_svg(canvas_state), encoding="utf-8")
+        else:
+            output_path.write_bytes(rasterizer.render_png(canvas_state))
+    except Exception as e:
+        click.echo(click.style(f"Error: {e}", fg="red"), err=True)
+        raise SystemExit(1)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    if rasterizer.skipped_drawables:
+        click.echo(
+            click.style(f"Not rendered (failed to rebuild): {', '.join(rasterizer.skipped_drawables)}", fg="yellow"),
+            err=True,
+        )
+    click.echo(click.style(f"Rendered {output_path} in {elapsed_ms:.0f} ms", fg="green"))
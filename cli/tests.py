@@ -8,6 +8,7 @@ from __future__ import annotations
 import json
 import os
 import shutil
+import statistics
 import subprocess
 import sys
 import time
@@ -234,6 +235,64 @@ def run_client_tests(
             manager.stop()
 
 
+def run_startup_timing(
+    port: int = DEFAULT_PORT,
+    runs: int = 3,
+    headless: bool = True,
+    start_server: bool = False,
+) -> dict:
+    """Measure cold and warm time-to-interactive of the application page.
+
+    Each run does one cold load (caches cleared) followed by one warm load.
+
+    Args:
+        port: Server port number.
+        runs: Number of cold/warm load pairs.
+        headless: Run browser in headless mode.
+        start_server: Start server if not running.
+
+    Returns:
+        Dictionary with per-run ``cold_ms`` and ``warm_ms`` lists and their medians.
+    """
+    manager = ServerManager(port=port)
+    server_was_started = False
+
+    if not manager.is_server_running():
+        if not start_server:
+            return {
+                "status": "error",
+                "error": f"Server is not running on port {port}. Start it with 'mathud server start' or use --start-server.",
+            }
+        click.echo("Starting server...")
+        success, message = manager.start(wait=True, auto_increment_port=True, max_port_tries=25)
+        if not success:
+            return {"status": "error", "error": f"Failed to start server: {message}"}
+        server_was_started = True
+        port = manager.port
+
+    try:
+        cold_ms: list[float] = []
+        warm_ms: list[float] = []
+        with BrowserAutomation(port=port, headless=headless) as browser:
+            for _ in range(max(1, runs)):
+                for cold, samples in ((True, cold_ms), (False, warm_ms)):
+                    elapsed = browser.measure_time_to_interactive(cold=cold)
+                    if elapsed is None:
+                        return {"status": "error", "error": "Application did not become ready in time"}
+                    samples.append(elapsed)
+        return {
+            "status": "ok",
+            "cold_ms": cold_ms,
+            "warm_ms": warm_ms,
+            "cold_median_ms": statistics.median(cold_ms),
+            "warm_median_ms": statistics.median(warm_ms),
+        }
+    finally:
+        if server_was_started:
+            click.echo("Stopping server...")
+            manager.stop()
+
+
 @click.group()
 def test() -> None:
     """Run MatHud tests."""
@@ -404,6 +463,33 @@ def client_cmd(
                 raise SystemExit(1)
 
 
+@test.command("startup")
+@click.option(
+    "--port",
+    "-p",
+    default=DEFAULT_PORT,
+    type=int,
+    help=f"Server port (default: {DEFAULT_PORT})",
+)
+@click.option("--runs", "-n", default=3, type=int, help="Cold/warm load pairs to measure (default: 3)")
+@click.option("--no-headless", is_flag=True, help="Show browser window")
+@click.option("--start-server", is_flag=True, help="Start server if not running")
+@click.option("--json", "as_json", is_flag=True, help="Output results as JSON")
+def startup_cmd(port: int, runs: int, no_headless: bool, start_server: bool, as_json: bool) -> None:
+    """Measure cold and warm time-to-interactive via headless Chrome."""
+    results = run_startup_timing(port=port, runs=runs, headless=not no_headless, start_server=start_server)
+
+    if as_json:
+        click.echo(json.dumps(results, indent=2))
+    elif results.get("status") == "error":
+        click.echo(click.style(f"Error: {results.get('error', 'Unknown error')}", fg="red"), err=True)
+    else:
+        click.echo(f"Cold: {results['cold_median_ms']:.0f} ms (median of {len(results['cold_ms'])})")
+        click.echo(f"Warm: {results['warm_median_ms']:.0f} ms (median of {len(results['warm_ms'])})")
+    if results.get("status") == "error":
+        raise SystemExit(1)
+
+
 @test.command("all")
 @click.option(
     "--port",
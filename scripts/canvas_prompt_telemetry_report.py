@@ -4,7 +4,7 @@ Build summary/CSV reports from `canvas_prompt_telemetry` log entries.
 
 Usage examples:
   python scripts/canvas_prompt_telemetry_report.py
-  python scripts/canvas_prompt_telemetry_report.py --log-file logs/mathud_session_26_02_11.log
+  python scripts/canvas_prompt_telemetry_report.py --log-file logs/mathud_session_26_02_11.jsonl
   python scripts/canvas_prompt_telemetry_report.py --mode hybrid --csv-out /tmp/telemetry.csv
   python scripts/canvas_prompt_telemetry_report.py --json-out /tmp/telemetry_summary.json
 """
@@ -36,15 +36,32 @@ def _default_log_file() -> Optional[Path]:
     if not logs_dir.exists():
         return None
     # Sort oldest->newest by mtime and pick the newest entry.
-    candidates = sorted(logs_dir.glob("mathud_session_*.log"), key=lambda p: p.stat().st_mtime)
+    candidates = sorted(
+        [*logs_dir.glob("mathud_session_*.jsonl"), *logs_dir.glob("mathud_session_*.log")],
+        key=lambda p: p.stat().st_mtime,
+    )
     if not candidates:
         return None
     return candidates[-1]
 
 
+def _message_from_jsonl(line: str) -> str:
+    """Return the message of a JSONL log record, or the line itself for plain-text logs."""
+    if not line.startswith("{"):
+        return line
+    try:
+        record = json.loads(line)
+    except json.JSONDecodeError:
+        return line
+    if isinstance(record, dict) and isinstance(record.get("message"), str):
+        return str(record["message"])
+    return ""
+
+
 def _read_rows(log_file: Path, modes: Optional[set[str]]) -> List[Dict[str, Any]]:
     rows: List[Dict[str, Any]] = []
     for line in log_file.read_text(encoding="utf-8", errors="ignore").splitlines():
+        line = _message_from_jsonl(line)
         marker_idx = line.find(LOG_MARKER)
         if marker_idx < 0:
             continue
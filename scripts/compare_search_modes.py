@@ -31,7 +31,7 @@ _project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if _project_root not in sys.path:
     sys.path.insert(0, _project_root)
 
-from static.tool_search_service import ToolSearchService, clear_search_cache
+from static.tool_search_service import CONFIDENCE_THRESHOLD, ToolSearchService, clear_search_cache
 
 DATASET_PATH = Path("server_tests/data/tool_discovery_cases.yaml")
 
@@ -74,6 +74,7 @@ def _run_mode(
     top3_hits = 0
     top5_hits = 0
     evaluated = 0
+    fallbacks = 0
     latencies: List[float] = []
     case_results: List[Dict[str, Any]] = []
 
@@ -92,6 +93,9 @@ def _run_mode(
             results = service.search_tools(query, max_results=max_results)
         elapsed_ms = (time.perf_counter() - start) * 1000
         latencies.append(elapsed_ms)
+        # Queries hybrid mode would have sent on to the API
+        if mode == "local" and (not results or service._last_local_top_score < CONFIDENCE_THRESHOLD):
+            fallbacks += 1
 
         ranked = [_get_tool_name(t) for t in results]
         expected_set = set(expected_any)
@@ -138,6 +142,7 @@ def _run_mode(
         "top1_rate": top1_hits / evaluated if evaluated else 0,
         "top3_rate": top3_hits / evaluated if evaluated else 0,
         "top5_rate": top5_hits / evaluated if evaluated else 0,
+        "hybrid_fallbacks": fallbacks,
         "avg_latency_ms": avg_latency,
         "p50_latency_ms": p50,
         "p99_latency_ms": p99,
@@ -224,6 +229,8 @@ def main() -> int:
         print(f"  Top-5: {result['top5_hits']}/{result['evaluated']} = {result['top5_rate']:.3f}")
         print(f"  Latency: avg={result['avg_latency_ms']:.1f}ms, "
               f"p50={result['p50_latency_ms']:.1f}ms, p99={result['p99_latency_ms']:.1f}ms")
+        if mode == "local":
+            print(f"  Hybrid API fallbacks: {result['hybrid_fallbacks']}/{result['evaluated']}")
         print()
 
     # Side-by-side comparison
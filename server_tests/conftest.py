@@ -0,0 +1,14 @@
+"""Shared pytest setup for the server tests."""
+
+from __future__ import annotations
+
+import atexit
+import os
+import shutil
+import tempfile
+
+# Apps built by the tests write session logs and workspaces; keep them out of ./logs/ and ./workspaces/
+_test_data_dir = tempfile.mkdtemp(prefix="mathud-tests-")
+os.environ["LOG_DIR"] = os.path.join(_test_data_dir, "logs")
+os.environ["WORKSPACES_DIR"] = os.path.join(_test_data_dir, "workspaces")
+atexit.register(shutil.rmtree, _test_data_dir, True)
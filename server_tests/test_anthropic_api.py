@@ -0,0 +1,289 @@
+"""
+Tests for the Anthropic API provider.
+
+Runs the provider against a stub Anthropic client that records request
+payloads, covering incremental message conversion, tool conversion
+memoization, and prompt-cache breakpoints.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import os
+import unittest
+from types import SimpleNamespace
+from typing import Any, Dict, List
+from unittest.mock import patch
+
+from static.providers.anthropic_api import CACHE_CONTROL, AnthropicAPI
+
+TOOLS = [
+    {
+        "type": "function",
+        "function": {
+            "name": "create_point",
+            "description": "Create a point",
+            "parameters": {"type": "object", "properties": {"x": {"type": "number"}, "y": {"type": "number"}}},
+        },
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "undo",
+            "description": "Undo the last action",
+            "parameters": {"type": "object", "properties": {}},
+        },
+    },
+]
+
+
+class _RecordingStream:
+    def __init__(self, events: List[Any]) -> None:
+        self._events = events
+
+    def __enter__(self) -> "_RecordingStream":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        return None
+
+    def __iter__(self) -> Any:
+        return iter(self._events)
+
+
+class RecordingAnthropicClient:
+    """Stub Anthropic client that records request payloads and replays scripted replies."""
+
+    def __init__(self, **kwargs: Any) -> None:
+        self.payloads: List[Dict[str, Any]] = []
+        self.replies: List[Dict[str, Any]] = []
+        self.messages = SimpleNamespace(stream=self._stream, create=self._create)
+
+    def _next_reply(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        self.payloads.append(copy.deepcopy(kwargs))
+        return self.replies.pop(0) if self.replies else {"text": "Done."}
+
+    def _stream(self, **kwargs: Any) -> _RecordingStream:
+        reply = self._next_reply(kwargs)
+        events: List[Any] = []
+        if reply.get("text"):
+            text_delta = SimpleNamespace(type="text_delta", text=reply["text"])
+            events.append(SimpleNamespace(type="content_block_delta", delta=text_delta))
+            events.append(SimpleNamespace(type="content_block_stop"))
+        for tool in reply.get("tools", []):
+            block = SimpleNamespace(type="tool_use", id=tool["id"], name=tool["name"])
+            events.append(SimpleNamespace(type="content_block_start", content_block=block))
+            delta = SimpleNamespace(type="input_json_delta", partial_json=json.dumps(tool["input"]))
+            events.append(SimpleNamespace(type="content_block_delta", delta=delta))
+            events.append(SimpleNamespace(type="content_block_stop"))
+        events.append(SimpleNamespace(type="message_stop"))
+        return _RecordingStream(events)
+
+    def _create(self, **kwargs: Any) -> Any:
+        reply = self._next_reply(kwargs)
+        content: List[Any] = []
+        if reply.get("text"):
+            content.append(SimpleNamespace(type="text", text=reply["text"]))
+        for tool in reply.get("tools", []):
+            content.append(SimpleNamespace(type="tool_use", id=tool["id"], name=tool["name"], input=tool["input"]))
+        return SimpleNamespace(content=content)
+
+
+def _prompt(text: str) -> str:
+    return json.dumps({"user_message": text, "canvas_state": {"Points": [{"name": "A"}]}})
+
+
+def _tool_results(results: Dict[str, str]) -> str:
+    return json.dumps({"tool_call_results": json.dumps(results)})
+
+
+def _breakpoint_blocks(payload: Dict[str, Any]) -> List[Dict[str, Any]]:
+    blocks: List[Dict[str, Any]] = []
+    for message in payload["messages"]:
+        content = message["content"]
+        if isinstance(content, list):
+            blocks.extend(block for block in content if "cache_control" in block)
+    return blocks
+
+
+class TestAnthropicAPI(unittest.TestCase):
+    """Unit tests for AnthropicAPI against a recording stub client."""
+
+    def setUp(self) -> None:
+        self.original_api_key = os.environ.get("ANTHROPIC_API_KEY")
+        os.environ["ANTHROPIC_API_KEY"] = "test-api-key"
+        patcher = patch("anthropic.Anthropic", RecordingAnthropicClient)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.api = AnthropicAPI(tools=TOOLS)
+        self.client: RecordingAnthropicClient = self.api._anthropic_client
+
+    def tearDown(self) -> None:
+        if self.original_api_key:
+            os.environ["ANTHROPIC_API_KEY"] = self.original_api_key
+        else:
+            os.environ.pop("ANTHROPIC_API_KEY", None)
+
+    def _stream(self, prompt: str) -> List[Dict[str, Any]]:
+        return list(self.api.create_chat_completion_stream(prompt))
+
+    def _fresh_conversion(self) -> List[Dict[str, Any]]:
+        fresh = AnthropicAPI(tools=TOOLS)
+        fresh.messages = self.api.messages
+        converted: List[Dict[str, Any]] = fresh._convert_messages_to_anthropic()
+        return converted
+
+    def _run_tool_turn(self) -> None:
+        self.client.replies = [
+            {"text": "Creating it.", "tools": [{"id": "call_1", "name": "create_point", "input": {"x": 1, "y": 2}}]},
+            {"text": "Point created."},
+        ]
+        self._stream(_prompt("Create point A"))
+        self._stream(_tool_results({"call_1": "A created"}))
+
+    def test_system_prompt_and_last_tool_carry_breakpoints(self) -> None:
+        self._stream(_prompt("Hello"))
+
+        payload = self.client.payloads[0]
+        system_block = {"type": "text", "text": self.api._system_prompt, "cache_control": CACHE_CONTROL}
+        self.assertEqual(payload["system"], [system_block])
+        self.assertEqual(payload["tools"][-1]["cache_control"], CACHE_CONTROL)
+        self.assertNotIn("cache_control", payload["tools"][0])
+        self.assertEqual(_breakpoint_blocks(payload), [])
+
+    def test_new_prompt_marks_end_of_older_history(self) -> None:
+        self._stream(_prompt("First"))
+        self._stream(_prompt("Second"))
+
+        messages = self.client.payloads[1]["messages"]
+        self.assertEqual(messages[1]["content"], [{"type": "text", "text": "Done.", "cache_control": CACHE_CONTROL}])
+        self.assertIsInstance(messages[-1]["content"], str)
+        self.assertEqual(len(_breakpoint_blocks(self.client.payloads[1])), 1)
+
+    def test_tool_loop_marks_latest_tool_results(self) -> None:
+        self._run_tool_turn()
+
+        messages = self.client.payloads[1]["messages"]
+        self.assertEqual(messages[-1]["role"], "user")
+        self.assertEqual(messages[-1]["content"][-1]["type"], "tool_result")
+        self.assertEqual(messages[-1]["content"][-1]["content"], json.dumps({"call_1": "A created"}))
+        self.assertEqual(messages[-1]["content"][-1]["cache_control"], CACHE_CONTROL)
+
+    def test_breakpoints_never_leak_into_cached_conversion(self) -> None:
+        self._run_tool_turn()
+        self._stream(_prompt("Next"))
+
+        for message in self.api._converted_messages:
+            content = message["content"]
+            if isinstance(content, list):
+                for block in content:
+                    self.assertNotIn("cache_control", block)
+        for tool in self.api._convert_tools_to_anthropic():
+            self.assertNotIn("cache_control", tool)
+
+    def test_unchanged_prefix_is_not_reconverted(self) -> None:
+        self._run_tool_turn()
+        before = self.api._convert_messages_to_anthropic()
+        self.api.messages.append({"role": "user", "content": "Another question"})
+
+        with patch.object(self.api, "_append_anthropic_message", wraps=self.api._append_anthropic_message) as spy:
+            after = self.api._convert_messages_to_anthropic()
+
+        self.assertEqual(spy.call_count, 1)
+        for old, new in zip(before, after):
+            self.assertIs(old, new)
+        self.assertEqual(after, self._fresh_conversion())
+
+    def test_settled_prompt_is_reconverted_after_cleaning(self) -> None:
+        self.client.replies = [{"text": "Hi."}]
+        self._stream(_prompt("Hello"))
+        first_prompt = self.client.payloads[0]["messages"][0]["content"]
+
+        converted = self.api._convert_messages_to_anthropic()
+
+        self.assertIn("canvas_state", first_prompt)
+        self.assertNotIn("canvas_state", converted[0]["content"])
+        self.assertEqual(converted, self._fresh_conversion())
+
+    def test_tool_result_update_does_not_mutate_earlier_payloads(self) -> None:
+        self.client.replies = [
+            {"tools": [{"id": "call_1", "name": "undo", "input": {}}, {"id": "call_2", "name": "undo", "input": {}}]},
+        ]
+        self._stream(_prompt("Undo twice"))
+        placeholders = self.api._convert_messages_to_anthropic()[-1]
+
+        self._stream(_tool_results({"call_2": "ok"}))
+
+        placeholder_results = [block["content"] for block in placeholders["content"]]
+        self.assertEqual(placeholder_results, ["Awaiting result...", "Awaiting result..."])
+        sent = self.client.payloads[1]["messages"][-1]["content"]
+        self.assertEqual([block["content"] for block in sent], ["Awaiting result...", json.dumps({"call_2": "ok"})])
+
+    def test_rewritten_history_matches_full_conversion(self) -> None:
+        self._run_tool_turn()
+        self._stream(_prompt("Second"))
+        self.api._convert_messages_to_anthropic()
+
+        # Compaction replaces old turns with a summary pair and drops messages
+        self.api.messages[0:4] = [
+            {"role": "user", "content": "Create point A"},
+            {"role": "assistant", "content": "[Earlier turn, compacted] Tools used: create_point."},
+        ]
+        self.assertEqual(self.api._convert_messages_to_anthropic(), self._fresh_conversion())
+
+        del self.api.messages[1:]
+        self.assertEqual(self.api._convert_messages_to_anthropic(), self._fresh_conversion())
+
+        self.api.reset_conversation()
+        self.assertEqual(self.api._convert_messages_to_anthropic(), [])
+
+    def test_tool_conversion_is_memoized_per_tool_set(self) -> None:
+        first = self.api._convert_tools_to_anthropic()
+        self.assertIs(self.api._convert_tools_to_anthropic(), first)
+
+        self.api.tools = copy.deepcopy(TOOLS)
+        self.assertIs(self.api._convert_tools_to_anthropic(), first)
+
+        self.api.tools = TOOLS[:1]
+        subset = self.api._convert_tools_to_anthropic()
+        self.assertEqual([tool["name"] for tool in subset], ["create_point"])
+
+        self.api.tools = list(TOOLS)
+        self.assertIs(self.api._convert_tools_to_anthropic(), first)
+
+    def test_non_streaming_completion_uses_same_payload(self) -> None:
+        self.client.replies = [{"text": "One."}, {"text": "Two."}]
+        self.api.create_chat_completion(_prompt("First"))
+        response = self.api.create_chat_completion(_prompt("Second"))
+
+        self.assertEqual(response.message.content, "Two.")
+        payload = self.client.payloads[1]
+        self.assertEqual(payload["system"][0]["cache_control"], CACHE_CONTROL)
+        self.assertEqual(payload["tools"][-1]["cache_control"], CACHE_CONTROL)
+        self.assertEqual(payload["messages"][1]["content"][-1]["cache_control"], CACHE_CONTROL)
+
+    def test_empty_assistant_reply_is_skipped_for_history_breakpoint(self) -> None:
+        self.api.messages = [
+            {"role": "user", "content": "First"},
+            {"role": "assistant", "content": "Answer"},
+            {"role": "user", "content": "Second"},
+            {"role": "assistant", "content": ""},
+            {"role": "user", "content": "Third"},
+        ]
+
+        messages = self.api._build_request_kwargs()["messages"]
+
+        self.assertEqual(messages[3]["content"], "")
+        self.assertEqual(messages[2]["content"], [{"type": "text", "text": "Second", "cache_control": CACHE_CONTROL}])
+
+    def test_tools_omitted_when_empty(self) -> None:
+        self.api.tools = []
+
+        request = self.api._build_request_kwargs()
+
+        self.assertNotIn("tools", request)
+
+
+if __name__ == "__main__":
+    unittest.main()
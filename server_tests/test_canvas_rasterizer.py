@@ -0,0 +1,267 @@
+from __future__ import annotations
+
+import os
+import struct
+import sys
+import tempfile
+import time
+import unittest
+import zlib
+from typing import Any, Dict, Tuple
+from unittest.mock import MagicMock, patch
+
+from static import routes
+from static import canvas_rasterizer
+from static.canvas_rasterizer import CanvasRasterizer, RasterPrimitiveAdapter, _RenderWorker, parse_css_color
+
+
+def _scene() -> Dict[str, Any]:
+    return {
+        "Points": [
+            {"name": "A", "args": {"position": {"x": 0, "y": 0}}},
+            {"name": "B", "args": {"position": {"x": 4, "y": 0}}},
+            {"name": "C", "args": {"position": {"x": 0, "y": 3}}},
+        ],
+        "Segments": [
+            {"name": "AB", "args": {"p1": "A", "p2": "B"}},
+            {"name": "AC", "args": {"p1": "A", "p2": "C"}},
+            {"name": "BC", "args": {"p1": "B", "p2": "C"}},
+        ],
+        "Circles": [{"name": "A(2)", "args": {"center": "A", "radius": 2}}],
+        "Functions": [{"name": "f", "args": {"function_string": "sin(x)", "left_bound": None, "right_bound": None}}],
+        "Labels": [
+            {
+                "name": "L",
+                "args": {
+                    "position": {"x": -5, "y": 4},
+                    "text": "a<b",
+                    "color": "red",
+                    "font_size": 14,
+                    "visible": True,
+                },
+            }
+        ],
+        "Cartesian_System_Visibility": {"left_bound": -8, "right_bound": 8, "top_bound": 6, "bottom_bound": -6},
+        "coordinate_system": {"mode": "cartesian"},
+    }
+
+
+def _decode_png(data: bytes) -> Tuple[int, int, bytes]:
+    """Return (width, height, packed RGB) for the unfiltered truecolor PNGs the rasterizer writes."""
+    assert data[:8] == b"\x89PNG\r\n\x1a\n"
+    offset = 8
+    width = height = 0
+    idat = b""
+    while offset < len(data):
+        (length,) = struct.unpack(">I", data[offset : offset + 4])
+        tag = data[offset + 4 : offset + 8]
+        body = data[offset + 8 : offset + 8 + length]
+        if tag == b"IHDR":
+            width, height = struct.unpack(">II", body[:8])
+        elif tag == b"IDAT":
+            idat += body
+        offset += 12 + length
+    raw = zlib.decompress(idat)
+    stride = width * 3 + 1
+    rows = [raw[row * stride + 1 : (row + 1) * stride] for row in range(height)]
+    return width, height, b"".join(rows)
+
+
+def _pixel(rgb: bytes, width: int, x: int, y: int) -> Tuple[int, int, int]:
+    offset = (y * width + x) * 3
+    return rgb[offset], rgb[offset + 1], rgb[offset + 2]
+
+
+class TestParseCssColor(unittest.TestCase):
+    def test_formats(self) -> None:
+        self.assertEqual(parse_css_color("red"), ((255, 0, 0), 1.0))
+        self.assertEqual(parse_css_color("#0f0"), ((0, 255, 0), 1.0))
+        self.assertEqual(parse_css_color("#0000ff80")[0], (0, 0, 255))
+        self.assertAlmostEqual(parse_css_color("#0000ff80")[1], 128 / 255)
+        self.assertEqual(parse_css_color("rgba(10, 20, 30, 0.5)"), ((10, 20, 30), 0.5))
+        self.assertEqual(parse_css_color("transparent")[1], 0.0)
+        self.assertEqual(parse_css_color("not-a-color", (1, 2, 3)), ((1, 2, 3), 1.0))
+
+
+class TestRasterPrimitiveAdapter(unittest.TestCase):
+    def test_fill_polygon_covers_pixel_centers(self) -> None:
+        adapter = RasterPrimitiveAdapter(10, 10)
+        fill = MagicMock(color="black", opacity=None)
+        adapter.fill_polygon([(2, 2), (6, 2), (6, 6), (2, 6)], fill)
+        _, _, rgb = _decode_png(adapter.to_png())
+        self.assertEqual(_pixel(rgb, 10, 2, 2), (0, 0, 0))
+        self.assertEqual(_pixel(rgb, 10, 5, 5), (0, 0, 0))
+        self.assertEqual(_pixel(rgb, 10, 6, 6), (255, 255, 255))
+        self.assertEqual(_pixel(rgb, 10, 1, 3), (255, 255, 255))
+
+    def test_translucent_fill_blends_with_background(self) -> None:
+        adapter = RasterPrimitiveAdapter(4, 4)
+        adapter.fill_polygon([(0, 0), (4, 0), (4, 4), (0, 4)], MagicMock(color="blue", opacity=0.5))
+        red, green, blue = adapter.pixels[0:3]
+        self.assertAlmostEqual(red, 128, delta=1)
+        self.assertAlmostEqual(green, 128, delta=1)
+        self.assertEqual(blue, 255)
+
+    def test_offscreen_line_is_clipped(self) -> None:
+        adapter = RasterPrimitiveAdapter(20, 20)
+        stroke = MagicMock(color="black", width=1.0)
+        start = time.perf_counter()
+        adapter.stroke_line((-1e9, 10), (1e9, 10), stroke)
+        self.assertLess(time.perf_counter() - start, 0.5)
+        self.assertEqual(tuple(adapter.pixels[(10 * 20 + 7) * 3 : (10 * 20 + 7) * 3 + 3]), (0, 0, 0))
+
+
+class TestCanvasRasterizer(unittest.TestCase):
+    def test_render_png_draws_scene(self) -> None:
+        png = CanvasRasterizer(320, 240).render_png(_scene())
+        width, height, rgb = _decode_png(png)
+        self.assertEqual((width, height), (320, 240))
+        # Bounds x in [-8, 8] over 320 px: origin at (160, 120), 20 px per unit
+        self.assertNotEqual(_pixel(rgb, width, 160, 120), (255, 255, 255))
+        # Segment AB runs along the x-axis to (240, 120); BC rises to (160, 60)
+        self.assertEqual(_pixel(rgb, width, 200, 90), (0, 0, 0))
+
+    def test_render_svg_uses_shared_plans(self) -> None:
+        svg = CanvasRasterizer(320, 240).render_svg(_scene())
+        self.assertTrue(svg.startswith("<svg"))
+        self.assertIn('width="320"', svg)
+        self.assertIn("<polyline", svg)
+        self.assertIn("<circle", svg)
+        self.assertIn("a&lt;b", svg)
+
+    def test_unsupported_buckets_ignores_empty_and_metadata(self) -> None:
+        state = _scene()
+        state["ColoredAreas"] = []
+        state["computations"] = [{"expression": "1+1"}]
+        self.assertEqual(CanvasRasterizer.unsupported_buckets(state), [])
+        state["FunctionsBoundedColoredAreas"] = [{"name": "area", "args": {}}]
+        self.assertEqual(CanvasRasterizer.unsupported_buckets(state), ["FunctionsBoundedColoredAreas"])
+
+    def test_broken_entries_are_skipped(self) -> None:
+        state = _scene()
+        state["Segments"].append({"name": "XY", "args": {"p1": "X", "p2": "Y"}})
+        state["Functions"].append({"name": "g", "args": {"function_string": "(((", "left_bound": None}})
+        rasterizer = CanvasRasterizer(160, 120)
+        png = rasterizer.render_png(state)
+        self.assertEqual(_decode_png(png)[:2], (160, 120))
+        self.assertEqual(rasterizer.skipped_drawables, ["Segments:XY", "Functions:g"])
+
+    def test_client_modules_stay_out_of_server_process(self) -> None:
+        modules_before = set(sys.modules)
+        path_before = list(sys.path)
+
+        CanvasRasterizer(80, 60).render_svg(_scene())
+
+        self.assertEqual(sys.path, path_before)
+        new_modules = set(sys.modules) - modules_before
+        client_modules = [name for name in new_modules if name.split(".")[0] in ("browser", "drawables", "rendering")]
+        self.assertEqual(client_modules, [])
+
+    def test_polar_mode(self) -> None:
+        state = _scene()
+        state["coordinate_system"] = {"mode": "polar"}
+        svg = CanvasRasterizer(200, 200).render_svg(state)
+        self.assertIn("<circle", svg)
+
+
+# Reads its request and then never answers, like a worker stuck evaluating 9**9**9+x.
+_SILENT_WORKER = [sys.executable, "-c", "import sys, time; sys.stdin.buffer.read(4); time.sleep(60)"]
+
+
+class TestRenderWorkerTimeout(unittest.TestCase):
+    def test_silent_worker_is_killed_and_replaced(self) -> None:
+        worker = _RenderWorker(timeout=0.5, command=_SILENT_WORKER)
+        self.addCleanup(worker.close)
+
+        started = time.monotonic()
+        with self.assertRaises(TimeoutError):
+            worker.render(80, 60, _scene(), "png")
+        self.assertLess(time.monotonic() - started, 5)
+
+        self.assertIsNone(worker._process)
+        # The lock was released and the next render starts a fresh worker.
+        with self.assertRaises(TimeoutError):
+            worker.render(80, 60, _scene(), "png")
+
+    def test_timed_out_render_falls_back_to_webdriver(self) -> None:
+        worker = _RenderWorker(timeout=0.5, command=_SILENT_WORKER)
+        self.addCleanup(worker.close)
+        app = MagicMock()
+        app.webdriver_manager.capture_png.return_value = b"browser-png"
+        svg_state = {"content": "<svg/>", "dimensions": {"width": 80, "height": 60}}
+
+        with patch.object(canvas_rasterizer, "_render_worker", worker), patch.dict(
+            os.environ, {"SERVER_CANVAS_RASTER": "true"}
+        ):
+            png = routes.handle_vision_capture(app, True, svg_state, None, MagicMock(), canvas_state=_scene())
+
+        self.assertEqual(png, b"browser-png")
+        app.webdriver_manager.capture_png.assert_called_once_with(svg_state)
+
+
+class TestVisionCaptureRasterization(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        snapshot_path = os.path.join(self.temp_dir.name, "canvas.png")
+        self.snapshot_path = snapshot_path
+        patches = [
+            patch.object(routes, "CANVAS_SNAPSHOT_DIR", self.temp_dir.name),
+            patch.object(routes, "CANVAS_SNAPSHOT_PATH", snapshot_path),
+            patch.dict(os.environ, {"SERVER_CANVAS_RASTER": "true"}),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+        self.addCleanup(self.temp_dir.cleanup)
+        self.app = MagicMock()
+        self.init_webdriver = MagicMock()
+        self.svg_state = {"content": "<svg/>", "dimensions": {"width": 400, "height": 300}}
+
+    def test_supported_state_skips_webdriver(self) -> None:
+        png = routes.handle_vision_capture(
+            self.app, True, self.svg_state, None, self.init_webdriver, canvas_state=_scene()
+        )
+
+        self.app.webdriver_manager.capture_png.assert_not_called()
+        self.init_webdriver.assert_not_called()
+        assert png is not None
+        self.assertEqual(_decode_png(png)[:2], (400, 300))
+        self.assertEqual(os.listdir(self.temp_dir.name), [])
+
+    def test_unsupported_state_falls_back_to_webdriver(self) -> None:
+        state = _scene()
+        state["UndirectedGraphs"] = [{"name": "G", "args": {}}]
+
+        self.app.webdriver_manager.capture_png.return_value = b"browser-png"
+
+        png = routes.handle_vision_capture(
+            self.app, True, self.svg_state, None, self.init_webdriver, canvas_state=state
+        )
+
+        self.app.webdriver_manager.capture_png.assert_called_once_with(self.svg_state)
+        self.assertEqual(png, b"browser-png")
+        self.assertFalse(os.path.exists(self.snapshot_path))
+
+    def test_skipped_drawables_fall_back_to_webdriver(self) -> None:
+        state = _scene()
+        state["Segments"].append({"name": "XY", "args": {"p1": "X", "p2": "Y"}})
+        self.app.webdriver_manager.capture_png.return_value = b"browser-png"
+
+        png = routes.handle_vision_capture(
+            self.app, True, self.svg_state, None, self.init_webdriver, canvas_state=state
+        )
+
+        self.app.webdriver_manager.capture_png.assert_called_once_with(self.svg_state)
+        self.assertEqual(png, b"browser-png")
+
+    def test_disabled_by_environment(self) -> None:
+        with patch.dict(os.environ, {"SERVER_CANVAS_RASTER": "false"}):
+            routes.handle_vision_capture(
+                self.app, True, self.svg_state, None, self.init_webdriver, canvas_state=_scene()
+            )
+
+        self.app.webdriver_manager.capture_png.assert_called_once_with(self.svg_state)
+
+
+if __name__ == "__main__":
+    unittest.main()
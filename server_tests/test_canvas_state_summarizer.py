@@ -1,9 +1,63 @@
 from __future__ import annotations
 
+import json
+import threading
+import time
 import unittest
-from typing import Any, Dict
+from typing import Any, Dict, List
+from unittest.mock import patch
 
-from static.canvas_state_summarizer import compare_canvas_states, summarize_canvas_state
+import static.canvas_state_summarizer as canvas_state_summarizer
+
+from static.canvas_state_summarizer import (
+    build_canvas_state_summary,
+    clear_summary_memo,
+    compare_canvas_states,
+    measure_canvas_state_bytes,
+    summarize_canvas_state,
+)
+
+
+def _scene(drawable_count: int) -> Dict[str, Any]:
+    """Mixed scene with the noisy fields the summarizer prunes."""
+    state: Dict[str, Any] = {
+        "Points": [],
+        "Segments": [],
+        "Circles": [],
+        "Functions": [],
+        "coordinate_system": {"mode": "cartesian", "grid_visible": True},
+    }
+    for i in range(drawable_count):
+        kind = i % 4
+        if kind == 0:
+            state["Points"].append(
+                {"name": f"P{i}", "args": {"position": {"x": i, "y": -i}, "label": {"text": "", "visible": False}}}
+            )
+        elif kind == 1:
+            state["Segments"].append(
+                {
+                    "name": f"s{i}",
+                    "args": {"p1": f"P{i - 1}", "p2": f"P{i + 3}", "label": {"text": "", "visible": False}},
+                    "_p1_coords": [i, -i],
+                    "_p2_coords": [i + 3, -i - 3],
+                }
+            )
+        elif kind == 2:
+            state["Circles"].append(
+                {
+                    "name": f"c{i}",
+                    "args": {"center": f"P{i - 2}", "radius": 1.5 + i},
+                    "circle_formula": {"a": 1, "b": 1, "c": 0, "d": -2, "e": 4, "f": -9},
+                }
+            )
+        else:
+            state["Functions"].append(
+                {
+                    "name": f"f{i}",
+                    "args": {"function_string": f"sin(x)+{i}", "left_bound": None, "undefined_at": []},
+                }
+            )
+    return state
 
 
 class TestCanvasStateSummarizer(unittest.TestCase):
@@ -107,6 +161,113 @@ class TestCanvasStateSummarizer(unittest.TestCase):
         self.assertEqual(len(comparison["summary"]["Points"]), 200)
         self.assertEqual(len(comparison["summary"]["Segments"]), 200)
 
+    def test_metrics_match_serialized_sizes(self) -> None:
+        state = self._sample_state()
+        comparison = compare_canvas_states(state)
+        metrics = comparison["metrics"]
+
+        full_json = json.dumps(comparison["full"], separators=(",", ":"), sort_keys=True)
+        summary_json = json.dumps(comparison["summary"], separators=(",", ":"), sort_keys=True)
+        self.assertEqual(metrics["full_bytes"], len(full_json))
+        self.assertEqual(metrics["summary_bytes"], len(summary_json))
+        self.assertEqual(measure_canvas_state_bytes(state), len(full_json))
+
+    def test_measure_stops_past_limit(self) -> None:
+        state = _scene(400)
+        self.assertGreater(measure_canvas_state_bytes(state, limit=100), 100)
+        self.assertLess(measure_canvas_state_bytes(state, limit=100), measure_canvas_state_bytes(state))
+
+    def test_unchanged_drawables_are_reused_across_turns(self) -> None:
+        clear_summary_memo()
+        first = summarize_canvas_state(self._sample_state())
+        edited = self._sample_state()
+        edited["Circles"][0]["args"]["radius"] = 7
+        second = summarize_canvas_state(edited)
+
+        self.assertIs(first["Points"][0], second["Points"][0])
+        self.assertIsNot(first["Circles"][0], second["Circles"][0])
+        self.assertEqual(second["Circles"][0]["args"]["radius"], 7)
+
+    def test_memo_stays_bounded_under_concurrent_sessions(self) -> None:
+        scenes = [_scene(200 + 40 * index) for index in range(4)]
+        expected = [summarize_canvas_state(scene) for scene in scenes]
+        clear_summary_memo()
+        barrier = threading.Barrier(len(scenes))
+        results: Dict[int, Any] = {}
+        errors: List[BaseException] = []
+
+        def session(index: int) -> None:
+            try:
+                barrier.wait(timeout=5)
+                for _ in range(5):
+                    results[index] = summarize_canvas_state(scenes[index])
+            except BaseException as exc:
+                errors.append(exc)
+
+        with patch.object(canvas_state_summarizer, "SUMMARY_MEMO_MAX_SIZE", 50):
+            threads = [threading.Thread(target=session, args=(index,)) for index in range(len(scenes))]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(timeout=30)
+
+        self.assertEqual(errors, [])
+        self.assertEqual([results[index] for index in range(len(scenes))], expected)
+        self.assertLessEqual(len(canvas_state_summarizer._summary_memo), 50)
+        clear_summary_memo()
+
+    def test_token_budget_collapses_largest_bucket_first(self) -> None:
+        state = _scene(400)
+        state["Circles"] = state["Circles"][:2]
+        state["Points"] = state["Points"][:50]
+        state["Functions"] = state["Functions"][:50]
+        unbounded = build_canvas_state_summary(state)["metrics"]["summary_estimated_tokens"]
+
+        result = build_canvas_state_summary(state, max_tokens=unbounded - 500)
+        summary = result["summary"]
+        metrics = result["metrics"]
+
+        self.assertLessEqual(metrics["summary_estimated_tokens"], unbounded - 500)
+        self.assertEqual(metrics["token_budget"], unbounded - 500)
+        self.assertEqual(summary["Segments"]["count"], 100)
+        self.assertIn("s1", summary["Segments"]["names"])
+        self.assertEqual(len(summary["Circles"]), 2)
+        self.assertEqual(metrics["collapsed_buckets"], ["Segments"])
+        self.assertEqual(metrics["summary_bytes"], len(json.dumps(summary, separators=(",", ":"))))
+
+    def test_tight_token_budget_keeps_only_counts(self) -> None:
+        result = build_canvas_state_summary(_scene(400), max_tokens=30)
+        summary = result["summary"]
+
+        self.assertEqual(summary["Points"], {"count": 100})
+        self.assertEqual(summary["coordinate_system"], {"grid_visible": True, "mode": "cartesian"})
+        # Counts are the floor; the budget is best-effort below it
+        self.assertEqual(len(result["metrics"]["collapsed_buckets"]), 4)
+
+
+class TestCanvasStateSummarizerPerformance(unittest.TestCase):
+    """Per-turn summarization time on large scenes, with and without memo reuse."""
+
+    def test_per_turn_time(self) -> None:
+        timings: Dict[int, Dict[str, float]] = {}
+        for size in (100, 1000, 5000):
+            prompt = json.dumps({"user_message": "hi", "canvas_state": _scene(size)})
+
+            clear_summary_memo()
+            start = time.perf_counter()
+            build_canvas_state_summary(json.loads(prompt)["canvas_state"], max_tokens=20000)
+            cold_ms = (time.perf_counter() - start) * 1000
+
+            # Next turn: the client re-sends the same scene
+            start = time.perf_counter()
+            build_canvas_state_summary(json.loads(prompt)["canvas_state"], max_tokens=20000)
+            warm_ms = (time.perf_counter() - start) * 1000
+            timings[size] = {"cold_ms": cold_ms, "warm_ms": warm_ms}
+
+        for size, metrics in timings.items():
+            print(f"[CanvasStateSummarizer] n={size} cold={metrics['cold_ms']:.1f}ms warm={metrics['warm_ms']:.1f}ms")
+        self.assertLess(timings[5000]["warm_ms"], timings[5000]["cold_ms"])
+
 
 if __name__ == "__main__":
     unittest.main()
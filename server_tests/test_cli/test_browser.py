@@ -183,6 +183,45 @@ class TestBrowserAutomationNavigate:
             browser.navigate_to_app()
 
 
+class TestBrowserAutomationStartupTiming:
+    """Test BrowserAutomation.measure_time_to_interactive method."""
+
+    def test_warm_load_reports_elapsed_ms(self) -> None:
+        """A warm load navigates without clearing caches."""
+        browser = BrowserAutomation()
+        mock_driver = MagicMock()
+        mock_driver.execute_script.side_effect = [True, 812.5]
+        browser.driver = mock_driver
+
+        result = browser.measure_time_to_interactive(cold=False)
+
+        assert result == 812.5
+        mock_driver.execute_cdp_cmd.assert_not_called()
+        mock_driver.get.assert_called_once_with(browser.base_url)
+
+    def test_cold_load_clears_caches_first(self) -> None:
+        """A cold load clears the HTTP cache and origin storage."""
+        browser = BrowserAutomation()
+        mock_driver = MagicMock()
+        mock_driver.execute_script.side_effect = [True, 2400.0]
+        browser.driver = mock_driver
+
+        result = browser.measure_time_to_interactive(cold=True)
+
+        assert result == 2400.0
+        commands = [call.args[0] for call in mock_driver.execute_cdp_cmd.call_args_list]
+        assert commands == ["Network.clearBrowserCache", "Storage.clearDataForOrigin"]
+
+    def test_navigation_failure_returns_none(self) -> None:
+        """measure_time_to_interactive returns None when navigation fails."""
+        browser = BrowserAutomation()
+        mock_driver = MagicMock()
+        mock_driver.get.side_effect = Exception("Navigation failed")
+        browser.driver = mock_driver
+
+        assert browser.measure_time_to_interactive() is None
+
+
 class TestBrowserAutomationExecuteJs:
     """Test BrowserAutomation.execute_js method."""
 
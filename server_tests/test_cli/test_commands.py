@@ -238,6 +238,34 @@ class TestTestCommands:
         assert "Screenshot saved to:" in result.output
 
 
+    @patch("cli.tests.run_startup_timing")
+    def test_test_startup_reports_medians(self, mock_run: MagicMock) -> None:
+        """test startup prints cold and warm medians."""
+        mock_run.return_value = {
+            "status": "ok",
+            "cold_ms": [2000.0, 2200.0],
+            "warm_ms": [900.0, 1000.0],
+            "cold_median_ms": 2100.0,
+            "warm_median_ms": 950.0,
+        }
+        runner = CliRunner()
+        result = runner.invoke(cli, ["test", "startup", "--runs", "2"])
+
+        assert result.exit_code == 0
+        assert "Cold: 2100 ms" in result.output
+        assert "Warm: 950 ms" in result.output
+        assert mock_run.call_args.kwargs["runs"] == 2
+
+    @patch("cli.tests.run_startup_timing")
+    def test_test_startup_server_not_running(self, mock_run: MagicMock) -> None:
+        """test startup fails when server not running."""
+        mock_run.return_value = {"status": "error", "error": "Server is not running"}
+        runner = CliRunner()
+        result = runner.invoke(cli, ["test", "startup"])
+
+        assert result.exit_code == 1
+
+
 class TestCanvasCommands:
     """Test canvas subcommands."""
 
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import json
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import patch
 
+from click.testing import CliRunner
 
-from cli.screenshot import generate_default_filename
+from cli.screenshot import generate_default_filename, load_canvas_state, screenshot
 from cli.config import CLI_OUTPUT_DIR
 
 
@@ -68,3 +70,43 @@ class TestGenerateDefaultFilename:
             # Note: This test may need adjustment based on actual implementation
             # The key point is that timestamps make filenames unique
             assert "20240101" in result1.name or result1 != result2
+
+
+class TestRenderCommand:
+    """Test the browserless screenshot render command."""
+
+    STATE = {
+        "Points": [{"name": "A", "args": {"position": {"x": 1, "y": 1}}}],
+        "Cartesian_System_Visibility": {"left_bound": -5, "right_bound": 5, "top_bound": 5, "bottom_bound": -5},
+    }
+
+    def test_load_canvas_state_unwraps_workspace(self, tmp_path: Path) -> None:
+        """Workspace files are unwrapped to their canvas state."""
+        workspace = tmp_path / "ws.json"
+        workspace.write_text(json.dumps({"metadata": {"name": "ws"}, "state": self.STATE}))
+        assert load_canvas_state(workspace) == self.STATE
+
+    def test_render_png(self, tmp_path: Path) -> None:
+        """render writes a PNG of the requested size without a server."""
+        state_file = tmp_path / "state.json"
+        state_file.write_text(json.dumps(self.STATE))
+        output = tmp_path / "out.png"
+
+        result = CliRunner().invoke(screenshot, ["render", str(state_file), "-o", str(output), "-w", "64", "-h", "48"])
+
+        assert result.exit_code == 0, result.output
+        data = output.read_bytes()
+        assert data.startswith(b"\x89PNG")
+        assert data[16:24] == (64).to_bytes(4, "big") + (48).to_bytes(4, "big")
+
+    def test_render_svg_reports_unsupported(self, tmp_path: Path) -> None:
+        """An .svg output selects SVG, and unsupported buckets are listed."""
+        state_file = tmp_path / "state.json"
+        state_file.write_text(json.dumps({**self.STATE, "UndirectedGraphs": [{"name": "G", "args": {}}]}))
+        output = tmp_path / "out.svg"
+
+        result = CliRunner().invoke(screenshot, ["render", str(state_file), "-o", str(output)])
+
+        assert result.exit_code == 0
+        assert "UndirectedGraphs" in result.output
+        assert output.read_text().startswith("<svg")
@@ -0,0 +1,186 @@
+"""Tests for static/client_bundle.py and the /client_bundle/ route."""
+
+from __future__ import annotations
+
+import gzip
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from typing import Dict, Optional
+
+from static.app_manager import AppManager
+from static.client_bundle import (
+    CORE_CHUNK,
+    IMMUTABLE_CACHE_CONTROL,
+    build_client_bundle,
+    bundle_file_names,
+    chunk_for_module,
+    load_client_bundle,
+    module_name_for,
+)
+
+
+def _read_vfs(path: Path) -> Dict[str, list]:
+    text = path.read_text(encoding="utf-8")
+    payload = text.split("var scripts = ", 1)[1].rsplit(";\n__BRYTHON__.update_VFS", 1)[0]
+    scripts: Dict[str, list] = json.loads(payload)
+    return scripts
+
+
+class TestClientBundleBuild(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = Path(tempfile.mkdtemp())
+        self.client = self.tmp / "client"
+        self.output = self.tmp / "out"
+        self._write("main.py", "import canvas\n")
+        self._write("canvas.py", "from utils.helpers import helper\n")
+        self._write("utils/__init__.py", "")
+        self._write("utils/helpers.py", "def helper():\n    return 1\n")
+        self._write("utils/graph_layout.py", "from . import helpers\n")
+        self._write("client_tests/__init__.py", "")
+        self._write("client_tests/test_a.py", "from .test_b import B\n")
+        self._write("client_tests/test_b.py", "class B:\n    pass\n")
+        self._write("__pycache__/ignored.py", "this is not python\n")
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def _write(self, relative: str, text: str) -> None:
+        path = self.client / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+
+    def _build(self) -> dict:
+        chunks = {"graph_layout": ("utils.graph_layout",), "client_tests": ("client_tests",)}
+        return dict(build_client_bundle(self.client, self.output, chunks))
+
+    def test_module_names_and_chunks(self) -> None:
+        self.assertEqual(module_name_for("utils/helpers.py"), ("utils.helpers", False))
+        self.assertEqual(module_name_for("utils/__init__.py"), ("utils", True))
+        self.assertEqual(chunk_for_module("utils.statistics.regression"), "statistics")
+        self.assertEqual(chunk_for_module("utils.statistics_extra"), CORE_CHUNK)
+        self.assertEqual(chunk_for_module("client_tests"), "client_tests")
+
+    def test_modules_are_split_into_core_and_lazy_chunks(self) -> None:
+        manifest = self._build()
+
+        core = _read_vfs(self.output / manifest["core"])
+        self.assertEqual(sorted(k for k in core if k != "$timestamp"), ["canvas", "main", "utils", "utils.helpers"])
+        self.assertEqual(core["utils"][3], 1)
+        self.assertEqual(core["canvas"][2], ["utils.helpers"])
+
+        layout = _read_vfs(self.output / manifest["chunks"]["graph_layout"]["file"])
+        self.assertEqual(layout["utils.graph_layout"][2], ["utils", "utils.helpers"])
+
+        tests = _read_vfs(self.output / manifest["chunks"]["client_tests"]["file"])
+        self.assertEqual(tests["client_tests.test_a"][2], ["client_tests.test_b"])
+        self.assertEqual(manifest["chunks"]["client_tests"]["prefixes"], ["client_tests"])
+
+    def test_core_imports_never_name_lazy_modules(self) -> None:
+        self._write("canvas.py", "from utils.helpers import helper\nfrom utils.graph_layout import x\n")
+        manifest = self._build()
+        core = _read_vfs(self.output / manifest["core"])
+        self.assertNotIn("utils.graph_layout", core["canvas"][2])
+
+    def test_names_follow_content_and_gzip_matches(self) -> None:
+        first = self._build()
+        second = self._build()
+        self.assertEqual(first, second)
+        self.assertRegex(first["core"], r"^mathud-core\.[0-9a-f]{12}\.js$")
+
+        self._write("utils/graph_layout.py", "from . import helpers\nVALUE = 2\n")
+        third = self._build()
+        self.assertEqual(third["core"], first["core"])
+        self.assertNotEqual(third["chunks"]["graph_layout"]["file"], first["chunks"]["graph_layout"]["file"])
+        self.assertFalse((self.output / first["chunks"]["graph_layout"]["file"]).exists())
+
+        for name in bundle_file_names(third):  # type: ignore[arg-type]
+            raw = (self.output / name).read_bytes()
+            self.assertEqual(gzip.decompress((self.output / f"{name}.gz").read_bytes()), raw)
+
+    def test_syntax_errors_fail_the_build(self) -> None:
+        self._write("broken.py", "def broken(:\n")
+        with self.assertRaises(SyntaxError):
+            self._build()
+
+    def test_stale_or_missing_bundles_are_ignored(self) -> None:
+        self.assertIsNone(load_client_bundle(self.client, self.output))
+        manifest = self._build()
+        self.assertEqual(load_client_bundle(self.client, self.output), manifest)
+
+        self._write("canvas.py", "from utils.helpers import helper\nEDITED = True\n")
+        self.assertIsNone(load_client_bundle(self.client, self.output))
+
+        manifest = self._build()
+        (self.output / manifest["core"]).unlink()
+        self.assertIsNone(load_client_bundle(self.client, self.output))
+
+
+class TestClientBundleRoutes(unittest.TestCase):
+    def setUp(self) -> None:
+        self.original_require_auth: Optional[str] = os.environ.get("REQUIRE_AUTH")
+        os.environ["REQUIRE_AUTH"] = "false"
+        self.tmp = Path(tempfile.mkdtemp())
+        client = self.tmp / "client"
+        client.mkdir()
+        (client / "main.py").write_text("import canvas\n", encoding="utf-8")
+        (client / "canvas.py").write_text("VALUE = 1\n", encoding="utf-8")
+        (client / "client_tests").mkdir()
+        (client / "client_tests" / "__init__.py").write_text("", encoding="utf-8")
+        self.manifest = build_client_bundle(client, self.tmp / "out", {"client_tests": ("client_tests",)})
+
+        self.app = AppManager.create_app()
+        self.app.config["TESTING"] = True
+        self.app.client_bundle = self.manifest
+        self.app.client_bundle_dir = self.tmp / "out"
+        self.client = self.app.test_client()
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.tmp, ignore_errors=True)
+        if self.original_require_auth is not None:
+            os.environ["REQUIRE_AUTH"] = self.original_require_auth
+        else:
+            os.environ.pop("REQUIRE_AUTH", None)
+
+    def test_bundle_is_served_gzipped_with_immutable_caching(self) -> None:
+        name = self.manifest["core"]
+        response = self.client.get(f"/client_bundle/{name}", headers={"Accept-Encoding": "gzip, br"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["Content-Encoding"], "gzip")
+        self.assertEqual(response.headers["Cache-Control"], IMMUTABLE_CACHE_CONTROL)
+        self.assertIn("Accept-Encoding", response.headers["Vary"])
+        self.assertTrue(response.mimetype.endswith("javascript"))
+        body = gzip.decompress(response.get_data())
+        self.assertEqual(body, (self.tmp / "out" / name).read_bytes())
+        response.close()
+
+    def test_bundle_is_served_plain_without_gzip_support(self) -> None:
+        name = self.manifest["core"]
+        response = self.client.get(f"/client_bundle/{name}", headers={"Accept-Encoding": "identity"})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("Content-Encoding", response.headers)
+        self.assertTrue(response.get_data().startswith(b"__BRYTHON__.use_VFS = true;"))
+        response.close()
+
+    def test_unknown_files_are_not_served(self) -> None:
+        self.assertEqual(self.client.get("/client_bundle/manifest.json").status_code, 404)
+        self.app.client_bundle = None
+        self.assertEqual(self.client.get(f"/client_bundle/{self.manifest['core']}").status_code, 404)
+
+    def test_index_references_bundle_and_lazy_chunks(self) -> None:
+        html = self.client.get("/").get_data(as_text=True)
+        self.assertIn(f"/client_bundle/{self.manifest['core']}", html)
+        chunk_file = self.manifest["chunks"]["client_tests"]["file"]
+        self.assertIn("window.MATHUD_LAZY_CHUNKS", html)
+        self.assertIn(chunk_file, html)
+
+        self.app.client_bundle = None
+        html = self.client.get("/").get_data(as_text=True)
+        self.assertNotIn("MATHUD_LAZY_CHUNKS", html)
+
+
+if __name__ == "__main__":
+    unittest.main()
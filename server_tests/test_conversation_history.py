@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import json
+import os
+import unittest
+from typing import Any, Dict, List
+from unittest.mock import Mock, patch
+
+from static import conversation_history
+from static.conversation_history import (
+    SUMMARY_PREFIX,
+    ConversationHistory,
+    estimate_message_tokens,
+)
+from static.openai_api_base import OpenAIAPIBase
+
+
+def _user(text: str, canvas_state: Any = None) -> Dict[str, Any]:
+    payload: Dict[str, Any] = {"user_message": text}
+    if canvas_state is not None:
+        payload["canvas_state"] = canvas_state
+    return {"role": "user", "content": json.dumps(payload)}
+
+
+def _tool_turn(index: int, result_size: int = 40) -> List[Dict[str, Any]]:
+    call_id = f"call_{index}"
+    return [
+        _user(f"question {index}", canvas_state={"Points": [{"name": "A"}] * 5}),
+        {
+            "role": "assistant",
+            "content": "",
+            "tool_calls": [
+                {"id": call_id, "type": "function", "function": {"name": "create_point", "arguments": "{}"}}
+            ],
+        },
+        {"role": "tool", "tool_call_id": call_id, "content": "r" * result_size},
+        {"role": "assistant", "content": f"answer {index}"},
+    ]
+
+
+class TestConversationHistoryCleaning(unittest.TestCase):
+    def test_settle_strips_canvas_state_and_images(self) -> None:
+        messages: List[Dict[str, Any]] = [
+            {"role": "developer", "content": "dev"},
+            {
+                "role": "user",
+                "content": [
+                    {"type": "text", "text": json.dumps({"user_message": "hi", "canvas_state": {"Points": []}})},
+                    {"type": "image_url", "image_url": {"url": "data:image/png;base64,AAAA"}},
+                ],
+            },
+        ]
+        history = ConversationHistory()
+
+        history.settle(messages)
+
+        self.assertEqual(json.loads(messages[1]["content"]), {"user_message": "hi"})
+        self.assertEqual(history.total_tokens, sum(estimate_message_tokens(m) for m in messages))
+
+    def test_messages_are_cleaned_once(self) -> None:
+        messages: List[Dict[str, Any]] = [{"role": "developer", "content": "dev"}]
+        history = ConversationHistory()
+        with patch.object(
+            conversation_history,
+            "clean_settled_message",
+            wraps=conversation_history.clean_settled_message,
+        ) as clean:
+            for index in range(5):
+                messages.extend(_tool_turn(index))
+                history.settle(messages)
+
+        self.assertEqual(clean.call_count, len(messages))
+
+    def test_replaced_or_shrunk_list_restarts_bookkeeping(self) -> None:
+        history = ConversationHistory()
+        messages = [{"role": "developer", "content": "dev"}] + _tool_turn(0)
+        history.settle(messages)
+
+        fresh = [{"role": "developer", "content": "dev"}]
+        history.settle(fresh)
+        self.assertEqual(history.total_tokens, estimate_message_tokens(fresh[0]))
+
+        del messages[2:]
+        history.settle(messages)
+        self.assertEqual(history.total_tokens, sum(estimate_message_tokens(m) for m in messages))
+
+    def test_note_updated_reestimates_tool_results(self) -> None:
+        history = ConversationHistory()
+        messages = [{"role": "developer", "content": "dev"}] + _tool_turn(0, result_size=4)
+        history.settle(messages)
+        before = history.total_tokens
+
+        messages[3]["content"] = "x" * 4000
+        history.note_updated(messages, 3)
+
+        self.assertGreater(history.total_tokens, before + 900)
+        self.assertEqual(history.total_tokens, sum(estimate_message_tokens(m) for m in messages))
+
+
+class TestConversationHistoryCompaction(unittest.TestCase):
+    def _history(self, turns: int, budget: int, result_size: int = 40, keep: int = 2) -> List[Dict[str, Any]]:
+        history = ConversationHistory(token_budget=budget, keep_recent_turns=keep, summary_chars=32)
+        messages: List[Dict[str, Any]] = [{"role": "developer", "content": "dev"}]
+        for index in range(turns):
+            messages.extend(_tool_turn(index, result_size))
+            history.settle(messages)
+        self.history = history
+        return messages
+
+    def test_within_budget_is_untouched(self) -> None:
+        messages = self._history(turns=4, budget=100000)
+        self.assertEqual(len(messages), 1 + 4 * 4)
+        self.assertFalse(any(SUMMARY_PREFIX in str(m.get("content")) for m in messages))
+
+    def test_truncates_old_tool_results_first(self) -> None:
+        # Four turns with 2000-char results are ~2200 tokens; truncating the oldest two fits 1500.
+        messages = self._history(turns=4, budget=1500, result_size=2000)
+
+        tool_contents = [m["content"] for m in messages if m.get("role") == "tool"]
+        self.assertTrue(tool_contents[0].endswith("[truncated]"))
+        self.assertTrue(tool_contents[1].endswith("[truncated]"))
+        self.assertEqual(tool_contents[2:], ["r" * 2000, "r" * 2000])
+        self.assertLessEqual(self.history.total_tokens, 1500)
+
+    def test_summarizes_old_turns_and_keeps_recent_verbatim(self) -> None:
+        messages = self._history(turns=10, budget=500)
+
+        summaries = [m for m in messages if str(m.get("content", "")).startswith(SUMMARY_PREFIX)]
+        self.assertTrue(summaries)
+        self.assertIn("create_point", summaries[0]["content"])
+        self.assertIn("answer", summaries[0]["content"])
+        # The two most recent turns are intact, with their tool call/result pairs.
+        self.assertEqual(messages[-4:], _strip_state(_tool_turn(9)))
+        self.assertEqual(messages[-8:-4], _strip_state(_tool_turn(8)))
+        self.assertLessEqual(self.history.total_tokens, 500)
+        self.assertEqual(self.history.total_tokens, sum(estimate_message_tokens(m) for m in messages))
+
+    def test_compacted_history_keeps_tool_pairs_valid(self) -> None:
+        messages = self._history(turns=12, budget=400)
+
+        pending: set[str] = set()
+        for message in messages:
+            for call in message.get("tool_calls") or []:
+                pending.add(call["id"])
+            if message.get("role") == "tool":
+                self.assertIn(message["tool_call_id"], pending)
+        self.assertEqual(messages[0]["role"], "developer")
+        self.assertEqual(messages[1]["role"], "user")
+
+    def test_drops_oldest_summaries_when_still_over_budget(self) -> None:
+        messages = self._history(turns=12, budget=250)
+
+        user_turns = [m for m in messages if m.get("role") == "user"]
+        self.assertLess(len(user_turns), 12)
+        self.assertEqual(json.loads(user_turns[-1]["content"])["user_message"], "question 11")
+        self.assertLessEqual(self.history.total_tokens, 250)
+
+
+def _strip_state(turn: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    for message in turn:
+        conversation_history.clean_settled_message(message)
+    return turn
+
+
+class TestProviderHistoryIntegration(unittest.TestCase):
+    @patch("static.openai_api_base.OpenAI")
+    def test_budget_from_environment(self, mock_openai: Mock) -> None:
+        with patch.dict(os.environ, {"AI_HISTORY_TOKEN_BUDGET": "1234", "AI_HISTORY_KEEP_TURNS": "0"}):
+            api = OpenAIAPIBase()
+            self.assertEqual(api.history.token_budget, 1234)
+            self.assertEqual(api.history.keep_recent_turns, 4)
+
+    @patch("static.openai_api_base.OpenAI")
+    def test_clean_conversation_history_bounds_long_sessions(self, mock_openai: Mock) -> None:
+        with patch.dict(os.environ, {"AI_HISTORY_TOKEN_BUDGET": "1500"}):
+            api = OpenAIAPIBase()
+            for index in range(40):
+                api.messages.extend(_tool_turn(index, result_size=400))
+                api._clean_conversation_history()
+
+        self.assertLessEqual(api.history.total_tokens, 1500)
+        self.assertEqual(api.messages[0]["role"], "developer")
+        user_contents = [m["content"] for m in api.messages if m.get("role") == "user"]
+        self.assertFalse(any("canvas_state" in content for content in user_contents))
+
+    @patch("static.openai_api_base.OpenAI")
+    def test_tool_results_update_running_estimate(self, mock_openai: Mock) -> None:
+        api = OpenAIAPIBase()
+        api.messages.extend(_tool_turn(0, result_size=4))
+        api._clean_conversation_history()
+        before = api.history.total_tokens
+
+        api._update_tool_messages_with_results(json.dumps({"call_0": "x" * 400}))
+
+        self.assertGreater(api.history.total_tokens, before)
+        self.assertEqual(api.history.total_tokens, sum(estimate_message_tokens(m) for m in api.messages))
+
+
+if __name__ == "__main__":
+    unittest.main()
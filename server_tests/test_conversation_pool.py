@@ -0,0 +1,303 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+import unittest
+from typing import Any, Dict, Iterator, List, Optional
+from unittest.mock import MagicMock, patch
+
+from static import routes
+from static.app_manager import AppManager, MatHudFlask
+from static.conversation_pool import (
+    NO_CANVAS_SNAPSHOT,
+    SESSION_HEADER,
+    ConversationPool,
+    ConversationSession,
+    is_valid_session_id,
+)
+from static.openai_completions_api import OpenAIChatCompletionsAPI
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _session(session_id: str) -> ConversationSession:
+    return ConversationSession(session_id, MagicMock(), MagicMock(), f"snapshots/{session_id}.png")
+
+
+class TestConversationPool(unittest.TestCase):
+    def setUp(self) -> None:
+        self.clock = FakeClock()
+        self.evicted: List[str] = []
+        self.pool = ConversationPool(
+            _session,
+            _session("default"),
+            max_sessions=2,
+            idle_timeout=60,
+            clock=self.clock,
+            on_evict=lambda session: self.evicted.append(session.session_id),
+        )
+
+    def _use(self, session_id: Optional[str]) -> ConversationSession:
+        session = self.pool.acquire(session_id)
+        self.pool.release(session)
+        return session
+
+    def test_session_id_validation(self) -> None:
+        self.assertTrue(is_valid_session_id("0b8e4c1e-5f0a-4d3e-9a51-2d1c9f3b7e10"))
+        self.assertFalse(is_valid_session_id("short"))
+        self.assertFalse(is_valid_session_id("../../etc/passwd"))
+        self.assertFalse(is_valid_session_id(None))
+
+    def test_missing_id_uses_default(self) -> None:
+        self.assertIs(self._use(None), self.pool.default)
+        self.assertIs(self._use("default"), self.pool.default)
+        self.assertEqual(len(self.pool), 0)
+
+    def test_invalid_id_is_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            self.pool.acquire("bad id!")
+        self.assertEqual(len(self.pool), 0)
+        self.assertFalse(self.pool.default.in_use)
+
+    def test_failing_eviction_hook_is_logged(self) -> None:
+        def failing_hook(session: ConversationSession) -> None:
+            raise RuntimeError("boom")
+
+        pool = ConversationPool(_session, _session("default"), max_sessions=1, on_evict=failing_hook)
+        pool.release(pool.acquire("session-a"))
+        with self.assertLogs("mathud", level="ERROR") as captured:
+            pool.release(pool.acquire("session-b"))
+        self.assertIn("session-a", captured.output[0])
+
+    def test_same_id_returns_same_session(self) -> None:
+        first = self._use("session-a")
+        self.assertIs(self._use("session-a"), first)
+        self.assertIsNot(self._use("session-b"), first)
+
+    def test_lru_eviction(self) -> None:
+        self._use("session-a")
+        self._use("session-b")
+        self._use("session-a")  # refresh A, so B is least recently used
+        self._use("session-c")
+
+        self.assertIn("session-a", self.pool)
+        self.assertNotIn("session-b", self.pool)
+        self.assertEqual(self.evicted, ["session-b"])
+
+    def test_in_use_sessions_are_not_evicted(self) -> None:
+        held = self.pool.acquire("session-a")
+        self._use("session-b")
+        self._use("session-c")
+
+        self.assertIn("session-a", self.pool)
+        self.assertEqual(self.evicted, ["session-b"])
+        self.pool.release(held)
+
+    def test_idle_timeout(self) -> None:
+        self._use("session-a")
+        self.clock.now = 30
+        self._use("session-b")
+        self.clock.now = 61
+
+        self.assertEqual(self.pool.evict_idle(), 1)
+        self.assertNotIn("session-a", self.pool)
+        self.assertIn("session-b", self.pool)
+        self.assertEqual(self.evicted, ["session-a"])
+
+    def test_new_session_gets_its_own_snapshot_path(self) -> None:
+        session = self._use("session-a")
+        self.assertEqual(session.ai_api.canvas_snapshot_path, "snapshots/session-a.png")
+        provider = MagicMock()
+        session.add_provider("anthropic", provider)
+        self.assertEqual(provider.canvas_snapshot_path, "snapshots/session-a.png")
+        self.assertEqual(len(session.all_providers()), 3)
+
+    def test_canvas_snapshot_is_shared_with_providers(self) -> None:
+        session = self._use("session-a")
+        session.set_canvas_snapshot(b"png")
+        provider = MagicMock()
+        session.add_provider("anthropic", provider)
+
+        self.assertEqual(session.ai_api.canvas_snapshot_bytes, b"png")
+        self.assertEqual(provider.canvas_snapshot_bytes, b"png")
+        session.set_canvas_snapshot(None)
+        self.assertEqual(provider.canvas_snapshot_bytes, NO_CANVAS_SNAPSHOT)
+
+    def test_settings_from_env(self) -> None:
+        with patch.dict(os.environ, {"CONVERSATION_POOL_SIZE": "5", "CONVERSATION_IDLE_TIMEOUT": "not-a-number"}):
+            max_sessions, idle_timeout = ConversationPool.settings_from_env()
+        self.assertEqual(max_sessions, 5)
+        self.assertEqual(idle_timeout, 1800.0)
+
+
+class TestConversationRoutes(unittest.TestCase):
+    """Route-level checks that each session header gets an isolated conversation."""
+
+    def setUp(self) -> None:
+        patcher = patch.dict(os.environ, {"REQUIRE_AUTH": "false"})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.app: MatHudFlask = AppManager.create_app()
+        self.app.config["TESTING"] = True
+        self.client = self.app.test_client()
+
+    def test_no_header_uses_shared_apis(self) -> None:
+        conversation = self.app.conversations.default
+        self.assertIs(conversation.ai_api, self.app.ai_api)
+        self.assertIs(conversation.responses_api, self.app.responses_api)
+        self.assertIs(conversation.providers, self.app.providers)
+
+    def test_new_conversation_only_resets_its_session(self) -> None:
+        session = self.app.conversations.acquire("session-a")
+        self.app.conversations.release(session)
+        session.ai_api.messages.append({"role": "user", "content": "session a"})
+        self.app.ai_api.messages.append({"role": "user", "content": "shared"})
+
+        response = self.client.post("/new_conversation", headers={SESSION_HEADER: "session-a"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(session.ai_api.messages), 1)
+        self.assertEqual(self.app.ai_api.messages[-1]["content"], "shared")
+
+    def test_invalid_session_header_is_rejected(self) -> None:
+        self.app.ai_api.messages.append({"role": "user", "content": "shared"})
+
+        response = self.client.post("/new_conversation", headers={SESSION_HEADER: "../bad"})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.app.ai_api.messages[-1]["content"], "shared")
+        self.assertEqual(len(self.app.conversations), 0)
+
+    def test_busy_session_returns_conflict(self) -> None:
+        session = self.app.conversations.acquire("session-a")
+        self.addCleanup(self.app.conversations.release, session)
+        with session.lock, patch.object(routes, "CONVERSATION_LOCK_TIMEOUT_SECONDS", 0.01):
+            response = self.client.post("/new_conversation", headers={SESSION_HEADER: "session-a"})
+        self.assertEqual(response.status_code, 409)
+
+
+class TestConcurrentStreamingSessions(unittest.TestCase):
+    """Load test: N clients stream at once against a stubbed provider."""
+
+    SESSIONS = 8
+    TOKENS = 5
+    TOKEN_DELAY = 0.03
+
+    def setUp(self) -> None:
+        patcher = patch.dict(os.environ, {"REQUIRE_AUTH": "false"})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.app: MatHudFlask = AppManager.create_app()
+        self.app.config["TESTING"] = True
+
+        self.active: Dict[int, int] = {}
+        self.max_active = 0
+        self.max_active_per_conversation: Dict[int, int] = {}
+        self.counter_lock = threading.Lock()
+        # When set, every stream waits here before its first token
+        self.rendezvous: Optional[threading.Barrier] = None
+
+        test = self
+
+        def fake_stream(api: OpenAIChatCompletionsAPI, full_prompt: str) -> Iterator[Dict[str, Any]]:
+            user_message = json.loads(full_prompt)["user_message"]
+            key = id(api)
+            with test.counter_lock:
+                test.active[key] = test.active.get(key, 0) + 1
+                test.max_active = max(test.max_active, sum(test.active.values()))
+                test.max_active_per_conversation[key] = max(
+                    test.max_active_per_conversation.get(key, 0), test.active[key]
+                )
+            try:
+                if test.rendezvous is not None:
+                    test.rendezvous.wait()
+                api.messages.append({"role": "user", "content": user_message})
+                for index in range(test.TOKENS):
+                    time.sleep(test.TOKEN_DELAY)
+                    yield {"type": "token", "text": f"{user_message}:{index} "}
+                api.messages.append({"role": "assistant", "content": f"reply to {user_message}"})
+                yield {
+                    "type": "final",
+                    "ai_message": f"reply to {user_message}",
+                    "ai_tool_calls": [],
+                    "finish_reason": "stop",
+                }
+            finally:
+                with test.counter_lock:
+                    test.active[key] -= 1
+
+        stream_patch = patch.object(OpenAIChatCompletionsAPI, "create_chat_completion_stream", fake_stream)
+        stream_patch.start()
+        self.addCleanup(stream_patch.stop)
+
+    def _stream(self, session_id: str, text: str) -> List[Dict[str, Any]]:
+        payload = {"message": json.dumps({"user_message": text, "use_vision": False, "ai_model": "gpt-4.1"})}
+        client = self.app.test_client()
+        response = client.post("/send_message_stream", json=payload, headers={SESSION_HEADER: session_id})
+        self.assertEqual(response.status_code, 200)
+        return [json.loads(line) for line in response.data.decode("utf-8").splitlines() if line.strip()]
+
+    def _run_clients(self, requests: List[tuple[str, str]]) -> Dict[str, List[Dict[str, Any]]]:
+        results: Dict[str, List[Dict[str, Any]]] = {}
+        errors: List[BaseException] = []
+
+        def worker(session_id: str, text: str) -> None:
+            try:
+                results[text] = self._stream(session_id, text)
+            except BaseException as exc:  # surface thread failures in the test
+                errors.append(exc)
+
+        threads = [threading.Thread(target=worker, args=request) for request in requests]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=30)
+        self.assertEqual(errors, [])
+        return results
+
+    def test_sessions_stream_in_parallel_without_sharing_history(self) -> None:
+        requests = [(f"load-session-{index:02d}", f"message-{index}") for index in range(self.SESSIONS)]
+
+        # Only passes if all sessions are inside their streams at the same time
+        self.rendezvous = threading.Barrier(self.SESSIONS, timeout=10)
+        results = self._run_clients(requests)
+
+        self.assertFalse(self.rendezvous.broken)
+        self.assertEqual(self.max_active, self.SESSIONS)
+
+        for session_id, text in requests:
+            final = results[text][-1]
+            self.assertEqual(final["ai_message"], f"reply to {text}")
+            tokens = [event["text"] for event in results[text] if event["type"] == "token"]
+            self.assertTrue(all(token.startswith(f"{text}:") for token in tokens))
+
+            conversation = self.app.conversations.peek(session_id)
+            assert conversation is not None
+            contents = [message["content"] for message in conversation.ai_api.messages[1:]]
+            self.assertEqual(contents, [text, f"reply to {text}"])
+            self.assertFalse(conversation.in_use)
+
+        self.assertEqual(len(self.app.ai_api.messages), 1)
+
+    def test_requests_on_one_session_are_serialized(self) -> None:
+        requests = [("shared-session", f"turn-{index}") for index in range(4)]
+
+        self._run_clients(requests)
+
+        conversation = self.app.conversations.peek("shared-session")
+        assert conversation is not None
+        self.assertEqual(self.max_active_per_conversation[id(conversation.ai_api)], 1)
+        roles = [message["role"] for message in conversation.ai_api.messages[1:]]
+        self.assertEqual(roles, ["user", "assistant"] * 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -12,9 +12,12 @@ from __future__ import annotations
 import base64
 import json
 import os
+import tempfile
 import unittest
 from unittest.mock import Mock, patch
 
+from static.conversation_history import strip_images
+from static.conversation_pool import NO_CANVAS_SNAPSHOT
 from static.openai_api_base import OpenAIAPIBase
 from static.openai_responses_api import OpenAIResponsesAPI
 from static.routes import extract_vision_payload
@@ -257,6 +260,33 @@ class TestCreateEnhancedPromptWithImage(unittest.TestCase):
         )
         self.assertIsNone(result)
 
+    @patch("static.openai_api_base.OpenAI")
+    def test_in_memory_snapshot_skips_file(self, mock_openai: Mock) -> None:
+        """Snapshot bytes handed over by the route are used without reading the file."""
+        api = OpenAIAPIBase()
+        api.canvas_snapshot_path = os.path.join("does-not-exist", "canvas.png")
+        api.canvas_snapshot_bytes = b"\x89PNG-bytes"
+
+        result = api._create_enhanced_prompt_with_image(user_message="Look", include_canvas_snapshot=True)
+
+        self.assertIsNotNone(result)
+        expected = "data:image/png;base64," + base64.b64encode(b"\x89PNG-bytes").decode("ascii")
+        self.assertEqual(result[1]["image_url"]["url"], expected)
+
+    @patch("static.openai_api_base.OpenAI")
+    def test_missing_snapshot_does_not_read_stale_file(self, mock_openai: Mock) -> None:
+        """A request whose capture failed sends no image even if an old snapshot file exists."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            api = OpenAIAPIBase()
+            api.canvas_snapshot_path = os.path.join(temp_dir, "canvas.png")
+            with open(api.canvas_snapshot_path, "wb") as stale:
+                stale.write(b"\x89PNG-stale")
+            api.canvas_snapshot_bytes = NO_CANVAS_SNAPSHOT
+
+            result = api._create_enhanced_prompt_with_image(user_message="Look", include_canvas_snapshot=True)
+
+        self.assertIsNone(result)
+
 
 class TestConvertContentForResponsesAPI(unittest.TestCase):
     """Tests for _convert_content_for_responses_api in OpenAIResponsesAPI."""
@@ -337,8 +367,8 @@ class TestConvertContentForResponsesAPI(unittest.TestCase):
         self.assertEqual(result, content)
 
 
-class TestRemoveImagesFromUserMessages(unittest.TestCase):
-    """Tests for _remove_images_from_user_messages in OpenAIAPIBase."""
+class TestStripImagesFromHistory(unittest.TestCase):
+    """Tests for conversation_history.strip_images as applied to provider history."""
 
     def setUp(self) -> None:
         """Set up test fixtures."""
@@ -366,7 +396,7 @@ class TestRemoveImagesFromUserMessages(unittest.TestCase):
             }
         )
 
-        api._remove_images_from_user_messages()
+        strip_images(api.messages[-1])
 
         # Content should now be just the text string
         self.assertEqual(api.messages[-1]["content"], "test message")
@@ -377,7 +407,7 @@ class TestRemoveImagesFromUserMessages(unittest.TestCase):
         api = OpenAIAPIBase()
         api.messages.append({"role": "user", "content": "simple text"})
 
-        api._remove_images_from_user_messages()
+        strip_images(api.messages[-1])
 
         self.assertEqual(api.messages[-1]["content"], "simple text")
 
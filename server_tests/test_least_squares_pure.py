@@ -0,0 +1,179 @@
+"""
+Pure Python tests for the least-squares fitting core.
+
+Covers the streaming QR accumulator, the co-moment line fit, polynomial
+rescaling, and Levenberg-Marquardt in utils.statistics.least_squares, plus
+fit timings for 100 and 10k points (100k with RUN_SLOW_TESTS=1).
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import random
+import time
+import unittest
+from typing import List, Sequence, Tuple
+
+import pytest
+
+from utils.statistics.least_squares import (
+    StreamingLeastSquares,
+    fit_line_least_squares,
+    fit_polynomial_least_squares,
+    levenberg_marquardt,
+)
+from utils.statistics.regression import fit_regression
+
+
+class TestStreamingLeastSquares(unittest.TestCase):
+    """Tests for the Givens QR accumulator."""
+
+    def test_exact_system_is_recovered(self) -> None:
+        solver = StreamingLeastSquares(3)
+        for x in [-2.0, -1.0, 0.0, 1.0, 2.0, 3.0]:
+            solver.add_row([1.0, x, x * x], 4.0 - 3.0 * x + 0.5 * x * x)
+        coefficients = solver.solve()
+        for actual, expected in zip(coefficients, [4.0, -3.0, 0.5]):
+            self.assertAlmostEqual(actual, expected, places=10)
+        self.assertAlmostEqual(solver.residual_sum_squares(), 0.0, places=18)
+
+    def test_satisfies_normal_equations_on_noisy_data(self) -> None:
+        rng = random.Random(7)
+        rows = [[1.0, rng.uniform(-1, 1), rng.uniform(-1, 1)] for _ in range(50)]
+        ys = [2.0 + r[1] - 3.0 * r[2] + rng.gauss(0, 0.1) for r in rows]
+        solver = StreamingLeastSquares(3)
+        for row, y in zip(rows, ys):
+            solver.add_row(row, y)
+
+        coefficients = solver.solve()
+        residuals = [y - sum(c * v for c, v in zip(coefficients, r)) for r, y in zip(rows, ys)]
+        # The least-squares residual is orthogonal to every column: X^T (y - X c) = 0
+        for i in range(3):
+            self.assertAlmostEqual(sum(r[i] * e for r, e in zip(rows, residuals)), 0.0, places=10)
+        self.assertAlmostEqual(solver.residual_sum_squares(), sum(e * e for e in residuals), places=10)
+        mean = sum(ys) / len(ys)
+        self.assertAlmostEqual(solver.total_sum_squares(), sum((y - mean) ** 2 for y in ys), places=10)
+
+    def test_rank_deficient_system_raises(self) -> None:
+        solver = StreamingLeastSquares(2)
+        for _ in range(5):
+            solver.add_row([1.0, 3.0], 2.0)
+        with self.assertRaises(ValueError):
+            solver.solve()
+
+    def test_row_length_is_checked(self) -> None:
+        with self.assertRaises(ValueError):
+            StreamingLeastSquares(2).add_row([1.0], 1.0)
+
+
+class TestLineAndPolynomialFits(unittest.TestCase):
+    """Tests for the one-pass line and polynomial fits."""
+
+    def test_line_fit_survives_large_x_offset(self) -> None:
+        # n*sum(xx) - sum(x)^2 cancels catastrophically for x near 1e8
+        x = [1e8 + i for i in range(10)]
+        y = [2.0 * (xi - 1e8) + 1.0 for xi in x]
+        intercept, slope, ss_res, _ = fit_line_least_squares(x, y)
+        self.assertAlmostEqual(slope, 2.0, places=8)
+        self.assertAlmostEqual(intercept + slope * 1e8, 1.0, places=5)
+        self.assertLess(ss_res, 1e-12)
+
+    def test_polynomial_fit_on_narrow_offset_range(self) -> None:
+        # Raw Vandermonde columns for x in [1000, 1010] are nearly collinear;
+        # inverting X^T X here gave R^2 of about 0.90
+        x = [1000.0 + 0.05 * i for i in range(201)]
+        y = [(xi - 1005.0) ** 4 - 2.0 * (xi - 1005.0) ** 2 + 3.0 for xi in x]
+        _, ss_res, ss_tot = fit_polynomial_least_squares(x, y, 4)
+        self.assertLess(ss_res, 1e-9 * ss_tot)
+        result = fit_regression(x, y, "polynomial", degree=4)
+        self.assertAlmostEqual(result["r_squared"], 1.0, places=8)
+        # Monomial coefficients around x = 1000 are huge, so compare with a loose tolerance
+        self.assertAlmostEqual(result["coefficients"]["a4"], 1.0, places=6)
+
+    def test_high_degree_polynomial_regression(self) -> None:
+        x = [-1.0 + 0.01 * i for i in range(201)]
+        y = [sum((k + 1) * xi**k for k in range(10)) for xi in x]
+        result = fit_regression(x, y, "polynomial", degree=9)
+        for k in range(10):
+            self.assertAlmostEqual(result["coefficients"][f"a{k}"], k + 1, places=6)
+
+
+class TestLevenbergMarquardt(unittest.TestCase):
+    """Tests for the Levenberg-Marquardt solver."""
+
+    @staticmethod
+    def _decay(x: float, params: Sequence[float]) -> Tuple[float, Sequence[float]]:
+        a, k = params
+        e = math.exp(-k * x)
+        return a * e, (e, -a * x * e)
+
+    def test_converges_from_distant_start(self) -> None:
+        x = [0.25 * i for i in range(40)]
+        y = [5.0 * math.exp(-0.7 * xi) for xi in x]
+        params, sse = levenberg_marquardt(self._decay, (1.0, 0.1), x, y)
+        self.assertAlmostEqual(params[0], 5.0, places=6)
+        self.assertAlmostEqual(params[1], 0.7, places=6)
+        self.assertLess(sse, 1e-12)
+
+    def test_invalid_steps_are_rejected(self) -> None:
+        x = [0.25 * i for i in range(40)]
+        y = [5.0 * math.exp(-0.7 * xi) for xi in x]
+        params, _ = levenberg_marquardt(self._decay, (1.0, 0.1), x, y, is_valid=lambda p: p[0] <= 3.0)
+        self.assertLessEqual(params[0], 3.0)
+
+    def test_never_increases_error(self) -> None:
+        x = [0.1 * i for i in range(50)]
+        y = [math.sin(xi) for xi in x]
+        start = (2.0, 0.5)
+        start_sse = sum((yi - self._decay(xi, start)[0]) ** 2 for xi, yi in zip(x, y))
+        _, sse = levenberg_marquardt(self._decay, start, x, y)
+        self.assertLessEqual(sse, start_sse)
+
+
+def _benchmark_data(model: str, n: int) -> Tuple[List[float], List[float]]:
+    rng = random.Random(1)
+    x = [20.0 * i / n for i in range(n)]
+    if model == "linear":
+        y = [3.0 * xi - 7.0 + rng.gauss(0, 1.0) for xi in x]
+    elif model == "polynomial":
+        y = [0.01 * xi**5 - 0.3 * xi**3 + xi + rng.gauss(0, 0.5) for xi in x]
+    elif model == "logistic":
+        y = [5.0 / (1.0 + math.exp(-2.0 * (xi - 10.0))) + rng.gauss(0, 0.1) for xi in x]
+    else:
+        y = [3.0 * math.sin(0.8 * xi + 0.3) - 1.0 + rng.gauss(0, 0.2) for xi in x]
+    return x, y
+
+
+class TestFittingBenchmarks(unittest.TestCase):
+    """Fit timings on noisy data at increasing sizes."""
+
+    SIZES = (100, 10_000)
+    SLOW_SIZES = (100_000,)
+    MODELS = ("linear", "polynomial", "logistic", "sinusoidal")
+
+    def _time_fits(self, sizes: Sequence[int]) -> None:
+        for model in self.MODELS:
+            for n in sizes:
+                x, y = _benchmark_data(model, n)
+                degree = 5 if model == "polynomial" else None
+                start = time.perf_counter()
+                result = fit_regression(x, y, model, degree=degree)
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                print(f"\n### {model} n={n}: {elapsed_ms:.1f}ms, r^2={result['r_squared']:.6f}")
+                self.assertGreater(result["r_squared"], 0.95, f"{model} n={n}")
+
+    def test_fit_timings(self) -> None:
+        self._time_fits(self.SIZES)
+
+    @pytest.mark.slow
+    @pytest.mark.skipif(
+        os.getenv("RUN_SLOW_TESTS", "").strip() != "1",
+        reason="Set RUN_SLOW_TESTS=1 to time fits on 100k points.",
+    )
+    def test_fit_timings_large(self) -> None:
+        self._time_fits(self.SLOW_SIZES)
+
+
+if __name__ == "__main__":
+    unittest.main()
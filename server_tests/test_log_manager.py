@@ -1,12 +1,18 @@
-"""Tests for LogManager — structured action trace logging."""
+"""Tests for LogManager — structured action trace logging and the JSONL pipeline."""
 
 from __future__ import annotations
 
 import json
 import logging
+import os
+import tempfile
+import threading
 import unittest
+import unittest.mock
+from typing import Any, Dict, List
 
-from static.log_manager import LogManager
+import static.log_manager as log_manager_module
+from static.log_manager import JsonLineFormatter, LogManager, StructuredQueueHandler, start_log_pipeline
 
 
 class TestLogActionTrace(unittest.TestCase):
@@ -51,3 +57,177 @@ class TestLogActionTrace(unittest.TestCase):
         json_str = msg.split("action_trace ", 1)[1]
         # Keys should be sorted
         self.assertLess(json_str.index("a_field"), json_str.index("z_field"))
+
+
+class TestJsonLinePipeline(unittest.TestCase):
+    """Verify records are written off-thread as capped, de-duplicated JSON lines."""
+
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.log_path = os.path.join(self.tmp.name, "session.jsonl")
+        self.logger = logging.getLogger(f"test_jsonl_{id(self)}")
+        self.logger.propagate = False
+        self.logger.setLevel(logging.INFO)
+        self.log_manager = LogManager.__new__(LogManager)
+        self.log_manager._logger = self.logger
+
+    def _start(self, **kwargs: Any) -> None:
+        handler, self.listener, self.queue = start_log_pipeline(self.log_path, **kwargs)
+        self.logger.addHandler(handler)
+
+        def stop() -> None:
+            self.logger.removeHandler(handler)
+            self.listener.stop()
+            for file_handler in self.listener.handlers:
+                file_handler.close()
+
+        self.addCleanup(stop)
+
+    def _records(self) -> List[Dict[str, Any]]:
+        self.queue.join()
+        with open(self.log_path, encoding="utf-8") as fh:
+            return [json.loads(line) for line in fh]
+
+    def test_user_message_is_parsed_on_writer_thread(self) -> None:
+        self._start()
+        threads: List[str] = []
+        original = JsonLineFormatter._structured_fields
+
+        def spy(formatter: JsonLineFormatter, record: logging.LogRecord) -> Dict[str, Any]:
+            threads.append(threading.current_thread().name)
+            return original(formatter, record)
+
+        prompt = {
+            "user_message": "draw a point",
+            "svg_state": {"dimensions": {"width": 800, "height": 600}},
+            "canvas_state": {"Points": [{"name": "A"}]},
+            "previous_results": {"x": 1},
+        }
+        with unittest.mock.patch.object(JsonLineFormatter, "_structured_fields", spy):
+            self.log_manager.log_user_message(json.dumps(prompt))
+            record = self._records()[0]
+
+        self.assertEqual(record["event"], "user_message")
+        self.assertEqual(record["user_message"], "draw a point")
+        self.assertEqual(record["svg_dimensions"], {"width": 800, "height": 600})
+        self.assertEqual(record["canvas_state"], {"Points": [{"name": "A"}]})
+        self.assertEqual(record["previous_results"], {"x": 1})
+        self.assertNotIn(threading.current_thread().name, threads)
+
+    def test_invalid_prompt_is_recorded(self) -> None:
+        self._start()
+        self.log_manager.log_user_message("not json")
+        record = self._records()[0]
+        self.assertEqual(record["error"], "Failed to decode user message JSON.")
+        self.assertEqual(record["prompt"], "not json")
+
+    def test_repeated_canvas_state_is_written_once(self) -> None:
+        self._start()
+        prompt = json.dumps({"user_message": "hi", "canvas_state": {"Points": [{"name": "A"}]}})
+        self.log_manager.log_user_message(prompt)
+        self.log_manager.log_user_message(prompt)
+
+        first, second = self._records()
+        self.assertIn("canvas_state", first)
+        self.assertNotIn("canvas_state", second)
+        self.assertTrue(second["canvas_state_repeat"])
+        self.assertEqual(first["canvas_state_hash"], second["canvas_state_hash"])
+
+    def test_large_fields_are_capped(self) -> None:
+        self._start(field_max_chars=100)
+        calls = [{"function_name": "create_point", "arguments": {"x": i, "y": i}} for i in range(50)]
+        self.log_manager.log_ai_tool_calls(calls)
+
+        record = self._records()[0]
+        self.assertEqual(record["count"], 50)
+        self.assertTrue(record["tool_calls"].endswith("...[truncated]"))
+        self.assertLess(len(record["tool_calls"]), 150)
+        self.assertGreater(record["tool_calls_chars"], 100)
+
+    def test_tool_calls_mutated_after_logging_are_written_as_logged(self) -> None:
+        self._start()
+        calls: List[Dict[str, Any]] = [{"function_name": "create_point", "arguments": {"x": 1}}]
+        self.listener.stop()
+        self.log_manager.log_ai_tool_calls(calls)
+        calls[0]["arguments"]["x"] = 99
+        calls.append({"function_name": "undo", "arguments": {}})
+        self.listener.start()
+
+        record = self._records()[0]
+        self.assertEqual(record["count"], 1)
+        self.assertEqual(record["tool_calls"], [{"function_name": "create_point", "arguments": {"x": 1}}])
+
+    def test_exception_traceback_is_kept_separate_from_message(self) -> None:
+        self._start()
+        try:
+            raise ValueError("bad input")
+        except ValueError:
+            self.logger.exception("request failed for %s", "A")
+
+        record = self._records()[0]
+        self.assertEqual(record["message"], "request failed for A")
+        self.assertIn("Traceback", record["exception"])
+        self.assertIn("ValueError: bad input", record["exception"])
+
+    def test_files_rotate_by_size(self) -> None:
+        self._start(max_bytes=2000, backup_count=2)
+        for index in range(40):
+            self.log_manager.log_ai_response(f"response {index} " + "x" * 100)
+        self.queue.join()
+
+        files = sorted(os.listdir(self.tmp.name))
+        self.assertEqual(files, ["session.jsonl", "session.jsonl.1", "session.jsonl.2"])
+        for name in files:
+            self.assertLessEqual(os.path.getsize(os.path.join(self.tmp.name, name)), 2000)
+
+
+class TestLogManagerSetup(unittest.TestCase):
+    """The process-wide pipeline is attached to the application logger only."""
+
+    def test_pipeline_leaves_root_logger_alone(self) -> None:
+        logger = logging.getLogger("mathud")
+        saved_handlers = list(logger.handlers)
+        saved_pipeline = (log_manager_module._listener, log_manager_module._log_queue)
+        root_handlers = list(logging.getLogger().handlers)
+        logger.handlers = []
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        with unittest.mock.patch("static.log_manager._stop_log_pipeline"):
+            log_manager = LogManager(logs_dir=tmp.name)
+        handler = logger.handlers[0]
+
+        def restore() -> None:
+            listener = log_manager_module._listener
+            if listener is not None:
+                listener.stop()
+                for file_handler in listener.handlers:
+                    file_handler.close()
+            logger.handlers = saved_handlers
+            log_manager_module._listener, log_manager_module._log_queue = saved_pipeline
+
+        self.addCleanup(restore)
+        log_manager.flush()
+        self.assertEqual(logging.getLogger().handlers, root_handlers)
+        self.assertIsInstance(handler, StructuredQueueHandler)
+        self.assertEqual(os.listdir(tmp.name), [log_manager._get_log_file_name()])
+
+
+class TestBrowserForwarding(unittest.TestCase):
+    """Pending browser logs are still collected and drained."""
+
+    def test_get_pending_logs_drains_queue(self) -> None:
+        with (
+            unittest.mock.patch.object(LogManager, "_setup_logging"),
+            unittest.mock.patch.dict(os.environ, {"FORWARD_LOGS_TO_BROWSER": "true", "LOG_FORWARD_LEVEL": "info"}),
+        ):
+            log_manager = LogManager()
+        log_manager._logger = logging.getLogger("test_browser_forwarding")
+        log_manager._logger.addHandler(logging.NullHandler())
+        log_manager._logger.propagate = False
+
+        log_manager.queue_for_browser("debug", "ignored")
+        log_manager.log_error("boom", source="routes")
+
+        self.assertEqual(log_manager.get_pending_logs(), [{"level": "error", "message": "boom", "source": "routes"}])
+        self.assertEqual(log_manager.get_pending_logs(), [])
@@ -26,9 +26,11 @@ class TestOpenAIAPIBase(unittest.TestCase):
         self.original_summary_mode = os.environ.get("AI_CANVAS_SUMMARY_MODE")
         self.original_hybrid_max = os.environ.get("AI_CANVAS_HYBRID_FULL_MAX_BYTES")
         self.original_summary_telemetry = os.environ.get("AI_CANVAS_SUMMARY_TELEMETRY")
+        self.original_summary_max_tokens = os.environ.get("AI_CANVAS_SUMMARY_MAX_TOKENS")
         os.environ.pop("AI_CANVAS_SUMMARY_MODE", None)
         os.environ.pop("AI_CANVAS_HYBRID_FULL_MAX_BYTES", None)
         os.environ.pop("AI_CANVAS_SUMMARY_TELEMETRY", None)
+        os.environ.pop("AI_CANVAS_SUMMARY_MAX_TOKENS", None)
 
     def tearDown(self) -> None:
         """Clean up after tests."""
@@ -48,6 +50,10 @@ class TestOpenAIAPIBase(unittest.TestCase):
             os.environ.pop("AI_CANVAS_SUMMARY_TELEMETRY", None)
         else:
             os.environ["AI_CANVAS_SUMMARY_TELEMETRY"] = self.original_summary_telemetry
+        if self.original_summary_max_tokens is None:
+            os.environ.pop("AI_CANVAS_SUMMARY_MAX_TOKENS", None)
+        else:
+            os.environ["AI_CANVAS_SUMMARY_MAX_TOKENS"] = self.original_summary_max_tokens
 
     @patch("static.openai_api_base.OpenAI")
     def test_initialization_default_model(self, mock_openai: Mock) -> None:
@@ -258,6 +264,27 @@ class TestOpenAIAPIBase(unittest.TestCase):
         self.assertFalse(parsed["canvas_state_summary"]["includes_full_state"])
         self.assertIn("state", parsed["canvas_state_summary"])
 
+    @patch("static.openai_api_base.OpenAI")
+    def test_prepare_message_content_summary_respects_token_budget(self, mock_openai: Mock) -> None:
+        api = OpenAIAPIBase()
+        os.environ["AI_CANVAS_SUMMARY_MODE"] = "summary_only"
+        os.environ["AI_CANVAS_SUMMARY_MAX_TOKENS"] = "200"
+        points = [{"name": f"P{i}", "args": {"position": {"x": i, "y": i}}} for i in range(200)]
+        prompt = json.dumps({"user_message": "test", "use_vision": False, "canvas_state": {"Points": points}})
+
+        parsed = json.loads(api._prepare_message_content(prompt))
+
+        summary = parsed["canvas_state_summary"]
+        self.assertEqual(summary["state"]["Points"]["count"], 200)
+        self.assertEqual(summary["metrics"]["collapsed_buckets"], ["Points"])
+        self.assertLessEqual(summary["metrics"]["summary_estimated_tokens"], 200)
+
+    @patch("static.openai_api_base.OpenAI")
+    def test_invalid_summary_max_tokens_falls_back_to_default(self, mock_openai: Mock) -> None:
+        api = OpenAIAPIBase()
+        os.environ["AI_CANVAS_SUMMARY_MAX_TOKENS"] = "-5"
+        self.assertEqual(api._get_canvas_summary_max_tokens(), OpenAIAPIBase.DEFAULT_CANVAS_SUMMARY_MAX_TOKENS)
+
     @patch("static.openai_api_base.OpenAI")
     def test_prepare_message_content_default_mode_is_hybrid(self, mock_openai: Mock) -> None:
         api = OpenAIAPIBase()
@@ -420,8 +447,8 @@ class TestOpenAIAPIBase(unittest.TestCase):
         self.assertEqual(error_resp.message.content, "Custom error message")
 
     @patch("static.openai_api_base.OpenAI")
-    def test_remove_canvas_state_from_user_messages(self, mock_openai: Mock) -> None:
-        """Test _remove_canvas_state_from_user_messages removes state payloads."""
+    def test_clean_history_removes_canvas_state(self, mock_openai: Mock) -> None:
+        """Test settling the turn strips canvas state payloads via ConversationHistory."""
         api = OpenAIAPIBase()
         api.messages.append(
             {
@@ -436,7 +463,7 @@ class TestOpenAIAPIBase(unittest.TestCase):
             }
         )
 
-        api._remove_canvas_state_from_user_messages()
+        api._clean_conversation_history()
 
         content = json.loads(api.messages[-1]["content"])
         self.assertNotIn("canvas_state", content)
@@ -444,8 +471,8 @@ class TestOpenAIAPIBase(unittest.TestCase):
         self.assertEqual(content["user_message"], "test")
 
     @patch("static.openai_api_base.OpenAI")
-    def test_remove_images_from_user_messages(self, mock_openai: Mock) -> None:
-        """Test _remove_images_from_user_messages removes image content."""
+    def test_clean_history_removes_images(self, mock_openai: Mock) -> None:
+        """Test settling the turn collapses image content via ConversationHistory."""
         api = OpenAIAPIBase()
         api.messages.append(
             {
@@ -457,7 +484,7 @@ class TestOpenAIAPIBase(unittest.TestCase):
             }
         )
 
-        api._remove_images_from_user_messages()
+        api._clean_conversation_history()
 
         # Content should now be just the text string
         self.assertEqual(api.messages[-1]["content"], "test message")
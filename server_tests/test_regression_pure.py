@@ -8,6 +8,7 @@ without requiring browser/Brython dependencies.
 from __future__ import annotations
 
 import math
+import random
 import unittest
 
 from utils.statistics.regression import (
@@ -24,9 +25,6 @@ from utils.statistics.regression import (
     build_expression,
     _validate_data,
     _validate_positive,
-    _matrix_multiply,
-    _matrix_transpose,
-    _matrix_inverse,
 )
 
 
@@ -80,54 +78,6 @@ class TestValidation(unittest.TestCase):
             _validate_positive([1.0, -1.0, 3.0], "test")
 
 
-class TestMatrixOperations(unittest.TestCase):
-    """Tests for pure Python matrix operations."""
-
-    def test_matrix_transpose(self) -> None:
-        A = [[1, 2, 3], [4, 5, 6]]
-        At = _matrix_transpose(A)
-        self.assertEqual(At, [[1, 4], [2, 5], [3, 6]])
-
-    def test_matrix_transpose_empty(self) -> None:
-        self.assertEqual(_matrix_transpose([]), [])
-
-    def test_matrix_multiply(self) -> None:
-        A = [[1, 2], [3, 4]]
-        B = [[5, 6], [7, 8]]
-        C = _matrix_multiply(A, B)
-        self.assertEqual(C, [[19, 22], [43, 50]])
-
-    def test_matrix_multiply_non_square(self) -> None:
-        A = [[1, 2, 3], [4, 5, 6]]  # 2x3
-        B = [[7], [8], [9]]  # 3x1
-        C = _matrix_multiply(A, B)
-        self.assertEqual(C, [[50], [122]])
-
-    def test_matrix_inverse_2x2(self) -> None:
-        A = [[4.0, 7.0], [2.0, 6.0]]
-        A_inv = _matrix_inverse(A)
-        # A * A_inv should be identity
-        I = _matrix_multiply(A, A_inv)
-        self.assertAlmostEqual(I[0][0], 1.0, places=10)
-        self.assertAlmostEqual(I[0][1], 0.0, places=10)
-        self.assertAlmostEqual(I[1][0], 0.0, places=10)
-        self.assertAlmostEqual(I[1][1], 1.0, places=10)
-
-    def test_matrix_inverse_3x3(self) -> None:
-        A = [[1.0, 2.0, 3.0], [0.0, 1.0, 4.0], [5.0, 6.0, 0.0]]
-        A_inv = _matrix_inverse(A)
-        I = _matrix_multiply(A, A_inv)
-        for i in range(3):
-            for j in range(3):
-                expected = 1.0 if i == j else 0.0
-                self.assertAlmostEqual(I[i][j], expected, places=9)
-
-    def test_matrix_inverse_singular_raises(self) -> None:
-        A = [[1.0, 2.0], [2.0, 4.0]]  # Singular (row 2 = 2 * row 1)
-        with self.assertRaises(ValueError):
-            _matrix_inverse(A)
-
-
 class TestRSquared(unittest.TestCase):
     """Tests for R-squared calculation."""
 
@@ -409,6 +359,16 @@ class TestFitSinusoidal(unittest.TestCase):
         result = fit_sinusoidal(x, y)
         self.assertGreater(result["r_squared"], 0.9)
 
+    def test_sinusoidal_dense_noisy_data(self) -> None:
+        # Noise near the mean must not add zero crossings to the period estimate
+        rng = random.Random(1)
+        x = [0.004 * i for i in range(5000)]
+        y = [3.0 * math.sin(0.8 * xi + 0.3) - 1.0 + rng.gauss(0, 0.2) for xi in x]
+
+        result = fit_sinusoidal(x, y)
+        self.assertGreater(result["r_squared"], 0.98)
+        self.assertAlmostEqual(result["coefficients"]["b"], 0.8, delta=0.01)
+
     def test_sinusoidal_minimum_points(self) -> None:
         # Need at least 4 points
         x = [0.0, 1.0, 2.0]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import base64
 import json
 import os
 import unittest
@@ -48,7 +49,7 @@ class TestRoutes(unittest.TestCase):
             except OSError:
                 pass
 
-    @patch("static.webdriver_manager.WebDriverManager")
+    @patch("static.webdriver_manager.WebDriverPool")
     def test_init_webdriver_route(self, mock_webdriver_class: Mock) -> None:
         """Test the webdriver initialization route."""
         # Create a mock instance
@@ -157,10 +158,35 @@ class TestRoutes(unittest.TestCase):
 
         self.assertEqual(response.status_code, 200)
         self.assertEqual(data["status"], "success")
-        self.assertTrue(os.path.exists(CANVAS_SNAPSHOT_PATH))
-        self.assertGreater(os.path.getsize(CANVAS_SNAPSHOT_PATH), 0)
+        self.assertEqual(self.app.ai_api.canvas_snapshot_bytes, base64.b64decode(self.SAMPLE_PNG_BASE64))
+        self.assertFalse(os.path.exists(CANVAS_SNAPSHOT_PATH))
         self.assertIsNone(self.app.webdriver_manager)
 
+    def test_tts_stream_routes(self) -> None:
+        """A registered TTS stream is served as chunked WAV from its URL."""
+        import numpy as np
+
+        from static.tts_manager import TTSManager
+
+        def pipeline(text: str, voice: str = "") -> Any:
+            yield text, "", np.zeros(100, dtype=np.float32)
+
+        manager = TTSManager(pipeline=pipeline)
+        with patch("static.routes.get_tts_manager", return_value=manager):
+            response = self.client.post("/api/tts/stream", json={"text": "One. Two.", "voice": "af_nova"})
+            data = json.loads(response.data)
+            self.assertEqual(response.status_code, 200)
+            stream_url = data["data"]["url"]
+
+            audio = self.client.get(stream_url)
+            self.assertEqual(audio.status_code, 200)
+            self.assertEqual(audio.mimetype, "audio/wav")
+            self.assertTrue(audio.is_streamed)
+            self.assertEqual(len(audio.data), 44 + 2 * 100 * 2)
+
+            missing = self.client.get("/api/tts/stream/unknown")
+            self.assertEqual(missing.status_code, 404)
+
     def test_new_conversation_route(self) -> None:
         """Test the new_conversation route resets the AI conversation history."""
         # Simulate existing conversation history in both APIs (standard + reasoning).
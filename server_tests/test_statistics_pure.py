@@ -9,6 +9,7 @@ from drawables.bars_plot import BarsPlot
 from drawables.continuous_plot import ContinuousPlot
 from drawables.discrete_plot import DiscretePlot
 from drawables.plot import Plot
+from drawables.scatter_plot import ScatterPlot
 from utils.statistics.distributions import _require_finite, default_normal_bounds, normal_pdf_expression
 
 
@@ -227,6 +228,68 @@ class TestStatisticsDrawablesPure(unittest.TestCase):
         self.assertAlmostEqual(b_state["fill_opacity"], 0.5)
         self.assertEqual(deepcopy(bars).get_state(), bars.get_state())
 
+    def test_scatter_plot_state_is_compact(self) -> None:
+        scatter = ScatterPlot("S", x_values=[1, 2, 3], y_values=[4.0, 5.0, 6.5], color="#123")
+        self.assertEqual(scatter.get_class_name(), "ScatterPlot")
+        self.assertTrue(scatter.is_renderable)
+        self.assertEqual(scatter.point_count, 3)
+        self.assertEqual(
+            scatter.get_state(),
+            {
+                "name": "S",
+                "args": {
+                    "plot_type": "scatter",
+                    "x_values": [1.0, 2.0, 3.0],
+                    "y_values": [4.0, 5.0, 6.5],
+                    "color": "#123",
+                },
+            },
+        )
+        scatter.point_radius = 2.5
+        self.assertEqual(scatter.get_state()["args"]["point_radius"], 2.5)
+
+    def test_scatter_plot_rejects_mismatched_lengths(self) -> None:
+        with self.assertRaises(ValueError):
+            ScatterPlot("S", x_values=[1.0, 2.0], y_values=[1.0])
+        scatter = ScatterPlot("S", x_values=[1.0], y_values=[1.0])
+        with self.assertRaises(ValueError):
+            scatter.set_points([1.0], [])
+
+    def test_scatter_plot_hit_testing_by_index(self) -> None:
+        scatter = ScatterPlot("S", x_values=[0.0, 1.0, 1.0, 5.0], y_values=[0.0, 1.0, 1.0, 5.0])
+        self.assertEqual(scatter.index_at(0.9, 1.05, 0.5), 1)
+        self.assertEqual(scatter.index_at(4.8, 5.1, 0.5), 3)
+        self.assertIsNone(scatter.index_at(3.0, 3.0, 0.5))
+        self.assertEqual(scatter.get_point(3), (5.0, 5.0))
+        self.assertEqual(scatter.indices_in_rect(0.5, 0.5, 6.0, 6.0), [1, 2, 3])
+
+    def test_scatter_plot_bounds_follow_mutation(self) -> None:
+        scatter = ScatterPlot("S", x_values=[1.0, -2.0, float("nan")], y_values=[3.0, 4.0, 0.0])
+        self.assertEqual(scatter.get_math_bounds(), (-2.0, 3.0, 1.0, 4.0))
+        version = scatter.get_render_version()
+        scatter.translate(1.0, -1.0)
+        self.assertGreater(scatter.get_render_version(), version)
+        self.assertEqual(scatter.get_math_bounds(), (-1.0, 2.0, 2.0, 3.0))
+        self.assertIsNone(ScatterPlot("E", x_values=[], y_values=[]).get_math_bounds())
+
+    def test_scatter_plot_deepcopy_shares_coordinates(self) -> None:
+        scatter = ScatterPlot(
+            "S",
+            x_values=[1.0, 2.0],
+            y_values=[3.0, 4.0],
+            color="#123",
+            point_radius=3.0,
+            metadata={"source": "fit"},
+        )
+        scatter_copy = deepcopy(scatter)
+        self.assertIsNot(scatter_copy, scatter)
+        self.assertEqual(scatter_copy.get_state(), scatter.get_state())
+        self.assertIs(scatter_copy.x_values, scatter.x_values)
+
+        scatter_copy.translate(1.0, 0.0)
+        self.assertEqual(scatter.x_values, (1.0, 2.0))
+        self.assertEqual(scatter_copy.x_values, (2.0, 3.0))
+
     def test_distributions_pdf_matches_expected_peak(self) -> None:
         # Sanity check for the normal PDF peak value at x == mean.
         mean = 0.0
@@ -24,7 +24,7 @@ _project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if _project_root not in sys.path:
     sys.path.insert(0, _project_root)
 
-from static.tool_search_service import ToolSearchService, clear_search_cache
+from static.tool_search_service import CONFIDENCE_THRESHOLD, ToolSearchService, clear_search_cache
 
 DATASET_PATH = Path("server_tests/data/tool_discovery_cases.yaml")
 
@@ -158,6 +158,18 @@ class TestLocalSearchBenchmark:
             f"Top-5 accuracy {metrics['top5_rate']:.3f} below threshold 0.90"
         )
 
+    def test_hybrid_fallback_rate(self) -> None:
+        """Answerable queries should rarely drop below the hybrid-mode confidence threshold."""
+        cases = [c for c in _load_dataset().get("cases", []) if c.get("expected_any")]
+        fallbacks = 0
+        for case in cases:
+            results = self.service.search_tools_local(str(case.get("query", "")).strip())
+            if not results or self.service._last_local_top_score < CONFIDENCE_THRESHOLD:
+                fallbacks += 1
+
+        print(f"\nHybrid API fallbacks: {fallbacks}/{len(cases)}")
+        assert fallbacks / len(cases) <= 0.02, f"{fallbacks}/{len(cases)} queries would fall back to the API"
+
 
 class TestLocalSearchLatency:
     """Ensure local search completes fast enough."""
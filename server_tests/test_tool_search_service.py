@@ -18,11 +18,16 @@ _project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if _project_root not in sys.path:
     sys.path.insert(0, _project_root)
 
+import static.tool_search_service as tool_search_module
 from static.tool_search_service import (
     TOOL_CATEGORIES,
     ToolSearchService,
+    _CATEGORY_POSTINGS,
+    _TOKEN_POSTINGS,
     _TOOL_BY_NAME,
-    _TOOL_NAME_INDEX,
+    _TOOLS_BY_PREFIX,
+    _cache_get,
+    _cache_put,
     _search_cache,
     clear_search_cache,
 )
@@ -902,6 +907,22 @@ class TestSearchCache:
         service.search_tools("solve equation")
         assert len(_search_cache) == 2
 
+    def test_eviction_drops_least_recently_used(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A cache hit should protect its entry from the next eviction."""
+        monkeypatch.setattr(tool_search_module, "CACHE_MAX_SIZE", 2)
+        _cache_put("a", [])
+        _cache_put("b", [])
+        assert _cache_get("a") == []
+        _cache_put("c", [])
+        assert set(_search_cache) == {"a", "c"}
+
+    def test_expired_entry_is_dropped(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Entries older than CACHE_TTL should miss and be removed."""
+        _cache_put("stale", [])
+        monkeypatch.setattr(tool_search_module, "CACHE_TTL", -1)
+        assert _cache_get("stale") is None
+        assert "stale" not in _search_cache
+
 
 class TestSearchModeSwitching:
     """Test TOOL_SEARCH_MODE env var switching."""
@@ -984,18 +1005,32 @@ class TestToolCategoryRegistry:
                     f"Tool '{tool_name}' in category '{cat_name}' not found in FUNCTIONS"
                 )
 
-    def test_name_index_populated(self) -> None:
-        """Tool name index should be populated."""
-        assert len(_TOOL_NAME_INDEX) > 0
-        # "create" should index multiple tools
-        assert len(_TOOL_NAME_INDEX.get("create", [])) > 5
-
     def test_tool_by_name_lookup(self) -> None:
         """_TOOL_BY_NAME should include all tools."""
         assert "create_circle" in _TOOL_BY_NAME
         assert "search_tools" in _TOOL_BY_NAME  # meta-tools still in lookup
         assert "undo" in _TOOL_BY_NAME
 
+    def test_prefix_buckets(self) -> None:
+        """Prefix buckets should hold exactly the tools with that prefix."""
+        assert "create_circle" in _TOOLS_BY_PREFIX["create_"]
+        for prefix, names in _TOOLS_BY_PREFIX.items():
+            assert all(name.startswith(prefix) for name in names)
+        assert "search_tools" not in _TOOLS_BY_PREFIX.get("search_", ())
+
+    def test_rare_name_tokens_outweigh_common_ones(self) -> None:
+        """BM25 should weight a rare name token above a widely shared one."""
+        parametric = dict(_TOKEN_POSTINGS["parametric"])["draw_parametric_function"]
+        function = dict(_TOKEN_POSTINGS["function"])["draw_parametric_function"]
+        assert parametric > function
+
+    def test_category_postings_cover_keywords(self) -> None:
+        """Every category keyword should post to its category."""
+        for cat_name, entry in TOOL_CATEGORIES.items():
+            for keyword in entry["keywords"]:
+                posted = {name for name, _ in _CATEGORY_POSTINGS[keyword.lower()]}
+                assert cat_name in posted
+
 
 class TestLazyClientInitialization:
     """Test that OpenAI client is lazily initialized."""
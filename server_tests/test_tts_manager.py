@@ -8,9 +8,49 @@ Note: Tests that require Kokoro will be skipped if it's not installed.
 
 from __future__ import annotations
 
+import os
+import struct
+import threading
+import time
 import unittest
+from typing import Dict, Iterator, List, Optional, Tuple
 from unittest.mock import patch
 
+import numpy as np
+
+
+class StubPipeline:
+    """Stands in for Kokoro's KPipeline: one constant-amplitude chunk per call."""
+
+    def __init__(
+        self,
+        samples_per_char: int = 10,
+        delay: float = 0.0,
+        barrier: Optional[threading.Barrier] = None,
+        amplitudes: Optional[Dict[str, float]] = None,
+    ) -> None:
+        self.samples_per_char = samples_per_char
+        self.delay = delay
+        self.barrier = barrier
+        self.amplitudes = amplitudes or {}
+        self.calls: List[Tuple[str, str]] = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, text: str, voice: str = "") -> Iterator[Tuple[str, str, np.ndarray]]:
+        with self._lock:
+            self.calls.append((text, voice))
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        if self.barrier is not None:
+            self.barrier.wait(timeout=5)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        amplitude = self.amplitudes.get(text, 0.5)
+        yield text, "", np.full(len(text) * self.samples_per_char, amplitude, dtype=np.float32)
+
 
 class TestTTSManager(unittest.TestCase):
     """Test cases for TTSManager class."""
@@ -98,6 +138,189 @@ class TestTTSManager(unittest.TestCase):
         self.assertIs(manager1, manager2)
 
 
+class TestTTSManagerStubPipeline(unittest.TestCase):
+    """Chunking, streaming, caching and concurrency with a stub pipeline."""
+
+    def test_split_sentences(self) -> None:
+        """Sentences are split on terminators and normalized."""
+        from static.tts_manager import split_sentences
+
+        self.assertEqual(
+            split_sentences("The slope is 2.5.  Next,\n the  intercept!\n\nDone"),
+            ["The slope is 2.5.", "Next, the intercept!", "Done"],
+        )
+
+    def test_generate_speech_synthesizes_each_sentence(self) -> None:
+        """Full WAV output is assembled from per-sentence synthesis."""
+        from static.tts_manager import TTSManager
+
+        pipeline = StubPipeline()
+        manager = TTSManager(pipeline=pipeline)
+        success, result = manager.generate_speech("One. Two two.", voice="af_nova")
+
+        self.assertTrue(success)
+        assert isinstance(result, bytes)
+        self.assertEqual(result[:4], b"RIFF")
+        self.assertEqual(pipeline.calls, [("One.", "af_nova"), ("Two two.", "af_nova")])
+
+    def test_repeated_text_is_served_from_cache(self) -> None:
+        """Identical text (after whitespace normalization) is synthesized once per voice."""
+        from static.tts_manager import TTSManager
+
+        pipeline = StubPipeline()
+        manager = TTSManager(pipeline=pipeline)
+        manager.generate_speech("Hello there. General Kenobi.")
+        manager.generate_speech("Hello   there.\nGeneral Kenobi.")
+        self.assertEqual(len(pipeline.calls), 2)
+        self.assertEqual(manager.cache_hits, 2)
+
+        manager.generate_speech("Hello there.", voice="af_bella")
+        self.assertEqual(len(pipeline.calls), 3)
+
+    def test_cache_is_bounded(self) -> None:
+        """The least recently used sentence is evicted once the byte budget is exceeded."""
+        from static.tts_manager import TTSManager
+
+        pipeline = StubPipeline(samples_per_char=100)
+        # "Aaaa." is 5 chars -> 500 float32 samples -> 2000 bytes; room for two sentences
+        manager = TTSManager(pipeline=pipeline, cache_bytes=4500)
+        for text in ("Aaaa.", "Bbbb.", "Aaaa.", "Cccc.", "Bbbb."):
+            manager.generate_speech(text)
+
+        self.assertEqual([call[0] for call in pipeline.calls], ["Aaaa.", "Bbbb.", "Cccc.", "Bbbb."])
+        self.assertLessEqual(manager._cache_bytes, 4500)
+
+    def test_stream_yields_header_then_one_chunk_per_sentence(self) -> None:
+        """The stream starts with an open-ended WAV header followed by PCM per sentence."""
+        from static.tts_manager import TTSManager
+
+        manager = TTSManager(pipeline=StubPipeline())
+        chunks = list(manager.stream_speech("First one. Second. Third sentence here."))
+
+        header = chunks[0]
+        self.assertEqual(header[:4], b"RIFF")
+        self.assertEqual(header[8:16], b"WAVEfmt ")
+        self.assertEqual(struct.unpack("<I", header[24:28])[0], 24000)
+        self.assertEqual(len(header), 44)
+        sentences = ("First one.", "Second.", "Third sentence here.")
+        self.assertEqual([len(chunk) for chunk in chunks[1:]], [len(sentence) * 10 * 2 for sentence in sentences])
+        self.assertEqual(struct.unpack("<h", chunks[1][:2])[0], int(0.5 * 32767))
+
+    def test_stream_rejects_empty_text_and_missing_pipeline(self) -> None:
+        """Stream setup errors are raised before any audio is produced."""
+        from static.tts_manager import TTSManager
+
+        with self.assertRaises(ValueError):
+            TTSManager(pipeline=StubPipeline()).stream_speech("  ")
+        manager = TTSManager()
+        manager._pipeline_error = "Kokoro not installed"
+        with self.assertRaises(RuntimeError):
+            manager.stream_speech("Hello.")
+
+    def test_worker_pool_synthesizes_requests_concurrently(self) -> None:
+        """Concurrent requests run on separate pipelines, one per worker."""
+        from static.tts_manager import TTSManager
+
+        # Every synthesis waits until three are running at once
+        barrier = threading.Barrier(3)
+        pipelines: List[StubPipeline] = []
+
+        def make_pipeline() -> StubPipeline:
+            pipeline = StubPipeline(barrier=barrier)
+            pipelines.append(pipeline)
+            return pipeline
+
+        manager = TTSManager(max_workers=3, pipeline_factory=make_pipeline)
+        results: List[bool] = []
+
+        def speak(text: str) -> None:
+            results.append(manager.generate_speech_threaded(text, timeout=10)[0])
+
+        threads = [threading.Thread(target=speak, args=(f"Message {i}.",)) for i in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=10)
+
+        self.assertEqual(results, [True, True, True])
+        self.assertEqual(len(pipelines), 3)
+        self.assertEqual([len(pipeline.calls) for pipeline in pipelines], [1, 1, 1])
+
+    def test_shared_pipeline_is_never_used_concurrently(self) -> None:
+        """A single injected pipeline serves one synthesis at a time."""
+        from static.tts_manager import TTSManager
+
+        pipeline = StubPipeline(delay=0.02)
+        manager = TTSManager(pipeline=pipeline, max_workers=3)
+        threads = [
+            threading.Thread(target=manager.generate_speech_threaded, args=(f"Message {i}.",)) for i in range(3)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        self.assertEqual(len(pipeline.calls), 3)
+        self.assertEqual(pipeline.max_active, 1)
+
+    def test_duplicate_uncached_sentence_is_synthesized_once(self) -> None:
+        """Requests for a sentence already being synthesized wait for that result."""
+        from static.tts_manager import TTSManager
+
+        started = threading.Event()
+        release = threading.Event()
+        pipeline = StubPipeline()
+
+        def blocking_pipeline(text: str, voice: str = "") -> Iterator[Tuple[str, str, np.ndarray]]:
+            started.set()
+            release.wait(timeout=5)
+            return pipeline(text, voice)
+
+        manager = TTSManager(max_workers=2, pipeline_factory=lambda: blocking_pipeline)
+        first = manager._executor.submit(manager._synthesize_sentence, "Same.", "am_michael")
+        self.assertTrue(started.wait(timeout=5))
+        second = manager._executor.submit(manager._synthesize_sentence, "Same.", "am_michael")
+        # The second request counts as a hit once it is waiting on the first
+        deadline = time.monotonic() + 5
+        while manager.cache_hits == 0 and time.monotonic() < deadline:
+            time.sleep(0.001)
+        release.set()
+
+        self.assertIs(first.result(timeout=5), second.result(timeout=5))
+        self.assertEqual(pipeline.calls, [("Same.", "am_michael")])
+        self.assertEqual((manager.cache_hits, manager.cache_misses), (1, 1))
+
+    def test_stream_uses_one_gain_for_every_sentence(self) -> None:
+        """Quiet sentences keep their level next to loud ones; peaks are clipped."""
+        from static.tts_manager import TTSManager
+
+        pipeline = StubPipeline(amplitudes={"Loud.": 2.0, "Quiet.": 0.25})
+        chunks = list(TTSManager(pipeline=pipeline).stream_speech("Loud. Quiet."))
+
+        self.assertEqual(struct.unpack("<h", chunks[1][:2])[0], 32767)
+        self.assertEqual(struct.unpack("<h", chunks[2][:2])[0], int(0.25 * 32767))
+
+    def test_registered_streams_are_bounded(self) -> None:
+        """Only the most recent stream registrations are remembered."""
+        from static.tts_manager import MAX_PENDING_STREAMS, TTSManager
+
+        manager = TTSManager(pipeline=StubPipeline())
+        first = manager.register_stream("First.", "bogus_voice")
+        self.assertEqual(manager.get_stream_request(first), ("First.", "am_michael"))
+        for i in range(MAX_PENDING_STREAMS):
+            manager.register_stream(f"Text {i}.")
+        self.assertIsNone(manager.get_stream_request(first))
+
+    def test_settings_from_env(self) -> None:
+        """Worker count and cache size come from TTS_WORKERS / TTS_CACHE_MB."""
+        from static.tts_manager import DEFAULT_CACHE_BYTES, DEFAULT_WORKERS, TTSManager
+
+        with patch.dict(os.environ, {"TTS_WORKERS": "4", "TTS_CACHE_MB": "0.5"}):
+            self.assertEqual(TTSManager.settings_from_env(), (4, 512 * 1024))
+        with patch.dict(os.environ, {"TTS_WORKERS": "x", "TTS_CACHE_MB": "y"}):
+            self.assertEqual(TTSManager.settings_from_env(), (DEFAULT_WORKERS, DEFAULT_CACHE_BYTES))
+
+
 class TestTTSManagerWithKokoro(unittest.TestCase):
     """Test cases that require Kokoro to be installed.
 
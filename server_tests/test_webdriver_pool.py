@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import threading
+import time
+import unittest
+from typing import Any, Dict, List
+from unittest.mock import MagicMock, patch
+
+from static.webdriver_manager import WARMUP_RETRIES, SvgState, WebDriverManager, WebDriverPool
+
+SVG_STATE: SvgState = {"content": "<svg id='math-svg'/>", "dimensions": {"width": 400, "height": 300}}
+
+
+class FakeDriver:
+    """Stands in for a warmed WebDriverManager; each capture takes ``delay`` seconds."""
+
+    def __init__(self, base_url: str, delay: float = 0.0, fail: bool = False) -> None:
+        self.base_url = base_url
+        self.delay = delay
+        self.fail = fail
+        self.closed = False
+        self.last_capture_timings: Dict[str, float] = {}
+
+    def capture_png(self, svg_state: SvgState) -> bytes:
+        if self.fail:
+            raise RuntimeError("browser crashed")
+        time.sleep(self.delay)
+        self.last_capture_timings = {"inject_ms": 1.0, "ready_ms": 2.0, "screenshot_ms": 3.0, "total_ms": 6.0}
+        return f"png:{id(self)}".encode()
+
+    def cleanup(self) -> None:
+        self.closed = True
+
+
+class TestWebDriverPool(unittest.TestCase):
+    def _pool(self, size: int, **driver_kwargs: Any) -> tuple[WebDriverPool, List[FakeDriver]]:
+        created: List[FakeDriver] = []
+
+        def factory(base_url: str) -> FakeDriver:
+            driver = FakeDriver(base_url, **driver_kwargs)
+            created.append(driver)
+            return driver
+
+        pool = WebDriverPool("http://127.0.0.1:5000/", size=size, driver_factory=factory, acquire_timeout=5)
+        self.addCleanup(pool.cleanup)
+        deadline = time.monotonic() + 5
+        while pool.ready_count < size and time.monotonic() < deadline:
+            time.sleep(0.01)
+        return pool, created
+
+    def test_drivers_are_warmed_up_front(self) -> None:
+        pool, created = self._pool(size=3)
+        self.assertEqual(pool.ready_count, 3)
+        self.assertEqual(len(created), 3)
+
+    def test_concurrent_captures_use_separate_drivers(self) -> None:
+        pool, _ = self._pool(size=3, delay=0.1)
+        results: List[bytes] = []
+        lock = threading.Lock()
+
+        def capture() -> None:
+            png = pool.capture_png(SVG_STATE)
+            assert png is not None
+            with lock:
+                results.append(png)
+
+        threads = [threading.Thread(target=capture) for _ in range(3)]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(len(set(results)), 3)
+        self.assertLess(elapsed, 0.25)
+
+    def test_requests_queue_when_all_drivers_are_busy(self) -> None:
+        pool, _ = self._pool(size=1, delay=0.05)
+        threads = [threading.Thread(target=pool.capture_png, args=(SVG_STATE,)) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        summary = pool.timing_summary()
+        self.assertEqual(summary["captures"], 3)
+        self.assertGreaterEqual(summary["queue_wait_ms"]["max"], 40.0)
+
+    def test_timings_are_reported(self) -> None:
+        pool, _ = self._pool(size=1)
+        with self.assertLogs("mathud", level="INFO") as logs:
+            pool.capture_png(SVG_STATE)
+
+        summary = pool.timing_summary()
+        self.assertEqual(summary["last"]["ready_ms"], 2.0)
+        self.assertIn("queue_wait_ms", summary["last"])
+        self.assertTrue(any("vision_capture" in line for line in logs.output))
+
+    def test_failed_driver_is_replaced(self) -> None:
+        pool, created = self._pool(size=1, fail=True)
+
+        self.assertIsNone(pool.capture_png(SVG_STATE))
+
+        deadline = time.monotonic() + 5
+        while len(created) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertTrue(created[0].closed)
+        self.assertEqual(len(created), 2)
+
+    def _flaky_pool(self, size: int, failures: int) -> tuple[WebDriverPool, List[FakeDriver]]:
+        """Pool whose first driver starts and whose next ``failures`` warm-ups raise."""
+        created: List[FakeDriver] = []
+        attempts = [0]
+
+        def factory(base_url: str) -> FakeDriver:
+            attempts[0] += 1
+            if 1 < attempts[0] <= failures + 1:
+                raise RuntimeError("firefox failed to start")
+            driver = FakeDriver(base_url)
+            created.append(driver)
+            return driver
+
+        pool = WebDriverPool(
+            "http://127.0.0.1:5000/", size=size, driver_factory=factory, acquire_timeout=5, warmup_backoff=0.01
+        )
+        self.addCleanup(pool.cleanup)
+        return pool, created
+
+    def _wait_for_drivers(self, pool: WebDriverPool, count: int) -> None:
+        deadline = time.monotonic() + 5
+        while (pool.ready_count < count or pool.timing_summary()["warming"]) and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    def test_failed_warm_up_is_retried(self) -> None:
+        pool, created = self._flaky_pool(size=2, failures=2)
+
+        self._wait_for_drivers(pool, 2)
+
+        self.assertEqual(len(created), 2)
+        summary = pool.timing_summary()
+        self.assertEqual((summary["drivers"], summary["missing"], summary["warm_failures"]), (2, 0, 2))
+
+    def test_capture_tops_up_pool_after_retries_run_out(self) -> None:
+        pool, created = self._flaky_pool(size=2, failures=WARMUP_RETRIES + 1)
+        self._wait_for_drivers(pool, 1)
+        summary = pool.timing_summary()
+        self.assertEqual((summary["drivers"], summary["missing"], summary["warming"]), (1, 1, 0))
+
+        self.assertIsNotNone(pool.capture_png(SVG_STATE))
+        self._wait_for_drivers(pool, 2)
+
+        self.assertEqual(len(created), 2)
+        self.assertEqual(pool.timing_summary()["missing"], 0)
+
+    def test_cleanup_closes_all_drivers(self) -> None:
+        pool, created = self._pool(size=2)
+        pool.cleanup()
+        self.assertTrue(all(driver.closed for driver in created))
+
+
+class TestWebDriverManagerCapture(unittest.TestCase):
+    def test_capture_png_waits_for_render_signal_instead_of_sleeping(self) -> None:
+        manager = WebDriverManager.__new__(WebDriverManager)
+        manager.driver = MagicMock()
+        manager.driver.execute_script.return_value = {"width": 400, "height": 300}
+        manager.driver.find_element.return_value.screenshot_as_png = b"png-bytes"
+        manager.driver.find_element.return_value.get_attribute.return_value = "<circle/>"
+
+        with patch("static.webdriver_manager.WebDriverWait"), patch("static.webdriver_manager.time.sleep") as sleep:
+            png = manager.capture_png(SVG_STATE)
+
+        self.assertEqual(png, b"png-bytes")
+        sleep.assert_not_called()
+        manager.driver.execute_async_script.assert_called_once()
+        self.assertEqual(
+            set(manager.last_capture_timings),
+            {"inject_ms", "ready_ms", "screenshot_ms", "total_ms", "width", "height"},
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
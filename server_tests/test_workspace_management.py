@@ -1,17 +1,22 @@
 from __future__ import annotations
 
+import gzip
 import json
 import os
+import tempfile
+import threading
 import unittest
 from datetime import datetime
-from typing import Any, Dict, cast
+from typing import Any, Dict, List, cast
+from unittest.mock import patch
 
 from server_tests.test_mocks import CanvasStateDict, MockCanvas
 from static.client.managers.polygon_type import PolygonType
 from static.client.utils.polygon_canonicalizer import canonicalize_rectangle
 from static.workspace_manager import (
     CURRENT_WORKSPACE_SCHEMA_VERSION,
-    WORKSPACES_DIR,
+    WORKSPACE_INDEX_FILENAME,
+    WORKSPACE_INDEX_LOCK_FILENAME,
     WorkspaceManager,
     WorkspaceState,
 )
@@ -22,26 +27,12 @@ TEST_DIR = "Test"
 class TestWorkspaceManagement(unittest.TestCase):
     def setUp(self) -> None:
         """Set up test environment before each test."""
+        temp_root = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_root.cleanup)
+        self.workspaces_dir = os.path.join(temp_root.name, "workspaces")
         self.canvas: MockCanvas = MockCanvas(500, 500, draw_enabled=False)
-        self.workspace_manager: WorkspaceManager = WorkspaceManager(WORKSPACES_DIR)
+        self.workspace_manager: WorkspaceManager = WorkspaceManager(self.workspaces_dir)
         self.workspace_manager.ensure_workspaces_dir(TEST_DIR)
-        self.cleanup_test_workspaces()
-
-    def tearDown(self) -> None:
-        """Clean up after each test."""
-        self.cleanup_test_workspaces()
-        try:
-            test_dir = os.path.join(WORKSPACES_DIR, TEST_DIR)
-            os.rmdir(test_dir)
-        except OSError:
-            pass
-
-    def cleanup_test_workspaces(self) -> None:
-        """Remove test workspace files."""
-        test_dir = os.path.join(WORKSPACES_DIR, TEST_DIR)
-        if os.path.exists(test_dir):
-            for filename in os.listdir(test_dir):
-                os.remove(os.path.join(test_dir, filename))
 
     def test_save_workspace_without_name(self) -> None:
         """Test saving workspace without a name (current workspace)."""
@@ -55,7 +46,7 @@ class TestWorkspaceManagement(unittest.TestCase):
         )
         self.assertTrue(success, "Save workspace should return True on success")
 
-        workspace_path = os.path.join(WORKSPACES_DIR, TEST_DIR, f"{test_current}.json")
+        workspace_path = os.path.join(self.workspaces_dir, TEST_DIR, f"{test_current}.json")
         self.assertTrue(os.path.exists(workspace_path))
 
         with open(workspace_path, "r") as f:
@@ -76,7 +67,7 @@ class TestWorkspaceManagement(unittest.TestCase):
         )
         self.assertTrue(success, "Save workspace should return True on success")
 
-        workspace_path = os.path.join(WORKSPACES_DIR, TEST_DIR, f"{workspace_name}.json")
+        workspace_path = os.path.join(self.workspaces_dir, TEST_DIR, f"{workspace_name}.json")
         self.assertTrue(os.path.exists(workspace_path))
 
         with open(workspace_path, "r") as f:
@@ -97,7 +88,7 @@ class TestWorkspaceManagement(unittest.TestCase):
         self.assertFalse(success, "Save workspace should return False with invalid name")
 
         if os.name != "nt" and getattr(os, "getuid", lambda: -1)() != 0:  # Skip on Windows and root
-            test_dir = os.path.join(WORKSPACES_DIR, TEST_DIR)
+            test_dir = os.path.join(self.workspaces_dir, TEST_DIR)
             original_mode = os.stat(test_dir).st_mode
             try:
                 os.chmod(test_dir, 0o444)  # Read-only
@@ -141,7 +132,7 @@ class TestWorkspaceManagement(unittest.TestCase):
     def test_load_workspace_invalid_json(self) -> None:
         """Test loading a workspace file with invalid JSON content."""
         workspace_name = "test_invalid_json_workspace"
-        workspace_path = os.path.join(WORKSPACES_DIR, TEST_DIR, f"{workspace_name}.json")
+        workspace_path = os.path.join(self.workspaces_dir, TEST_DIR, f"{workspace_name}.json")
 
         with open(workspace_path, "w") as f:
             f.write('{"name": "test", "state": {this_is_not_valid_json}')
@@ -152,7 +143,7 @@ class TestWorkspaceManagement(unittest.TestCase):
     def test_load_workspace_incorrect_schema(self) -> None:
         """Test loading a workspace file with valid JSON but incorrect schema."""
         workspace_name = "test_incorrect_schema_workspace"
-        workspace_path = os.path.join(WORKSPACES_DIR, TEST_DIR, f"{workspace_name}.json")
+        workspace_path = os.path.join(self.workspaces_dir, TEST_DIR, f"{workspace_name}.json")
 
         # Case 1: Valid JSON, but missing the top-level 'state' key.
         malformed_data = {
@@ -167,7 +158,7 @@ class TestWorkspaceManagement(unittest.TestCase):
 
         # Case 2: 'state' key exists, but 'Points' (a drawable type) is not a list.
         workspace_name_2 = "test_points_not_list"
-        workspace_path_2 = os.path.join(WORKSPACES_DIR, TEST_DIR, f"{workspace_name_2}.json")
+        workspace_path_2 = os.path.join(self.workspaces_dir, TEST_DIR, f"{workspace_name_2}.json")
         malformed_data_2 = {"metadata": {"name": workspace_name_2}, "state": {"Points": "this should be a list"}}
         with open(workspace_path_2, "w") as f:
             json.dump(malformed_data_2, f)
@@ -184,7 +175,7 @@ class TestWorkspaceManagement(unittest.TestCase):
     def test_load_workspace_legacy_state_only_payload(self) -> None:
         """Legacy files with top-level state payload should still load."""
         workspace_name = "test_legacy_state_only_workspace"
-        workspace_path = os.path.join(WORKSPACES_DIR, TEST_DIR, f"{workspace_name}.json")
+        workspace_path = os.path.join(self.workspaces_dir, TEST_DIR, f"{workspace_name}.json")
         legacy_state = {"Points": [{"x": 1, "y": 2, "name": "A"}], "Segments": []}
         with open(workspace_path, "w") as f:
             json.dump(legacy_state, f)
@@ -197,7 +188,7 @@ class TestWorkspaceManagement(unittest.TestCase):
     def test_load_workspace_rejects_future_schema_version(self) -> None:
         """Future schema versions should fail fast until migration is added."""
         workspace_name = "test_future_schema_workspace"
-        workspace_path = os.path.join(WORKSPACES_DIR, TEST_DIR, f"{workspace_name}.json")
+        workspace_path = os.path.join(self.workspaces_dir, TEST_DIR, f"{workspace_name}.json")
         future_data = {
             "metadata": {
                 "name": workspace_name,
@@ -215,7 +206,7 @@ class TestWorkspaceManagement(unittest.TestCase):
     def test_load_workspace_accepts_string_schema_version(self) -> None:
         """String schema_version values should be parsed for compatibility."""
         workspace_name = "test_string_schema_workspace"
-        workspace_path = os.path.join(WORKSPACES_DIR, TEST_DIR, f"{workspace_name}.json")
+        workspace_path = os.path.join(self.workspaces_dir, TEST_DIR, f"{workspace_name}.json")
         data = {
             "metadata": {
                 "name": workspace_name,
@@ -252,7 +243,7 @@ class TestWorkspaceManagement(unittest.TestCase):
             cast(WorkspaceState, self.canvas.get_canvas_state()), "valid_ws_for_list_test", TEST_DIR
         )
 
-        test_dir_path = os.path.join(WORKSPACES_DIR, TEST_DIR)
+        test_dir_path = os.path.join(self.workspaces_dir, TEST_DIR)
         with open(os.path.join(test_dir_path, "notes.txt"), "w") as f:
             f.write("some notes")
         with open(os.path.join(test_dir_path, "image.jpg"), "w") as f:
@@ -272,8 +263,6 @@ class TestWorkspaceManagement(unittest.TestCase):
 
     def test_list_workspaces_empty_directory(self) -> None:
         """Test listing workspaces from an empty directory."""
-        # Ensure the directory is clean. setUp usually does this, but explicit call for clarity.
-        self.cleanup_test_workspaces()
         workspaces = self.workspace_manager.list_workspaces(TEST_DIR)
         self.assertEqual(len(workspaces), 0)
 
@@ -322,7 +311,7 @@ class TestWorkspaceManagement(unittest.TestCase):
         )
         self.assertTrue(success, "Failed to save complex workspace")
 
-        workspace_path = os.path.join(WORKSPACES_DIR, TEST_DIR, f"{workspace_name}.json")
+        workspace_path = os.path.join(self.workspaces_dir, TEST_DIR, f"{workspace_name}.json")
         with open(workspace_path, "r") as f:
             data = json.load(f)
             state = data["state"]
@@ -520,7 +509,7 @@ class TestWorkspaceManagement(unittest.TestCase):
         )
         self.assertTrue(success, "Initial save should succeed")
 
-        workspace_path = os.path.join(WORKSPACES_DIR, TEST_DIR, f"{workspace_name}.json")
+        workspace_path = os.path.join(self.workspaces_dir, TEST_DIR, f"{workspace_name}.json")
         self.assertTrue(os.path.exists(workspace_path))
 
         success = self.workspace_manager.delete_workspace(workspace_name, TEST_DIR)
@@ -544,6 +533,181 @@ class TestWorkspaceManagement(unittest.TestCase):
         success = self.workspace_manager.delete_workspace("test/invalid/name", TEST_DIR)
         self.assertFalse(success, "Delete workspace should return False for invalid name")
 
+    def test_save_workspace_writes_compact_json_atomically(self) -> None:
+        """Saves are compact and leave no temporary files behind."""
+        self.canvas.create_point(1, 2, "A")
+        self.workspace_manager.save_workspace(cast(WorkspaceState, self.canvas.get_canvas_state()), "compact", TEST_DIR)
+
+        test_dir = os.path.join(self.workspaces_dir, TEST_DIR)
+        with open(os.path.join(test_dir, "compact.json"), "r") as f:
+            content = f.read()
+        self.assertNotIn("\n", content)
+        self.assertNotIn(": ", content)
+        self.assertEqual(json.loads(content)["metadata"]["name"], "compact")
+        self.assertEqual(
+            sorted(name for name in os.listdir(test_dir) if name != WORKSPACE_INDEX_LOCK_FILENAME),
+            sorted(["compact.json", WORKSPACE_INDEX_FILENAME]),
+        )
+
+    def test_compressed_workspace_round_trip(self) -> None:
+        """Compressed saves load and list like plain ones and replace the other variant."""
+        self.canvas.create_point(3, 4, "A")
+        state = cast(WorkspaceState, self.canvas.get_canvas_state())
+        test_dir = os.path.join(self.workspaces_dir, TEST_DIR)
+        self.workspace_manager.save_workspace(state, "packed", TEST_DIR)
+
+        compressing_manager = WorkspaceManager(self.workspaces_dir, compress=True)
+        self.assertTrue(compressing_manager.save_workspace(state, "packed", TEST_DIR))
+        self.assertTrue(os.path.exists(os.path.join(test_dir, "packed.json.gz")))
+        self.assertFalse(os.path.exists(os.path.join(test_dir, "packed.json")))
+        with gzip.open(os.path.join(test_dir, "packed.json.gz"), "rt", encoding="utf-8") as f:
+            self.assertEqual(json.load(f)["state"], state)
+
+        self.assertEqual(self.workspace_manager.load_workspace("packed", TEST_DIR), state)
+        self.assertEqual(self.workspace_manager.list_workspaces(TEST_DIR), ["packed"])
+
+        self.assertTrue(self.workspace_manager.delete_workspace("packed", TEST_DIR))
+        self.assertEqual(self.workspace_manager.list_workspaces(TEST_DIR), [])
+
+    def test_describe_workspaces_reports_index_metadata(self) -> None:
+        """Index entries carry size, schema version and drawable counts."""
+        self.canvas.create_point(0, 0, "A")
+        self.canvas.create_point(5, 5, "B")
+        self.canvas.create_segment(0, 0, 5, 5, "AB")
+        self.workspace_manager.save_workspace(
+            cast(WorkspaceState, self.canvas.get_canvas_state()), "described", TEST_DIR
+        )
+
+        entries = self.workspace_manager.describe_workspaces(TEST_DIR)
+        self.assertEqual(len(entries), 1)
+        entry = entries[0]
+        file_path = os.path.join(self.workspaces_dir, TEST_DIR, "described.json")
+        self.assertEqual(entry["name"], "described")
+        self.assertEqual(entry["size"], os.path.getsize(file_path))
+        self.assertEqual(entry["schema_version"], CURRENT_WORKSPACE_SCHEMA_VERSION)
+        self.assertEqual(entry["drawable_counts"]["Points"], 2)
+        self.assertEqual(entry["drawable_counts"]["Segments"], 1)
+
+    def test_listing_only_opens_new_or_changed_files(self) -> None:
+        """A fresh manager lists from the persisted index, opening only files it has not seen."""
+        state = cast(WorkspaceState, self.canvas.get_canvas_state())
+        for name in ("idx_a", "idx_b", "idx_c"):
+            self.workspace_manager.save_workspace(state, name, TEST_DIR)
+
+        with open(os.path.join(self.workspaces_dir, TEST_DIR, "idx_external.json"), "w") as f:
+            json.dump({"metadata": {"name": "idx_external"}, "state": {}}, f)
+
+        fresh_manager = WorkspaceManager(self.workspaces_dir)
+        opened: List[str] = []
+        read_workspace_file = fresh_manager._read_workspace_file
+
+        def tracking_read(file_path: str) -> Any:
+            opened.append(os.path.basename(file_path))
+            return read_workspace_file(file_path)
+
+        with patch.object(fresh_manager, "_read_workspace_file", side_effect=tracking_read):
+            self.assertEqual(
+                fresh_manager.list_workspaces(TEST_DIR),
+                ["idx_a", "idx_b", "idx_c", "idx_external"],
+            )
+            self.assertEqual(opened, ["idx_external.json"])
+
+            opened.clear()
+            fresh_manager.list_workspaces(TEST_DIR)
+            self.assertEqual(opened, [])
+
+    def test_load_latest_current_workspace_uses_newest_mtime(self) -> None:
+        """Loading without a name picks the most recently modified autosave."""
+        test_dir = os.path.join(self.workspaces_dir, TEST_DIR)
+        for filename, x, mtime in (
+            ("current_workspace_20200101_000002.json", 1, 1_000_000),
+            ("current_workspace_20200101_000001.json", 2, 2_000_000),
+        ):
+            path = os.path.join(test_dir, filename)
+            with open(path, "w") as f:
+                json.dump({"metadata": {"name": filename[:-5]}, "state": {"Points": [{"name": "A", "x": x}]}}, f)
+            os.utime(path, (mtime, mtime))
+
+        state = cast(Dict[str, Any], self.workspace_manager.load_workspace(test_dir=TEST_DIR))
+        self.assertEqual(state["Points"][0]["x"], 2)
+        self.assertEqual(self.workspace_manager.list_workspaces(TEST_DIR), [])
+
+    def test_legacy_workspace_is_migrated_in_memory_on_load(self) -> None:
+        """Loading a legacy file never rewrites it; the next save stores the current schema."""
+        workspace_name = "test_migrate_in_memory_workspace"
+        workspace_path = os.path.join(self.workspaces_dir, TEST_DIR, f"{workspace_name}.json")
+        legacy_state = {"Points": [{"x": 1, "y": 2, "name": "A"}]}
+        with open(workspace_path, "w") as f:
+            json.dump(legacy_state, f)
+        os.utime(workspace_path, (1_000_000, 1_000_000))
+        index_path = os.path.join(self.workspaces_dir, TEST_DIR, WORKSPACE_INDEX_FILENAME)
+        index_before = os.path.getmtime(index_path) if os.path.exists(index_path) else None
+
+        with patch.object(self.workspace_manager, "_atomic_write", side_effect=AssertionError("wrote on load")):
+            self.assertEqual(self.workspace_manager.load_workspace(workspace_name, TEST_DIR), legacy_state)
+            self.assertEqual(self.workspace_manager.load_workspace(workspace_name, TEST_DIR), legacy_state)
+        with open(workspace_path, "r") as f:
+            self.assertEqual(json.load(f), legacy_state)
+        self.assertEqual(os.stat(workspace_path).st_mtime, 1_000_000)
+        self.assertEqual(os.path.getmtime(index_path) if os.path.exists(index_path) else None, index_before)
+
+        saved = self.workspace_manager.save_workspace(cast(WorkspaceState, legacy_state), workspace_name, TEST_DIR)
+        self.assertTrue(saved)
+        with open(workspace_path, "r") as f:
+            upgraded = json.load(f)
+        self.assertEqual(upgraded["metadata"]["schema_version"], CURRENT_WORKSPACE_SCHEMA_VERSION)
+        with patch.object(self.workspace_manager, "_migrate_state", side_effect=AssertionError("re-migrated")):
+            self.assertEqual(self.workspace_manager.load_workspace(workspace_name, TEST_DIR), legacy_state)
+
+    def test_unchanged_legacy_workspace_is_migrated_once(self) -> None:
+        """Repeat loads of an unchanged legacy file reuse the migrated state; a rewrite migrates again."""
+        workspace_name = "test_migrate_once_workspace"
+        workspace_path = os.path.join(self.workspaces_dir, TEST_DIR, f"{workspace_name}.json")
+        legacy_state = {"Points": [{"x": 1, "y": 2, "name": "A"}]}
+        with open(workspace_path, "w") as f:
+            json.dump(legacy_state, f)
+        migrate = self.workspace_manager._normalize_and_migrate_workspace_record
+
+        with patch.object(
+            self.workspace_manager, "_normalize_and_migrate_workspace_record", side_effect=migrate
+        ) as spy, patch.object(self.workspace_manager, "_atomic_write", side_effect=AssertionError("wrote on load")):
+            first = cast(Dict[str, Any], self.workspace_manager.load_workspace(workspace_name, TEST_DIR))
+            first["Points"].append({"x": 5, "y": 5, "name": "B"})
+            second = self.workspace_manager.load_workspace(workspace_name, TEST_DIR)
+            self.assertEqual(spy.call_count, 1)
+            self.assertEqual(second, legacy_state)
+
+            changed_state = {"Points": [{"x": 3, "y": 4, "name": "C"}]}
+            with open(workspace_path, "w") as f:
+                json.dump(changed_state, f)
+            os.utime(workspace_path, ns=(os.stat(workspace_path).st_mtime_ns + 1_000_000,) * 2)
+            self.assertEqual(self.workspace_manager.load_workspace(workspace_name, TEST_DIR), changed_state)
+            self.assertEqual(spy.call_count, 2)
+
+    def test_concurrent_saves_keep_every_index_entry(self) -> None:
+        """Index read-modify-writes from parallel saves do not drop each other's entries."""
+        state = cast(WorkspaceState, self.canvas.get_canvas_state())
+        managers = [WorkspaceManager(self.workspaces_dir) for _ in range(4)]
+        barrier = threading.Barrier(len(managers))
+        results: List[bool] = []
+
+        def save_all(index: int, manager: WorkspaceManager) -> None:
+            barrier.wait(timeout=5)
+            for step in range(5):
+                results.append(manager.save_workspace(state, f"parallel_{index}_{step}", TEST_DIR))
+
+        threads = [threading.Thread(target=save_all, args=pair) for pair in enumerate(managers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=30)
+
+        self.assertEqual(results, [True] * 20)
+        with open(os.path.join(self.workspaces_dir, TEST_DIR, WORKSPACE_INDEX_FILENAME), "r") as f:
+            persisted = json.load(f)["entries"]
+        expected = {f"parallel_{index}_{step}.json" for index in range(4) for step in range(5)}
+        self.assertTrue(expected <= set(persisted))
+
 
 if __name__ == "__main__":
     unittest.main()
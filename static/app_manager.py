@@ -8,6 +8,7 @@ Dependencies:
     - Flask: Web framework core
     - static.openai_completions_api: OpenAI Chat Completions API integration
     - static.workspace_manager: Workspace file operations
+    - static.client_bundle: Prebuilt Brython client bundles
     - static.log_manager: Application logging
     - static.routes: Route definitions and registration
 """
@@ -16,6 +17,7 @@ from __future__ import annotations
 
 import os
 import secrets
+from pathlib import Path
 from typing import TYPE_CHECKING, Dict, Optional, Tuple, TypedDict, Union
 
 from cachelib.file import FileSystemCache
@@ -23,16 +25,21 @@ from dotenv import load_dotenv
 from flask import Flask, Response, jsonify
 from flask_session import Session as FlaskSession
 
+from static.client_bundle import DEFAULT_OUTPUT_DIR as CLIENT_BUNDLE_DIR, ClientBundleManifest, load_client_bundle
+from static.conversation_pool import DEFAULT_SESSION_ID, ConversationPool, ConversationSession
 from static.log_manager import LogManager
+from static.openai_api_base import DEFAULT_CANVAS_SNAPSHOT_PATH
 from static.openai_completions_api import OpenAIChatCompletionsAPI
 from static.openai_responses_api import OpenAIResponsesAPI
 from static.providers import discover_providers
-from static.workspace_manager import WorkspaceManager
+from static.workspace_manager import WORKSPACES_DIR, WorkspaceManager
 
 
 if TYPE_CHECKING:
+    from openai import OpenAI
+
     from static.openai_api_base import OpenAIAPIBase
-    from static.webdriver_manager import WebDriverManager
+    from static.webdriver_manager import WebDriverPool
 
 
 JsonValue = Union[str, int, float, bool, None, Dict[str, "JsonValue"], list["JsonValue"]]
@@ -52,10 +59,12 @@ class MatHudFlask(Flask):
     log_manager: LogManager
     ai_api: OpenAIChatCompletionsAPI
     responses_api: OpenAIResponsesAPI
-    webdriver_manager: Optional["WebDriverManager"]
+    webdriver_manager: Optional["WebDriverPool"]
     workspace_manager: WorkspaceManager
-    current_attached_images: Optional[list[str]]  # User-attached images for current request
     providers: Dict[str, "OpenAIAPIBase"]  # Lazily-loaded provider instances by name
+    conversations: ConversationPool  # Per-client-session conversations; default wraps the APIs above
+    client_bundle: Optional[ClientBundleManifest]  # None serves the client modules unbundled
+    client_bundle_dir: Path
 
 
 class AppManager:
@@ -188,16 +197,20 @@ class AppManager:
         app.log_manager = LogManager()
         # Default to minimal search-first tool exposure; routes inject matching
         # tools dynamically after search_tools returns.
-        app.ai_api = OpenAIChatCompletionsAPI()
-        app.ai_api.set_tool_mode("search")
-        app.responses_api = OpenAIResponsesAPI()
-        app.responses_api.set_tool_mode("search")
+        app.ai_api, app.responses_api = AppManager._create_openai_apis()
         app.webdriver_manager = None  # Will be set after Flask starts
-        app.current_attached_images = None  # User-attached images for current request
         app.providers = {}  # Lazily-loaded provider instances
+        app.conversations = AppManager._create_conversation_pool(app)
 
         # Initialize workspace manager
-        app.workspace_manager = WorkspaceManager()
+        app.workspace_manager = WorkspaceManager(
+            workspaces_dir=os.getenv("WORKSPACES_DIR") or WORKSPACES_DIR,
+            compress=os.getenv("WORKSPACE_COMPRESSION", "").lower() in ("true", "1", "yes"),
+        )
+
+        # Serve the prebuilt client bundle when one matches the current sources
+        app.client_bundle_dir = CLIENT_BUNDLE_DIR
+        app.client_bundle = load_client_bundle(output_dir=CLIENT_BUNDLE_DIR)
 
         # Initialize TTS manager (eager load to check availability at startup)
         AppManager._initialize_tts()
@@ -209,6 +222,55 @@ class AppManager:
 
         return app
 
+    @staticmethod
+    def _create_openai_apis(
+        shared_client: Optional["OpenAI"] = None,
+    ) -> Tuple[OpenAIChatCompletionsAPI, OpenAIResponsesAPI]:
+        """Create the Chat Completions and Responses API pair used by one conversation.
+
+        Pooled sessions pass the default conversation's client so they share its
+        connection pool instead of building a new client (and TLS context) each.
+        """
+        ai_api = OpenAIChatCompletionsAPI(client=shared_client)
+        ai_api.set_tool_mode("search")
+        responses_api = OpenAIResponsesAPI(client=shared_client)
+        responses_api.set_tool_mode("search")
+        return ai_api, responses_api
+
+    @staticmethod
+    def _create_conversation_pool(app: MatHudFlask) -> ConversationPool:
+        """Build the session pool whose default conversation is app.ai_api/app.responses_api/app.providers.
+
+        Pool size and idle timeout come from CONVERSATION_POOL_SIZE and
+        CONVERSATION_IDLE_TIMEOUT (seconds).
+        """
+        snapshot_dir = os.path.dirname(DEFAULT_CANVAS_SNAPSHOT_PATH)
+
+        def create_session(session_id: str) -> ConversationSession:
+            ai_api, responses_api = AppManager._create_openai_apis(shared_client=app.ai_api.client)
+            snapshot_path = os.path.join(snapshot_dir, f"canvas_{session_id}.png")
+            return ConversationSession(session_id, ai_api, responses_api, snapshot_path)
+
+        def remove_snapshot(session: ConversationSession) -> None:
+            if os.path.exists(session.canvas_snapshot_path):
+                os.remove(session.canvas_snapshot_path)
+
+        default_session = ConversationSession(
+            DEFAULT_SESSION_ID,
+            app.ai_api,
+            app.responses_api,
+            DEFAULT_CANVAS_SNAPSHOT_PATH,
+            providers=app.providers,
+        )
+        max_sessions, idle_timeout = ConversationPool.settings_from_env()
+        return ConversationPool(
+            create_session,
+            default_session,
+            max_sessions=max_sessions,
+            idle_timeout=idle_timeout,
+            on_evict=remove_snapshot,
+        )
+
     @staticmethod
     def _initialize_tts() -> None:
         """Initialize TTS manager and log availability status."""
@@ -0,0 +1,1312 @@
+"""
+MatHud Server-Side Canvas Rasterizer
+
+Renders a canvas state to SVG text or PNG bytes without a browser. Drawables
+are rebuilt from the canvas state with the client's own model classes and
+recorded through the shared plan builders (build_plan_for_drawable,
+build_plan_for_cartesian, build_plan_for_polar), so server output follows the
+same geometry, styling and culling as the Canvas2D and SVG renderers. Only the
+final primitive adapter differs.
+
+Key Features:
+    - SvgTextPrimitiveAdapter: RendererPrimitives implementation emitting SVG markup
+    - RasterPrimitiveAdapter: pure-Python scanline rasterizer with a zlib PNG encoder
+    - Bitmap labels from static.raster_font (no font engine required)
+    - Reports canvas-state buckets and drawables it cannot rebuild so callers can
+      fall back to WebDriver
+
+Worker Process:
+    - Rendering runs in a long-lived ``python -m static.canvas_rasterizer`` worker
+      that imports the client modules with a placeholder ``browser`` module (plan
+      building never touches the DOM); requests and results are pickled frames
+      over the worker's stdin/stdout
+    - A render that misses RENDER_TIMEOUT_SECONDS kills the worker and raises
+      TimeoutError, so vision capture can fall back instead of hanging
+    - The server process never imports client modules or extends sys.path, so
+      client names such as ``constants`` cannot shadow server imports
+
+Dependencies:
+    - static/client: drawables, coordinate mapper and plan builders (worker only)
+    - subprocess/pickle: render worker and its request channel
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import math
+import os
+import pickle
+import struct
+import subprocess
+import sys
+import threading
+import types
+import zlib
+from html import escape
+from typing import IO, Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from static.raster_font import GLYPH_ASCENT, GLYPH_HEIGHT, GLYPH_PIXEL_SIZE, GLYPH_WIDTH, glyph_rows
+
+_logger = logging.getLogger("mathud")
+
+Point2D = Tuple[float, float]
+RGB = Tuple[int, int, int]
+
+DEFAULT_RASTER_WIDTH: int = 800
+DEFAULT_RASTER_HEIGHT: int = 600
+MAX_RASTER_DIMENSION: int = 4096
+RENDER_TIMEOUT_SECONDS: float = 20.0
+
+_CLIENT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "client")
+
+# Canvas-state buckets the rasterizer can rebuild. Polygon buckets are listed
+# because their outlines are already present as Segments.
+SUPPORTED_BUCKETS = frozenset(
+    {
+        "Points",
+        "Segments",
+        "Vectors",
+        "Circles",
+        "Ellipses",
+        "CircleArcs",
+        "Angles",
+        "Functions",
+        "ParametricFunctions",
+        "PiecewiseFunctions",
+        "Labels",
+        "Triangles",
+        "Rectangles",
+        "Quadrilaterals",
+        "Pentagons",
+        "Hexagons",
+        "Heptagons",
+        "Octagons",
+        "Nonagons",
+        "Decagons",
+        "GenericPolygons",
+    }
+)
+
+_NAMED_COLORS: Dict[str, RGB] = {
+    "black": (0, 0, 0),
+    "white": (255, 255, 255),
+    "red": (255, 0, 0),
+    "green": (0, 128, 0),
+    "lime": (0, 255, 0),
+    "blue": (0, 0, 255),
+    "yellow": (255, 255, 0),
+    "orange": (255, 165, 0),
+    "purple": (128, 0, 128),
+    "magenta": (255, 0, 255),
+    "fuchsia": (255, 0, 255),
+    "cyan": (0, 255, 255),
+    "aqua": (0, 255, 255),
+    "pink": (255, 192, 203),
+    "brown": (165, 42, 42),
+    "gold": (255, 215, 0),
+    "navy": (0, 0, 128),
+    "teal": (0, 128, 128),
+    "maroon": (128, 0, 0),
+    "olive": (128, 128, 0),
+    "silver": (192, 192, 192),
+    "gray": (128, 128, 128),
+    "grey": (128, 128, 128),
+    "darkgray": (169, 169, 169),
+    "darkgrey": (169, 169, 169),
+    "lightgray": (211, 211, 211),
+    "lightgrey": (211, 211, 211),
+    "darkblue": (0, 0, 139),
+    "darkgreen": (0, 100, 0),
+    "darkred": (139, 0, 0),
+    "darkorange": (255, 140, 0),
+    "lightblue": (173, 216, 230),
+    "lightgreen": (144, 238, 144),
+    "steelblue": (70, 130, 180),
+    "indigo": (75, 0, 130),
+    "violet": (238, 130, 238),
+}
+
+_client_runtime: Optional[Dict[str, Any]] = None
+
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _prepare_client_imports() -> None:
+    """Make the client modules importable. Runs only inside the render worker process."""
+    if "browser" not in sys.modules:
+        try:
+            import browser  # noqa: F401
+        except ImportError:
+            # Plan building only needs the module to exist; window/document stay unset.
+            placeholder = types.ModuleType("browser")
+            setattr(placeholder, "window", None)
+            setattr(placeholder, "document", None)
+            sys.modules["browser"] = placeholder
+    if _CLIENT_DIR not in sys.path:
+        sys.path.append(_CLIENT_DIR)
+
+
+def _write_frame(stream: IO[bytes], payload: Any) -> None:
+    data = pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL)
+    stream.write(struct.pack(">I", len(data)) + data)
+    stream.flush()
+
+
+def _read_frame(stream: IO[bytes]) -> Any:
+    header = stream.read(4)
+    if len(header) < 4:
+        raise EOFError("render worker channel closed")
+    (length,) = struct.unpack(">I", header)
+    data = stream.read(length)
+    if len(data) < length:
+        raise EOFError("render worker channel closed")
+    return pickle.loads(data)
+
+
+class _RenderWorker:
+    """Long-lived ``python -m static.canvas_rasterizer`` process serving one render at a time.
+
+    A plain subprocess rather than a multiprocessing pool: spawned pool workers
+    re-import the server's ``__main__`` module, and app.py builds the app there.
+    A render that does not answer within ``timeout`` seconds (for example a
+    client-supplied expression that never finishes evaluating) kills the worker
+    and raises TimeoutError; the next render starts a fresh one.
+    """
+
+    def __init__(self, timeout: float = RENDER_TIMEOUT_SECONDS, command: Optional[List[str]] = None) -> None:
+        self._process: Optional["subprocess.Popen[bytes]"] = None
+        self._lock = threading.Lock()
+        self._timeout = timeout
+        self._command = command or [sys.executable, "-m", "static.canvas_rasterizer"]
+
+    def render(self, width: int, height: int, canvas_state: Dict[str, Any], output_format: str) -> Any:
+        with self._lock:
+            process = self._ensure_started()
+            assert process.stdin is not None and process.stdout is not None
+            try:
+                _write_frame(process.stdin, (width, height, canvas_state, output_format))
+                ok, result = self._read_reply(process.stdout)
+            except TimeoutError:
+                self._stop(kill=True)
+                raise
+            except (OSError, EOFError, pickle.UnpicklingError):
+                # The worker died or the channel broke; start a fresh one next time.
+                self._stop()
+                raise
+        if not ok:
+            raise RuntimeError(f"Canvas render worker failed: {result}")
+        return result
+
+    def close(self) -> None:
+        with self._lock:
+            self._stop()
+
+    def _read_reply(self, stream: IO[bytes]) -> Any:
+        """Read one frame, raising TimeoutError if the worker does not answer in time."""
+        outcome: List[Any] = []
+
+        def read() -> None:
+            try:
+                outcome.append((True, _read_frame(stream)))
+            except BaseException as exc:
+                outcome.append((False, exc))
+
+        reader = threading.Thread(target=read, name="render-worker-reply", daemon=True)
+        reader.start()
+        reader.join(self._timeout)
+        if not outcome:
+            raise TimeoutError(f"Canvas render worker did not answer within {self._timeout:g}s")
+        succeeded, value = outcome[0]
+        if not succeeded:
+            raise value
+        return value
+
+    def _ensure_started(self) -> "subprocess.Popen[bytes]":
+        if self._process is None or self._process.poll() is not None:
+            self._process = subprocess.Popen(
+                self._command,
+                cwd=_PROJECT_ROOT,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+            )
+        return self._process
+
+    def _stop(self, kill: bool = False) -> None:
+        process, self._process = self._process, None
+        if process is None:
+            return
+        if kill:
+            # Kill before closing the pipes: the reply reader may still hold stdout until it sees EOF.
+            process.kill()
+            process.wait()
+        for stream in (process.stdin, process.stdout):
+            if stream is not None:
+                stream.close()
+        try:
+            process.wait(timeout=2)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+_render_worker = _RenderWorker()
+atexit.register(_render_worker.close)
+
+
+def _serve_worker() -> None:
+    """Worker loop: answer render requests from stdin on stdout until stdin closes."""
+    channel_in = sys.stdin.buffer
+    channel_out = sys.stdout.buffer
+    # Stray prints from client modules must not corrupt the channel.
+    sys.stdout = sys.stderr
+    _prepare_client_imports()
+    while True:
+        try:
+            width, height, canvas_state, output_format = _read_frame(channel_in)
+        except EOFError:
+            return
+        response: Tuple[bool, Any]
+        try:
+            response = (True, _render_in_worker(width, height, canvas_state, output_format))
+        except Exception as exc:
+            response = (False, f"{type(exc).__name__}: {exc}")
+        _write_frame(channel_out, response)
+
+
+def _render_in_worker(
+    width: int, height: int, canvas_state: Dict[str, Any], output_format: str
+) -> Tuple[Any, List[Tuple[str, str]]]:
+    """Render in the worker process; returns the output and the skipped drawables with reasons."""
+    background = str(_load_client_runtime()["get_renderer_style"]().get("canvas_background_color", "#ffffff"))
+    if output_format == "svg":
+        svg_adapter = SvgTextPrimitiveAdapter(width, height, background)
+        skipped = _render_scene(canvas_state, svg_adapter, width, height)
+        return svg_adapter.to_svg(), skipped
+    raster_adapter = RasterPrimitiveAdapter(width, height, background)
+    skipped = _render_scene(canvas_state, raster_adapter, width, height)
+    return raster_adapter.to_png(), skipped
+
+
+def _load_client_runtime() -> Dict[str, Any]:
+    """Import the client modules used for plan building, once per worker process."""
+    global _client_runtime
+    if _client_runtime is not None:
+        return _client_runtime
+
+    from cartesian_system_2axis import Cartesian2Axis
+    from coordinate_mapper import CoordinateMapper
+    from drawables.angle import Angle
+    from drawables.circle import Circle
+    from drawables.circle_arc import CircleArc
+    from drawables.ellipse import Ellipse
+    from drawables.function import Function
+    from drawables.label import Label
+    from drawables.parametric_function import ParametricFunction
+    from drawables.piecewise_function import PiecewiseFunction
+    from drawables.point import Point
+    from drawables.segment import Segment
+    from drawables.vector import Vector
+    from polar_grid import PolarGrid
+    from rendering.cached_render_plan import build_plan_for_cartesian, build_plan_for_drawable, build_plan_for_polar
+    from rendering.style_manager import get_renderer_style
+
+    _client_runtime = {
+        "Angle": Angle,
+        "Cartesian2Axis": Cartesian2Axis,
+        "Circle": Circle,
+        "CircleArc": CircleArc,
+        "CoordinateMapper": CoordinateMapper,
+        "Ellipse": Ellipse,
+        "Function": Function,
+        "Label": Label,
+        "ParametricFunction": ParametricFunction,
+        "PiecewiseFunction": PiecewiseFunction,
+        "Point": Point,
+        "PolarGrid": PolarGrid,
+        "Segment": Segment,
+        "Vector": Vector,
+        "build_plan_for_cartesian": build_plan_for_cartesian,
+        "build_plan_for_drawable": build_plan_for_drawable,
+        "build_plan_for_polar": build_plan_for_polar,
+        "get_renderer_style": get_renderer_style,
+    }
+    return _client_runtime
+
+
+def parse_css_color(value: Any, default: RGB = (0, 0, 0)) -> Tuple[RGB, float]:
+    """Parse a CSS color into ``((r, g, b), alpha)``; unknown values map to ``default``."""
+    text = str(value or "").strip().lower()
+    if not text:
+        return default, 1.0
+    if text in ("none", "transparent"):
+        return default, 0.0
+    named = _NAMED_COLORS.get(text)
+    if named is not None:
+        return named, 1.0
+    try:
+        if text.startswith("#"):
+            digits = text[1:]
+            if len(digits) in (3, 4):
+                digits = "".join(ch * 2 for ch in digits)
+            if len(digits) in (6, 8):
+                rgb = (int(digits[0:2], 16), int(digits[2:4], 16), int(digits[4:6], 16))
+                alpha = int(digits[6:8], 16) / 255.0 if len(digits) == 8 else 1.0
+                return rgb, alpha
+        elif text.startswith("rgb"):
+            inner = text[text.index("(") + 1 : text.rindex(")")]
+            parts = [part.strip() for part in inner.replace("/", ",").split(",") if part.strip()]
+            channels = [_parse_channel(part) for part in parts[:3]]
+            alpha = 1.0
+            if len(parts) > 3:
+                alpha = float(parts[3][:-1]) / 100.0 if parts[3].endswith("%") else float(parts[3])
+            return (channels[0], channels[1], channels[2]), max(0.0, min(1.0, alpha))
+    except (ValueError, IndexError):
+        pass
+    return default, 1.0
+
+
+def _parse_channel(part: str) -> int:
+    if part.endswith("%"):
+        return max(0, min(255, round(float(part[:-1]) * 2.55)))
+    return max(0, min(255, round(float(part))))
+
+
+def _font_size_px(size: Any, default: float = 14.0) -> float:
+    text = str(size).strip()
+    if text.endswith("px"):
+        text = text[:-2]
+    try:
+        value = float(text)
+    except ValueError:
+        return default
+    return value if math.isfinite(value) and value > 0 else default
+
+
+def _label_rotation_rad(metadata: Optional[Dict[str, Any]]) -> float:
+    if not isinstance(metadata, dict):
+        return 0.0
+    label_meta = metadata.get("label")
+    if not isinstance(label_meta, dict):
+        return 0.0
+    try:
+        degrees = float(label_meta.get("rotation_degrees", 0.0))
+    except (TypeError, ValueError):
+        return 0.0
+    return math.radians(degrees) if math.isfinite(degrees) else 0.0
+
+
+def _arc_sweep(start_angle: float, end_angle: float, sweep_clockwise: bool) -> float:
+    """Signed sweep of a Canvas2D ``arc`` call (anticlockwise = not sweep_clockwise)."""
+    tau = 2.0 * math.pi
+    raw = end_angle - start_angle
+    if sweep_clockwise:
+        return tau if raw >= tau else raw % tau
+    return -tau if raw <= -tau else -((start_angle - end_angle) % tau)
+
+
+def _arc_points(cx: float, cy: float, radius: float, start: float, sweep: float) -> List[Point2D]:
+    steps = max(8, min(720, int(abs(sweep) * max(radius, 1.0) / 2.0) + 1))
+    return [
+        (cx + radius * math.cos(start + sweep * i / steps), cy + radius * math.sin(start + sweep * i / steps))
+        for i in range(steps + 1)
+    ]
+
+
+def encode_png(width: int, height: int, rgb: bytes) -> bytes:
+    """Encode packed 8-bit RGB rows as a PNG image."""
+    stride = width * 3
+    raw = b"".join(b"\x00" + rgb[row * stride : (row + 1) * stride] for row in range(height))
+
+    def chunk(tag: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data) & 0xFFFFFFFF)
+
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    return b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header) + chunk(b"IDAT", zlib.compress(raw, 6)) + chunk(b"IEND", b"")
+
+
+class _PrimitiveAdapterBase:
+    """Frame/batch hooks and optimized-command dispatch shared by the server adapters.
+
+    Mirrors the defaults of the client's RendererPrimitives so recorded plans
+    can be applied without importing the client base class at module import.
+    """
+
+    def begin_frame(self) -> None:
+        return None
+
+    def end_frame(self) -> None:
+        return None
+
+    def begin_batch(self, plan: Any = None) -> None:
+        return None
+
+    def end_batch(self, plan: Any = None) -> None:
+        return None
+
+    def execute_optimized(self, command: Any) -> None:
+        handler = getattr(self, getattr(command, "op", ""), None)
+        if callable(handler):
+            handler(*getattr(command, "args", ()), **getattr(command, "kwargs", {}))
+
+
+class RasterPrimitiveAdapter(_PrimitiveAdapterBase):
+    """Rasterize renderer primitives into an RGB pixel buffer.
+
+    Shapes are filled with an even-odd scanline fill sampled at pixel centers;
+    hairlines use Bresenham and wider strokes are filled as quads. There is no
+    anti-aliasing. Translucent fills blend through per-channel lookup tables.
+    """
+
+    def __init__(self, width: int, height: int, background: str = "#ffffff") -> None:
+        self.width = max(1, int(width))
+        self.height = max(1, int(height))
+        self.background = background
+        self.pixels = bytearray()
+        self._blend_tables: Dict[Tuple[RGB, int], Tuple[bytes, bytes, bytes]] = {}
+        self.clear_surface()
+
+    def clear_surface(self) -> None:
+        rgb, _ = parse_css_color(self.background, (255, 255, 255))
+        self.pixels = bytearray(bytes(rgb) * (self.width * self.height))
+
+    def resize_surface(self, width: float, height: float) -> None:
+        self.width = max(1, int(width))
+        self.height = max(1, int(height))
+        self.clear_surface()
+
+    def to_png(self) -> bytes:
+        return encode_png(self.width, self.height, bytes(self.pixels))
+
+    # ------------------------------------------------------------------
+    # RendererPrimitives interface
+    # ------------------------------------------------------------------
+
+    def stroke_line(self, start: Point2D, end: Point2D, stroke: Any, *, include_width: bool = True) -> None:
+        width = float(getattr(stroke, "width", 1.0)) if include_width else 1.0
+        self._stroke_path([start, end], False, stroke.color, width)
+
+    def stroke_polyline(self, points: List[Point2D], stroke: Any) -> None:
+        self._stroke_path(points, False, stroke.color, float(stroke.width))
+
+    def stroke_circle(self, center: Point2D, radius: float, stroke: Any) -> None:
+        points = _arc_points(center[0], center[1], float(radius), 0.0, 2.0 * math.pi)
+        self._stroke_path(points, True, stroke.color, float(stroke.width))
+
+    def fill_circle(
+        self,
+        center: Point2D,
+        radius: float,
+        fill: Any,
+        stroke: Any = None,
+        *,
+        screen_space: bool = False,
+    ) -> None:
+        points = _arc_points(center[0], center[1], float(radius), 0.0, 2.0 * math.pi)
+        self._fill_shape(points, fill, stroke)
+
+    def stroke_ellipse(
+        self,
+        center: Point2D,
+        radius_x: float,
+        radius_y: float,
+        rotation_rad: float,
+        stroke: Any,
+    ) -> None:
+        cos_r, sin_r = math.cos(rotation_rad), math.sin(rotation_rad)
+        rx, ry = float(radius_x), float(radius_y)
+        points: List[Point2D] = []
+        # Sample the circle of the larger radius, then squash it onto the ellipse axes.
+        radius = max(rx, ry, 1.0)
+        for x, y in _arc_points(0.0, 0.0, radius, 0.0, 2.0 * math.pi):
+            px, py = x * rx / radius, y * ry / radius
+            points.append((center[0] + px * cos_r - py * sin_r, center[1] + px * sin_r + py * cos_r))
+        self._stroke_path(points, True, stroke.color, float(stroke.width))
+
+    def fill_polygon(
+        self,
+        points: List[Point2D],
+        fill: Any,
+        stroke: Any = None,
+        *,
+        screen_space: bool = False,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        if len(points) >= 3:
+            self._fill_shape(points, fill, stroke)
+
+    def fill_joined_area(self, forward: List[Point2D], reverse: List[Point2D], fill: Any) -> None:
+        if len(forward) >= 2 and reverse:
+            self._fill_shape(list(forward) + list(reverse), fill, None)
+
+    def stroke_arc(
+        self,
+        center: Point2D,
+        radius: float,
+        start_angle_rad: float,
+        end_angle_rad: float,
+        sweep_clockwise: bool,
+        stroke: Any,
+        css_class: Optional[str] = None,
+        *,
+        screen_space: bool = False,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        sweep = _arc_sweep(start_angle_rad, end_angle_rad, sweep_clockwise)
+        points = _arc_points(center[0], center[1], float(radius), start_angle_rad, sweep)
+        self._stroke_path(points, False, stroke.color, float(stroke.width))
+
+    def draw_text(
+        self,
+        text: str,
+        position: Point2D,
+        font: Any,
+        color: str,
+        alignment: Any,
+        style_overrides: Optional[Dict[str, Any]] = None,
+        *,
+        screen_space: bool = False,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        lines = str(text).split("\n")
+        scale = _font_size_px(getattr(font, "size", None)) / GLYPH_PIXEL_SIZE
+        mask, mask_width, mask_height = _text_mask(lines, scale)
+        if not mask_width or not mask_height:
+            return
+
+        horizontal = getattr(alignment, "horizontal", "left")
+        vertical = getattr(alignment, "vertical", "alphabetic")
+        offset_x = {"center": -mask_width / 2.0, "right": -mask_width, "end": -mask_width}.get(horizontal, 0.0)
+        offset_y = {
+            "top": 0.0,
+            "hanging": 0.0,
+            "middle": -mask_height / 2.0,
+            "bottom": -mask_height,
+            "ideographic": -mask_height,
+        }.get(vertical, -GLYPH_ASCENT * scale)
+
+        rgb, alpha = parse_css_color(color)
+        rotation = _label_rotation_rad(metadata)
+        anchor_x, anchor_y = float(position[0]), float(position[1])
+        if not rotation:
+            left = round(anchor_x + offset_x)
+            top = round(anchor_y + offset_y)
+            for row_index, row in enumerate(mask):
+                for start, end in _row_runs(row):
+                    self._paint_span(top + row_index, left + start, left + end, rgb, alpha)
+            return
+
+        # Canvas rotates by -rotation about the anchor; sample the mask through the inverse.
+        cos_r, sin_r = math.cos(rotation), math.sin(rotation)
+        corners = [(offset_x, offset_y), (offset_x + mask_width, offset_y)]
+        corners += [(offset_x, offset_y + mask_height), (offset_x + mask_width, offset_y + mask_height)]
+        screen = [(anchor_x + u * cos_r + v * sin_r, anchor_y - u * sin_r + v * cos_r) for u, v in corners]
+        y0 = max(0, math.floor(min(y for _, y in screen)))
+        y1 = min(self.height, math.ceil(max(y for _, y in screen)))
+        x0 = max(0, math.floor(min(x for x, _ in screen)))
+        x1 = min(self.width, math.ceil(max(x for x, _ in screen)))
+        for py in range(y0, y1):
+            dy = py + 0.5 - anchor_y
+            for px in range(x0, x1):
+                dx = px + 0.5 - anchor_x
+                u = int(math.floor(dx * cos_r - dy * sin_r - offset_x))
+                v = int(math.floor(dx * sin_r + dy * cos_r - offset_y))
+                if 0 <= u < mask_width and 0 <= v < mask_height and mask[v][u]:
+                    self._paint_span(py, px, px + 1, rgb, alpha)
+
+    # ------------------------------------------------------------------
+    # Rasterization
+    # ------------------------------------------------------------------
+
+    def _fill_shape(self, points: Sequence[Point2D], fill: Any, stroke: Any) -> None:
+        rgb, alpha = parse_css_color(getattr(fill, "color", None))
+        opacity = getattr(fill, "opacity", None)
+        if opacity is not None:
+            alpha *= max(0.0, min(1.0, float(opacity)))
+        self._fill_rings([points], rgb, alpha)
+        if stroke is not None:
+            self._stroke_path(points, True, stroke.color, float(stroke.width))
+
+    def _stroke_path(self, points: Sequence[Point2D], closed: bool, color: Any, width: float) -> None:
+        rgb, alpha = parse_css_color(color)
+        if alpha <= 0.0 or len(points) < 2:
+            return
+        path = [(float(x), float(y)) for x, y in points if math.isfinite(x) and math.isfinite(y)]
+        if closed and path:
+            path.append(path[0])
+        half = max(width, 1.0) / 2.0
+        for (ax, ay), (bx, by) in zip(path, path[1:]):
+            clipped = self._clip_segment(ax, ay, bx, by, half + 1.0)
+            if clipped is None:
+                continue
+            ax, ay, bx, by = clipped
+            if width <= 1.5:
+                self._plot_line(ax, ay, bx, by, rgb, alpha)
+                continue
+            length = math.hypot(bx - ax, by - ay)
+            if length == 0.0:
+                continue
+            nx, ny = -(by - ay) / length * half, (bx - ax) / length * half
+            self._fill_rings(
+                [[(ax + nx, ay + ny), (bx + nx, by + ny), (bx - nx, by - ny), (ax - nx, ay - ny)]], rgb, alpha
+            )
+        if width >= 3.0 and alpha >= 1.0:
+            # Round the joints so thick polylines do not show notches between quads.
+            for x, y in path[1:-1] if not closed else path:
+                if -half <= x <= self.width + half and -half <= y <= self.height + half:
+                    self._fill_rings([_arc_points(x, y, half, 0.0, 2.0 * math.pi)], rgb, alpha)
+
+    def _clip_segment(
+        self, ax: float, ay: float, bx: float, by: float, margin: float
+    ) -> Optional[Tuple[float, float, float, float]]:
+        """Liang-Barsky clip against the surface expanded by ``margin``."""
+        t0, t1 = 0.0, 1.0
+        dx, dy = bx - ax, by - ay
+        for p, q in (
+            (-dx, ax + margin),
+            (dx, self.width + margin - ax),
+            (-dy, ay + margin),
+            (dy, self.height + margin - ay),
+        ):
+            if p == 0.0:
+                if q < 0.0:
+                    return None
+                continue
+            t = q / p
+            if p < 0.0:
+                if t > t1:
+                    return None
+                t0 = max(t0, t)
+            else:
+                if t < t0:
+                    return None
+                t1 = min(t1, t)
+        return ax + t0 * dx, ay + t0 * dy, ax + t1 * dx, ay + t1 * dy
+
+    def _plot_line(self, ax: float, ay: float, bx: float, by: float, rgb: RGB, alpha: float) -> None:
+        x, y = int(math.floor(ax)), int(math.floor(ay))
+        x_end, y_end = int(math.floor(bx)), int(math.floor(by))
+        if y == y_end:
+            self._paint_span(y, min(x, x_end), max(x, x_end) + 1, rgb, alpha)
+            return
+        dx, dy = abs(x_end - x), -abs(y_end - y)
+        step_x = 1 if x < x_end else -1
+        step_y = 1 if y < y_end else -1
+        error = dx + dy
+        width, height = self.width, self.height
+        pixels = self.pixels
+        color = bytes(rgb)
+        while True:
+            if 0 <= x < width and 0 <= y < height:
+                if alpha >= 1.0:
+                    offset = (y * width + x) * 3
+                    pixels[offset : offset + 3] = color
+                else:
+                    self._paint_span(y, x, x + 1, rgb, alpha)
+            if x == x_end and y == y_end:
+                return
+            doubled = 2 * error
+            if doubled >= dy:
+                error += dy
+                x += step_x
+            if doubled <= dx:
+                error += dx
+                y += step_y
+
+    def _fill_rings(self, rings: Sequence[Sequence[Point2D]], rgb: RGB, alpha: float) -> None:
+        """Even-odd scanline fill of one or more closed rings, sampled at pixel centers."""
+        if alpha <= 0.0:
+            return
+        edges: List[Tuple[float, float, float, float]] = []
+        for ring in rings:
+            count = len(ring)
+            for index in range(count):
+                x0, y0 = ring[index]
+                x1, y1 = ring[(index + 1) % count]
+                if y0 == y1 or not (
+                    math.isfinite(x0) and math.isfinite(y0) and math.isfinite(x1) and math.isfinite(y1)
+                ):
+                    continue
+                if y0 > y1:
+                    x0, y0, x1, y1 = x1, y1, x0, y0
+                edges.append((y0, y1, x0, (x1 - x0) / (y1 - y0)))
+        if not edges:
+            return
+        edges.sort()
+        row_start = max(0, math.floor(edges[0][0]))
+        row_end = min(self.height, math.ceil(max(edge[1] for edge in edges)))
+        active: List[Tuple[float, float, float, float]] = []
+        next_edge = 0
+        for row in range(row_start, row_end):
+            sample_y = row + 0.5
+            while next_edge < len(edges) and edges[next_edge][0] <= sample_y:
+                active.append(edges[next_edge])
+                next_edge += 1
+            active = [edge for edge in active if edge[1] > sample_y]
+            if not active:
+                if next_edge >= len(edges):
+                    return
+                continue
+            crossings = sorted(x0 + (sample_y - y0) * slope for y0, _, x0, slope in active if y0 <= sample_y)
+            for index in range(0, len(crossings) - 1, 2):
+                start = math.ceil(crossings[index] - 0.5)
+                end = math.ceil(crossings[index + 1] - 0.5)
+                self._paint_span(row, start, end, rgb, alpha)
+
+    def _paint_span(self, row: int, start: int, end: int, rgb: RGB, alpha: float) -> None:
+        if row < 0 or row >= self.height:
+            return
+        start = max(0, start)
+        end = min(self.width, end)
+        if start >= end:
+            return
+        first = (row * self.width + start) * 3
+        last = (row * self.width + end) * 3
+        if alpha >= 1.0:
+            self.pixels[first:last] = bytes(rgb) * (end - start)
+            return
+        tables = self._blend_table(rgb, alpha)
+        span = self.pixels[first:last]
+        for channel in range(3):
+            span[channel::3] = span[channel::3].translate(tables[channel])
+        self.pixels[first:last] = span
+
+    def _blend_table(self, rgb: RGB, alpha: float) -> Tuple[bytes, bytes, bytes]:
+        level = max(0, min(255, round(alpha * 255)))
+        key = (rgb, level)
+        tables = self._blend_tables.get(key)
+        if tables is None:
+            weight = level / 255.0
+
+            def channel_table(target: int) -> bytes:
+                return bytes(round(value + (target - value) * weight) for value in range(256))
+
+            tables = (channel_table(rgb[0]), channel_table(rgb[1]), channel_table(rgb[2]))
+            self._blend_tables[key] = tables
+        return tables
+
+
+def _text_mask(lines: List[str], scale: float) -> Tuple[List[bytearray], int, int]:
+    """Nearest-neighbour scaled coverage mask (one byte per pixel) for monospaced lines."""
+    columns = max((len(line) for line in lines), default=0)
+    if not columns:
+        return [], 0, 0
+    source_width = columns * GLYPH_WIDTH
+    source_height = len(lines) * GLYPH_HEIGHT
+    source: List[bytearray] = []
+    for line in lines:
+        line_rows = [bytearray(source_width) for _ in range(GLYPH_HEIGHT)]
+        for column, char in enumerate(line):
+            base = column * GLYPH_WIDTH
+            for row_index, bits in enumerate(glyph_rows(char)):
+                if not bits:
+                    continue
+                target = line_rows[row_index]
+                for bit in range(GLYPH_WIDTH):
+                    if bits & (1 << (GLYPH_WIDTH - 1 - bit)):
+                        target[base + bit] = 1
+        source.extend(line_rows)
+
+    width = max(1, round(source_width * scale))
+    height = max(1, round(source_height * scale))
+    column_map = [min(source_width - 1, int(x / scale)) for x in range(width)]
+    mask = []
+    for y in range(height):
+        source_row = source[min(source_height - 1, int(y / scale))]
+        mask.append(bytearray(source_row[x] for x in column_map))
+    return mask, width, height
+
+
+def _row_runs(row: bytearray) -> List[Tuple[int, int]]:
+    runs: List[Tuple[int, int]] = []
+    start = -1
+    for index, value in enumerate(row):
+        if value and start < 0:
+            start = index
+        elif not value and start >= 0:
+            runs.append((start, index))
+            start = -1
+    if start >= 0:
+        runs.append((start, len(row)))
+    return runs
+
+
+def _fmt(value: float) -> str:
+    return f"{float(value):.2f}".rstrip("0").rstrip(".")
+
+
+def _points_attr(points: Sequence[Point2D]) -> str:
+    return " ".join(f"{_fmt(x)},{_fmt(y)}" for x, y in points)
+
+
+class SvgTextPrimitiveAdapter(_PrimitiveAdapterBase):
+    """Serialize renderer primitives as standalone SVG markup."""
+
+    _TEXT_ANCHORS = {"center": "middle", "right": "end", "end": "end"}
+    _BASELINES = {
+        "top": "hanging",
+        "hanging": "hanging",
+        "middle": "middle",
+        "bottom": "text-after-edge",
+        "ideographic": "ideographic",
+    }
+
+    def __init__(self, width: int, height: int, background: str = "#ffffff") -> None:
+        self.width = max(1, int(width))
+        self.height = max(1, int(height))
+        self.background = background
+        self.elements: List[str] = []
+
+    def clear_surface(self) -> None:
+        self.elements = []
+
+    def resize_surface(self, width: float, height: float) -> None:
+        self.width = max(1, int(width))
+        self.height = max(1, int(height))
+
+    def to_svg(self) -> str:
+        header = (
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{self.width}" height="{self.height}" '
+            f'viewBox="0 0 {self.width} {self.height}">'
+        )
+        background = f'<rect width="100%" height="100%" fill="{escape(self.background)}"/>'
+        return "\n".join([header, background, *self.elements, "</svg>"]) + "\n"
+
+    @staticmethod
+    def _stroke_attrs(stroke: Any, include_width: bool = True) -> str:
+        attrs = f'stroke="{escape(str(stroke.color))}"'
+        if include_width:
+            attrs += f' stroke-width="{_fmt(stroke.width)}"'
+        if getattr(stroke, "line_join", None):
+            attrs += f' stroke-linejoin="{escape(str(stroke.line_join))}"'
+        if getattr(stroke, "line_cap", None):
+            attrs += f' stroke-linecap="{escape(str(stroke.line_cap))}"'
+        return attrs
+
+    @staticmethod
+    def _fill_attrs(fill: Any) -> str:
+        attrs = f'fill="{escape(str(fill.color))}"'
+        if getattr(fill, "opacity", None) is not None:
+            attrs += f' fill-opacity="{_fmt(fill.opacity)}"'
+        return attrs
+
+    def stroke_line(self, start: Point2D, end: Point2D, stroke: Any, *, include_width: bool = True) -> None:
+        self.elements.append(
+            f'<line x1="{_fmt(start[0])}" y1="{_fmt(start[1])}" x2="{_fmt(end[0])}" y2="{_fmt(end[1])}" '
+            f"{self._stroke_attrs(stroke, include_width)}/>"
+        )
+
+    def stroke_polyline(self, points: List[Point2D], stroke: Any) -> None:
+        if len(points) >= 2:
+            self.elements.append(
+                f'<polyline points="{_points_attr(points)}" fill="none" {self._stroke_attrs(stroke)}/>'
+            )
+
+    def stroke_circle(self, center: Point2D, radius: float, stroke: Any) -> None:
+        self.elements.append(
+            f'<circle cx="{_fmt(center[0])}" cy="{_fmt(center[1])}" r="{_fmt(radius)}" fill="none" '
+            f"{self._stroke_attrs(stroke)}/>"
+        )
+
+    def fill_circle(
+        self,
+        center: Point2D,
+        radius: float,
+        fill: Any,
+        stroke: Any = None,
+        *,
+        screen_space: bool = False,
+    ) -> None:
+        stroke_attrs = f" {self._stroke_attrs(stroke)}" if stroke is not None else ""
+        self.elements.append(
+            f'<circle cx="{_fmt(center[0])}" cy="{_fmt(center[1])}" r="{_fmt(radius)}" '
+            f"{self._fill_attrs(fill)}{stroke_attrs}/>"
+        )
+
+    def stroke_ellipse(
+        self,
+        center: Point2D,
+        radius_x: float,
+        radius_y: float,
+        rotation_rad: float,
+        stroke: Any,
+    ) -> None:
+        cx, cy = _fmt(center[0]), _fmt(center[1])
+        self.elements.append(
+            f'<ellipse cx="{cx}" cy="{cy}" rx="{_fmt(radius_x)}" ry="{_fmt(radius_y)}" '
+            f'transform="rotate({_fmt(math.degrees(rotation_rad))} {cx} {cy})" fill="none" '
+            f"{self._stroke_attrs(stroke)}/>"
+        )
+
+    def fill_polygon(
+        self,
+        points: List[Point2D],
+        fill: Any,
+        stroke: Any = None,
+        *,
+        screen_space: bool = False,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        if len(points) < 3:
+            return
+        stroke_attrs = f" {self._stroke_attrs(stroke)}" if stroke is not None else ""
+        self.elements.append(f'<polygon points="{_points_attr(points)}" {self._fill_attrs(fill)}{stroke_attrs}/>')
+
+    def fill_joined_area(self, forward: List[Point2D], reverse: List[Point2D], fill: Any) -> None:
+        if len(forward) >= 2 and reverse:
+            points = list(forward) + list(reverse)
+            self.elements.append(f'<polygon points="{_points_attr(points)}" {self._fill_attrs(fill)}/>')
+
+    def stroke_arc(
+        self,
+        center: Point2D,
+        radius: float,
+        start_angle_rad: float,
+        end_angle_rad: float,
+        sweep_clockwise: bool,
+        stroke: Any,
+        css_class: Optional[str] = None,
+        *,
+        screen_space: bool = False,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        sweep = _arc_sweep(start_angle_rad, end_angle_rad, sweep_clockwise)
+        r = float(radius)
+        # A full turn cannot be a single SVG arc command; split it at the midpoint.
+        stops = [start_angle_rad, start_angle_rad + sweep / 2.0, start_angle_rad + sweep]
+        if abs(sweep) < 2.0 * math.pi:
+            stops = [start_angle_rad, start_angle_rad + sweep]
+        cx, cy = float(center[0]), float(center[1])
+        path = f"M {_fmt(cx + r * math.cos(stops[0]))} {_fmt(cy + r * math.sin(stops[0]))}"
+        for previous, angle in zip(stops, stops[1:]):
+            large_arc = 1 if abs(angle - previous) > math.pi else 0
+            path += (
+                f" A {_fmt(r)} {_fmt(r)} 0 {large_arc} {1 if sweep > 0 else 0} "
+                f"{_fmt(cx + r * math.cos(angle))} {_fmt(cy + r * math.sin(angle))}"
+            )
+        class_attr = f' class="{escape(css_class)}"' if css_class else ""
+        self.elements.append(f'<path d="{path}" fill="none"{class_attr} {self._stroke_attrs(stroke)}/>')
+
+    def draw_text(
+        self,
+        text: str,
+        position: Point2D,
+        font: Any,
+        color: str,
+        alignment: Any,
+        style_overrides: Optional[Dict[str, Any]] = None,
+        *,
+        screen_space: bool = False,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        x, y = _fmt(position[0]), _fmt(position[1])
+        attrs = f'x="{x}" y="{y}" fill="{escape(str(color))}"'
+        attrs += f' font-size="{_fmt(_font_size_px(getattr(font, "size", None)))}"'
+        if getattr(font, "family", None):
+            attrs += f' font-family="{escape(str(font.family))}"'
+        if getattr(font, "weight", None):
+            attrs += f' font-weight="{escape(str(font.weight))}"'
+        anchor = self._TEXT_ANCHORS.get(getattr(alignment, "horizontal", "left"))
+        if anchor:
+            attrs += f' text-anchor="{anchor}"'
+        baseline = self._BASELINES.get(getattr(alignment, "vertical", "alphabetic"))
+        if baseline:
+            attrs += f' dominant-baseline="{baseline}"'
+        rotation = _label_rotation_rad(metadata)
+        if rotation:
+            attrs += f' transform="rotate({_fmt(-math.degrees(rotation))} {x} {y})"'
+        self.elements.append(f"<text {attrs}>{escape(str(text))}</text>")
+
+
+class CanvasRasterizer:
+    """Render canvas states to SVG text or PNG bytes without a browser.
+
+    Usage:
+        rasterizer = CanvasRasterizer(800, 600)
+        if not rasterizer.unsupported_buckets(canvas_state):
+            png_bytes = rasterizer.render_png(canvas_state)
+            if rasterizer.skipped_drawables:
+                ...  # some entries failed to rebuild; fall back or report them
+
+    Attributes:
+        skipped_drawables (list): ``"Bucket:name"`` labels of entries the last
+            render could not rebuild and left out
+    """
+
+    def __init__(self, width: int = DEFAULT_RASTER_WIDTH, height: int = DEFAULT_RASTER_HEIGHT) -> None:
+        self.width = max(1, min(MAX_RASTER_DIMENSION, int(width)))
+        self.height = max(1, min(MAX_RASTER_DIMENSION, int(height)))
+        self.skipped_drawables: List[str] = []
+
+    @staticmethod
+    def unsupported_buckets(canvas_state: Dict[str, Any]) -> List[str]:
+        """Return non-empty drawable buckets this rasterizer cannot reproduce."""
+        return sorted(
+            key
+            for key, value in canvas_state.items()
+            if key[:1].isupper() and isinstance(value, list) and value and key not in SUPPORTED_BUCKETS
+        )
+
+    def render_svg(self, canvas_state: Dict[str, Any]) -> str:
+        """Render ``canvas_state`` as an SVG document string."""
+        return str(self._render(canvas_state, "svg"))
+
+    def render_png(self, canvas_state: Dict[str, Any]) -> bytes:
+        """Render ``canvas_state`` as PNG bytes."""
+        return bytes(self._render(canvas_state, "png"))
+
+    def _render(self, canvas_state: Dict[str, Any], output_format: str) -> Any:
+        output, skipped = _render_worker.render(self.width, self.height, canvas_state, output_format)
+        self.skipped_drawables = [label for label, _ in skipped]
+        for label, reason in skipped:
+            _logger.warning("Canvas rasterizer skipped %s: %s", label, reason)
+        return output
+
+
+def _render_scene(
+    canvas_state: Dict[str, Any], adapter: _PrimitiveAdapterBase, width: int, height: int
+) -> List[Tuple[str, str]]:
+    runtime = _load_client_runtime()
+    mapper = runtime["CoordinateMapper"](width, height)
+    visibility = canvas_state.get("Cartesian_System_Visibility")
+    if isinstance(visibility, dict):
+        try:
+            mapper.set_visible_bounds(
+                visibility["left_bound"],
+                visibility["right_bound"],
+                visibility["top_bound"],
+                visibility["bottom_bound"],
+            )
+        except (KeyError, ValueError):
+            pass
+    style = runtime["get_renderer_style"]()
+
+    adapter.begin_frame()
+    coordinate_system = canvas_state.get("coordinate_system")
+    mode = coordinate_system.get("mode") if isinstance(coordinate_system, dict) else None
+    if mode == "polar":
+        polar_grid = runtime["PolarGrid"](mapper)
+        grid_plan = runtime["build_plan_for_polar"](polar_grid, mapper, style, supports_transform=False)
+    else:
+        cartesian = runtime["Cartesian2Axis"](mapper)
+        cartesian.set_state(canvas_state)
+        if "current_tick_spacing" not in canvas_state:
+            cartesian.current_tick_spacing = cartesian._calculate_tick_spacing()
+        grid_plan = runtime["build_plan_for_cartesian"](cartesian, mapper, style, supports_transform=False)
+    if getattr(grid_plan, "drawable", None) is None or getattr(grid_plan.drawable, "visible", True):
+        grid_plan.apply(adapter)
+
+    build_plan = runtime["build_plan_for_drawable"]
+    scene = _SceneBuilder(runtime)
+    for drawable in scene.build(canvas_state):
+        plan = build_plan(drawable, mapper, style, supports_transform=False)
+        if plan is not None:
+            plan.apply(adapter)
+    adapter.end_frame()
+    return scene.skipped
+
+
+class _SceneBuilder:
+    """Rebuild client drawables from canvas-state buckets.
+
+    Entries that fail to rebuild (missing endpoints, unparsable expressions)
+    are left out and recorded in ``skipped`` with the reason.
+    """
+
+    # Draw order: curves and shapes under segments, points and labels on top.
+    _BUCKET_ORDER: Tuple[str, ...] = (
+        "Functions",
+        "PiecewiseFunctions",
+        "ParametricFunctions",
+        "Circles",
+        "Ellipses",
+        "CircleArcs",
+        "Angles",
+        "Segments",
+        "Vectors",
+        "Points",
+        "Labels",
+    )
+    # Points and segments are referenced by name, so they are built first.
+    _BUILD_ORDER: Tuple[str, ...] = ("Points", "Segments") + tuple(
+        bucket for bucket in _BUCKET_ORDER if bucket not in ("Points", "Segments")
+    )
+
+    def __init__(self, runtime: Dict[str, Any]) -> None:
+        self.runtime = runtime
+        self.points: Dict[str, Any] = {}
+        self.segments: Dict[str, Any] = {}
+        self.skipped: List[Tuple[str, str]] = []
+
+    def build(self, canvas_state: Dict[str, Any]) -> List[Any]:
+        builders: Dict[str, Callable[[Dict[str, Any], Dict[str, Any]], Any]] = {
+            "Functions": self._function,
+            "PiecewiseFunctions": self._piecewise_function,
+            "ParametricFunctions": self._parametric_function,
+            "Circles": self._circle,
+            "Ellipses": self._ellipse,
+            "CircleArcs": self._circle_arc,
+            "Angles": self._angle,
+            "Segments": self._segment,
+            "Vectors": self._vector,
+            "Points": self._point,
+            "Labels": self._label,
+        }
+        built: Dict[str, List[Any]] = {}
+        for bucket in self._BUILD_ORDER:
+            drawables = built.setdefault(bucket, [])
+            for item in self._entries(canvas_state, bucket):
+                drawable = self._try_build(bucket, builders[bucket], item)
+                if drawable is not None:
+                    drawables.append(drawable)
+        return [drawable for bucket in self._BUCKET_ORDER for drawable in built[bucket]]
+
+    def _try_build(
+        self, bucket: str, builder: Callable[[Dict[str, Any], Dict[str, Any]], Any], item: Dict[str, Any]
+    ) -> Any:
+        try:
+            return builder(item, item.get("args", {}))
+        except Exception as exc:
+            self.skipped.append((f"{bucket}:{item.get('name', '')}", f"{type(exc).__name__}: {exc}"))
+            return None
+
+    @staticmethod
+    def _entries(canvas_state: Dict[str, Any], bucket: str) -> List[Dict[str, Any]]:
+        items = canvas_state.get(bucket)
+        if not isinstance(items, list):
+            return []
+        return [item for item in items if isinstance(item, dict) and isinstance(item.get("args", {}), dict)]
+
+    @staticmethod
+    def _color_kwargs(item: Dict[str, Any], args: Dict[str, Any]) -> Dict[str, Any]:
+        color = args.get("color") or item.get("color")
+        return {"color": str(color)} if color else {}
+
+    def _resolve_point(self, name: Any, coords: Any) -> Any:
+        point = self.points.get(str(name)) if name is not None else None
+        if point is None and isinstance(coords, (list, tuple)) and len(coords) == 2:
+            point = self.runtime["Point"](float(coords[0]), float(coords[1]), name=str(name or ""))
+        if point is None:
+            raise ValueError(f"Unknown point {name!r}")
+        return point
+
+    def _point(self, item: Dict[str, Any], args: Dict[str, Any]) -> Any:
+        name = str(item.get("name", ""))
+        position = args.get("position") or {}
+        point = self.runtime["Point"](
+            float(position["x"]), float(position["y"]), name=name, **self._color_kwargs(item, args)
+        )
+        self.points[name] = point
+        return point
+
+    def _segment(self, item: Dict[str, Any], args: Dict[str, Any]) -> Any:
+        name = str(item.get("name", ""))
+        label = args.get("label")
+        if not isinstance(label, dict):
+            label = {}
+        segment = self.runtime["Segment"](
+            self._resolve_point(args.get("p1"), item.get("_p1_coords")),
+            self._resolve_point(args.get("p2"), item.get("_p2_coords")),
+            label_text=str(label.get("text", "") or ""),
+            label_visible=bool(label.get("visible", False)),
+            **self._color_kwargs(item, args),
+        )
+        self.segments[name] = segment
+        return segment
+
+    def _vector(self, item: Dict[str, Any], args: Dict[str, Any]) -> Any:
+        return self.runtime["Vector"](
+            self._resolve_point(args.get("origin"), item.get("_origin_coords")),
+            self._resolve_point(args.get("tip"), item.get("_tip_coords")),
+            **self._color_kwargs(item, args),
+        )
+
+    def _circle(self, item: Dict[str, Any], args: Dict[str, Any]) -> Any:
+        center = self._resolve_point(args.get("center"), None)
+        return self.runtime["Circle"](center, float(args["radius"]), **self._color_kwargs(item, args))
+
+    def _ellipse(self, item: Dict[str, Any], args: Dict[str, Any]) -> Any:
+        return self.runtime["Ellipse"](
+            self._resolve_point(args.get("center"), None),
+            float(args["radius_x"]),
+            float(args["radius_y"]),
+            rotation_angle=float(args.get("rotation_angle", 0) or 0),
+            **self._color_kwargs(item, args),
+        )
+
+    def _circle_arc(self, item: Dict[str, Any], args: Dict[str, Any]) -> Any:
+        return self.runtime["CircleArc"](
+            self._resolve_point(args.get("point1_name"), None),
+            self._resolve_point(args.get("point2_name"), None),
+            center_x=float(args["center_x"]),
+            center_y=float(args["center_y"]),
+            radius=float(args["radius"]),
+            use_major_arc=bool(args.get("use_major_arc", False)),
+            name=item.get("name"),
+            **self._color_kwargs(item, args),
+        )
+
+    def _angle(self, item: Dict[str, Any], args: Dict[str, Any]) -> Any:
+        segment1 = self.segments.get(str(args.get("segment1_name")))
+        segment2 = self.segments.get(str(args.get("segment2_name")))
+        if segment1 is None or segment2 is None:
+            return None
+        return self.runtime["Angle"](
+            segment1,
+            segment2,
+            is_reflex=bool(args.get("is_reflex", False)),
+            name=item.get("name"),
+            **self._color_kwargs(item, args),
+        )
+
+    def _function(self, item: Dict[str, Any], args: Dict[str, Any]) -> Any:
+        return self.runtime["Function"](
+            str(args["function_string"]),
+            name=item.get("name"),
+            left_bound=args.get("left_bound"),
+            right_bound=args.get("right_bound"),
+            vertical_asymptotes=args.get("vertical_asymptotes"),
+            horizontal_asymptotes=args.get("horizontal_asymptotes"),
+            point_discontinuities=args.get("point_discontinuities"),
+            undefined_at=args.get("undefined_at"),
+            **self._color_kwargs(item, args),
+        )
+
+    def _piecewise_function(self, item: Dict[str, Any], args: Dict[str, Any]) -> Any:
+        return self.runtime["PiecewiseFunction"](
+            list(args["pieces"]),
+            name=item.get("name"),
+            vertical_asymptotes=args.get("vertical_asymptotes"),
+            horizontal_asymptotes=args.get("horizontal_asymptotes"),
+            point_discontinuities=args.get("point_discontinuities"),
+            **self._color_kwargs(item, args),
+        )
+
+    def _parametric_function(self, item: Dict[str, Any], args: Dict[str, Any]) -> Any:
+        t_max = args.get("t_max")
+        return self.runtime["ParametricFunction"](
+            str(args["x_expression"]),
+            str(args["y_expression"]),
+            name=item.get("name"),
+            t_min=float(args.get("t_min", 0.0) or 0.0),
+            t_max=float(t_max) if t_max is not None else None,
+            **self._color_kwargs(item, args),
+        )
+
+    def _label(self, item: Dict[str, Any], args: Dict[str, Any]) -> Any:
+        if not args.get("visible", True):
+            return None
+        position = args.get("position") or {}
+        return self.runtime["Label"](
+            float(position["x"]),
+            float(position["y"]),
+            str(args.get("text", "")),
+            name=str(item.get("name", "")),
+            font_size=args.get("font_size"),
+            rotation_degrees=args.get("rotation_degrees"),
+            reference_scale_factor=args.get("reference_scale_factor"),
+            **self._color_kwargs(item, args),
+        )
+
+
+if __name__ == "__main__":
+    _serve_worker()
@@ -3,15 +3,22 @@ Canvas state summarization utilities for AI-facing debugging and comparison.
 
 This module keeps workspace/persistence state untouched and provides a pruned
 view intended for prompt-quality inspection.
+
+Summaries are built in a single pass over the top-level buckets. Each drawable
+is serialized once; that string both sizes the full state and keys a memo of
+per-drawable summaries, so objects unchanged since the previous chat turn are
+reused rather than pruned and canonicalized again. An optional token budget
+collapses the largest drawable buckets to counts and names when exceeded.
 """
 
 from __future__ import annotations
 
-import copy
+import hashlib
 import json
-from typing import Any, Dict, List, Tuple, cast
+import threading
+from typing import Any, Dict, List, Optional, Tuple, cast
 
-from static.token_estimation import estimate_tokens_from_text
+from static.token_estimation import estimate_tokens_from_bytes
 
 _DRAWABLE_FIELD_PRUNE_RULES: Dict[str, set[str]] = {
     "Segments": {"_p1_coords", "_p2_coords"},
@@ -28,66 +35,207 @@ _ALWAYS_PRUNE_PREFIXES: Tuple[str, ...] = ("_",)
 # Keys that should always stay present when found at object level.
 _IDENTITY_KEYS: set[str] = {"name", "args"}
 
+_JSON_SEPARATORS = (",", ":")
+# Shared compact encoder; json.dumps builds a new encoder per call when given separators
+_COMPACT_ENCODER = json.JSONEncoder(separators=_JSON_SEPARATORS)
 
-def summarize_canvas_state(full_state: Dict[str, Any]) -> Dict[str, Any]:
-    """Return a pruned copy of canvas state for AI-facing readability."""
-    if not isinstance(full_state, dict):
-        return {}
+# content hash -> (summary item, summary JSON length, sort key).
+# Insertion order doubles as recency order: hits are re-inserted at the end,
+# so the least recently used entry is always the first key. The memo is shared
+# by all sessions (entries are keyed by content), so every access holds the lock.
+SUMMARY_MEMO_MAX_SIZE = 20000
+_summary_memo: Dict[bytes, Tuple[Any, int, Tuple[str, str]]] = {}
+_summary_memo_lock = threading.Lock()
 
-    summary: Dict[str, Any] = copy.deepcopy(full_state)
 
-    for key, value in list(summary.items()):
-        if isinstance(value, list):
-            if _is_drawable_bucket(value):
-                summary[key] = _summarize_drawable_bucket(key, value)
-            else:
-                summary[key] = _strip_empty_values(value)
-        elif isinstance(value, dict):
-            summary[key] = _strip_empty_values(value)
+def clear_summary_memo() -> None:
+    """Clear the per-drawable summary memo."""
+    with _summary_memo_lock:
+        _summary_memo.clear()
+
+
+def _memo_get(digest: bytes) -> Optional[Tuple[Any, int, Tuple[str, str]]]:
+    with _summary_memo_lock:
+        cached = _summary_memo.pop(digest, None)
+        if cached is not None:
+            _summary_memo[digest] = cached
+        return cached
+
+
+def _memo_put(digest: bytes, cached: Tuple[Any, int, Tuple[str, str]]) -> None:
+    with _summary_memo_lock:
+        _summary_memo.pop(digest, None)
+        while len(_summary_memo) >= SUMMARY_MEMO_MAX_SIZE:
+            _summary_memo.pop(next(iter(_summary_memo)))
+        _summary_memo[digest] = cached
 
-    return cast(Dict[str, Any], _canonicalize(summary))
+
+def summarize_canvas_state(full_state: Dict[str, Any], max_tokens: Optional[int] = None) -> Dict[str, Any]:
+    """Return a pruned copy of canvas state for AI-facing readability."""
+    return cast(Dict[str, Any], build_canvas_state_summary(full_state, max_tokens=max_tokens)["summary"])
 
 
 def compare_canvas_states(full_state: Dict[str, Any]) -> Dict[str, Any]:
     """Return full+summary states with deterministic size metrics."""
-    canonical_full = _canonicalize(copy.deepcopy(full_state if isinstance(full_state, dict) else {}))
-    summary = summarize_canvas_state(canonical_full)
+    state = full_state if isinstance(full_state, dict) else {}
+    result = build_canvas_state_summary(state)
+    return {
+        "full": _canonicalize(state),
+        "summary": result["summary"],
+        "metrics": result["metrics"],
+    }
+
+
+def measure_canvas_state_bytes(full_state: Dict[str, Any], limit: Optional[int] = None) -> int:
+    """Return the compact-JSON byte size of a canvas state.
+
+    With ``limit`` set, counting stops as soon as the size exceeds it and the
+    partial (already over-limit) total is returned, so a size check against a
+    threshold never serializes more of a large state than it needs to.
+    """
+    total = 2 + max(0, len(full_state) - 1)
+    for key, value in full_state.items():
+        total += len(json.dumps(key)) + 1
+        if isinstance(value, list):
+            total += 2 + max(0, len(value) - 1)
+            for item in value:
+                total += len(_COMPACT_ENCODER.encode(item))
+                if limit is not None and total > limit:
+                    return total
+        else:
+            total += len(_COMPACT_ENCODER.encode(value))
+        if limit is not None and total > limit:
+            return total
+    return total
+
+
+def build_canvas_state_summary(full_state: Dict[str, Any], max_tokens: Optional[int] = None) -> Dict[str, Any]:
+    """Return ``{"summary", "metrics"}`` for a canvas state in one traversal.
+
+    Sizes are exact compact-JSON byte counts, assembled from per-value lengths
+    rather than by serializing either state as a whole. Summary entries for
+    drawables are shared with the memo and must be treated as read-only.
 
-    full_json = json.dumps(canonical_full, separators=(",", ":"), sort_keys=True)
-    summary_json = json.dumps(summary, separators=(",", ":"), sort_keys=True)
+    Args:
+        full_state: Canvas state as sent by the client.
+        max_tokens: Optional estimated-token budget for the summary. When it is
+            exceeded the largest drawable buckets are collapsed to
+            ``{"count", "names"}``, then to ``{"count"}``, until it fits.
+    """
+    if not isinstance(full_state, dict):
+        full_state = {}
+
+    summary: Dict[str, Any] = {}
+    # bucket name -> (item count, names) for budget degradation
+    buckets: Dict[str, Tuple[int, List[str]]] = {}
+    value_lengths: Dict[str, int] = {}
+    full_bytes = 2 + max(0, len(full_state) - 1)
+    summary_bytes = 2 + max(0, len(full_state) - 1)
+
+    for key in sorted(full_state):
+        value = full_state[key]
+        key_length = len(json.dumps(key)) + 1
+        if isinstance(value, list) and _is_drawable_bucket(value):
+            summary[key], raw_length, value_lengths[key], names = _summarize_drawable_bucket(key, value)
+            buckets[key] = (len(value), names)
+        else:
+            raw_length = len(_COMPACT_ENCODER.encode(value))
+            summary[key] = _canonicalize(_strip_empty_values(value)) if isinstance(value, (list, dict)) else value
+            value_lengths[key] = len(_COMPACT_ENCODER.encode(summary[key]))
+        full_bytes += key_length + raw_length
+        summary_bytes += key_length + value_lengths[key]
+
+    collapsed: List[str] = []
+    if max_tokens is not None:
+        summary_bytes = _collapse_to_budget(summary, buckets, value_lengths, summary_bytes, max_tokens, collapsed)
 
-    full_bytes = len(full_json.encode("utf-8"))
-    summary_bytes = len(summary_json.encode("utf-8"))
     reduction_pct = 0.0
     if full_bytes > 0:
         reduction_pct = round((1.0 - (summary_bytes / float(full_bytes))) * 100.0, 2)
 
-    return {
-        "full": canonical_full,
-        "summary": summary,
-        "metrics": {
-            "full_bytes": full_bytes,
-            "summary_bytes": summary_bytes,
-            "full_estimated_tokens": estimate_tokens_from_text(full_json),
-            "summary_estimated_tokens": estimate_tokens_from_text(summary_json),
-            "reduction_pct": reduction_pct,
-        },
+    metrics: Dict[str, Any] = {
+        "full_bytes": full_bytes,
+        "summary_bytes": summary_bytes,
+        "full_estimated_tokens": estimate_tokens_from_bytes(full_bytes),
+        "summary_estimated_tokens": estimate_tokens_from_bytes(summary_bytes),
+        "reduction_pct": reduction_pct,
     }
+    if max_tokens is not None:
+        metrics["token_budget"] = max_tokens
+    if collapsed:
+        metrics["collapsed_buckets"] = collapsed
+    return {"summary": summary, "metrics": metrics}
 
 
-def _summarize_drawable_bucket(bucket_name: str, drawables: List[Any]) -> List[Any]:
-    result: List[Any] = []
+def _summarize_drawable_bucket(bucket_name: str, drawables: List[Any]) -> Tuple[List[Any], int, int, List[str]]:
+    """Return (sorted summary items, raw JSON length, summary JSON length, names)."""
     prune_fields = _DRAWABLE_FIELD_PRUNE_RULES.get(bucket_name, set())
+    entries: List[Tuple[Tuple[str, str], Any]] = []
+    raw_length = 2 + max(0, len(drawables) - 1)
+    summary_length = raw_length
 
     for item in drawables:
-        if not isinstance(item, dict):
-            result.append(item)
-            continue
-
-        pruned = _prune_drawable_object(item, prune_fields)
-        result.append(pruned)
-
-    return _stable_sort_drawables(result)
+        try:
+            raw: Optional[str] = _COMPACT_ENCODER.encode(item)
+        except (TypeError, ValueError):
+            raw = None
+        if raw is None:
+            summary_item, item_length, sort_key = _summarize_drawable(item, prune_fields)
+            raw_length += len(json.dumps(item, separators=_JSON_SEPARATORS, default=str))
+        else:
+            raw_length += len(raw)
+            digest = hashlib.blake2b(f"{bucket_name}\0{raw}".encode("utf-8"), digest_size=16).digest()
+            cached = _memo_get(digest)
+            if cached is None:
+                # Summarize outside the lock; sessions racing on one drawable store equal results
+                cached = _summarize_drawable(item, prune_fields)
+                _memo_put(digest, cached)
+            summary_item, item_length, sort_key = cached
+        summary_length += item_length
+        entries.append((sort_key, summary_item))
+
+    entries.sort(key=lambda entry: entry[0])
+    result = [summary_item for _, summary_item in entries]
+    names = [str(item["name"]) for item in result if isinstance(item, dict) and "name" in item]
+    return result, raw_length, summary_length, names
+
+
+def _summarize_drawable(item: Any, prune_fields: set[str]) -> Tuple[Any, int, Tuple[str, str]]:
+    """Return (summary item, summary JSON length, sort key) for one drawable."""
+    if isinstance(item, dict):
+        summary_item = _canonicalize(_prune_drawable_object(item, prune_fields))
+    else:
+        summary_item = _canonicalize(item)
+    length = len(json.dumps(summary_item, separators=_JSON_SEPARATORS, default=str))
+    return summary_item, length, _drawable_sort_key(summary_item)
+
+
+def _collapse_to_budget(
+    summary: Dict[str, Any],
+    buckets: Dict[str, Tuple[int, List[str]]],
+    value_lengths: Dict[str, int],
+    summary_bytes: int,
+    max_tokens: int,
+    collapsed: List[str],
+) -> int:
+    """Collapse the largest drawable buckets in place until the budget fits; return new byte size."""
+    # Largest first, so the fewest buckets lose detail
+    order = sorted(buckets, key=lambda name: (-value_lengths[name], name))
+    for keep_names in (True, False):
+        for bucket_name in order:
+            if estimate_tokens_from_bytes(summary_bytes) <= max_tokens:
+                return summary_bytes
+            count, names = buckets[bucket_name]
+            replacement: Dict[str, Any] = {"count": count, "names": names} if keep_names and names else {"count": count}
+            length = len(_COMPACT_ENCODER.encode(replacement))
+            if length >= value_lengths[bucket_name]:
+                continue
+            summary[bucket_name] = replacement
+            summary_bytes += length - value_lengths[bucket_name]
+            value_lengths[bucket_name] = length
+            if bucket_name not in collapsed:
+                collapsed.append(bucket_name)
+    return summary_bytes
 
 
 def _prune_drawable_object(obj: Dict[str, Any], prune_fields: set[str]) -> Dict[str, Any]:
@@ -164,22 +312,19 @@ def _is_drawable_bucket(items: List[Any]) -> bool:
     return all(isinstance(entry, dict) and ("name" in entry or "args" in entry) for entry in sample)
 
 
+def _drawable_sort_key(item: Any) -> Tuple[str, str]:
+    if not isinstance(item, dict):
+        return ("", str(item))
+    args = item.get("args", {})
+    try:
+        args_key = json.dumps(args, sort_keys=True, separators=_JSON_SEPARATORS)
+    except Exception:
+        args_key = str(args)
+    return (str(item.get("name", "")), args_key)
+
+
 def _stable_sort_drawables(items: List[Any]) -> List[Any]:
-    keyed: List[Tuple[str, str, Any]] = []
-    for item in items:
-        if isinstance(item, dict):
-            name = str(item.get("name", ""))
-            args = item.get("args", {})
-            args_key = ""
-            try:
-                args_key = json.dumps(args, sort_keys=True, separators=(",", ":"))
-            except Exception:
-                args_key = str(args)
-            keyed.append((name, args_key, item))
-        else:
-            keyed.append(("", str(item), item))
-    keyed.sort(key=lambda t: (t[0], t[1]))
-    return [item for _, _, item in keyed]
+    return sorted(items, key=_drawable_sort_key)
 
 
 def _canonicalize(value: Any) -> Any:
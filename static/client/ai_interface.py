@@ -1884,7 +1884,7 @@ class AIInterface:
             ajax.post(
                 "/save_partial_response",
                 data=payload,
-                headers={"Content-Type": "application/json"},
+                headers={"Content-Type": "application/json", **self._session_headers()},
                 oncomplete=lambda req: None,
                 onerror=lambda req: print(f"Failed to save partial response: {req.status}"),
             )
@@ -2052,6 +2052,16 @@ class AIInterface:
             print(f"Failed to capture Canvas2D snapshot: {exc}")
         return None
 
+    def _session_headers(self) -> Dict[str, str]:
+        """Headers that route a request to this tab's server-side conversation."""
+        try:
+            session_id = getattr(window, "mathudSessionId", None)
+        except Exception:
+            return {}
+        if not isinstance(session_id, str) or not session_id:
+            return {}
+        return {"X-MatHud-Session": session_id}
+
     def _make_request(self, payload: Dict[str, Any]) -> None:
         """Send an AJAX request with the given payload."""
         req = ajax.ajax()
@@ -2059,6 +2069,8 @@ class AIInterface:
         req.bind("error", self._on_error)
         req.open("POST", "/send_message", True)
         req.set_header("content-type", "application/json")
+        for name, value in self._session_headers().items():
+            req.set_header(name, value)
         req.send(json.dumps(payload))
 
     def _start_streaming_request(self, payload: Dict[str, Any]) -> None:
@@ -2339,4 +2351,6 @@ class AIInterface:
         req = ajax.ajax()
         req.open("POST", "/new_conversation", True)
         req.set_header("content-type", "application/json")
+        for name, value in self._session_headers().items():
+            req.set_header(name, value)
         req.send()
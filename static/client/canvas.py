@@ -35,6 +35,8 @@ from __future__ import annotations
 import math
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Set, Tuple, Union, cast
 
+from browser import window
+
 from constants import (
     default_area_fill_color,
     default_area_opacity,
@@ -63,6 +65,10 @@ if TYPE_CHECKING:
     from drawables.drawable import Drawable
     from geometry.graph_state import GraphState
 
+# Drawables this far outside the viewport are still rendered, so strokes, point
+# radii, and labels that reach into the view are never culled.
+_CULL_MARGIN_PX: float = 128.0
+
 
 class Canvas:
     """Central mathematical visualization canvas coordinating all drawable objects and interactions.
@@ -113,6 +119,15 @@ class Canvas:
         self.dragging: bool = False
         self.draw_enabled: bool = draw_enabled
 
+        # Draw scheduling: draw() calls made while deferred only mark the canvas dirty
+        self._draw_deferral_depth: int = 0
+        self._draw_pending: bool = False
+        self._pending_apply_zoom: bool = False
+        self._animation_frame_requested: bool = False
+
+        # Drawables rendered by the last culled frame, keyed by id
+        self._culled_visible: Dict[int, "Drawable"] = {}
+
         # Initialize coordinate system and managers
         self.cartesian2axis: Cartesian2Axis = Cartesian2Axis(self.coordinate_mapper)
 
@@ -210,8 +225,89 @@ class Canvas:
             pass
 
     def draw(self, apply_zoom: bool = False) -> None:
+        """Redraw the canvas now, or mark it dirty while draws are deferred."""
         if not self.draw_enabled:
             return
+        self._record_draw_request()
+        if self._draw_deferral_depth > 0:
+            self._mark_draw_pending(apply_zoom)
+            return
+        self._draw_now(apply_zoom)
+
+    def request_draw(self, apply_zoom: bool = False) -> None:
+        """Mark the canvas dirty and redraw once on the next animation frame.
+
+        Any number of requests before that frame collapse into a single draw.
+        Falls back to a synchronous draw where animation frames are unavailable.
+        """
+        if not self.draw_enabled:
+            return
+        self._record_draw_request()
+        self._mark_draw_pending(apply_zoom)
+        if self._draw_deferral_depth > 0 or self._animation_frame_requested:
+            return
+        self._animation_frame_requested = True
+        try:
+            window.requestAnimationFrame(self._on_animation_frame)
+        except Exception:
+            self._on_animation_frame()
+
+    def _on_animation_frame(self, _timestamp: Any = None) -> None:
+        self._animation_frame_requested = False
+        if self._draw_deferral_depth > 0:
+            return
+        try:
+            self.flush_draw()
+        except Exception:
+            pass
+
+    def flush_draw(self) -> bool:
+        """Synchronously perform a pending draw, if any. Returns True when a draw ran."""
+        if not self._draw_pending:
+            return False
+        apply_zoom = self._pending_apply_zoom
+        self._draw_pending = False
+        self._pending_apply_zoom = False
+        if not self.draw_enabled:
+            return False
+        self._draw_now(apply_zoom)
+        return True
+
+    def begin_deferred_draws(self) -> None:
+        """Start a batch during which draw() only marks the canvas dirty.
+
+        Calls nest; pair each with end_deferred_draws() in a finally block.
+        """
+        self._draw_deferral_depth += 1
+
+    def end_deferred_draws(self) -> None:
+        """End a deferred batch; the outermost end flushes one pending draw synchronously."""
+        if self._draw_deferral_depth <= 0:
+            return
+        self._draw_deferral_depth -= 1
+        if self._draw_deferral_depth == 0:
+            self.flush_draw()
+
+    def is_drawing_deferred(self) -> bool:
+        return self._draw_deferral_depth > 0
+
+    def _mark_draw_pending(self, apply_zoom: bool) -> None:
+        self._draw_pending = True
+        # A zoom draw invalidates zoom caches, which a plain draw does not, so it wins
+        self._pending_apply_zoom = self._pending_apply_zoom or apply_zoom
+
+    def _record_draw_request(self) -> None:
+        record = getattr(self.renderer, "record_draw_request", None) if self.renderer is not None else None
+        if callable(record):
+            try:
+                record()
+            except Exception:
+                pass
+
+    def _draw_now(self, apply_zoom: bool) -> None:
+        # A synchronous draw satisfies any pending request
+        self._draw_pending = False
+        self._pending_apply_zoom = False
         renderer = self.renderer
         renderer_end = self._begin_renderer_frame(renderer)
 
@@ -278,11 +374,38 @@ class Canvas:
             renderer.render_polar(self.coordinate_system_manager.polar_grid, self.coordinate_mapper)
 
     def _render_drawables(self, renderer: Optional[RendererProtocol], apply_zoom: bool) -> None:
-        """Render all drawable objects with optional zoom cache invalidation."""
-        for drawable in self.drawable_manager.get_renderable_drawables():
+        """Render the drawables near the viewport with optional zoom cache invalidation.
+
+        Drawables whose math-space bounds lie entirely outside the viewport are skipped.
+        Drawables that just left the viewport are rendered once more so retained-mode
+        renderers can hide their elements.
+        """
+        drawables = self._get_viewport_drawables()
+        visible: Dict[int, "Drawable"] = {id(drawable): drawable for drawable in drawables}
+        container = self.drawable_manager.drawables
+        for drawable_id, drawable in self._culled_visible.items():
+            if drawable_id not in visible and container.is_current_renderable(drawable):
+                self._invalidate_drawable_zoom_cache(drawable, apply_zoom)
+                self._render_drawable_with_renderer(renderer, drawable)
+        self._culled_visible = visible
+        for drawable in drawables:
             self._invalidate_drawable_zoom_cache(drawable, apply_zoom)
             self._render_drawable_with_renderer(renderer, drawable)
 
+    def _get_viewport_drawables(self) -> List["Drawable"]:
+        """Return renderable drawables that may overlap the viewport plus the cull margin."""
+        try:
+            mapper = self.coordinate_mapper
+            margin = _CULL_MARGIN_PX
+            x1, y1 = mapper.screen_to_math(-margin, -margin)
+            x2, y2 = mapper.screen_to_math(mapper.canvas_width + margin, mapper.canvas_height + margin)
+            drawables: List["Drawable"] = self.drawable_manager.get_renderable_drawables_in_bounds(
+                min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2)
+            )
+        except Exception:
+            drawables = self.drawable_manager.get_renderable_drawables()
+        return drawables
+
     def _invalidate_drawable_zoom_cache(self, drawable: Any, apply_zoom: bool) -> None:
         if apply_zoom and hasattr(drawable, "_invalidate_cache_on_zoom"):
             drawable._invalidate_cache_on_zoom()
@@ -123,8 +123,7 @@ class CanvasEventHandler:
         self.touch_start_positions: List[Any] = []
         self.initial_pinch_distance: Optional[float] = None
         self.last_pinch_distance: Optional[float] = None
-        # Zoom draw scheduling (wheel + pinch): avoid blocking by drawing at most once per frame
-        self._zoom_draw_scheduled: bool = False
+        # Zoom settle scheduling (wheel + pinch); per-frame zoom draws go through Canvas.request_draw
         self._zoom_settle_timeout_id: Optional[Any] = None
         self.bind_events()
 
@@ -181,20 +180,10 @@ class CanvasEventHandler:
         This prevents multiple synchronous full redraws per wheel/touch event burst which can
         block the UI thread when many labels become visible again during zoom-in.
         """
-        if not self._zoom_draw_scheduled:
-            self._zoom_draw_scheduled = True
-
-            def _raf_callback(_ts: Any = None) -> None:
-                self._zoom_draw_scheduled = False
-                try:
-                    self.canvas.draw(True)
-                except Exception:
-                    pass
-
-            try:
-                window.requestAnimationFrame(_raf_callback)
-            except Exception:
-                _raf_callback()
+        try:
+            self.canvas.request_draw(True)
+        except Exception:
+            pass
 
         # Debounce a final full-detail draw after zoom events stop.
         timeout_id = self._zoom_settle_timeout_id
@@ -432,7 +421,7 @@ class CanvasEventHandler:
                 offset: Position = self._calculate_drag_offset()
                 self._apply_offset_to_canvas(offset)
                 self._update_last_mouse_position()
-                self.canvas.draw(False)
+                self.canvas.request_draw(False)
         except Exception as e:
             print(f"Error updating canvas position: {str(e)}")
 
@@ -0,0 +1,154 @@
+"""Dependency graph benchmark on long midpoint/bisector construction chains."""
+
+from __future__ import annotations
+
+import sys
+import time
+import unittest
+from typing import Any, Callable, Dict, List, Set
+
+from canvas import Canvas
+from drawables.point import Point
+from drawables.segment import Segment
+
+
+# Each step adds a segment, its midpoint, and a bisector through the midpoint,
+# so the chain depth is twice the step count
+CHAIN_SCENE: Dict[str, Any] = {
+    "steps": 600,
+    "queries": 100,
+}
+
+
+def _build_construction_chain(canvas: Canvas, steps: int) -> List[Point]:
+    # Construct drawables directly so setup cost does not dominate the benchmark
+    drawables = canvas.drawable_manager.drawables
+    dependency_manager = canvas.dependency_manager
+    current = Point(0.0, 0.0, name="A")
+    drawables.add(current)
+    chain: List[Point] = [current]
+    for index in range(steps):
+        # Fresh coordinates every step keep value-hashed drawables distinct
+        endpoint = Point(current.x + 2.0, current.y + 1.0, name=f"B{index}")
+        segment = Segment(current, endpoint)
+        drawables.add(endpoint)
+        drawables.add(segment)
+        dependency_manager.analyze_drawable_for_dependencies(segment)
+
+        midpoint = Point(current.x + 1.0, current.y + 0.5, name=f"M{index}")
+        tip = Point(midpoint.x - 1.0, midpoint.y + 2.0, name=f"T{index}")
+        bisector = Segment(midpoint, tip)
+        for drawable in (midpoint, tip, bisector):
+            drawables.add(drawable)
+        dependency_manager.register_dependency(child=midpoint, parent=segment)
+        dependency_manager.register_dependency(child=tip, parent=segment)
+        dependency_manager.analyze_drawable_for_dependencies(bisector)
+
+        current = midpoint
+        chain.append(midpoint)
+    canvas.undo_redo_manager.clear()
+    return chain
+
+
+def _legacy_closure(drawable: Any, step: Callable[[Any], Set[Any]]) -> Set[Any]:
+    # Uncached traversal, as get_all_children/get_all_parents did before caching
+    result: Set[Any] = set()
+    to_process = set(step(drawable))
+    while to_process:
+        node = to_process.pop()
+        if node not in result:
+            result.add(node)
+            to_process.update(step(node))
+    return result
+
+
+def _time_ms(operation: Callable[[], Any], iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        operation()
+    return (time.perf_counter() - start) * 1000 / max(iterations, 1)
+
+
+def run_dependency_graph_performance(
+    *, scene_spec: Dict[str, Any] | None = None, iterations: int = 3
+) -> Dict[str, Any]:
+    """Time closure queries, topological ordering, and undo refresh on a deep chain."""
+    spec: Dict[str, Any] = {**CHAIN_SCENE, **(scene_spec or {})}
+    canvas = Canvas(500, 500, draw_enabled=False)
+    chain = _build_construction_chain(canvas, spec["steps"])
+    dependency_manager = canvas.dependency_manager
+    undo_manager = canvas.undo_redo_manager
+    stride = max(1, len(chain) // spec["queries"])
+    sample = chain[::stride]
+
+    def legacy_queries() -> None:
+        for point in sample:
+            _legacy_closure(point, dependency_manager.get_children)
+            _legacy_closure(point, dependency_manager.get_parents)
+
+    def cached_queries() -> None:
+        for point in sample:
+            dependency_manager.get_all_children(point)
+            dependency_manager.get_all_parents(point)
+
+    legacy_query_ms = _time_ms(legacy_queries, iterations)
+    cached_query_ms = _time_ms(cached_queries, iterations)
+
+    everything = canvas.drawable_manager.drawables.get_all()
+    order_start = time.perf_counter()
+    ordered = dependency_manager.resolve_dependency_order(list(reversed(everything)))
+    order_ms = (time.perf_counter() - order_start) * 1000
+    positions = {id(drawable): index for index, drawable in enumerate(ordered)}
+    order_valid = len(positions) == len(everything) and all(
+        positions[id(parent)] < positions[id(drawable)]
+        for drawable in ordered
+        for parent in dependency_manager.get_parents(drawable)
+    )
+
+    # Undo/redo of a single move: incremental refresh vs the former full dependency rebuild
+    target = chain[-1]
+    undo_manager.archive()
+    undo_manager.clear()
+    for _ in range(iterations):
+        undo_manager.archive()
+        target.update_position(target.x + 1.0, target.y)
+    undo_manager.archive()
+
+    def undo_redo() -> None:
+        undo_manager.undo()
+        undo_manager.redo()
+
+    refresh_ms = _time_ms(undo_redo, iterations)
+    incremental_refresh = undo_manager._refresh_dependency_graph
+    undo_manager._refresh_dependency_graph = lambda touched: undo_manager._rebuild_dependency_graph()
+    try:
+        rebuild_ms = _time_ms(undo_redo, iterations)
+    finally:
+        undo_manager._refresh_dependency_graph = incremental_refresh
+
+    return {
+        "drawables": len(everything),
+        "depth": len(chain),
+        "iterations": iterations,
+        "recursion_limit": sys.getrecursionlimit(),
+        "order_valid": order_valid,
+        "queries": {"legacy_ms": legacy_query_ms, "cached_ms": cached_query_ms},
+        "order_ms": order_ms,
+        "undo_redo": {"refresh_ms": refresh_ms, "rebuild_ms": rebuild_ms},
+    }
+
+
+class TestDependencyGraphPerformance(unittest.TestCase):
+    """Dependency graph benchmark executed via the client test suite."""
+
+    def test_dependency_graph_performance(self) -> None:
+        result = run_dependency_graph_performance(iterations=3)
+        print(f"[DependencyGraphPerformance] {result}")
+
+        # The chain is deeper than the recursion limit the old recursive sort ran into
+        self.assertGreater(2 * (result["depth"] - 1), result["recursion_limit"])
+        self.assertTrue(result["order_valid"])
+        queries = result["queries"]
+        self.assertLess(queries["cached_ms"], queries["legacy_ms"])
+        undo_redo = result["undo_redo"]
+        self.assertLess(undo_redo["refresh_ms"], undo_redo["rebuild_ms"])
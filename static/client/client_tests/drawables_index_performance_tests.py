@@ -0,0 +1,108 @@
+"""DrawablesContainer lookup benchmark comparing linear scans with the maintained indexes."""
+
+from __future__ import annotations
+
+import random
+import time
+import unittest
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from drawables.point import Point
+from drawables.segment import Segment
+from managers.drawables_container import DrawablesContainer
+from utils.math_utils import MathUtils
+
+
+# Scene sizes to sweep; each scene has one segment per two points
+INDEX_SCENE_SIZES: Sequence[int] = (100, 1000, 5000)
+
+
+def _build_container(point_count: int, seed: int = 11) -> DrawablesContainer:
+    rng = random.Random(seed)
+    container = DrawablesContainer()
+    points: List[Point] = []
+    for index in range(point_count):
+        point = Point(rng.uniform(-500, 500), rng.uniform(-500, 500), name=f"P{index}")
+        container.add(point)
+        points.append(point)
+    for index in range(0, point_count - 1, 2):
+        container.add(Segment(points[index], points[index + 1]))
+    return container
+
+
+def _scan_point(container: DrawablesContainer, x: float, y: float) -> Optional[Any]:
+    for point in container.Points:
+        if MathUtils.point_matches_coordinates(point, x, y):
+            return point
+    return None
+
+
+def _scan_name(container: DrawablesContainer, name: str) -> Optional[Any]:
+    for point in container.Points:
+        if point.name == name:
+            return point
+    return None
+
+
+def _scan_segment(container: DrawablesContainer, x1: float, y1: float, x2: float, y2: float) -> Optional[Any]:
+    for segment in container.Segments:
+        if MathUtils.segment_matches_coordinates(segment, x1, y1, x2, y2):
+            return segment
+    return None
+
+
+def _time_us(operation: Callable[[Any], Any], queries: List[Any]) -> float:
+    start = time.perf_counter()
+    for query in queries:
+        operation(query)
+    return (time.perf_counter() - start) * 1_000_000 / max(len(queries), 1)
+
+
+def run_drawables_index_performance(
+    *, sizes: Sequence[int] = INDEX_SCENE_SIZES, queries: int = 200
+) -> Dict[int, Dict[str, float]]:
+    """Return mean microseconds per lookup for scan and index paths at each scene size."""
+    results: Dict[int, Dict[str, float]] = {}
+    for size in sizes:
+        container = _build_container(size)
+        rng = random.Random(size)
+        points = list(container.Points)
+        segments = list(container.Segments)
+        # Half hits, half misses: misses are what create_* calls pay before adding
+        point_queries = [
+            (p.x, p.y) if i % 2 == 0 else (p.x + 1.0, p.y)
+            for i, p in enumerate(rng.choice(points) for _ in range(queries))
+        ]
+        name_queries = [f"P{rng.randrange(size * 2)}" for _ in range(queries)]
+        segment_queries = [
+            (s.point1.x, s.point1.y, s.point2.x, s.point2.y) for s in (rng.choice(segments) for _ in range(queries))
+        ]
+        # Warm the lazily built indexes so the timings show steady-state lookups
+        container.get_point_at(0.0, 0.0)
+        container.get_by_name("")
+        results[size] = {
+            "scan_point_us": _time_us(lambda q: _scan_point(container, *q), point_queries),
+            "index_point_us": _time_us(lambda q: container.get_point_at(*q), point_queries),
+            "scan_name_us": _time_us(lambda q: _scan_name(container, q), name_queries),
+            "index_name_us": _time_us(lambda q: container.get_by_name(q, ("Point",)), name_queries),
+            "scan_segment_us": _time_us(lambda q: _scan_segment(container, *q), segment_queries),
+            "index_segment_us": _time_us(lambda q: container.get_segment_at(*q), segment_queries),
+        }
+    return results
+
+
+class TestDrawablesIndexPerformance(unittest.TestCase):
+    """Drawables index benchmark executed via the client test suite."""
+
+    def test_drawables_index_performance(self) -> None:
+        results = run_drawables_index_performance(queries=100)
+        for size, timings in results.items():
+            print(f"[DrawablesIndexPerformance] n={size} " + " ".join(f"{k}={v:.1f}" for k, v in timings.items()))
+
+        largest = results[max(results)]
+        smallest = results[min(results)]
+        self.assertLess(largest["index_point_us"], largest["scan_point_us"])
+        self.assertLess(largest["index_name_us"], largest["scan_name_us"])
+        self.assertLess(largest["index_segment_us"], largest["scan_segment_us"])
+        # Indexed lookups stay roughly flat while the scene grows 50x
+        self.assertLess(largest["index_point_us"], smallest["index_point_us"] * 10 + 50)
@@ -0,0 +1,84 @@
+"""Force-directed layout benchmark comparing exact repulsion with the Barnes-Hut approximation."""
+
+from __future__ import annotations
+
+import math
+import random
+import time
+import unittest
+from typing import Dict, List, Sequence, Tuple
+
+from utils.graph_layout import DEFAULT_BARNES_HUT_THETA, _force_directed_layout
+from utils.graph_utils import Edge
+
+
+# Vertex counts to sweep; each graph has 1.5 edges per vertex
+FORCE_LAYOUT_SIZES: Sequence[int] = (50, 200, 1000)
+FORCE_LAYOUT_BOX: Dict[str, float] = {"x": 0.0, "y": 0.0, "width": 1000.0, "height": 800.0}
+
+
+def _random_graph(vertex_count: int, seed: int = 5) -> Tuple[List[str], List[Edge[str]]]:
+    rng = random.Random(seed)
+    vertex_ids = [f"v{i}" for i in range(vertex_count)]
+    edges: List[Edge[str]] = []
+    # A spanning path keeps the graph connected; the rest are random chords
+    for i in range(1, vertex_count):
+        edges.append(Edge(vertex_ids[rng.randrange(i)], vertex_ids[i]))
+    for _ in range(vertex_count // 2):
+        a, b = rng.sample(vertex_ids, 2)
+        edges.append(Edge(a, b))
+    return vertex_ids, edges
+
+
+def _mean_edge_length(edges: List[Edge[str]], positions: Dict[str, Tuple[float, float]]) -> float:
+    total = 0.0
+    for edge in edges:
+        x1, y1 = positions[edge.source]
+        x2, y2 = positions[edge.target]
+        total += math.hypot(x2 - x1, y2 - y1)
+    return total / max(len(edges), 1)
+
+
+def run_graph_layout_performance(
+    *,
+    sizes: Sequence[int] = FORCE_LAYOUT_SIZES,
+    iterations: int = 100,
+    theta: float = DEFAULT_BARNES_HUT_THETA,
+) -> Dict[int, Dict[str, float]]:
+    """Return layout milliseconds and mean edge length for exact and Barnes-Hut modes at each size."""
+    results: Dict[int, Dict[str, float]] = {}
+    for size in sizes:
+        vertex_ids, edges = _random_graph(size)
+
+        start = time.perf_counter()
+        exact = _force_directed_layout(vertex_ids, edges, FORCE_LAYOUT_BOX, iterations, theta=0.0)
+        exact_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        approx = _force_directed_layout(vertex_ids, edges, FORCE_LAYOUT_BOX, iterations, theta=theta)
+        approx_ms = (time.perf_counter() - start) * 1000
+
+        results[size] = {
+            "exact_ms": exact_ms,
+            "barnes_hut_ms": approx_ms,
+            "exact_edge_length": _mean_edge_length(edges, exact),
+            "barnes_hut_edge_length": _mean_edge_length(edges, approx),
+        }
+    return results
+
+
+class TestGraphLayoutPerformance(unittest.TestCase):
+    """Force-directed layout benchmark executed via the client test suite."""
+
+    def test_force_layout_performance(self) -> None:
+        results = run_graph_layout_performance(sizes=(50, 400), iterations=40)
+        for size, metrics in results.items():
+            print(f"[GraphLayoutPerformance] n={size} " + " ".join(f"{k}={v:.1f}" for k, v in metrics.items()))
+
+        largest = results[max(results)]
+        self.assertLess(largest["barnes_hut_ms"], largest["exact_ms"])
+        # The approximation should settle at a comparable scale, not a different layout regime
+        for metrics in results.values():
+            ratio = metrics["barnes_hut_edge_length"] / metrics["exact_edge_length"]
+            self.assertGreater(ratio, 0.7)
+            self.assertLess(ratio, 1.4)
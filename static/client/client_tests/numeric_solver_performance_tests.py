@@ -0,0 +1,170 @@
+"""Numeric solver benchmark: math.js evaluations per solve before and after compiling the system."""
+
+from __future__ import annotations
+
+import math
+import time
+import unittest
+from typing import Any, Dict, List, Optional, Sequence
+
+from browser import window
+
+from numeric_solver.compiled_system import CompiledSystem
+from numeric_solver.expression_utils import equation_to_residual
+from numeric_solver.linear_algebra import solve_linear_system_gaussian
+from numeric_solver.newton_raphson import ARMIJO_C, ARMIJO_RHO, DIVERGENCE_THRESHOLD, MAX_BACKTRACKS
+from numeric_solver.solver import solve_numeric
+from numeric_solver.utils import deduplicate_solutions, generate_initial_guesses
+
+
+NUMERIC_SOLVER_SYSTEMS: Dict[str, Dict[str, Any]] = {
+    "2var_circle_line": {"equations": ["x^2 + y^2 = 25", "y = x + 1"], "variables": ["x", "y"]},
+    "2var_transcendental": {"equations": ["sin(x) + y = 1", "x^2 + y^2 = 4"], "variables": ["x", "y"]},
+    "3var_symmetric": {
+        # Six simple roots: the permutations of (1, 2, 3)
+        "equations": ["x^2 + y^2 + z^2 = 14", "x + y + z = 6", "x*y*z = 6"],
+        "variables": ["x", "y", "z"],
+    },
+}
+
+
+class _LegacyCounter:
+    """Re-creates the pre-compilation solve: raw-string math.evaluate and per-entry differences."""
+
+    def __init__(self, residual_exprs: Sequence[str], variables: Sequence[str]) -> None:
+        self.residual_exprs = list(residual_exprs)
+        self.variables = list(variables)
+        self.expression_evaluations = 0
+
+    def evaluate(self, values: Sequence[float]) -> Optional[List[float]]:
+        scope = {var: val for var, val in zip(self.variables, values)}
+        residuals: List[float] = []
+        for expr in self.residual_exprs:
+            self.expression_evaluations += 1
+            try:
+                value = float(window.math.evaluate(expr, scope))
+            except Exception:
+                return None
+            if not math.isfinite(value):
+                return None
+            residuals.append(value)
+        return residuals
+
+    def jacobian(self, values: Sequence[float], h: float = 1e-7) -> Optional[List[List[float]]]:
+        rows: List[List[float]] = []
+        for i in range(len(self.residual_exprs)):
+            row: List[float] = []
+            for j in range(len(self.variables)):
+                plus = list(values)
+                plus[j] += h
+                minus = list(values)
+                minus[j] -= h
+                f_plus = self.evaluate(plus)
+                f_minus = self.evaluate(minus)
+                if f_plus is None or f_minus is None:
+                    return None
+                row.append((f_plus[i] - f_minus[i]) / (2 * h))
+            rows.append(row)
+        return rows
+
+    def newton(self, x0: Sequence[float], tolerance: float, max_iterations: int) -> Optional[List[float]]:
+        x = list(x0)
+        for _ in range(max_iterations):
+            F = self.evaluate(x)
+            if F is None:
+                return None
+            if max(abs(f) for f in F) < tolerance:
+                return x
+            if any(abs(xi) > DIVERGENCE_THRESHOLD for xi in x):
+                return None
+            J = self.jacobian(x)
+            if J is None:
+                return None
+            delta = solve_linear_system_gaussian(J, [-f for f in F])
+            if delta is None:
+                return None
+            alpha = 1.0
+            F_norm_sq = sum(f * f for f in F)
+            for _ in range(MAX_BACKTRACKS):
+                x_new = [x[i] + alpha * delta[i] for i in range(len(x))]
+                F_new = self.evaluate(x_new)
+                if F_new is not None and sum(f * f for f in F_new) <= (1 - 2 * ARMIJO_C * alpha) * F_norm_sq:
+                    x = x_new
+                    break
+                alpha *= ARMIJO_RHO
+            else:
+                x = [x[i] + delta[i] for i in range(len(x))]
+        F = self.evaluate(x)
+        if F is not None and max(abs(f) for f in F) < tolerance * 100:
+            return x
+        return None
+
+
+def _legacy_solve(equations: Sequence[str], variables: Sequence[str], tolerance: float = 1e-10) -> Dict[str, Any]:
+    legacy = _LegacyCounter([equation_to_residual(eq) for eq in equations], variables)
+    found: List[List[float]] = []
+    for guess in generate_initial_guesses(len(variables)):
+        solution = legacy.newton(guess, tolerance, 50)
+        if solution is not None:
+            residuals = legacy.evaluate(solution)
+            if residuals is not None and all(abs(r) < tolerance * 10 for r in residuals):
+                found.append(solution)
+    return {
+        "solutions": deduplicate_solutions(found, variables),
+        "expression_evaluations": legacy.expression_evaluations,
+    }
+
+
+def _compiled_evaluation_count(equations: Sequence[str], variables: Sequence[str]) -> int:
+    # solve_numeric builds its own CompiledSystem; count by wrapping the class methods
+    counts = {"evaluations": 0}
+    original_node_eval = CompiledSystem._evaluate_node
+
+    def counting_node_eval(self: CompiledSystem, node: Any, scope: Dict[str, float]) -> Optional[float]:
+        counts["evaluations"] += 1
+        return original_node_eval(self, node, scope)
+
+    CompiledSystem._evaluate_node = counting_node_eval  # type: ignore[method-assign]
+    try:
+        solve_numeric(list(equations), list(variables))
+    finally:
+        CompiledSystem._evaluate_node = original_node_eval  # type: ignore[method-assign]
+    return counts["evaluations"]
+
+
+def run_numeric_solver_performance(
+    systems: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """Return evaluations and wall time per solve for the legacy and compiled solvers."""
+    import json
+
+    results: Dict[str, Dict[str, Any]] = {}
+    for name, spec in (systems or NUMERIC_SOLVER_SYSTEMS).items():
+        equations, variables = spec["equations"], spec["variables"]
+        start = time.perf_counter()
+        legacy = _legacy_solve(equations, variables)
+        legacy_ms = (time.perf_counter() - start) * 1000
+        start = time.perf_counter()
+        compiled_solutions = json.loads(solve_numeric(list(equations), list(variables)))["solutions"]
+        compiled_ms = (time.perf_counter() - start) * 1000
+        results[name] = {
+            "variables": len(variables),
+            "legacy_evaluations": legacy["expression_evaluations"],
+            "compiled_evaluations": _compiled_evaluation_count(equations, variables),
+            "legacy_ms": legacy_ms,
+            "compiled_ms": compiled_ms,
+            "legacy_solutions": len(legacy["solutions"]),
+            "compiled_solutions": len(compiled_solutions),
+        }
+    return results
+
+
+class TestNumericSolverPerformance(unittest.TestCase):
+    """Numeric solver benchmark executed via the client test suite."""
+
+    def test_numeric_solver_performance(self) -> None:
+        results = run_numeric_solver_performance()
+        for name, result in results.items():
+            print(f"[NumericSolverPerformance] {name}: {result}")
+            self.assertEqual(result["compiled_solutions"], result["legacy_solutions"])
+            self.assertLess(result["compiled_evaluations"], result["legacy_evaluations"])
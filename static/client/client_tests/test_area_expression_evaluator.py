@@ -1700,3 +1700,53 @@ class TestRegionGeneration(unittest.TestCase):
             y = cy + radius * math.sin(angle)
             vertices.append((x, y))
         return vertices
+
+
+# =============================================================================
+# Exact Boolean Tests
+# =============================================================================
+
+
+class TestExactBooleanOperations(unittest.TestCase):
+    """Test exact polygon booleans on concave operands and region memoization."""
+
+    def setUp(self) -> None:
+        self.canvas = MockCanvas()
+
+    def test_concave_intersection_then_difference(self) -> None:
+        # U-shape: 3x3 square with a 1x2 notch cut from the top middle (area 7)
+        u_shape = MockGenericPolygon([(0, 0), (3, 0), (3, 3), (2, 3), (2, 1), (1, 1), (1, 3), (0, 3)], "U")
+        band = MockRectangle([(0, 2), (3, 2), (3, 4), (0, 4)], "band")
+        cutter = MockRectangle([(2.5, 0), (4, 0), (4, 4), (2.5, 4)], "cut")
+        self.canvas.drawable_manager.add_drawable("U", u_shape)
+        self.canvas.drawable_manager.add_drawable("band", band)
+        self.canvas.drawable_manager.add_drawable("cut", cutter)
+        # (U & band) keeps both prongs (2 x 1x1); the cutter removes half of the right prong
+        result = AreaExpressionEvaluator.evaluate("(U & band) - cut", self.canvas)
+        self.assertIsNone(result.error)
+        self.assertAlmostEqual(result.area, 1.5, places=9)
+
+    def test_concave_union_fills_notch_exactly(self) -> None:
+        u_shape = MockGenericPolygon([(0, 0), (3, 0), (3, 3), (2, 3), (2, 1), (1, 1), (1, 3), (0, 3)], "U")
+        plug = MockRectangle([(1, 1), (2, 1), (2, 3), (1, 3)], "plug")
+        self.canvas.drawable_manager.add_drawable("U", u_shape)
+        self.canvas.drawable_manager.add_drawable("plug", plug)
+        result = AreaExpressionEvaluator.evaluate("U | plug", self.canvas)
+        self.assertIsNone(result.error)
+        self.assertAlmostEqual(result.area, 9.0, places=9)
+
+    def test_region_reused_until_render_version_changes(self) -> None:
+        circle = MockCircle(0, 0, 2, "C")
+        version = [1]
+        circle.get_render_version = lambda: version[0]
+        self.canvas.drawable_manager.add_drawable("C", circle)
+
+        first = AreaExpressionEvaluator._cached_region_with_source(circle)
+        self.assertIs(AreaExpressionEvaluator._cached_region_with_source(circle), first)
+
+        circle.radius = 3
+        version[0] = 2
+        rebuilt = AreaExpressionEvaluator._cached_region_with_source(circle)
+        self.assertIsNot(rebuilt, first)
+        result = AreaExpressionEvaluator.evaluate("C", self.canvas)
+        self.assertAlmostEqual(result.area, math.pi * 9, places=5)
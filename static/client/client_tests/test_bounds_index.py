@@ -0,0 +1,119 @@
+import unittest
+
+import utils.bounds_index as bounds_index_module
+
+from drawables.circle import Circle
+from drawables.drawable import change_log_position, changed_since
+from drawables.point import Point
+from drawables.segment import Segment
+from utils.bounds_index import BoundsIndex, drawable_math_bounds
+from .simple_mock import SimpleMock
+
+
+class TestBoundsIndex(unittest.TestCase):
+    """Window queries must agree with a brute-force overlap test."""
+
+    def setUp(self) -> None:
+        self.index = BoundsIndex()
+        self.points = [Point(float(x), float(y), name=f"P{x}_{y}") for x in range(-20, 21, 4) for y in range(-20, 21, 4)]
+        for point in self.points:
+            self.index.add(point)
+
+    def _brute_force(self, min_x: float, min_y: float, max_x: float, max_y: float) -> set:
+        return {
+            id(point) for point in self.points if min_x <= point.x <= max_x and min_y <= point.y <= max_y
+        }
+
+    def test_query_matches_brute_force(self) -> None:
+        for window in ((-5.0, -5.0, 5.0, 5.0), (0.0, 0.0, 0.0, 0.0), (-100.0, -100.0, 100.0, 100.0), (50, 50, 60, 60)):
+            found = {id(drawable) for drawable in self.index.query(*window)}
+            self.assertEqual(found, self._brute_force(*window), window)
+
+    def test_moved_drawables_are_rebinned(self) -> None:
+        self.index.query(-1.0, -1.0, 1.0, 1.0)
+        point = self.points[0]
+        point.update_position(100.0, 100.0)
+        self.assertIn(point, self.index.query(99.0, 99.0, 101.0, 101.0))
+        self.assertNotIn(point, self.index.query(-21.0, -21.0, -19.0, -19.0))
+
+    def test_change_log_keeps_mutations_after_a_read(self) -> None:
+        circle = Circle(self.points[0], 1.0)
+        circle.radius = 2.0
+        position = change_log_position()
+        circle.radius = 3.0
+        self.assertEqual(changed_since(position), [id(circle)])
+
+    def test_repeated_resizes_of_one_drawable_are_all_seen(self) -> None:
+        circle = Circle(Point(100.0, 100.0, name="C"), 1.0)
+        self.index.add(circle)
+        circle.radius = 50.0
+        self.assertIn(circle, self.index.query(140.0, 100.0, 141.0, 101.0))
+        circle.radius = 500.0
+        self.assertIn(circle, self.index.query(590.0, 100.0, 591.0, 101.0))
+
+    def test_moving_an_endpoint_rebins_the_segment(self) -> None:
+        a = Point(0.0, 0.0, name="A")
+        b = Point(1.0, 1.0, name="B")
+        segment = Segment(a, b)
+        self.index.add(segment)
+        self.index.query(-1.0, -1.0, 1.0, 1.0)
+        b.update_position(200.0, 200.0)
+        self.assertIn(segment, self.index.query(150.0, 150.0, 160.0, 160.0))
+
+    def test_refresh_checks_only_changed_drawables(self) -> None:
+        self.index.query(-1.0, -1.0, 1.0, 1.0)
+        original = bounds_index_module._render_version
+        checked = []
+
+        def counting_render_version(drawable: object) -> object:
+            checked.append(drawable)
+            return original(drawable)
+
+        bounds_index_module._render_version = counting_render_version
+        try:
+            self.index.query(-1.0, -1.0, 1.0, 1.0)
+            self.assertEqual(checked, [])
+            self.points[3].update_position(0.5, 0.5)
+            self.assertIn(self.points[3], self.index.query(0.0, 0.0, 1.0, 1.0))
+        finally:
+            bounds_index_module._render_version = original
+        self.assertEqual({id(drawable) for drawable in checked}, {id(self.points[3])})
+
+    def test_segment_spanning_window_is_found(self) -> None:
+        a = Point(-1000.0, 0.0, name="A")
+        b = Point(1000.0, 0.0, name="B")
+        segment = Segment(a, b)
+        self.index.add(segment)
+        self.assertIn(segment, self.index.query(-1.0, -1.0, 1.0, 1.0))
+        self.assertNotIn(segment, self.index.query(-1.0, 5.0, 1.0, 6.0))
+
+    def test_removed_drawables_are_not_returned(self) -> None:
+        point = self.points[0]
+        self.index.remove(point)
+        self.assertNotIn(point, self.index.query(-100.0, -100.0, 100.0, 100.0))
+        self.assertEqual(len(self.index), len(self.points) - 1)
+
+    def test_unbounded_drawables_are_always_returned(self) -> None:
+        label_like = SimpleMock(get_class_name=SimpleMock(return_value="Label"))
+        self.index.add(label_like)
+        self.assertIn(label_like, self.index.query(500.0, 500.0, 501.0, 501.0))
+        self.index.remove(label_like)
+        self.assertNotIn(label_like, self.index.query(500.0, 500.0, 501.0, 501.0))
+
+    def test_circle_bounds_include_radius(self) -> None:
+        circle = Circle(Point(0.0, 0.0, name="O"), 5.0)
+        self.assertEqual(drawable_math_bounds(circle), (-5.0, -5.0, 5.0, 5.0))
+        self.index.add(circle)
+        self.assertIn(circle, self.index.query(4.0, 4.0, 6.0, 6.0))
+        self.assertNotIn(circle, self.index.query(6.0, 6.0, 7.0, 7.0))
+
+    def test_growth_past_initial_sizing_keeps_results(self) -> None:
+        self.index.query(0.0, 0.0, 1.0, 1.0)
+        extra = [Point(float(i) * 0.5, 0.25, name=f"E{i}") for i in range(1000)]
+        for point in extra:
+            self.index.add(point)
+        found = self.index.query(10.0, 0.0, 20.0, 1.0)
+        expected = [point for point in extra if 10.0 <= point.x <= 20.0]
+        for point in expected:
+            self.assertIn(point, found)
+        self.assertEqual(len([d for d in found if d in extra and not any(d is p for p in expected)]), 0)
@@ -6,12 +6,13 @@ from typing import Any, Dict, List, Optional, cast
 import re
 import math
 
+import canvas as canvas_module
 from canvas import Canvas
 from expression_validator import ExpressionValidator
 from utils.math_utils import MathUtils
 from utils.polygon_canonicalizer import canonicalize_rectangle
 from types import SimpleNamespace
-from drawables_aggregator import Position
+from drawables_aggregator import Point, Position, Segment
 from managers.polygon_type import PolygonType
 from .simple_mock import SimpleMock
 from utils.geometry_utils import GeometryUtils
@@ -3006,3 +3007,184 @@ class TestCanvasHelperMethods(unittest.TestCase):
         angles_after = self.canvas.get_drawables_by_class_name("Angle")
         self.assertEqual(len(angles_after), 0)
         self.assertNotIn(angle, angles_after)
+
+
+class _RecordingRenderer:
+    """Minimal renderer that counts frames and draw requests."""
+
+    def __init__(self) -> None:
+        self.frames = 0
+        self.draw_requests = 0
+        self.clears = 0
+
+    def clear(self) -> None:
+        self.clears += 1
+
+    def render(self, drawable: Any, coordinate_mapper: Any) -> bool:
+        return True
+
+    def render_cartesian(self, cartesian: Any, coordinate_mapper: Any) -> None:
+        pass
+
+    def render_polar(self, polar_grid: Any, coordinate_mapper: Any) -> None:
+        pass
+
+    def register(self, cls: type, handler: Any) -> None:
+        pass
+
+    def register_default_drawables(self) -> None:
+        pass
+
+    def begin_frame(self) -> None:
+        self.frames += 1
+
+    def end_frame(self) -> None:
+        pass
+
+    def record_draw_request(self) -> None:
+        self.draw_requests += 1
+
+
+class _CapturingRenderer(_RecordingRenderer):
+    """Recording renderer that also keeps the drawables rendered in each frame."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.rendered: List[Any] = []
+
+    def begin_frame(self) -> None:
+        super().begin_frame()
+        self.rendered = []
+
+    def render(self, drawable: Any, coordinate_mapper: Any) -> bool:
+        self.rendered.append(drawable)
+        return True
+
+
+class TestCanvasViewportCulling(unittest.TestCase):
+    def setUp(self) -> None:
+        self.renderer = _CapturingRenderer()
+        self.canvas = Canvas(500, 500, draw_enabled=True, renderer=cast(Any, self.renderer))
+        self.drawables = self.canvas.drawable_manager.drawables
+        self.near = Point(10.0, 10.0, name="A")
+        self.far = Point(5000.0, 5000.0, name="B")
+        self.bridge = Segment(Point(-5000.0, 0.0, name="C"), Point(5000.0, 1.0, name="D"))
+        for drawable in (self.near, self.far, self.bridge):
+            self.drawables.add(drawable)
+
+    def test_offscreen_drawables_are_skipped(self) -> None:
+        self.canvas.draw()
+        self.assertIn(self.near, self.renderer.rendered)
+        self.assertIn(self.bridge, self.renderer.rendered)
+        self.assertNotIn(self.far, self.renderer.rendered)
+
+    def test_pan_brings_drawables_into_view(self) -> None:
+        self.canvas.draw()
+        self.canvas.coordinate_mapper.set_visible_bounds(4900.0, 5100.0, 5100.0, 4900.0)
+        self.canvas.draw()
+        self.assertIn(self.far, self.renderer.rendered)
+        self.assertNotIn(self.near, self.renderer.rendered[1:])
+
+    def test_drawable_leaving_view_is_rendered_once_more(self) -> None:
+        self.canvas.draw()
+        self.near.update_position(9000.0, 9000.0)
+        self.canvas.draw()
+        self.assertEqual(self.renderer.rendered.count(self.near), 1)
+        self.canvas.draw()
+        self.assertNotIn(self.near, self.renderer.rendered)
+
+    def test_removed_drawable_is_not_rendered(self) -> None:
+        self.canvas.draw()
+        self.drawables.remove(self.near)
+        self.canvas.draw()
+        self.assertNotIn(self.near, self.renderer.rendered)
+
+    def test_order_matches_unculled_layering(self) -> None:
+        self.canvas.coordinate_mapper.set_visible_bounds(-6000.0, 6000.0, 6000.0, -6000.0)
+        self.canvas.draw()
+        self.assertEqual(self.renderer.rendered, self.canvas.drawable_manager.get_renderable_drawables())
+
+
+class TestCanvasDrawScheduling(unittest.TestCase):
+    def setUp(self) -> None:
+        self.renderer = _RecordingRenderer()
+        self.canvas = Canvas(500, 500, draw_enabled=True, renderer=cast(Any, self.renderer))
+        self.frame_callbacks: List[Any] = []
+        self._original_window = canvas_module.window
+        canvas_module.window = SimpleNamespace(requestAnimationFrame=self.frame_callbacks.append)
+
+    def tearDown(self) -> None:
+        canvas_module.window = self._original_window
+
+    def test_draw_is_synchronous_by_default(self) -> None:
+        self.canvas.draw()
+        self.canvas.draw()
+        self.assertEqual(self.renderer.frames, 2)
+        self.assertEqual(self.renderer.draw_requests, 2)
+
+    def test_deferred_draws_flush_once(self) -> None:
+        self.canvas.begin_deferred_draws()
+        for _ in range(30):
+            self.canvas.draw()
+        self.assertEqual(self.renderer.frames, 0)
+        self.assertTrue(self.canvas.is_drawing_deferred())
+        self.canvas.end_deferred_draws()
+
+        self.assertEqual(self.renderer.frames, 1)
+        self.assertEqual(self.renderer.draw_requests, 30)
+        self.assertFalse(self.canvas.is_drawing_deferred())
+
+    def test_nested_deferral_flushes_at_outermost_end(self) -> None:
+        self.canvas.begin_deferred_draws()
+        self.canvas.begin_deferred_draws()
+        self.canvas.draw()
+        self.canvas.end_deferred_draws()
+        self.assertEqual(self.renderer.frames, 0)
+        self.canvas.end_deferred_draws()
+        self.assertEqual(self.renderer.frames, 1)
+
+    def test_deferral_without_draws_does_not_render(self) -> None:
+        self.canvas.begin_deferred_draws()
+        self.canvas.end_deferred_draws()
+        self.assertEqual(self.renderer.frames, 0)
+
+    def test_deferred_zoom_request_is_kept(self) -> None:
+        zoom_flags: List[bool] = []
+        self.canvas._draw_now = lambda apply_zoom: zoom_flags.append(apply_zoom)
+        self.canvas.begin_deferred_draws()
+        self.canvas.draw(True)
+        self.canvas.draw(False)
+        self.canvas.end_deferred_draws()
+        self.assertEqual(zoom_flags, [True])
+
+    def test_request_draw_coalesces_until_animation_frame(self) -> None:
+        for _ in range(5):
+            self.canvas.request_draw()
+        self.assertEqual(len(self.frame_callbacks), 1)
+        self.assertEqual(self.renderer.frames, 0)
+
+        self.frame_callbacks[0](0.0)
+        self.assertEqual(self.renderer.frames, 1)
+        self.assertEqual(self.renderer.draw_requests, 5)
+
+        self.canvas.request_draw()
+        self.assertEqual(len(self.frame_callbacks), 2)
+
+    def test_synchronous_draw_satisfies_pending_frame_request(self) -> None:
+        self.canvas.request_draw()
+        self.canvas.draw()
+        self.frame_callbacks[0](0.0)
+        self.assertEqual(self.renderer.frames, 1)
+
+    def test_flush_draw_renders_pending_request_immediately(self) -> None:
+        self.canvas.request_draw()
+        self.assertTrue(self.canvas.flush_draw())
+        self.assertFalse(self.canvas.flush_draw())
+        self.assertEqual(self.renderer.frames, 1)
+
+    def test_disabled_canvas_ignores_requests(self) -> None:
+        self.canvas.draw_enabled = False
+        self.canvas.request_draw()
+        self.canvas.draw()
+        self.assertEqual(self.frame_callbacks, [])
+        self.assertEqual(self.renderer.draw_requests, 0)
@@ -877,3 +877,77 @@ class TestDrawableDependencyManager(unittest.TestCase):
         """Vector type hierarchy should list Segment, not Point."""
         self.assertIn("Segment", self.manager._type_hierarchy["Vector"])
         self.assertNotIn("Point", self.manager._type_hierarchy["Vector"])
+
+    def test_closure_cache_invalidated_by_edge_changes(self) -> None:
+        """Cached transitive closures must reflect later edge changes."""
+        self.manager.register_dependency(child=self.segment1, parent=self.point1)
+        self.manager.register_dependency(child=self.triangle, parent=self.segment1)
+        self.assertEqual(self.manager.get_all_children(self.point1), {self.segment1, self.triangle})
+        self.assertEqual(self.manager.get_all_parents(self.triangle), {self.segment1, self.point1})
+
+        self.manager.register_dependency(child=self.triangle, parent=self.segment2)
+        self.manager.register_dependency(child=self.segment2, parent=self.point3)
+        self.assertEqual(
+            self.manager.get_all_parents(self.triangle),
+            {self.segment1, self.segment2, self.point1, self.point3},
+        )
+        self.assertEqual(self.manager.get_all_children(self.point3), {self.segment2, self.triangle})
+
+        self.manager.unregister_dependency(child=self.triangle, parent=self.segment1)
+        self.assertEqual(self.manager.get_all_children(self.point1), {self.segment1})
+        self.assertEqual(self.manager.get_all_parents(self.triangle), {self.segment2, self.point3})
+
+        self.manager.remove_drawable(self.segment2)
+        self.assertEqual(self.manager.get_all_children(self.point3), set())
+        self.assertEqual(self.manager.get_all_parents(self.triangle), set())
+        self._assert_internal_graph_invariants()
+
+    def test_closure_cache_keeps_unrelated_entries(self) -> None:
+        """Edge changes only drop cached closures of the affected subgraph."""
+        self.manager.register_dependency(child=self.segment1, parent=self.point1)
+        self.manager.register_dependency(child=self.segment2, parent=self.point3)
+        self.manager.get_all_children(self.point1)
+        self.manager.get_all_children(self.point3)
+
+        self.manager.register_dependency(child=self.triangle, parent=self.segment2)
+        self.assertIn(id(self.point1), self.manager._descendant_cache)
+        self.assertNotIn(id(self.point3), self.manager._descendant_cache)
+
+    def test_resolve_dependency_order_after_reverse_registration(self) -> None:
+        """Edges registered child-first still yield parents before children."""
+        chain = [self._create_mock_drawable(f"D{index}") for index in range(6)]
+        for index in range(len(chain) - 1, 0, -1):
+            self.manager.register_dependency(child=chain[index], parent=chain[index - 1])
+        ordered = self.manager.resolve_dependency_order(list(reversed(chain)))
+        self.assertEqual(ordered, chain)
+
+    def test_resolve_dependency_order_includes_ancestors(self) -> None:
+        """Ancestors of requested drawables are ordered ahead of them."""
+        self.manager.register_dependency(child=self.segment1, parent=self.point1)
+        self.manager.register_dependency(child=self.triangle, parent=self.segment1)
+        ordered = self.manager.resolve_dependency_order([self.triangle])
+        self.assertEqual(ordered, [self.point1, self.segment1, self.triangle])
+
+    def test_deep_chain_does_not_recurse(self) -> None:
+        """Chains deeper than the recursion limit resolve iteratively."""
+        chain = [self._create_mock_drawable(f"D{index}") for index in range(1500)]
+        for parent, child in zip(chain, chain[1:]):
+            self.manager.register_dependency(child=child, parent=parent)
+        ordered = self.manager.resolve_dependency_order([chain[-1]])
+        self.assertEqual(len(ordered), len(chain))
+        self.assertIs(ordered[0], chain[0])
+        self.assertEqual(len(self.manager.get_all_children(chain[0])), len(chain) - 1)
+
+    def test_refresh_drawables_rederives_changed_and_detaches_removed(self) -> None:
+        """refresh_drawables re-analyzes changed drawables and drops removed ones quietly."""
+        self.manager.analyze_drawable_for_dependencies(self.segment1)
+        self.manager.analyze_drawable_for_dependencies(self.segment2)
+        self.manager.get_all_children(self.point2)
+
+        self.segment1.point2 = self.point3
+        self.manager.refresh_drawables([self.segment1], [self.segment2])
+
+        self.assertEqual(self.manager.get_parents(self.segment1), {self.point1, self.point3})
+        self.assertEqual(self.manager.get_all_children(self.point2), set())
+        self.assertEqual(self.manager.get_all_children(self.point3), {self.segment1})
+        self._assert_internal_graph_invariants()
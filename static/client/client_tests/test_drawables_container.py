@@ -1,4 +1,6 @@
 import unittest
+from drawables.point import Point
+from drawables.segment import Segment
 from managers.drawables_container import DrawablesContainer
 from .simple_mock import SimpleMock
 
@@ -214,3 +216,171 @@ class TestDrawablesContainer(unittest.TestCase):
             ordered,
             "Colored areas should render before other drawables, circles, and arcs.",
         )
+
+
+class TestDrawablesContainerIndexes(unittest.TestCase):
+    """Name and spatial lookups must agree with a linear scan of storage."""
+
+    def setUp(self) -> None:
+        self.container = DrawablesContainer()
+        self.a = Point(1.0, 2.0, name="A")
+        self.b = Point(4.0, 6.0, name="B")
+        self.ab = Segment(self.a, self.b)
+        for drawable in (self.a, self.b, self.ab):
+            self.container.add(drawable)
+
+    def test_name_lookup_respects_class_filter(self) -> None:
+        self.assertIs(self.container.get_by_name("A"), self.a)
+        self.assertIs(self.container.get_by_name("A", ("Point",)), self.a)
+        self.assertIsNone(self.container.get_by_name("A", ("Segment",)))
+        self.assertIs(self.container.get_by_name(self.ab.name, ("Segment",)), self.ab)
+        self.assertIsNone(self.container.get_by_name("missing"))
+
+    def test_point_lookup_is_tolerance_aware(self) -> None:
+        self.assertIs(self.container.get_point_at(1.0 + 1e-10, 2.0 - 1e-10), self.a)
+        self.assertIsNone(self.container.get_point_at(1.0 + 1e-6, 2.0))
+        # Points straddling a grid cell boundary still match
+        edge = Point(-5e-10, 3e-6 - 1e-12, name="E")
+        self.container.add(edge)
+        self.assertIs(self.container.get_point_at(1e-10, 3e-6), edge)
+
+    def test_segment_lookup_matches_either_endpoint_order(self) -> None:
+        self.assertIs(self.container.get_segment_at(1.0, 2.0, 4.0, 6.0), self.ab)
+        self.assertIs(self.container.get_segment_at(4.0, 6.0, 1.0, 2.0), self.ab)
+        self.assertIsNone(self.container.get_segment_at(1.0, 2.0, 4.0, 7.0))
+
+    def test_remove_updates_indexes(self) -> None:
+        self.assertIs(self.container.get_point_at(4.0, 6.0), self.b)
+        self.container.remove(self.ab)
+        self.container.remove(self.b)
+        self.assertIsNone(self.container.get_point_at(4.0, 6.0))
+        self.assertIsNone(self.container.get_by_name("B"))
+        self.assertIsNone(self.container.get_segment_at(1.0, 2.0, 4.0, 6.0))
+
+    def test_rename_is_visible_to_name_index(self) -> None:
+        self.assertIs(self.container.get_by_name("A"), self.a)
+        self.a.update_name("Z")
+        self.assertIsNone(self.container.get_by_name("A"))
+        self.assertIs(self.container.get_by_name("Z"), self.a)
+
+    def test_moves_are_visible_to_spatial_index(self) -> None:
+        self.assertIs(self.container.get_segment_at(1.0, 2.0, 4.0, 6.0), self.ab)
+        self.a.translate(10.0, 0.0)
+        self.assertIsNone(self.container.get_point_at(1.0, 2.0))
+        self.assertIs(self.container.get_point_at(11.0, 2.0), self.a)
+        self.assertIs(self.container.get_segment_at(11.0, 2.0, 4.0, 6.0), self.ab)
+        self.b.rotate_around(180.0, 0.0, 0.0)
+        self.assertIs(self.container.get_point_at(-4.0, -6.0), self.b)
+
+    def test_replaced_endpoint_is_visible_to_spatial_index(self) -> None:
+        self.assertIs(self.container.get_segment_at(1.0, 2.0, 4.0, 6.0), self.ab)
+        c = Point(9.0, 9.0, name="C")
+        self.container.add(c)
+        self.ab.point2 = c
+        self.assertIsNone(self.container.get_segment_at(1.0, 2.0, 4.0, 6.0))
+        self.assertIs(self.container.get_segment_at(9.0, 9.0, 1.0, 2.0), self.ab)
+        self.b.update_position(20.0, 20.0)
+        c.update_position(30.0, 30.0)
+        self.assertIs(self.container.get_segment_at(1.0, 2.0, 30.0, 30.0), self.ab)
+
+    def test_renames_and_moves_update_entries_in_place(self) -> None:
+        self.container.get_by_name("A")
+        reindexed = []
+        original = self.container._index_drawable
+
+        def counting_index(drawable: object) -> None:
+            reindexed.append(drawable)
+            original(drawable)
+
+        self.container._index_drawable = counting_index
+        self.a.update_name("Z")
+        self.b.update_position(5.0, 5.0)
+        self.assertIs(self.container.get_by_name("Z"), self.a)
+        self.assertIs(self.container.get_point_at(5.0, 5.0), self.b)
+        self.assertEqual(reindexed, [])
+
+    def test_storage_replacement_is_reindexed_by_rebuild_renderables(self) -> None:
+        self.assertIs(self.container.get_by_name("A"), self.a)
+        replacement = Point(7.0, 8.0, name="A")
+        # Undo/redo and workspace restore swap storage buckets directly
+        self.container._drawables["Point"] = [replacement, self.b]
+        self.container.rebuild_renderables()
+        self.assertIs(self.container.get_by_name("A"), replacement)
+        self.assertIs(self.container.get_point_at(7.0, 8.0), replacement)
+        self.assertIsNone(self.container.get_point_at(1.0, 2.0))
+
+    def test_undo_redo_restores_keep_lookups_consistent(self) -> None:
+        from canvas import Canvas
+
+        canvas = Canvas(500, 500, draw_enabled=False)
+        manager = canvas.drawable_manager
+        point = manager.create_point(1.0, 2.0, name="A")
+        canvas.undo_redo_manager.archive()
+        point.update_position(3.0, 4.0)
+        point.update_name("Q")
+        self.assertIs(manager.point_manager.get_point(3.0, 4.0), point)
+
+        canvas.undo_redo_manager.undo()
+        self.assertIs(manager.point_manager.get_point(1.0, 2.0), point)
+        self.assertIsNone(manager.point_manager.get_point(3.0, 4.0))
+        self.assertIs(manager.get_point_by_name("A"), point)
+
+        canvas.undo_redo_manager.redo()
+        self.assertIs(manager.point_manager.get_point(3.0, 4.0), point)
+        self.assertIs(manager.get_point_by_name("Q"), point)
+        self.assertIsNone(manager.get_point_by_name("A"))
+
+    def test_duplicate_matches_keep_storage_order(self) -> None:
+        twin = Point(1.0, 2.0, name="A")
+        self.container.add(twin)
+        self.assertIs(self.container.get_point_at(1.0, 2.0), self.a)
+        self.assertIs(self.container.get_by_name("A"), self.a)
+
+    def test_polygon_name_lookup_follows_allowed_class_order(self) -> None:
+        first = SimpleMock(get_class_name=SimpleMock(return_value="Rectangle"), name="poly", is_renderable=True)
+        second = SimpleMock(get_class_name=SimpleMock(return_value="Triangle"), name="poly", is_renderable=True)
+        self.container.add(first)
+        self.container.add(second)
+        self.assertIs(self.container.get_polygon_by_name("poly"), second)
+        self.assertIs(self.container.get_polygon_by_name("poly", ["Rectangle"]), first)
+        self.assertIs(self.container.get_rectangle_by_name("poly"), first)
+        self.assertIsNone(self.container.get_pentagon_by_name("poly"))
+
+
+class TestDrawablesContainerRenderBounds(unittest.TestCase):
+    """Culled renderable queries keep the layering of the full renderables list."""
+
+    def setUp(self) -> None:
+        self.container = DrawablesContainer()
+        self.a = Point(0.0, 0.0, name="A")
+        self.b = Point(2.0, 2.0, name="B")
+        self.far = Point(500.0, 500.0, name="F")
+        self.ab = Segment(self.a, self.b)
+        self.area = SimpleMock(get_class_name=SimpleMock(return_value="ClosedShapeColoredArea"), is_renderable=True)
+        for drawable in (self.ab, self.a, self.area, self.b, self.far):
+            self.container.add(drawable)
+
+    def _in_window(self) -> list:
+        found: list = self.container.get_renderables_in_bounds(-1.0, -1.0, 3.0, 3.0)
+        return found
+
+    def test_window_query_skips_far_drawables_and_keeps_order(self) -> None:
+        expected = [d for d in self.container.get_renderables_with_layering() if d is not self.far]
+        self.assertEqual(self._in_window(), expected)
+
+    def test_additions_and_removals_are_tracked(self) -> None:
+        self._in_window()
+        c = Point(1.0, 1.0, name="C")
+        self.container.add(c)
+        self.assertIn(c, self._in_window())
+        self.container.remove(self.a)
+        self.assertNotIn(self.a, self._in_window())
+        self.assertFalse(self.container.is_current_renderable(self.a))
+        self.assertTrue(self.container.is_current_renderable(c))
+
+    def test_rebuild_renderables_reindexes(self) -> None:
+        self._in_window()
+        self.far.update_position(1.5, 1.5)
+        self.container.rebuild_renderables()
+        expected = self.container.get_renderables_with_layering()
+        self.assertEqual(self._in_window(), expected)
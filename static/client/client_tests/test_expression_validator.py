@@ -246,3 +246,56 @@ class TestExpressionValidator(unittest.TestCase):
                 )
                 self.assertNotIn("!", fixed_expression)
                 self.assertEqual(fixed_expression.replace(" ", ""), expected)
+
+    def test_compile_expression_is_cached_by_normalized_string(self) -> None:
+        ExpressionValidator.clear_compiled_cache()
+        first = ExpressionValidator.compile_expression("x^2")
+        self.assertIs(ExpressionValidator.compile_expression("x^2"), first)
+        # Different spelling, same normalized form
+        self.assertIs(ExpressionValidator.compile_expression("x**2"), first)
+        self.assertIsNot(ExpressionValidator.compile_expression("x^2", "t"), first)
+
+    def test_compiled_cache_evicts_least_recently_used(self) -> None:
+        ExpressionValidator.clear_compiled_cache()
+        original_size = ExpressionValidator.COMPILED_CACHE_SIZE
+        ExpressionValidator.COMPILED_CACHE_SIZE = 2
+        try:
+            a = ExpressionValidator.compile_expression("x+1")
+            b = ExpressionValidator.compile_expression("x+2")
+            self.assertIs(ExpressionValidator.compile_expression("x+1"), a)
+            ExpressionValidator.compile_expression("x+3")
+            self.assertIs(ExpressionValidator.compile_expression("x+1"), a)
+            self.assertIsNot(ExpressionValidator.compile_expression("x+2"), b)
+        finally:
+            ExpressionValidator.COMPILED_CACHE_SIZE = original_size
+            ExpressionValidator.clear_compiled_cache()
+
+    def test_invalid_expressions_are_not_cached(self) -> None:
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                ExpressionValidator.compile_expression("__import__('os')")
+
+    def test_evaluate_many_matches_scalar_path(self) -> None:
+        compiled = ExpressionValidator.parse_function_string("sin(x) + x^2")
+        xs = [-2.5, -1, 0, 0.5, math.pi]
+        self.assertEqual(compiled.evaluate_many(xs), [compiled(x) for x in xs])
+        parametric = ExpressionValidator.parse_parametric_expression("t*cos(t)")
+        self.assertEqual(parametric.evaluate_many(xs), [parametric(t) for t in xs])
+
+    def test_evaluate_many_error_semantics_match_scalar_path(self) -> None:
+        log_compiled = ExpressionValidator.compile_expression("log(x)")
+        with self.assertRaises(ValueError):
+            log_compiled(-1.0)
+        with self.assertRaises(ValueError):
+            log_compiled.evaluate_many([1.0, -1.0])
+        self.assertEqual(log_compiled.evaluate_many([1.0, -1.0, 0.0], default=None), [0.0, None, None])
+        # Complex results are rejected by float() on both paths
+        root_compiled = ExpressionValidator.compile_expression("(x)**0.5")
+        with self.assertRaises(TypeError):
+            root_compiled(-4.0)
+        with self.assertRaises(TypeError):
+            root_compiled.evaluate_many([-4.0])
+        # Non-finite floats pass through unchanged on both paths
+        inf_compiled = ExpressionValidator.compile_expression("x*x")
+        self.assertEqual(inf_compiled(1e200), float("inf"))
+        self.assertEqual(inf_compiled.evaluate_many([1e200]), [float("inf")])
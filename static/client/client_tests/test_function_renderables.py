@@ -153,6 +153,121 @@ class TestFunctionRenderable(unittest.TestCase):
         )
 
 
+class TestIncrementalResampling(unittest.TestCase):
+    """Tests for the math-space sample cache reused across pans and zooms."""
+
+    def setUp(self) -> None:
+        self.mapper = CoordinateMapper(640, 480)
+        self.mapper.scale_factor = 40.0
+        self.func = Function("x^2/4", name="f")
+        self.renderable = FunctionRenderable(self.func, self.mapper)
+        self.evaluated: list[float] = []
+        evaluate = self.func.function
+
+        def counting_function(x: float) -> float:
+            self.evaluated.append(x)
+            return evaluate(x)
+
+        self.func.function = counting_function
+        self.renderable.build_screen_paths()
+        self.evaluated.clear()
+
+    def _visible_span(self) -> tuple[float, float]:
+        return self.mapper.get_visible_left_bound(), self.mapper.get_visible_right_bound()
+
+    def test_pan_only_samples_newly_exposed_interval(self) -> None:
+        old_left, old_right = self._visible_span()
+        self.mapper.apply_pan(-40, 0)
+        new_left, new_right = self._visible_span()
+
+        self.renderable.build_screen_paths()
+
+        self.assertGreater(len(self.evaluated), 0)
+        for x in self.evaluated:
+            self.assertTrue(x == new_left or old_right <= x <= new_right, f"re-evaluated x={x}")
+        self.assertEqual(self.renderable._sample_span, (new_left, new_right))
+        self.assertLess(old_left, new_left)
+
+    def test_pan_trims_samples_outside_view(self) -> None:
+        self.mapper.apply_pan(60, 0)
+        self.renderable.build_screen_paths()
+
+        left, right = self._visible_span()
+        self.assertEqual(self.renderable._sample_xs[0], left)
+        self.assertEqual(self.renderable._sample_xs[-1], right)
+        self.assertTrue(all(left <= x <= right for x in self.renderable._sample_xs))
+
+    def test_panned_paths_match_fresh_sampling_on_screen(self) -> None:
+        self.mapper.apply_pan(-50, 30)
+        panned = self.renderable.build_screen_paths()
+
+        fresh = FunctionRenderable(self.func, self.mapper).build_screen_paths()
+
+        self.assertEqual(len(panned.paths), len(fresh.paths))
+        for panned_path, fresh_path in zip(panned.paths, fresh.paths):
+            self.assertAlmostEqual(panned_path[0][0], fresh_path[0][0], places=6)
+            self.assertAlmostEqual(panned_path[-1][0], fresh_path[-1][0], places=6)
+
+    def test_vertical_pan_reuses_every_sample(self) -> None:
+        before = self.renderable.build_screen_paths()
+        self.mapper.apply_pan(0, 25)
+
+        after = self.renderable.build_screen_paths()
+
+        self.assertEqual(len(self.evaluated), 0)
+        self.assertIsNot(before, after)
+        self.assertNotEqual(before.paths, after.paths)
+
+    def test_small_zoom_out_reuses_samples(self) -> None:
+        cached = set(self.renderable._sample_xs)
+        self.mapper.apply_zoom(0.8)
+
+        self.renderable.build_screen_paths()
+
+        left, right = self._visible_span()
+        kept = [x for x in self.renderable._sample_xs if x in cached]
+        self.assertGreater(len(kept), 2)
+        self.assertEqual(self.renderable._sample_scales, (32.0, 40.0))
+        self.assertEqual(self.renderable._sample_span, (left, right))
+
+    def test_zoom_in_resamples_whole_range(self) -> None:
+        self.mapper.apply_zoom(1.5)
+
+        self.renderable.build_screen_paths()
+
+        self.assertEqual(self.renderable._sample_scales, (60.0, 60.0))
+        self.assertTrue(set(self.renderable._sample_xs) <= set(self.evaluated))
+
+    def test_large_zoom_out_resamples_whole_range(self) -> None:
+        self.mapper.apply_zoom(0.25)
+
+        self.renderable.build_screen_paths()
+
+        self.assertEqual(self.renderable._sample_scales, (10.0, 10.0))
+
+    def test_function_change_drops_cached_samples(self) -> None:
+        self.func.update_left_bound(-1)
+
+        self.renderable.build_screen_paths()
+
+        self.assertEqual(self.renderable._sample_xs[0], -1)
+        self.assertTrue(set(self.renderable._sample_xs) <= set(self.evaluated))
+
+    def test_pan_keeps_paths_split_at_asymptote(self) -> None:
+        func = Function("1/x", name="g")
+        renderable = FunctionRenderable(func, self.mapper)
+        renderable.build_screen_paths()
+        self.mapper.apply_pan(-100, 0)
+
+        result = renderable.build_screen_paths()
+
+        origin_x = self.mapper.math_to_screen(0, 0)[0]
+        self.assertGreaterEqual(len(result.paths), 2)
+        for path in result.paths:
+            xs = [point[0] for point in path]
+            self.assertTrue(max(xs) <= origin_x or min(xs) >= origin_x)
+
+
 class TestFunctionsBoundedAreaRenderable(unittest.TestCase):
     def setUp(self) -> None:
         self.mapper = CoordinateMapper(640, 480)
@@ -1,10 +1,18 @@
 from __future__ import annotations
 
 import math
+import random
 import unittest
 
 from utils.graph_layout import (
     layout_vertices,
+    _SegmentGrid,
+    _adjacent_edges_overlap,
+    _barnes_hut_repulsion,
+    _exact_repulsion,
+    _count_crossings_for_vertex,
+    _crossings_and_overlaps,
+    _edges_collinear_overlap,
     _circular_layout,
     _grid_layout,
     _simple_grid_placement,
@@ -1019,6 +1027,57 @@ class TestGraphLayout(unittest.TestCase):
         # Intra-cluster average should be less than cluster center separation
         self.assertLess(avg_intra, cluster_dist)
 
+    def test_force_layout_barnes_hut_matches_exact_at_small_theta(self) -> None:
+        # A tiny theta opens every cell, so only summation order differs from the exact sum
+        vertices = [f"V{i}" for i in range(12)]
+        edges = [Edge(vertices[i], vertices[(i * 5 + 1) % 12]) for i in range(12)]
+        exact = _force_directed_layout(vertices, edges, self.box, iterations=30, theta=0.0)
+        approx = _force_directed_layout(vertices, edges, self.box, iterations=30, theta=1e-9)
+        for vid in vertices:
+            self.assertAlmostEqual(exact[vid][0], approx[vid][0], places=6)
+            self.assertAlmostEqual(exact[vid][1], approx[vid][1], places=6)
+
+    def test_force_layout_barnes_hut_stays_in_box(self) -> None:
+        vertices = [f"V{i}" for i in range(60)]
+        edges = [Edge(vertices[i], vertices[i + 1]) for i in range(59)]
+        positions = _force_directed_layout(vertices, edges, self.box, iterations=40, theta=0.8)
+        self.assertEqual(len(positions), 60)
+        for x, y in positions.values():
+            self.assertTrue(0.0 <= x <= 100.0 and 0.0 <= y <= 100.0)
+
+    def test_force_layout_barnes_hut_coincident_vertices(self) -> None:
+        disp_x, disp_y = _barnes_hut_repulsion([5.0] * 10, [5.0] * 10, 10.0, 0.8)
+        self.assertEqual(len(disp_x), 10)
+        self.assertTrue(all(math.isfinite(d) for d in disp_x + disp_y))
+
+    def test_force_layout_barnes_hut_never_approximates_enclosing_cell(self) -> None:
+        # Every cell holding several vertices also holds the vertex asking, so even a huge theta is exact
+        xs = [0.0, 10.0, -10.0, 0.0, 0.0]
+        ys = [0.0, 0.0, 0.0, 10.0, -10.0]
+        exact_x, exact_y = _exact_repulsion(xs, ys, 10.0)
+        approx_x, approx_y = _barnes_hut_repulsion(xs, ys, 10.0, 100.0)
+        for i in range(len(xs)):
+            self.assertAlmostEqual(exact_x[i], approx_x[i], places=6)
+            self.assertAlmostEqual(exact_y[i], approx_y[i], places=6)
+
+    def test_force_layout_converged_layout_stops_early(self) -> None:
+        vertices = ["A", "B", "C", "D"]
+        edges = [Edge("A", "B"), Edge("B", "C"), Edge("C", "D")]
+        # With an unbounded tolerance the first iteration already counts as converged
+        stopped = _force_directed_layout(
+            vertices, edges, self.box, iterations=100, theta=0.5, tolerance=float("inf")
+        )
+        single = _force_directed_layout(vertices, edges, self.box, iterations=1, theta=0.5)
+        self.assertEqual(stopped, single)
+
+    def test_force_layout_exact_mode_runs_every_iteration(self) -> None:
+        vertices = ["A", "B", "C", "D"]
+        edges = [Edge("A", "B"), Edge("B", "C"), Edge("C", "D")]
+        unbounded = _force_directed_layout(vertices, edges, self.box, iterations=100, tolerance=float("inf"))
+        full = _force_directed_layout(vertices, edges, self.box, iterations=100)
+        self.assertEqual(unbounded, full)
+        self.assertNotEqual(full, _force_directed_layout(vertices, edges, self.box, iterations=1))
+
     # ------------------------------------------------------------------
     # layout_vertices selector
     # ------------------------------------------------------------------
@@ -1544,5 +1603,84 @@ class TestGraphLayoutVisibility(unittest.TestCase):
             self.assertLessEqual(positions[vid][1], root_y)
 
 
+class TestGraphLayoutCrossingIndex(unittest.TestCase):
+    """The segment grid must give exactly the counts of a full pairwise scan."""
+
+    def _random_case(self, rng: random.Random, grid_size: int) -> tuple:
+        vertices = [f"v{i}" for i in range(rng.randint(4, 12))]
+        edges = [Edge(*rng.sample(vertices, 2)) for _ in range(rng.randint(3, 2 * len(vertices)))]
+        grid_pos = {v: (rng.randrange(grid_size), rng.randrange(grid_size)) for v in vertices}
+        return vertices, edges, grid_pos
+
+    def _brute_force_count(self, vertex: str, pos: tuple, edges: list, grid_pos: dict) -> int:
+        placed = dict(grid_pos)
+        placed[vertex] = pos
+        problems = 0
+        for e1 in edges:
+            if vertex not in (e1.source, e1.target):
+                continue
+            p1, p2 = placed[e1.source], placed[e1.target]
+            for e2 in edges:
+                if e1 == e2:
+                    continue
+                p3, p4 = placed[e2.source], placed[e2.target]
+                if e1.source in (e2.source, e2.target) or e1.target in (e2.source, e2.target):
+                    problems += int(_adjacent_edges_overlap(p1, p2, p3, p4))
+                else:
+                    problems += int(
+                        GraphUtils.segments_cross(p1, p2, p3, p4) or _edges_collinear_overlap(p1, p2, p3, p4)
+                    )
+        return problems
+
+    def test_vertex_count_matches_pairwise_scan(self) -> None:
+        rng = random.Random(3)
+        for _ in range(300):
+            # Small grids force collinear, touching, and coincident placements
+            grid_size = rng.choice([3, 4, 6, 12])
+            vertices, edges, grid_pos = self._random_case(rng, grid_size)
+            vertex = rng.choice(vertices)
+            pos = (rng.randrange(grid_size), rng.randrange(grid_size))
+            self.assertEqual(
+                _count_crossings_for_vertex(vertex, pos, edges, dict(grid_pos), grid_size),
+                self._brute_force_count(vertex, pos, edges, grid_pos),
+            )
+
+    def test_incremental_moves_match_rebuilt_index(self) -> None:
+        rng = random.Random(5)
+        vertices, edges, grid_pos = self._random_case(rng, 8)
+        index = _SegmentGrid(edges, grid_pos)
+        for _ in range(50):
+            moved = rng.choice(vertices)
+            grid_pos[moved] = (rng.randrange(8), rng.randrange(8))
+            index.move_vertex(moved, grid_pos[moved])
+            probe = rng.choice(vertices)
+            pos = (rng.randrange(8), rng.randrange(8))
+            self.assertEqual(
+                _count_crossings_for_vertex(probe, pos, edges, grid_pos, 8, index),
+                _count_crossings_for_vertex(probe, pos, edges, grid_pos, 8),
+            )
+
+    def test_pairs_and_overlaps_match_pairwise_scan(self) -> None:
+        rng = random.Random(9)
+        box = {"x": -40.0, "y": 10.0, "width": 130.0, "height": 70.0}
+        for _ in range(100):
+            _, edges, grid_pos = self._random_case(rng, rng.choice([4, 10]))
+            positions = {v: (box["x"] + (c + 0.5) * 13.0, box["y"] + (r + 0.5) * 7.0) for v, (c, r) in grid_pos.items()}
+            expected_pairs = []
+            for i, e1 in enumerate(edges):
+                for e2 in edges[i + 1 :]:
+                    p1, p2, p3, p4 = (positions[v] for v in (e1.source, e1.target, e2.source, e2.target))
+                    if e1.source in (e2.source, e2.target) or e1.target in (e2.source, e2.target):
+                        conflict = _adjacent_edges_overlap(p1, p2, p3, p4)
+                    else:
+                        conflict = GraphUtils.segments_cross(p1, p2, p3, p4) or _edges_collinear_overlap(p1, p2, p3, p4)
+                    if conflict:
+                        expected_pairs.append((e1, e2))
+
+            pairs, overlaps = _crossings_and_overlaps(edges, positions)
+            self.assertEqual(pairs, expected_pairs)
+            self.assertEqual(overlaps, GraphUtils.count_edge_overlaps(edges, positions))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import sys
+import unittest
+
+from lazy_module_loader import LazyChunkFinder
+
+
+class TestLazyChunkFinder(unittest.TestCase):
+    def setUp(self) -> None:
+        self.loaded: list[str] = []
+        self.finder = LazyChunkFinder(
+            {"utils.statistics": "/client_bundle/stats.js", "client_tests": "/client_bundle/tests.js"},
+            self.loaded.append,
+        )
+
+    def test_prefix_matching(self) -> None:
+        self.assertEqual(self.finder.chunk_url_for("utils.statistics"), "/client_bundle/stats.js")
+        self.assertEqual(self.finder.chunk_url_for("utils.statistics.regression"), "/client_bundle/stats.js")
+        self.assertIsNone(self.finder.chunk_url_for("utils.statistics_extra"))
+        self.assertIsNone(self.finder.chunk_url_for("utils"))
+
+    def test_chunk_loads_once_and_lookup_continues(self) -> None:
+        self.assertIsNone(self.finder.find_spec("utils.statistics"))
+        self.assertIsNone(self.finder.find_spec("utils.statistics.regression"))
+        self.assertIsNone(self.finder.find_spec("canvas"))
+        self.assertEqual(self.loaded, ["/client_bundle/stats.js"])
+
+    def test_failed_load_is_retried(self) -> None:
+        calls: list[str] = []
+
+        def flaky(url: str) -> None:
+            calls.append(url)
+            if len(calls) == 1:
+                raise ImportError("offline")
+
+        finder = LazyChunkFinder({"client_tests": "/client_bundle/tests.js"}, flaky)
+        with self.assertRaises(ImportError):
+            finder.find_spec("client_tests")
+        finder.find_spec("client_tests")
+        self.assertEqual(len(calls), 2)
+
+    def test_finder_does_not_shadow_regular_imports(self) -> None:
+        sys.meta_path.insert(0, self.finder)
+        try:
+            import json  # noqa: F401
+        finally:
+            sys.meta_path.remove(self.finder)
+        self.assertEqual(self.loaded, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -336,3 +336,74 @@ class TestExpressionEvaluation(unittest.TestCase):
 
         result = evaluate_residuals(["x + z"], ["x"], [1.0])
         self.assertIsNone(result)
+
+
+class TestCompiledSystem(unittest.TestCase):
+    """Tests for the compiled residual system shared across starts."""
+
+    def test_evaluate_matches_evaluate_residuals(self) -> None:
+        """Compiled residuals agree with the uncompiled evaluation path."""
+        from numeric_solver.compiled_system import CompiledSystem
+        from numeric_solver.expression_utils import evaluate_residuals
+
+        residuals = ["sin(x) + y - 1", "x^2 + y^2 - 4"]
+        system = CompiledSystem(residuals, ["x", "y"])
+        values = [0.3, 1.7]
+
+        expected = evaluate_residuals(residuals, ["x", "y"], values)
+        actual = system.evaluate(values)
+
+        self.assertIsNotNone(actual)
+        for a, e in zip(actual, expected):
+            self.assertAlmostEqual(a, e, places=12)
+
+    def test_evaluate_non_finite_returns_none(self) -> None:
+        """Non-finite residuals return None, as evaluate_residuals does."""
+        from numeric_solver.compiled_system import CompiledSystem
+
+        system = CompiledSystem(["1/x"], ["x"])
+        self.assertIsNone(system.evaluate([0.0]))
+
+    def test_jacobian_numeric_fallback(self) -> None:
+        """Without symbolic derivatives every column uses central differences."""
+        from numeric_solver.compiled_system import CompiledSystem
+
+        system = CompiledSystem(["x^2 + y^2", "x*y"], ["x", "y"], analytic_jacobian=False)
+        J = system.jacobian([1.0, 2.0])
+
+        self.assertEqual(system.analytic_entries, 0)
+        self.assertIsNotNone(J)
+        self.assertAlmostEqual(J[0][0], 2.0, places=4)
+        self.assertAlmostEqual(J[0][1], 4.0, places=4)
+        self.assertAlmostEqual(J[1][0], 2.0, places=4)
+        self.assertAlmostEqual(J[1][1], 1.0, places=4)
+        # Two residual-vector evaluations per column
+        self.assertEqual(system.residual_evaluations, 4)
+
+    def test_jacobian_matches_compute_jacobian(self) -> None:
+        """Symbolic entries agree with the finite-difference Jacobian."""
+        from numeric_solver.compiled_system import CompiledSystem
+        from numeric_solver.jacobian import compute_jacobian
+
+        residuals = ["sin(x) + y - 1", "x^2 + y^2 - 4"]
+        values = [0.5, -1.2]
+        expected = compute_jacobian(residuals, ["x", "y"], values)
+        actual = CompiledSystem(residuals, ["x", "y"]).jacobian(values)
+
+        self.assertIsNotNone(actual)
+        for row_a, row_e in zip(actual, expected):
+            for a, e in zip(row_a, row_e):
+                self.assertAlmostEqual(a, e, places=4)
+
+    def test_newton_returns_known_root_when_captured(self) -> None:
+        """A start that lands on an already-found root returns that root object."""
+        from numeric_solver.compiled_system import CompiledSystem
+        from numeric_solver.newton_raphson import newton_raphson
+
+        residuals = ["x^2 - 4"]
+        system = CompiledSystem(residuals, ["x"])
+        root = [2.0]
+
+        result = newton_raphson(residuals, ["x"], [2.5], 1e-10, 50, system=system, known_roots=[root])
+
+        self.assertIs(result, root)
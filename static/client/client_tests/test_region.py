@@ -4,6 +4,7 @@ import math
 import unittest
 
 from geometry import (
+    CircularArc,
     LineSegment,
     CompositePath,
     Region,
@@ -158,7 +159,21 @@ class TestRegion(unittest.TestCase):
 
         result = sq1.difference(sq2)
         self.assertIsNotNone(result)
+        # The overlap is cut out of a corner, leaving an L-shape without holes
+        self.assertAlmostEqual(result.area(), 3.0, places=9)
+        self.assertEqual(len(result.holes), 0)
+        self.assertFalse(result.contains_point(1.5, 1.5))
+        self.assertTrue(result.contains_point(0.5, 1.5))
+
+    def test_difference_inner_region_becomes_hole(self) -> None:
+        outer = Region.from_points([(0.0, 0.0), (4.0, 0.0), (4.0, 4.0), (0.0, 4.0)])
+        inner = Region.from_points([(1.0, 1.0), (2.0, 1.0), (2.0, 2.0), (1.0, 2.0)])
+
+        result = outer.difference(inner)
+        self.assertIsNotNone(result)
         self.assertEqual(len(result.holes), 1)
+        self.assertAlmostEqual(result.area(), 15.0, places=9)
+        self.assertIsNone(inner.difference(outer))
 
     def test_difference_non_overlapping(self) -> None:
         sq1 = Region.from_points([(0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0)])
@@ -168,6 +183,74 @@ class TestRegion(unittest.TestCase):
         self.assertIsNotNone(result)
         self.assertEqual(len(result.holes), 0)
 
+    def test_intersection_with_concave_clip(self) -> None:
+        # U-shape: a 3x3 square with the 1x2 slot x in [1, 2], y in [1, 3] removed
+        u_shape = Region.from_points(
+            [(0.0, 0.0), (3.0, 0.0), (3.0, 3.0), (2.0, 3.0), (2.0, 1.0), (1.0, 1.0), (1.0, 3.0), (0.0, 3.0)]
+        )
+        bar = Region.from_points([(-1.0, 2.0), (4.0, 2.0), (4.0, 2.5), (-1.0, 2.5)])
+
+        result = bar.intersection(u_shape)
+        self.assertIsNotNone(result)
+        # The bar crosses both prongs but not the slot: 2 * (1 * 0.5)
+        self.assertAlmostEqual(result.area(), 1.0, places=9)
+        self.assertFalse(result.contains_point(1.5, 2.25))
+        self.assertAlmostEqual(u_shape.intersection(bar).area(), 1.0, places=9)
+
+    def test_union_with_concave_operand_keeps_notch(self) -> None:
+        u_shape = Region.from_points(
+            [(0.0, 0.0), (3.0, 0.0), (3.0, 3.0), (2.0, 3.0), (2.0, 1.0), (1.0, 1.0), (1.0, 3.0), (0.0, 3.0)]
+        )
+        lid = Region.from_points([(0.0, 3.0), (3.0, 3.0), (3.0, 4.0), (0.0, 4.0)])
+
+        result = u_shape.union(lid)
+        self.assertIsNotNone(result)
+        # 7 + 3; the slot is now enclosed and becomes a hole
+        self.assertAlmostEqual(result.area(), 10.0, places=9)
+        self.assertEqual(len(result.holes), 1)
+        self.assertFalse(result.contains_point(1.5, 2.0))
+
+    def test_operations_on_shared_edges(self) -> None:
+        left = Region.from_points([(0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0)])
+        right = Region.from_points([(1.0, 0.0), (2.0, 0.0), (2.0, 1.0), (1.0, 1.0)])
+        top_half = Region.from_points([(0.0, 0.5), (1.0, 0.5), (1.0, 1.0), (0.0, 1.0)])
+
+        self.assertAlmostEqual(left.union(right).area(), 2.0, places=9)
+        self.assertEqual(len(left.union(right).holes), 0)
+        self.assertIsNone(left.intersection(right))
+        self.assertAlmostEqual(left.difference(right).area(), 1.0, places=9)
+        self.assertAlmostEqual(left.intersection(top_half).area(), 0.5, places=9)
+        self.assertAlmostEqual(left.difference(top_half).area(), 0.5, places=9)
+        self.assertAlmostEqual(left.symmetric_difference(top_half).area(), 0.5, places=9)
+
+    def test_circle_operations_use_adaptive_sampling(self) -> None:
+        circle_a = Region.from_circle((0.0, 0.0), 1.0)
+        circle_b = Region.from_circle((1.0, 0.0), 1.0)
+        # Lens area of two unit circles one radius apart
+        lens = 2 * math.pi / 3 - math.sqrt(3) / 2
+
+        self.assertAlmostEqual(circle_a.intersection(circle_b).area(), lens, places=3)
+        self.assertAlmostEqual(circle_a.union(circle_b).area(), 2 * math.pi - lens, places=3)
+        self.assertAlmostEqual(circle_a.symmetric_difference(circle_b).area(), 2 * (math.pi - lens), places=3)
+
+    def test_arc_chord_region_area_is_exact(self) -> None:
+        arc = CircularArc((5.0, -3.0), 2.0, 0.0, math.pi / 2)
+        chord = LineSegment(arc.end_point(), arc.start_point())
+        region = Region(CompositePath([arc, chord]))
+        # Quarter sector minus the right triangle under the chord
+        self.assertAlmostEqual(region.area(), math.pi - 2.0, places=9)
+
+    def test_disjoint_union_is_multi_part(self) -> None:
+        sq1 = Region.from_points([(0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0)])
+        sq2 = Region.from_points([(5.0, 5.0), (7.0, 5.0), (7.0, 7.0), (5.0, 7.0)])
+
+        result = sq1.union(sq2)
+        self.assertTrue(result.contains_point(0.5, 0.5))
+        self.assertTrue(result.contains_point(6.0, 6.0))
+        self.assertFalse(result.contains_point(3.0, 3.0))
+        # The larger part supplies the displayed boundary
+        self.assertIn((7.0, 7.0), result._sample_to_points())
+
     def test_repr(self) -> None:
         region = Region.from_points([(0.0, 0.0), (1.0, 0.0), (1.0, 1.0)])
         repr_str = repr(region)
@@ -50,7 +50,7 @@ class TestRegressionCanvas(unittest.TestCase):
         function_names = self._names_for_class("Function")
         self.assertIn(result["function_name"], function_names)
 
-    def test_fit_regression_linear_creates_points(self) -> None:
+    def test_fit_regression_linear_creates_scatter_plot(self) -> None:
         result = self.canvas.fit_regression(
             name="WithPoints",
             x_data=[1.0, 2.0, 3.0],
@@ -60,16 +60,37 @@ class TestRegressionCanvas(unittest.TestCase):
             plot_bounds=None,
             curve_color=None,
             show_points=True,
-            point_color=None,
+            point_color="#ff0000",
         )
 
-        self.assertIn("point_names", result)
-        point_names = result["point_names"]
-        self.assertEqual(len(point_names), 3)
+        self.assertEqual(result["scatter_name"], "WithPoints_points")
+        self.assertEqual(result["point_count"], 3)
+        self.assertNotIn("point_names", result)
+
+        # One scatter drawable replaces the per-sample points
+        self.assertEqual(self._names_for_class("Point"), [])
+        scatters = self.canvas.get_drawables_by_class_name("ScatterPlot")
+        self.assertEqual([s.name for s in scatters], ["WithPoints_points"])
+        self.assertEqual(scatters[0].x_values, (1.0, 2.0, 3.0))
+        self.assertEqual(scatters[0].y_values, (2.0, 4.0, 6.0))
+        self.assertEqual(scatters[0].color, "#ff0000")
+
+    def test_fit_regression_scatter_plot_is_deleted_with_delete_plot(self) -> None:
+        result = self.canvas.fit_regression(
+            name="Removable",
+            x_data=[1.0, 2.0, 3.0],
+            y_data=[2.0, 4.0, 6.0],
+            model_type="linear",
+            degree=None,
+            plot_bounds=None,
+            curve_color=None,
+            show_points=True,
+            point_color=None,
+        )
 
-        all_points = self._names_for_class("Point")
-        for pt_name in point_names:
-            self.assertIn(pt_name, all_points)
+        self.assertTrue(self.canvas.delete_plot(result["scatter_name"]))
+        self.assertEqual(self._names_for_class("ScatterPlot"), [])
+        self.assertIn(result["function_name"], self._names_for_class("Function"))
 
     def test_fit_regression_show_points_false_omits_points(self) -> None:
         result = self.canvas.fit_regression(
@@ -84,9 +105,8 @@ class TestRegressionCanvas(unittest.TestCase):
             point_color=None,
         )
 
-        # Should not have point_names or have empty list
-        point_names = result.get("point_names", [])
-        self.assertEqual(len(point_names), 0)
+        self.assertNotIn("scatter_name", result)
+        self.assertEqual(self._names_for_class("ScatterPlot"), [])
 
     def test_fit_regression_linear_r_squared_perfect(self) -> None:
         result = self.canvas.fit_regression(
@@ -454,7 +474,7 @@ class TestRegressionCanvas(unittest.TestCase):
         )
 
         function_name = result["function_name"]
-        point_names = result.get("point_names", [])
+        scatter_name = result["scatter_name"]
 
         # Verify function exists
         self.assertIn(function_name, self._names_for_class("Function"))
@@ -462,10 +482,9 @@ class TestRegressionCanvas(unittest.TestCase):
         # Delete the function directly
         self.assertTrue(self.canvas.delete_function(function_name))
 
-        # Function should be removed, points remain (independent)
+        # Function should be removed, the scatter plot remains (independent)
         self.assertNotIn(function_name, self._names_for_class("Function"))
-        for pt in point_names:
-            self.assertIn(pt, self._names_for_class("Point"))
+        self.assertIn(scatter_name, self._names_for_class("ScatterPlot"))
 
     # -------------------------------------------------------------------------
     # Case insensitivity test
@@ -535,9 +554,9 @@ class TestRegressionCanvas(unittest.TestCase):
             point_color=None,
         )
 
-        # Points should be created by default
-        self.assertIn("point_names", result)
-        self.assertEqual(len(result["point_names"]), 3)
+        # Points should be plotted by default
+        self.assertIn("scatter_name", result)
+        self.assertEqual(result["point_count"], 3)
 
     def test_fit_regression_with_curve_color(self) -> None:
         result = self.canvas.fit_regression(
@@ -590,7 +609,7 @@ class TestRegressionCanvas(unittest.TestCase):
 
         self.assertAlmostEqual(result["coefficients"]["m"], 2.0, places=6)
         self.assertAlmostEqual(result["coefficients"]["b"], 0.0, places=6)
-        self.assertEqual(len(result.get("point_names", [])), 5)
+        self.assertEqual(result["point_count"], 5)
 
     def test_fit_regression_multiple_independent_regressions(self) -> None:
         r1 = self.canvas.fit_regression(
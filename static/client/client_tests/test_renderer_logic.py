@@ -2,15 +2,21 @@ from __future__ import annotations
 
 import unittest
 from types import SimpleNamespace
+from typing import Any
+from unittest import mock
 
+from coordinate_mapper import CoordinateMapper
 from drawables.bar import Bar
+from drawables.point import Point
+from drawables.segment import Segment
+from rendering import canvas2d_renderer, svg_renderer
 from rendering import cached_render_plan as optimized
 from rendering import shared_drawable_renderers as shared
 from rendering import style_manager
-from rendering.canvas2d_renderer import Canvas2DRenderer
+from rendering.canvas2d_renderer import Canvas2DRenderer, Canvas2DTelemetry
 from rendering.canvas2d_primitive_adapter import Canvas2DPrimitiveAdapter
 from rendering.primitives import FontStyle
-from rendering.svg_renderer import SvgRenderer
+from rendering.svg_renderer import SvgRenderer, SvgTelemetry
 from rendering.webgl_renderer import WebGLRenderer
 
 
@@ -157,5 +163,97 @@ class TestRendererLogic(unittest.TestCase):
         self.assertLessEqual(int(snap2.get("font_cache_entries", 0) or 0), 64)
         self.assertEqual(int(snap1.get("font_cache_entries", 0) or 0), int(snap2.get("font_cache_entries", 0) or 0))
 
+    def test_telemetry_reports_requested_versus_executed_draws(self) -> None:
+        for telemetry in (Canvas2DTelemetry(), SvgTelemetry()):
+            for _ in range(3):
+                telemetry.record_draw_request()
+            telemetry.begin_frame()
+            snapshot = telemetry.drain()
+            self.assertEqual(snapshot["draw_requests"], 3)
+            self.assertEqual(snapshot["frames"], 1)
+            self.assertEqual(telemetry.snapshot()["draw_requests"], 0)
+
+    def test_drawable_version_bumps_on_mutation_and_dependencies(self) -> None:
+        p1 = Point(0, 0, name="A")
+        p2 = Point(3, 4, name="B")
+        segment = Segment(p1, p2)
+        start = segment.get_render_version()
+
+        self.assertEqual(segment.get_render_version(), start)
+        p1.x = 1.0
+        moved = segment.get_render_version()
+        self.assertGreater(moved, start)
+
+        segment.color = "red"
+        recolored = segment.get_render_version()
+        self.assertGreater(recolored, moved)
+
+        p2.label.translate(1.0, 1.0)
+        self.assertGreater(p2.get_render_version(), p2.get_version())
+        self.assertGreater(segment.get_render_version(), recolored)
+
+    def test_rewriting_equal_values_keeps_version(self) -> None:
+        point = Point(3, 4, name="B")
+        segment = Segment(Point(0, 0, name="A"), point)
+        start = segment.get_render_version()
+
+        point.x = 3.0
+        point.name = "B"
+        segment.color = segment.color
+        self.assertEqual(segment.get_render_version(), start)
+
+        segment.color = "red"
+        recolored = segment.get_version()
+        self.assertGreater(recolored, start)
+        self.assertEqual(segment.get_render_version(), recolored)
+
+    def _make_plan_cache_renderer(self, renderer_cls: type, telemetry: object) -> Any:
+        renderer = renderer_cls.__new__(renderer_cls)
+        renderer.style = style_manager.get_renderer_style()
+        renderer._telemetry = telemetry
+        renderer._plan_cache = {}
+        renderer._frame_index = 0
+        renderer._shared_primitives = SimpleNamespace()
+        return renderer
+
+    def test_plan_cache_reuses_plan_without_hashing_state(self) -> None:
+        mapper = CoordinateMapper(400, 300)
+        point = Point(1, 2, name="A")
+        renderer = self._make_plan_cache_renderer(Canvas2DRenderer, Canvas2DTelemetry())
+        map_state = renderer._capture_map_state(mapper)
+
+        def resolve() -> object:
+            signature = renderer._compute_render_signature(point, mapper)
+            return renderer._resolve_drawable_plan(point, mapper, map_state, signature, "Point", "Point:A")
+
+        real_build = canvas2d_renderer.build_plan_for_drawable
+        with mock.patch.object(canvas2d_renderer, "build_plan_for_drawable", side_effect=real_build) as build:
+            with mock.patch.object(Point, "get_state", side_effect=AssertionError("state hashed")):
+                first = resolve()
+                self.assertIs(resolve(), first)
+                self.assertEqual(build.call_count, 1)
+
+                point.translate(1.0, 0.0)
+                self.assertIsNot(resolve(), first)
+                self.assertEqual(build.call_count, 2)
+
+    def test_plan_cache_evicts_entries_for_drawables_no_longer_rendered(self) -> None:
+        cases = (
+            (canvas2d_renderer, Canvas2DRenderer, Canvas2DTelemetry()),
+            (svg_renderer, SvgRenderer, SvgTelemetry()),
+        )
+        for module, renderer_cls, telemetry in cases:
+            renderer = self._make_plan_cache_renderer(renderer_cls, telemetry)
+            renderer._plan_cache = {
+                "Point:live": {"plan": None, "signature": (1,), "frame": 0},
+                "Point:deleted": {"plan": None, "signature": (2,), "frame": 0},
+            }
+            with mock.patch.object(module, "plan_cache_idle_frames", 4):
+                for frame in range(1, 9):
+                    renderer._frame_index = frame
+                    renderer._plan_cache["Point:live"]["frame"] = frame
+                    renderer._evict_idle_plan_entries()
+            self.assertEqual(list(renderer._plan_cache), ["Point:live"])
+
 
 __all__ = ["TestRendererLogic"]
@@ -71,6 +71,33 @@ class TestGetResultsTraced(unittest.TestCase):
         self.assertTrue(traced[0]["is_error"])
         self.assertIn("Error", str(results.get("fail_func", "")))
 
+    def test_batch_redraws_canvas_once(self) -> None:
+        frames: list[int] = []
+        self.canvas.draw_enabled = True
+        self.canvas._draw_now = lambda apply_zoom: frames.append(1)
+
+        def draw_twice(**kwargs: Any) -> str:
+            self.canvas.draw()
+            self.canvas.draw()
+            return "ok"
+
+        def fail_after_draw(**kwargs: Any) -> str:
+            self.canvas.draw()
+            raise ValueError("intentional error")
+
+        available_functions: Dict[str, Any] = {"draw_twice": draw_twice, "fail_after_draw": fail_after_draw}
+        calls = [
+            {"function_name": "draw_twice", "arguments": {}},
+            {"function_name": "fail_after_draw", "arguments": {}},
+            {"function_name": "draw_twice", "arguments": {}},
+        ]
+        ProcessFunctionCalls.get_results_traced(calls, available_functions, (), self.canvas)
+        self.assertEqual(len(frames), 1)
+        self.assertFalse(self.canvas.is_drawing_deferred())
+
+        ProcessFunctionCalls.get_results(calls, available_functions, (), self.canvas)
+        self.assertEqual(len(frames), 2)
+
     def test_same_results_as_get_results(self) -> None:
         """get_results_traced should produce identical results dict as get_results."""
         available_functions: Dict[str, Any] = {
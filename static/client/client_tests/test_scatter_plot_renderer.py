@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import unittest
+
+from coordinate_mapper import CoordinateMapper
+from drawables.scatter_plot import ScatterPlot
+from rendering import shared_drawable_renderers as shared
+from rendering.cached_render_plan import PrimitiveCommand, build_plan_for_drawable
+from rendering.canvas2d_primitive_adapter import Canvas2DPrimitiveAdapter
+from rendering.primitives import FillStyle
+from rendering.style_manager import get_renderer_style
+
+from .test_renderer_primitives import MockCanvasElement
+
+
+class RecordingPrimitives(shared.RendererPrimitives):
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, tuple, dict]] = []
+
+    def begin_shape(self) -> None:
+        self.calls.append(("begin_shape", (), {}))
+
+    def end_shape(self) -> None:
+        self.calls.append(("end_shape", (), {}))
+
+    def fill_circle(self, center, radius, fill, stroke=None, **kwargs):
+        self.calls.append(("fill_circle", (center, radius, fill, stroke), dict(kwargs)))
+
+    # The remaining primitives are not needed for these tests.
+    def stroke_line(self, *_args, **_kwargs):
+        raise NotImplementedError
+
+    def stroke_polyline(self, *_args, **_kwargs):
+        raise NotImplementedError
+
+    def stroke_circle(self, *_args, **_kwargs):
+        raise NotImplementedError
+
+    def fill_polygon(self, *_args, **_kwargs):
+        raise NotImplementedError
+
+    def draw_text(self, *_args, **_kwargs):
+        raise NotImplementedError
+
+    def stroke_ellipse(self, *_args, **_kwargs):
+        raise NotImplementedError
+
+    def fill_joined_area(self, *_args, **_kwargs):
+        raise NotImplementedError
+
+    def stroke_arc(self, *_args, **_kwargs):
+        raise NotImplementedError
+
+    def clear_surface(self, *_args, **_kwargs):
+        raise NotImplementedError
+
+    def resize_surface(self, *_args, **_kwargs):
+        raise NotImplementedError
+
+
+class SimpleCoordinateMapper:
+    def __init__(self, scale: float = 10.0) -> None:
+        self.scale = float(scale)
+
+    def math_to_screen(self, x: float, y: float):
+        return (float(x) * self.scale, float(y) * self.scale)
+
+
+class TestScatterPlotRenderer(unittest.TestCase):
+    def setUp(self) -> None:
+        self.primitives = RecordingPrimitives()
+        self.mapper = SimpleCoordinateMapper(scale=10.0)
+        self.style = {"point_radius": 4, "point_color": "#000"}
+
+    def test_renders_one_shape_with_a_circle_per_sample(self) -> None:
+        scatter = ScatterPlot("S", x_values=[1.0, 2.0, 3.0], y_values=[0.0, 1.0, 2.0], color="#f00")
+        shared.render_scatter_plot_helper(self.primitives, scatter, self.mapper, self.style)
+
+        ops = [call[0] for call in self.primitives.calls]
+        self.assertEqual(ops, ["begin_shape", "fill_circle", "fill_circle", "fill_circle", "end_shape"])
+        circles = [call for call in self.primitives.calls if call[0] == "fill_circle"]
+        self.assertEqual([c[1][0] for c in circles], [(10.0, 0.0), (20.0, 10.0), (30.0, 20.0)])
+        fills = {id(c[1][2]) for c in circles}
+        self.assertEqual(len(fills), 1)
+        self.assertEqual(circles[0][1][1], 4.0)
+        self.assertEqual(circles[0][1][2].color, "#f00")
+        self.assertTrue(all(c[2].get("screen_space") for c in circles))
+
+    def test_point_radius_overrides_style(self) -> None:
+        scatter = ScatterPlot("S", x_values=[1.0], y_values=[1.0], point_radius=2.5)
+        shared.render_scatter_plot_helper(self.primitives, scatter, self.mapper, self.style)
+
+        circles = [call for call in self.primitives.calls if call[0] == "fill_circle"]
+        self.assertEqual(circles[0][1][1], 2.5)
+
+    def test_skips_non_finite_samples_and_empty_plots(self) -> None:
+        scatter = ScatterPlot("S", x_values=[1.0, float("nan"), 2.0], y_values=[1.0, 1.0, float("inf")])
+        shared.render_scatter_plot_helper(self.primitives, scatter, self.mapper, self.style)
+        circles = [call for call in self.primitives.calls if call[0] == "fill_circle"]
+        self.assertEqual(len(circles), 1)
+
+        self.primitives.calls.clear()
+        shared.render_scatter_plot_helper(self.primitives, ScatterPlot("E", x_values=[], y_values=[]), self.mapper, {})
+        self.assertEqual(self.primitives.calls, [])
+
+    def test_plan_records_one_command_per_sample(self) -> None:
+        mapper = CoordinateMapper(400, 300)
+        scatter = ScatterPlot("S", x_values=[float(i) for i in range(50)], y_values=[0.5 * i for i in range(50)])
+        plan = build_plan_for_drawable(scatter, mapper, get_renderer_style())
+
+        self.assertIsNotNone(plan)
+        circles = [command for command in plan.commands if command.op == "fill_circle"]
+        self.assertEqual(len(circles), 50)
+
+
+class TestCanvas2DCircleBatching(unittest.TestCase):
+    def setUp(self) -> None:
+        self.canvas_el = MockCanvasElement()
+        self.adapter = Canvas2DPrimitiveAdapter(self.canvas_el)
+        self.log = self.canvas_el._ctx.log
+
+    def _ops(self, name: str) -> list:
+        return [entry for entry in self.log if entry[0] == name]
+
+    def test_same_style_circles_share_one_fill(self) -> None:
+        mapper = CoordinateMapper(400, 300)
+        scatter = ScatterPlot("S", x_values=[float(i) for i in range(20)], y_values=[0.0] * 20, color="#00f")
+        plan = build_plan_for_drawable(scatter, mapper, get_renderer_style())
+        self.log.clear()
+
+        plan.apply(self.adapter)
+
+        self.assertEqual(len(self._ops("arc")), 20)
+        self.assertEqual(len(self._ops("fill")), 1)
+        self.assertEqual(len(self._ops("beginPath")), 1)
+
+    def test_style_change_starts_a_new_fill(self) -> None:
+        red = FillStyle(color="#f00")
+        blue = FillStyle(color="#00f")
+        self.adapter.begin_batch()
+        for index, (x, fill) in enumerate([(1.0, red), (5.0, red), (9.0, blue)]):
+            command = PrimitiveCommand("fill_circle", ((x, 1.0), 2.0, fill), {"screen_space": True}, f"c{index}")
+            self.adapter.execute_optimized(command)
+        self.adapter.end_batch()
+
+        fills = self._ops("fill")
+        self.assertEqual(len(fills), 2)
+        self.assertEqual([entry[1] for entry in fills], ["#f00", "#00f"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -181,3 +181,21 @@ class TestTTSControllerErrorHandling(unittest.TestCase):
 
         # Should not raise
         controller._notify_error("Test error")
+
+
+class TestTTSControllerStreamResponse(unittest.TestCase):
+    """Test cases for reading the stream URL from /api/tts/stream."""
+
+    def test_extract_stream_url(self) -> None:
+        """Test that the audio URL is read from the response data."""
+        controller = TTSController()
+        req = SimpleMock(responseText='{"status": "success", "data": {"stream_id": "abc", "url": "/api/tts/stream/abc"}}')
+
+        self.assertEqual(controller._extract_stream_url(req), "/api/tts/stream/abc")
+
+    def test_extract_stream_url_malformed_response(self) -> None:
+        """Test that malformed responses yield no URL."""
+        controller = TTSController()
+
+        self.assertIsNone(controller._extract_stream_url(SimpleMock(responseText="not json")))
+        self.assertIsNone(controller._extract_stream_url(SimpleMock(responseText='{"data": {}}')))
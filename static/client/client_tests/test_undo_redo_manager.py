@@ -1,23 +1,47 @@
 from __future__ import annotations
 
 import unittest
-from unittest.mock import MagicMock
+from typing import Any, Dict
+from unittest.mock import MagicMock, patch
 
+from drawables.drawable import Drawable
+from managers.drawable_dependency_manager import DrawableDependencyManager
 from managers.undo_redo_manager import UndoRedoManager
 from .simple_mock import SimpleMock
 
 
+class _FakePoint(Drawable):
+    def __init__(self, name: str, x: float = 0.0) -> None:
+        super().__init__(name=name, color="black")
+        self.x = x
+
+    def get_class_name(self) -> str:
+        return "Point"
+
+    def get_state(self) -> Dict[str, Any]:
+        return {"name": self.name, "args": {"x": self.x}}
+
+
+class _FakeSegment(Drawable):
+    def __init__(self, name: str, point1: _FakePoint, point2: _FakePoint) -> None:
+        super().__init__(name=name, color="black")
+        self.point1 = point1
+        self.point2 = point2
+
+    def get_class_name(self) -> str:
+        return "Segment"
+
+    def get_state(self) -> Dict[str, Any]:
+        return {"name": self.name, "args": {"p1": self.point1.name, "p2": self.point2.name}}
+
+
 class TestUndoRedoManager(unittest.TestCase):
     def setUp(self) -> None:
         self.drawables = SimpleMock(
             _drawables={"Points": [], "Segments": []},
             rebuild_renderables=MagicMock(),
         )
-        self.dependency_manager = SimpleMock(
-            _parents={},
-            _children={},
-            analyze_drawable_for_dependencies=MagicMock(),
-        )
+        self.dependency_manager = DrawableDependencyManager()
         self.canvas = SimpleMock(
             drawable_manager=SimpleMock(drawables=self.drawables),
             computations=[],
@@ -35,39 +59,194 @@ class TestUndoRedoManager(unittest.TestCase):
         self.manager.archive()
         self.assertEqual(len(self.manager.undo_stack), 1)
 
-    def test_push_undo_state_deep_copies_and_clears_redo(self) -> None:
-        self.manager.redo_stack = [{"drawables": {}, "computations": []}]
-        state = {"drawables": {"Points": [SimpleMock(name="A")]}, "computations": [1]}
+    def test_undo_and_redo_restore_mutation_in_place(self) -> None:
+        point = _FakePoint("A", 1.0)
+        self.drawables._drawables["Points"] = [point]
+        self.manager.archive()
+        point.x = 5.0
+
+        self.assertTrue(self.manager.undo())
+        self.assertIs(self.drawables._drawables["Points"][0], point)
+        self.assertEqual(point.x, 1.0)
+
+        self.assertTrue(self.manager.redo())
+        self.assertIs(self.drawables._drawables["Points"][0], point)
+        self.assertEqual(point.x, 5.0)
+
+    def test_undo_removes_created_and_restores_deleted_drawables(self) -> None:
+        a = _FakePoint("A")
+        b = _FakePoint("B")
+        self.drawables._drawables["Points"] = [a, b]
+        self.manager.archive()
+        c = _FakePoint("C")
+        self.drawables._drawables["Points"].remove(a)
+        self.drawables._drawables["Points"].append(c)
+
+        self.manager.undo()
+        self.assertEqual([p.name for p in self.drawables._drawables["Points"]], ["A", "B"])
+        self.assertIs(self.drawables._drawables["Points"][0], a)
+
+        self.manager.redo()
+        self.assertEqual([p.name for p in self.drawables._drawables["Points"]], ["B", "C"])
+        self.assertIs(self.drawables._drawables["Points"][1], c)
+
+    def test_undo_keeps_references_between_drawables(self) -> None:
+        a = _FakePoint("A")
+        b = _FakePoint("B")
+        segment = _FakeSegment("AB", a, b)
+        self.drawables._drawables["Points"] = [a, b]
+        self.drawables._drawables["Segments"] = [segment]
+        self.manager.archive()
+        self.drawables._drawables["Segments"].remove(segment)
+        a.x = 3.0
+
+        self.manager.undo()
+        restored = self.drawables._drawables["Segments"][0]
+        self.assertIs(restored, segment)
+        self.assertIs(restored.point1, a)
+        self.assertEqual(a.x, 0.0)
+
+    def test_entry_records_only_changed_drawables(self) -> None:
+        points = [_FakePoint(f"P{i}", float(i)) for i in range(50)]
+        self.drawables._drawables["Points"] = list(points)
+        self.manager.archive()
+        points[10].x = -1.0
+        self.manager.archive()
+
+        entry = self.manager.undo_stack[-2]
+        self.assertEqual(len(entry.records), 1)
+        self.assertEqual(entry.cost(), 2)
+
+    def test_archive_examines_only_mutated_drawables(self) -> None:
+        points = [_FakePoint(f"P{i}", float(i)) for i in range(200)]
+        self.drawables._drawables["Points"] = list(points)
+        self.manager.archive()
+        points[7].x = -1.0
+
+        with patch.object(self.manager, "_version_of", wraps=self.manager._version_of) as spy:
+            self.manager.archive()
 
-        self.manager.push_undo_state(state)
-        state["computations"].append(2)
+        self.assertLess(spy.call_count, 5)
+        self.assertEqual(list(self.manager.undo_stack[-2].records), [id(points[7])])
+
+    def test_undo_restores_attributes_missing_from_state(self) -> None:
+        point = _FakePoint("A")
+        self.drawables._drawables["Points"] = [point]
+        self.manager.archive()
+        point.label_offset = (3, 4)
+
+        self.assertTrue(self.manager.undo())
+        self.assertFalse(hasattr(point, "label_offset"))
+        self.assertTrue(self.manager.redo())
+        self.assertEqual(point.label_offset, (3, 4))
+
+    def test_undo_bumps_restored_drawable_version(self) -> None:
+        point = _FakePoint("A", 1.0)
+        self.drawables._drawables["Points"] = [point]
+        self.manager.archive()
+        point.x = 2.0
+        version = point.get_version()
+
+        self.assertTrue(self.manager.undo())
+        self.assertGreater(point.get_version(), version)
+        self.assertTrue(self.manager._collect_changes().is_empty())
+
+    def test_push_undo_state_commits_single_entry_and_clears_redo(self) -> None:
+        self.drawables._drawables["Points"] = [_FakePoint("A")]
+        self.manager.archive()
+        self.manager.undo()
+        self.assertEqual(len(self.manager.redo_stack), 1)
+
+        baseline = self.manager.capture_state()
+        self.manager.suspend_archiving()
+        self.drawables._drawables["Points"].append(_FakePoint("B"))
+        self.manager.archive()
+        self.drawables._drawables["Points"].append(_FakePoint("C"))
+        self.manager.push_undo_state(baseline)
+        self.manager.resume_archiving()
 
         self.assertEqual(len(self.manager.undo_stack), 1)
-        stored = self.manager.undo_stack[0]
-        self.assertEqual(stored["computations"], [1])
         self.assertEqual(self.manager.redo_stack, [])
+        self.manager.undo()
+        self.assertEqual([p.name for p in self.drawables._drawables["Points"]], ["A"])
 
     def test_restore_state_rebuilds_dependencies_and_redraws(self) -> None:
-        p1 = SimpleMock(name="P1")
-        s1 = SimpleMock(name="S1")
-        state = {
-            "drawables": {"Points": [p1], "Segments": [s1]},
-            "computations": [{"expression": "2+2", "result": 4}],
-        }
+        p1 = _FakePoint("P1")
+        self.drawables._drawables["Points"] = [p1]
+        self.canvas.computations = [{"expression": "2+2", "result": 4}]
+        state = self.manager.capture_state()
+        p1.x = 9.0
+        self.drawables._drawables["Segments"] = [_FakeSegment("S1", p1, p1)]
+        self.canvas.computations = []
 
         self.manager.restore_state(state)
 
         self.drawables.rebuild_renderables.assert_called_once()
         self.canvas.draw.assert_called_once()
         self.assertEqual(self.canvas.computations, [{"expression": "2+2", "result": 4}])
-        self.assertEqual(self.dependency_manager.analyze_drawable_for_dependencies.call_count, 2)
+        self.assertEqual(p1.x, 0.0)
+        self.assertNotIn("Segments", self.drawables._drawables)
+        self.assertEqual(self.dependency_manager.get_children(p1), set())
+        self.assertEqual(self.dependency_manager._object_lookup, {})
 
-    def test_capture_state_returns_deep_copy(self) -> None:
+    def test_nested_checkpoint_restores_only_inner_changes(self) -> None:
+        self.drawables._drawables["Points"] = [_FakePoint("A")]
+        outer = self.manager.capture_state()
+        self.manager.suspend_archiving()
+        self.drawables._drawables["Points"].append(_FakePoint("B"))
+        inner = self.manager.capture_state()
+        self.drawables._drawables["Points"].append(_FakePoint("C"))
+
+        self.manager.restore_state(inner, redraw=False)
+        self.assertEqual([p.name for p in self.drawables._drawables["Points"]], ["A", "B"])
+
+        self.manager.push_undo_state(outer)
+        self.manager.resume_archiving()
+        self.manager.undo()
+        self.assertEqual([p.name for p in self.drawables._drawables["Points"]], ["A"])
+
+    def test_capture_state_copies_computations(self) -> None:
         self.canvas.computations = [{"expression": "x", "result": 1}]
-        point = SimpleMock(name="P")
-        self.drawables._drawables = {"Points": [point]}
 
         snapshot = self.manager.capture_state()
         self.canvas.computations[0]["result"] = 99
 
         self.assertEqual(snapshot["computations"][0]["result"], 1)
+
+    def test_memory_budget_evicts_oldest_entries(self) -> None:
+        self.manager.memory_budget = 4
+        self.drawables._drawables["Points"] = []
+        for index in range(6):
+            self.manager.archive()
+            self.drawables._drawables["Points"].append(_FakePoint(f"P{index}"))
+        self.manager.archive()
+
+        self.assertLessEqual(self.manager.get_history_cost(), 4)
+        self.assertLess(len(self.manager.undo_stack), 7)
+        while self.manager.undo():
+            pass
+        self.assertGreater(len(self.drawables._drawables.get("Points", [])), 0)
+
+    def test_undo_refreshes_only_touched_dependencies(self) -> None:
+        a, b, c = _FakePoint("A"), _FakePoint("B"), _FakePoint("C")
+        segment = _FakeSegment("S", a, b)
+        other = _FakeSegment("T", b, c)
+        self.drawables._drawables["Points"] = [a, b, c]
+        self.drawables._drawables["Segments"] = [segment, other]
+        for drawable in (segment, other):
+            self.dependency_manager.analyze_drawable_for_dependencies(drawable)
+        self.manager.archive()
+
+        segment.point2 = c
+        self.dependency_manager.unregister_dependency(segment, b)
+        self.dependency_manager.register_dependency(segment, c)
+        self.assertEqual(self.dependency_manager.get_all_children(b), {other})
+
+        self.assertTrue(self.manager.undo())
+        self.assertEqual(self.dependency_manager.get_parents(segment), {a, b})
+        self.assertEqual(self.dependency_manager.get_all_children(b), {segment, other})
+        self.assertEqual(self.dependency_manager.get_parents(other), {b, c})
+
+        self.assertTrue(self.manager.redo())
+        self.assertEqual(self.dependency_manager.get_parents(segment), {a, c})
+        self.assertEqual(self.dependency_manager.get_all_children(c), {segment, other})
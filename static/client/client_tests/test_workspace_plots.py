@@ -145,3 +145,31 @@ class TestWorkspacePlotsRestore(unittest.TestCase):
         self.assertNotIn("MyBars", self._names_for_class(canvas2, "DiscretePlot"))
         self.assertNotIn("Poll", self._names_for_class(canvas2, "BarsPlot"))
         self.assertNotIn("MyPlot", self._names_for_class(canvas2, "ContinuousPlot"))
+
+    def test_restore_workspace_rebuilds_scatter_plot(self) -> None:
+        canvas1 = Canvas(500, 500, draw_enabled=False)
+        canvas1.fit_regression(
+            name="Fit",
+            x_data=[1.0, 2.0, 3.0, 4.0],
+            y_data=[2.0, 4.1, 5.9, 8.0],
+            model_type="linear",
+            show_points=True,
+        )
+
+        state = canvas1.get_canvas_state()
+        scatters = state.get("ScatterPlots")
+        self.assertIsInstance(scatters, list)
+        self.assertEqual(len(scatters), 1)
+        self.assertEqual(scatters[0]["args"]["x_values"], [1.0, 2.0, 3.0, 4.0])
+        self.assertNotIn("Points", state)
+
+        canvas2 = Canvas(500, 500, draw_enabled=False)
+        manager = WorkspaceManager(canvas2)
+        manager._restore_workspace_state(state)
+
+        restored = canvas2.get_drawables_by_class_name("ScatterPlot")
+        self.assertEqual(len(restored), 1)
+        self.assertEqual(restored[0].y_values, (2.0, 4.1, 5.9, 8.0))
+
+        self.assertTrue(canvas2.delete_plot(restored[0].name))
+        self.assertEqual(canvas2.get_drawables_by_class_name("ScatterPlot"), [])
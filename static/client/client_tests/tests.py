@@ -6,7 +6,12 @@ from typing import Any, Callable, Dict, List, Tuple, Type, cast
 
 from browser import aio
 
-from .test_canvas import TestCanvas, TestCanvasHelperMethods
+from .test_canvas import (
+    TestCanvas,
+    TestCanvasDrawScheduling,
+    TestCanvasHelperMethods,
+    TestCanvasViewportCulling,
+)
 from .test_cartesian import TestCartesian2Axis
 from .test_circle import TestCircle
 from .test_circle_arc import TestCircleArc
@@ -17,7 +22,12 @@ from .test_drawable_manager import (
     TestDrawableManagerColoredAreaDelegation,
 )
 from .test_drawable_name_generator import TestDrawableNameGenerator
-from .test_drawables_container import TestDrawablesContainer
+from .test_drawables_container import (
+    TestDrawablesContainer,
+    TestDrawablesContainerIndexes,
+    TestDrawablesContainerRenderBounds,
+)
+from .test_bounds_index import TestBoundsIndex
 from .test_ellipse import TestEllipse
 from .test_event_handler import TestCanvasEventHandlerTouch
 from .test_chat_message_menu import TestChatMessageMenu
@@ -38,7 +48,7 @@ from .test_function_calling import TestProcessFunctionCalls, TestProcessFunction
 from .test_math_functions import TestMathFunctions, TestNumberTheory
 from .test_periodicity_detection import TestPeriodicityDetection, TestPeriodicityEdgeCases
 from .test_geometry_utils import TestGeometryUtils, TestConvexHull, TestPointInConvexHull
-from .test_graph_layout import TestGraphLayout, TestGraphLayoutVisibility
+from .test_graph_layout import TestGraphLayout, TestGraphLayoutCrossingIndex, TestGraphLayoutVisibility
 from .test_graph_manager import TestGraphManager
 from .test_graph_analyzer import (
     TestAnalyzeGraphShortestPath,
@@ -144,6 +154,12 @@ from .test_zoom import (
 )
 from .test_function_bounded_colored_area_integration import TestFunctionBoundedColoredAreaIntegration
 from .renderer_performance_tests import TestRendererPerformance
+from .undo_redo_performance_tests import TestUndoRedoPerformance
+from .dependency_graph_performance_tests import TestDependencyGraphPerformance
+from .drawables_index_performance_tests import TestDrawablesIndexPerformance
+from .numeric_solver_performance_tests import TestNumericSolverPerformance
+from .graph_layout_performance_tests import TestGraphLayoutPerformance
+from .viewport_culling_performance_tests import TestViewportCullingPerformance
 from .test_optimized_renderers import TestOptimizedRendererParity
 from .test_renderer_primitives import TestRendererPrimitives
 from .test_renderer_logic import TestRendererLogic
@@ -159,6 +175,8 @@ from .test_drawable_renderers import (
 )
 from .test_point_manager import TestPointManagerUpdates
 from .test_bar_renderer import TestBarRenderer
+from .test_scatter_plot_renderer import TestCanvas2DCircleBatching, TestScatterPlotRenderer
+from .test_lazy_module_loader import TestLazyChunkFinder
 from .test_function_renderables import (
     TestFunctionRenderable,
     TestFunctionsBoundedAreaRenderable,
@@ -193,6 +211,7 @@ from .test_transformations_manager import TestTransformationsManager
 from .test_transforms import TestTransforms
 from .test_area_expression_evaluator import (
     TestAreaCalculation,
+    TestExactBooleanOperations,
     TestRegionGeneration,
 )
 from .test_polar_grid import TestPolarGrid, TestPolarGridConversions
@@ -236,6 +255,7 @@ from .test_numeric_solver import (
     TestNumericSolverFallback,
     TestJacobianComputation,
     TestExpressionEvaluation,
+    TestCompiledSystem,
 )
 from .test_error_recovery import TestErrorRecovery
 from .test_tts_controller import (
@@ -341,6 +361,12 @@ class Tests:
         return [
             TestOptimizedRendererParity,
             # TestRendererPerformance,
+            TestUndoRedoPerformance,
+            # TestDependencyGraphPerformance,
+            # TestDrawablesIndexPerformance,
+            # TestNumericSolverPerformance,
+            # TestGraphLayoutPerformance,
+            # TestViewportCullingPerformance,
             # TestRendererPrimitives,
             TestRendererLogic,
             TestChatMessageMenu,
@@ -348,6 +374,9 @@ class Tests:
             TestScreenOffsetLabelLayout,
             TestBarManager,
             TestBarRenderer,
+            TestScatterPlotRenderer,
+            TestCanvas2DCircleBatching,
+            TestLazyChunkFinder,
             TestVectorRenderer,
             TestAngleRenderer,
             TestEllipseRenderer,
@@ -388,6 +417,7 @@ class Tests:
             TestPointInConvexHull,
             TestGraphLayout,
             TestGraphLayoutVisibility,
+            TestGraphLayoutCrossingIndex,
             TestGraphManager,
             TestGraphUtils,
             TestStatisticsDistributions,
@@ -483,6 +513,8 @@ class Tests:
             TestSegmentsBoundedColoredArea,
             TestCartesian2Axis,
             TestCanvas,
+            TestCanvasDrawScheduling,
+            TestCanvasViewportCulling,
             TestCanvasHelperMethods,
             TestZoomXAxisRange,
             TestZoomYAxisRange,
@@ -500,6 +532,9 @@ class Tests:
             TestDrawableManagerRegionLookup,
             TestDrawableManagerColoredAreaDelegation,
             TestDrawablesContainer,
+            TestDrawablesContainerIndexes,
+            TestDrawablesContainerRenderBounds,
+            TestBoundsIndex,
             TestFunctionBoundedColoredAreaIntegration,
             TestLinearAlgebraUtils,
             TestCoerceFontSize,
@@ -509,6 +544,7 @@ class Tests:
             TestFilterValidPoints,
             TestRenderColoredAreaHelper,
             TestAreaCalculation,
+            TestExactBooleanOperations,
             TestRegionGeneration,
             TestPolarGrid,
             TestPolarGridConversions,
@@ -545,6 +581,7 @@ class Tests:
             TestNumericSolverFallback,
             TestJacobianComputation,
             TestExpressionEvaluation,
+            TestCompiledSystem,
             TestErrorRecovery,
             TestTTSControllerState,
             TestTTSControllerSettings,
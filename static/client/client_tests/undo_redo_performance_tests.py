@@ -0,0 +1,157 @@
+"""Undo/redo history benchmark comparing full snapshots with delta entries."""
+
+from __future__ import annotations
+
+import copy
+import random
+import time
+import unittest
+from typing import Any, Callable, Dict, List
+
+from canvas import Canvas
+from drawables.circle import Circle
+from drawables.point import Point
+from drawables.segment import Segment
+
+
+# Baseline workload: 1,000 drawables split across common construction types
+UNDO_SCENE: Dict[str, Any] = {
+    "seed": 7,
+    "points": 600,
+    "segments": 300,
+    "circles": 100,
+}
+
+
+def _populate_scene(canvas: Canvas, spec: Dict[str, Any]) -> int:
+    # Build drawables directly so scene setup does not dominate the benchmark
+    rng = random.Random(spec.get("seed", 7))
+    drawables = canvas.drawable_manager.drawables
+    dependency_manager = canvas.dependency_manager
+    points: List[Point] = []
+    for index in range(spec.get("points", 0)):
+        point = Point(rng.uniform(-500, 500), rng.uniform(-500, 500), name=f"P{index}")
+        drawables.add(point)
+        points.append(point)
+    for index in range(spec.get("segments", 0)):
+        p1, p2 = rng.sample(points, 2)
+        segment = Segment(p1, p2)
+        drawables.add(segment)
+        dependency_manager.analyze_drawable_for_dependencies(segment)
+    for index in range(spec.get("circles", 0)):
+        circle = Circle(rng.choice(points), rng.uniform(1, 20))
+        drawables.add(circle)
+        dependency_manager.analyze_drawable_for_dependencies(circle)
+    canvas.undo_redo_manager.clear()
+    return len(drawables.get_all())
+
+
+def _legacy_snapshot(canvas: Canvas) -> Dict[str, Any]:
+    return {
+        "drawables": copy.deepcopy(canvas.drawable_manager.drawables._drawables),
+        "computations": copy.deepcopy(canvas.computations),
+    }
+
+
+def _time_ms(operation: Callable[[], Any], iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        operation()
+    return (time.perf_counter() - start) * 1000 / max(iterations, 1)
+
+
+def run_undo_redo_performance(*, scene_spec: Dict[str, Any] | None = None, iterations: int = 5) -> Dict[str, Any]:
+    """Time archive/undo/redo for full-snapshot and delta history on the same scene."""
+    spec: Dict[str, Any] = {**UNDO_SCENE, **(scene_spec or {})}
+    canvas = Canvas(500, 500, draw_enabled=False)
+    drawable_count = _populate_scene(canvas, spec)
+    undo_manager = canvas.undo_redo_manager
+    drawables = canvas.drawable_manager.drawables
+    target = drawables.Points[0]
+
+    def move_target() -> None:
+        target.update_position(target.x + 1.0, target.y)
+
+    # Legacy approach: deep copy the whole container on archive, undo, and redo
+    legacy_undo: List[Dict[str, Any]] = []
+    legacy_redo: List[Dict[str, Any]] = []
+
+    def legacy_archive() -> None:
+        legacy_undo.append(copy.deepcopy(_legacy_snapshot(canvas)))
+        legacy_redo.clear()
+        move_target()
+
+    def legacy_step(source: List[Dict[str, Any]], sink: List[Dict[str, Any]]) -> None:
+        state = source.pop()
+        sink.append(_legacy_snapshot(canvas))
+        drawables._drawables = copy.deepcopy(state["drawables"])
+        drawables.rebuild_renderables()
+        undo_manager._rebuild_dependency_graph()
+
+    legacy_archive_ms = _time_ms(legacy_archive, iterations)
+    legacy_undo_ms = _time_ms(lambda: legacy_step(legacy_undo, legacy_redo), iterations)
+    legacy_redo_ms = _time_ms(lambda: legacy_step(legacy_redo, legacy_undo), iterations)
+    legacy_snapshots = sum(len(bucket) for state in legacy_undo + legacy_redo for bucket in state["drawables"].values())
+
+    # Delta approach: the first archive commits the baseline once, then only changes are copied
+    canvas2 = Canvas(500, 500, draw_enabled=False)
+    _populate_scene(canvas2, spec)
+    undo_manager = canvas2.undo_redo_manager
+    drawables = canvas2.drawable_manager.drawables
+    target = drawables.Points[0]
+    undo_manager.archive()
+    undo_manager.clear()
+
+    # Count the drawables each history step compares against the baseline
+    examined: List[int] = []
+    version_of = undo_manager._version_of
+
+    def counting_version_of(drawable: Any) -> Any:
+        examined.append(id(drawable))
+        return version_of(drawable)
+
+    undo_manager._version_of = counting_version_of
+
+    def delta_archive() -> None:
+        undo_manager.archive()
+        move_target()
+
+    try:
+        delta_archive_ms = _time_ms(delta_archive, iterations)
+        delta_undo_ms = _time_ms(undo_manager.undo, iterations)
+        delta_redo_ms = _time_ms(undo_manager.redo, iterations)
+    finally:
+        del undo_manager._version_of
+
+    return {
+        "drawables": drawable_count,
+        "iterations": iterations,
+        "legacy": {
+            "archive_ms": legacy_archive_ms,
+            "undo_ms": legacy_undo_ms,
+            "redo_ms": legacy_redo_ms,
+            "stored_snapshots": legacy_snapshots,
+        },
+        "delta": {
+            "archive_ms": delta_archive_ms,
+            "undo_ms": delta_undo_ms,
+            "redo_ms": delta_redo_ms,
+            "stored_snapshots": undo_manager.get_history_cost(),
+            "examined_per_step": len(examined) / max(iterations * 3, 1),
+        },
+    }
+
+
+class TestUndoRedoPerformance(unittest.TestCase):
+    """Undo/redo benchmark executed via the client test suite."""
+
+    def test_undo_redo_performance(self) -> None:
+        result = run_undo_redo_performance(iterations=3)
+        print(f"[UndoRedoPerformance] {result}")
+
+        self.assertGreaterEqual(result["drawables"], 900)
+        legacy = result["legacy"]
+        delta = result["delta"]
+        self.assertLess(delta["stored_snapshots"], legacy["stored_snapshots"])
+        # History steps visit only the mutated drawables, not the whole scene
+        self.assertLess(delta["examined_per_step"], 10)
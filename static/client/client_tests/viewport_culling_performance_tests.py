@@ -0,0 +1,121 @@
+"""Viewport culling benchmark: full renderable iteration vs bounds-index queries while panning."""
+
+from __future__ import annotations
+
+import random
+import time
+import unittest
+from typing import Any, Dict, List
+
+from canvas import Canvas
+from drawables.point import Point
+from drawables.segment import Segment
+
+
+# A large scene viewed through a window that holds a small fraction of it
+CULLING_SCENE: Dict[str, Any] = {
+    "points": 5000,
+    "extent": 1000.0,
+    "window": 40.0,
+    "frames": 30,
+}
+
+
+class _WorkRenderer:
+    """Renderer stub doing the per-drawable work every backend does: version check and projection."""
+
+    SKIP_AUTO_CLEAR = True
+
+    def __init__(self) -> None:
+        self.rendered = 0
+
+    def clear(self) -> None:
+        pass
+
+    def render(self, drawable: Any, coordinate_mapper: Any) -> bool:
+        drawable.get_render_version()
+        if drawable.get_class_name() == "Point":
+            coordinate_mapper.math_to_screen(drawable.x, drawable.y)
+        self.rendered += 1
+        return True
+
+    def render_cartesian(self, cartesian: Any, coordinate_mapper: Any) -> None:
+        pass
+
+    def render_polar(self, polar_grid: Any, coordinate_mapper: Any) -> None:
+        pass
+
+    def register(self, cls: type, handler: Any) -> None:
+        pass
+
+    def register_default_drawables(self) -> None:
+        pass
+
+
+def _build_scene(canvas: Canvas, spec: Dict[str, Any], seed: int = 5) -> None:
+    rng = random.Random(seed)
+    half = spec["extent"] / 2
+    drawables = canvas.drawable_manager.drawables
+    points: List[Point] = []
+    for index in range(spec["points"]):
+        point = Point(rng.uniform(-half, half), rng.uniform(-half, half), name=f"P{index}")
+        drawables.add(point)
+        points.append(point)
+    # One segment per ten points; long ones cross the window and must survive culling
+    for index in range(0, len(points) - 1, 10):
+        drawables.add(Segment(points[index], points[index + 1]))
+
+
+def _pan_frames(canvas: Canvas, spec: Dict[str, Any], render_frame: Any) -> float:
+    size = spec["window"]
+    start = time.perf_counter()
+    for frame in range(spec["frames"]):
+        left = -size / 2 + frame * size / 10
+        canvas.coordinate_mapper.set_visible_bounds(left, left + size, size / 2, -size / 2)
+        render_frame()
+    return (time.perf_counter() - start) * 1000 / max(spec["frames"], 1)
+
+
+def run_viewport_culling_performance(*, scene_spec: Dict[str, Any] | None = None) -> Dict[str, Any]:
+    """Time pan frames over a zoomed-in window with and without viewport culling."""
+    spec: Dict[str, Any] = {**CULLING_SCENE, **(scene_spec or {})}
+    renderer = _WorkRenderer()
+    canvas = Canvas(800, 600, draw_enabled=False, renderer=renderer)  # type: ignore[arg-type]
+    _build_scene(canvas, spec)
+    total = len(canvas.drawable_manager.get_renderable_drawables())
+
+    def full_frame() -> None:
+        for drawable in canvas.drawable_manager.get_renderable_drawables():
+            canvas._render_drawable_with_renderer(renderer, drawable)
+
+    def culled_frame() -> None:
+        canvas._render_drawables(renderer, False)
+
+    renderer.rendered = 0
+    full_ms = _pan_frames(canvas, spec, full_frame)
+    full_rendered = renderer.rendered / spec["frames"]
+
+    renderer.rendered = 0
+    culled_ms = _pan_frames(canvas, spec, culled_frame)
+    culled_rendered = renderer.rendered / spec["frames"]
+
+    return {
+        "drawables": total,
+        "frames": spec["frames"],
+        "full": {"frame_ms": full_ms, "rendered_per_frame": full_rendered},
+        "culled": {"frame_ms": culled_ms, "rendered_per_frame": culled_rendered},
+    }
+
+
+class TestViewportCullingPerformance(unittest.TestCase):
+    """Viewport culling benchmark executed via the client test suite."""
+
+    def test_viewport_culling_performance(self) -> None:
+        result = run_viewport_culling_performance()
+        print(f"[ViewportCullingPerformance] {result}")
+
+        full = result["full"]
+        culled = result["culled"]
+        self.assertEqual(full["rendered_per_frame"], result["drawables"])
+        self.assertLess(culled["rendered_per_frame"], full["rendered_per_frame"] / 10)
+        self.assertLess(culled["frame_ms"], full["frame_ms"])
@@ -62,3 +62,9 @@ DEFAULT_RENDERER_MODE: str = "canvas2d"  # other options: "svg", "webgl"
 # ===== PERFORMANCE OPTIMIZATION CONSTANTS =====
 # Event throttling settings for smooth user experience
 mousemove_throttle_ms: int = 8  # Mouse movement throttling (8ms = ~120fps for smooth panning)
+
+# Frames a cached render plan may go unused before the renderer evicts it
+plan_cache_idle_frames: int = 120
+
+# Undo/redo history budget, counted in stored drawable snapshots and spliced references
+undo_history_budget: int = 50000
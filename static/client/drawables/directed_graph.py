@@ -70,6 +70,7 @@ class DirectedGraph(Graph):
     # ------------------------------------------------------------------
     def _invalidate_cache(self) -> None:
         self._cached_descriptors = None
+        self.bump_version()
 
     def remove_point(self, point: "Point") -> bool:
         removed = super().remove_point(point)
@@ -6,6 +6,7 @@ Defines the core interface for geometric objects including state management and
 
 Key Features:
     - Color and naming system
+    - Mutation version counter for render cache invalidation
     - Canvas-agnostic: no view or rendering dependencies
     - State serialization for persistence
     - Abstract interface for drawing and transformations
@@ -21,10 +22,75 @@ Dependencies:
 
 from __future__ import annotations
 
-from typing import Any, Dict
+import itertools
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from constants import default_color
 
+# Bookkeeping attributes that never change how a drawable renders; writing
+# them must not invalidate cached render plans.
+_UNVERSIONED_ATTRIBUTES = frozenset(
+    (
+        "_version",
+        "_render_dependencies",
+        "_cached_descriptors",
+        "_renderable",
+    )
+)
+
+# Immutable value types compared by equality: rewriting an attribute with an
+# equal value of the same type is not a mutation. Anything else (lists, helper
+# objects, drawables) always counts, since it may have been mutated in place.
+_VALUE_TYPES = frozenset((str, int, float, bool, type(None)))
+
+# Shared clock for mutation versions. Versions are unique across drawables, so
+# the newest version in a dependency closure identifies the state of all of it.
+_version_clock = itertools.count(1)
+
+
+# Ids of recently mutated drawables, oldest first. Indexes keep a cursor into
+# this log and revisit only the drawables changed since their last read.
+_change_log: List[int] = []
+# Absolute log position of _change_log[0]; grows as old entries are trimmed.
+_change_log_start: int = 0
+# Absolute position up to which readers may hold a cursor; entries before it are
+# never merged with new ones, or a reader positioned after them would miss a change.
+_change_log_read: int = 0
+_CHANGE_LOG_LIMIT = 4096
+
+
+def _record_change(drawable: "Drawable") -> None:
+    global _change_log_start
+    drawable.__dict__["_version"] = next(_version_clock)
+    marker = id(drawable)
+    if _change_log and _change_log[-1] == marker and _change_log_start + len(_change_log) > _change_log_read:
+        return
+    _change_log.append(marker)
+    if len(_change_log) > _CHANGE_LOG_LIMIT:
+        dropped = len(_change_log) // 2
+        del _change_log[:dropped]
+        _change_log_start += dropped
+
+
+def change_log_position() -> int:
+    """Return a cursor just past the newest entry of the drawable change log."""
+    global _change_log_read
+    _change_log_read = _change_log_start + len(_change_log)
+    return _change_log_read
+
+
+def changed_since(position: int) -> Optional[List[int]]:
+    """Return ids of drawables mutated since ``position``, oldest first.
+
+    Returns None when entries after ``position`` were already trimmed, in which
+    case the caller must revalidate everything it tracks.
+    """
+    global _change_log_read
+    if position < _change_log_start:
+        return None
+    _change_log_read = _change_log_start + len(_change_log)
+    return _change_log[position - _change_log_start :]
+
 
 class Drawable:
     """Abstract base class for math-space geometric objects.
@@ -50,6 +116,96 @@ class Drawable:
         self._color: str = color
         self._is_renderable: bool = bool(is_renderable)
 
+    def __setattr__(self, key: str, value: Any) -> None:
+        attributes = self.__dict__
+        if key in attributes:
+            current = attributes[key]
+            object.__setattr__(self, key, value)
+            if key in _UNVERSIONED_ATTRIBUTES:
+                return
+            if type(current) is type(value) and type(value) in _VALUE_TYPES and current == value:
+                return
+            _record_change(self)
+            return
+        object.__setattr__(self, key, value)
+        if key in _UNVERSIONED_ATTRIBUTES or isinstance(getattr(type(self), key, None), property):
+            # Property setters record the attributes they assign themselves
+            return
+        _record_change(self)
+
+    def bump_version(self) -> None:
+        """Mark the drawable as changed after an in-place mutation.
+
+        Attribute assignment bumps the version automatically unless it stores
+        an equal number, string, bool or None; call this after mutating a list
+        or helper object held by the drawable.
+        """
+        _record_change(self)
+
+    def get_version(self) -> int:
+        """Return the version of this drawable's own attributes."""
+        return int(self.__dict__.get("_version", 0))
+
+    def get_render_version(self) -> int:
+        """Return the newest version across this drawable and the drawables it references.
+
+        Renderers compare this value instead of hashing ``get_state()``: it changes
+        whenever the drawable or any point, segment, or function it is built from
+        is mutated.
+        """
+        newest = 0
+        visited: Set[int] = set()
+        stack: List[Drawable] = [self]
+        while stack:
+            drawable = stack.pop()
+            marker = id(drawable)
+            if marker in visited:
+                continue
+            visited.add(marker)
+            attributes = drawable.__dict__
+            version = attributes.get("_version", 0)
+            if version > newest:
+                newest = version
+            cached = attributes.get("_render_dependencies")
+            if cached is None or cached[0] != version:
+                cached = drawable._collect_render_dependencies(version)
+            stack.extend(cached[1])
+        return int(newest)
+
+    def get_render_dependencies(self) -> List["Drawable"]:
+        """Return every drawable this drawable's rendering depends on, excluding itself."""
+        found: List[Drawable] = []
+        visited: Set[int] = {id(self)}
+        stack: List[Drawable] = [self]
+        while stack:
+            drawable = stack.pop()
+            attributes = drawable.__dict__
+            version = attributes.get("_version", 0)
+            cached = attributes.get("_render_dependencies")
+            if cached is None or cached[0] != version:
+                cached = drawable._collect_render_dependencies(version)
+            for dependency in cached[1]:
+                if id(dependency) not in visited:
+                    visited.add(id(dependency))
+                    found.append(dependency)
+                    stack.append(dependency)
+        return found
+
+    def _collect_render_dependencies(self, version: int) -> Tuple[int, List["Drawable"]]:
+        dependencies: List[Drawable] = []
+        for key, value in self.__dict__.items():
+            if key in _UNVERSIONED_ATTRIBUTES:
+                continue
+            if isinstance(value, Drawable):
+                dependencies.append(value)
+            elif isinstance(value, (list, tuple)):
+                dependencies.extend(item for item in value if isinstance(item, Drawable))
+            elif isinstance(value, dict):
+                dependencies.extend(item for item in value.values() if isinstance(item, Drawable))
+        cached = (version, dependencies)
+        self.__dict__["_render_dependencies"] = cached
+        return cached
+
     @property
     def name(self) -> str:
         return self._name
@@ -17,7 +17,7 @@ from __future__ import annotations
 
 import math
 from copy import deepcopy
-from typing import Any, Callable, Dict, List, Optional, cast
+from typing import Any, Callable, Dict, List, Optional, Sequence, cast
 
 from constants import default_color, default_point_size
 from drawables.drawable import Drawable
@@ -100,6 +100,29 @@ class Function(Drawable):
                 return float("nan")
         return self._base_function(x)
 
+    def evaluate_many(self, xs: Sequence[float], default: Any = None) -> List[Any]:
+        """Evaluate the function at each x in order.
+
+        Samples that raise yield ``default``; explicit undefined points yield NaN,
+        matching what ``function`` returns for them.
+        """
+        batch = getattr(self._base_function, "evaluate_many", None)
+        values: List[Any]
+        if batch is not None:
+            values = batch(xs, default)
+        else:
+            values = []
+            for x in xs:
+                try:
+                    values.append(self._base_function(x))
+                except Exception:
+                    values.append(default)
+        if self.undefined_at:
+            for index, x in enumerate(xs):
+                if any(abs(x - hole) < 1e-12 for hole in self.undefined_at):
+                    values[index] = float("nan")
+        return values
+
     def _detect_periodicity(self) -> None:
         """Detect if function is periodic and estimate its period."""
         range_hint = None
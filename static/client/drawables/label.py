@@ -105,6 +105,7 @@ class Label(Drawable):
     def translate(self, x_offset: float, y_offset: float) -> None:
         self._position.x += float(x_offset)
         self._position.y += float(y_offset)
+        self.bump_version()
 
     def rotate(self, angle: float) -> None:
         delta = float(angle)
@@ -234,8 +235,13 @@ class Label(Drawable):
 
     def update_position(self, x: float, y: float) -> None:
         """Update the anchor position of the label."""
-        self._position.x = float(x)
-        self._position.y = float(y)
+        x = float(x)
+        y = float(y)
+        if self._position.x == x and self._position.y == y:
+            return
+        self._position.x = x
+        self._position.y = y
+        self.bump_version()
 
     def update_color(self, color: str) -> None:
         """Update the label color metadata."""
@@ -0,0 +1,179 @@
+"""Scatter plot drawable for array-backed data point clouds.
+
+This module provides the ScatterPlot class for plotting many data samples
+as a single drawable instead of one Point drawable per sample.
+
+Key Features:
+    - Flat x and y coordinate arrays instead of per-sample drawables
+    - Single batched render plan of screen-space filled circles
+    - Compact state serialization as two parallel value lists
+    - Nearest-sample hit-testing by index
+    - Cached math-space bounds for viewport culling
+    - Coordinate tuples shared, not copied, by undo snapshots
+"""
+
+from __future__ import annotations
+
+import math
+from copy import deepcopy
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from drawables.plot import Plot
+
+
+class ScatterPlot(Plot):
+    """
+    Renderable plot composite drawing a cloud of data samples.
+
+    The coordinates are held as immutable tuples and are only ever replaced
+    wholesale, so attribute assignment bumps the render version and copies
+    for undo/redo can share them.
+
+    Attributes:
+        x_values: Tuple of sample x coordinates in math space.
+        y_values: Tuple of sample y coordinates, parallel to ``x_values``.
+        point_radius: Optional marker radius in pixels (style default when None).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        x_values: Sequence[float],
+        y_values: Sequence[float],
+        color: Optional[str] = None,
+        point_radius: Optional[float] = None,
+        plot_type: str = "scatter",
+        bounds: Optional[Dict[str, float]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        is_renderable: bool = True,
+    ) -> None:
+        super().__init__(name, plot_type=plot_type, bounds=bounds, metadata=metadata)
+        xs = tuple(float(x) for x in x_values)
+        ys = tuple(float(y) for y in y_values)
+        if len(xs) != len(ys):
+            raise ValueError("x_values and y_values must have the same length")
+        self.x_values: Tuple[float, ...] = xs
+        self.y_values: Tuple[float, ...] = ys
+        if color is not None:
+            self.color = str(color)
+        self.point_radius: Optional[float] = None if point_radius is None else float(point_radius)
+        self.is_renderable = bool(is_renderable)
+
+    def get_class_name(self) -> str:
+        return "ScatterPlot"
+
+    @property
+    def point_count(self) -> int:
+        return len(self.x_values)
+
+    def get_point(self, index: int) -> Tuple[float, float]:
+        """Return the ``(x, y)`` coordinates of the sample at ``index``."""
+        return self.x_values[index], self.y_values[index]
+
+    def set_points(self, x_values: Sequence[float], y_values: Sequence[float]) -> None:
+        """Replace every sample at once."""
+        xs = tuple(float(x) for x in x_values)
+        ys = tuple(float(y) for y in y_values)
+        if len(xs) != len(ys):
+            raise ValueError("x_values and y_values must have the same length")
+        self.x_values = xs
+        self.y_values = ys
+
+    def get_math_bounds(self) -> Optional[Tuple[float, float, float, float]]:
+        """Return ``(min_x, min_y, max_x, max_y)`` over the finite samples, or None when empty."""
+        cached = getattr(self, "_cached_descriptors", None)
+        version = self.get_version()
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        box: Optional[Tuple[float, float, float, float]] = None
+        finite = [(x, y) for x, y in zip(self.x_values, self.y_values) if math.isfinite(x) and math.isfinite(y)]
+        if finite:
+            xs = [x for x, _ in finite]
+            ys = [y for _, y in finite]
+            box = (min(xs), min(ys), max(xs), max(ys))
+        self._cached_descriptors = (version, box)
+        return box
+
+    def index_at(self, x: float, y: float, tolerance: float) -> Optional[int]:
+        """Return the index of the sample nearest ``(x, y)`` within ``tolerance``, or None.
+
+        Ties resolve to the lowest index.
+        """
+        best_index: Optional[int] = None
+        best_distance = float(tolerance) * float(tolerance)
+        for index, (px, py) in enumerate(zip(self.x_values, self.y_values)):
+            dx = px - x
+            if dx * dx > best_distance:
+                continue
+            dy = py - y
+            distance = dx * dx + dy * dy
+            if distance < best_distance or (distance == best_distance and best_index is None):
+                best_distance = distance
+                best_index = index
+        return best_index
+
+    def indices_in_rect(self, min_x: float, min_y: float, max_x: float, max_y: float) -> List[int]:
+        """Return the indices of the samples inside the math-space rectangle, in order."""
+        return [
+            index
+            for index, (px, py) in enumerate(zip(self.x_values, self.y_values))
+            if min_x <= px <= max_x and min_y <= py <= max_y
+        ]
+
+    def get_state(self) -> Dict[str, Any]:
+        state = super().get_state()
+
+        # Prune empty base Plot fields to keep ScatterPlot state compact.
+        args = state.get("args", None)
+        if isinstance(args, dict):
+            if args.get("distribution_type") is None:
+                args.pop("distribution_type", None)
+            if not args.get("distribution_params"):
+                args.pop("distribution_params", None)
+            if not args.get("bounds"):
+                args.pop("bounds", None)
+            if not args.get("metadata"):
+                args.pop("metadata", None)
+
+        state["args"].update(
+            {
+                "x_values": list(self.x_values),
+                "y_values": list(self.y_values),
+                "color": self.color,
+            }
+        )
+        if self.point_radius is not None:
+            state["args"]["point_radius"] = self.point_radius
+        return state
+
+    def translate(self, x_offset: float, y_offset: float) -> None:
+        dx = float(x_offset)
+        dy = float(y_offset)
+        self.set_points([x + dx for x in self.x_values], [y + dy for y in self.y_values])
+
+    def _collect_render_dependencies(self, version: int) -> Tuple[int, List[Any]]:
+        # Coordinates never hold drawables; skip scanning them element by element.
+        cached: Tuple[int, List[Any]] = (version, [])
+        self.__dict__["_render_dependencies"] = cached
+        return cached
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "ScatterPlot":
+        if id(self) in memo:
+            return memo[id(self)]  # type: ignore[return-value]
+        copied = ScatterPlot(
+            self.name,
+            x_values=(),
+            y_values=(),
+            color=self.color,
+            point_radius=self.point_radius,
+            plot_type=self.plot_type,
+            bounds=deepcopy(self.bounds, memo),
+            metadata=deepcopy(self.metadata, memo),
+            is_renderable=self.is_renderable,
+        )
+        # The coordinate tuples are immutable, so snapshots share them instead of copying.
+        copied.x_values = self.x_values
+        copied.y_values = self.y_values
+        memo[id(self)] = copied
+        return copied
@@ -66,6 +66,7 @@ class UndirectedGraph(Graph):
     # ------------------------------------------------------------------
     def _invalidate_cache(self) -> None:
         self._cached_descriptors = None
+        self.bump_version()
 
     def remove_point(self, point: "Point") -> bool:
         removed = super().remove_point(point)
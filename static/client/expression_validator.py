@@ -38,6 +38,12 @@ Expression Processing:
     - Power operator conversion (^ <-> **)
     - Function name standardization
 
+Compiled Evaluation:
+    - CompiledExpression: validated expression compiled once into a one-argument function
+    - Shared namespace built once per parameter variable instead of per sample
+    - evaluate_many(xs) batch evaluation for samplers and area builders
+    - LRU cache of compiled expressions keyed by the normalized expression string
+
 Dependencies:
     - ast: Abstract syntax tree parsing for security
     - math: Standard mathematical functions
@@ -49,10 +55,55 @@ Dependencies:
 from __future__ import annotations
 
 import ast
+import builtins
 import math
 import random
 import re
-from typing import Any, Callable, Dict, Set, Type, cast
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Set, Tuple, Type, cast
+
+# Sentinel for CompiledExpression.evaluate_many: re-raise instead of substituting a default
+_RAISE: Any = object()
+
+
+class CompiledExpression:
+    """A validated expression compiled once into a function of one parameter variable.
+
+    Calling the object behaves exactly like the evaluator returned by the legacy
+    per-sample ``eval`` path: the raw result is passed through ``float()``, so
+    complex results raise ``TypeError``, domain errors propagate, and non-finite
+    floats are returned unchanged.
+    """
+
+    def __init__(self, source: str, variable: str, namespace: Mapping[str, Any]) -> None:
+        self.source: str = source
+        self.variable: str = variable
+        # The newlines keep a trailing comment in the source from swallowing the paren
+        code = compile(f"lambda {variable}: (\n{source}\n)", "<string>", mode="eval")
+        self._function: Callable[[Any], Any] = eval(code, cast(Dict[str, Any], namespace))
+
+    def __call__(self, value: float) -> float:
+        return float(self._function(value))
+
+    def evaluate_raw(self, value: float) -> Any:
+        """Evaluate without float conversion, preserving bool/list/int results."""
+        return self._function(value)
+
+    def evaluate_many(self, values: Iterable[float], default: Any = _RAISE) -> List[Any]:
+        """Evaluate at each value in order.
+
+        Without ``default`` the first failing sample raises exactly as a scalar
+        call would; with it, failing samples yield ``default`` instead.
+        """
+        function = self._function
+        if default is _RAISE:
+            return [float(function(value)) for value in values]
+        results: List[Any] = []
+        for value in values:
+            try:
+                results.append(float(function(value)))
+            except Exception:
+                results.append(default)
+        return results
 
 
 # The ExpressionValidator class is used to validate and evaluate mathematical expressions
@@ -81,8 +132,14 @@ class ExpressionValidator(ast.NodeVisitor):
     Attributes:
         ALLOWED_NODES (set): Whitelist of permitted AST node types
         ALLOWED_FUNCTIONS (set): Whitelist of permitted mathematical functions
+        COMPILED_CACHE_SIZE (int): Maximum compiled expressions kept in the LRU cache
     """
 
+    COMPILED_CACHE_SIZE: int = 256
+    _compiled_cache: Dict[Tuple[str, str], CompiledExpression] = {}
+    _normalized_cache: Dict[str, str] = {}
+    _shared_namespaces: Dict[str, Dict[str, Any]] = {}
+
     ALLOWED_NODES: Set[Type[ast.AST]] = {
         ast.Add,
         ast.Sub,
@@ -317,13 +374,81 @@ class ExpressionValidator(ast.NodeVisitor):
         Returns:
             float: Result of expression evaluation
         """
-        variables_and_functions = ExpressionValidator._get_variables_and_functions(x)
+        variables_and_functions = dict(ExpressionValidator._get_shared_namespace("x"))
+        variables_and_functions["x"] = x
         # Parse the expression into an abstract syntax tree
         tree = ast.parse(expression, mode="eval")
         # Evaluate the expression using the abstract syntax tree and the variables dictionary
         result = eval(compile(tree, "<string>", mode="eval"), variables_and_functions)
         return cast(float, result)
 
+    @staticmethod
+    def _get_shared_namespace(variable: str) -> Dict[str, Any]:
+        """Return the evaluation namespace for ``variable``, built once and never mutated.
+
+        The parameter itself is not included; compiled expressions bind it as a
+        function argument. ``__builtins__`` is pre-set so eval never writes to it.
+        """
+        namespace = ExpressionValidator._shared_namespaces.get(variable)
+        if namespace is None:
+            if variable == "t":
+                namespace = ExpressionValidator._get_variables_and_functions_parametric(0)
+            else:
+                namespace = ExpressionValidator._get_variables_and_functions(0)
+            namespace.pop(variable, None)
+            namespace["__builtins__"] = builtins
+            ExpressionValidator._shared_namespaces[variable] = namespace
+        return namespace
+
+    @staticmethod
+    def _lru_get(cache: Dict[Any, Any], key: Any) -> Any:
+        value = cache.pop(key, None)
+        if value is not None:
+            # Re-insert so dict order tracks recency
+            cache[key] = value
+        return value
+
+    @staticmethod
+    def _lru_put(cache: Dict[Any, Any], key: Any, value: Any) -> None:
+        cache[key] = value
+        limit = max(1, int(ExpressionValidator.COMPILED_CACHE_SIZE))
+        while len(cache) > limit:
+            del cache[next(iter(cache))]
+
+    @staticmethod
+    def compile_normalized(normalized: str, variable: str = "x") -> CompiledExpression:
+        """Validate and compile an already-normalized expression, reusing cached results.
+
+        Raises:
+            ValueError: If the expression fails validation (failures are not cached)
+        """
+        key = (variable, normalized)
+        compiled = ExpressionValidator._lru_get(ExpressionValidator._compiled_cache, key)
+        if compiled is None:
+            ExpressionValidator.validate_expression_tree(normalized)
+            compiled = CompiledExpression(normalized, variable, ExpressionValidator._get_shared_namespace(variable))
+            ExpressionValidator._lru_put(ExpressionValidator._compiled_cache, key, compiled)
+        return cast(CompiledExpression, compiled)
+
+    @staticmethod
+    def compile_expression(expression: str, variable: str = "x") -> CompiledExpression:
+        """Normalize, validate and compile ``expression`` as a function of ``variable``.
+
+        Both the normalization and the compiled object are cached, so repeated
+        requests for the same string skip regex rewriting and AST validation.
+        """
+        normalized = ExpressionValidator._lru_get(ExpressionValidator._normalized_cache, expression)
+        if normalized is None:
+            normalized = ExpressionValidator.fix_math_expression(expression, python_compatible=True)
+            ExpressionValidator._lru_put(ExpressionValidator._normalized_cache, expression, normalized)
+        return ExpressionValidator.compile_normalized(cast(str, normalized), variable)
+
+    @staticmethod
+    def clear_compiled_cache() -> None:
+        """Drop cached normalizations and compiled expressions."""
+        ExpressionValidator._compiled_cache.clear()
+        ExpressionValidator._normalized_cache.clear()
+
     @staticmethod
     def _get_variables_and_functions(x: float) -> Dict[str, Any]:
         """Create a dictionary with variables and functions for expression evaluation"""
@@ -590,17 +715,7 @@ class ExpressionValidator(ast.NodeVisitor):
     @staticmethod
     def _parse_with_python(function_string: str) -> Callable[[float], float]:
         """Parse a function string using Python's built-in evaluation (faster)"""
-        function_string = ExpressionValidator.fix_math_expression(function_string, python_compatible=True)
-        ExpressionValidator.validate_expression_tree(function_string)
-
-        tree = ast.parse(function_string, mode="eval")
-        compiled_code = compile(tree, "<string>", mode="eval")
-
-        def evaluator(x: float) -> float:
-            variables = ExpressionValidator._get_variables_and_functions(x)
-            return float(eval(compiled_code, variables))
-
-        return evaluator
+        return ExpressionValidator.compile_expression(function_string, "x")
 
     @staticmethod
     def parse_function_string(function_string: str, use_mathjs: bool = False) -> Callable[[float], Any]:
@@ -663,17 +778,7 @@ class ExpressionValidator(ast.NodeVisitor):
 
         Uses 't' as the parameter variable instead of 'x'.
         """
-        expression_string = ExpressionValidator.fix_math_expression(expression_string, python_compatible=True)
-        ExpressionValidator.validate_expression_tree(expression_string)
-
-        tree = ast.parse(expression_string, mode="eval")
-        compiled_code = compile(tree, "<string>", mode="eval")
-
-        def evaluator(t: float) -> float:
-            variables = ExpressionValidator._get_variables_and_functions_parametric(t)
-            return float(eval(compiled_code, variables))
-
-        return evaluator
+        return ExpressionValidator.compile_expression(expression_string, "t")
 
     @staticmethod
     def parse_parametric_expression(expression_string: str) -> Callable[[float], float]:
@@ -0,0 +1,458 @@
+"""
+MatHud Polygon Boolean Engine
+
+Boolean operations (intersection, union, difference, symmetric difference)
+on polygon sets with holes, used by Region.
+
+Algorithm:
+    Edges of both operands are split at every mutual intersection, found by
+    an x-sorted sweep with bounding-box pre-rejection. Each split piece is
+    classified as inside or outside the other operand, or as shared with it,
+    and the pieces the operation keeps are linked back into rings. Concave
+    operands, holes, touching vertices and overlapping edges are supported,
+    which Sutherland-Hodgman clipping (convex clip polygons only) is not.
+
+Conventions:
+    Rings are lists of (x, y) tuples without a repeated closing vertex.
+    Outer rings run counter-clockwise and holes clockwise, so the summed
+    signed shoelace area of a ring set is the area it encloses.
+
+Dependencies:
+    - math: Turning angles when linking result rings
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Dict, List, Optional, Set, Tuple
+
+Point = Tuple[float, float]
+Ring = List[Point]
+Edge = Tuple[Point, Point]
+BoundingBox = Tuple[float, float, float, float]
+
+INTERSECTION = "&"
+UNION = "|"
+DIFFERENCE = "-"
+SYMMETRIC_DIFFERENCE = "^"
+
+# Coordinates are snapped to a grid of this size relative to the operands' extent,
+# so intersection points computed from either operand coincide exactly.
+_RELATIVE_EPSILON = 1e-9
+
+
+def ring_signed_area(ring: Ring) -> float:
+    """Shoelace area of a ring; positive for counter-clockwise rings."""
+    total = 0.0
+    n = len(ring)
+    for i in range(n):
+        x1, y1 = ring[i]
+        x2, y2 = ring[(i + 1) % n]
+        total += x1 * y2 - x2 * y1
+    return total / 2.0
+
+
+def orient_ring(ring: Ring, counter_clockwise: bool) -> Ring:
+    """Return the ring traversed counter-clockwise or clockwise as requested."""
+    if (ring_signed_area(ring) > 0) != counter_clockwise:
+        return list(reversed(ring))
+    return ring
+
+
+def clean_ring(points: List[Point]) -> Ring:
+    """Drop repeated consecutive vertices, including a repeated closing vertex."""
+    ring: Ring = []
+    for point in points:
+        if not ring or ring[-1] != point:
+            ring.append(point)
+    while len(ring) > 1 and ring[0] == ring[-1]:
+        ring.pop()
+    return ring
+
+
+def bounding_box(rings: List[Ring]) -> Optional[BoundingBox]:
+    """(min_x, min_y, max_x, max_y) over all ring vertices, or None if empty."""
+    xs = [x for ring in rings for x, _ in ring]
+    ys = [y for ring in rings for _, y in ring]
+    if not xs:
+        return None
+    return (min(xs), min(ys), max(xs), max(ys))
+
+
+def point_in_rings(x: float, y: float, rings: List[Ring]) -> bool:
+    """Even-odd ray casting against every ring of a set (holes included)."""
+    inside = False
+    for ring in rings:
+        n = len(ring)
+        j = n - 1
+        for i in range(n):
+            xi, yi = ring[i]
+            xj, yj = ring[j]
+            if (yi > y) != (yj > y) and x < (xj - xi) * (y - yi) / (yj - yi) + xi:
+                inside = not inside
+            j = i
+    return inside
+
+
+def boolean_rings(subject: List[Ring], clip: List[Ring], op: str) -> List[Ring]:
+    """Apply a boolean operation to two oriented ring sets.
+
+    Args:
+        subject: Rings of the left operand (outer CCW, holes CW)
+        clip: Rings of the right operand (outer CCW, holes CW)
+        op: One of "&", "|", "-", "^"
+
+    Returns:
+        Oriented rings of the result; an empty list for an empty result
+    """
+    if op == SYMMETRIC_DIFFERENCE:
+        return boolean_rings(subject, clip, DIFFERENCE) + boolean_rings(clip, subject, DIFFERENCE)
+    if op not in (INTERSECTION, UNION, DIFFERENCE):
+        raise ValueError(f"Unknown operator: {op}")
+
+    subject = [ring for ring in subject if len(ring) >= 3]
+    clip = [ring for ring in clip if len(ring) >= 3]
+    box_a = bounding_box(subject)
+    box_b = bounding_box(clip)
+    if box_a is None or box_b is None:
+        if op == INTERSECTION:
+            return []
+        if op == UNION:
+            return subject + clip
+        return subject
+
+    # Bounding-box pre-rejection: disjoint operands need no clipping at all.
+    if box_a[2] < box_b[0] or box_b[2] < box_a[0] or box_a[3] < box_b[1] or box_b[3] < box_a[1]:
+        if op == INTERSECTION:
+            return []
+        if op == UNION:
+            return subject + clip
+        return subject
+
+    extent = max(
+        box_a[2] - box_a[0],
+        box_a[3] - box_a[1],
+        box_b[2] - box_b[0],
+        box_b[3] - box_b[1],
+        abs(box_a[0]),
+        abs(box_a[1]),
+        abs(box_b[0]),
+        abs(box_b[1]),
+        1e-12,
+    )
+    # A power of two keeps coordinates that are already multiples of it (integers, halves) exact.
+    grid = 2.0 ** math.ceil(math.log2(extent * _RELATIVE_EPSILON))
+    subject = _snap_rings(subject, grid)
+    clip = _merge_close_vertices(_snap_rings(clip, grid), subject, grid * 4.0)
+
+    edges_a = _ring_edges(subject)
+    edges_b = _ring_edges(clip)
+    splits_a: List[List[Point]] = [[] for _ in edges_a]
+    splits_b: List[List[Point]] = [[] for _ in edges_b]
+    touch_points: Set[Point] = set()
+    _find_intersections(edges_a, edges_b, splits_a, splits_b, touch_points, grid)
+
+    pieces_a = _split_edges(subject, edges_a, splits_a)
+    pieces_b = _split_edges(clip, edges_b, splits_b)
+    keys_a = {piece for ring in pieces_a for piece in ring}
+    keys_b = {piece for ring in pieces_b for piece in ring}
+
+    selected: List[Edge] = []
+    for ring_pieces in pieces_a:
+        inside: Optional[bool] = None
+        for start, end in ring_pieces:
+            if (start, end) in keys_b:
+                if op != DIFFERENCE:
+                    selected.append((start, end))
+                inside = None
+                continue
+            if (end, start) in keys_b:
+                if op == DIFFERENCE:
+                    selected.append((start, end))
+                inside = None
+                continue
+            if inside is None or start in touch_points:
+                inside = _piece_inside(start, end, clip)
+            if inside == (op == INTERSECTION):
+                selected.append((start, end))
+
+    for ring_pieces in pieces_b:
+        inside = None
+        for start, end in ring_pieces:
+            if (start, end) in keys_a or (end, start) in keys_a:
+                # Shared pieces were decided while walking the subject.
+                inside = None
+                continue
+            if inside is None or start in touch_points:
+                inside = _piece_inside(start, end, subject)
+            if op == INTERSECTION and inside:
+                selected.append((start, end))
+            elif op == UNION and not inside:
+                selected.append((start, end))
+            elif op == DIFFERENCE and inside:
+                selected.append((end, start))
+
+    return _link_edges(selected, grid)
+
+
+def group_rings(rings: List[Ring]) -> List[Tuple[Ring, List[Ring]]]:
+    """Pair each counter-clockwise outer ring with the clockwise holes it contains.
+
+    Returns:
+        List of (outer, holes) in descending order of outer area
+    """
+    outers = sorted((ring for ring in rings if ring_signed_area(ring) > 0), key=ring_signed_area, reverse=True)
+    groups: List[Tuple[Ring, List[Ring]]] = [(outer, []) for outer in outers]
+    for hole in (ring for ring in rings if ring_signed_area(ring) < 0):
+        probe = _point_left_of_ring(hole)
+        owner: Optional[Tuple[Ring, List[Ring]]] = None
+        # Outers are sorted by decreasing area, so the last match is the tightest.
+        for group in groups:
+            if point_in_rings(probe[0], probe[1], [group[0]]):
+                owner = group
+        if owner is not None:
+            owner[1].append(hole)
+    return groups
+
+
+def _snap(value: float, grid: float) -> float:
+    return round(value / grid) * grid
+
+
+def _snap_rings(rings: List[Ring], grid: float) -> List[Ring]:
+    snapped: List[Ring] = []
+    for ring in rings:
+        cleaned = clean_ring([(_snap(x, grid), _snap(y, grid)) for x, y in ring])
+        if len(cleaned) >= 3:
+            snapped.append(cleaned)
+    return snapped
+
+
+def _merge_close_vertices(rings: List[Ring], reference: List[Ring], radius: float) -> List[Ring]:
+    """Move vertices lying within ``radius`` of a reference vertex onto it.
+
+    Near-coincident vertices would otherwise produce sliver pieces whose
+    endpoints differ between the operands and break ring linking.
+    """
+    cells: Dict[Tuple[int, int], List[Point]] = {}
+    for ring in reference:
+        for point in ring:
+            cells.setdefault((int(math.floor(point[0] / radius)), int(math.floor(point[1] / radius))), []).append(point)
+
+    merged: List[Ring] = []
+    for ring in rings:
+        moved: Ring = []
+        for x, y in ring:
+            cell_x, cell_y = int(math.floor(x / radius)), int(math.floor(y / radius))
+            target: Point = (x, y)
+            for dx in (-1, 0, 1):
+                for dy in (-1, 0, 1):
+                    for candidate in cells.get((cell_x + dx, cell_y + dy), ()):
+                        if abs(candidate[0] - x) <= radius and abs(candidate[1] - y) <= radius:
+                            target = candidate
+            moved.append(target)
+        cleaned = clean_ring(moved)
+        if len(cleaned) >= 3:
+            merged.append(cleaned)
+    return merged
+
+
+def _ring_edges(rings: List[Ring]) -> List[Edge]:
+    edges: List[Edge] = []
+    for ring in rings:
+        n = len(ring)
+        for i in range(n):
+            edges.append((ring[i], ring[(i + 1) % n]))
+    return edges
+
+
+def _find_intersections(
+    edges_a: List[Edge],
+    edges_b: List[Edge],
+    splits_a: List[List[Point]],
+    splits_b: List[List[Point]],
+    touch_points: Set[Point],
+    grid: float,
+) -> None:
+    """Record split points where subject and clip edges cross, touch or overlap."""
+    entries: List[Tuple[float, float, float, float, int, int]] = []
+    for owner, edges in ((0, edges_a), (1, edges_b)):
+        for index, ((x1, y1), (x2, y2)) in enumerate(edges):
+            entries.append((min(x1, x2), max(x1, x2), min(y1, y2), max(y1, y2), owner, index))
+    entries.sort()
+
+    active: Tuple[List[Tuple[float, float, float, float, int, int]], ...] = ([], [])
+    for entry in entries:
+        min_x, _, min_y, max_y, owner, index = entry
+        others = [other for other in active[1 - owner] if other[1] >= min_x - grid]
+        active[1 - owner][:] = others
+        for other in others:
+            if other[2] > max_y + grid or other[3] < min_y - grid:
+                continue
+            if owner == 0:
+                _intersect_edges(edges_a[index], edges_b[other[5]], splits_a[index], splits_b[other[5]], touch_points, grid)
+            else:
+                _intersect_edges(edges_a[other[5]], edges_b[index], splits_a[other[5]], splits_b[index], touch_points, grid)
+        active[owner].append(entry)
+
+
+def _intersect_edges(
+    edge_a: Edge,
+    edge_b: Edge,
+    splits_a: List[Point],
+    splits_b: List[Point],
+    touch_points: Set[Point],
+    grid: float,
+) -> None:
+    (ax1, ay1), (ax2, ay2) = edge_a
+    (bx1, by1), (bx2, by2) = edge_b
+    dax, day = ax2 - ax1, ay2 - ay1
+    dbx, dby = bx2 - bx1, by2 - by1
+    len_a = math.hypot(dax, day)
+    len_b = math.hypot(dbx, dby)
+    if len_a == 0.0 or len_b == 0.0:
+        return
+    denom = dax * dby - day * dbx
+    offset_x, offset_y = bx1 - ax1, by1 - ay1
+
+    if abs(denom) <= grid * (len_a + len_b):
+        # Parallel: only collinear overlaps matter.
+        if abs(offset_x * day - offset_y * dax) > grid * len_a:
+            return
+        for point in edge_b:
+            if _strictly_within(point, edge_a, grid):
+                _add_split(splits_a, point, touch_points)
+            elif point in edge_a:
+                touch_points.add(point)
+        for point in edge_a:
+            if _strictly_within(point, edge_b, grid):
+                _add_split(splits_b, point, touch_points)
+        return
+
+    t = (offset_x * dby - offset_y * dbx) / denom
+    u = (offset_x * day - offset_y * dax) / denom
+    tol_a = grid / len_a
+    tol_b = grid / len_b
+    if t < -tol_a or t > 1.0 + tol_a or u < -tol_b or u > 1.0 + tol_b:
+        return
+
+    # Reuse existing vertices for touching configurations so both sides agree.
+    if t <= tol_a:
+        point = edge_a[0]
+    elif t >= 1.0 - tol_a:
+        point = edge_a[1]
+    elif u <= tol_b:
+        point = edge_b[0]
+    elif u >= 1.0 - tol_b:
+        point = edge_b[1]
+    else:
+        point = (_snap(ax1 + t * dax, grid), _snap(ay1 + t * day, grid))
+
+    touch_points.add(point)
+    if point not in edge_a:
+        _add_split(splits_a, point, touch_points)
+    if point not in edge_b:
+        _add_split(splits_b, point, touch_points)
+
+
+def _strictly_within(point: Point, edge: Edge, grid: float) -> bool:
+    """True if a collinear point lies on the edge's interior (not at an endpoint)."""
+    if point in edge:
+        return False
+    (x1, y1), (x2, y2) = edge
+    dx, dy = x2 - x1, y2 - y1
+    length_sq = dx * dx + dy * dy
+    t = ((point[0] - x1) * dx + (point[1] - y1) * dy) / length_sq
+    margin = grid / math.sqrt(length_sq)
+    return margin < t < 1.0 - margin
+
+
+def _add_split(splits: List[Point], point: Point, touch_points: Set[Point]) -> None:
+    splits.append(point)
+    touch_points.add(point)
+
+
+def _split_edges(rings: List[Ring], edges: List[Edge], splits: List[List[Point]]) -> List[List[Edge]]:
+    """Split every edge at its recorded points; returns pieces grouped per ring."""
+    pieces: List[List[Edge]] = []
+    index = 0
+    for ring in rings:
+        ring_pieces: List[Edge] = []
+        for _ in range(len(ring)):
+            start, end = edges[index]
+            points = splits[index]
+            index += 1
+            if points:
+                dx, dy = end[0] - start[0], end[1] - start[1]
+                ordered = sorted(set(points), key=lambda p: (p[0] - start[0]) * dx + (p[1] - start[1]) * dy)
+                chain = [start] + ordered + [end]
+            else:
+                chain = [start, end]
+            for i in range(len(chain) - 1):
+                if chain[i] != chain[i + 1]:
+                    ring_pieces.append((chain[i], chain[i + 1]))
+        pieces.append(ring_pieces)
+    return pieces
+
+
+def _piece_inside(start: Point, end: Point, rings: List[Ring]) -> bool:
+    return point_in_rings((start[0] + end[0]) / 2.0, (start[1] + end[1]) / 2.0, rings)
+
+
+def _link_edges(edges: List[Edge], grid: float) -> List[Ring]:
+    """Chain directed edges into closed rings, turning as far left as possible at junctions."""
+    outgoing: Dict[Point, List[int]] = {}
+    for index, (start, _) in enumerate(edges):
+        outgoing.setdefault(start, []).append(index)
+
+    used = [False] * len(edges)
+    rings: List[Ring] = []
+    min_area = grid * grid
+    for first in range(len(edges)):
+        if used[first]:
+            continue
+        origin = edges[first][0]
+        ring: Ring = []
+        current = first
+        closed = False
+        while True:
+            used[current] = True
+            start, end = edges[current]
+            ring.append(start)
+            if end == origin:
+                closed = True
+                break
+            candidates = [index for index in outgoing.get(end, ()) if not used[index]]
+            if not candidates:
+                break
+            current = candidates[0] if len(candidates) == 1 else _leftmost(start, end, candidates, edges)
+        if closed and len(ring) >= 3 and abs(ring_signed_area(ring)) > min_area:
+            rings.append(ring)
+    return rings
+
+
+def _leftmost(start: Point, end: Point, candidates: List[int], edges: List[Edge]) -> int:
+    in_x, in_y = end[0] - start[0], end[1] - start[1]
+    best = candidates[0]
+    best_turn = -math.inf
+    for index in candidates:
+        target = edges[index][1]
+        out_x, out_y = target[0] - end[0], target[1] - end[1]
+        turn = math.atan2(in_x * out_y - in_y * out_x, in_x * out_x + in_y * out_y)
+        if turn > best_turn:
+            best, best_turn = index, turn
+    return best
+
+
+def _point_left_of_ring(ring: Ring) -> Point:
+    """A point just left of the ring's longest edge, i.e. outside a clockwise hole."""
+    best_length = -1.0
+    best: Edge = (ring[0], ring[1 % len(ring)])
+    for i in range(len(ring)):
+        start, end = ring[i], ring[(i + 1) % len(ring)]
+        length = math.hypot(end[0] - start[0], end[1] - start[1])
+        if length > best_length:
+            best_length, best = length, (start, end)
+    (x1, y1), (x2, y2) = best
+    nudge = 1e-6
+    return ((x1 + x2) / 2.0 - (y2 - y1) * nudge, (y1 + y2) / 2.0 + (x2 - x1) * nudge)
@@ -2,7 +2,12 @@
 MatHud Region Class
 
 Represents a 2D region bounded by a closed path, optionally with holes.
-Supports area calculation and point containment testing.
+Supports area calculation, point containment testing, and boolean
+operations through the polygon boolean engine.
+
+Boolean operands are polygonized once per Region: line segments keep
+their exact endpoints and arcs are sampled adaptively so the chord
+deviation stays below ARC_TOLERANCE of the radius.
 """
 
 from __future__ import annotations
@@ -16,6 +21,23 @@ from .path import (
     EllipticalArc,
     CompositePath,
 )
+from .polygon_boolean import (
+    DIFFERENCE,
+    INTERSECTION,
+    SYMMETRIC_DIFFERENCE,
+    UNION,
+    Ring,
+    boolean_rings,
+    clean_ring,
+    group_rings,
+    orient_ring,
+    point_in_rings,
+)
+
+# Maximum distance between an arc and its polygon chords, relative to the radius.
+ARC_TOLERANCE = 2.5e-4
+_ARC_STEP = 2.0 * math.acos(1.0 - ARC_TOLERANCE)
+_MIN_ARC_SEGMENTS = 4
 
 _GEOMETRY_UTILS = None
 
@@ -56,6 +78,7 @@ class Region:
 
         self._outer_boundary = outer_boundary
         self._holes: List[CompositePath] = []
+        self._rings: Optional[List[Ring]] = None
 
         if holes:
             for hole in holes:
@@ -85,6 +108,7 @@ class Region:
         if not hole.is_closed():
             raise ValueError("Hole must be a closed path")
         self._holes.append(hole)
+        self._rings = None
 
     def _path_area(self, path: CompositePath) -> float:
         """Calculate the signed area enclosed by a path using Green's theorem."""
@@ -164,7 +188,7 @@ class Region:
     def contains_point(self, x: float, y: float) -> bool:
         """Test if a point is inside the region.
 
-        Uses ray casting algorithm on sampled boundary points.
+        Uses ray casting on the polygonized boundary.
         Point must be inside outer boundary and outside all holes.
 
         Args:
@@ -174,17 +198,7 @@ class Region:
         Returns:
             True if point is inside the region
         """
-        outer_points = self._outer_boundary.sample(100)
-
-        if not self._point_in_polygon(x, y, outer_points):
-            return False
-
-        for hole in self._holes:
-            hole_points = hole.sample(100)
-            if self._point_in_polygon(x, y, hole_points):
-                return False
-
-        return True
+        return point_in_rings(x, y, self._polygon())
 
     @classmethod
     def from_polygon(cls, polygon: Any) -> Region:
@@ -305,141 +319,54 @@ class Region:
         """Sample the outer boundary to a list of points."""
         return self._outer_boundary.sample(num_samples)
 
-    @staticmethod
-    def _line_intersection(
-        p1: Tuple[float, float], p2: Tuple[float, float], p3: Tuple[float, float], p4: Tuple[float, float]
-    ) -> Optional[Tuple[float, float]]:
-        """Find intersection of lines (p1-p2) and (p3-p4)."""
-        x1, y1 = p1
-        x2, y2 = p2
-        x3, y3 = p3
-        x4, y4 = p4
-
-        denom = (x1 - x2) * (y3 - y4) - (y1 - y2) * (x3 - x4)
-        if abs(denom) < 1e-10:
-            return None
-
-        t = ((x1 - x3) * (y3 - y4) - (y1 - y3) * (x3 - x4)) / denom
-
-        x = x1 + t * (x2 - x1)
-        y = y1 + t * (y2 - y1)
-        return (x, y)
+    def _polygon(self) -> List[Ring]:
+        """Oriented polygon rings (outer CCW, holes CW), computed once per region."""
+        if self._rings is None:
+            rings = [orient_ring(_path_ring(self._outer_boundary), counter_clockwise=True)]
+            rings.extend(orient_ring(_path_ring(hole), counter_clockwise=False) for hole in self._holes)
+            self._rings = [ring for ring in rings if len(ring) >= 3]
+        return self._rings
 
-    @staticmethod
-    def _is_inside_edge(
-        point: Tuple[float, float], edge_start: Tuple[float, float], edge_end: Tuple[float, float]
-    ) -> bool:
-        """Check if point is on the inside (left) of a directed edge."""
-        return (
-            (edge_end[0] - edge_start[0]) * (point[1] - edge_start[1])
-            - (edge_end[1] - edge_start[1]) * (point[0] - edge_start[0])
-        ) >= 0
-
-    def _sutherland_hodgman_clip(
-        self, subject: List[Tuple[float, float]], clip: List[Tuple[float, float]]
-    ) -> List[Tuple[float, float]]:
-        """Clip subject polygon against clip polygon using Sutherland-Hodgman."""
-        if len(subject) < 3 or len(clip) < 3:
-            return []
-
-        output = list(subject)
-
-        for i in range(len(clip)):
-            if len(output) == 0:
-                break
-
-            input_list = output
-            output = []
-
-            edge_start = clip[i]
-            edge_end = clip[(i + 1) % len(clip)]
-
-            for j in range(len(input_list)):
-                current = input_list[j]
-                previous = input_list[j - 1]
-
-                current_inside = self._is_inside_edge(current, edge_start, edge_end)
-                previous_inside = self._is_inside_edge(previous, edge_start, edge_end)
-
-                if current_inside:
-                    if not previous_inside:
-                        intersection = self._line_intersection(previous, current, edge_start, edge_end)
-                        if intersection:
-                            output.append(intersection)
-                    output.append(current)
-                elif previous_inside:
-                    intersection = self._line_intersection(previous, current, edge_start, edge_end)
-                    if intersection:
-                        output.append(intersection)
-
-        return output
-
-    @staticmethod
-    def _ensure_ccw(points: List[Tuple[float, float]]) -> List[Tuple[float, float]]:
-        """Ensure polygon points are in counterclockwise order.
-
-        Sutherland-Hodgman requires consistent CCW winding for both polygons.
-        """
-        if len(points) < 3:
-            return points
-
-        # Calculate signed area using shoelace formula
-        signed_area = 0.0
-        n = len(points)
-        for i in range(n):
-            j = (i + 1) % n
-            signed_area += points[i][0] * points[j][1]
-            signed_area -= points[j][0] * points[i][1]
+    @classmethod
+    def _from_rings(cls, rings: List[Ring]) -> Optional[Region]:
+        """Build a region from boolean-engine output rings, or None if empty."""
+        parts: List[Region] = []
+        for outer, holes in group_rings(rings):
+            region = cls(_ring_path(outer), [_ring_path(hole) for hole in holes])
+            region._rings = [outer] + holes
+            parts.append(region)
+        if not parts:
+            return None
+        if len(parts) == 1:
+            return parts[0]
+        return _MultiRegion(parts)
 
-        # If clockwise (negative area), reverse to make CCW
-        if signed_area < 0:
-            return list(reversed(points))
-        return points
+    def _boolean(self, other: Region, op: str) -> Optional[Region]:
+        return Region._from_rings(boolean_rings(self._polygon(), other._polygon(), op))
 
-    def intersection(self, other: Region, num_samples: int = 100) -> Optional[Region]:
+    def intersection(self, other: Region) -> Optional[Region]:
         """Compute the intersection of this region with another.
 
-        Uses Sutherland-Hodgman polygon clipping on sampled boundaries.
-
         Args:
             other: Another Region to intersect with
-            num_samples: Number of sample points for boundary approximation
 
         Returns:
             A new Region representing the intersection, or None if empty
         """
-        self_points = self._sample_to_points(num_samples)
-        other_points = other._sample_to_points(num_samples)
+        return self._boolean(other, INTERSECTION)
 
-        if len(self_points) < 3 or len(other_points) < 3:
-            return None
-
-        # Ensure both polygons are CCW for correct clipping
-        self_points = self._ensure_ccw(self_points)
-        other_points = self._ensure_ccw(other_points)
-
-        clipped = self._sutherland_hodgman_clip(self_points, other_points)
-
-        if len(clipped) < 3:
-            return None
-
-        return Region.from_points(clipped)
-
-    def union(self, other: Region, num_samples: int = 100) -> "Region":
+    def union(self, other: Region) -> Optional[Region]:
         """Compute the union of this region with another.
 
-        Uses area formula: union = A + B - intersection.
-        Returns a CompositeRegion that computes area correctly.
+        Disjoint pieces are returned together as one multi-part region.
 
         Args:
             other: Another Region to union with
-            num_samples: Number of sample points for boundary approximation
 
         Returns:
-            A Region representing the union
+            A Region representing the union, or None if both are empty
         """
-        intersection = self.intersection(other, num_samples)
-        return _CompositeRegion([self, other], intersection)
+        return self._boolean(other, UNION)
 
     @staticmethod
     def _convex_hull(points: List[Tuple[float, float]]) -> List[Tuple[float, float]]:
@@ -469,93 +396,103 @@ class Region:
 
         return lower[:-1] + upper[:-1]
 
-    def difference(self, other: Region, num_samples: int = 100) -> Optional[Region]:
+    def difference(self, other: Region) -> Optional[Region]:
         """Compute the difference of this region minus another.
 
         Returns the area of this region that is not in the other region.
-        Uses intersection as hole to correctly handle partial overlaps.
 
         Args:
             other: Region to subtract from this region
-            num_samples: Number of sample points for boundary approximation
 
         Returns:
-            A new Region with the intersection as a hole, or self if no overlap
+            A new Region, or None if the other region covers this one
         """
-        inter = self.intersection(other, num_samples)
-
-        if inter is None:
-            return Region(self._outer_boundary, list(self._holes))
-
-        new_holes = list(self._holes)
-        new_holes.append(inter._outer_boundary)
+        return self._boolean(other, DIFFERENCE)
 
-        return Region(self._outer_boundary, new_holes)
-
-    def symmetric_difference(self, other: Region, num_samples: int = 100) -> "Region":
+    def symmetric_difference(self, other: Region) -> Optional[Region]:
         """Compute the symmetric difference of this region with another.
 
         Returns the area in either region but not in both.
-        Uses formula: A ^ B = A + B - 2 * (A & B)
 
         Args:
             other: Another Region
-            num_samples: Number of sample points for boundary approximation
 
         Returns:
-            A Region representing the symmetric difference
+            A Region representing the symmetric difference, or None if empty
         """
-        inter = self.intersection(other, num_samples)
-        return _SymmetricDifferenceRegion(self, other, inter)
+        return self._boolean(other, SYMMETRIC_DIFFERENCE)
 
 
-class _CompositeRegion(Region):
-    """A composite region representing the union of two regions.
+class _MultiRegion(Region):
+    """A region made of disjoint parts, as produced by boolean operations.
 
-    This is used internally to correctly compute union area using the
-    formula: area(A | B) = area(A) + area(B) - area(A & B)
+    The largest part supplies the outer boundary and holes used for display.
     """
 
-    def __init__(self, regions: List[Region], intersection: Optional[Region]) -> None:
-        self._regions = regions
-        self._intersection = intersection
-        self._outer_boundary = regions[0]._outer_boundary if regions else CompositePath([])
-        self._holes: List[CompositePath] = []
+    def __init__(self, parts: List[Region]) -> None:
+        largest = max(parts, key=lambda part: part.area())
+        super().__init__(largest.outer_boundary, largest.holes)
+        self._parts = list(parts)
+
+    @property
+    def parts(self) -> List[Region]:
+        """Get the disjoint parts of the region."""
+        return list(self._parts)
 
     def area(self) -> float:
-        """Calculate union area as sum of regions minus intersection."""
-        total = sum(r.area() for r in self._regions)
-        if self._intersection is not None:
-            total -= self._intersection.area()
-        return total
+        """Calculate the total area of all parts."""
+        return sum(part.area() for part in self._parts)
 
-    def contains_point(self, x: float, y: float) -> bool:
-        """Check if point is in any of the regions."""
-        return any(r.contains_point(x, y) for r in self._regions)
+    def signed_area(self) -> float:
+        """Calculate the summed signed area of all parts."""
+        return sum(part.signed_area() for part in self._parts)
 
+    def contains_point(self, x: float, y: float) -> bool:
+        """Check if point is in any of the parts."""
+        return any(part.contains_point(x, y) for part in self._parts)
 
-class _SymmetricDifferenceRegion(Region):
-    """A region representing the symmetric difference of two regions.
+    def _polygon(self) -> List[Ring]:
+        return [ring for part in self._parts for ring in part._polygon()]
 
-    Uses formula: area(A ^ B) = area(A) + area(B) - 2 * area(A & B)
-    """
+    def __repr__(self) -> str:
+        return f"Region(parts={len(self._parts)})"
 
-    def __init__(self, region1: Region, region2: Region, intersection: Optional[Region]) -> None:
-        self._region1 = region1
-        self._region2 = region2
-        self._intersection = intersection
-        self._outer_boundary = region1._outer_boundary
-        self._holes: List[CompositePath] = []
 
-    def area(self) -> float:
-        """Calculate symmetric difference area."""
-        total = self._region1.area() + self._region2.area()
-        if self._intersection is not None:
-            total -= 2 * self._intersection.area()
-        return total
+def _arc_points(element: Any, include_start: bool) -> List[Tuple[float, float]]:
+    """Sample an arc with chords within ARC_TOLERANCE of its radius, excluding its end point.
 
-    def contains_point(self, x: float, y: float) -> bool:
-        """Check if point is in exactly one of the regions."""
-        in1 = self._region1.contains_point(x, y)
-        in2 = self._region2.contains_point(x, y)
-        return in1 != in2
+    Interior vertices are pushed outward by sqrt(step / sin(step)) so each
+    chord triangle has the area of its sector; the polygon then encloses the
+    same area as the exact arc instead of consistently less.
+    """
+    span = element._arc_angle_span()
+    segments = max(_MIN_ARC_SEGMENTS, int(math.ceil(span / _ARC_STEP)))
+    step = span / segments
+    scale = math.sqrt(step / math.sin(step)) if step > 1e-9 else 1.0
+    cx, cy = element.center
+    points = element.sample(segments + 1)[:-1]
+    first = 0 if include_start else 1
+    for i in range(first, len(points)):
+        x, y = points[i]
+        points[i] = (cx + (x - cx) * scale, cy + (y - cy) * scale)
+    return points
+
+
+def _path_ring(path: CompositePath) -> Ring:
+    """Polygonize a closed path: exact line vertices, adaptively sampled arcs."""
+    elements = list(path)
+    # A lone closed arc (circle, ellipse) has no fixed junction vertex to preserve.
+    closed_arc = len(elements) == 1
+    points: List[Tuple[float, float]] = []
+    for element in elements:
+        if isinstance(element, LineSegment):
+            points.append(element.start_point())
+        elif isinstance(element, (CircularArc, EllipticalArc)):
+            points.extend(_arc_points(element, include_start=closed_arc))
+        else:
+            points.extend(element.sample(32)[:-1])
+    return clean_ring(points)
+
+
+def _ring_path(ring: Ring) -> CompositePath:
+    return CompositePath.from_points(list(ring) + [ring[0]])
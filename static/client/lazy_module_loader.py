@@ -0,0 +1,74 @@
+"""
+MatHud Lazy Module Chunk Loader
+
+Loads rarely used client subsystems on first import when the server serves the
+prebuilt client bundle (see static/client_bundle.py).
+
+The page defines window.MATHUD_LAZY_CHUNKS as a JSON object mapping module
+prefixes to chunk script URLs. A meta path finder fetches the chunk for a
+prefix the first time a matching module is imported and registers its sources
+with Brython's virtual file system; the regular VFS finder then loads the module.
+
+Key Features:
+    - One synchronous fetch per chunk, only when one of its modules is imported
+    - No-op without a bundle, so modules keep loading from the client path
+
+Dependencies:
+    - browser.window: Chunk fetching and evaluation
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+from typing import Any, Callable, Dict, Optional, Set
+
+from browser import window
+
+
+class LazyChunkFinder:
+    """Meta path finder that loads a module's chunk before the VFS finder runs.
+
+    It never returns a spec itself: after the chunk is registered, the lookup
+    continues to the finders that follow it in sys.meta_path.
+    """
+
+    def __init__(self, chunks: Dict[str, str], load_chunk: Callable[[str], None]) -> None:
+        self._chunks = dict(chunks)
+        self._load_chunk = load_chunk
+        self._loaded: Set[str] = set()
+
+    def chunk_url_for(self, fullname: str) -> Optional[str]:
+        """Return the chunk URL whose prefix covers ``fullname``, if any."""
+        for prefix, url in self._chunks.items():
+            if fullname == prefix or fullname.startswith(prefix + "."):
+                return url
+        return None
+
+    def find_spec(self, fullname: str, path: Any = None, target: Any = None) -> None:
+        url = self.chunk_url_for(fullname)
+        if url is None or url in self._loaded:
+            return None
+        self._load_chunk(url)
+        self._loaded.add(url)
+        return None
+
+
+def _load_chunk_script(url: str) -> None:
+    """Fetch a chunk script synchronously and evaluate it in the page's global scope."""
+    request = window.XMLHttpRequest.new()
+    request.open("GET", url, False)
+    request.send()
+    if request.status != 200:
+        raise ImportError(f"Failed to load module chunk {url} (HTTP {request.status})")
+    window.eval(request.responseText)
+
+
+def install_lazy_module_loader() -> Optional[LazyChunkFinder]:
+    """Install the chunk finder when the page was served with a client bundle."""
+    raw = getattr(window, "MATHUD_LAZY_CHUNKS", None)
+    if not raw:
+        return None
+    finder = LazyChunkFinder(json.loads(str(raw)), _load_chunk_script)
+    sys.meta_path.insert(0, finder)
+    return finder
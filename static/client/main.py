@@ -12,7 +12,7 @@ Components Initialized:
 Dependencies:
     - Brython: Python-in-browser runtime environment
     - browser.document: DOM access for SVG manipulation
-    - Custom modules: canvas, ai_interface, canvas_event_handler
+    - Custom modules: canvas, ai_interface, canvas_event_handler, lazy_module_loader
 """
 
 from __future__ import annotations
@@ -23,6 +23,7 @@ from ai_interface import AIInterface
 from browser import document, window
 from canvas import Canvas
 from canvas_event_handler import CanvasEventHandler
+from lazy_module_loader import install_lazy_module_loader
 
 # Module-level reference for programmatic test access
 _ai_interface: Optional[AIInterface] = None
@@ -185,6 +186,9 @@ def main() -> None:
     """
     global _ai_interface, _canvas
 
+    # Fetch bundled lazy chunks (graph layout, statistics, tests) on first import
+    install_lazy_module_loader()
+
     # Instantiate the canvas with current SVG viewport dimensions
     viewport = document["math-svg"].getBoundingClientRect()
     canvas = Canvas(viewport.width, viewport.height)
@@ -472,10 +472,7 @@ class ArcManager:
         return arc
 
     def get_circle_arc_by_name(self, name: str) -> Optional[CircleArc]:
-        for arc in cast(List[CircleArc], self.drawables.CircleArcs):
-            if arc.name == name:
-                return arc
-        return None
+        return cast(Optional[CircleArc], self.drawables.get_by_name(name, ("CircleArc",)))
 
     def delete_circle_arc(self, name: str) -> bool:
         arc = self.get_circle_arc_by_name(name)
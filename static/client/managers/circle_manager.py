@@ -116,11 +116,7 @@ class CircleManager:
         Returns:
             Circle: The circle object with the given name, or None if not found
         """
-        circles = self.drawables.Circles
-        for circle in circles:
-            if circle.name == name:
-                return circle
-        return None
+        return cast(Optional[Circle], self.drawables.get_by_name(name, ("Circle",)))
 
     def create_circle(
         self,
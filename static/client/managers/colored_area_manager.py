@@ -739,18 +739,16 @@ class ColoredAreaManager:
         return areas
 
     def _get_colored_area_by_name(self, name: str) -> Optional["Drawable"]:
-        collections: List[List["Drawable"]] = [
-            self.drawables.FunctionsBoundedColoredAreas,
-            self.drawables.SegmentsBoundedColoredAreas,
-            self.drawables.FunctionSegmentBoundedColoredAreas,
-            self.drawables.ColoredAreas,
-            self.drawables.ClosedShapeColoredAreas,
-        ]
-        for collection in collections:
-            for area in collection:
-                if area.name == name:
-                    return area
-        return None
+        return self.drawables.get_by_name(
+            name,
+            (
+                "FunctionsBoundedColoredArea",
+                "SegmentsBoundedColoredArea",
+                "FunctionSegmentBoundedColoredArea",
+                "ColoredArea",
+                "ClosedShapeColoredArea",
+            ),
+        )
 
     def update_colored_area(
         self,
@@ -9,7 +9,8 @@ Dependency Architecture:
     - Hierarchical Relationships: Parent-child tracking between geometric objects
     - Type-Based Hierarchy: Points → Segments → Triangles/Rectangles → Complex Objects
     - Bidirectional Mapping: Efficient lookup of both parents and children
-    - Transitive Closure: Recursive traversal of entire dependency chains
+    - Transitive Closure: Cached ancestor/descendant sets, invalidated only for the affected subgraph
+    - Topological Order: Ranks maintained incrementally as edges are added (Pearce-Kelly reordering)
 
 Core Dependency Rules:
     - Segments depend on their endpoint Points
@@ -30,6 +31,7 @@ Graph Operations:
     - Dependency Registration: register_dependency(child, parent)
     - Relationship Queries: get_parents(), get_children(), get_all_parents(), get_all_children()
     - Graph Cleanup: remove_drawable() removes all references
+    - Incremental Refresh: refresh_drawables() re-analyzes only drawables changed by undo/redo
     - Topological Sorting: resolve_dependency_order() for proper operation sequencing
 
 State Management:
@@ -46,7 +48,7 @@ Mathematical Integration:
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Set
 
 from utils.math_utils import MathUtils
 
@@ -78,6 +80,15 @@ class DrawableDependencyManager:
         self._parents: Dict[int, Set[int]] = {}
         self._children: Dict[int, Set[int]] = {}
         self._object_lookup: Dict[int, "Drawable"] = {}
+        # Memoized transitive closures keyed by drawable id; entries are dropped
+        # for every node whose closure an edge change can affect
+        self._ancestor_cache: Dict[int, Set[int]] = {}
+        self._descendant_cache: Dict[int, Set[int]] = {}
+        # Topological rank per drawable id (parents rank below children);
+        # None means the order must be rebuilt before the next query
+        self._topo_rank: Optional[Dict[int, int]] = {}
+        self._next_rank: int = 0
+        self._batch_depth: int = 0
         # Type hierarchy - which types depend on which other types
         self._type_hierarchy: Dict[str, List[str]] = {
             "Point": [],
@@ -181,6 +192,11 @@ class DrawableDependencyManager:
         self._object_lookup[child_id] = child
         self._object_lookup[parent_id] = parent
 
+        if parent_id in self._parents.get(child_id, ()):
+            return
+
+        self._invalidate_closures([parent_id], [child_id])
+
         if child_id not in self._parents:
             self._parents[child_id] = set()
         if parent_id not in self._children:
@@ -188,6 +204,7 @@ class DrawableDependencyManager:
 
         self._parents[child_id].add(parent_id)
         self._children[parent_id].add(child_id)
+        self._order_edge(parent_id, child_id)
         self._debug_log_dependency_event("register", child=child, parent=parent)
 
     def unregister_dependency(self, child: Optional["Drawable"], parent: Optional["Drawable"]) -> None:
@@ -205,6 +222,9 @@ class DrawableDependencyManager:
         child_id = id(child)
         parent_id = id(parent)
 
+        if parent_id in self._parents.get(child_id, ()):
+            self._invalidate_closures([parent_id], [child_id])
+
         if child_id in self._parents:
             self._parents[child_id].discard(parent_id)
             if not self._parents[child_id]:
@@ -226,6 +246,141 @@ class DrawableDependencyManager:
             has_children = drawable_id in self._children
             if not has_parents and not has_children:
                 del self._object_lookup[drawable_id]
+                self._forget_node(drawable_id)
+
+    def _forget_node(self, drawable_id: int) -> None:
+        """Drop cached closure and rank entries for a drawable that left the graph."""
+        self._ancestor_cache.pop(drawable_id, None)
+        self._descendant_cache.pop(drawable_id, None)
+        if self._topo_rank is not None:
+            self._topo_rank.pop(drawable_id, None)
+
+    def _reachable(self, start_ids: Iterable[int], edges: Dict[int, Set[int]]) -> Set[int]:
+        """Return the start ids plus every id reachable through ``edges`` (iterative)."""
+        seen: Set[int] = set(start_ids)
+        stack: List[int] = list(seen)
+        while stack:
+            node_id = stack.pop()
+            for next_id in edges.get(node_id, ()):
+                if next_id not in seen:
+                    seen.add(next_id)
+                    stack.append(next_id)
+        return seen
+
+    def _invalidate_closures(self, upper_ids: Iterable[int], lower_ids: Iterable[int]) -> None:
+        """Drop cached closures an edge change between ``upper_ids`` and ``lower_ids`` can affect.
+
+        Only nodes that can reach an upper endpoint have their descendant sets
+        changed, and only nodes reachable from a lower endpoint their ancestor
+        sets, so the rest of the cache stays valid.
+        """
+        if self._batch_depth > 0:
+            return
+        if self._descendant_cache:
+            for node_id in self._reachable(upper_ids, self._parents):
+                self._descendant_cache.pop(node_id, None)
+        if self._ancestor_cache:
+            for node_id in self._reachable(lower_ids, self._children):
+                self._ancestor_cache.pop(node_id, None)
+
+    def _closure(self, drawable_id: int, edges: Dict[int, Set[int]], cache: Dict[int, Set[int]]) -> Set[int]:
+        """Return the cached transitive closure of ``drawable_id`` along ``edges``."""
+        cached = cache.get(drawable_id)
+        if cached is not None:
+            return cached
+        if drawable_id not in self._object_lookup:
+            return set()
+        result: Set[int] = set()
+        stack: List[int] = list(edges.get(drawable_id, ()))
+        while stack:
+            node_id = stack.pop()
+            if node_id in result:
+                continue
+            result.add(node_id)
+            known = cache.get(node_id) if node_id != drawable_id else None
+            if known is not None:
+                # A cached closure is complete, so its members need no traversal
+                result.update(known)
+                continue
+            stack.extend(edges.get(node_id, ()))
+        cache[drawable_id] = result
+        return result
+
+    def _order_edge(self, parent_id: int, child_id: int) -> None:
+        """Keep the topological ranks valid after adding ``parent_id`` -> ``child_id``.
+
+        Pearce-Kelly: when the child already ranks above the parent nothing
+        moves; otherwise only the nodes ranked between the two endpoints that
+        are reachable from them are reassigned, reusing their own rank slots.
+        """
+        rank = self._topo_rank
+        if rank is None:
+            return
+        for node_id in (parent_id, child_id):
+            if node_id not in rank:
+                rank[node_id] = self._next_rank
+                self._next_rank += 1
+        lower = rank[child_id]
+        upper = rank[parent_id]
+        if lower > upper:
+            return
+
+        forward = self._collect_window(child_id, self._children, lambda value: value <= upper)
+        if parent_id in forward:
+            # The edge closes a cycle; fall back to a full (cycle-tolerant) rebuild
+            self._topo_rank = None
+            return
+        backward = self._collect_window(parent_id, self._parents, lambda value: value >= lower)
+        moved = sorted(backward, key=lambda node_id: rank[node_id]) + sorted(
+            forward, key=lambda node_id: rank[node_id]
+        )
+        slots = sorted(rank[node_id] for node_id in moved)
+        for node_id, slot in zip(moved, slots):
+            rank[node_id] = slot
+
+    def _collect_window(
+        self, start_id: int, edges: Dict[int, Set[int]], in_window: Callable[[int], bool]
+    ) -> Set[int]:
+        """Collect ids reachable from ``start_id`` whose rank satisfies ``in_window``."""
+        rank = self._topo_rank or {}
+        seen: Set[int] = {start_id}
+        stack: List[int] = [start_id]
+        while stack:
+            node_id = stack.pop()
+            for next_id in edges.get(node_id, ()):
+                if next_id in seen or next_id not in rank or not in_window(rank[next_id]):
+                    continue
+                seen.add(next_id)
+                stack.append(next_id)
+        return seen
+
+    def _ensure_topo_rank(self) -> Dict[int, int]:
+        """Return the topological ranks, rebuilding them with Kahn's algorithm if invalid."""
+        if self._topo_rank is not None:
+            return self._topo_rank
+        indegree: Dict[int, int] = {
+            node_id: len(self._parents.get(node_id, ())) for node_id in self._object_lookup
+        }
+        queue: List[int] = [node_id for node_id, degree in indegree.items() if degree == 0]
+        rank: Dict[int, int] = {}
+        head = 0
+        while head < len(queue):
+            node_id = queue[head]
+            head += 1
+            rank[node_id] = len(rank)
+            for child_id in self._children.get(node_id, ()):
+                if child_id not in indegree:
+                    continue
+                indegree[child_id] -= 1
+                if indegree[child_id] == 0:
+                    queue.append(child_id)
+        # Nodes on cycles never reach indegree zero; rank them after everything else
+        for node_id in indegree:
+            if node_id not in rank:
+                rank[node_id] = len(rank)
+        self._topo_rank = rank
+        self._next_rank = len(rank)
+        return rank
 
     def _verify_get_class_name_method(self, obj: Any, obj_type_name: str) -> None:
         """
@@ -351,21 +506,8 @@ class DrawableDependencyManager:
             print("Warning: Trying to get parents for None drawable")
             return set()
 
-        all_parents = set()
-        # Operate on a copy to avoid modifying the original set
-        to_process = self.get_parents(drawable).copy()
-
-        while to_process:
-            parent = to_process.pop()
-            if parent is None:
-                print("Warning: Found None parent in dependency tree")
-                continue
-
-            if parent not in all_parents:
-                all_parents.add(parent)
-                to_process.update(self.get_parents(parent))
-
-        return all_parents
+        ancestor_ids = self._closure(id(drawable), self._parents, self._ancestor_cache)
+        return {self._object_lookup[node_id] for node_id in ancestor_ids if node_id in self._object_lookup}
 
     def get_all_children(self, drawable: Optional["Drawable"]) -> Set["Drawable"]:
         """
@@ -381,20 +523,8 @@ class DrawableDependencyManager:
             print("Warning: Trying to get children for None drawable")
             return set()
 
-        all_children = set()
-        to_process = self.get_children(drawable)
-
-        while to_process:
-            child = to_process.pop()
-            if child is None:
-                print("Warning: Found None child in dependency tree")
-                continue
-
-            if child not in all_children:
-                all_children.add(child)
-                to_process.update(self.get_children(child))
-
-        return all_children
+        descendant_ids = self._closure(id(drawable), self._children, self._descendant_cache)
+        return {self._object_lookup[node_id] for node_id in descendant_ids if node_id in self._object_lookup}
 
     def remove_drawable(self, drawable: "Drawable") -> None:
         """
@@ -405,6 +535,7 @@ class DrawableDependencyManager:
         """
         drawable_id = id(drawable)
         drawable_class = drawable.get_class_name() if hasattr(drawable, "get_class_name") else ""
+        self._invalidate_closures([drawable_id], [drawable_id])
 
         # Notify children (e.g., graphs) to remove references to this drawable
         for child_id in self._children.get(drawable_id, set()).copy():
@@ -428,8 +559,77 @@ class DrawableDependencyManager:
             del self._children[drawable_id]
         if drawable_id in self._object_lookup:
             del self._object_lookup[drawable_id]
+        self._forget_node(drawable_id)
         self._debug_log_dependency_event("remove_drawable", drawable=drawable)
 
+    def clear(self) -> None:
+        """Remove every dependency edge and cached query result."""
+        self._parents.clear()
+        self._children.clear()
+        self._object_lookup.clear()
+        self._ancestor_cache.clear()
+        self._descendant_cache.clear()
+        self._topo_rank = {}
+        self._next_rank = 0
+
+    def refresh_drawables(self, changed: Iterable["Drawable"], removed: Iterable["Drawable"]) -> None:
+        """
+        Bring the graph up to date after drawables were restored in place.
+
+        Changed drawables have their own parent edges re-derived; removed ones
+        are detached without notifying their children, since those were
+        restored alongside them. Edges of untouched drawables are kept.
+
+        Args:
+            changed: Live drawables whose state or membership changed
+            removed: Drawables that are no longer on the canvas
+        """
+        changed_list = [drawable for drawable in changed if drawable is not None]
+        removed_list = [drawable for drawable in removed if drawable is not None]
+        touched_ids = [id(drawable) for drawable in changed_list + removed_list]
+        self._invalidate_closures(touched_ids, touched_ids)
+
+        self._batch_depth += 1
+        try:
+            for drawable in removed_list:
+                self._detach(id(drawable))
+            for drawable in changed_list:
+                drawable_id = id(drawable)
+                for parent_id in list(self._parents.get(drawable_id, ())):
+                    self._remove_edge(parent_id, drawable_id)
+                self.analyze_drawable_for_dependencies(drawable)
+        finally:
+            self._batch_depth -= 1
+
+        # New parent edges can reach nodes the first pass did not see
+        self._invalidate_closures(touched_ids, touched_ids)
+        self._debug_log_dependency_event("refresh")
+
+    def _remove_edge(self, parent_id: int, child_id: int) -> None:
+        """Remove one edge by id and prune endpoints left without edges."""
+        parents = self._parents.get(child_id)
+        if parents is not None:
+            parents.discard(parent_id)
+            if not parents:
+                del self._parents[child_id]
+        children = self._children.get(parent_id)
+        if children is not None:
+            children.discard(child_id)
+            if not children:
+                del self._children[parent_id]
+        self._prune_lookup_if_orphaned(child_id)
+        self._prune_lookup_if_orphaned(parent_id)
+
+    def _detach(self, drawable_id: int) -> None:
+        """Remove every edge touching a drawable without notifying its neighbours."""
+        for parent_id in list(self._parents.get(drawable_id, ())):
+            self._remove_edge(parent_id, drawable_id)
+        for child_id in list(self._children.get(drawable_id, ())):
+            self._remove_edge(drawable_id, child_id)
+        if drawable_id in self._object_lookup:
+            del self._object_lookup[drawable_id]
+        self._forget_node(drawable_id)
+
     def _notify_child_of_parent_removal(self, child: "Drawable", parent: "Drawable", parent_class: str) -> None:
         """Notify a child drawable that one of its parents has been removed."""
         child_class = child.get_class_name() if hasattr(child, "get_class_name") else ""
@@ -613,24 +813,19 @@ class DrawableDependencyManager:
         # Filter out None values
         filtered_drawables: List["Drawable"] = [d for d in drawables if d is not None]
 
-        # Simple topological sort
-        result: List["Drawable"] = []
-        visited: Set["Drawable"] = set()
-
-        def visit(drawable: "Drawable") -> None:
-            if drawable in visited:
-                return
-
-            visited.add(drawable)
-
-            # Visit all parents first
-            for parent in self.get_parents(drawable):
-                visit(parent)
-
-            result.append(drawable)
-
-        # Process all drawables
+        # Include every ancestor so parents are processed before their children
+        selected: Dict[int, "Drawable"] = {}
         for drawable in filtered_drawables:
-            visit(drawable)
-
-        return result
+            drawable_id = id(drawable)
+            if drawable_id in selected:
+                continue
+            selected[drawable_id] = drawable
+            for ancestor_id in self._closure(drawable_id, self._parents, self._ancestor_cache):
+                ancestor = self._object_lookup.get(ancestor_id)
+                if ancestor is not None and ancestor_id not in selected:
+                    selected[ancestor_id] = ancestor
+
+        # Drawables outside the graph have no constraints and keep their input position up front
+        rank = self._ensure_topo_rank()
+        ordered_ids = sorted(selected, key=lambda drawable_id: rank.get(drawable_id, -1))
+        return [selected[drawable_id] for drawable_id in ordered_ids]
@@ -250,6 +250,12 @@ class DrawableManager:
         """Get only the drawables that should be rendered, preserving layering."""
         return cast(List["Drawable"], self.drawables.get_renderables_with_layering())
 
+    def get_renderable_drawables_in_bounds(
+        self, min_x: float, min_y: float, max_x: float, max_y: float
+    ) -> List["Drawable"]:
+        """Get the renderable drawables that may overlap a math-space window, preserving layering."""
+        return cast(List["Drawable"], self.drawables.get_renderables_in_bounds(min_x, min_y, max_x, max_y))
+
     # ------------------- Point Methods -------------------
 
     # ------------------- Polygon Methods -------------------
@@ -27,6 +27,14 @@ Rendering Support:
     - Layered Access: get_all_with_layering() provides proper rendering order
     - Background/Foreground Separation: Efficient separation for rendering pipeline
 
+Lookup Indexes:
+    - Name Index: name -> drawables, answered in bucket order
+    - Spatial Hash: tolerance-aware grid over point and segment endpoint coordinates
+    - Incremental Updates: renamed or moved drawables, and segments whose endpoints
+      moved or were replaced, are re-filed in place from the drawable change log
+    - Lazy Rebuilds: indexes rebuild on demand after rebuild_renderables() or a trimmed log
+    - Render Bounds: math-space grid over renderables for viewport-culled rendering
+
 State Management:
     - State Serialization: get_state() for undo/redo functionality
     - Clear Operations: Bulk removal for canvas reset
@@ -40,11 +48,36 @@ Access Patterns:
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional
+import math
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple
+
+from drawables.drawable import change_log_position, changed_since
+from utils.bounds_index import BoundsIndex
+from utils.math_utils import MathUtils
 
 if TYPE_CHECKING:
     from drawables.drawable import Drawable
 
+# Spatial hash cells are derived from the lookup tolerance. At four tolerances wide,
+# a match sits in the query cell or a neighbour even after division rounding: only
+# coordinates below 2**52 tolerances can differ by less than the tolerance at all.
+_SPATIAL_CELL_SIZE: float = 4 * MathUtils.EPSILON
+
+CellKey = Optional[Tuple[int, int]]
+
+_POLYGON_CLASSES: Tuple[str, ...] = (
+    "Triangle",
+    "Quadrilateral",
+    "Rectangle",
+    "Pentagon",
+    "Hexagon",
+    "Heptagon",
+    "Octagon",
+    "Nonagon",
+    "Decagon",
+    "GenericPolygon",
+)
+
 
 class DrawablesContainer:
     """
@@ -58,6 +91,14 @@ class DrawablesContainer:
         """Initialize an empty drawables container."""
         self._drawables: Dict[str, List["Drawable"]] = {}
         self._renderables: Dict[str, List["Drawable"]] = {}
+        # id -> insertion sequence of each renderable, used to restore bucket order after culling
+        self._render_order: Dict[int, int] = {}
+        self._render_sequence: int = 0
+        # Built on the first culled query; None until then or after a wholesale rebuild
+        self._render_bounds: Optional[BoundsIndex] = None
+        # Lookup indexes, built on the first lookup and kept current from the drawable change log
+        self._index_log_position: int = 0
+        self.invalidate_indexes()
 
     def add(self, drawable: "Drawable") -> None:
         """
@@ -71,6 +112,7 @@ class DrawablesContainer:
             self._drawables[category] = []
         self._drawables[category].append(drawable)
         self._sync_renderable_entry(drawable)
+        self._index_drawable(drawable)
 
     def _is_renderable(self, drawable: "Drawable") -> bool:
         renderable_attr = getattr(drawable, "is_renderable", True)
@@ -79,41 +121,38 @@ class DrawablesContainer:
         except Exception:
             return True
 
-    def _apply_layering(self, colored: List["Drawable"], others: List["Drawable"]) -> List["Drawable"]:
-        circles: List["Drawable"] = []
-        circle_arcs: List["Drawable"] = []
-        remaining: List["Drawable"] = []
-
-        for drawable in others:
-            class_name = (
-                drawable.get_class_name() if hasattr(drawable, "get_class_name") else drawable.__class__.__name__
-            )
-            if class_name == "Circle":
-                circles.append(drawable)
-            elif class_name == "CircleArc":
-                circle_arcs.append(drawable)
-            else:
-                remaining.append(drawable)
+    @staticmethod
+    def _layer_of(drawable: "Drawable") -> int:
+        """Return the draw layer: colored areas, then other drawables, then circles, then circle arcs."""
+        class_name = drawable.get_class_name() if hasattr(drawable, "get_class_name") else drawable.__class__.__name__
+        if "ColoredArea" in class_name:
+            return 0
+        if class_name == "Circle":
+            return 2
+        if class_name == "CircleArc":
+            return 3
+        return 1
 
-        return colored + remaining + circles + circle_arcs
+    def _apply_layering(self, colored: List["Drawable"], others: List["Drawable"]) -> List["Drawable"]:
+        # Stable sort keeps insertion order within each layer
+        return colored + sorted(others, key=self._layer_of)
 
     def _add_to_renderables(self, drawable: "Drawable") -> None:
         category = drawable.get_class_name()
         if category not in self._renderables:
             self._renderables[category] = []
         bucket = self._renderables[category]
-        if drawable not in bucket:
+        if not any(candidate is drawable for candidate in bucket):
             bucket.append(drawable)
+            self._render_sequence += 1
+            self._render_order[id(drawable)] = self._render_sequence
+            if self._render_bounds is not None:
+                self._render_bounds.add(drawable)
 
     def _remove_from_renderables(self, drawable: "Drawable") -> None:
-        category = drawable.get_class_name()
-        bucket = self._renderables.get(category)
-        if not bucket:
-            return
-        if drawable in bucket:
-            bucket.remove(drawable)
-            if not bucket:
-                del self._renderables[category]
+        self._bucket_remove(self._renderables, drawable.get_class_name(), drawable)
+        if self._render_order.pop(id(drawable), None) is not None and self._render_bounds is not None:
+            self._render_bounds.remove(drawable)
 
     def _sync_renderable_entry(self, drawable: "Drawable") -> None:
         if self._is_renderable(drawable):
@@ -132,13 +171,213 @@ class DrawablesContainer:
             bool: True if the drawable was removed, False otherwise
         """
         category = drawable.get_class_name()
-        if category in self._drawables and drawable in self._drawables[category]:
-            self._drawables[category].remove(drawable)
-            if not self._drawables[category]:
-                del self._drawables[category]
-            self._remove_from_renderables(drawable)
-            return True
-        return False
+        bucket = self._drawables.get(category)
+        if not bucket:
+            return False
+        # Match by identity: Point equality is coordinate-based and would pick the wrong twin
+        for position, candidate in enumerate(bucket):
+            if candidate is drawable:
+                del bucket[position]
+                break
+        else:
+            return False
+        if not bucket:
+            del self._drawables[category]
+        self._remove_from_renderables(drawable)
+        self._unindex_drawable(drawable)
+        return True
+
+    # ------------------------------------------------------------------
+    # Lookup indexes
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _cell_key(x: float, y: float) -> CellKey:
+        try:
+            return (math.floor(x / _SPATIAL_CELL_SIZE), math.floor(y / _SPATIAL_CELL_SIZE))
+        except (OverflowError, ValueError, TypeError):
+            # Non-finite coordinates share a single catch-all cell
+            return None
+
+    @classmethod
+    def _neighbour_keys(cls, x: float, y: float) -> List[CellKey]:
+        key = cls._cell_key(x, y)
+        if key is None:
+            return [None]
+        cx, cy = key
+        return [(cx + dx, cy + dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1)]
+
+    @staticmethod
+    def _bucket_remove(index: Dict[Any, List["Drawable"]], key: Any, drawable: "Drawable") -> None:
+        bucket = index.get(key)
+        if not bucket:
+            return
+        for position, candidate in enumerate(bucket):
+            if candidate is drawable:
+                del bucket[position]
+                break
+        if not bucket:
+            del index[key]
+
+    def _segment_keys(self, segment: Any) -> List[CellKey]:
+        keys: List[CellKey] = []
+        for endpoint in (getattr(segment, "point1", None), getattr(segment, "point2", None)):
+            if endpoint is None:
+                continue
+            key = self._cell_key(endpoint.x, endpoint.y)
+            if key not in keys:
+                keys.append(key)
+        return keys
+
+    def _index_drawable(self, drawable: "Drawable") -> None:
+        if not self._indexes_ready:
+            return
+        drawable_id = id(drawable)
+        name = getattr(drawable, "name", "")
+        self._indexed[drawable_id] = (drawable, name)
+        self._name_index.setdefault(name, []).append(drawable)
+        self._spatial_insert(drawable)
+
+    def _unindex_drawable(self, drawable: "Drawable") -> None:
+        if not self._indexes_ready:
+            return
+        indexed = self._indexed.pop(id(drawable), None)
+        if indexed is None:
+            return
+        self._bucket_remove(self._name_index, indexed[1], drawable)
+        self._spatial_remove(drawable)
+
+    def _spatial_insert(self, drawable: Any) -> None:
+        category = drawable.get_class_name()
+        if category == "Point":
+            keys = [self._cell_key(drawable.x, drawable.y)]
+            cells = self._point_cells
+        elif category == "Segment":
+            keys = self._segment_keys(drawable)
+            cells = self._segment_cells
+            endpoint_ids = []
+            for endpoint in (getattr(drawable, "point1", None), getattr(drawable, "point2", None)):
+                if endpoint is not None:
+                    endpoint_ids.append(id(endpoint))
+                    self._endpoint_segments.setdefault(id(endpoint), {})[id(drawable)] = drawable
+            self._segment_endpoints[id(drawable)] = endpoint_ids
+        else:
+            return
+        self._spatial_keys[id(drawable)] = keys
+        for key in keys:
+            cells.setdefault(key, []).append(drawable)
+
+    def _spatial_remove(self, drawable: Any) -> None:
+        drawable_id = id(drawable)
+        keys = self._spatial_keys.pop(drawable_id, None)
+        if keys is None:
+            return
+        cells = self._point_cells if drawable.get_class_name() == "Point" else self._segment_cells
+        for key in keys:
+            self._bucket_remove(cells, key, drawable)
+        for endpoint_id in self._segment_endpoints.pop(drawable_id, []):
+            segments = self._endpoint_segments.get(endpoint_id)
+            if segments is not None:
+                segments.pop(drawable_id, None)
+                if not segments:
+                    del self._endpoint_segments[endpoint_id]
+
+    def invalidate_indexes(self) -> None:
+        """Drop the lookup indexes so the next query rebuilds them from storage."""
+        self._indexes_ready = False
+        # id -> (drawable, name it is indexed under)
+        self._indexed: Dict[int, Tuple["Drawable", str]] = {}
+        self._name_index: Dict[str, List["Drawable"]] = {}
+        self._point_cells: Dict[CellKey, List["Drawable"]] = {}
+        self._segment_cells: Dict[CellKey, List["Drawable"]] = {}
+        # id -> cell keys a point or segment is filed under
+        self._spatial_keys: Dict[int, List[CellKey]] = {}
+        # point id -> segments indexed by that endpoint, and segment id -> endpoint ids
+        self._endpoint_segments: Dict[int, Dict[int, "Drawable"]] = {}
+        self._segment_endpoints: Dict[int, List[int]] = {}
+
+    def _ensure_indexes(self) -> None:
+        """Build the lookup indexes, or re-file only the drawables mutated since the last query."""
+        if self._indexes_ready:
+            changed = changed_since(self._index_log_position)
+            self._index_log_position = change_log_position()
+            if changed is not None:
+                for drawable_id in changed:
+                    self._reindex_changed(drawable_id)
+                return
+        self.invalidate_indexes()
+        self._indexes_ready = True
+        self._index_log_position = change_log_position()
+        for bucket in self._drawables.values():
+            for drawable in bucket:
+                self._index_drawable(drawable)
+
+    def _reindex_changed(self, drawable_id: int) -> None:
+        indexed = self._indexed.get(drawable_id)
+        if indexed is not None:
+            drawable, indexed_name = indexed
+            name = getattr(drawable, "name", "")
+            if name != indexed_name:
+                self._bucket_remove(self._name_index, indexed_name, drawable)
+                self._name_index.setdefault(name, []).append(drawable)
+                self._indexed[drawable_id] = (drawable, name)
+            if drawable_id in self._spatial_keys:
+                self._spatial_remove(drawable)
+                self._spatial_insert(drawable)
+        # A moved endpoint moves every segment filed under it
+        for segment in list(self._endpoint_segments.get(drawable_id, {}).values()):
+            self._spatial_remove(segment)
+            self._spatial_insert(segment)
+
+    def _first_in_storage(self, categories: Iterable[str], matches: List["Drawable"]) -> Optional["Drawable"]:
+        if len(matches) <= 1:
+            return matches[0] if matches else None
+        # Several matches: keep the storage-order answer of a linear scan
+        match_ids = {id(match) for match in matches}
+        for category in categories:
+            for drawable in self._drawables.get(category, []):
+                if id(drawable) in match_ids:
+                    return drawable
+        return matches[0]
+
+    def get_by_name(self, name: str, class_names: Optional[Iterable[str]] = None) -> Optional["Drawable"]:
+        """Return the first drawable called ``name``, optionally restricted to ``class_names``.
+
+        Class names are tried in the given order, mirroring a scan over those buckets.
+        """
+        self._ensure_indexes()
+        candidates = self._name_index.get(name)
+        if not candidates:
+            return None
+        if class_names is None:
+            return self._first_in_storage(list(self._drawables), candidates)
+        for class_name in class_names:
+            matches = [drawable for drawable in candidates if drawable.get_class_name() == class_name]
+            if matches:
+                return self._first_in_storage((class_name,), matches)
+        return None
+
+    def get_point_at(self, x: float, y: float) -> Optional["Drawable"]:
+        """Return the stored point matching (x, y) within MathUtils.EPSILON."""
+        self._ensure_indexes()
+        matches: List["Drawable"] = []
+        for key in self._neighbour_keys(x, y):
+            for point in self._point_cells.get(key, ()):
+                if MathUtils.point_matches_coordinates(point, x, y):
+                    matches.append(point)
+        return self._first_in_storage(("Point",), matches)
+
+    def get_segment_at(self, x1: float, y1: float, x2: float, y2: float) -> Optional["Drawable"]:
+        """Return the stored segment with endpoints (x1, y1) and (x2, y2) in either order."""
+        self._ensure_indexes()
+        matches: List["Drawable"] = []
+        for key in self._neighbour_keys(x1, y1):
+            for segment in self._segment_cells.get(key, ()):
+                if MathUtils.segment_matches_coordinates(segment, x1, y1, x2, y2) and not any(
+                    match is segment for match in matches
+                ):
+                    matches.append(segment)
+        return self._first_in_storage(("Segment",), matches)
 
     def get_by_class_name(self, class_name: str) -> List["Drawable"]:
         """
@@ -214,10 +453,40 @@ class DrawablesContainer:
                 others.extend(bucket)
         return self._apply_layering(list(colored), list(others))
 
+    def get_renderables_in_bounds(self, min_x: float, min_y: float, max_x: float, max_y: float) -> List["Drawable"]:
+        """
+        Get renderable drawables that may overlap a math-space window, with proper layering.
+
+        Drawables without a math-space bounding box (functions, labels, colored areas, ...)
+        are always included. The result keeps the order of get_renderables_with_layering().
+        """
+        if self._render_bounds is None:
+            self._render_bounds = BoundsIndex()
+            for bucket in self._renderables.values():
+                for drawable in bucket:
+                    self._render_bounds.add(drawable)
+        hits: List["Drawable"] = self._render_bounds.query(min_x, min_y, max_x, max_y)
+        category_rank = {class_name: rank for rank, class_name in enumerate(self._renderables)}
+        order = self._render_order
+
+        def layering_key(drawable: "Drawable") -> Tuple[int, int, int]:
+            rank = category_rank.get(drawable.get_class_name(), 0)
+            return (self._layer_of(drawable), rank, order.get(id(drawable), 0))
+
+        hits.sort(key=layering_key)
+        return hits
+
+    def is_current_renderable(self, drawable: "Drawable") -> bool:
+        """Return True when the drawable is currently registered for rendering."""
+        return id(drawable) in self._render_order
+
     def clear(self) -> None:
         """Remove all drawables from the container."""
         self._drawables.clear()
         self._renderables.clear()
+        self._render_order = {}
+        self._render_bounds = None
+        self.invalidate_indexes()
 
     def get_state(self) -> Dict[str, List[Dict[str, Any]]]:
         """
@@ -232,11 +501,23 @@ class DrawablesContainer:
         return state_dict
 
     def rebuild_renderables(self) -> None:
-        """Rebuild the renderables index from the current drawable storage."""
+        """Rebuild the renderables index from the current drawable storage.
+
+        Storage may have been replaced wholesale (undo/redo, workspace restore), so
+        the lookup indexes are dropped too and rebuilt on the next query.
+        """
+        self.invalidate_indexes()
+        # Storage buckets hold each drawable once, so no per-item membership checks are needed
         self._renderables = {}
-        for bucket in self._drawables.values():
-            for drawable in bucket:
-                self._sync_renderable_entry(drawable)
+        self._render_order = {}
+        self._render_bounds = None
+        for category, bucket in self._drawables.items():
+            renderable = [drawable for drawable in bucket if self._is_renderable(drawable)]
+            if renderable:
+                self._renderables[category] = renderable
+                for drawable in renderable:
+                    self._render_sequence += 1
+                    self._render_order[id(drawable)] = self._render_sequence
 
     # Property-style access for specific drawable types (for convenience)
     @property
@@ -263,10 +544,7 @@ class DrawablesContainer:
         """Retrieve a triangle by name."""
         if not name:
             return None
-        for triangle in self.Triangles:
-            if getattr(triangle, "name", "") == name:
-                return triangle
-        return None
+        return self.get_by_name(name, ("Triangle",))
 
     @property
     def Rectangles(self) -> List["Drawable"]:
@@ -277,10 +555,7 @@ class DrawablesContainer:
         """Retrieve a rectangle by name."""
         if not name:
             return None
-        for rectangle in self.Rectangles:
-            if getattr(rectangle, "name", "") == name:
-                return rectangle
-        return None
+        return self.get_by_name(name, ("Rectangle",))
 
     @property
     def Quadrilaterals(self) -> List["Drawable"]:
@@ -291,10 +566,7 @@ class DrawablesContainer:
         """Retrieve a quadrilateral by name."""
         if not name:
             return None
-        for quadrilateral in self.Quadrilaterals:
-            if getattr(quadrilateral, "name", "") == name:
-                return quadrilateral
-        return None
+        return self.get_by_name(name, ("Quadrilateral",))
 
     @property
     def Pentagons(self) -> List["Drawable"]:
@@ -305,10 +577,7 @@ class DrawablesContainer:
         """Retrieve a pentagon by name."""
         if not name:
             return None
-        for pentagon in self.Pentagons:
-            if getattr(pentagon, "name", "") == name:
-                return pentagon
-        return None
+        return self.get_by_name(name, ("Pentagon",))
 
     @property
     def Hexagons(self) -> List["Drawable"]:
@@ -319,26 +588,11 @@ class DrawablesContainer:
         """Retrieve a hexagon by name."""
         if not name:
             return None
-        for hexagon in self.Hexagons:
-            if getattr(hexagon, "name", "") == name:
-                return hexagon
-        return None
+        return self.get_by_name(name, ("Hexagon",))
 
     def iter_polygons(self, allowed_classes: Optional[Iterable[str]] = None) -> Iterable["Drawable"]:
         """Iterate over stored polygon drawables, optionally filtered by class name."""
-        polygon_classes = (
-            "Triangle",
-            "Quadrilateral",
-            "Rectangle",
-            "Pentagon",
-            "Hexagon",
-            "Heptagon",
-            "Octagon",
-            "Nonagon",
-            "Decagon",
-            "GenericPolygon",
-        )
-        target_classes = tuple(allowed_classes) if allowed_classes else polygon_classes
+        target_classes = tuple(allowed_classes) if allowed_classes else _POLYGON_CLASSES
         for class_name in target_classes:
             for drawable in self.get_by_class_name(class_name):
                 yield drawable
@@ -347,10 +601,7 @@ class DrawablesContainer:
         """Retrieve the first polygon matching the provided name."""
         if not name:
             return None
-        for polygon in self.iter_polygons(allowed_classes):
-            if getattr(polygon, "name", "") == name:
-                return polygon
-        return None
+        return self.get_by_name(name, tuple(allowed_classes) if allowed_classes else _POLYGON_CLASSES)
 
     @property
     def Circles(self) -> List["Drawable"]:
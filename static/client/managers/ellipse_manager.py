@@ -123,11 +123,7 @@ class EllipseManager:
         Returns:
             Ellipse: The ellipse object with the given name, or None if not found
         """
-        ellipses = self.drawables.Ellipses
-        for ellipse in ellipses:
-            if ellipse.name == name:
-                return ellipse
-        return None
+        return cast(Optional[Ellipse], self.drawables.get_by_name(name, ("Ellipse",)))
 
     def create_ellipse(
         self,
@@ -160,6 +160,7 @@ class FunctionManager:
                     if hole not in existing_function.point_discontinuities:
                         existing_function.point_discontinuities.append(hole)
                 existing_function.point_discontinuities.sort()
+                existing_function.bump_version()
 
             if color_value:
                 existing_function.update_color(color_value)
@@ -21,7 +21,6 @@ from drawables.undirected_graph import UndirectedGraph
 from drawables.tree import Tree
 from geometry.graph_state import GraphEdgeDescriptor, GraphState, GraphVertexDescriptor, TreeState
 from managers.dependency_removal import remove_drawable_with_dependencies
-from utils.graph_layout import layout_vertices
 from utils.graph_utils import Edge, GraphUtils
 
 if TYPE_CHECKING:
@@ -372,6 +371,9 @@ class GraphManager:
             except (AttributeError, KeyError):
                 placement_box = None
 
+        # Imported here so the bundled graph layout chunk loads on the first graph only
+        from utils.graph_layout import layout_vertices
+
         edges_for_layout = [Edge(e.source, e.target) for e in state.edges]
         layout_positions = layout_vertices(
             [v.id for v in state.vertices],
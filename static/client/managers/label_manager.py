@@ -45,10 +45,7 @@ class LabelManager:
     def get_label_by_name(self, name: str) -> Optional[Label]:
         if not name:
             return None
-        for label in self.drawables.Labels:
-            if label.name == name:
-                return label
-        return None
+        return cast(Optional[Label], self.drawables.get_by_name(name, ("Label",)))
 
     def get_labels_at_position(self, x: float, y: float) -> List[Label]:
         matches: List[Label] = []
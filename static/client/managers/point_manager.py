@@ -90,8 +90,8 @@ class PointManager:
         """
         Get a point at the specified coordinates.
 
-        Searches through all existing points to find one that matches the specified
-        coordinates using mathematical tolerance for coordinate matching.
+        Uses the container's spatial hash, matching coordinates within
+        mathematical tolerance.
 
         Args:
             x (float): x-coordinate to search for
@@ -100,16 +100,13 @@ class PointManager:
         Returns:
             Point: The matching point object, or None if no match is found
         """
-        for point in self.drawables.Points:
-            if MathUtils.point_matches_coordinates(point, x, y):
-                return point
-        return None
+        return cast(Optional[Point], self.drawables.get_point_at(x, y))
 
     def get_point_by_name(self, name: str) -> Optional[Point]:
         """
         Get a point by its name.
 
-        Searches through all existing points to find one with the specified name.
+        Uses the container's name index.
 
         Args:
             name (str): The name of the point to find
@@ -117,10 +114,7 @@ class PointManager:
         Returns:
             Point: The point with the matching name, or None if not found
         """
-        for point in self.drawables.Points:
-            if point.name == name:
-                return point
-        return None
+        return cast(Optional[Point], self.drawables.get_by_name(name, ("Point",)))
 
     def create_point(
         self,
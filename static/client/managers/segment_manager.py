@@ -96,8 +96,8 @@ class SegmentManager:
         """
         Get a segment by its endpoint coordinates.
 
-        Searches through all existing segments to find one that matches the specified
-        endpoint coordinates using mathematical tolerance for coordinate matching.
+        Uses the container's spatial hash over segment endpoints, matching
+        coordinates within mathematical tolerance.
 
         Args:
             x1 (float): x-coordinate of the first endpoint
@@ -108,16 +108,13 @@ class SegmentManager:
         Returns:
             Segment: The matching segment object, or None if no match is found
         """
-        for segment in self.drawables.Segments:
-            if MathUtils.segment_matches_coordinates(segment, x1, y1, x2, y2):
-                return segment
-        return None
+        return cast(Optional[Segment], self.drawables.get_segment_at(x1, y1, x2, y2))
 
     def get_segment_by_name(self, name: str) -> Optional[Segment]:
         """
         Get a segment by its name.
 
-        Searches through all existing segments to find one with the specified name.
+        Uses the container's name index.
 
         Args:
             name (str): The name of the segment to find
@@ -125,10 +122,7 @@ class SegmentManager:
         Returns:
             Segment: The segment with the matching name, or None if not found
         """
-        for segment in self.drawables.Segments:
-            if segment.name == name:
-                return segment
-        return None
+        return cast(Optional[Segment], self.drawables.get_by_name(name, ("Segment",)))
 
     def get_segment_by_points(self, p1: "Point", p2: "Point") -> Optional[Segment]:
         """
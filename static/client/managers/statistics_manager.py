@@ -8,6 +8,7 @@ Key Features:
     - Discrete distribution plots using bar elements
     - Custom bar chart creation with values and labels
     - Regression fitting (linear, polynomial, exponential, etc.)
+    - Array-backed scatter plots for regression data points
     - Plot deletion with proper cleanup of constituent drawables
     - Workspace restore via plot materialization methods
 """
@@ -16,7 +17,7 @@ from __future__ import annotations
 
 import math
 import time
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, cast
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from constants import default_area_fill_color, default_area_opacity
 from drawables.bars_plot import BarsPlot
@@ -24,11 +25,7 @@ from drawables.continuous_plot import ContinuousPlot
 from drawables.bar import Bar
 from drawables.discrete_plot import DiscretePlot
 from drawables.plot import Plot
-from utils.statistics.distributions import default_normal_bounds, normal_pdf_expression
-from utils.statistics.descriptive import (
-    compute_descriptive_statistics as _compute_descriptive_statistics,
-)
-from utils.statistics.regression import fit_regression as _fit_regression, SUPPORTED_MODEL_TYPES
+from drawables.scatter_plot import ScatterPlot
 
 if TYPE_CHECKING:
     from canvas import Canvas
@@ -36,7 +33,6 @@ if TYPE_CHECKING:
     from managers.drawable_dependency_manager import DrawableDependencyManager
     from managers.drawables_container import DrawablesContainer
     from managers.function_manager import FunctionManager
-    from managers.point_manager import PointManager
     from name_generator.drawable import DrawableNameGenerator
 
 
@@ -150,6 +146,9 @@ class StatisticsManager:
                 )
                 return result_payload
 
+            # utils.statistics ships as a lazily loaded bundle chunk, so it is imported on use
+            from utils.statistics.distributions import normal_pdf_expression
+
             expression = normal_pdf_expression(mean, sigma)
 
             function_preferred = f"{plot_name}_pdf"
@@ -357,12 +356,13 @@ class StatisticsManager:
         """
         Fit a regression model to data points and plot the resulting curve.
 
-        Creates a standalone Function for the fitted curve and optionally
-        Point markers for the data. No tracking entity is created - delete
-        the function with delete_function() and points individually.
+        Creates a standalone Function for the fitted curve and optionally a
+        single ScatterPlot holding the data points. No tracking entity ties
+        them together - delete the function with delete_function() and the
+        scatter plot with delete_plot().
 
         Args:
-            name: Optional base name for the function and points
+            name: Optional base name for the function and scatter plot
             x_data: List of x values
             y_data: List of y values
             model_type: One of "linear", "polynomial", "exponential",
@@ -375,8 +375,10 @@ class StatisticsManager:
 
         Returns:
             Dict with function_name, expression, coefficients, r_squared,
-            model_type, bounds, and optionally point_names
+            model_type, bounds, and optionally scatter_name and point_count
         """
+        from utils.statistics.regression import SUPPORTED_MODEL_TYPES, fit_regression as _fit_regression
+
         started_at = time.perf_counter()
         model = str(model_type or "").strip().lower()
         self._log_operation_debug(
@@ -408,7 +410,7 @@ class StatisticsManager:
             coefficients = result["coefficients"]
             r_squared = result["r_squared"]
 
-            # Generate base name for function and points
+            # Generate base name for function and scatter plot
             default_name = f"{model}_fit"
             base_name = self.name_generator.filter_string(name or "") or default_name
 
@@ -443,33 +445,17 @@ class StatisticsManager:
             )
             function_name = getattr(function_obj, "name", function_name)
 
-            # Optionally plot the data points
-            point_names: List[str] = []
+            # Optionally plot the data points as one scatter drawable
+            scatter: Optional[ScatterPlot] = None
             should_show_points = show_points if show_points is not None else True
 
             if should_show_points:
-                point_manager = self._get_point_manager()
-                if point_manager is not None:
-                    for i, (x, y) in enumerate(zip(x_data, y_data)):
-                        point_preferred = f"{base_name}_pt{i}"
-                        try:
-                            created_point = point_manager.create_point(
-                                x=x,
-                                y=y,
-                                name=point_preferred,
-                                color=point_color,
-                                extra_graphics=False,
-                            )
-                            if created_point is not None:
-                                point_names.append(created_point.name)
-                        except Exception as e:
-                            # Log point creation failure for debugging
-                            try:
-                                logger = getattr(self.canvas, "logger", None)
-                                if logger is not None:
-                                    logger.debug(f"Failed to create regression point {point_preferred}: {e}")
-                            except Exception:
-                                pass
+                scatter = self._create_scatter_plot(
+                    name=f"{base_name}_points",
+                    x_data=x_data,
+                    y_data=y_data,
+                    color=point_color,
+                )
 
             # Trigger redraw
             if getattr(self.canvas, "draw_enabled", False):
@@ -487,8 +473,9 @@ class StatisticsManager:
                 "bounds": {"left": left_bound, "right": right_bound},
             }
 
-            if point_names:
-                result_dict["point_names"] = point_names
+            if scatter is not None:
+                result_dict["scatter_name"] = scatter.name
+                result_dict["point_count"] = scatter.point_count
 
             return result_dict
         except Exception as exc:
@@ -508,19 +495,27 @@ class StatisticsManager:
                     details={
                         "model_type": model,
                         "function_name": result_dict.get("function_name", ""),
-                        "point_count": len(cast(List[str], result_dict.get("point_names", []))),
+                        "point_count": result_dict.get("point_count", 0),
                     },
                 )
 
-    def _get_point_manager(self) -> Optional["PointManager"]:
-        """Get the point manager from the canvas."""
-        try:
-            dm = getattr(self.canvas, "drawable_manager", None)
-            if dm is not None:
-                return getattr(dm, "point_manager", None)
-        except Exception:
-            pass
-        return None
+    def _create_scatter_plot(
+        self,
+        *,
+        name: str,
+        x_data: List[float],
+        y_data: List[float],
+        color: Optional[str],
+    ) -> ScatterPlot:
+        """Add a ScatterPlot for the data samples under a unique name."""
+        scatter = ScatterPlot(
+            self._generate_unique_name(name),
+            x_values=x_data,
+            y_values=y_data,
+            color=None if color is None else str(color),
+        )
+        self.drawables.add(scatter)
+        return scatter
 
     def compute_descriptive_statistics(
         self,
@@ -539,6 +534,8 @@ class StatisticsManager:
             Dict with count, mean, median, mode, standard_deviation,
             variance, min, max, q1, q3, iqr, range.
         """
+        from utils.statistics.descriptive import compute_descriptive_statistics as _compute_descriptive_statistics
+
         return dict(_compute_descriptive_statistics(data))
 
     def delete_plot(self, name: str) -> bool:
@@ -558,6 +555,9 @@ class StatisticsManager:
                 self._delete_bars_plot(plot)
             elif plot_class == "ContinuousPlot":
                 self._delete_continuous_plot(plot)
+            elif plot_class == "ScatterPlot":
+                # Scatter plots draw their own samples; there are no components to remove.
+                pass
             else:
                 # Legacy best-effort deletion.
                 self._delete_legacy_plot(plot)
@@ -797,7 +797,7 @@ class StatisticsManager:
     # Internal helpers
     # ------------------------------------------------------------------
     def _get_plot_by_name(self, name: str) -> Optional[Plot]:
-        for class_name in ("ContinuousPlot", "DiscretePlot", "BarsPlot", "Plot"):
+        for class_name in ("ContinuousPlot", "DiscretePlot", "BarsPlot", "ScatterPlot", "Plot"):
             for d in self.drawables.get_by_class_name(class_name):
                 try:
                     if getattr(d, "name", None) == name:
@@ -1063,6 +1063,8 @@ class StatisticsManager:
         left_bound: Optional[float],
         right_bound: Optional[float],
     ) -> tuple[float, float]:
+        from utils.statistics.distributions import default_normal_bounds
+
         default_left, default_right = default_normal_bounds(mean, sigma, k=4.0)
         left = default_left if left_bound is None else float(left_bound)
         right = default_right if right_bound is None else float(right_bound)
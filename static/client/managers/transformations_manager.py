@@ -52,6 +52,7 @@ _EXCLUDE_TRANSFORM: Tuple[str, ...] = (
     "Label",
     "Bar",
     "Plot",
+    "ScatterPlot",
 )
 
 
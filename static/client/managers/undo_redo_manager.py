@@ -1,32 +1,36 @@
 """
 MatHud Undo/Redo State Management System
 
-Provides comprehensive undo and redo functionality for canvas operations through state archiving
-and restoration. Maintains operation history and handles complex object relationships during
-state transitions.
+Provides comprehensive undo and redo functionality for canvas operations through delta
+recording and in-place restoration. Maintains operation history and handles complex object
+relationships during state transitions.
 
 State Management Architecture:
-    - Snapshot System: Deep copying of entire canvas state for each operation
+    - Delta History: Each undo entry records only the drawables an action created, deleted, or mutated
+    - Committed Baseline: One snapshot per live drawable describing the last committed state
     - Dual Stack System: Separate undo and redo stacks for bidirectional navigation
     - Automatic Archiving: State capture before any destructive operation
-    - State Restoration: Complete canvas reconstruction from archived states
+    - Memory Budget: Oldest entries are evicted once the recorded snapshots exceed the budget
 
-Archived State Components:
-    - Drawable Objects: Complete deep copy of all geometric objects and their properties
-    - Computation History: Mathematical operation results and expressions
-    - Object Relationships: Preservation of parent-child dependencies
-    - Canvas References: Proper object-to-canvas relationship maintenance
+Change Detection:
+    - Drawables record every mutation in the shared drawable change log; the manager keeps a
+      cursor into it and compares only the logged drawables' versions with the baseline
+    - Pending changes are collected lazily when the next archive, undo, or redo occurs
+    - Bucket membership and ordering are compared by identity, never by value equality
 
 Operation Flow:
-    - archive(): Captures current state before modifications
-    - undo(): Restores previous state and moves current to redo stack
-    - redo(): Restores next state and moves current to undo stack
-    - State clearing: Automatic redo stack clearing on new operations
+    - archive(): Commits pending changes to the newest entry and opens a new one
+    - undo(): Reverts the newest entry's delta and moves it to the redo stack
+    - redo(): Re-applies the delta and moves it back to the undo stack
+    - capture_state()/push_undo_state()/restore_state(): Checkpoints for composite operations
 
 Complex State Handling:
-    - Dependency Rebuilding: _rebuild_dependency_graph() recreates object relationships
-    - Deep Copy Management: Handles nested object structures and circular references
-    - Memory Efficiency: Strategic state limitation to prevent memory bloat
+    - Identity Preservation: Snapshots are written back into the live objects, so references
+      held by dependent drawables stay valid across undo and redo
+    - Dependency Refresh: Only drawables touched by the restored delta are re-analyzed;
+      _rebuild_dependency_graph() recreates every relationship from scratch
+    - Deep Copy Management: Only changed drawables are cloned, with references to other live
+      drawables shared instead of copied
 
 Integration Points:
     - DrawableManager: State capture of all drawable objects
@@ -43,10 +47,69 @@ Error Recovery:
 from __future__ import annotations
 
 import copy
-from typing import TYPE_CHECKING, Any, Dict, List
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from constants import undo_history_budget
+from drawables.drawable import change_log_position, changed_since
 
 if TYPE_CHECKING:
     from canvas import Canvas
+    from drawables.drawable import Drawable
+
+
+class DrawableSnapshot:
+    """Committed copy of a single drawable.
+
+    ``clone`` is produced by the drawable's own ``__deepcopy__`` with every other
+    live drawable pre-seeded in the memo, so it references the live objects
+    instead of copying them. ``drawable`` is the live object the copy belongs to.
+    """
+
+    def __init__(self, drawable: Any, clone: Any) -> None:
+        self.drawable: Any = drawable
+        self.clone: Any = clone
+
+
+class HistoryEntry:
+    """Delta between the canvas state before and after one undoable action.
+
+    ``records`` maps ``id(drawable)`` to ``[drawable, before, after]`` where
+    ``before``/``after`` are :class:`DrawableSnapshot` instances, or ``None``
+    when the drawable did not exist on that side of the action.
+
+    ``splices`` lists bucket membership edits in the order they happened as
+    ``(category, start, removed, inserted)``, so membership changes cost the
+    number of drawables added or removed rather than the bucket size.
+    """
+
+    def __init__(self) -> None:
+        self.records: Dict[int, List[Any]] = {}
+        self.splices: List[Tuple[str, int, List["Drawable"], List["Drawable"]]] = []
+        self.before_order: Optional[List[str]] = None
+        self.after_order: Optional[List[str]] = None
+
+    def cost(self) -> int:
+        """Approximate memory cost in stored snapshots and spliced references."""
+        total = 0
+        for record in self.records.values():
+            total += (record[1] is not None) + (record[2] is not None)
+        for _category, _start, removed, inserted in self.splices:
+            total += len(removed) + len(inserted)
+        return total
+
+
+class ChangeSet:
+    """Differences between the live drawables and the committed baseline."""
+
+    def __init__(self) -> None:
+        self.drawables: Dict[int, "Drawable"] = {}
+        # ids of changed drawables that are no longer stored
+        self.removed: Set[int] = set()
+        self.buckets: Dict[str, List["Drawable"]] = {}
+        self.order_changed: bool = False
+
+    def is_empty(self) -> bool:
+        return not self.drawables and not self.buckets and not self.order_changed
 
 
 class UndoRedoManager:
@@ -59,17 +122,27 @@ class UndoRedoManager:
     - Handling redo operations (restore undone state)
     """
 
-    def __init__(self, canvas: "Canvas") -> None:
+    def __init__(self, canvas: "Canvas", memory_budget: int = undo_history_budget) -> None:
         """
         Initialize the UndoRedoManager.
 
         Args:
             canvas: The Canvas object this manager is responsible for
+            memory_budget: Maximum number of drawable snapshots and bucket references kept
+                across both history stacks before the oldest undo entries are evicted
         """
         self.canvas: "Canvas" = canvas
-        self.undo_stack: List[Dict[str, Any]] = []
-        self.redo_stack: List[Dict[str, Any]] = []
+        self.undo_stack: List[HistoryEntry] = []
+        self.redo_stack: List[HistoryEntry] = []
+        self.memory_budget: int = int(memory_budget)
         self._archive_suspension_depth: int = 0
+        self._baseline: Dict[int, DrawableSnapshot] = {}
+        # id -> live drawable and the version it had when its baseline snapshot was taken
+        self._baseline_drawables: Dict[int, "Drawable"] = {}
+        self._baseline_versions: Dict[int, Optional[int]] = {}
+        self._baseline_buckets: Dict[str, List["Drawable"]] = {}
+        self._baseline_order: List[str] = []
+        self._log_position: int = change_log_position()
 
     def archive(self) -> None:
         """
@@ -80,28 +153,85 @@ class UndoRedoManager:
         """
         if self._archive_suspension_depth > 0:
             return
-        self.push_undo_state(self.capture_state())
+        self._commit_pending_changes()
+        self.undo_stack.append(HistoryEntry())
+        self.redo_stack = []
+        self._enforce_memory_budget()
 
     def capture_state(self) -> Dict[str, Any]:
-        """Capture the current canvas state snapshot."""
+        """Capture a checkpoint of the current canvas state.
+
+        Outside of a suspended composite operation the pending changes are
+        committed first, so the checkpoint is simply the baseline. Inside one,
+        the drift from the baseline is snapshotted into the checkpoint.
+        """
+        nested = self._archive_suspension_depth > 0
+        overlay: Dict[int, Optional[DrawableSnapshot]] = {}
+        buckets: Dict[str, List["Drawable"]] = {}
+        order: Optional[List[str]] = None
+        if nested:
+            changes = self._collect_changes()
+            memo = self._pending_live_memo(changes)
+            for drawable_id, drawable in changes.drawables.items():
+                overlay[drawable_id] = None if drawable_id in changes.removed else self._take_snapshot(drawable, memo)
+            buckets = {category: list(bucket) for category, bucket in changes.buckets.items()}
+            if changes.order_changed:
+                order = list(self._storage().keys())
+        else:
+            self._commit_pending_changes()
         return {
-            "drawables": copy.deepcopy(self.canvas.drawable_manager.drawables._drawables),
+            "nested": nested,
+            "overlay": overlay,
+            "buckets": buckets,
+            "order": order,
             "computations": copy.deepcopy(self.canvas.computations),
         }
 
     def push_undo_state(self, state: Dict[str, Any]) -> None:
-        """Push a prior state onto the undo stack and clear redo history."""
-        self.undo_stack.append(copy.deepcopy(state))
+        """Commit everything changed since ``state`` was captured as one undo entry.
+
+        Checkpoints captured inside another composite operation are left to the
+        outer operation, which commits the combined change as a single entry.
+        """
+        if state.get("nested"):
+            return
+        entry = HistoryEntry()
+        self._merge_changes_into(entry)
+        self.undo_stack.append(entry)
         self.redo_stack = []
+        self._enforce_memory_budget()
 
     def restore_state(self, state: Dict[str, Any], redraw: bool = True) -> None:
-        """Restore a captured state snapshot."""
-        self.canvas.drawable_manager.drawables._drawables = copy.deepcopy(state["drawables"])
-        self.canvas.drawable_manager.drawables.rebuild_renderables()
+        """Roll the canvas back to a checkpoint returned by capture_state()."""
+        changes = self._collect_changes()
+        overlay: Dict[int, Optional[DrawableSnapshot]] = state.get("overlay", {})
+        target_buckets: Dict[str, List["Drawable"]] = state.get("buckets", {})
+        storage = self._storage()
+        touched: Dict[int, "Drawable"] = dict(changes.drawables)
+
+        for category in set(changes.buckets) | set(target_buckets):
+            if category in target_buckets:
+                bucket = target_buckets[category]
+            else:
+                bucket = self._baseline_buckets.get(category, [])
+            for drawable in storage.get(category, []) + list(bucket):
+                touched[id(drawable)] = drawable
+            self._assign_bucket(storage, category, list(bucket))
+        self._apply_order(storage, state.get("order") or self._baseline_order)
+
+        memo = self._build_live_memo()
+        for drawable_id in set(changes.drawables) | set(overlay):
+            in_overlay = drawable_id in overlay
+            snapshot = overlay[drawable_id] if in_overlay else self._baseline.get(drawable_id)
+            if snapshot is not None and drawable_id in memo:
+                touched[drawable_id] = memo[drawable_id]
+                self._restore_snapshot(memo[drawable_id], snapshot, memo)
+                if not in_overlay:
+                    # Back at the committed state: no longer a pending change
+                    self._baseline_versions[drawable_id] = self._version_of(memo[drawable_id])
+
         self.canvas.computations = copy.deepcopy(state.get("computations", []))
-        self._rebuild_dependency_graph()
-        if redraw:
-            self.canvas.draw()
+        self._finish_restore(redraw, touched)
 
     def suspend_archiving(self) -> None:
         """Suspend archive() calls for composite operations."""
@@ -122,27 +252,12 @@ class UndoRedoManager:
         if not self.undo_stack:
             return False
 
-        # Get the last archived state
-        last_state = self.undo_stack.pop()
-
-        # Archive current state for redo
-        current_state = {
-            "drawables": copy.deepcopy(self.canvas.drawable_manager.drawables._drawables),
-            "computations": copy.deepcopy(self.canvas.computations),
-        }
-        self.redo_stack.append(current_state)
-
-        # Restore only the drawables from the last state
-        self.canvas.drawable_manager.drawables._drawables = copy.deepcopy(last_state["drawables"])
-        self.canvas.drawable_manager.drawables.rebuild_renderables()
-
-        # Ensure all objects are properly initialized
-        self._rebuild_dependency_graph()
-
-        # Make sure to reset any cached or derived values
-        # This ensures a complete state reset
-        self.canvas.draw()
-
+        # Fold any changes made since the last checkpoint into the newest entry
+        self._commit_pending_changes()
+        entry = self.undo_stack.pop()
+        self._apply_entry(entry, forward=False)
+        self.redo_stack.append(entry)
+        self._finish_restore(redraw=True, touched=self._entry_drawables(entry))
         return True
 
     def redo(self) -> bool:
@@ -155,27 +270,11 @@ class UndoRedoManager:
         if not self.redo_stack:
             return False
 
-        # Get the last undone state
-        next_state = self.redo_stack.pop()
-
-        # Archive current state for undo
-        current_state = {
-            "drawables": copy.deepcopy(self.canvas.drawable_manager.drawables._drawables),
-            "computations": copy.deepcopy(self.canvas.computations),
-        }
-        self.undo_stack.append(current_state)
-
-        # Restore only the drawables from the next state
-        self.canvas.drawable_manager.drawables._drawables = copy.deepcopy(next_state["drawables"])
-        self.canvas.drawable_manager.drawables.rebuild_renderables()
-
-        # Ensure all objects are properly initialized
-        self._rebuild_dependency_graph()
-
-        # Make sure to reset any cached or derived values
-        # This ensures a complete state reset
-        self.canvas.draw()
-
+        self._commit_pending_changes()
+        entry = self.redo_stack.pop()
+        self._apply_entry(entry, forward=True)
+        self.undo_stack.append(entry)
+        self._finish_restore(redraw=True, touched=self._entry_drawables(entry))
         return True
 
     def can_undo(self) -> bool:
@@ -196,6 +295,278 @@ class UndoRedoManager:
         """
         return len(self.redo_stack) > 0
 
+    def get_history_cost(self) -> int:
+        """Return the combined memory cost of both history stacks."""
+        return sum(entry.cost() for entry in self.undo_stack) + sum(entry.cost() for entry in self.redo_stack)
+
+    def _storage(self) -> Dict[str, List["Drawable"]]:
+        storage: Dict[str, List["Drawable"]] = self.canvas.drawable_manager.drawables._drawables
+        return storage
+
+    def _live_ids(self) -> Dict[int, "Drawable"]:
+        live: Dict[int, "Drawable"] = {}
+        for bucket in self._storage().values():
+            for drawable in bucket:
+                live[id(drawable)] = drawable
+        return live
+
+    def _build_live_memo(self) -> Dict[int, Any]:
+        """Deepcopy memo that maps every live drawable to itself."""
+        return dict(self._live_ids())
+
+    @staticmethod
+    def _version_of(drawable: Any) -> Optional[int]:
+        get_version = getattr(drawable, "get_version", None)
+        if not callable(get_version):
+            return None
+        try:
+            return int(get_version())
+        except Exception:
+            return None
+
+    def _same_bucket(self, current: List["Drawable"], baseline: Optional[List["Drawable"]]) -> bool:
+        # Compare by identity: some drawables define value-based __eq__
+        if baseline is None or len(current) != len(baseline):
+            return False
+        for live_item, base_item in zip(current, baseline):
+            if live_item is not base_item:
+                return False
+        return True
+
+    def _collect_changes(self) -> ChangeSet:
+        """Diff the live drawables against the committed baseline.
+
+        Only drawables in the change log since the last commit, and members of
+        buckets whose membership changed, are examined.
+        """
+        changes = ChangeSet()
+        storage = self._storage()
+        for category, bucket in storage.items():
+            if not self._same_bucket(bucket, self._baseline_buckets.get(category)):
+                changes.buckets[category] = bucket
+        for category in self._baseline_buckets:
+            if category not in storage:
+                changes.buckets[category] = []
+        for category, bucket in changes.buckets.items():
+            current = {id(drawable): drawable for drawable in bucket}
+            for drawable in self._baseline_buckets.get(category, []):
+                if id(drawable) not in current:
+                    changes.drawables[id(drawable)] = drawable
+                    changes.removed.add(id(drawable))
+            for drawable_id, drawable in current.items():
+                if drawable_id not in self._baseline:
+                    changes.drawables[drawable_id] = drawable
+
+        logged: Optional[Iterable[int]] = changed_since(self._log_position)
+        if logged is None:
+            # The log was trimmed past our cursor; compare every committed drawable
+            logged = list(self._baseline_drawables)
+        for drawable_id in logged:
+            if drawable_id in changes.drawables:
+                continue
+            drawable = self._baseline_drawables.get(drawable_id)
+            if drawable is not None and self._version_of(drawable) != self._baseline_versions.get(drawable_id):
+                changes.drawables[drawable_id] = drawable
+        changes.order_changed = list(storage.keys()) != self._baseline_order
+        return changes
+
+    def _take_snapshot(self, drawable: Any, memo: Dict[int, Any]) -> DrawableSnapshot:
+        memo.pop(id(drawable), None)
+        try:
+            clone = copy.deepcopy(drawable, memo)
+        finally:
+            memo[id(drawable)] = drawable
+        return DrawableSnapshot(drawable, clone)
+
+    def _restore_snapshot(self, drawable: Any, snapshot: DrawableSnapshot, memo: Dict[int, Any]) -> None:
+        """Write a snapshot back into the live object so existing references stay valid."""
+        # Copy again so later in-place edits never leak into the stored snapshot
+        fresh = copy.deepcopy(snapshot.clone, memo)
+        drawable.__dict__.clear()
+        drawable.__dict__.update(fresh.__dict__)
+        # A fresh version tells renderers and indexes the object changed
+        bump_version = getattr(drawable, "bump_version", None)
+        if callable(bump_version):
+            bump_version()
+
+    def _commit_pending_changes(self) -> None:
+        """Fold changes made since the baseline into the newest undo entry."""
+        if self.undo_stack:
+            self._merge_changes_into(self.undo_stack[-1])
+        else:
+            self._merge_changes_into(None)
+
+    def _merge_changes_into(self, entry: Optional[HistoryEntry]) -> None:
+        changes = self._collect_changes()
+        # Nothing mutates live drawables while committing, so the cursor may move
+        # past the log entries written by snapshot copies as well
+        self._commit_changes(changes, entry)
+        self._log_position = change_log_position()
+
+    def _commit_changes(self, changes: ChangeSet, entry: Optional[HistoryEntry]) -> None:
+        if changes.is_empty():
+            return
+        memo: Optional[Dict[int, Any]] = None
+
+        for drawable_id, drawable in changes.drawables.items():
+            before = self._baseline.get(drawable_id)
+            after: Optional[DrawableSnapshot] = None
+            if drawable_id not in changes.removed:
+                if memo is None:
+                    memo = self._pending_live_memo(changes)
+                after = self._take_snapshot(drawable, memo)
+                self._set_baseline(drawable_id, drawable, after)
+            else:
+                self._set_baseline(drawable_id, drawable, None)
+            if entry is None:
+                continue
+            record = entry.records.get(drawable_id)
+            if record is None:
+                entry.records[drawable_id] = [drawable, before, after]
+            elif record[1] is None and after is None:
+                del entry.records[drawable_id]
+            else:
+                record[2] = after
+
+        for category, bucket in changes.buckets.items():
+            previous = self._baseline_buckets.get(category, [])
+            if entry is not None:
+                entry.splices.append(self._compute_splice(category, previous, bucket))
+            if bucket:
+                self._baseline_buckets[category] = list(bucket)
+            else:
+                self._baseline_buckets.pop(category, None)
+
+        if changes.order_changed:
+            if entry is not None and entry.before_order is None:
+                entry.before_order = self._baseline_order
+            self._baseline_order = list(self._storage().keys())
+            if entry is not None:
+                entry.after_order = self._baseline_order
+
+    def _pending_live_memo(self, changes: ChangeSet) -> Dict[int, Any]:
+        """Deepcopy memo of the live drawables, derived from the baseline and a change set."""
+        memo: Dict[int, Any] = dict(self._baseline_drawables)
+        for drawable_id, drawable in changes.drawables.items():
+            if drawable_id in changes.removed:
+                memo.pop(drawable_id, None)
+            else:
+                memo[drawable_id] = drawable
+        return memo
+
+    def _set_baseline(self, drawable_id: int, drawable: Any, snapshot: Optional[DrawableSnapshot]) -> None:
+        if snapshot is None:
+            self._baseline.pop(drawable_id, None)
+            self._baseline_drawables.pop(drawable_id, None)
+            self._baseline_versions.pop(drawable_id, None)
+            return
+        self._baseline[drawable_id] = snapshot
+        self._baseline_drawables[drawable_id] = drawable
+        self._baseline_versions[drawable_id] = self._version_of(drawable)
+
+    def _compute_splice(
+        self, category: str, before: List["Drawable"], after: List["Drawable"]
+    ) -> Tuple[str, int, List["Drawable"], List["Drawable"]]:
+        """Describe a bucket edit as the identity-wise differing middle section."""
+        limit = min(len(before), len(after))
+        start = 0
+        while start < limit and before[start] is after[start]:
+            start += 1
+        tail = 0
+        while tail < limit - start and before[len(before) - 1 - tail] is after[len(after) - 1 - tail]:
+            tail += 1
+        return (category, start, list(before[start : len(before) - tail]), list(after[start : len(after) - tail]))
+
+    def _apply_entry(self, entry: HistoryEntry, forward: bool) -> None:
+        """Apply one side of a history entry to the live drawables and baseline."""
+        storage = self._storage()
+        splices = entry.splices if forward else list(reversed(entry.splices))
+        for category, start, removed, inserted in splices:
+            old_items, new_items = (removed, inserted) if forward else (inserted, removed)
+            bucket = storage.get(category, [])
+            bucket[start : start + len(old_items)] = new_items
+            self._assign_bucket(storage, category, bucket)
+            if bucket:
+                self._baseline_buckets[category] = list(bucket)
+            else:
+                self._baseline_buckets.pop(category, None)
+        order = entry.after_order if forward else entry.before_order
+        if order is not None:
+            self._apply_order(storage, order)
+        self._baseline_order = list(storage.keys())
+
+        side = 2 if forward else 1
+        restored: List[Tuple[int, Any, DrawableSnapshot]] = []
+        for drawable_id, record in entry.records.items():
+            snapshot = record[side]
+            if snapshot is None:
+                self._set_baseline(drawable_id, record[0], None)
+            else:
+                self._baseline_drawables[drawable_id] = record[0]
+                restored.append((drawable_id, record[0], snapshot))
+        memo: Dict[int, Any] = dict(self._baseline_drawables)
+        for drawable_id, drawable, snapshot in restored:
+            self._restore_snapshot(drawable, snapshot, memo)
+            self._set_baseline(drawable_id, drawable, snapshot)
+        self._log_position = change_log_position()
+
+    def _assign_bucket(self, storage: Dict[str, List["Drawable"]], category: str, bucket: List["Drawable"]) -> None:
+        if bucket:
+            storage[category] = bucket
+        else:
+            storage.pop(category, None)
+
+    def _apply_order(self, storage: Dict[str, List["Drawable"]], order: List[str]) -> None:
+        """Reorder category keys in place so get_all() iteration order is restored."""
+        if list(storage.keys()) == order:
+            return
+        items = [(category, storage[category]) for category in order if category in storage]
+        items.extend((category, bucket) for category, bucket in storage.items() if category not in order)
+        storage.clear()
+        for category, bucket in items:
+            storage[category] = bucket
+
+    def _entry_drawables(self, entry: HistoryEntry) -> Dict[int, "Drawable"]:
+        """Every drawable a history entry mutates, creates, deletes, or moves between buckets."""
+        touched: Dict[int, "Drawable"] = {drawable_id: record[0] for drawable_id, record in entry.records.items()}
+        for _category, _start, removed, inserted in entry.splices:
+            for drawable in removed + inserted:
+                touched[id(drawable)] = drawable
+        return touched
+
+    def _finish_restore(self, redraw: bool, touched: Optional[Dict[int, "Drawable"]] = None) -> None:
+        self.canvas.drawable_manager.drawables.rebuild_renderables()
+        if touched is None:
+            self._rebuild_dependency_graph()
+        else:
+            self._refresh_dependency_graph(touched)
+        if redraw:
+            self.canvas.draw()
+
+    def _refresh_dependency_graph(self, touched: Dict[int, "Drawable"]) -> None:
+        """Re-analyze only the drawables a restore touched.
+
+        Snapshots are written back into the live objects, so edges between
+        untouched drawables still hold and need not be rebuilt.
+        """
+        dependency_manager = getattr(self.canvas, "dependency_manager", None)
+        if dependency_manager is None or not hasattr(dependency_manager, "refresh_drawables"):
+            self._rebuild_dependency_graph()
+            return
+        live_ids = self._live_ids()
+        changed = [drawable for drawable_id, drawable in touched.items() if drawable_id in live_ids]
+        removed = [drawable for drawable_id, drawable in touched.items() if drawable_id not in live_ids]
+        dependency_manager.refresh_drawables(changed, removed)
+
+    def _enforce_memory_budget(self) -> None:
+        """Evict the oldest undo entries once the history exceeds the memory budget."""
+        if self.memory_budget <= 0:
+            return
+        total = self.get_history_cost()
+        while total > self.memory_budget and len(self.undo_stack) > 1:
+            evicted = self.undo_stack.pop(0)
+            total -= evicted.cost()
+
     def _rebuild_dependency_graph(self) -> None:
         """
         Rebuilds the dependency relationships between drawables.
@@ -215,9 +586,8 @@ class UndoRedoManager:
         if hasattr(self.canvas, "dependency_manager") and self.canvas.dependency_manager is not None:
             dependency_manager = self.canvas.dependency_manager
 
-            # Clear existing dependency relationships from the manager
-            dependency_manager._parents.clear()
-            dependency_manager._children.clear()
+            # Clear existing dependency relationships and cached queries from the manager
+            dependency_manager.clear()
 
             # Re-analyze each drawable to rebuild the dependency graph
             # The analyze_drawable_for_dependencies method in DrawableDependencyManager
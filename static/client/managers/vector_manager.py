@@ -37,7 +37,7 @@ Mathematical Context:
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, List, Optional, cast
 
 from drawables.vector import Vector
 from managers.dependency_removal import remove_drawable_with_dependencies
@@ -117,10 +117,7 @@ class VectorManager:
     def get_vector_by_name(self, name: str) -> Optional[Vector]:
         if not name:
             return None
-        for vector in self.drawables.Vectors:
-            if vector.name == name:
-                return vector
-        return None
+        return cast(Optional[Vector], self.drawables.get_by_name(name, ("Vector",)))
 
     def create_vector(
         self,
@@ -5,6 +5,7 @@ Multi-start damped Newton-Raphson solver for systems of equations that
 cannot be solved symbolically (transcendental, mixed nonlinear, 3+ variables).
 """
 
+from .compiled_system import CompiledSystem
 from .solver import solve_numeric
 
-__all__ = ["solve_numeric"]
+__all__ = ["CompiledSystem", "solve_numeric"]
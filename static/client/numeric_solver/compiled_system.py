@@ -0,0 +1,125 @@
+"""
+Compiled residual system for the numeric solver.
+
+Parses every residual once per solve with math.js, derives symbolic partial
+derivatives once where math.js can, and falls back to central differences for
+the Jacobian columns it cannot differentiate. One instance is shared by every
+starting point of a multi-start solve.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Any, Dict, List, Optional, Sequence
+
+from browser import window
+
+
+class CompiledSystem:
+    """Residual expressions compiled once, with optional analytic Jacobian entries.
+
+    Attributes:
+        residual_exprs: Residual expression strings, in equation order.
+        variables: Variable names, in solution-vector order.
+        residual_evaluations: Number of full residual-vector evaluations.
+        expression_evaluations: Number of individual math.js evaluations
+            (residuals and partial derivatives).
+    """
+
+    def __init__(
+        self,
+        residual_exprs: Sequence[str],
+        variables: Sequence[str],
+        analytic_jacobian: bool = True,
+        h: float = 1e-7,
+    ) -> None:
+        self.residual_exprs: List[str] = list(residual_exprs)
+        self.variables: List[str] = list(variables)
+        self.h: float = h
+        self.residual_evaluations: int = 0
+        self.expression_evaluations: int = 0
+        self._residuals: List[Optional[Any]] = [self._compile(expr) for expr in self.residual_exprs]
+        self._partials: List[List[Optional[Any]]] = [
+            [self._differentiate(expr, var) if analytic_jacobian else None for var in self.variables]
+            for expr in self.residual_exprs
+        ]
+
+    @staticmethod
+    def _compile(expr: str) -> Optional[Any]:
+        try:
+            return window.math.compile(expr)
+        except Exception:
+            # Evaluation of an unparseable residual always fails, as it did uncompiled
+            return None
+
+    @staticmethod
+    def _differentiate(expr: str, variable: str) -> Optional[Any]:
+        try:
+            return window.math.derivative(expr, variable).compile()
+        except Exception:
+            return None
+
+    @property
+    def analytic_entries(self) -> int:
+        """Number of Jacobian entries with a symbolic derivative."""
+        return sum(1 for row in self._partials for entry in row if entry is not None)
+
+    def _scope(self, values: Sequence[float]) -> Dict[str, float]:
+        return {var: val for var, val in zip(self.variables, values)}
+
+    def _evaluate_node(self, node: Any, scope: Dict[str, float]) -> Optional[float]:
+        self.expression_evaluations += 1
+        try:
+            value = float(node.evaluate(scope))
+        except Exception:
+            return None
+        return value if math.isfinite(value) else None
+
+    def evaluate(self, values: Sequence[float]) -> Optional[List[float]]:
+        """Evaluate all residuals; same contract as expression_utils.evaluate_residuals."""
+        self.residual_evaluations += 1
+        scope = self._scope(values)
+        residuals: List[float] = []
+        for node in self._residuals:
+            if node is None:
+                return None
+            value = self._evaluate_node(node, scope)
+            if value is None:
+                return None
+            residuals.append(value)
+        return residuals
+
+    def jacobian(self, values: Sequence[float]) -> Optional[List[List[float]]]:
+        """Jacobian at ``values``: symbolic entries first, central differences for the rest.
+
+        A symbolic entry that fails or is non-finite at this point demotes its
+        whole column to central differences, which need two residual evaluations
+        per column rather than per entry.
+        """
+        scope = self._scope(values)
+        n_vars = len(self.variables)
+        jacobian: List[List[float]] = [[0.0] * n_vars for _ in self.residual_exprs]
+        numeric_columns: List[int] = []
+        for j in range(n_vars):
+            for i, row in enumerate(self._partials):
+                node = row[j]
+                value = self._evaluate_node(node, scope) if node is not None else None
+                if value is None:
+                    numeric_columns.append(j)
+                    break
+                jacobian[i][j] = value
+
+        values_list = list(values)
+        h = self.h
+        for j in numeric_columns:
+            values_plus = values_list.copy()
+            values_plus[j] += h
+            values_minus = values_list.copy()
+            values_minus[j] -= h
+            f_plus = self.evaluate(values_plus)
+            f_minus = self.evaluate(values_minus)
+            if f_plus is None or f_minus is None:
+                return None
+            for i in range(len(jacobian)):
+                jacobian[i][j] = (f_plus[i] - f_minus[i]) / (2 * h)
+        return jacobian
@@ -1,7 +1,8 @@
 """
 Jacobian computation for the numeric solver.
 
-Provides numerical Jacobian via central differences.
+Provides numerical Jacobian via central differences for uncompiled residual
+strings; the solver itself uses CompiledSystem.jacobian.
 """
 
 from __future__ import annotations
@@ -34,32 +35,27 @@ def compute_jacobian(
     n_vars = len(variables)
     values_list = list(values)
 
-    jacobian: List[List[float]] = []
+    jacobian: List[List[float]] = [[0.0] * n_vars for _ in range(n_eqs)]
 
-    for i in range(n_eqs):
-        row: List[float] = []
-        for j in range(n_vars):
-            # Compute partial derivative of F_i with respect to x_j
+    # One pair of residual evaluations per column yields the whole column
+    for j in range(n_vars):
+        # Forward point: x + h*e_j
+        values_plus = values_list.copy()
+        values_plus[j] += h
 
-            # Forward point: x + h*e_j
-            values_plus = values_list.copy()
-            values_plus[j] += h
+        # Backward point: x - h*e_j
+        values_minus = values_list.copy()
+        values_minus[j] -= h
 
-            # Backward point: x - h*e_j
-            values_minus = values_list.copy()
-            values_minus[j] -= h
+        # Evaluate residuals at both points
+        f_plus = evaluate_residuals(residual_exprs, variables, values_plus)
+        f_minus = evaluate_residuals(residual_exprs, variables, values_minus)
 
-            # Evaluate residuals at both points
-            f_plus = evaluate_residuals(residual_exprs, variables, values_plus)
-            f_minus = evaluate_residuals(residual_exprs, variables, values_minus)
+        if f_plus is None or f_minus is None:
+            return None
 
-            if f_plus is None or f_minus is None:
-                return None
-
-            # Central difference
-            derivative = (f_plus[i] - f_minus[i]) / (2 * h)
-            row.append(derivative)
-
-        jacobian.append(row)
+        # Central difference
+        for i in range(n_eqs):
+            jacobian[i][j] = (f_plus[i] - f_minus[i]) / (2 * h)
 
     return jacobian
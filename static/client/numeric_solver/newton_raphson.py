@@ -6,11 +6,9 @@ Core iteration logic for the numeric solver.
 
 from __future__ import annotations
 
-import math
 from typing import List, Optional, Sequence
 
-from .expression_utils import evaluate_residuals
-from .jacobian import compute_jacobian
+from .compiled_system import CompiledSystem
 from .linear_algebra import solve_linear_system_gaussian
 
 # Armijo line search constants
@@ -21,6 +19,22 @@ MAX_BACKTRACKS = 10
 # Divergence detection
 DIVERGENCE_THRESHOLD = 1e15
 
+# A start whose iterate and Newton step are both this close to an already-found
+# root is in that root's quadratic basin; finishing it would only rediscover it.
+ROOT_CAPTURE_RADIUS = 1e-4
+
+
+def _captured_root(
+    x: Sequence[float], delta: Sequence[float], known_roots: Sequence[List[float]]
+) -> Optional[List[float]]:
+    """Return the known root this iterate is converging onto, if any."""
+    if max(abs(d) for d in delta) >= ROOT_CAPTURE_RADIUS:
+        return None
+    for root in known_roots:
+        if all(abs(a - b) < ROOT_CAPTURE_RADIUS for a, b in zip(x, root)):
+            return root
+    return None
+
 
 def newton_raphson(
     residual_exprs: Sequence[str],
@@ -28,6 +42,8 @@ def newton_raphson(
     x0: Sequence[float],
     tolerance: float = 1e-10,
     max_iterations: int = 50,
+    system: Optional[CompiledSystem] = None,
+    known_roots: Optional[Sequence[List[float]]] = None,
 ) -> Optional[List[float]]:
     """Run Newton-Raphson iteration with Armijo backtracking line search.
 
@@ -37,16 +53,24 @@ def newton_raphson(
         x0: Initial guess for variable values.
         tolerance: Convergence tolerance (max absolute residual).
         max_iterations: Maximum number of iterations.
+        system: Pre-compiled residual system to reuse across starting points.
+            Compiled from ``residual_exprs`` when omitted.
+        known_roots: Roots already found by earlier starts. When the iteration
+            settles next to one of them, that same list object is returned
+            early so callers can recognise the duplicate by identity.
 
     Returns:
         Converged solution, or None if iteration fails to converge.
     """
+    if system is None:
+        system = CompiledSystem(residual_exprs, variables)
     x = list(x0)
     n = len(x)
 
+    # Residuals at the current iterate, carried over from the accepted line-search trial
+    F: Optional[List[float]] = system.evaluate(x)
+
     for iteration in range(max_iterations):
-        # Evaluate residuals
-        F = evaluate_residuals(residual_exprs, variables, x)
         if F is None:
             return None
 
@@ -60,7 +84,7 @@ def newton_raphson(
             return None
 
         # Compute Jacobian
-        J = compute_jacobian(residual_exprs, variables, x)
+        J = system.jacobian(x)
         if J is None:
             return None
 
@@ -71,6 +95,11 @@ def newton_raphson(
             # Singular Jacobian
             return None
 
+        if known_roots:
+            captured = _captured_root(x, delta, known_roots)
+            if captured is not None:
+                return captured
+
         # Armijo backtracking line search
         alpha = 1.0
         F_norm_sq = sum(f * f for f in F)
@@ -80,7 +109,7 @@ def newton_raphson(
             x_new = [x[i] + alpha * delta[i] for i in range(n)]
 
             # Evaluate residuals at trial point
-            F_new = evaluate_residuals(residual_exprs, variables, x_new)
+            F_new = system.evaluate(x_new)
             if F_new is None:
                 alpha *= ARMIJO_RHO
                 continue
@@ -90,16 +119,17 @@ def newton_raphson(
             # Armijo condition: ||F(x + alpha*delta)||^2 <= (1 - 2*c*alpha) * ||F(x)||^2
             if F_new_norm_sq <= (1 - 2 * ARMIJO_C * alpha) * F_norm_sq:
                 x = x_new
+                F = F_new
                 break
 
             alpha *= ARMIJO_RHO
         else:
             # All backtracks failed, take the full step anyway
             x = [x[i] + delta[i] for i in range(n)]
+            F = system.evaluate(x)
 
     # Did not converge within max_iterations
     # Check if we're close enough
-    F = evaluate_residuals(residual_exprs, variables, x)
     if F is not None and max(abs(f) for f in F) < tolerance * 100:
         return x
 
@@ -1,7 +1,7 @@
 """
 Main entry point for the numeric solver.
 
-Orchestrates multi-start Newton-Raphson solving.
+Orchestrates multi-start Newton-Raphson solving over a system compiled once per solve.
 """
 
 from __future__ import annotations
@@ -9,7 +9,8 @@ from __future__ import annotations
 import json
 from typing import Any, Dict, List, Optional, Sequence
 
-from .expression_utils import detect_variables, equation_to_residual, evaluate_residuals
+from .compiled_system import CompiledSystem
+from .expression_utils import detect_variables, equation_to_residual
 from .newton_raphson import newton_raphson
 from .utils import deduplicate_solutions, generate_initial_guesses
 
@@ -61,6 +62,9 @@ def solve_numeric(
     # Generate initial guesses
     guesses = generate_initial_guesses(n_vars, initial_guesses)
 
+    # Parse residuals and derive the Jacobian once, shared by every starting point
+    system = CompiledSystem(residual_exprs, var_list)
+
     # Run Newton-Raphson from each starting point
     found_solutions: List[List[float]] = []
 
@@ -71,13 +75,18 @@ def solve_numeric(
             guess,
             tolerance=tolerance,
             max_iterations=max_iterations,
+            system=system,
+            known_roots=found_solutions,
         )
 
-        if solution is not None:
-            # Verify the solution by checking residuals
-            residuals = evaluate_residuals(residual_exprs, var_list, solution)
-            if residuals is not None and all(abs(r) < tolerance * 10 for r in residuals):
-                found_solutions.append(solution)
+        if solution is None or any(solution is root for root in found_solutions):
+            # Failed, or stopped early while converging onto a root already found
+            continue
+
+        # Verify the solution by checking residuals
+        residuals = system.evaluate(solution)
+        if residuals is not None and all(abs(r) < tolerance * 10 for r in residuals):
+            found_solutions.append(solution)
 
     # Deduplicate solutions
     unique_solutions = deduplicate_solutions(found_solutions, var_list)
@@ -1427,6 +1427,7 @@ _HELPERS: Dict[str, Any] = {
     "PiecewiseFunction": shared.render_function_helper,
     "ParametricFunction": shared.render_parametric_function_helper,
     "Bar": shared.render_bar_helper,
+    "ScatterPlot": shared.render_scatter_plot_helper,
     "FunctionsBoundedColoredArea": shared.render_functions_bounded_area_helper,
     "FunctionSegmentBoundedColoredArea": shared.render_function_segment_area_helper,
     "SegmentsBoundedColoredArea": shared.render_segments_bounded_area_helper,
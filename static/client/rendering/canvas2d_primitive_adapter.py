@@ -8,6 +8,7 @@ Key Features:
     - Efficient style state tracking to minimize context changes
     - Font string caching with LRU eviction
     - Batched line drawing for improved performance
+    - Batched unstroked circle fills, one path per run of same-style markers
     - Deferred text layout for screen-offset labels
     - Telemetry integration for performance monitoring
 """
@@ -69,6 +70,7 @@ class Canvas2DPrimitiveAdapter(RendererPrimitives):
         self._batch_depth: int = 0
         self._telemetry = telemetry
         self._line_batch: Optional[Dict[str, Any]] = None
+        self._circle_batch: Optional[Dict[str, Any]] = None
         self._deferred_screen_offset_text_calls: List[Any] = []
 
     def set_telemetry(self, telemetry: Any) -> None:
@@ -539,6 +541,7 @@ class Canvas2DPrimitiveAdapter(RendererPrimitives):
         self._record_batch_depth()
 
     def end_batch(self, plan: Any = None) -> None:
+        self._flush_circle_batch()
         self._flush_polygon_batch()
         if self._batch_depth:
             self._batch_depth -= 1
@@ -547,6 +550,7 @@ class Canvas2DPrimitiveAdapter(RendererPrimitives):
         self._record_batch_depth()
 
     def clear_surface(self) -> None:
+        self._flush_circle_batch()
         self._flush_polygon_batch()
         self._flush_line_batch()
         self.ctx.clearRect(0, 0, self.canvas_el.width, self.canvas_el.height)
@@ -587,6 +591,10 @@ class Canvas2DPrimitiveAdapter(RendererPrimitives):
         if op == "stroke_polyline":
             self._batch_polyline(command)
             return
+        if op == "fill_circle":
+            self._batch_fill_circle_from_command(command)
+            return
+        self._flush_circle_batch()
         if op in {"fill_polygon", "fill_joined_area"}:
             self._batch_fill_polygon_from_command(command)
             return
@@ -662,6 +670,50 @@ class Canvas2DPrimitiveAdapter(RendererPrimitives):
         self._record_event("stroke_calls")
         self._line_batch = None
 
+    # ------------------------------------------------------------------
+    # Circle batching helpers
+    # ------------------------------------------------------------------
+
+    def _batch_fill_circle_from_command(self, command: Any) -> None:
+        args: tuple[Any, ...] = getattr(command, "args", ())
+        if len(args) < 3:
+            return
+        center, radius, fill = args[:3]
+        stroke = args[3] if len(args) > 3 else None
+        self._flush_line_batch()
+        self._flush_polygon_batch()
+        if stroke:
+            self._flush_circle_batch()
+            self.fill_circle(center, radius, fill, stroke, **getattr(command, "kwargs", {}))
+            return
+        signature = (getattr(fill, "color", None), getattr(fill, "opacity", None))
+        batch = self._circle_batch
+        if batch is None or batch["signature"] != signature:
+            self._flush_circle_batch()
+            self._circle_batch = {"fill": fill, "circles": [], "signature": signature}
+            batch = self._circle_batch
+        batch["circles"].append((center, radius))
+        self._record_event("circle_batch_circles")
+
+    def _flush_circle_batch(self) -> None:
+        batch = self._circle_batch
+        if not batch:
+            return
+        self._circle_batch = None
+        circles = batch["circles"]
+        if not circles:
+            return
+        self._apply_fill_style(batch["fill"])
+        self._begin_path()
+        two_pi = 2 * math.pi
+        for center, radius in circles:
+            coerced_radius = self._coerce_number(radius)
+            # Each marker is its own subpath; without the moveTo arcs would be joined by lines
+            self.ctx.moveTo(center[0] + coerced_radius, center[1])
+            self.ctx.arc(center[0], center[1], coerced_radius, 0, two_pi)
+        self._fill_path()
+        self._reset_alpha_if_needed()
+
     # ------------------------------------------------------------------
     # Polygon batching helpers
     # ------------------------------------------------------------------
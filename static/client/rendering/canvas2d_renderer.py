@@ -25,6 +25,7 @@ from typing import Any, Callable, Dict, Optional, Tuple
 
 from browser import document, html, window
 
+from constants import plan_cache_idle_frames
 from rendering.style_manager import get_renderer_style
 from rendering.interfaces import RendererProtocol
 from rendering.canvas2d_primitive_adapter import Canvas2DPrimitiveAdapter
@@ -49,6 +50,7 @@ class Canvas2DTelemetry:
         _per_drawable: Per-drawable type timing breakdown.
         _adapter_events: Event counts from the primitive adapter.
         _frames: Total frames rendered since last reset.
+        _draw_requests: Draws requested by the canvas since last reset.
     """
 
     def __init__(self) -> None:
@@ -73,12 +75,17 @@ class Canvas2DTelemetry:
         self._per_drawable: Dict[str, Dict[str, float]] = {}
         self._adapter_events: Dict[str, int] = {}
         self._frames: int = 0
+        self._draw_requests: int = 0
         self._max_batch_depth: int = 0
 
     def begin_frame(self) -> None:
         """Signal the start of a new frame for counting purposes."""
         self._frames += 1
 
+    def record_draw_request(self) -> None:
+        """Count a Canvas.draw() request; requests beyond ``frames`` were coalesced."""
+        self._draw_requests += 1
+
     def end_frame(self) -> None:
         """Signal the end of a frame (currently no-op)."""
         pass
@@ -170,6 +177,7 @@ class Canvas2DTelemetry:
         phase.update(self._phase_counts)
         return {
             "frames": self._frames,
+            "draw_requests": self._draw_requests,
             "phase": phase,
             "per_drawable": per_drawable,
             "adapter_events": adapter_events,
@@ -344,6 +352,10 @@ class Canvas2DRenderer(RendererProtocol):
         self._mark_screen_space_plan_dirty(plan)
         return plan
 
+    def record_draw_request(self) -> None:
+        """Count a draw requested by the canvas, whether or not it was coalesced."""
+        self._telemetry.record_draw_request()
+
     def begin_frame(self) -> None:
         """Begin a new rendering frame."""
         self._telemetry.begin_frame()
@@ -354,6 +366,8 @@ class Canvas2DRenderer(RendererProtocol):
         self._shared_primitives.end_frame()
         self._flush_offscreen_to_main()
         self._telemetry.end_frame()
+        self._frame_index += 1
+        self._evict_idle_plan_entries()
 
     def register(self, cls: type, handler: Callable[[Any, Any], None]) -> None:
         """Register a handler function for a drawable type.
@@ -464,6 +478,12 @@ class Canvas2DRenderer(RendererProtocol):
             self.register(BarDrawable, self._render_drawable)
         except Exception:
             pass
+        try:
+            from drawables.scatter_plot import ScatterPlot as ScatterPlotDrawable
+
+            self.register(ScatterPlotDrawable, self._render_drawable)
+        except Exception:
+            pass
 
     # ------------------------------------------------------------------
     # Handlers
@@ -559,7 +579,7 @@ class Canvas2DRenderer(RendererProtocol):
             return
         drawable_name = self._resolve_drawable_name(drawable)
         map_state = self._capture_map_state(coordinate_mapper)
-        signature = self._compute_drawable_signature(drawable, coordinate_mapper)
+        signature = self._compute_render_signature(drawable, coordinate_mapper)
         cache_key = self._plan_cache_key(drawable, drawable_name)
         plan = self._resolve_drawable_plan(drawable, coordinate_mapper, map_state, signature, drawable_name, cache_key)
         if plan is None:
@@ -592,6 +612,27 @@ class Canvas2DRenderer(RendererProtocol):
             return f"{drawable_name}:{identifier}"
         return f"{drawable_name}:{id(drawable)}"
 
+    def _compute_render_signature(self, drawable: Any, coordinate_mapper: Any = None) -> Tuple[Any, ...]:
+        """Key a cached plan on the drawable's mutation version plus the view it depends on.
+
+        Falls back to hashing ``get_state()`` for objects without a render version.
+        """
+        version_getter = getattr(drawable, "get_render_version", None)
+        version = version_getter() if callable(version_getter) else None
+        if not isinstance(version, int):
+            return self._compute_drawable_signature(drawable, coordinate_mapper)
+        if self._needs_scale_in_signature(drawable) and coordinate_mapper is not None:
+            return (version, self._view_signature(coordinate_mapper))
+        return (version,)
+
+    def _view_signature(self, coordinate_mapper: Any) -> Tuple[Any, ...]:
+        scale = getattr(coordinate_mapper, "scale_factor", None)
+        offset = getattr(coordinate_mapper, "offset", None)
+        return (
+            round(float(scale), 4) if scale is not None else None,
+            (round(float(offset.x), 2), round(float(offset.y), 2)) if offset is not None else None,
+        )
+
     def _compute_drawable_signature(self, drawable: Any, coordinate_mapper: Any = None) -> Tuple[Any, ...]:
         state_func = getattr(drawable, "get_state", None)
         state: Any = None
@@ -793,6 +834,17 @@ class Canvas2DRenderer(RendererProtocol):
     def _initialize_plan_caches(self) -> None:
         self._plan_cache = {}
         self._cartesian_cache = None
+        self._frame_index = 0
+
+    def _evict_idle_plan_entries(self) -> None:
+        """Drop plans of drawables that stopped rendering, e.g. after delete or rename."""
+        if self._frame_index % plan_cache_idle_frames or not self._plan_cache:
+            return
+        oldest_live_frame = self._frame_index - plan_cache_idle_frames
+        stale_keys = [key for key, entry in self._plan_cache.items() if entry.get("frame", 0) < oldest_live_frame]
+        for key in stale_keys:
+            entry = self._plan_cache.pop(key)
+            self._drop_plan_group(entry.get("plan"))
 
     def _assign_cartesian_dimensions(self, cartesian: Any, width: int, height: int) -> None:
         cartesian.width = width
@@ -834,6 +886,7 @@ class Canvas2DRenderer(RendererProtocol):
     ) -> Optional[OptimizedPrimitivePlan]:
         cached_entry = self._plan_cache.get(cache_key)
         if self._is_cached_plan_valid(cached_entry, signature):
+            cached_entry["frame"] = self._frame_index
             plan = cached_entry["plan"]
             plan.update_map_state(map_state)
             return plan
@@ -844,7 +897,7 @@ class Canvas2DRenderer(RendererProtocol):
             self._telemetry.record_plan_build(drawable_name, build_elapsed)
             plan.update_map_state(map_state)
             if signature is not None:
-                self._plan_cache[cache_key] = {"plan": plan, "signature": signature}
+                self._plan_cache[cache_key] = {"plan": plan, "signature": signature, "frame": self._frame_index}
             return plan
         self._telemetry.record_plan_miss(drawable_name)
         self._plan_cache.pop(cache_key, None)
@@ -36,6 +36,7 @@ from rendering.helpers.polar_renderer import render_polar_helper
 from rendering.helpers.function_renderer import render_function_helper
 from rendering.helpers.parametric_function_renderer import render_parametric_function_helper
 from rendering.helpers.bar_renderer import render_bar_helper
+from rendering.helpers.scatter_plot_renderer import render_scatter_plot_helper
 from rendering.helpers.colored_area_renderer import (
     render_colored_area_helper,
     render_functions_bounded_area_helper,
@@ -70,6 +71,7 @@ __all__ = [
     "render_function_helper",
     "render_parametric_function_helper",
     "render_bar_helper",
+    "render_scatter_plot_helper",
     "render_colored_area_helper",
     "render_functions_bounded_area_helper",
     "render_function_segment_area_helper",
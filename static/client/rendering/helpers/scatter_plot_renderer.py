@@ -0,0 +1,66 @@
+"""Scatter plot rendering helper for drawing array-backed point clouds.
+
+This module provides the render_scatter_plot_helper function that renders
+every sample of a scatter plot drawable as a screen-space filled circle.
+
+Key Features:
+    - One shape for the whole cloud so all markers land in a single plan
+    - Shared FillStyle across markers for batched canvas fills
+    - Marker radius from the drawable or the style's point_radius
+    - Non-finite samples skipped
+"""
+
+from __future__ import annotations
+
+import math
+
+from rendering.helpers.shape_decorator import _manages_shape
+from rendering.primitives import FillStyle
+
+
+@_manages_shape
+def _render_markers(primitives, screen_points, radius, fill):
+    """Render one filled circle per screen point."""
+    for center in screen_points:
+        primitives.fill_circle(center, radius, fill, screen_space=True)
+
+
+def render_scatter_plot_helper(primitives, scatter, coordinate_mapper, style):
+    """Render a scatter plot drawable as a cloud of filled circles.
+
+    Args:
+        primitives: The renderer primitives interface.
+        scatter: ScatterPlot drawable with x_values, y_values, color, and point_radius.
+        coordinate_mapper: Mapper for math-to-screen coordinate conversion.
+        style: Style dictionary with point_radius and point_color.
+    """
+    x_values = getattr(scatter, "x_values", ())
+    y_values = getattr(scatter, "y_values", ())
+    if not x_values:
+        return
+    radius_raw = getattr(scatter, "point_radius", None)
+    if radius_raw is None:
+        radius_raw = style.get("point_radius", 0) or 0
+    try:
+        radius = float(radius_raw)
+    except Exception:
+        return
+    if radius <= 0:
+        return
+
+    math_to_screen = coordinate_mapper.math_to_screen
+    screen_points = []
+    for x, y in zip(x_values, y_values):
+        if not (math.isfinite(x) and math.isfinite(y)):
+            continue
+        try:
+            screen_point = math_to_screen(x, y)
+        except Exception:
+            continue
+        if screen_point:
+            screen_points.append(screen_point)
+    if not screen_points:
+        return
+
+    fill = FillStyle(color=str(getattr(scatter, "color", style.get("point_color", "#000"))), opacity=None)
+    _render_markers(primitives, screen_points, radius, fill)
@@ -4,18 +4,32 @@ Function renderable: computes function polylines in math or screen space.
 This class extracts the sampling, discontinuity handling, and asymptote logic
 from the math model (`drawables.function.Function`) so that the model remains
 math-only and the renderer consumes a clean representation.
+
+Adaptive samples are cached in math space. A pan only samples the newly exposed
+x-intervals and trims samples that scrolled out of view; a moderate zoom-out
+reuses the cached samples, which stay accurate when the scale shrinks. Screen
+paths are then rebuilt by mapping the cached samples, without re-evaluating the
+function.
 """
 
 from __future__ import annotations
 
+import bisect
 import math
-from typing import Any, Optional, Tuple, cast
+from typing import Any, List, Optional, Tuple, cast
 
 from rendering.primitives import MathPolyline, ScreenPolyline
-from rendering.renderables.adaptive_sampler import AdaptiveSampler
+from rendering.renderables.adaptive_sampler import AdaptiveSampler, INITIAL_SEGMENTS
 
 SCREEN_MARGIN: float = 16.0
 
+# Cached samples are kept across a zoom-out of at most this factor; beyond it they
+# are denser than the new scale needs and the range is sampled afresh.
+MAX_REUSED_ZOOM_OUT: float = 2.0
+
+# Mirrors the sub-range cap in AdaptiveSampler.generate_samples_with_asymptotes
+MAX_SPLIT_SUBRANGES: int = 20
+
 
 class FunctionRenderable:
     def __init__(self, function_model: Any, coordinate_mapper: Any) -> None:
@@ -26,6 +40,16 @@ class FunctionRenderable:
         self._last_scale: Optional[float] = None
         self._last_bounds: Optional[Tuple[float, float]] = None
         self._last_screen_bounds: Optional[Tuple[int, int]] = None
+        self._last_top_bound: Optional[float] = None
+        self._last_version: Optional[int] = None
+        # Math-space sample cache: sorted x-values, their f(x) (None when evaluation failed),
+        # the covered x-span, the (min, max) scales the samples were taken at, and the
+        # function version and screen size they belong to.
+        self._sample_xs: List[float] = []
+        self._sample_ys: List[Any] = []
+        self._sample_span: Optional[Tuple[float, float]] = None
+        self._sample_scales: Optional[Tuple[float, float]] = None
+        self._sample_key: Optional[Tuple[Optional[int], Tuple[int, int]]] = None
 
     def invalidate_cache(self) -> None:
         self._cached_screen_paths = None
@@ -33,6 +57,16 @@ class FunctionRenderable:
         self._last_scale = None
         self._last_bounds = None
         self._last_screen_bounds = None
+        self._last_top_bound = None
+        self._last_version = None
+        self._clear_samples()
+
+    def _clear_samples(self) -> None:
+        self._sample_xs = []
+        self._sample_ys = []
+        self._sample_span = None
+        self._sample_scales = None
+        self._sample_key = None
 
     def _compute_angle(
         self,
@@ -59,17 +93,34 @@ class FunctionRenderable:
         except Exception:
             return -10, 10
 
+    def _get_visible_top_bound(self) -> Optional[float]:
+        try:
+            return cast(float, self.mapper.get_visible_top_bound())
+        except Exception:
+            return None
+
     def _get_screen_signature(self) -> Tuple[int, int]:
         screen_width = getattr(self.mapper, "canvas_width", None)
         screen_height = getattr(self.mapper, "canvas_height", None)
         return (int(screen_width or 0), int(screen_height or 0))
 
+    def _get_function_version(self) -> Optional[int]:
+        get_version = getattr(self.func, "get_version", None)
+        if get_version is None:
+            return None
+        try:
+            return cast(int, get_version())
+        except Exception:
+            return None
+
     def _update_cache_state(
         self, scale: Optional[float], bounds: Tuple[float, float], screen_sig: Tuple[int, int]
     ) -> None:
         self._last_scale = scale
         self._last_bounds = bounds
         self._last_screen_bounds = screen_sig
+        self._last_top_bound = self._get_visible_top_bound()
+        self._last_version = self._get_function_version()
 
     def _should_regenerate(self) -> bool:
         current_scale: Optional[float] = getattr(self.mapper, "scale_factor", None)
@@ -78,6 +129,13 @@ class FunctionRenderable:
         if self._cached_screen_paths is None or not self._cache_valid:
             self._update_cache_state(current_scale, current_bounds, screen_signature)
             return True
+        if self._last_version != self._get_function_version():
+            self._update_cache_state(current_scale, current_bounds, screen_signature)
+            return True
+        # A vertical pan keeps every sample but moves the screen paths
+        if self._last_top_bound != self._get_visible_top_bound():
+            self._update_cache_state(current_scale, current_bounds, screen_signature)
+            return True
         if self._last_bounds != current_bounds:
             self._update_cache_state(current_scale, current_bounds, screen_signature)
             return True
@@ -198,25 +256,35 @@ class FunctionRenderable:
         height: float = getattr(self.mapper, "canvas_height", 0) or 0
         return width, height
 
-    def _calculate_sample_points_by_subrange(self, left_bound: float, right_bound: float) -> list[list[float]]:
+    def _get_split_points(self) -> list[float]:
+        """Asymptotes and point discontinuities, sorted; sampling and paths break at each."""
+        asymptotes = getattr(self.func, "vertical_asymptotes", []) or []
+        point_discontinuities = getattr(self.func, "point_discontinuities", []) or []
+        return sorted(set(asymptotes + point_discontinuities))
+
+    def _calculate_sample_points_by_subrange(
+        self,
+        left_bound: float,
+        right_bound: float,
+        max_samples: Optional[int] = None,
+        initial_segments: Optional[int] = None,
+    ) -> list[list[float]]:
         """
         Calculate sample points, splitting at asymptotes and discontinuities into separate sub-ranges.
         Returns a list of sample lists, one per continuous sub-range.
         """
         canvas_width = int(getattr(self.mapper, "canvas_width", 800) or 800)
+        if max_samples is None:
+            max_samples = canvas_width
 
-        initial_segments = None
         if getattr(self.func, "is_periodic", False) and getattr(self.func, "estimated_period", None):
             range_width = right_bound - left_bound
             num_periods = range_width / self.func.estimated_period
-            initial_segments = min(canvas_width, max(8, int(num_periods * 4)))
+            min_segments = initial_segments if initial_segments is not None else 8
+            initial_segments = min(max_samples, max(min_segments, int(num_periods * 4)))
 
-        # Get asymptotes AND point discontinuities - both require splitting
-        asymptotes = getattr(self.func, "vertical_asymptotes", []) or []
-        point_discontinuities = getattr(self.func, "point_discontinuities", []) or []
-
-        # Combine all split points (asymptotes and discontinuities)
-        all_split_points = sorted(set(asymptotes + point_discontinuities))
+        # Asymptotes AND point discontinuities both require splitting
+        all_split_points = self._get_split_points()
 
         if all_split_points:
             return cast(
@@ -228,7 +296,7 @@ class FunctionRenderable:
                     self.mapper.math_to_screen,
                     all_split_points,
                     initial_segments,
-                    max_samples=canvas_width,
+                    max_samples=max_samples,
                 ),
             )
         else:
@@ -239,10 +307,126 @@ class FunctionRenderable:
                 self.func.function,
                 self.mapper.math_to_screen,
                 initial_segments,
-                max_samples=canvas_width,
+                max_samples=max_samples,
             )
             return [samples] if samples else []
 
+    def _evaluate_samples(self, sample_points: list[float]) -> list[Any]:
+        """Evaluate f at each sample x-value, with None for failed evaluations."""
+        function = self.func.function
+        values: list[Any] = []
+        for x in sample_points:
+            try:
+                values.append(function(x))
+            except Exception:
+                values.append(None)
+        return values
+
+    def _sample_interval(
+        self,
+        left_bound: float,
+        right_bound: float,
+        max_samples: Optional[int] = None,
+        initial_segments: Optional[int] = None,
+    ) -> Tuple[list[float], list[Any]]:
+        """Adaptively sample [left_bound, right_bound] and evaluate the samples."""
+        subranges = self._calculate_sample_points_by_subrange(left_bound, right_bound, max_samples, initial_segments)
+        xs = sorted({x for subrange in subranges for x in subrange})
+        return xs, self._evaluate_samples(xs)
+
+    def _sample_exposed_interval(
+        self, left_bound: float, right_bound: float, scale: float
+    ) -> Tuple[list[float], list[Any]]:
+        """Sample a strip uncovered by a pan or zoom-out.
+
+        The initial segments and sample budget are the full-canvas ones scaled to the
+        strip's width in pixels, so panning keeps the density of a full regeneration.
+        """
+        strip_width = (right_bound - left_bound) * scale
+        canvas_width = float(getattr(self.mapper, "canvas_width", 0) or 0)
+        budget = int(math.ceil(strip_width)) + 1
+        segments = INITIAL_SEGMENTS
+        if canvas_width > 0:
+            budget = min(budget, int(canvas_width))
+            segments = int(math.ceil(INITIAL_SEGMENTS * min(1.0, strip_width / canvas_width)))
+        return self._sample_interval(left_bound, right_bound, max(2, budget), max(1, segments))
+
+    def _can_reuse_samples(self, left_bound: float, right_bound: float, scale: Optional[float]) -> bool:
+        if self._sample_span is None or self._sample_scales is None or not scale:
+            return False
+        if self._sample_key != (self._get_function_version(), self._get_screen_signature()):
+            return False
+        cached_left, cached_right = self._sample_span
+        if right_bound <= cached_left or left_bound >= cached_right:
+            return False
+        min_scale, max_scale = self._sample_scales
+        # Chord deviations shrink with the scale, so samples stay accurate when zooming out,
+        # but not when zooming in past the coarsest scale they were taken at
+        return scale <= min_scale and max_scale <= scale * MAX_REUSED_ZOOM_OUT
+
+    def _update_samples(self, left_bound: float, right_bound: float) -> None:
+        """Bring the math-space sample cache to cover exactly [left_bound, right_bound].
+
+        Reusable samples are trimmed to the new span and only the exposed ends are
+        sampled; otherwise the whole span is sampled afresh.
+        """
+        scale: Optional[float] = getattr(self.mapper, "scale_factor", None)
+        if not self._can_reuse_samples(left_bound, right_bound, scale):
+            self._sample_xs, self._sample_ys = self._sample_interval(left_bound, right_bound)
+            self._sample_span = (left_bound, right_bound)
+            self._sample_scales = (float(scale), float(scale)) if scale else None
+            self._sample_key = (self._get_function_version(), self._get_screen_signature())
+            return
+
+        assert self._sample_span is not None and self._sample_scales is not None and scale
+        cached_left, cached_right = self._sample_span
+        start = bisect.bisect_left(self._sample_xs, left_bound)
+        end = bisect.bisect_right(self._sample_xs, right_bound)
+        xs = self._sample_xs[start:end]
+        ys = self._sample_ys[start:end]
+
+        if left_bound < cached_left:
+            head_xs, head_ys = self._sample_exposed_interval(left_bound, cached_left, scale)
+        elif xs and xs[0] == left_bound:
+            head_xs, head_ys = [], []
+        else:
+            head_xs, head_ys = [left_bound], self._evaluate_samples([left_bound])
+        keep = bisect.bisect_left(head_xs, xs[0]) if xs else len(head_xs)
+        xs = head_xs[:keep] + xs
+        ys = head_ys[:keep] + ys
+
+        if right_bound > cached_right:
+            tail_xs, tail_ys = self._sample_exposed_interval(cached_right, right_bound, scale)
+        elif xs and xs[-1] == right_bound:
+            tail_xs, tail_ys = [], []
+        else:
+            tail_xs, tail_ys = [right_bound], self._evaluate_samples([right_bound])
+        skip = bisect.bisect_right(tail_xs, xs[-1]) if xs else 0
+        xs = xs + tail_xs[skip:]
+        ys = ys + tail_ys[skip:]
+
+        self._sample_xs = xs
+        self._sample_ys = ys
+        self._sample_span = (left_bound, right_bound)
+        self._sample_scales = (min(self._sample_scales[0], scale), self._sample_scales[1])
+
+    def _split_cached_samples(self, left_bound: float, right_bound: float) -> list[Tuple[list[float], list[Any]]]:
+        """Split the cached samples into the continuous sub-ranges between split points."""
+        split_points = [p for p in self._get_split_points() if left_bound < p < right_bound]
+        if len(split_points) > MAX_SPLIT_SUBRANGES - 1:
+            split_points = []
+        subranges: list[Tuple[list[float], list[Any]]] = []
+        start = 0
+        for point in split_points + [math.inf]:
+            end = bisect.bisect_left(self._sample_xs, point)
+            if end > start:
+                subranges.append((self._sample_xs[start:end], self._sample_ys[start:end]))
+            # A sample exactly on a split point belongs to neither side
+            while end < len(self._sample_xs) and self._sample_xs[end] == point:
+                end += 1
+            start = end
+        return subranges
+
     def _eval_scaled_point(self, x_val: float) -> Tuple[Tuple[Optional[float], Optional[float]], Any]:
         try:
             y_val: Any = self.func.function(x_val)
@@ -303,14 +487,17 @@ class FunctionRenderable:
         """
         left_bound, right_bound = self._get_effective_bounds()
         width, height = self._get_screen_dimensions()
+        if right_bound <= left_bound:
+            self._clear_samples()
+            return []
 
-        # Get samples split by asymptotes - each sub-list is a continuous range
-        sample_subranges = self._calculate_sample_points_by_subrange(left_bound, right_bound)
+        self._update_samples(left_bound, right_bound)
 
         all_paths: list[list[tuple[float, float]]] = []
 
-        for sample_points in sample_subranges:
-            paths = self._build_path_from_samples(sample_points, height)
+        # Each cached sub-range between asymptotes is a continuous range
+        for sample_points, sample_values in self._split_cached_samples(left_bound, right_bound):
+            paths = self._build_path_from_math_samples(sample_points, sample_values, height)
             all_paths.extend(paths)
         return all_paths
 
@@ -339,6 +526,26 @@ class FunctionRenderable:
         Build screen paths from a list of sample x-values (within a single sub-range).
         Path breaks on: failed evaluation, large y-jumps, discontinuities, or asymptotes.
         """
+        if len(sample_points) < 2:
+            return []
+        return self._build_path_from_math_samples(sample_points, self._evaluate_samples(sample_points), height)
+
+    def _map_sample(self, x: float, y: Any) -> Tuple[Optional[float], Optional[float]]:
+        if y is None:
+            return (None, None)
+        try:
+            sx, sy = self.mapper.math_to_screen(x, y)
+            return (sx, sy)
+        except Exception:
+            return (None, None)
+
+    def _build_path_from_math_samples(
+        self, sample_points: list[float], sample_values: list[Any], height: float
+    ) -> list[list[tuple[float, float]]]:
+        """
+        Build screen paths from evaluated math-space samples (within a single sub-range).
+        Path breaks on: failed evaluation, large y-jumps, discontinuities, or asymptotes.
+        """
         if len(sample_points) < 2:
             return []
 
@@ -348,7 +555,7 @@ class FunctionRenderable:
         prev_sx: Optional[float] = None
         prev_x: Optional[float] = None
 
-        for x in sample_points:
+        for x, y in zip(sample_points, sample_values):
             if self._is_discontinuity(x):
                 self._finalize_path(current_path, paths)
                 current_path = []
@@ -363,7 +570,7 @@ class FunctionRenderable:
                 prev_sy = None
                 prev_sx = None
 
-            scaled_point, _ = self._eval_scaled_point(x)
+            scaled_point = self._map_sample(x, y)
             if scaled_point[0] is None:
                 self._finalize_path(current_path, paths)
                 current_path = []
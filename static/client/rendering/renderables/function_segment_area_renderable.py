@@ -43,15 +43,25 @@ class FunctionSegmentAreaRenderable:
         if num_points < 2:
             num_points = 2
         dx: float = (right_bound - left_bound) / (num_points - 1) if num_points > 1 else 1.0
+        xs: List[float] = [left_bound + i * dx for i in range(num_points)]
         pts: List[Tuple[float, float]] = []
-        for i in range(num_points):
-            x_m: float = left_bound + i * dx
-            y_m: Optional[float] = self._eval_function(x_m)
+        for x_m, y_m in zip(xs, self._eval_function_many(xs)):
             if y_m is None:
                 continue
             pts.append((x_m, y_m))
         return pts
 
+    def _eval_function_many(self, xs: List[float]) -> List[Optional[float]]:
+        func: Any = self.area.func
+        if hasattr(func, "function") and hasattr(func, "evaluate_many"):
+            try:
+                values: Any = func.evaluate_many(xs)
+                if isinstance(values, list) and len(values) == len(xs):
+                    return cast(List[Optional[float]], values)
+            except Exception:
+                pass
+        return [self._eval_function(x) for x in xs]
+
     def _segment_reverse_points_math(self) -> Optional[List[Tuple[float, float]]]:
         p1: Any = self.area.segment.point1
         p2: Any = self.area.segment.point2
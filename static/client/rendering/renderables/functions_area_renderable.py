@@ -24,18 +24,31 @@ class FunctionsBoundedAreaRenderable:
             return float(f)
         if self._is_function_like(f):
             try:
-                y: Any = f.function(x_math)
-                if y is None:
-                    return None
-                if not isinstance(y, (int, float)):
-                    return None
-                if isinstance(y, float) and (y != y or abs(y) == float("inf")):
-                    return None
-                return y
+                return self._filter_y(f.function(x_math))
             except Exception:
                 return None
         return None
 
+    def _filter_y(self, y: Any) -> Optional[float]:
+        if y is None:
+            return None
+        if not isinstance(y, (int, float)):
+            return None
+        if isinstance(y, float) and (y != y or abs(y) == float("inf")):
+            return None
+        return y
+
+    def _eval_y_math_many(self, f: Any, xs: List[float]) -> List[Optional[float]]:
+        """Batch counterpart of _eval_y_math, using the model's evaluate_many when present."""
+        if self._is_function_like(f) and hasattr(f, "evaluate_many"):
+            try:
+                values: Any = f.evaluate_many(xs)
+                if isinstance(values, list) and len(values) == len(xs):
+                    return [self._filter_y(y) for y in values]
+            except Exception:
+                pass
+        return [self._eval_y_math(f, x) for x in xs]
+
     def _get_bounds(self) -> Tuple[float, float]:
         try:
             left: float
@@ -75,10 +88,10 @@ class FunctionsBoundedAreaRenderable:
             num_points = 2
         dx: float = (right - left) / (num_points - 1) if num_points > 1 else 1.0
         pairs: List[Tuple[Optional[Tuple[float, float]], Optional[Tuple[float, float]]]] = []
-        for i in range(num_points):
-            x_m: float = left + i * dx
-            y1: Optional[float] = self._eval_y_math(f1, x_m)
-            y2: Optional[float] = self._eval_y_math(f2, x_m)
+        xs: List[float] = [left + i * dx for i in range(num_points)]
+        ys1: List[Optional[float]] = self._eval_y_math_many(f1, xs)
+        ys2: List[Optional[float]] = self._eval_y_math_many(f2, xs)
+        for x_m, y1, y2 in zip(xs, ys1, ys2):
             if y1 is None or y2 is None:
                 pairs.append((None, None))
                 continue
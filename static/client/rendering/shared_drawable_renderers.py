@@ -44,6 +44,7 @@ from rendering.helpers import (
     render_functions_bounded_area_helper,
     render_label_helper,
     render_point_helper,
+    render_scatter_plot_helper,
     render_segment_helper,
     render_segments_bounded_area_helper,
     render_vector_helper,
@@ -90,6 +91,7 @@ __all__ = [
     "render_functions_bounded_area_helper",
     "render_label_helper",
     "render_point_helper",
+    "render_scatter_plot_helper",
     "render_segment_helper",
     "render_segments_bounded_area_helper",
     "render_vector_helper",
@@ -25,6 +25,7 @@ from typing import Any, Callable, Dict, Optional, Set, Tuple
 
 from browser import document, svg, window
 
+from constants import plan_cache_idle_frames
 from rendering.cached_render_plan import (
     OptimizedPrimitivePlan,
     build_plan_for_cartesian,
@@ -48,6 +49,7 @@ class SvgTelemetry:
         _per_drawable: Per-drawable type timing breakdown.
         _adapter_events: Event counts from the primitive adapter.
         _frames: Total frames rendered since last reset.
+        _draw_requests: Draws requested by the canvas since last reset.
     """
 
     def __init__(self) -> None:
@@ -72,11 +74,15 @@ class SvgTelemetry:
         self._per_drawable: Dict[str, Dict[str, float]] = {}
         self._adapter_events: Dict[str, int] = {}
         self._frames: int = 0
+        self._draw_requests: int = 0
         self._max_batch_depth: int = 0
 
     def begin_frame(self) -> None:
         self._frames += 1
 
+    def record_draw_request(self) -> None:
+        self._draw_requests += 1
+
     def end_frame(self) -> None:
         pass
 
@@ -154,6 +160,7 @@ class SvgTelemetry:
         phase.update(self._phase_counts)
         return {
             "frames": self._frames,
+            "draw_requests": self._draw_requests,
             "phase": phase,
             "per_drawable": per_drawable,
             "adapter_events": adapter_events,
@@ -206,6 +213,7 @@ class SvgRenderer(RendererProtocol):
         )
         self._frame_seen_plan_keys: Set[str] = set()
         self._cartesian_rendered_this_frame: bool = False
+        self._frame_index: int = 0
 
     def _record_plan_usage(self, name: str, usage_counts: Dict[str, int], *, cartesian: bool = False) -> None:
         if not usage_counts:
@@ -239,6 +247,7 @@ class SvgRenderer(RendererProtocol):
         self._register_shape("drawables.triangle", "Triangle", self._render_triangle)
         self._register_shape("drawables.rectangle", "Rectangle", self._render_rectangle)
         self._register_shape("drawables.bar", "Bar", self._render_drawable)
+        self._register_shape("drawables.scatter_plot", "ScatterPlot", self._render_drawable)
         self._register_shape(
             "drawables.functions_bounded_colored_area",
             "FunctionsBoundedColoredArea",
@@ -285,6 +294,9 @@ class SvgRenderer(RendererProtocol):
         except Exception:
             pass
 
+    def record_draw_request(self) -> None:
+        self._telemetry.record_draw_request()
+
     def begin_frame(self) -> None:
         self._telemetry.begin_frame()
         if self._use_offscreen_surface:
@@ -302,6 +314,8 @@ class SvgRenderer(RendererProtocol):
         if not self._cartesian_rendered_this_frame and self._cartesian_cache:
             self.invalidate_cartesian_cache()
         self._telemetry.end_frame()
+        self._frame_index += 1
+        self._evict_idle_plan_entries()
 
     def render(self, drawable: Any, coordinate_mapper: Any) -> bool:
         # Handlers perform the actual drawing; this method only dispatches.
@@ -502,7 +516,7 @@ class SvgRenderer(RendererProtocol):
             return
         drawable_name = self._resolve_drawable_name(drawable)
         map_state = self._capture_map_state(coordinate_mapper)
-        signature = self._compute_drawable_signature(drawable, coordinate_mapper)
+        signature = self._compute_render_signature(drawable, coordinate_mapper)
         cache_key = self._plan_cache_key(drawable, drawable_name)
         plan_context = self._resolve_drawable_plan_context(
             drawable, coordinate_mapper, map_state, signature, drawable_name, cache_key
@@ -559,6 +573,16 @@ class SvgRenderer(RendererProtocol):
                     drop(plan_obj.plan_key)
         self._frame_seen_plan_keys.clear()
 
+    def _evict_idle_plan_entries(self) -> None:
+        """Drop plans of drawables that stopped rendering, e.g. after delete or rename."""
+        if self._frame_index % plan_cache_idle_frames or not self._plan_cache:
+            return
+        oldest_live_frame = self._frame_index - plan_cache_idle_frames
+        stale_keys = [key for key, entry in self._plan_cache.items() if entry.get("frame", 0) < oldest_live_frame]
+        for key in stale_keys:
+            entry = self._plan_cache.pop(key)
+            self._drop_plan_group(entry.get("plan"))
+
     def _resolve_drawable_name(self, drawable: Any) -> str:
         try:
             candidate = getattr(drawable, "get_class_name", None)
@@ -579,6 +603,27 @@ class SvgRenderer(RendererProtocol):
             return f"{drawable_name}:{identifier}"
         return f"{drawable_name}:{id(drawable)}"
 
+    def _compute_render_signature(self, drawable: Any, coordinate_mapper: Any = None) -> Tuple[Any, ...]:
+        """Key a cached plan on the drawable's mutation version plus the view it depends on.
+
+        Falls back to hashing ``get_state()`` for objects without a render version.
+        """
+        version_getter = getattr(drawable, "get_render_version", None)
+        version = version_getter() if callable(version_getter) else None
+        if not isinstance(version, int):
+            return self._compute_drawable_signature(drawable, coordinate_mapper)
+        if self._needs_scale_in_signature(drawable) and coordinate_mapper is not None:
+            return (version, self._view_signature(coordinate_mapper))
+        return (version,)
+
+    def _view_signature(self, coordinate_mapper: Any) -> Tuple[Any, ...]:
+        scale = getattr(coordinate_mapper, "scale_factor", None)
+        offset = getattr(coordinate_mapper, "offset", None)
+        return (
+            round(float(scale), 4) if scale is not None else None,
+            (round(float(offset.x), 2), round(float(offset.y), 2)) if offset is not None else None,
+        )
+
     def _compute_drawable_signature(self, drawable: Any, coordinate_mapper: Any = None) -> Tuple[Any, ...]:
         state_func = getattr(drawable, "get_state", None)
         state: Any = None
@@ -858,6 +903,7 @@ class SvgRenderer(RendererProtocol):
     ) -> Optional[Dict[str, Any]]:
         cached_entry = self._plan_cache.get(cache_key)
         if self._is_cached_plan_valid(cached_entry, signature) and cached_entry is not None:
+            cached_entry["frame"] = self._frame_index
             plan = cached_entry["plan"]
             plan.update_map_state(map_state)
             self._mark_screen_space_plan_dirty(plan)
@@ -869,7 +915,7 @@ class SvgRenderer(RendererProtocol):
                 self._plan_cache.pop(cache_key, None)
                 return None
             if signature is not None:
-                self._plan_cache[cache_key] = {"plan": plan, "signature": signature}
+                self._plan_cache[cache_key] = {"plan": plan, "signature": signature, "frame": self._frame_index}
         return self._create_drawable_plan_context(plan)
 
     def _apply_drawable_plan(self, context: Dict[str, Any], drawable_name: str) -> None:
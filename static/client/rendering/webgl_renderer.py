@@ -161,6 +161,12 @@ class WebGLRenderer(RendererProtocol):
             self.register(BarDrawable, self._render_drawable)
         except Exception:
             pass
+        try:
+            from drawables.scatter_plot import ScatterPlot as ScatterPlotDrawable
+
+            self.register(ScatterPlotDrawable, self._render_drawable)
+        except Exception:
+            pass
 
     def begin_frame(self) -> None:
         self._shared_primitives.begin_frame()
@@ -80,15 +80,19 @@ class ResultProcessor:
         if contains_undoable_function:
             canvas.archive()
 
-        # Process each function call
-        for call in calls:
-            try:
-                ResultProcessor._process_function_call(
-                    call, available_functions, non_computation_functions, unformattable_functions, canvas, results
-                )
-            except Exception as e:
-                function_name: str = call.get("function_name", "")
-                ResultProcessor._handle_exception(e, function_name, results)
+        # Process each function call, redrawing once for the whole batch
+        deferred = ResultProcessor._begin_deferred_draws(canvas)
+        try:
+            for call in calls:
+                try:
+                    ResultProcessor._process_function_call(
+                        call, available_functions, non_computation_functions, unformattable_functions, canvas, results
+                    )
+                except Exception as e:
+                    function_name: str = call.get("function_name", "")
+                    ResultProcessor._handle_exception(e, function_name, results)
+        finally:
+            ResultProcessor._end_deferred_draws(canvas, deferred)
 
         return results
 
@@ -128,6 +132,46 @@ class ResultProcessor:
         if contains_undoable_function:
             canvas.archive()
 
+        deferred = ResultProcessor._begin_deferred_draws(canvas)
+        try:
+            ResultProcessor._process_traced_calls(
+                calls,
+                available_functions,
+                non_computation_functions,
+                unformattable_functions,
+                canvas,
+                results,
+                traced_calls,
+            )
+        finally:
+            ResultProcessor._end_deferred_draws(canvas, deferred)
+
+        return results, traced_calls
+
+    @staticmethod
+    def _begin_deferred_draws(canvas: "Canvas") -> bool:
+        """Defer canvas draws for a batch of calls; returns False for canvases without a scheduler."""
+        begin = getattr(canvas, "begin_deferred_draws", None)
+        if not callable(begin):
+            return False
+        begin()
+        return True
+
+    @staticmethod
+    def _end_deferred_draws(canvas: "Canvas", deferred: bool) -> None:
+        if deferred:
+            canvas.end_deferred_draws()
+
+    @staticmethod
+    def _process_traced_calls(
+        calls: List[Dict[str, Any]],
+        available_functions: Dict[str, Any],
+        non_computation_functions: Tuple[str, ...],
+        unformattable_functions: Tuple[str, ...],
+        canvas: "Canvas",
+        results: Dict[str, Any],
+        traced_calls: List["TracedCall"],
+    ) -> None:
         for seq, call in enumerate(calls):
             function_name = call.get("function_name", "")
             args = call.get("arguments", {})
@@ -177,8 +221,6 @@ class ResultProcessor:
                 }
             )
 
-        return results, traced_calls
-
     @staticmethod
     def _validate_inputs(
         calls: List[Dict[str, Any]], available_functions: Dict[str, Any], undoable_functions: Tuple[str, ...]
@@ -6,7 +6,8 @@ the state machine for requesting, loading, and playing audio.
 
 Features:
     - State machine: IDLE -> LOADING -> PLAYING -> IDLE
-    - Audio blob management for efficient playback
+    - Streamed playback: the audio element loads /api/tts/stream/<id>,
+      so speech starts after the server synthesizes the first sentence
     - Voice selection persistence via localStorage
     - Integration with AI message menu
 
@@ -46,7 +47,6 @@ class TTSController:
         """Initialize the TTS controller."""
         self._state: TTSState = "idle"
         self._audio: Optional[Any] = None  # HTML5 Audio element
-        self._audio_url: Optional[str] = None  # Blob URL for cleanup
         self._current_text: str = ""
         self._on_state_change: Optional[Callable[[TTSState], None]] = None
         self._on_error: Optional[Callable[[str], None]] = None
@@ -141,13 +141,12 @@ class TTSController:
         self._current_text = text
         self._set_state("loading")
 
-        # Make request to TTS endpoint
+        # Register the text; the response names the URL that streams the audio
         try:
             req = ajax.ajax()
             req.bind("complete", self._on_request_complete)
             req.bind("error", self._on_request_error)
-            req.responseType = "blob"
-            req.open("POST", "/api/tts", True)
+            req.open("POST", "/api/tts/stream", True)
             req.set_header("Content-Type", "application/json")
 
             import json
@@ -168,9 +167,12 @@ class TTSController:
         """Handle TTS request completion."""
         try:
             if req.status == 200:
-                # Got audio blob
-                blob = req.response
-                self._play_audio_blob(blob)
+                stream_url = self._extract_stream_url(req)
+                if stream_url:
+                    self._play_audio_url(stream_url)
+                else:
+                    self._notify_error("TTS response did not include an audio stream")
+                    self._set_state("idle")
             else:
                 # Error response - try to extract message from JSON
                 error_msg = self._extract_error_message(req)
@@ -181,6 +183,25 @@ class TTSController:
             self._notify_error(f"Error processing TTS response: {e}")
             self._set_state("idle")
 
+    def _extract_stream_url(self, req: Any) -> Optional[str]:
+        """Read the audio stream URL from a successful /api/tts/stream response.
+
+        Args:
+            req: The AJAX request object
+
+        Returns:
+            Stream URL, or None if the response is malformed
+        """
+        try:
+            import json
+
+            response_text = getattr(req, "responseText", None) or getattr(req, "text", None)
+            data = json.loads(response_text).get("data") if response_text else None
+            url = data.get("url") if isinstance(data, dict) else None
+            return url if isinstance(url, str) and url else None
+        except Exception:
+            return None
+
     def _extract_error_message(self, req: Any) -> str:
         """Extract error message from failed request.
 
@@ -223,17 +244,14 @@ class TTSController:
         self._notify_error("TTS request failed")
         self._set_state("idle")
 
-    def _play_audio_blob(self, blob: Any) -> None:
-        """Play audio from a blob.
+    def _play_audio_url(self, url: str) -> None:
+        """Play audio streamed from a server URL.
 
         Args:
-            blob: Audio blob from server response
+            url: Stream URL returned by /api/tts/stream
         """
         try:
-            # Create object URL for the blob
-            url = window.URL.createObjectURL(blob)
-
-            # Create Audio element
+            # The element starts playing as soon as enough of the stream arrives
             audio = window.Audio.new(url)
 
             # Set up event handlers
@@ -251,7 +269,6 @@ class TTSController:
 
             # Store reference and play
             self._audio = audio
-            self._audio_url = url
             audio.play()
 
             self._set_state("playing")
@@ -262,12 +279,13 @@ class TTSController:
 
     def _cleanup_audio(self) -> None:
         """Clean up audio resources."""
-        try:
-            if hasattr(self, "_audio_url") and self._audio_url:
-                window.URL.revokeObjectURL(self._audio_url)
-                self._audio_url = None
-        except Exception:
-            pass
+        if self._audio:
+            try:
+                # Dropping the source closes the streaming connection
+                self._audio.removeAttribute("src")
+                self._audio.load()
+            except Exception:
+                pass
 
         self._audio = None
 
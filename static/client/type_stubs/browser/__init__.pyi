@@ -31,8 +31,12 @@ class _LocalStorage:
 class _Performance:
     def now(self) -> float: ...
 
+class _MathJSCompiled:
+    def evaluate(self, scope: Any = ...) -> Any: ...
+
 class _MathJS:
     def evaluate(self, expr: str, scope: Any = ...) -> Any: ...
+    def compile(self, expr: str) -> _MathJSCompiled: ...
     def format(self, val: Any) -> str: ...
     def sqrt(self, x: Any) -> Any: ...
     def pow(self, x: Any, exp: Any) -> Any: ...
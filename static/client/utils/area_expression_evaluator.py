@@ -22,15 +22,21 @@ Example expressions:
     - "(circle_A & triangle_ABC) - square_DEFG"  (nested)
     - "C(5) & AB"                   (circle cut by segment - circular segment area)
     - "ArcMajor & A''E'"            (arc intersected with segment using prime names)
+
+Operations use Region's polygon boolean engine, so concave operands are
+handled exactly. Regions built from drawables are memoized per drawable and
+render version, and each Region polygonizes its boundary only once, so
+nested sub-expressions reuse earlier work.
 """
 
 from __future__ import annotations
 
 import math
 import re
+from collections import OrderedDict
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
-from geometry import Region
+from geometry import CircularArc, CompositePath, LineSegment, Region
 
 if TYPE_CHECKING:
     from canvas import Canvas
@@ -51,6 +57,13 @@ class _RegionWithSource:
         self.source_drawable = source_drawable
 
 
+# Regions built from drawables, keyed by id(drawable) and reused while the
+# drawable's render version is unchanged. Entries keep the drawable alive so
+# an id cannot be reused while its entry exists.
+_REGION_CACHE: "OrderedDict[int, Tuple[Any, int, _RegionWithSource]]" = OrderedDict()
+_REGION_CACHE_SIZE = 64
+
+
 class AreaExpressionResult:
     """Result of an area expression evaluation."""
 
@@ -336,7 +349,7 @@ class AreaExpressionEvaluator:
         """Recursively evaluate an AST node."""
         if isinstance(node, _NameNode):
             drawable = AreaExpressionEvaluator._resolve_drawable(node.name, canvas)
-            return AreaExpressionEvaluator._drawable_to_region_with_source(drawable)
+            return AreaExpressionEvaluator._cached_region_with_source(drawable)
 
         if isinstance(node, _BinaryOpNode):
             left_result = AreaExpressionEvaluator._evaluate_ast(node.left, canvas)
@@ -353,6 +366,27 @@ class AreaExpressionEvaluator:
             raise ValueError(f"Drawable '{name}' not found or cannot be converted to a region")
         return drawable
 
+    @staticmethod
+    def _cached_region_with_source(drawable: "Drawable") -> _RegionWithSource:
+        """Return the drawable's region, rebuilding it only after the drawable changes."""
+        get_version = getattr(drawable, "get_render_version", None)
+        if not callable(get_version):
+            return AreaExpressionEvaluator._drawable_to_region_with_source(drawable)
+
+        version = get_version()
+        key = id(drawable)
+        entry = _REGION_CACHE.get(key)
+        if entry is not None and entry[0] is drawable and entry[1] == version:
+            _REGION_CACHE.move_to_end(key)
+            return entry[2]
+
+        result = AreaExpressionEvaluator._drawable_to_region_with_source(drawable)
+        _REGION_CACHE[key] = (drawable, version, result)
+        _REGION_CACHE.move_to_end(key)
+        while len(_REGION_CACHE) > _REGION_CACHE_SIZE:
+            _REGION_CACHE.popitem(last=False)
+        return result
+
     @staticmethod
     def _drawable_to_region_with_source(drawable: "Drawable") -> _RegionWithSource:
         """Convert a drawable to a Region wrapped with source info."""
@@ -466,18 +500,20 @@ class AreaExpressionEvaluator:
                 sweep = ccw_sweep
 
         # Create region from circular segment (chord + arc curve, no center)
-        num_points = max(32, int(abs(sweep) * 16))
-        points: List[Tuple[float, float]] = []
+        return AreaExpressionEvaluator._circular_segment_region(center, radius, angle1, sweep)
 
-        # Trace along arc from p1 to p2
-        for i in range(num_points + 1):
-            t = i / num_points
-            angle = angle1 + t * sweep
-            x = center[0] + radius * math.cos(angle)
-            y = center[1] + radius * math.sin(angle)
-            points.append((x, y))
+    @staticmethod
+    def _circular_segment_region(
+        center: Tuple[float, float], radius: float, start_angle: float, sweep: float
+    ) -> Region:
+        """Region between an exact circular arc and its chord.
 
-        return Region.from_points(points)
+        Keeping the arc as a CircularArc lets Region sample it adaptively
+        instead of at a fixed point count.
+        """
+        arc = CircularArc(center, radius, start_angle, start_angle + sweep, clockwise=sweep < 0)
+        chord = LineSegment(arc.end_point(), arc.start_point())
+        return Region(CompositePath([arc, chord]))
 
     @staticmethod
     def _region_from_segments(segments: list) -> Region:
@@ -752,20 +788,10 @@ class AreaExpressionEvaluator:
             # P1 is in CW direction, so go CCW
             arc_sweep = ccw_sweep_i
 
-        # Sample the arc from i1 to i2
-        points: List[Tuple[float, float]] = []
-        num_points = max(16, int(abs(arc_sweep) * 16))
-        for i in range(num_points + 1):
-            t = i / num_points
-            angle = i1_angle + t * arc_sweep
-            x = center[0] + radius * math.cos(angle)
-            y = center[1] + radius * math.sin(angle)
-            points.append((x, y))
-
-        if len(points) < 3:
+        if abs(arc_sweep) < 1e-12:
             return AreaExpressionEvaluator._arc_to_region(arc)
 
-        return Region.from_points(points)
+        return AreaExpressionEvaluator._circular_segment_region(center, radius, i1_angle, arc_sweep)
 
     @staticmethod
     def _circle_segment_enclosed_region(circle: "Drawable", segment: "Drawable") -> Optional[Region]:
@@ -817,17 +843,7 @@ class AreaExpressionEvaluator:
             else:
                 sweep = -(2 * math.pi - ccw_sweep)
 
-        # Sample the arc
-        points: List[Tuple[float, float]] = []
-        num_points = max(16, int(abs(sweep) * 16))
-        for i in range(num_points + 1):
-            t = i / num_points
-            angle = i1_angle + t * sweep
-            x = center[0] + radius * math.cos(angle)
-            y = center[1] + radius * math.sin(angle)
-            points.append((x, y))
-
-        if len(points) < 3:
+        if abs(sweep) < 1e-12:
             return None
 
-        return Region.from_points(points)
+        return AreaExpressionEvaluator._circular_segment_region(center, radius, i1_angle, sweep)
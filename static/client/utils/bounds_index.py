@@ -0,0 +1,315 @@
+"""
+MatHud Bounding-Box Index Module
+
+Uniform grid over the math-space bounding boxes of renderable drawables, so the
+canvas can fetch only the drawables that overlap the visible window instead of
+handing every drawable to the renderer on each pan and zoom.
+
+Index Model:
+    - Bounded drawables (points, segments, vectors, circles, ellipses, arcs,
+      polygons, scatter plots) are binned into every grid cell their box overlaps
+    - Unbounded or screen-space drawables (functions, plots, labels, angles,
+      colored areas, ...) are kept in an always-on set returned by every query
+    - Boxes spanning many cells are kept in a short list tested directly
+    - The cell size is derived from the scene extent and item count on rebuild
+
+Change Tracking:
+    - Each entry remembers the render version it was binned at and the drawables
+      its rendering depends on (a segment's endpoints, a polygon's vertices)
+    - Queries read the drawable change log from a cursor, so only drawables
+      mutated since the last query, and the entries built on them, are re-checked
+    - Pans and zooms mutate no drawables, so those queries touch only visible cells
+
+Dependencies:
+    - math: Cell coordinates and finiteness checks
+    - drawables.drawable: Drawable change log
+"""
+
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from drawables.drawable import change_log_position, changed_since
+
+if TYPE_CHECKING:
+    from drawables.drawable import Drawable
+
+Bounds = Tuple[float, float, float, float]
+CellKey = Tuple[int, int]
+
+# A box covering more cells than this is tested directly instead of binned.
+_MAX_CELLS_PER_ITEM = 64
+# Rebuild with a new cell size once the item count outgrows the one it was sized for.
+_REBUILD_GROWTH = 4
+
+_POLYGON_CLASSES = (
+    "Triangle",
+    "Quadrilateral",
+    "Rectangle",
+    "Pentagon",
+    "Hexagon",
+    "Heptagon",
+    "Octagon",
+    "Nonagon",
+    "Decagon",
+    "GenericPolygon",
+)
+
+
+def _box_of_points(points: List[Tuple[float, float]]) -> Optional[Bounds]:
+    if not points:
+        return None
+    xs = [float(x) for x, _ in points]
+    ys = [float(y) for _, y in points]
+    box = (min(xs), min(ys), max(xs), max(ys))
+    if not all(math.isfinite(value) for value in box):
+        return None
+    return box
+
+
+def _box_around(cx: float, cy: float, radius: float) -> Optional[Bounds]:
+    radius = abs(float(radius))
+    return _box_of_points([(cx - radius, cy - radius), (cx + radius, cy + radius)])
+
+
+def drawable_math_bounds(drawable: Any) -> Optional[Bounds]:
+    """Return ``(min_x, min_y, max_x, max_y)`` in math space, or None when unbounded.
+
+    Only drawables whose extent is fully determined by math coordinates get a
+    box; anything else is treated as always visible.
+    """
+    try:
+        class_name = drawable.get_class_name()
+        if class_name == "Point":
+            return _box_of_points([(drawable.x, drawable.y)])
+        if class_name == "Segment":
+            return _box_of_points([(drawable.point1.x, drawable.point1.y), (drawable.point2.x, drawable.point2.y)])
+        if class_name == "Vector":
+            segment = drawable.segment
+            return _box_of_points([(segment.point1.x, segment.point1.y), (segment.point2.x, segment.point2.y)])
+        if class_name == "Circle":
+            return _box_around(drawable.center.x, drawable.center.y, drawable.radius)
+        if class_name == "Ellipse":
+            # The larger radius bounds the ellipse under any rotation
+            radius = max(abs(drawable.radius_x), abs(drawable.radius_y))
+            return _box_around(drawable.center.x, drawable.center.y, radius)
+        if class_name == "CircleArc":
+            return _box_around(drawable.center_x, drawable.center_y, drawable.radius)
+        if class_name in _POLYGON_CLASSES:
+            return _box_of_points([(vertex.x, vertex.y) for vertex in drawable.get_vertices()])
+        if class_name == "ScatterPlot":
+            return drawable.get_math_bounds()
+    except Exception:
+        return None
+    return None
+
+
+def _render_version(drawable: Any) -> Optional[int]:
+    get_version = getattr(drawable, "get_render_version", None)
+    if not callable(get_version):
+        return None
+    try:
+        return int(get_version())
+    except Exception:
+        return None
+
+
+def _dependency_ids(drawable: Any) -> List[int]:
+    get_dependencies = getattr(drawable, "get_render_dependencies", None)
+    if not callable(get_dependencies):
+        return []
+    try:
+        return [id(dependency) for dependency in get_dependencies()]
+    except Exception:
+        return []
+
+
+def _overlaps(box: Bounds, window: Bounds) -> bool:
+    return box[0] <= window[2] and box[2] >= window[0] and box[1] <= window[3] and box[3] >= window[1]
+
+
+class BoundsIndex:
+    """Uniform-grid index answering "which drawables overlap this math-space window"."""
+
+    def __init__(self, bounds_of: Callable[[Any], Optional[Bounds]] = drawable_math_bounds) -> None:
+        self._bounds_of = bounds_of
+        # id -> [drawable, render version, box, cell keys, dependency ids]
+        self._entries: Dict[int, List[Any]] = {}
+        # dependency id -> ids of the entries whose rendering depends on it
+        self._dependents: Dict[int, Set[int]] = {}
+        self._unbounded: Dict[int, Any] = {}
+        self._large: Dict[int, Any] = {}
+        self._cells: Dict[CellKey, Dict[int, Any]] = {}
+        self._cell_size: float = 0.0
+        self._sized_for: int = 0
+        self._log_position: int = change_log_position()
+
+    def __len__(self) -> int:
+        return len(self._entries) + len(self._unbounded)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._entries = {}
+        self._dependents = {}
+        self._unbounded = {}
+        self._large = {}
+        self._cells = {}
+        self._cell_size = 0.0
+        self._sized_for = 0
+        self._log_position = change_log_position()
+
+    def add(self, drawable: Any) -> None:
+        """Index a drawable, or mark it always-on when it has no math-space box."""
+        drawable_id = id(drawable)
+        self.remove(drawable)
+        version = _render_version(drawable)
+        box = self._bounds_of(drawable) if version is not None else None
+        if box is None:
+            self._unbounded[drawable_id] = drawable
+            return
+        dependency_ids = _dependency_ids(drawable)
+        entry: List[Any] = [drawable, version, box, [], dependency_ids]
+        self._entries[drawable_id] = entry
+        for dependency_id in dependency_ids:
+            self._dependents.setdefault(dependency_id, set()).add(drawable_id)
+        if self._cell_size > 0.0:
+            self._bin(drawable_id, entry)
+
+    def remove(self, drawable: Any) -> None:
+        """Forget a drawable; unknown drawables are ignored."""
+        drawable_id = id(drawable)
+        self._unbounded.pop(drawable_id, None)
+        entry = self._entries.pop(drawable_id, None)
+        if entry is None:
+            return
+        self._unbin(drawable_id, entry)
+        for dependency_id in entry[4]:
+            dependents = self._dependents.get(dependency_id)
+            if dependents is not None:
+                dependents.discard(drawable_id)
+                if not dependents:
+                    del self._dependents[dependency_id]
+
+    def query(self, min_x: float, min_y: float, max_x: float, max_y: float) -> List["Drawable"]:
+        """Return the drawables whose boxes overlap the window, plus every always-on drawable.
+
+        The result is unordered; callers impose their own drawing order.
+        """
+        self._refresh()
+        window: Bounds = (min_x, min_y, max_x, max_y)
+        found: Dict[int, "Drawable"] = {}
+        if self._entries:
+            if not all(math.isfinite(value) for value in window):
+                found = {drawable_id: entry[0] for drawable_id, entry in self._entries.items()}
+            else:
+                self._collect_cells(window, found)
+                for drawable_id, drawable in self._large.items():
+                    if _overlaps(self._entries[drawable_id][2], window):
+                        found[drawable_id] = drawable
+        result = list(found.values())
+        result.extend(self._unbounded.values())
+        return result
+
+    def _collect_cells(self, window: Bounds, found: Dict[int, "Drawable"]) -> None:
+        size = self._cell_size
+        x0 = math.floor(window[0] / size)
+        y0 = math.floor(window[1] / size)
+        x1 = math.floor(window[2] / size)
+        y1 = math.floor(window[3] / size)
+        entries = self._entries
+        if (x1 - x0 + 1) * (y1 - y0 + 1) <= len(self._cells):
+            buckets = []
+            for cx in range(x0, x1 + 1):
+                for cy in range(y0, y1 + 1):
+                    bucket = self._cells.get((cx, cy))
+                    if bucket:
+                        buckets.append(bucket)
+        else:
+            # Zoomed far out: walking the occupied cells is cheaper than the window's
+            buckets = [
+                bucket for (cx, cy), bucket in self._cells.items() if x0 <= cx <= x1 and y0 <= cy <= y1
+            ]
+        for bucket in buckets:
+            for drawable_id, drawable in bucket.items():
+                if drawable_id not in found and _overlaps(entries[drawable_id][2], window):
+                    found[drawable_id] = drawable
+
+    def _refresh(self) -> None:
+        """Re-bin drawables mutated since the last query and resize the grid if needed."""
+        changed = changed_since(self._log_position)
+        self._log_position = change_log_position()
+        if changed is None:
+            # The log was trimmed past our cursor; fall back to checking every entry
+            self._revalidate(list(self._entries))
+        elif changed:
+            self._revalidate(self._affected_by(changed))
+        if self._cell_size <= 0.0 or len(self._entries) > _REBUILD_GROWTH * self._sized_for + 64:
+            self._rebuild()
+
+    def _affected_by(self, changed_ids: Iterable[int]) -> Set[int]:
+        affected: Set[int] = set()
+        for changed_id in changed_ids:
+            if changed_id in self._entries:
+                affected.add(changed_id)
+            dependents = self._dependents.get(changed_id)
+            if dependents:
+                affected.update(dependents)
+        return affected
+
+    def _revalidate(self, drawable_ids: Iterable[int]) -> None:
+        moved: List[Any] = []
+        for drawable_id in drawable_ids:
+            entry = self._entries.get(drawable_id)
+            if entry is not None and _render_version(entry[0]) != entry[1]:
+                moved.append(entry[0])
+        for drawable in moved:
+            self.add(drawable)
+
+    def _rebuild(self) -> None:
+        self._cells = {}
+        self._large = {}
+        boxes = [entry[2] for entry in self._entries.values()]
+        self._sized_for = len(boxes)
+        if boxes:
+            extent = max(
+                max(box[2] for box in boxes) - min(box[0] for box in boxes),
+                max(box[3] for box in boxes) - min(box[1] for box in boxes),
+            )
+            # About one item per cell for evenly spread scenes
+            self._cell_size = extent / max(1.0, math.sqrt(len(boxes))) if extent > 0.0 else 1.0
+        else:
+            self._cell_size = 1.0
+        for drawable_id, entry in self._entries.items():
+            self._bin(drawable_id, entry)
+
+    def _bin(self, drawable_id: int, entry: List[Any]) -> None:
+        box = entry[2]
+        size = self._cell_size
+        x0 = math.floor(box[0] / size)
+        y0 = math.floor(box[1] / size)
+        x1 = math.floor(box[2] / size)
+        y1 = math.floor(box[3] / size)
+        if (x1 - x0 + 1) * (y1 - y0 + 1) > _MAX_CELLS_PER_ITEM:
+            entry[3] = []
+            self._large[drawable_id] = entry[0]
+            return
+        keys = [(cx, cy) for cx in range(x0, x1 + 1) for cy in range(y0, y1 + 1)]
+        entry[3] = keys
+        for key in keys:
+            bucket = self._cells.get(key)
+            if bucket is None:
+                bucket = {}
+                self._cells[key] = bucket
+            bucket[drawable_id] = entry[0]
+
+    def _unbin(self, drawable_id: int, entry: List[Any]) -> None:
+        self._large.pop(drawable_id, None)
+        for key in entry[3]:
+            bucket = self._cells.get(key)
+            if bucket is None:
+                continue
+            bucket.pop(drawable_id, None)
+            if not bucket:
+                del self._cells[key]
+        entry[3] = []
@@ -1068,9 +1068,9 @@ class GeometryUtils:
 
         Uses the formula: (1/2) * integral of (x*dy - y*dx) along the arc.
         For a circular arc, this integrates to:
-        Area = (r^2/2) * (theta2 - theta1) + (1/2) * (x1*y2 - x2*y1)
+        Area = (r^2/2) * (theta2 - theta1) + (1/2) * (cx*(y2 - y1) - cy*(x2 - x1))
 
-        The second term accounts for the chord contribution.
+        The second term accounts for the circle's offset from the origin.
 
         Args:
             center: (cx, cy) center of the circle
@@ -1109,9 +1109,9 @@ class GeometryUtils:
 
         sector_area = 0.5 * radius * radius * span
 
-        chord_area = 0.5 * (x1 * y2 - x2 * y1)
+        offset_area = 0.5 * (cx * (y2 - y1) - cy * (x2 - x1))
 
-        return sector_area + chord_area
+        return sector_area + offset_area
 
     @staticmethod
     def elliptical_segment_area(
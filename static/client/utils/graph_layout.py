@@ -23,7 +23,7 @@ All layouts fit vertices within a bounding box and return {vertex_id: (x, y)}.
 from __future__ import annotations
 
 import math
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, List, Mapping, Optional, Set, Tuple
 
 from utils.graph_utils import Edge, GraphUtils
 
@@ -1677,20 +1677,152 @@ def _edge_intersection(
 # =============================================================================
 
 
-def _find_crossing_pairs(
-    edges: List[Edge[str]],
-    positions: Dict[str, Tuple[float, float]],
-) -> List[Tuple[Edge[str], Edge[str]]]:
+class _SegmentGrid:
+    """
+    Uniform grid over edge bounding boxes for local crossing queries.
+
+    Each edge is registered in every cell its bounding box (padded slightly
+    for the floating-point tolerances of the predicates) touches, so any
+    edge that can cross, overlap, or touch a query segment shares a cell
+    with it. Moving one vertex re-registers only its incident edges.
+
+    positions holds the float coordinates the predicates see; the values
+    last passed in are kept separately so sync() can detect moves cheaply.
+    """
+
+    def __init__(
+        self,
+        edges: List[Edge[str]],
+        positions: Mapping[str, Tuple[float, float]],
+    ) -> None:
+        self.edges: List[Edge[str]] = list(edges)
+        self.positions: Dict[str, Tuple[float, float]] = {}
+        self._given: Dict[str, Tuple[float, float]] = {}
+        for vid in positions:
+            self._set_position(vid, positions[vid])
+
+        xs = [p[0] for p in self.positions.values()]
+        ys = [p[1] for p in self.positions.values()]
+        span = max(max(xs) - min(xs), max(ys) - min(ys)) if xs else 0.0
+        cells_per_side = max(1, int(math.sqrt(len(self.edges))))
+        self.origin_x: float = min(xs) if xs else 0.0
+        self.origin_y: float = min(ys) if ys else 0.0
+        self.cell_size: float = span / cells_per_side if span > 0 else 1.0
+        self.pad: float = 1e-6 * (1.0 + span)
+
+        self.endpoints: List[Tuple[str, str]] = [(edge.source, edge.target) for edge in self.edges]
+        self.incident: Dict[str, List[int]] = {}
+        self._cells: Dict[Tuple[int, int], Set[int]] = {}
+        self._edge_cells: List[List[Tuple[int, int]]] = [[] for _ in self.edges]
+        self._bounds: List[Tuple[float, float, float, float]] = [(0.0, 0.0, 0.0, 0.0) for _ in self.edges]
+        for index, edge in enumerate(self.edges):
+            self.incident.setdefault(edge.source, []).append(index)
+            if edge.target != edge.source:
+                self.incident.setdefault(edge.target, []).append(index)
+            self._register(index)
+
+    def _set_position(self, vid: str, pos: Tuple[float, float]) -> None:
+        self._given[vid] = pos
+        self.positions[vid] = (float(pos[0]), float(pos[1]))
+
+    def _padded_bounds(self, p: Tuple[float, float], q: Tuple[float, float]) -> Tuple[float, float, float, float]:
+        pad = self.pad
+        return (min(p[0], q[0]) - pad, min(p[1], q[1]) - pad, max(p[0], q[0]) + pad, max(p[1], q[1]) + pad)
+
+    def _cells_for(self, bounds: Tuple[float, float, float, float]) -> List[Tuple[int, int]]:
+        size = self.cell_size
+        c0 = int(math.floor((bounds[0] - self.origin_x) / size))
+        c1 = int(math.floor((bounds[2] - self.origin_x) / size))
+        r0 = int(math.floor((bounds[1] - self.origin_y) / size))
+        r1 = int(math.floor((bounds[3] - self.origin_y) / size))
+        return [(c, r) for c in range(c0, c1 + 1) for r in range(r0, r1 + 1)]
+
+    def _register(self, index: int) -> None:
+        edge = self.edges[index]
+        p = self.positions.get(edge.source)
+        q = self.positions.get(edge.target)
+        if p is None or q is None:
+            self._edge_cells[index] = []
+            return
+        bounds = self._padded_bounds(p, q)
+        self._bounds[index] = bounds
+        keys = self._cells_for(bounds)
+        for key in keys:
+            self._cells.setdefault(key, set()).add(index)
+        self._edge_cells[index] = keys
+
+    def _unregister(self, index: int) -> None:
+        for key in self._edge_cells[index]:
+            bucket = self._cells.get(key)
+            if bucket is not None:
+                bucket.discard(index)
+                if not bucket:
+                    del self._cells[key]
+        self._edge_cells[index] = []
+
+    def move_vertex(self, vid: str, pos: Tuple[float, float]) -> None:
+        """Move one vertex and re-register only the edges incident to it."""
+        self._set_position(vid, pos)
+        for index in self.incident.get(vid, []):
+            self._unregister(index)
+            self._register(index)
+
+    def sync(self, positions: Mapping[str, Tuple[float, float]]) -> None:
+        """Apply any vertex moves made directly on ``positions`` since the last sync."""
+        for vid in positions:
+            pos = positions[vid]
+            if self._given.get(vid) != pos:
+                self.move_vertex(vid, pos)
+
+    def nearby(self, p: Tuple[float, float], q: Tuple[float, float]) -> Set[int]:
+        """Indices of edges whose padded bounding boxes overlap that of segment p-q."""
+        min_x, min_y, max_x, max_y = query = self._padded_bounds(p, q)
+        found: Set[int] = set()
+        for key in self._cells_for(query):
+            bucket = self._cells.get(key)
+            if bucket:
+                found |= bucket
+        bounds = self._bounds
+        return {
+            j
+            for j in found
+            if bounds[j][0] <= max_x and bounds[j][2] >= min_x and bounds[j][1] <= max_y and bounds[j][3] >= min_y
+        }
+
+
+def _edges_conflict(
+    e1: Edge[str],
+    e2: Edge[str],
+    p1: Tuple[float, float],
+    p2: Tuple[float, float],
+    p3: Tuple[float, float],
+    p4: Tuple[float, float],
+) -> bool:
+    """Check whether two placed edges cross, overlap collinearly, or overlap at a shared vertex."""
+    # Check if edges share a vertex
+    shares_vertex = e1.source in (e2.source, e2.target) or e1.target in (e2.source, e2.target)
+
+    if shares_vertex:
+        # Check for adjacent edge overlap
+        return _adjacent_edges_overlap(p1, p2, p3, p4)
+    # Check for crossing OR collinear overlap
+    return GraphUtils.segments_cross(p1, p2, p3, p4) or _edges_collinear_overlap(p1, p2, p3, p4)
+
+
+def _grid_crossings_and_overlaps(
+    grid: _SegmentGrid,
+) -> Tuple[List[Tuple[Edge[str], Edge[str]]], int]:
     """
-    Find all pairs of edges that cross or overlap each other.
+    Scan each edge against the edges sharing its grid cells.
 
-    Returns list of (edge1, edge2) tuples where the edges:
-    - Cross at an interior point (non-adjacent edges)
-    - Are collinear and overlap (non-adjacent edges)
-    - Share a vertex but one vertex lies on the other edge (adjacent edges)
+    Returns (crossing_pairs, overlap_count) matching _find_crossing_pairs and
+    GraphUtils.count_edge_overlaps; pairs keep the (i, j) order of a full
+    pairwise scan.
     """
     crossing_pairs: List[Tuple[Edge[str], Edge[str]]] = []
-    edge_list = list(edges)
+    overlaps = 0
+    edge_list = grid.edges
+    positions = grid.positions
 
     for i in range(len(edge_list)):
         e1 = edge_list[i]
@@ -1699,26 +1831,46 @@ def _find_crossing_pairs(
         if p1 is None or p2 is None:
             continue
 
-        for j in range(i + 1, len(edge_list)):
+        for j in sorted(j for j in grid.nearby(p1, p2) if j > i):
             e2 = edge_list[j]
-            p3 = positions.get(e2.source)
-            p4 = positions.get(e2.target)
-            if p3 is None or p4 is None:
-                continue
+            p3 = positions[e2.source]
+            p4 = positions[e2.target]
 
-            # Check if edges share a vertex
-            shares_vertex = e1.source in (e2.source, e2.target) or e1.target in (e2.source, e2.target)
+            if _edges_conflict(e1, e2, p1, p2, p3, p4):
+                crossing_pairs.append((e1, e2))
 
-            if shares_vertex:
-                # Check for adjacent edge overlap
-                if _adjacent_edges_overlap(p1, p2, p3, p4):
-                    crossing_pairs.append((e1, e2))
-            else:
-                # Check for crossing OR collinear overlap
-                if GraphUtils.segments_cross(p1, p2, p3, p4) or _edges_collinear_overlap(p1, p2, p3, p4):
-                    crossing_pairs.append((e1, e2))
+            if e1.source in (e2.source, e2.target) or e1.target in (e2.source, e2.target):
+                if GraphUtils.adjacent_edges_overlap(p1, p2, p3, p4, True):
+                    overlaps += 1
+            elif GraphUtils.edges_overlap(p1, p2, p3, p4):
+                overlaps += 1
 
-    return crossing_pairs
+    return crossing_pairs, overlaps
+
+
+def _crossings_and_overlaps(
+    edges: List[Edge[str]],
+    positions: Dict[str, Tuple[float, float]],
+) -> Tuple[List[Tuple[Edge[str], Edge[str]]], int]:
+    """Return (crossing_pairs, overlap_count) for a layout from one grid-accelerated scan."""
+    return _grid_crossings_and_overlaps(_SegmentGrid(edges, positions))
+
+
+def _find_crossing_pairs(
+    edges: List[Edge[str]],
+    positions: Dict[str, Tuple[float, float]],
+) -> List[Tuple[Edge[str], Edge[str]]]:
+    """
+    Find all pairs of edges that cross or overlap each other.
+
+    Returns list of (edge1, edge2) tuples where the edges:
+    - Cross at an interior point (non-adjacent edges)
+    - Are collinear and overlap (non-adjacent edges)
+    - Share a vertex but one vertex lies on the other edge (adjacent edges)
+
+    Only edges sharing a segment-grid cell are tested against each other.
+    """
+    return _crossings_and_overlaps(edges, positions)[0]
 
 
 def _to_grid_coords(
@@ -1882,6 +2034,7 @@ def _count_crossings_for_vertex(
     edges: List[Edge[str]],
     grid_pos: Dict[str, Tuple[int, int]],
     grid_size: int,
+    index: Optional[_SegmentGrid] = None,
 ) -> int:
     """
     Count how many edge crossings or overlaps would occur if vertex is at the given position.
@@ -1890,50 +2043,61 @@ def _count_crossings_for_vertex(
     - Crossing edges (non-adjacent)
     - Collinear overlapping edges (non-adjacent)
     - Adjacent edge overlaps (vertex on another edge)
-    """
-    # Temporarily set the vertex position
-    old_pos = grid_pos.get(vertex)
-    grid_pos[vertex] = pos
 
-    # Convert to float positions for crossing detection
-    float_pos: Dict[str, Tuple[float, float]] = {}
-    for vid in grid_pos:
-        gpos = grid_pos[vid]
-        float_pos[vid] = (float(gpos[0]), float(gpos[1]))
+    Each incident edge is only tested against edges sharing its grid cells.
+    An index passed in must reflect grid_pos for every vertex but this one;
+    without one, a temporary index is built.
+    """
+    if index is None:
+        index = _SegmentGrid(edges, grid_pos)
 
+    moved = (float(pos[0]), float(pos[1]))
+    positions = index.positions
+    endpoints = index.endpoints
+    incident = index.incident.get(vertex, [])
+    incident_set = set(incident)
     problems = 0
-    incident_edges = [e for e in edges if e.source == vertex or e.target == vertex]
 
-    for e1 in incident_edges:
-        p1 = float_pos.get(e1.source)
-        p2 = float_pos.get(e1.target)
+    for i in incident:
+        s1, t1 = endpoints[i]
+        p1 = moved if s1 == vertex else positions.get(s1)
+        p2 = moved if t1 == vertex else positions.get(t1)
         if p1 is None or p2 is None:
             continue
+        dx = p2[0] - p1[0]
+        dy = p2[1] - p1[1]
 
-        for e2 in edges:
-            if e1 == e2:
+        # Incident edges are indexed at the vertex's old position, so test them all
+        for j in index.nearby(p1, p2) | incident_set:
+            s2, t2 = endpoints[j]
+            if s1 == s2 and t1 == t2:
                 continue
 
-            p3 = float_pos.get(e2.source)
-            p4 = float_pos.get(e2.target)
+            p3 = moved if s2 == vertex else positions.get(s2)
+            p4 = moved if t2 == vertex else positions.get(t2)
             if p3 is None or p4 is None:
                 continue
 
-            # Check if edges share a vertex
-            shares_vertex = e1.source in (e2.source, e2.target) or e1.target in (e2.source, e2.target)
-
-            if shares_vertex:
-                # Check for adjacent edge overlap (vertex on segment)
-                if _adjacent_edges_overlap(p1, p2, p3, p4):
-                    problems += 1
+            # Grid coordinates are integers, so these orientations are exact. Edges with
+            # one strictly on one side of the other's line can neither cross, overlap,
+            # nor touch, and edges sharing a vertex only overlap when all are collinear.
+            side3 = dx * (p3[1] - p1[1]) - dy * (p3[0] - p1[0])
+            side4 = dx * (p4[1] - p1[1]) - dy * (p4[0] - p1[0])
+            if s1 in (s2, t2) or t1 in (s2, t2):
+                if side3 != 0 or side4 != 0:
+                    continue
+            elif (side3 > 0 and side4 > 0) or (side3 < 0 and side4 < 0):
+                continue
             else:
-                # Check for crossing OR collinear overlap
-                if GraphUtils.segments_cross(p1, p2, p3, p4) or _edges_collinear_overlap(p1, p2, p3, p4):
-                    problems += 1
+                ex = p4[0] - p3[0]
+                ey = p4[1] - p3[1]
+                side1 = ex * (p1[1] - p3[1]) - ey * (p1[0] - p3[0])
+                side2 = ex * (p2[1] - p3[1]) - ey * (p2[0] - p3[0])
+                if (side1 > 0 and side2 > 0) or (side1 < 0 and side2 < 0):
+                    continue
 
-    # Restore old position
-    if old_pos is not None:
-        grid_pos[vertex] = old_pos
+            if _edges_conflict(index.edges[i], index.edges[j], p1, p2, p3, p4):
+                problems += 1
 
     return problems
 
@@ -1981,6 +2145,7 @@ def _score_position(
     edges: List[Edge[str]],
     grid_pos: Dict[str, Tuple[int, int]],
     grid_size: int,
+    index: Optional[_SegmentGrid] = None,
 ) -> Tuple[int, int]:
     """
     Score a position for a vertex.
@@ -1989,7 +2154,7 @@ def _score_position(
     - First priority: minimize crossings
     - Second priority: maximize orthogonal edges (negative for sorting)
     """
-    crossings = _count_crossings_for_vertex(vertex, pos, edges, grid_pos, grid_size)
+    crossings = _count_crossings_for_vertex(vertex, pos, edges, grid_pos, grid_size, index)
 
     # Temporarily set position to count orthogonal edges
     old_pos = grid_pos.get(vertex)
@@ -2008,6 +2173,7 @@ def _find_best_position(
     grid_size: int,
     search_radius: int = 3,
     optimize_orthogonality: bool = True,
+    index: Optional[_SegmentGrid] = None,
 ) -> Tuple[int, int]:
     """
     Find the best grid position for a vertex.
@@ -2017,14 +2183,20 @@ def _find_best_position(
     2. Maximum orthogonal edges (secondary, if optimize_orthogonality=True)
 
     Searches positions within search_radius of the current position.
+    A shared index is brought up to date with grid_pos before scoring.
     """
     current_pos = grid_pos.get(vertex)
     if current_pos is None:
         return (0, 0)
 
+    if index is None:
+        index = _SegmentGrid(edges, grid_pos)
+    else:
+        index.sync(grid_pos)
+
     current_col = int(current_pos[0])
     current_row = int(current_pos[1])
-    current_score = _score_position(vertex, current_pos, edges, grid_pos, grid_size)
+    current_score = _score_position(vertex, current_pos, edges, grid_pos, grid_size, index)
 
     best_pos = current_pos
     best_score = current_score
@@ -2052,7 +2224,7 @@ def _find_best_position(
                 continue
 
             new_pos = (new_col, new_row)
-            score = _score_position(vertex, new_pos, edges, grid_pos, grid_size)
+            score = _score_position(vertex, new_pos, edges, grid_pos, grid_size, index)
             candidates.append((new_pos, score))
 
     # Find best candidate
@@ -2102,6 +2274,7 @@ def _find_best_crossing_move(
     grid_size: int,
     box: Dict[str, float],
     best_crossing_count: int,
+    index: Optional[_SegmentGrid] = None,
 ) -> Optional[Tuple[str, Tuple[int, int], int]]:
     """
     Find the best vertex move to eliminate a crossing/overlap.
@@ -2118,7 +2291,7 @@ def _find_best_crossing_move(
 
     # Track current state
     current_float_pos = _from_grid_coords(grid_pos, box, grid_size)
-    current_overlaps = GraphUtils.count_edge_overlaps(edges, current_float_pos)
+    current_overlaps = _crossings_and_overlaps(edges, current_float_pos)[1]
     current_global_ortho = _count_total_orthogonal_grid(edges, grid_pos)
 
     best_move = None
@@ -2127,13 +2300,13 @@ def _find_best_crossing_move(
 
     for v in involved:
         old_pos = grid_pos[v]
-        new_pos = _find_best_position(v, edges, grid_pos, grid_size, optimize_orthogonality=True)
+        new_pos = _find_best_position(v, edges, grid_pos, grid_size, optimize_orthogonality=True, index=index)
 
         if new_pos != old_pos:
             grid_pos[v] = new_pos
             new_float_pos = _from_grid_coords(grid_pos, box, grid_size)
-            new_crossing_count = len(_find_crossing_pairs(edges, new_float_pos))
-            new_overlaps = GraphUtils.count_edge_overlaps(edges, new_float_pos)
+            new_pairs, new_overlaps = _crossings_and_overlaps(edges, new_float_pos)
+            new_crossing_count = len(new_pairs)
             new_global_ortho = _count_total_orthogonal_grid(edges, grid_pos)
             grid_pos[v] = old_pos
 
@@ -2167,6 +2340,7 @@ def _try_expanded_search(
     grid_size: int,
     box: Dict[str, float],
     best_crossing_count: int,
+    index: Optional[_SegmentGrid] = None,
 ) -> Tuple[bool, int, Dict[str, Tuple[int, int]]]:
     """
     Try to reduce crossings/overlaps using expanded search radius.
@@ -2177,18 +2351,18 @@ def _try_expanded_search(
     """
     best_grid_pos = dict(grid_pos)
     current_float_pos = _from_grid_coords(grid_pos, box, grid_size)
-    current_overlaps = GraphUtils.count_edge_overlaps(edges, current_float_pos)
+    current_overlaps = _crossings_and_overlaps(edges, current_float_pos)[1]
     current_global_ortho = _count_total_orthogonal_grid(edges, grid_pos)
 
     for v in vertex_ids:
         old_pos = grid_pos[v]
-        new_pos = _find_best_position(v, edges, grid_pos, grid_size, search_radius=grid_size // 2)
+        new_pos = _find_best_position(v, edges, grid_pos, grid_size, search_radius=grid_size // 2, index=index)
 
         if new_pos != old_pos:
             grid_pos[v] = new_pos
             new_float_pos = _from_grid_coords(grid_pos, box, grid_size)
-            new_crossing_count = len(_find_crossing_pairs(edges, new_float_pos))
-            new_overlaps = GraphUtils.count_edge_overlaps(edges, new_float_pos)
+            new_pairs, new_overlaps = _crossings_and_overlaps(edges, new_float_pos)
+            new_crossing_count = len(new_pairs)
             new_global_ortho = _count_total_orthogonal_grid(edges, grid_pos)
 
             ortho_loss = current_global_ortho - new_global_ortho
@@ -2225,6 +2399,8 @@ def _phase1_eliminate_crossings(
     """
     best_grid_pos = dict(grid_pos)
     best_crossing_count = len(_find_crossing_pairs(edges, _from_grid_coords(grid_pos, box, grid_size)))
+    # One segment index for the whole phase; candidate searches sync it with grid_pos
+    index = _SegmentGrid(edges, grid_pos)
 
     for iteration in range(max_iterations):
         float_pos = _from_grid_coords(grid_pos, box, grid_size)
@@ -2236,7 +2412,9 @@ def _phase1_eliminate_crossings(
         improved = False
 
         for crossing_pair in crossing_pairs:
-            best_move = _find_best_crossing_move(crossing_pair, grid_pos, edges, grid_size, box, best_crossing_count)
+            best_move = _find_best_crossing_move(
+                crossing_pair, grid_pos, edges, grid_size, box, best_crossing_count, index
+            )
 
             if best_move is not None:
                 v = best_move[0]
@@ -2252,7 +2430,7 @@ def _phase1_eliminate_crossings(
             continue
 
         # Try expanded search
-        expanded_result = _try_expanded_search(vertex_ids, grid_pos, edges, grid_size, box, best_crossing_count)
+        expanded_result = _try_expanded_search(vertex_ids, grid_pos, edges, grid_size, box, best_crossing_count, index)
         improved = expanded_result[0]
         best_crossing_count = expanded_result[1]
         best_grid_pos = expanded_result[2]
@@ -2272,13 +2450,14 @@ def _try_ortho_position(
     edges: List[Edge[str]],
     grid_size: int,
     best_ortho_count: int,
+    index: Optional[_SegmentGrid] = None,
 ) -> Tuple[Tuple[int, int], int]:
     """
     Try a position for orthogonality optimization.
 
     Returns (best_pos, best_ortho_count).
     """
-    crossings = _count_crossings_for_vertex(v, new_pos, edges, grid_pos, grid_size)
+    crossings = _count_crossings_for_vertex(v, new_pos, edges, grid_pos, grid_size, index)
     if crossings > 0:
         return old_pos, best_ortho_count
 
@@ -2298,6 +2477,7 @@ def _search_nearby_ortho_positions(
     edges: List[Edge[str]],
     grid_size: int,
     occupied: Set[Tuple[int, int]],
+    index: Optional[_SegmentGrid] = None,
 ) -> Tuple[Tuple[int, int], int]:
     """Search nearby positions for orthogonality improvement."""
     old_col = int(old_pos[0])
@@ -2319,7 +2499,9 @@ def _search_nearby_ortho_positions(
                 continue
 
             new_pos = (new_col, new_row)
-            ortho_result = _try_ortho_position(v, new_pos, best_ortho_pos, grid_pos, edges, grid_size, best_ortho_count)
+            ortho_result = _try_ortho_position(
+                v, new_pos, best_ortho_pos, grid_pos, edges, grid_size, best_ortho_count, index
+            )
             best_ortho_pos = ortho_result[0]
             best_ortho_count = ortho_result[1]
 
@@ -2336,6 +2518,7 @@ def _search_neighbor_aligned_positions(
     old_pos: Tuple[int, int],
     best_ortho_pos: Tuple[int, int],
     best_ortho_count: int,
+    index: Optional[_SegmentGrid] = None,
 ) -> Tuple[Tuple[int, int], int]:
     """Search positions aligned with neighbors for orthogonality improvement."""
     for neighbor in adjacency[v]:
@@ -2348,7 +2531,9 @@ def _search_neighbor_aligned_positions(
             if (test_col, n_row) in occupied or (test_col, n_row) == old_pos:
                 continue
             new_pos = (test_col, n_row)
-            ortho_result = _try_ortho_position(v, new_pos, best_ortho_pos, grid_pos, edges, grid_size, best_ortho_count)
+            ortho_result = _try_ortho_position(
+                v, new_pos, best_ortho_pos, grid_pos, edges, grid_size, best_ortho_count, index
+            )
             best_ortho_pos = ortho_result[0]
             best_ortho_count = ortho_result[1]
 
@@ -2357,7 +2542,9 @@ def _search_neighbor_aligned_positions(
             if (n_col, test_row) in occupied or (n_col, test_row) == old_pos:
                 continue
             new_pos = (n_col, test_row)
-            ortho_result = _try_ortho_position(v, new_pos, best_ortho_pos, grid_pos, edges, grid_size, best_ortho_count)
+            ortho_result = _try_ortho_position(
+                v, new_pos, best_ortho_pos, grid_pos, edges, grid_size, best_ortho_count, index
+            )
             best_ortho_pos = ortho_result[0]
             best_ortho_count = ortho_result[1]
 
@@ -2384,6 +2571,7 @@ def _phase2_optimize_orthogonality(
         adjacency[e.target].append(e.source)
 
     best_grid_pos = dict(grid_pos)
+    index = _SegmentGrid(edges, grid_pos)
 
     for ortho_iter in range(max_iterations):
         improved = False
@@ -2393,19 +2581,20 @@ def _phase2_optimize_orthogonality(
             occupied = {grid_pos[vid] for vid in grid_pos if vid != v}
 
             # Strategy 1: Search nearby positions
-            search_result = _search_nearby_ortho_positions(v, old_pos, grid_pos, edges, grid_size, occupied)
+            search_result = _search_nearby_ortho_positions(v, old_pos, grid_pos, edges, grid_size, occupied, index)
             best_ortho_pos = search_result[0]
             best_ortho_count = search_result[1]
 
             # Strategy 2: Try aligning with each neighbor
             align_result = _search_neighbor_aligned_positions(
-                v, adjacency, grid_pos, edges, grid_size, occupied, old_pos, best_ortho_pos, best_ortho_count
+                v, adjacency, grid_pos, edges, grid_size, occupied, old_pos, best_ortho_pos, best_ortho_count, index
             )
             best_ortho_pos = align_result[0]
             best_ortho_count = align_result[1]
 
             if best_ortho_pos != old_pos:
                 grid_pos[v] = best_ortho_pos
+                index.move_vertex(v, best_ortho_pos)
                 best_grid_pos = dict(grid_pos)
                 improved = True
 
@@ -2580,6 +2769,7 @@ def _try_edge_eq_position(
     grid_size: int,
     best_new_variance: float,
     require_no_crossings: bool = True,
+    index: Optional[_SegmentGrid] = None,
 ) -> Tuple[Tuple[int, int], float]:
     """
     Try a position for edge length equalization.
@@ -2589,7 +2779,7 @@ def _try_edge_eq_position(
     grid_pos[vid] = test_pos
 
     if require_no_crossings:
-        crossings = _count_crossings_for_vertex(vid, test_pos, edges, grid_pos, grid_size)
+        crossings = _count_crossings_for_vertex(vid, test_pos, edges, grid_pos, grid_size, index)
         if crossings > 0:
             grid_pos[vid] = old_pos
             return old_pos, best_new_variance
@@ -2672,6 +2862,7 @@ def _equalize_edge_lengths(
     best_variance = initial_variance
     positions_tried = 0
     improvements_found = 0
+    index = _SegmentGrid(edges, grid_pos)
 
     for iteration in range(max_iterations):
         improved = False
@@ -2704,7 +2895,7 @@ def _equalize_edge_lengths(
                             if test_ortho >= current_ortho:
                                 positions_tried += 1
                                 eq_result = _try_edge_eq_position(
-                                    vid, test_pos, old_pos, grid_pos, edges, grid_size, best_new_variance
+                                    vid, test_pos, old_pos, grid_pos, edges, grid_size, best_new_variance, index=index
                                 )
                                 result_pos = eq_result[0]
                                 result_var = eq_result[1]
@@ -2720,7 +2911,7 @@ def _equalize_edge_lengths(
                             if test_ortho >= current_ortho:
                                 positions_tried += 1
                                 eq_result = _try_edge_eq_position(
-                                    vid, test_pos, old_pos, grid_pos, edges, grid_size, best_new_variance
+                                    vid, test_pos, old_pos, grid_pos, edges, grid_size, best_new_variance, index=index
                                 )
                                 result_pos = eq_result[0]
                                 result_var = eq_result[1]
@@ -2740,7 +2931,7 @@ def _equalize_edge_lengths(
                     if test_ortho >= current_ortho:
                         positions_tried += 1
                         eq_result = _try_edge_eq_position(
-                            vid, test_pos, old_pos, grid_pos, edges, grid_size, best_new_variance
+                            vid, test_pos, old_pos, grid_pos, edges, grid_size, best_new_variance, index=index
                         )
                         result_pos = eq_result[0]
                         result_var = eq_result[1]
@@ -2756,7 +2947,7 @@ def _equalize_edge_lengths(
                     if test_ortho >= current_ortho:
                         positions_tried += 1
                         eq_result = _try_edge_eq_position(
-                            vid, test_pos, old_pos, grid_pos, edges, grid_size, best_new_variance
+                            vid, test_pos, old_pos, grid_pos, edges, grid_size, best_new_variance, index=index
                         )
                         result_pos = eq_result[0]
                         result_var = eq_result[1]
@@ -2766,6 +2957,7 @@ def _equalize_edge_lengths(
 
             if best_new_pos != old_pos and best_new_variance < best_variance:
                 grid_pos[vid] = best_new_pos
+                index.move_vertex(vid, best_new_pos)
                 best_pos = dict(grid_pos)
                 best_variance = best_new_variance
                 improved = True
@@ -3086,12 +3278,26 @@ def _assign_tree_positions(
 # Force-Directed Layout (Fruchterman-Reingold Style)
 # =============================================================================
 
+# Vertex count at which the default switches from exact to Barnes-Hut repulsion
+BARNES_HUT_MIN_VERTICES = 200
+# Opening criterion: cells narrower than theta times their distance are approximated.
+# Kept below 1/sqrt(2) so no cell is approximated from a vertex inside it.
+DEFAULT_BARNES_HUT_THETA = 0.7
+# Quadtree cells with this many vertices or fewer are leaves summed exactly
+BARNES_HUT_LEAF_SIZE = 4
+# Depth limit so coincident vertices cannot recurse forever
+BARNES_HUT_MAX_DEPTH = 24
+# Barnes-Hut layouts stop once no vertex moves more than this fraction of the ideal edge length
+CONVERGENCE_TOLERANCE = 1e-3
+
 
 def _force_directed_layout(
     vertex_ids: List[str],
     edges: List[Edge[str]],
     box: Dict[str, float],
     iterations: int = 100,
+    theta: Optional[float] = None,
+    tolerance: Optional[float] = None,
 ) -> Dict[str, Tuple[float, float]]:
     """
     Spring-electrical model for general graph layout.
@@ -3099,11 +3305,18 @@ def _force_directed_layout(
     Algorithm (Fruchterman-Reingold):
     1. Initialize positions (circular, scaled to 80% of box)
     2. Each iteration:
-       a. Compute repulsion between all pairs (k²/d)
+       a. Compute repulsion between all pairs (k²/d), or approximate it
+          with a Barnes-Hut quadtree when theta > 0
        b. Compute attraction along edges (d/k)
        c. Apply displacement capped by temperature
        d. Cool temperature (simulated annealing)
     3. Clamp positions to bounding box with margin
+
+    theta=None picks exact repulsion below BARNES_HUT_MIN_VERTICES and
+    DEFAULT_BARNES_HUT_THETA above it; theta=0 forces the exact O(n²) sum.
+    In Barnes-Hut mode iteration stops early once no vertex moves more than
+    tolerance (by default CONVERGENCE_TOLERANCE times the ideal edge length
+    k); exact mode always runs every iteration, as before.
     """
     n = len(vertex_ids)
     if n == 0:
@@ -3124,123 +3337,239 @@ def _force_directed_layout(
     }
 
     # Initialize with circular layout in inner box
-    positions = _circular_layout(vertex_ids, inner_box)
+    initial = _circular_layout(vertex_ids, inner_box)
+    xs = [float(initial[vid][0]) for vid in vertex_ids]
+    ys = [float(initial[vid][1]) for vid in vertex_ids]
+
+    slot = {vid: i for i, vid in enumerate(vertex_ids)}
+    edge_slots = [(slot[e.source], slot[e.target]) for e in edges if e.source in slot and e.target in slot]
 
     # Optimal distance between nodes (Fruchterman-Reingold)
     area = inner_box["width"] * inner_box["height"]
     k = math.sqrt(area / n) * 0.75
 
+    if theta is None:
+        theta = DEFAULT_BARNES_HUT_THETA if n >= BARNES_HUT_MIN_VERTICES else 0.0
+    if tolerance is None:
+        tolerance = k * CONVERGENCE_TOLERANCE
+
     # Simulated annealing: start with larger movements, cool down
     temp = min(inner_box["width"], inner_box["height"]) / 5.0
     min_temp = temp * 0.01
     cooling_factor = (min_temp / temp) ** (1.0 / iterations)
 
     for _ in range(iterations):
-        displacement = _compute_forces(vertex_ids, edges, positions, k)
-        positions = _apply_displacement(vertex_ids, positions, displacement, temp, inner_box)
+        if theta > 0:
+            disp_x, disp_y = _barnes_hut_repulsion(xs, ys, k, theta)
+        else:
+            disp_x, disp_y = _exact_repulsion(xs, ys, k)
+        _add_attraction(xs, ys, edge_slots, k, disp_x, disp_y)
+        max_move = _apply_displacement(xs, ys, disp_x, disp_y, temp, inner_box)
         temp *= cooling_factor
+        if theta > 0 and max_move < tolerance:
+            break
 
-    return positions
+    return {vid: (xs[i], ys[i]) for i, vid in enumerate(vertex_ids)}
 
 
-def _compute_forces(
-    vertex_ids: List[str],
-    edges: List[Edge[str]],
-    positions: Dict[str, Tuple[float, float]],
-    k: float,
-) -> Dict[str, Tuple[float, float]]:
+def _exact_repulsion(xs: List[float], ys: List[float], k: float) -> Tuple[List[float], List[float]]:
     """
-    Compute net force on each vertex from repulsion and attraction.
+    Repulsion between all pairs with force k²/distance (Coulomb-like).
 
-    Repulsion: All pairs repel with force k²/distance (Coulomb-like)
-    Attraction: Connected pairs attract with force distance/k (spring-like)
+    Returns per-vertex displacement arrays (disp_x, disp_y).
     """
-    displacement: Dict[str, Tuple[float, float]] = {vid: (0.0, 0.0) for vid in vertex_ids}
+    n = len(xs)
+    k_sq = k * k
+    disp_x = [0.0] * n
+    disp_y = [0.0] * n
 
-    # Repulsion between all pairs
-    for i, v1 in enumerate(vertex_ids):
-        pos1 = positions[v1]
-        x1 = float(pos1[0])
-        y1 = float(pos1[1])
-        for v2 in vertex_ids[i + 1 :]:
-            pos2 = positions[v2]
-            x2 = float(pos2[0])
-            y2 = float(pos2[1])
-            vec = _vector_between(x1, y1, x2, y2)
-            dx = vec[0]
-            dy = vec[1]
-            dist = vec[2]
+    for i in range(n):
+        x1 = xs[i]
+        y1 = ys[i]
+        for j in range(i + 1, n):
+            dx = x1 - xs[j]
+            dy = y1 - ys[j]
+            dist = math.sqrt(dx * dx + dy * dy)
+            if dist < 0.01:
+                dist = 0.01
+                dx = 0.01
 
             # Repulsion: inversely proportional to distance
-            repulsion = (k * k) / (dist * dist + 0.1)
+            repulsion = k_sq / (dist * dist + 0.1)
             fx = (dx / dist) * repulsion
             fy = (dy / dist) * repulsion
 
-            d1 = displacement[v1]
-            d2 = displacement[v2]
-            displacement[v1] = (d1[0] + fx, d1[1] + fy)
-            displacement[v2] = (d2[0] - fx, d2[1] - fy)
+            disp_x[i] += fx
+            disp_y[i] += fy
+            disp_x[j] -= fx
+            disp_y[j] -= fy
 
-    # Attraction along edges
-    for edge in edges:
-        if edge.source not in positions or edge.target not in positions:
-            continue
-        pos1 = positions[edge.source]
-        pos2 = positions[edge.target]
-        x1 = float(pos1[0])
-        y1 = float(pos1[1])
-        x2 = float(pos2[0])
-        y2 = float(pos2[1])
-        vec = _vector_between(x2, y2, x1, y1)  # Note: reversed for attraction
-        dx = vec[0]
-        dy = vec[1]
-        dist = vec[2]
+    return disp_x, disp_y
 
+
+def _barnes_hut_repulsion(
+    xs: List[float],
+    ys: List[float],
+    k: float,
+    theta: float,
+) -> Tuple[List[float], List[float]]:
+    """
+    Approximate all-pairs repulsion with a Barnes-Hut quadtree.
+
+    The tree is rebuilt from the flat coordinate arrays on every call. A
+    cell of width s at distance d from a vertex is treated as one body of
+    its total mass at its centre of mass when s / d < theta and the vertex
+    lies outside the cell; leaves and other cells are opened, down to the
+    exact pairwise force.
+    """
+    n = len(xs)
+    k_sq = k * k
+    disp_x = [0.0] * n
+    disp_y = [0.0] * n
+
+    # Flat node arrays: centre of mass, mass, cell corner and width, children, leaf bodies
+    node_x: List[float] = []
+    node_y: List[float] = []
+    node_mass: List[int] = []
+    node_x0: List[float] = []
+    node_y0: List[float] = []
+    node_size: List[float] = []
+    node_children: List[List[int]] = []
+    node_bodies: List[List[int]] = []
+
+    min_x = min(xs)
+    min_y = min(ys)
+    size = max(max(xs) - min_x, max(ys) - min_y, 1e-9)
+
+    def build(indices: List[int], x0: float, y0: float, width: float, depth: int) -> int:
+        node = len(node_mass)
+        mass = len(indices)
+        node_x.append(sum(xs[i] for i in indices) / mass)
+        node_y.append(sum(ys[i] for i in indices) / mass)
+        node_mass.append(mass)
+        node_x0.append(x0)
+        node_y0.append(y0)
+        node_size.append(width)
+        node_children.append([])
+        node_bodies.append([])
+        if mass <= BARNES_HUT_LEAF_SIZE or depth >= BARNES_HUT_MAX_DEPTH:
+            node_bodies[node] = indices
+            return node
+
+        half = width / 2
+        mid_x = x0 + half
+        mid_y = y0 + half
+        quadrants: List[List[int]] = [[], [], [], []]
+        for i in indices:
+            quadrants[(2 if ys[i] >= mid_y else 0) + (1 if xs[i] >= mid_x else 0)].append(i)
+        children: List[int] = []
+        for q in range(4):
+            if quadrants[q]:
+                qx = mid_x if q & 1 else x0
+                qy = mid_y if q & 2 else y0
+                children.append(build(quadrants[q], qx, qy, half, depth + 1))
+        node_children[node] = children
+        return node
+
+    build(list(range(n)), min_x, min_y, size, 0)
+    theta_sq = theta * theta
+
+    for i in range(n):
+        x1 = xs[i]
+        y1 = ys[i]
+        fx_total = 0.0
+        fy_total = 0.0
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            bodies = node_bodies[node]
+            if bodies:
+                for j in bodies:
+                    if j == i:
+                        continue
+                    dx = x1 - xs[j]
+                    dy = y1 - ys[j]
+                    dist = math.sqrt(dx * dx + dy * dy)
+                    if dist < 0.01:
+                        dist = 0.01
+                        dx = 0.01
+                    repulsion = k_sq / (dist * dist + 0.1)
+                    fx_total += (dx / dist) * repulsion
+                    fy_total += (dy / dist) * repulsion
+                continue
+
+            dx = x1 - node_x[node]
+            dy = y1 - node_y[node]
+            dist_sq = dx * dx + dy * dy
+            width = node_size[node]
+            x0 = node_x0[node]
+            y0 = node_y0[node]
+            inside = x0 <= x1 <= x0 + width and y0 <= y1 <= y0 + width
+            if not inside and width * width < theta_sq * dist_sq:
+                # Far enough away: the whole cell acts as one body at its centre of mass
+                dist = math.sqrt(dist_sq)
+                repulsion = node_mass[node] * k_sq / (dist_sq + 0.1)
+                fx_total += (dx / dist) * repulsion
+                fy_total += (dy / dist) * repulsion
+            else:
+                stack.extend(node_children[node])
+        disp_x[i] = fx_total
+        disp_y[i] = fy_total
+
+    return disp_x, disp_y
+
+
+def _add_attraction(
+    xs: List[float],
+    ys: List[float],
+    edge_slots: List[Tuple[int, int]],
+    k: float,
+    disp_x: List[float],
+    disp_y: List[float],
+) -> None:
+    """Add spring attraction (distance/k) along edges to the displacement arrays."""
+    for source, target in edge_slots:
+        dx = xs[target] - xs[source]
+        dy = ys[target] - ys[source]
+        dist = math.sqrt(dx * dx + dy * dy)
         if dist < 0.01:
-            continue
+            dist = 0.01
+            dx = 0.01
 
         # Attraction: proportional to distance (spring)
         attraction = dist / k
         fx = (dx / dist) * attraction
         fy = (dy / dist) * attraction
 
-        d1 = displacement[edge.source]
-        d2 = displacement[edge.target]
-        displacement[edge.source] = (d1[0] + fx, d1[1] + fy)
-        displacement[edge.target] = (d2[0] - fx, d2[1] - fy)
-
-    return displacement
-
-
-def _vector_between(x1: float, y1: float, x2: float, y2: float) -> Tuple[float, float, float]:
-    """Compute (dx, dy, distance) from point 2 to point 1, with minimum distance clamping."""
-    dx = x1 - x2
-    dy = y1 - y2
-    dist = math.sqrt(dx * dx + dy * dy)
-    if dist < 0.01:
-        dist = 0.01
-        dx = 0.01
-    return dx, dy, dist
+        disp_x[source] += fx
+        disp_y[source] += fy
+        disp_x[target] -= fx
+        disp_y[target] -= fy
 
 
 def _apply_displacement(
-    vertex_ids: List[str],
-    positions: Dict[str, Tuple[float, float]],
-    displacement: Dict[str, Tuple[float, float]],
+    xs: List[float],
+    ys: List[float],
+    disp_x: List[float],
+    disp_y: List[float],
     temp: float,
     box: Dict[str, float],
-) -> Dict[str, Tuple[float, float]]:
+) -> float:
     """
-    Apply displacement to positions, capped by temperature and clamped to box.
+    Apply displacement in place, capped by temperature and clamped to box.
 
     Temperature limits maximum movement per iteration (simulated annealing).
+    Returns the largest distance any vertex actually moved.
     """
-    new_positions: Dict[str, Tuple[float, float]] = {}
+    min_x = box["x"]
+    max_x = box["x"] + box["width"]
+    min_y = box["y"]
+    max_y = box["y"] + box["height"]
+    max_move = 0.0
 
-    for vid in vertex_ids:
-        disp = displacement[vid]
-        dx = float(disp[0])
-        dy = float(disp[1])
+    for i in range(len(xs)):
+        dx = disp_x[i]
+        dy = disp_y[i]
         disp_len = math.sqrt(dx * dx + dy * dy)
 
         # Cap displacement by temperature
@@ -3250,11 +3579,14 @@ def _apply_displacement(
             dy = (dy / disp_len) * capped
 
         # Apply and clamp to box
-        pos = positions[vid]
-        x = float(pos[0])
-        y = float(pos[1])
-        new_x = max(box["x"], min(box["x"] + box["width"], x + dx))
-        new_y = max(box["y"], min(box["y"] + box["height"], y + dy))
-        new_positions[vid] = (new_x, new_y)
-
-    return new_positions
+        x = xs[i]
+        y = ys[i]
+        new_x = max(min_x, min(max_x, x + dx))
+        new_y = max(min_y, min(max_y, y + dy))
+        move = max(abs(new_x - x), abs(new_y - y))
+        if move > max_move:
+            max_move = move
+        xs[i] = new_x
+        ys[i] = new_y
+
+    return max_move
@@ -38,7 +38,7 @@ import json
 import math
 import random
 import statistics
-from typing import Any, Dict, List, Optional, Sequence, Set, Tuple, Union
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple, Union, cast
 
 from browser import window
 
@@ -1085,6 +1085,37 @@ class MathUtils:
         "p_series_test",
     }
 
+    # Prepared evaluate() inputs keyed by the raw expression, oldest first (LRU order)
+    EVALUATE_CACHE_SIZE = 256
+    _evaluate_cache: Dict[str, Tuple[bool, Any]] = {}
+
+    @staticmethod
+    def _prepare_evaluation(expression: str) -> Tuple[bool, Any]:
+        """Normalize, validate and compile ``expression`` once for evaluate().
+
+        Returns ``(True, CompiledExpression)`` for Python-only (number theory)
+        expressions, otherwise ``(False, mathjs compiled node)``. Failures raise
+        and are not cached, so repeated bad input reports the same error.
+        """
+        cache = MathUtils._evaluate_cache
+        prepared = cache.pop(expression, None)
+        if prepared is None:
+            from expression_validator import ExpressionValidator
+
+            python_expression = ExpressionValidator.fix_math_expression(expression, python_compatible=True)
+            compiled = ExpressionValidator.compile_normalized(python_expression, "x")
+            # Check if expression contains Python-only functions (number theory)
+            if any(func in expression for func in MathUtils._PYTHON_ONLY_FUNCTIONS):
+                prepared = (True, compiled)
+            else:
+                js_expression = ExpressionValidator.fix_math_expression(expression, python_compatible=False)
+                js_expression = js_expression.replace("arrangements(", "permutations(")
+                prepared = (False, window.math.compile(js_expression))
+        cache[expression] = prepared
+        while len(cache) > max(1, MathUtils.EVALUATE_CACHE_SIZE):
+            del cache[next(iter(cache))]
+        return cast(Tuple[bool, Any], prepared)
+
     @staticmethod
     def evaluate(expression: str, variables: Optional[Dict[str, Number]] = None) -> Any:
         """Evaluate a mathematical expression numerically with optional variables.
@@ -1101,18 +1132,10 @@ class MathUtils:
             float or str: Numerical result or error message if evaluation fails
         """
         try:
-            from expression_validator import ExpressionValidator
-
-            js_expression = ExpressionValidator.fix_math_expression(expression, python_compatible=False)
-            python_expression = ExpressionValidator.fix_math_expression(expression, python_compatible=True)
-            ExpressionValidator.validate_expression_tree(python_expression)
-
-            # Check if expression contains Python-only functions (number theory)
-            if any(func in expression for func in MathUtils._PYTHON_ONLY_FUNCTIONS):
+            prepared = MathUtils._prepare_evaluation(expression)
+            if prepared[0]:
                 # Use Python evaluation for number theory functions
-                result = ExpressionValidator.evaluate_expression(
-                    python_expression, variables.get("x", 0) if variables else 0
-                )
+                result = prepared[1].evaluate_raw(variables.get("x", 0) if variables else 0)
                 # Preserve boolean and list types for better display
                 if isinstance(result, bool):
                     return "True" if result else "False"
@@ -1120,12 +1143,10 @@ class MathUtils:
                     return str(result)
                 return result
 
-            js_expression = js_expression.replace("arrangements(", "permutations(")
-
             if not variables:
-                result = window.math.format(window.math.evaluate(js_expression))
+                result = window.math.format(prepared[1].evaluate())
             else:
-                result = window.math.format(window.math.evaluate(js_expression, variables))
+                result = window.math.format(prepared[1].evaluate(variables))
 
             converted_result = MathUtils.try_convert_to_number(result)
 
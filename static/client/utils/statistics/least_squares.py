@@ -0,0 +1,314 @@
+"""Least-squares fitting core for the regression models.
+
+Pure-Python solvers used by utils.statistics.regression. No browser imports —
+fully testable with pytest.
+
+Key Features:
+    - One-pass straight-line fits from Welford co-moments (means and centered
+      sums of squares and cross products)
+    - Streaming linear least squares: rows are folded into an upper-triangular
+      R factor with Givens rotations, so no design matrix or X^T X is formed
+    - Residual and total sums of squares accumulated in the same pass
+    - Polynomial fits on x rescaled to [-1, 1], converted back to monomial
+      coefficients, which keeps higher degrees well conditioned
+    - Levenberg-Marquardt for nonlinear models, accumulating J^T J and J^T r
+      per pass instead of holding the Jacobian
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Callable, Iterable, List, Optional, Sequence, Tuple
+
+# Model callback for Levenberg-Marquardt: (x, params) -> (value, gradient wrt params)
+ModelFunction = Callable[[float, Sequence[float]], Tuple[float, Sequence[float]]]
+
+# Diagonal entries of R below this fraction of the largest one mark a rank-deficient system
+_RANK_TOLERANCE = 1e-10
+
+
+class StreamingLeastSquares:
+    """Incremental QR least-squares accumulator.
+
+    Each ``add_row`` call rotates one observation into the R factor and Q^T y,
+    costing O(p^2) time and O(p^2) memory for p coefficients regardless of the
+    number of rows.
+    """
+
+    def __init__(self, size: int) -> None:
+        if size < 1:
+            raise ValueError("size must be a positive integer")
+        self.size = size
+        self._r: List[List[float]] = [[0.0] * size for _ in range(size)]
+        self._qty: List[float] = [0.0] * size
+        self._residual_sum_squares = 0.0
+        # Welford accumulators for the total sum of squares of y
+        self._count = 0
+        self._y_mean = 0.0
+        self._y_m2 = 0.0
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    def add_row(self, row: Sequence[float], y: float) -> None:
+        """Fold one observation ``row . c ≈ y`` into the factorization."""
+        size = self.size
+        a = [float(value) for value in row]
+        if len(a) != size:
+            raise ValueError(f"Expected a row of length {size}, got {len(a)}")
+        b = float(y)
+
+        self._count += 1
+        delta = b - self._y_mean
+        self._y_mean += delta / self._count
+        self._y_m2 += delta * (b - self._y_mean)
+
+        r = self._r
+        qty = self._qty
+        for j in range(size):
+            aj = a[j]
+            if aj == 0.0:
+                continue
+            r_row = r[j]
+            rjj = r_row[j]
+            if rjj == 0.0:
+                # Empty pivot row: the observation becomes this row of R outright
+                for k in range(j, size):
+                    r_row[k] = a[k]
+                qty[j] = b
+                return
+            norm = math.hypot(rjj, aj)
+            c = rjj / norm
+            s = aj / norm
+            r_row[j] = norm
+            for k in range(j + 1, size):
+                rk = r_row[k]
+                ak = a[k]
+                r_row[k] = c * rk + s * ak
+                a[k] = c * ak - s * rk
+            qb = qty[j]
+            qty[j] = c * qb + s * b
+            b = c * b - s * qb
+        self._residual_sum_squares += b * b
+
+    def add_rows(self, rows: Iterable[Tuple[Sequence[float], float]]) -> None:
+        for row, y in rows:
+            self.add_row(row, y)
+
+    def solve(self) -> List[float]:
+        """Back-substitute R c = Q^T y.
+
+        Raises:
+            ValueError: If the accumulated system is rank deficient
+        """
+        size = self.size
+        r = self._r
+        largest = max(abs(r[i][i]) for i in range(size))
+        if largest == 0.0 or any(abs(r[i][i]) <= largest * _RANK_TOLERANCE for i in range(size)):
+            raise ValueError("Matrix is singular or nearly singular")
+        coefficients = [0.0] * size
+        for i in range(size - 1, -1, -1):
+            total = self._qty[i]
+            r_row = r[i]
+            for k in range(i + 1, size):
+                total -= r_row[k] * coefficients[k]
+            coefficients[i] = total / r_row[i]
+        return coefficients
+
+    def residual_sum_squares(self) -> float:
+        return self._residual_sum_squares
+
+    def total_sum_squares(self) -> float:
+        return self._y_m2
+
+
+def fit_line_least_squares(x_data: Sequence[float], y_data: Sequence[float]) -> Tuple[float, float, float, float]:
+    """Fit ``y = slope*x + intercept`` from centered co-moments in one pass.
+
+    Centered updates avoid the cancellation of the textbook ``n*sum(xx) - sum(x)^2``
+    formula when x has a large offset.
+
+    Returns:
+        (intercept, slope, residual sum of squares, total sum of squares)
+    """
+    count = 0
+    mean_x = 0.0
+    mean_y = 0.0
+    sxx = 0.0
+    sxy = 0.0
+    syy = 0.0
+    for x, y in zip(x_data, y_data):
+        count += 1
+        dx = x - mean_x
+        mean_x += dx / count
+        dy = y - mean_y
+        mean_y += dy / count
+        dy_new = y - mean_y
+        sxx += dx * (x - mean_x)
+        sxy += dx * dy_new
+        syy += dy * dy_new
+    if sxx <= 0.0:
+        raise ValueError("Matrix is singular or nearly singular")
+    slope = sxy / sxx
+    residual = max(0.0, syy - slope * sxy)
+    return mean_y - slope * mean_x, slope, residual, syy
+
+
+def _binomial_rows(degree: int) -> List[List[int]]:
+    rows = [[1]]
+    for n in range(1, degree + 1):
+        previous = rows[-1]
+        rows.append([1] + [previous[k - 1] + previous[k] for k in range(1, n)] + [1])
+    return rows
+
+
+def fit_polynomial_least_squares(
+    x_data: Sequence[float], y_data: Sequence[float], degree: int
+) -> Tuple[List[float], float, float]:
+    """Fit ``y = a0 + a1*x + ... + an*x^n`` in one streaming pass over the data.
+
+    x is mapped to u = (x - center) / half_width in [-1, 1] before building each
+    row, so columns stay comparable in magnitude; the solution is then expanded
+    back into monomial coefficients of x.
+
+    Returns:
+        (coefficients a0..an, residual sum of squares, total sum of squares)
+    """
+    x_min = min(x_data)
+    x_max = max(x_data)
+    center = (x_min + x_max) / 2.0
+    half_width = (x_max - x_min) / 2.0
+    if half_width <= 0.0:
+        raise ValueError("Matrix is singular or nearly singular")
+
+    size = degree + 1
+    solver = StreamingLeastSquares(size)
+    row = [1.0] * size
+    for x, y in zip(x_data, y_data):
+        u = (x - center) / half_width
+        power = 1.0
+        for j in range(1, size):
+            power *= u
+            row[j] = power
+        solver.add_row(row, y)
+    scaled = solver.solve()
+
+    # u^j = sum_k C(j, k) x^k (-center)^(j-k) / half_width^j
+    binomial = _binomial_rows(degree)
+    coefficients = [0.0] * size
+    for j in range(size):
+        weight = scaled[j] / half_width**j
+        if weight == 0.0:
+            continue
+        for k in range(j + 1):
+            coefficients[k] += weight * binomial[j][k] * (-center) ** (j - k)
+    return coefficients, solver.residual_sum_squares(), solver.total_sum_squares()
+
+
+def _cholesky_solve(matrix: List[List[float]], rhs: List[float]) -> Optional[List[float]]:
+    """Solve a small symmetric positive definite system, or return None if it is not SPD."""
+    size = len(rhs)
+    lower = [[0.0] * size for _ in range(size)]
+    for i in range(size):
+        for j in range(i + 1):
+            total = matrix[i][j]
+            for k in range(j):
+                total -= lower[i][k] * lower[j][k]
+            if i == j:
+                if total <= 0.0 or not math.isfinite(total):
+                    return None
+                lower[i][i] = math.sqrt(total)
+            else:
+                lower[i][j] = total / lower[j][j]
+    forward = [0.0] * size
+    for i in range(size):
+        total = rhs[i]
+        for k in range(i):
+            total -= lower[i][k] * forward[k]
+        forward[i] = total / lower[i][i]
+    solution = [0.0] * size
+    for i in range(size - 1, -1, -1):
+        total = forward[i]
+        for k in range(i + 1, size):
+            total -= lower[k][i] * solution[k]
+        solution[i] = total / lower[i][i]
+    return solution
+
+
+def _normal_equations(
+    model: ModelFunction, params: Sequence[float], x_data: Sequence[float], y_data: Sequence[float]
+) -> Tuple[float, List[List[float]], List[float]]:
+    """One pass over the data: SSE, J^T J (lower triangle filled), and J^T r."""
+    size = len(params)
+    jtj = [[0.0] * size for _ in range(size)]
+    jtr = [0.0] * size
+    sse = 0.0
+    for x, y in zip(x_data, y_data):
+        value, gradient = model(x, params)
+        residual = y - value
+        sse += residual * residual
+        for i in range(size):
+            gi = gradient[i]
+            if gi == 0.0:
+                continue
+            jtr[i] += gi * residual
+            jtj_row = jtj[i]
+            for k in range(i + 1):
+                jtj_row[k] += gi * gradient[k]
+    for i in range(size):
+        for k in range(i + 1, size):
+            jtj[i][k] = jtj[k][i]
+    return sse, jtj, jtr
+
+
+def levenberg_marquardt(
+    model: ModelFunction,
+    initial: Sequence[float],
+    x_data: Sequence[float],
+    y_data: Sequence[float],
+    max_iterations: int = 100,
+    is_valid: Optional[Callable[[Sequence[float]], bool]] = None,
+) -> Tuple[List[float], float]:
+    """Minimize the sum of squared residuals of ``model`` starting from ``initial``.
+
+    Uses Marquardt's diagonal scaling. Each trial step costs one pass over the
+    data, which also yields the normal equations for the next step when the
+    trial is accepted. Steps rejected by ``is_valid`` are treated as uphill.
+
+    Returns:
+        (fitted parameters, sum of squared residuals)
+    """
+    params = [float(value) for value in initial]
+    sse, jtj, jtr = _normal_equations(model, params, x_data, y_data)
+    damping = 1e-3
+    for _ in range(max_iterations):
+        if sse == 0.0:
+            break
+        accepted = False
+        while damping < 1e16:
+            system = [row[:] for row in jtj]
+            for i in range(len(params)):
+                system[i][i] += damping * max(jtj[i][i], 1e-12)
+            step = _cholesky_solve(system, jtr)
+            if step is None:
+                damping *= 10.0
+                continue
+            trial = [p + d for p, d in zip(params, step)]
+            if is_valid is not None and not is_valid(trial):
+                damping *= 10.0
+                continue
+            trial_sse, trial_jtj, trial_jtr = _normal_equations(model, trial, x_data, y_data)
+            if math.isfinite(trial_sse) and trial_sse < sse:
+                improvement = sse - trial_sse
+                small_step = all(abs(d) <= 1e-12 * (abs(p) + 1e-12) for p, d in zip(params, step))
+                params, sse, jtj, jtr = trial, trial_sse, trial_jtj, trial_jtr
+                damping = max(damping * 0.1, 1e-12)
+                accepted = True
+                if improvement <= 1e-12 * sse or small_step:
+                    return params, sse
+                break
+            damping *= 10.0
+        if not accepted:
+            break
+    return params, sse
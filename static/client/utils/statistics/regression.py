@@ -12,12 +12,27 @@ Provides fitting algorithms for multiple regression model types:
 
 Each fitting function returns a RegressionResult with the fitted expression,
 coefficients, R-squared value, and model type.
+
+Linear fits use one-pass centered co-moments and polynomial fits stream
+through a QR least-squares accumulator;
+logistic and sinusoidal fits are seeded by a coarse grid search and refined
+with Levenberg-Marquardt (see utils.statistics.least_squares).
 """
 
 from __future__ import annotations
 
 import math
-from typing import Any, Dict, List, Optional, TypedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple, TypedDict
+
+from utils.statistics.least_squares import (
+    StreamingLeastSquares,
+    fit_line_least_squares,
+    fit_polynomial_least_squares,
+    levenberg_marquardt,
+)
+
+# Grid searches that seed the nonlinear fits score candidates on at most this many points
+_SEED_SAMPLE_SIZE = 256
 
 
 class RegressionResult(TypedDict):
@@ -57,93 +72,21 @@ def _validate_positive(values: List[float], name: str) -> None:
 
 
 # ---------------------------------------------------------------------------
-# Pure Python matrix operations (no numpy dependency)
+# Least squares
 # ---------------------------------------------------------------------------
 
 
-def _matrix_multiply(A: List[List[float]], B: List[List[float]]) -> List[List[float]]:
-    """Multiply two matrices."""
-    rows_A = len(A)
-    cols_A = len(A[0]) if A else 0
-    rows_B = len(B)
-    cols_B = len(B[0]) if B else 0
-
-    if cols_A != rows_B:
-        raise ValueError("Matrix dimensions incompatible for multiplication")
-
-    result: List[List[float]] = [[0.0] * cols_B for _ in range(rows_A)]
-    for i in range(rows_A):
-        for j in range(cols_B):
-            for k in range(cols_A):
-                result[i][j] += A[i][k] * B[k][j]
-    return result
-
-
-def _matrix_transpose(A: List[List[float]]) -> List[List[float]]:
-    """Transpose a matrix."""
-    if not A:
-        return []
-    rows = len(A)
-    cols = len(A[0])
-    return [[A[i][j] for i in range(rows)] for j in range(cols)]
-
-
-def _matrix_inverse(A: List[List[float]]) -> List[List[float]]:
-    """Compute matrix inverse using Gauss-Jordan elimination."""
-    n = len(A)
-    if n == 0 or len(A[0]) != n:
-        raise ValueError("Matrix must be square")
-
-    # Create augmented matrix [A | I]
-    aug: List[List[float]] = [row[:] + [1.0 if i == j else 0.0 for j in range(n)] for i, row in enumerate(A)]
-
-    # Forward elimination with partial pivoting
-    for col in range(n):
-        # Find pivot
-        max_row = col
-        max_val = abs(aug[col][col])
-        for row in range(col + 1, n):
-            if abs(aug[row][col]) > max_val:
-                max_val = abs(aug[row][col])
-                max_row = row
-
-        if max_val < 1e-12:
-            raise ValueError("Matrix is singular or nearly singular")
-
-        # Swap rows
-        aug[col], aug[max_row] = aug[max_row], aug[col]
-
-        # Eliminate column
-        pivot = aug[col][col]
-        for j in range(2 * n):
-            aug[col][j] /= pivot
-
-        for row in range(n):
-            if row != col:
-                factor = aug[row][col]
-                for j in range(2 * n):
-                    aug[row][j] -= factor * aug[col][j]
-
-    # Extract inverse
-    return [row[n:] for row in aug]
-
-
 def _solve_least_squares(X: List[List[float]], y: List[float]) -> List[float]:
     """
     Solve least squares problem: find coefficients c such that X @ c ≈ y.
-    Uses normal equations: c = (X^T X)^(-1) X^T y
+    Uses a Givens QR factorization of X, avoiding the squared condition number of X^T X.
     """
-    Xt = _matrix_transpose(X)
-    XtX = _matrix_multiply(Xt, X)
-    XtX_inv = _matrix_inverse(XtX)
-
-    # Convert y to column vector
-    y_col = [[yi] for yi in y]
-    Xty = _matrix_multiply(Xt, y_col)
-
-    # Compute coefficients
-    c_col = _matrix_multiply(XtX_inv, Xty)
-    return [c[0] for c in c_col]
+    if not X:
+        raise ValueError("Design matrix must not be empty")
+    solver = StreamingLeastSquares(len(X[0]))
+    for row, yi in zip(X, y):
+        solver.add_row(row, yi)
+    return solver.solve()
 
 
 # ---------------------------------------------------------------------------
@@ -167,7 +110,11 @@ def calculate_r_squared(y_actual: List[float], y_predicted: List[float]) -> floa
     y_mean = sum(y_actual) / len(y_actual)
     ss_tot = sum((y - y_mean) ** 2 for y in y_actual)
     ss_res = sum((ya - yp) ** 2 for ya, yp in zip(y_actual, y_predicted))
+    return _r_squared_from_sums(ss_res, ss_tot)
 
+
+def _r_squared_from_sums(ss_res: float, ss_tot: float) -> float:
+    """R² from residual and total sums of squares, with the same edge handling as calculate_r_squared."""
     if ss_tot < 1e-12:
         # All y values are essentially the same
         return 1.0 if ss_res < 1e-12 else 0.0
@@ -296,22 +243,11 @@ def fit_linear(x_data: List[float], y_data: List[float]) -> RegressionResult:
     """
     _validate_data(x_data, y_data)
 
-    n = len(x_data)
-    sum_x = sum(x_data)
-    sum_y = sum(y_data)
-    sum_xy = sum(x * y for x, y in zip(x_data, y_data))
-    sum_xx = sum(x * x for x in x_data)
-
-    denom = n * sum_xx - sum_x * sum_x
-    if abs(denom) < 1e-12:
+    if max(x_data) - min(x_data) < 1e-12:
         raise ValueError("Cannot fit linear model: x values have no variance")
 
-    m = (n * sum_xy - sum_x * sum_y) / denom
-    b = (sum_y - m * sum_x) / n
-
-    # Calculate R-squared
-    y_predicted = [m * x + b for x in x_data]
-    r_squared = calculate_r_squared(y_data, y_predicted)
+    b, m, ss_res, ss_tot = fit_line_least_squares(x_data, y_data)
+    r_squared = _r_squared_from_sums(ss_res, ss_tot)
 
     coefficients = {"m": m, "b": b}
     expression = build_expression("linear", coefficients)
@@ -336,23 +272,9 @@ def fit_polynomial(x_data: List[float], y_data: List[float], degree: int) -> Reg
     min_points = degree + 1
     _validate_data(x_data, y_data, min_points=min_points)
 
-    len(x_data)
-
-    # Build Vandermonde matrix
-    X: List[List[float]] = []
-    for x in x_data:
-        row = [x**j for j in range(degree + 1)]
-        X.append(row)
-
-    # Solve least squares
-    coeffs = _solve_least_squares(X, y_data)
-
-    # Calculate R-squared
-    y_predicted = []
-    for x in x_data:
-        y_pred = sum(coeffs[j] * (x**j) for j in range(degree + 1))
-        y_predicted.append(y_pred)
-    r_squared = calculate_r_squared(y_data, y_predicted)
+    # Streams rows of the rescaled Vandermonde matrix without materializing it
+    coeffs, ss_res, ss_tot = fit_polynomial_least_squares(x_data, y_data, degree)
+    r_squared = _r_squared_from_sums(ss_res, ss_tot)
 
     coefficients = {f"a{i}": coeffs[i] for i in range(degree + 1)}
     expression = build_expression("polynomial", coefficients)
@@ -473,6 +395,16 @@ def fit_power(x_data: List[float], y_data: List[float]) -> RegressionResult:
     }
 
 
+def _seed_sample(x_data: List[float], y_data: List[float]) -> Tuple[List[float], List[float]]:
+    """Evenly strided subset used to score grid-search seeds on large datasets."""
+    n = len(x_data)
+    if n <= _SEED_SAMPLE_SIZE:
+        return x_data, y_data
+    stride = n / _SEED_SAMPLE_SIZE
+    indices = [int(i * stride) for i in range(_SEED_SAMPLE_SIZE)]
+    return [x_data[i] for i in indices], [y_data[i] for i in indices]
+
+
 def fit_logistic(
     x_data: List[float],
     y_data: List[float],
@@ -484,14 +416,13 @@ def fit_logistic(
     """
     Fit logistic model: y = L / (1 + e^(-k(x - x0)))
 
-    Uses grid search followed by coordinate descent refinement for Brython
-    compatibility (no scipy/numpy dependency).
+    Uses a coarse grid search for a starting point followed by Levenberg-Marquardt
+    refinement for Brython compatibility (no scipy/numpy dependency).
 
     Performance note:
-        This function uses iterative optimization which may be slower than
-        analytical methods. Each iteration evaluates 27 candidate solutions.
-        For typical datasets (<1000 points), fitting completes in <100ms.
-        Very large datasets may benefit from subsampling before fitting.
+        Grid candidates are scored on at most 256 evenly strided points. Each
+        Levenberg-Marquardt step is one pass over the data and typically converges
+        in a few dozen steps, so cost grows linearly with the number of points.
 
     Parameters:
         x_data: List of x values
@@ -506,7 +437,6 @@ def fit_logistic(
     """
     _validate_data(x_data, y_data)
 
-    min(y_data)
     y_max = max(y_data)
     x_min = min(x_data)
     x_max = max(x_data)
@@ -528,9 +458,22 @@ def fit_logistic(
             return L
         return L / (1.0 + math.exp(exp_arg))
 
+    def logistic_with_gradient(x: float, params: Sequence[float]) -> Tuple[float, Sequence[float]]:
+        L, k, x0 = params
+        exp_arg = -k * (x - x0)
+        if exp_arg > 700:
+            return 0.0, (0.0, 0.0, 0.0)
+        if exp_arg < -700:
+            return L, (1.0, 0.0, 0.0)
+        s = 1.0 / (1.0 + math.exp(exp_arg))
+        slope = L * s * (1.0 - s)
+        return L * s, (s, slope * (x - x0), -slope * k)
+
+    sample_x, sample_y = _seed_sample(x_data, y_data)
+
     def compute_sse(L: float, k: float, x0: float) -> float:
         sse = 0.0
-        for x, y in zip(x_data, y_data):
+        for x, y in zip(sample_x, sample_y):
             y_pred = logistic(x, L, k, x0)
             sse += (y - y_pred) ** 2
         return sse
@@ -551,36 +494,14 @@ def fit_logistic(
                     best_sse = sse
                     best_L, best_k, best_x0 = L_test, k_test, x0_test
 
-    # Simple refinement using coordinate descent
-    step_L = abs(best_L) * 0.1 if best_L != 0 else 0.1
-    step_k = abs(best_k) * 0.1 if best_k != 0 else 0.1
-    step_x0 = (x_max - x_min) * 0.1
-
-    for _ in range(max_iterations):
-        improved = False
-
-        for delta_L in [-step_L, 0, step_L]:
-            for delta_k in [-step_k, 0, step_k]:
-                for delta_x0 in [-step_x0, 0, step_x0]:
-                    if delta_L == delta_k == delta_x0 == 0:
-                        continue
-                    new_L = best_L + delta_L
-                    new_k = best_k + delta_k
-                    new_x0 = best_x0 + delta_x0
-                    if new_L <= 0 or new_k <= 0:
-                        continue
-                    sse = compute_sse(new_L, new_k, new_x0)
-                    if sse < best_sse:
-                        best_sse = sse
-                        best_L, best_k, best_x0 = new_L, new_k, new_x0
-                        improved = True
-
-        if not improved:
-            step_L *= 0.5
-            step_k *= 0.5
-            step_x0 *= 0.5
-            if step_L < 1e-8 and step_k < 1e-8 and step_x0 < 1e-8:
-                break
+    (best_L, best_k, best_x0), _ = levenberg_marquardt(
+        logistic_with_gradient,
+        (best_L, best_k, best_x0),
+        x_data,
+        y_data,
+        max_iterations=max_iterations,
+        is_valid=lambda params: params[0] > 0 and params[1] > 0,
+    )
 
     # Calculate R-squared
     y_predicted = [logistic(x, best_L, best_k, best_x0) for x in x_data]
@@ -605,15 +526,14 @@ def fit_sinusoidal(
     """
     Fit sinusoidal model: y = a * sin(bx + c) + d
 
-    Uses period estimation via zero-crossing detection followed by coordinate
-    descent refinement for Brython compatibility (no scipy/numpy dependency).
+    Uses period estimation via zero-crossing detection and a coarse grid search,
+    followed by Levenberg-Marquardt refinement for Brython compatibility
+    (no scipy/numpy dependency).
 
     Performance note:
-        This function uses iterative optimization which may be slower than
-        analytical methods. Each iteration evaluates 81 candidate solutions
-        (3^4 combinations). For typical datasets (<1000 points), fitting
-        completes in <200ms. Very large datasets may benefit from subsampling
-        before fitting.
+        Grid candidates are scored on at most 256 evenly strided points. Each
+        Levenberg-Marquardt step is one pass over the data, so cost grows
+        linearly with the number of points.
 
     Parameters:
         x_data: List of x values
@@ -642,17 +562,27 @@ def fit_sinusoidal(
     if a_init < 1e-10:
         a_init = 1.0
 
-    # Estimate period by finding zero crossings in (y - mean)
+    # Estimate period by finding zero crossings in (y - mean). A crossing only
+    # counts once the signal goes on to leave a band around the mean on the
+    # other side, so noise near the mean does not register as extra crossings.
+    band = 0.25 * a_init
     y_centered = [y - y_mean for y in y_data]
     crossings = []
     sorted_pairs = sorted(zip(x_data, y_centered))
+    side = 0
+    last_crossing: Optional[float] = None
     for i in range(len(sorted_pairs) - 1):
         x1, y1 = sorted_pairs[i]
         x2, y2 = sorted_pairs[i + 1]
         if y1 * y2 < 0:  # Sign change
             # Linear interpolation to find crossing
-            x_cross = x1 - y1 * (x2 - x1) / (y2 - y1)
-            crossings.append(x_cross)
+            last_crossing = x1 - y1 * (x2 - x1) / (y2 - y1)
+        new_side = 1 if y2 > band else -1 if y2 < -band else side
+        if new_side != side:
+            if side != 0 and last_crossing is not None:
+                crossings.append(last_crossing)
+            side = new_side
+            last_crossing = None
 
     if len(crossings) >= 2:
         # Estimate period as twice average distance between crossings
@@ -669,9 +599,18 @@ def fit_sinusoidal(
     def sinusoidal(x: float, a: float, b: float, c: float, d: float) -> float:
         return a * math.sin(b * x + c) + d
 
+    def sinusoidal_with_gradient(x: float, params: Sequence[float]) -> Tuple[float, Sequence[float]]:
+        a, b, c, d = params
+        phase = b * x + c
+        sin_phase = math.sin(phase)
+        a_cos_phase = a * math.cos(phase)
+        return a * sin_phase + d, (sin_phase, a_cos_phase * x, a_cos_phase, 1.0)
+
+    sample_x, sample_y = _seed_sample(x_data, y_data)
+
     def compute_sse(a: float, b: float, c: float, d: float) -> float:
         sse = 0.0
-        for x, y in zip(x_data, y_data):
+        for x, y in zip(sample_x, sample_y):
             y_pred = sinusoidal(x, a, b, c, d)
             sse += (y - y_pred) ** 2
         return sse
@@ -691,40 +630,14 @@ def fit_sinusoidal(
                 best_sse = sse
                 best_b, best_c = b_test, c_test
 
-    # Coordinate descent refinement
-    step_a = abs(best_a) * 0.1 if best_a != 0 else 0.1
-    step_b = abs(best_b) * 0.1 if best_b != 0 else 0.1
-    step_c = 0.1
-    step_d = abs(best_d) * 0.1 if best_d != 0 else 0.1
-
-    for _ in range(max_iterations):
-        improved = False
-
-        for delta_a in [-step_a, 0, step_a]:
-            for delta_b in [-step_b, 0, step_b]:
-                for delta_c in [-step_c, 0, step_c]:
-                    for delta_d in [-step_d, 0, step_d]:
-                        if delta_a == delta_b == delta_c == delta_d == 0:
-                            continue
-                        new_a = best_a + delta_a
-                        new_b = best_b + delta_b
-                        new_c = best_c + delta_c
-                        new_d = best_d + delta_d
-                        if new_b <= 0:
-                            continue
-                        sse = compute_sse(new_a, new_b, new_c, new_d)
-                        if sse < best_sse:
-                            best_sse = sse
-                            best_a, best_b, best_c, best_d = new_a, new_b, new_c, new_d
-                            improved = True
-
-        if not improved:
-            step_a *= 0.5
-            step_b *= 0.5
-            step_c *= 0.5
-            step_d *= 0.5
-            if step_a < 1e-8 and step_b < 1e-8 and step_c < 1e-8 and step_d < 1e-8:
-                break
+    (best_a, best_b, best_c, best_d), _ = levenberg_marquardt(
+        sinusoidal_with_gradient,
+        (best_a, best_b, best_c, best_d),
+        x_data,
+        y_data,
+        max_iterations=max_iterations,
+        is_valid=lambda params: params[1] > 0,
+    )
 
     # Calculate R-squared
     y_predicted = [sinusoidal(x, best_a, best_b, best_c, best_d) for x in x_data]
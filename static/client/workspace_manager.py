@@ -54,6 +54,7 @@ from drawables.bars_plot import BarsPlot
 from drawables.continuous_plot import ContinuousPlot
 from drawables.discrete_plot import DiscretePlot
 from drawables.plot import Plot
+from drawables.scatter_plot import ScatterPlot
 from utils.math_utils import MathUtils
 from managers.polygon_type import PolygonType
 from utils.polygon_canonicalizer import (
@@ -676,6 +677,8 @@ class WorkspaceManager:
             plot_items.append(("discrete", item_state))
         for item_state in state.get("BarsPlots", []) or []:
             plot_items.append(("bars", item_state))
+        for item_state in state.get("ScatterPlots", []) or []:
+            plot_items.append(("scatter", item_state))
         for item_state in state.get("Plots", []) or []:
             plot_items.append(("legacy", item_state))
         return plot_items
@@ -726,6 +729,16 @@ class WorkspaceManager:
             )
             return plot, name
 
+        if kind == "scatter":
+            plot = self._build_scatter_plot(
+                name=name,
+                args=args,
+                plot_type=plot_type,
+                bounds=bounds,
+                metadata=metadata,
+            )
+            return plot, name
+
         return self._build_legacy_plot(
             name=name,
             args=args,
@@ -811,6 +824,26 @@ class WorkspaceManager:
             metadata=metadata,
         )
 
+    def _build_scatter_plot(
+        self,
+        *,
+        name: str,
+        args: Dict[str, Any],
+        plot_type: str,
+        bounds: Any,
+        metadata: Any,
+    ) -> ScatterPlot:
+        return ScatterPlot(
+            name,
+            x_values=args.get("x_values") or [],
+            y_values=args.get("y_values") or [],
+            color=args.get("color"),
+            point_radius=args.get("point_radius"),
+            plot_type=plot_type,
+            bounds=bounds,
+            metadata=metadata,
+        )
+
     def _build_legacy_plot(
         self,
         *,
@@ -1073,8 +1106,16 @@ class WorkspaceManager:
         self._run_restore_phases(state)
 
     def _run_restore_phases(self, state: Dict[str, Any]) -> None:
-        for phase in self._restore_phases():
-            phase(state)
+        # Each restored drawable would otherwise redraw the whole canvas
+        deferred = callable(getattr(self.canvas, "begin_deferred_draws", None))
+        if deferred:
+            self.canvas.begin_deferred_draws()
+        try:
+            for phase in self._restore_phases():
+                phase(state)
+        finally:
+            if deferred:
+                self.canvas.end_deferred_draws()
 
     def _restore_phases(self) -> List[Callable[[Dict[str, Any]], None]]:
         return [
@@ -1149,6 +1190,10 @@ class WorkspaceManager:
         if getattr(self.canvas, "draw_enabled", False):
             try:
                 self.canvas.draw()
+                # Post-draw restore steps expect the drawables rendered, even mid-batch
+                flush_draw = getattr(self.canvas, "flush_draw", None)
+                if callable(flush_draw):
+                    flush_draw()
             except Exception:
                 pass
 
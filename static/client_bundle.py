@@ -0,0 +1,264 @@
+"""
+MatHud Client Bundle Builder
+
+Packs the Brython client modules into content-hashed bundle scripts so the
+browser loads the client in a few requests instead of fetching every module
+on import.
+
+Features:
+    - Core bundle registered with Brython's virtual file system (VFS)
+    - Rarely used subsystems split into lazy chunks, fetched on first import
+    - File names and VFS timestamps derived from content hashes, so Brython's
+      compiled-module cache and HTTP caches stay valid until the code changes
+    - Every module compiled at build time to reject syntax errors early
+    - Gzip copies written next to each bundle for the serving route
+    - Stale bundles (sources changed since the build) are ignored at startup
+
+Usage:
+    python -m static.client_bundle [--output DIR]
+
+Dependencies:
+    - ast: Import discovery for the VFS dependency lists
+    - gzip, hashlib, json: Bundle encoding and hashing
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import gzip
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Set, Tuple, TypedDict
+
+from flask import Response, send_from_directory
+
+_BASE_DIR = Path(__file__).resolve().parent
+
+CLIENT_ROOT = _BASE_DIR / "client"
+DEFAULT_OUTPUT_DIR = _BASE_DIR.parent / "build" / "client_bundle"
+MANIFEST_NAME = "manifest.json"
+CORE_CHUNK = "core"
+
+# Chunk name -> module prefixes kept out of the core bundle until first import
+LAZY_CHUNKS: Dict[str, Tuple[str, ...]] = {
+    "graph_layout": ("utils.graph_layout",),
+    "statistics": ("utils.statistics",),
+    "client_tests": ("client_tests",),
+}
+
+# Bundle names embed the content hash, so a cached copy never goes stale
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+_HASH_LENGTH = 12
+
+
+class ChunkEntry(TypedDict):
+    """A lazily loaded chunk in the bundle manifest."""
+
+    file: str
+    prefixes: List[str]
+
+
+class ClientBundleManifest(TypedDict):
+    """Build output description read by the server at startup."""
+
+    source_digest: str
+    core: str
+    chunks: Dict[str, ChunkEntry]
+
+
+def iter_client_sources(client_root: Path = CLIENT_ROOT) -> List[Tuple[str, Path]]:
+    """Return ``(relative posix path, path)`` for every client module, sorted by path."""
+    sources: List[Tuple[str, Path]] = []
+    for path in client_root.rglob("*.py"):
+        if "__pycache__" in path.parts:
+            continue
+        sources.append((path.relative_to(client_root).as_posix(), path))
+    sources.sort()
+    return sources
+
+
+def compute_source_digest(client_root: Path = CLIENT_ROOT) -> str:
+    """Hash the relative paths and contents of all client modules."""
+    digest = hashlib.sha256()
+    for relative, path in iter_client_sources(client_root):
+        digest.update(relative.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(path.read_bytes())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def module_name_for(relative_path: str) -> Tuple[str, bool]:
+    """Map ``pkg/mod.py`` to ``("pkg.mod", False)`` and ``pkg/__init__.py`` to ``("pkg", True)``."""
+    parts = relative_path[: -len(".py")].split("/")
+    if parts[-1] == "__init__":
+        return ".".join(parts[:-1]), True
+    return ".".join(parts), False
+
+
+def chunk_for_module(module_name: str, chunks: Dict[str, Tuple[str, ...]] = LAZY_CHUNKS) -> str:
+    """Return the name of the chunk that ships ``module_name``."""
+    for chunk, prefixes in chunks.items():
+        for prefix in prefixes:
+            if module_name == prefix or module_name.startswith(prefix + "."):
+                return chunk
+    return CORE_CHUNK
+
+
+def _imported_modules(tree: ast.AST, module_name: str, is_package: bool, known: Sequence[str]) -> List[str]:
+    """Client modules imported anywhere in ``tree``, with relative imports resolved."""
+    package = module_name if is_package else module_name.rpartition(".")[0]
+    found: Set[str] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            found.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            if node.level:
+                base_parts = package.split(".") if package else []
+                if node.level > 1:
+                    base_parts = base_parts[: len(base_parts) - (node.level - 1)]
+                base = ".".join(base_parts)
+                target = f"{base}.{node.module}" if base and node.module else (node.module or base)
+            else:
+                target = node.module or ""
+            if target:
+                found.add(target)
+                found.update(f"{target}.{alias.name}" for alias in node.names)
+    known_set = set(known)
+    return sorted(name for name in found if name in known_set and name != module_name)
+
+
+def _render_vfs_script(entries: Dict[str, list], timestamp: int) -> str:
+    scripts: Dict[str, object] = {"$timestamp": timestamp}
+    scripts.update(entries)
+    return "__BRYTHON__.use_VFS = true;\nvar scripts = " + json.dumps(scripts) + ";\n__BRYTHON__.update_VFS(scripts);\n"
+
+
+def build_client_bundle(
+    client_root: Path = CLIENT_ROOT,
+    output_dir: Path = DEFAULT_OUTPUT_DIR,
+    chunks: Dict[str, Tuple[str, ...]] = LAZY_CHUNKS,
+) -> ClientBundleManifest:
+    """Compile, split, and write the client bundles plus their manifest.
+
+    Bundle files from earlier builds are removed from ``output_dir``.
+
+    Raises:
+        SyntaxError: If a client module does not compile
+    """
+    modules: List[Tuple[str, bool, str, str]] = []
+    for relative, path in iter_client_sources(client_root):
+        name, is_package = module_name_for(relative)
+        if not name:
+            continue
+        modules.append((name, is_package, relative, path.read_text(encoding="utf-8")))
+    known = [name for name, _, _, _ in modules]
+
+    grouped: Dict[str, Dict[str, list]] = {CORE_CHUNK: {}}
+    grouped.update({chunk: {} for chunk in chunks})
+    for name, is_package, relative, source in modules:
+        tree = ast.parse(source, relative)
+        compile(tree, relative, "exec", dont_inherit=True)
+        chunk = chunk_for_module(name, chunks)
+        # Brython preloads listed imports from its cache, so never list a module from a chunk not yet loaded
+        imports = [
+            imported
+            for imported in _imported_modules(tree, name, is_package, known)
+            if chunk_for_module(imported, chunks) in (CORE_CHUNK, chunk)
+        ]
+        entry: list = [".py", source, imports]
+        if is_package:
+            entry.append(1)
+        grouped[chunk][name] = entry
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    for stale in output_dir.glob("mathud-*.js*"):
+        stale.unlink()
+
+    files: Dict[str, str] = {}
+    for chunk, entries in grouped.items():
+        if not entries:
+            continue
+        content_hash = hashlib.sha256(json.dumps(entries, sort_keys=True).encode("utf-8")).hexdigest()
+        script = _render_vfs_script(entries, int(content_hash[:_HASH_LENGTH], 16))
+        filename = f"mathud-{chunk}.{content_hash[:_HASH_LENGTH]}.js"
+        data = script.encode("utf-8")
+        (output_dir / filename).write_bytes(data)
+        (output_dir / f"{filename}.gz").write_bytes(gzip.compress(data, compresslevel=9, mtime=0))
+        files[chunk] = filename
+
+    manifest: ClientBundleManifest = {
+        "source_digest": compute_source_digest(client_root),
+        "core": files[CORE_CHUNK],
+        "chunks": {
+            chunk: {"file": files[chunk], "prefixes": list(prefixes)}
+            for chunk, prefixes in chunks.items()
+            if chunk in files
+        },
+    }
+    (output_dir / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    return manifest
+
+
+def load_client_bundle(
+    client_root: Path = CLIENT_ROOT,
+    output_dir: Path = DEFAULT_OUTPUT_DIR,
+) -> Optional[ClientBundleManifest]:
+    """Return the built manifest, or None when there is no usable bundle.
+
+    A bundle built from different sources than the ones on disk is ignored so
+    edits are never masked by an old build.
+    """
+    manifest_path = output_dir / MANIFEST_NAME
+    try:
+        manifest: ClientBundleManifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if manifest.get("source_digest") != compute_source_digest(client_root):
+        print("[ClientBundle] Client sources changed since the last build; serving unbundled modules")
+        return None
+    if not all((output_dir / name).is_file() for name in bundle_file_names(manifest)):
+        return None
+    return manifest
+
+
+def bundle_file_names(manifest: ClientBundleManifest) -> List[str]:
+    """All bundle script names listed in ``manifest``."""
+    return [manifest["core"]] + [entry["file"] for entry in manifest["chunks"].values()]
+
+
+def send_bundle_file(output_dir: Path, filename: str, accept_encoding: str) -> Response:
+    """Serve one bundle script, gzip-encoded when the client accepts it."""
+    gzip_name = f"{filename}.gz"
+    use_gzip = "gzip" in accept_encoding.lower() and (output_dir / gzip_name).is_file()
+    response = send_from_directory(
+        os.fspath(output_dir),
+        gzip_name if use_gzip else filename,
+        mimetype="text/javascript",
+    )
+    if use_gzip:
+        response.headers["Content-Encoding"] = "gzip"
+    response.headers["Vary"] = "Accept-Encoding"
+    response.headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+    return response
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Build the hashed Brython client bundles.")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT_DIR, help="Output directory")
+    args = parser.parse_args(argv)
+
+    manifest = build_client_bundle(output_dir=args.output)
+    for name in bundle_file_names(manifest):
+        raw = (args.output / name).stat().st_size
+        packed = (args.output / f"{name}.gz").stat().st_size
+        print(f"{name}: {raw / 1024:.0f} KiB ({packed / 1024:.0f} KiB gzip)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,261 @@
+"""
+MatHud Conversation History Manager
+
+Keeps a provider's message list bounded and cheap to maintain. Each message is
+cleaned exactly once, when the turn that produced it settles: canvas state is
+stripped from user prompts and attached images are collapsed to their text.
+A running token estimate (static.token_estimation) is kept per message, and
+when it exceeds the configured budget the oldest turns are compacted: first
+their tool results are truncated, then whole turns are replaced by a short
+user/assistant summary pair, and finally the oldest summaries are dropped.
+The most recent turns are always kept verbatim.
+
+Dependencies:
+    - json: Prompt payload parsing and message size estimation
+    - static.token_estimation: Byte-based token heuristic
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, List, Optional
+
+from static.token_estimation import estimate_tokens_from_text
+
+MessageDict = Dict[str, Any]
+
+SUMMARY_PREFIX = "[Earlier turn, compacted]"
+TRUNCATED_SUFFIX = " ...[truncated]"
+DEFAULT_TOKEN_BUDGET = 60000
+DEFAULT_KEEP_RECENT_TURNS = 4
+DEFAULT_SUMMARY_CHARS = 240
+
+_CANVAS_STATE_KEYS = ("canvas_state", "canvas_state_summary")
+
+
+def strip_canvas_state(message: MessageDict) -> None:
+    """Remove canvas_state payloads from a user message's JSON prompt text."""
+    content = message.get("content")
+    if isinstance(content, list):
+        for part in content:
+            if isinstance(part, dict) and part.get("type") == "text":
+                text = part.get("text", "")
+                stripped = _strip_canvas_state_text(text) if isinstance(text, str) else None
+                if stripped is not None:
+                    part["text"] = stripped
+    elif isinstance(content, str):
+        stripped = _strip_canvas_state_text(content)
+        if stripped is not None:
+            message["content"] = stripped
+
+
+def strip_images(message: MessageDict) -> None:
+    """Collapse multi-part user content (text plus images) to its first text part."""
+    content = message.get("content")
+    if not isinstance(content, list):
+        return
+    text_parts = [part for part in content if isinstance(part, dict) and part.get("type") == "text"]
+    if text_parts:
+        message["content"] = text_parts[0].get("text", "")
+
+
+def clean_settled_message(message: MessageDict) -> None:
+    """Drop per-turn payloads that are useless once the turn is over."""
+    if message.get("role") == "user" and "content" in message:
+        strip_canvas_state(message)
+        strip_images(message)
+
+
+def estimate_message_tokens(message: MessageDict) -> int:
+    """Estimate the prompt tokens a message contributes, including tool calls."""
+    return estimate_tokens_from_text(json.dumps(message, default=str, separators=(",", ":")))
+
+
+def _strip_canvas_state_text(text: str) -> Optional[str]:
+    if "canvas_state" not in text:
+        return None
+    try:
+        payload = json.loads(text)
+    except json.JSONDecodeError:
+        return None
+    if not isinstance(payload, dict):
+        return None
+    for key in _CANVAS_STATE_KEYS:
+        payload.pop(key, None)
+    return json.dumps(payload)
+
+
+def _truncate(text: str, limit: int) -> str:
+    text = " ".join(text.split())
+    return text if len(text) <= limit else text[:limit] + TRUNCATED_SUFFIX
+
+
+def _content_text(content: Any) -> str:
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        return " ".join(
+            str(part.get("text", "")) for part in content if isinstance(part, dict) and part.get("type") == "text"
+        )
+    return ""
+
+
+def _user_prompt_text(message: MessageDict) -> str:
+    text = _content_text(message.get("content"))
+    try:
+        payload = json.loads(text)
+    except (json.JSONDecodeError, TypeError):
+        return text
+    if isinstance(payload, dict) and isinstance(payload.get("user_message"), str):
+        return str(payload["user_message"])
+    return text
+
+
+def _tool_call_names(message: MessageDict) -> List[str]:
+    names: List[str] = []
+    for call in message.get("tool_calls") or []:
+        if isinstance(call, dict):
+            function = call.get("function")
+            name = function.get("name") if isinstance(function, dict) else call.get("name")
+            if isinstance(name, str) and name:
+                names.append(name)
+    return names
+
+
+class ConversationHistory:
+    """Incremental cleaner and token budget for one provider's ``messages`` list.
+
+    The manager never owns the list; providers keep appending to
+    ``self.messages`` as before and call settle() when a response completes.
+    Replacing or shrinking the list (e.g. reset_conversation) is detected and
+    the bookkeeping restarts. Compaction always advances oldest-first, so two
+    cursors remember how far tool results have been truncated and turns
+    summarized; a settle() therefore only touches messages past them.
+    """
+
+    def __init__(
+        self,
+        token_budget: int = DEFAULT_TOKEN_BUDGET,
+        keep_recent_turns: int = DEFAULT_KEEP_RECENT_TURNS,
+        summary_chars: int = DEFAULT_SUMMARY_CHARS,
+    ) -> None:
+        """Initialize the manager.
+
+        Args:
+            token_budget: Estimated-token ceiling for the history (<= 0 disables compaction)
+            keep_recent_turns: Number of most recent user turns never compacted
+            summary_chars: Maximum characters kept per truncated result or summary line
+        """
+        self.token_budget = token_budget
+        self.keep_recent_turns = max(1, keep_recent_turns)
+        self.summary_chars = max(16, summary_chars)
+        self._messages: Optional[List[MessageDict]] = None
+        self._tokens: List[int] = []
+        self._total = 0
+        self._summarized_end = 0
+        self._truncated_end = 0
+
+    @property
+    def total_tokens(self) -> int:
+        """Running token estimate of the messages settled so far."""
+        return self._total
+
+    def settle(self, messages: List[MessageDict]) -> None:
+        """Clean messages added since the last call and enforce the token budget."""
+        self._sync(messages)
+        if 0 < self.token_budget < self._total:
+            self._compact(messages)
+
+    def note_updated(self, messages: List[MessageDict], index: int) -> None:
+        """Re-estimate a settled message whose content changed in place (e.g. tool results)."""
+        if messages is self._messages and 0 <= index < len(self._tokens):
+            self._replace_tokens(index, index + 1, [estimate_message_tokens(messages[index])])
+
+    def _sync(self, messages: List[MessageDict]) -> None:
+        if messages is not self._messages or len(messages) < len(self._tokens):
+            self._messages = messages
+            self._tokens = []
+            self._total = 0
+            self._summarized_end = self._truncated_end = 0
+        for message in messages[len(self._tokens) :]:
+            clean_settled_message(message)
+            tokens = estimate_message_tokens(message)
+            self._tokens.append(tokens)
+            self._total += tokens
+
+    def _replace_tokens(self, start: int, end: int, tokens: List[int]) -> None:
+        self._total += sum(tokens) - sum(self._tokens[start:end])
+        self._tokens[start:end] = tokens
+
+    def _compact(self, messages: List[MessageDict]) -> None:
+        # Stage 1: shorten tool results in old turns, oldest first.
+        for start, end in self._old_turns(messages, max(self._truncated_end, self._summarized_end)):
+            for index in range(start, end):
+                message = messages[index]
+                content = message.get("content")
+                if message.get("role") != "tool" or not isinstance(content, str):
+                    continue
+                if len(content) <= self.summary_chars + len(TRUNCATED_SUFFIX):
+                    continue
+                message["content"] = _truncate(content, self.summary_chars)
+                self._replace_tokens(index, index + 1, [estimate_message_tokens(message)])
+            self._truncated_end = end
+            if self._total <= self.token_budget:
+                return
+
+        # Stage 2: replace whole old turns with a user/assistant summary pair, oldest first.
+        while self._total > self.token_budget:
+            old_turns = self._old_turns(messages, self._summarized_end)
+            if not old_turns:
+                break
+            start, end = old_turns[0]
+            summary = self._summarize_turn(messages[start:end])
+            messages[start:end] = summary
+            self._replace_tokens(start, end, [estimate_message_tokens(message) for message in summary])
+            self._summarized_end = start + len(summary)
+            self._truncated_end = max(self._truncated_end - (end - start - len(summary)), self._summarized_end)
+
+        # Stage 3: drop the oldest summaries until the history fits.
+        while self._total > self.token_budget:
+            start, end = self._first_turn(messages)
+            if end > self._summarized_end:
+                return
+            del messages[start:end]
+            self._replace_tokens(start, end, [])
+            self._summarized_end -= end - start
+            self._truncated_end -= end - start
+
+    def _old_turns(self, messages: List[MessageDict], offset: int) -> List[tuple[int, int]]:
+        """Return (start, end) of turns beginning at or after ``offset`` that may be compacted."""
+        starts = [index for index in range(offset, len(messages)) if messages[index].get("role") == "user"]
+        if len(starts) <= self.keep_recent_turns:
+            return []
+        bounds = starts + [len(messages)]
+        return [(bounds[i], bounds[i + 1]) for i in range(len(starts) - self.keep_recent_turns)]
+
+    @staticmethod
+    def _first_turn(messages: List[MessageDict]) -> tuple[int, int]:
+        start = next((i for i, message in enumerate(messages) if message.get("role") == "user"), len(messages))
+        end = next((i for i in range(start + 1, len(messages)) if messages[i].get("role") == "user"), len(messages))
+        return start, end
+
+    def _summarize_turn(self, turn: List[MessageDict]) -> List[MessageDict]:
+        prompt = _truncate(_user_prompt_text(turn[0]), self.summary_chars)
+        tools: List[str] = []
+        reply = ""
+        for message in turn[1:]:
+            if message.get("role") != "assistant":
+                continue
+            tools.extend(_tool_call_names(message))
+            text = _content_text(message.get("content"))
+            if text.strip():
+                reply = text
+        parts = [SUMMARY_PREFIX]
+        if tools:
+            parts.append("Tools used: " + ", ".join(dict.fromkeys(tools)) + ".")
+        if reply:
+            parts.append("Reply: " + _truncate(reply, self.summary_chars))
+        return [
+            {"role": "user", "content": prompt},
+            {"role": "assistant", "content": " ".join(parts)},
+        ]
@@ -0,0 +1,280 @@
+"""
+MatHud Conversation Pool
+
+Keeps one set of AI provider instances per client session so that concurrent
+browser tabs and CLI clients each get their own message history, injected tool
+set and vision snapshot. Sessions are evicted least-recently-used once the pool
+is full and after an idle timeout; each session carries a lock that serializes
+requests against its conversation while different sessions run in parallel.
+
+Dependencies:
+    - threading: Pool and per-session locks
+    - logging: Reports failing eviction hooks
+    - time: Monotonic clock for idle tracking
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import re
+import threading
+import time
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional
+
+if TYPE_CHECKING:
+    from static.openai_api_base import OpenAIAPIBase
+    from static.openai_completions_api import OpenAIChatCompletionsAPI
+    from static.openai_responses_api import OpenAIResponsesAPI
+
+
+SESSION_HEADER = "X-MatHud-Session"
+DEFAULT_SESSION_ID = "default"
+DEFAULT_MAX_SESSIONS = 32
+DEFAULT_IDLE_TIMEOUT_SECONDS = 1800.0
+# Handed to providers when a vision request produced no image, so they do not
+# fall back to a snapshot file left over from an earlier request
+NO_CANVAS_SNAPSHOT = b""
+
+_logger = logging.getLogger("mathud")
+
+_SESSION_ID_PATTERN = re.compile(r"^[A-Za-z0-9_-]{8,64}$")
+
+
+def is_valid_session_id(session_id: object) -> bool:
+    """Whether a client-supplied session id is safe to use as a pool key and file name."""
+    return isinstance(session_id, str) and bool(_SESSION_ID_PATTERN.match(session_id))
+
+
+class ConversationSession:
+    """Provider instances and per-request state owned by a single client session.
+
+    Attributes:
+        session_id: Pool key for the session
+        ai_api: Chat Completions API instance for non-reasoning OpenAI models
+        responses_api: Responses API instance for OpenAI reasoning models
+        providers: Lazily-created non-OpenAI provider instances by provider name
+        attached_images: User-attached images for the request in flight
+        canvas_snapshot_path: Snapshot file providers read if no snapshot was handed over
+        canvas_snapshot: PNG bytes of the vision snapshot for the request in flight
+        lock: Serializes requests against this session's conversation
+        last_used: Clock reading of the last acquire or release
+    """
+
+    def __init__(
+        self,
+        session_id: str,
+        ai_api: OpenAIChatCompletionsAPI,
+        responses_api: OpenAIResponsesAPI,
+        canvas_snapshot_path: str,
+        providers: Optional[Dict[str, OpenAIAPIBase]] = None,
+        last_used: float = 0.0,
+    ) -> None:
+        self.session_id = session_id
+        self.ai_api = ai_api
+        self.responses_api = responses_api
+        self.providers: Dict[str, OpenAIAPIBase] = providers if providers is not None else {}
+        self.attached_images: Optional[List[str]] = None
+        self.canvas_snapshot_path = ""
+        self.canvas_snapshot: Optional[bytes] = None
+        self.lock = threading.Lock()
+        self.last_used = last_used
+        self._users = 0
+        self.set_canvas_snapshot_path(canvas_snapshot_path)
+
+    @property
+    def in_use(self) -> bool:
+        """True while a request holds a reference to this session."""
+        return self._users > 0
+
+    def all_providers(self) -> List[OpenAIAPIBase]:
+        """Return every provider instance of this session, without duplicates."""
+        result: List[OpenAIAPIBase] = [self.ai_api, self.responses_api]
+        for provider in self.providers.values():
+            if all(provider is not existing for existing in result):
+                result.append(provider)
+        return result
+
+    def set_canvas_snapshot_path(self, path: str) -> None:
+        """Point this session and all of its providers at a vision snapshot file."""
+        self.canvas_snapshot_path = path
+        for provider in self.all_providers():
+            provider.canvas_snapshot_path = path
+
+    def set_canvas_snapshot(self, png: Optional[bytes]) -> None:
+        """Hand the current request's vision snapshot to all providers in memory.
+
+        None (no snapshot for this request) is passed on as NO_CANVAS_SNAPSHOT.
+        """
+        self.canvas_snapshot = png if png is not None else NO_CANVAS_SNAPSHOT
+        for provider in self.all_providers():
+            provider.canvas_snapshot_bytes = self.canvas_snapshot
+
+    def add_provider(self, name: str, provider: OpenAIAPIBase) -> None:
+        """Register a lazily-created provider so it shares the session's snapshot."""
+        provider.canvas_snapshot_path = self.canvas_snapshot_path
+        provider.canvas_snapshot_bytes = self.canvas_snapshot
+        self.providers[name] = provider
+
+    def reset_conversation(self) -> None:
+        """Clear the message history of every provider in the session."""
+        for provider in self.all_providers():
+            provider.reset_conversation()
+
+
+SessionFactory = Callable[[str], ConversationSession]
+
+
+class ConversationPool:
+    """Session-keyed pool of conversations with LRU eviction and idle timeouts.
+
+    The default session is created eagerly, is never evicted and serves
+    requests that do not identify a session, preserving the single shared
+    conversation for existing clients.
+    """
+
+    def __init__(
+        self,
+        factory: SessionFactory,
+        default_session: ConversationSession,
+        max_sessions: int = DEFAULT_MAX_SESSIONS,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+        on_evict: Optional[Callable[[ConversationSession], None]] = None,
+    ) -> None:
+        """Initialize the pool.
+
+        Args:
+            factory: Creates a new session for an unseen session id
+            default_session: Session used when no session id is supplied
+            max_sessions: Maximum number of non-default sessions kept alive
+            idle_timeout: Seconds after which an unused session is discarded (<= 0 disables)
+            clock: Time source, injectable for tests
+            on_evict: Called outside the pool lock for every session that is dropped
+        """
+        self._factory = factory
+        self._max_sessions = max(1, max_sessions)
+        self._idle_timeout = idle_timeout
+        self._clock = clock
+        self._on_evict = on_evict
+        self._lock = threading.Lock()
+        self._sessions: Dict[str, ConversationSession] = {}
+        self.default = default_session
+        self.default.last_used = clock()
+
+    @classmethod
+    def settings_from_env(cls) -> tuple[int, float]:
+        """Read (max_sessions, idle_timeout) from CONVERSATION_POOL_SIZE / CONVERSATION_IDLE_TIMEOUT."""
+        try:
+            max_sessions = int(os.getenv("CONVERSATION_POOL_SIZE", str(DEFAULT_MAX_SESSIONS)))
+        except ValueError:
+            max_sessions = DEFAULT_MAX_SESSIONS
+        try:
+            idle_timeout = float(os.getenv("CONVERSATION_IDLE_TIMEOUT", str(DEFAULT_IDLE_TIMEOUT_SECONDS)))
+        except ValueError:
+            idle_timeout = DEFAULT_IDLE_TIMEOUT_SECONDS
+        return max_sessions, idle_timeout
+
+    def __len__(self) -> int:
+        """Number of non-default sessions currently pooled."""
+        with self._lock:
+            return len(self._sessions)
+
+    def __contains__(self, session_id: object) -> bool:
+        with self._lock:
+            return session_id in self._sessions
+
+    def peek(self, session_id: Optional[str]) -> Optional[ConversationSession]:
+        """Return an existing session without creating it or refreshing its recency."""
+        if not session_id or session_id == DEFAULT_SESSION_ID:
+            return self.default
+        with self._lock:
+            return self._sessions.get(session_id)
+
+    def acquire(self, session_id: Optional[str]) -> ConversationSession:
+        """Return the session for an id, creating it if needed, and mark it in use.
+
+        Every acquire must be paired with release(); in-use sessions are never
+        evicted. The caller still takes ``session.lock`` to serialize work.
+
+        Raises:
+            ValueError: If a session id is given but is not a valid id
+        """
+        now = self._clock()
+        if session_id is None or session_id == DEFAULT_SESSION_ID:
+            with self._lock:
+                self.default._users += 1
+                self.default.last_used = now
+            return self.default
+        if not is_valid_session_id(session_id):
+            raise ValueError(f"Invalid session id: {session_id!r}")
+
+        with self._lock:
+            evicted = self._evict_idle_locked(now)
+            session = self._sessions.pop(session_id, None)
+            if session is None:
+                evicted.extend(self._evict_lru_locked())
+                session = self._factory(session_id)
+            # Re-insert to mark as most recently used
+            self._sessions[session_id] = session
+            session._users += 1
+            session.last_used = now
+        self._notify_evicted(evicted)
+        return session
+
+    def release(self, session: ConversationSession) -> None:
+        """Mark a session acquired via acquire() as no longer in use."""
+        with self._lock:
+            session._users = max(0, session._users - 1)
+            session.last_used = self._clock()
+
+    def discard(self, session_id: str) -> bool:
+        """Drop a session from the pool. Returns False if it was unknown or is in use."""
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is None or session.in_use:
+                return False
+            del self._sessions[session_id]
+        self._notify_evicted([session])
+        return True
+
+    def evict_idle(self) -> int:
+        """Discard sessions idle for longer than the timeout. Returns the number removed."""
+        with self._lock:
+            evicted = self._evict_idle_locked(self._clock())
+        self._notify_evicted(evicted)
+        return len(evicted)
+
+    def sessions(self) -> List[ConversationSession]:
+        """Snapshot of all sessions, default first, then least to most recently used."""
+        with self._lock:
+            return [self.default, *self._sessions.values()]
+
+    def _evict_idle_locked(self, now: float) -> List[ConversationSession]:
+        if self._idle_timeout <= 0:
+            return []
+        expired = [
+            key
+            for key, session in self._sessions.items()
+            if not session.in_use and now - session.last_used > self._idle_timeout
+        ]
+        return [self._sessions.pop(key) for key in expired]
+
+    def _evict_lru_locked(self) -> List[ConversationSession]:
+        # Iteration order is recency order; skip sessions with requests in flight.
+        evicted: List[ConversationSession] = []
+        while len(self._sessions) >= self._max_sessions:
+            victim = next((key for key, session in self._sessions.items() if not session.in_use), None)
+            if victim is None:
+                break
+            evicted.append(self._sessions.pop(victim))
+        return evicted
+
+    def _notify_evicted(self, sessions: List[ConversationSession]) -> None:
+        if self._on_evict is None:
+            return
+        for session in sessions:
+            try:
+                self._on_evict(session)
+            except Exception:
+                _logger.exception("Conversation eviction hook failed for %s", session.session_id)
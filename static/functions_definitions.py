@@ -2418,7 +2418,7 @@ FUNCTIONS: List[Dict[str, Any]] = [
         "type": "function",
         "function": {
             "name": "delete_plot",
-            "description": "Deletes a previously created plot composite by name, including any underlying components (curve and filled area, or derived bars).",
+            "description": "Deletes a previously created plot composite by name, including any underlying components (curve and filled area, or derived bars). Also deletes the scatter plots created by fit_regression.",
             "strict": True,
             "parameters": {
                 "type": "object",
@@ -2432,14 +2432,14 @@ FUNCTIONS: List[Dict[str, Any]] = [
         "type": "function",
         "function": {
             "name": "fit_regression",
-            "description": "Fits a regression model to data points and plots the resulting curve. Supported model types: linear (y = mx + b), polynomial (y = a0 + a1*x + ... + an*x^n), exponential (y = a*e^(bx)), logarithmic (y = a + b*ln(x)), power (y = a*x^b), logistic (y = L/(1+e^(-k(x-x0)))), and sinusoidal (y = a*sin(bx+c)+d). Returns the function_name, fitted expression, coefficients, R-squared, and point_names. Use delete_function to remove the curve; delete points individually.",
+            "description": "Fits a regression model to data points and plots the resulting curve. Supported model types: linear (y = mx + b), polynomial (y = a0 + a1*x + ... + an*x^n), exponential (y = a*e^(bx)), logarithmic (y = a + b*ln(x)), power (y = a*x^b), logistic (y = L/(1+e^(-k(x-x0)))), and sinusoidal (y = a*sin(bx+c)+d). Returns the function_name, fitted expression, coefficients, R-squared, and, when data points are shown, the scatter_name and point_count of a single scatter plot holding them. Use delete_function to remove the curve and delete_plot to remove the scatter plot.",
             "strict": True,
             "parameters": {
                 "type": "object",
                 "properties": {
                     "name": {
                         "type": ["string", "null"],
-                        "description": "Optional base name for the function and data points. If null, a name will be generated based on model type.",
+                        "description": "Optional base name for the function and data point scatter plot. If null, a name will be generated based on model type.",
                     },
                     "x_data": {
                         "type": "array",
@@ -2487,7 +2487,7 @@ FUNCTIONS: List[Dict[str, Any]] = [
                     "curve_color": {"type": ["string", "null"], "description": "Optional color for the fitted curve."},
                     "show_points": {
                         "type": ["boolean", "null"],
-                        "description": "Whether to plot the data points. Defaults to true.",
+                        "description": "Whether to plot the data points as a scatter plot. Defaults to true.",
                     },
                     "point_color": {
                         "type": ["string", "null"],
@@ -1,34 +1,64 @@
 """
 MatHud Application Logging System
 
-Session-based logging with timestamped entries for debugging and monitoring.
-Creates daily log files and tracks user interactions, AI responses, and tool calls.
+Session-based structured logging for debugging and monitoring. Records are
+handed to a background queue listener and written as JSON lines to daily,
+size-rotated log files, so prompt parsing, canvas-state hashing and
+serialization never run on the request thread. Large fields are capped and
+repeated canvas states are written once and then referenced by hash.
 Supports optional forwarding of logs to the browser console via streaming events.
 
 Dependencies:
-    - logging: Python logging framework
+    - logging: Python logging framework (QueueHandler/QueueListener, RotatingFileHandler)
+    - queue: Hand-off between request threads and the writer thread
+    - hashlib: Canvas state de-duplication
     - os: File system operations
     - datetime: Timestamp generation
-    - json: Message parsing and validation
+    - json: Message parsing and JSONL serialization
 """
 
 from __future__ import annotations
 
+import atexit
+import copy
+import hashlib
 import json
 import logging
+import logging.handlers
 import os
+import queue
+import threading
+from collections import OrderedDict
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Sequence, Union
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
 from static.tool_call_processor import ProcessedToolCall
 
 
 JsonValue = Union[str, int, float, bool, None, Dict[str, "JsonValue"], List["JsonValue"]]
 JsonObject = Dict[str, JsonValue]
+LogFields = Union[Dict[str, Any], Callable[[], Dict[str, Any]]]
 
 # Log levels for browser forwarding (in order of severity)
 LOG_LEVELS = ("debug", "info", "warning", "error")
 
+LOG_DIR_ENV = "LOG_DIR"
+LOG_FIELD_MAX_CHARS_ENV = "LOG_FIELD_MAX_CHARS"
+LOG_MAX_BYTES_ENV = "LOG_MAX_BYTES"
+LOG_BACKUP_COUNT_ENV = "LOG_BACKUP_COUNT"
+DEFAULT_LOGS_DIR = "./logs/"
+DEFAULT_FIELD_MAX_CHARS = 4000
+DEFAULT_MAX_BYTES = 10 * 1024 * 1024
+DEFAULT_BACKUP_COUNT = 5
+
+# Fields whose content is hashed and written only the first time it is seen.
+DEDUPLICATED_FIELDS = ("canvas_state",)
+_SEEN_HASHES_LIMIT = 256
+
+_pipeline_lock = threading.Lock()
+_log_queue: Optional[queue.Queue[logging.LogRecord]] = None
+_listener: Optional[logging.handlers.QueueListener] = None
+
 
 def _get_log_level_index(level: str) -> int:
     """Get numeric index for log level comparison."""
@@ -38,21 +68,195 @@ def _get_log_level_index(level: str) -> int:
         return LOG_LEVELS.index("warning")  # Default to warning
 
 
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
+def _compact_json(value: Any, sort_keys: bool = False) -> str:
+    return json.dumps(value, default=str, separators=(",", ":"), sort_keys=sort_keys)
+
+
+def _user_message_fields(user_message: str) -> Dict[str, Any]:
+    """Split a raw prompt JSON string into log fields (runs on the writer thread)."""
+    try:
+        payload = json.loads(user_message)
+    except json.JSONDecodeError:
+        return {"error": "Failed to decode user message JSON.", "prompt": user_message}
+    if not isinstance(payload, dict):
+        return {"error": "User message JSON is not an object.", "prompt": user_message}
+
+    fields: Dict[str, Any] = {"user_message": payload.get("user_message")}
+    svg_state = payload.get("svg_state")
+    if isinstance(svg_state, dict):
+        fields["svg_dimensions"] = svg_state.get("dimensions")
+    fields["canvas_state"] = payload.get("canvas_state")
+    fields["previous_results"] = payload.get("previous_results")
+    return fields
+
+
+class JsonLineFormatter(logging.Formatter):
+    """Format records as single-line JSON objects with capped, de-duplicated fields.
+
+    Records may carry ``event`` and ``fields`` attributes (via ``extra``);
+    ``fields`` is either a dict or a zero-argument callable producing one, which
+    lets callers defer expensive work to the writer thread. Any field whose
+    serialized form exceeds ``field_max_chars`` is truncated and its original
+    size recorded; fields in DEDUPLICATED_FIELDS are replaced by their hash
+    once the same content has been written recently.
+    """
+
+    def __init__(self, field_max_chars: int = DEFAULT_FIELD_MAX_CHARS) -> None:
+        super().__init__()
+        self.field_max_chars = max(64, field_max_chars)
+        self._seen_hashes: OrderedDict[str, None] = OrderedDict()
+
+    def format(self, record: logging.LogRecord) -> str:
+        # RotatingFileHandler formats once for its rollover check and again to
+        # emit; reuse the first result so hashes are only registered once.
+        cached = getattr(record, "_json_line", None)
+        if isinstance(cached, str):
+            return cached
+        entry: Dict[str, Any] = {
+            "ts": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+        }
+        event = getattr(record, "event", None)
+        if event:
+            entry["event"] = event
+        message = record.getMessage()
+        if message and message != event:
+            entry["message"] = self._cap("message", message, entry)
+        entry.update(self._structured_fields(record))
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exception"] = record.exc_text
+        line = _compact_json(entry)
+        setattr(record, "_json_line", line)
+        return line
+
+    def _structured_fields(self, record: logging.LogRecord) -> Dict[str, Any]:
+        fields = getattr(record, "fields", None)
+        if callable(fields):
+            try:
+                fields = fields()
+            except Exception as exc:
+                return {"fields_error": str(exc)}
+        if not isinstance(fields, dict):
+            return {}
+
+        result: Dict[str, Any] = {}
+        for key, value in fields.items():
+            if value is None:
+                continue
+            if key in DEDUPLICATED_FIELDS:
+                text = _compact_json(value, sort_keys=True)
+                digest = hashlib.sha1(text.encode("utf-8")).hexdigest()[:16]
+                result[f"{key}_hash"] = digest
+                if self._remember(digest):
+                    result[f"{key}_repeat"] = True
+                    continue
+            result[key] = self._cap(key, value, result)
+        return result
+
+    def _remember(self, digest: str) -> bool:
+        """Record a content hash; True if it was already seen recently."""
+        if digest in self._seen_hashes:
+            self._seen_hashes.move_to_end(digest)
+            return True
+        self._seen_hashes[digest] = None
+        if len(self._seen_hashes) > _SEEN_HASHES_LIMIT:
+            self._seen_hashes.popitem(last=False)
+        return False
+
+    def _cap(self, key: str, value: Any, target: Dict[str, Any]) -> Any:
+        text = value if isinstance(value, str) else _compact_json(value)
+        if len(text) <= self.field_max_chars:
+            return value
+        target[f"{key}_chars"] = len(text)
+        return text[: self.field_max_chars] + "...[truncated]"
+
+
+class StructuredQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that keeps exceptions and structured fields apart from the message.
+
+    The stock ``prepare`` formats the whole record into ``msg`` and drops
+    ``exc_info``; here only the message is merged and the traceback is
+    rendered to ``exc_text`` on the calling thread, while it is still live.
+    """
+
+    _exception_formatter = logging.Formatter()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        prepared = copy.copy(record)
+        prepared.msg = record.getMessage()
+        prepared.args = None
+        if record.exc_info:
+            prepared.exc_text = self._exception_formatter.formatException(record.exc_info)
+        prepared.exc_info = None
+        return prepared
+
+
+def start_log_pipeline(
+    log_file_path: str,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+    backup_count: int = DEFAULT_BACKUP_COUNT,
+    field_max_chars: int = DEFAULT_FIELD_MAX_CHARS,
+) -> Tuple[logging.handlers.QueueHandler, logging.handlers.QueueListener, queue.Queue[logging.LogRecord]]:
+    """Create a queue handler whose records are written as JSONL by a background listener.
+
+    Args:
+        log_file_path: Target file; rotated when it grows past ``max_bytes``
+        max_bytes: Rotation threshold in bytes (<= 0 disables rotation)
+        backup_count: Number of rotated files kept
+        field_max_chars: Per-field size cap passed to JsonLineFormatter
+
+    Returns:
+        (handler to attach to loggers, started listener, the queue between them)
+    """
+    file_handler = logging.handlers.RotatingFileHandler(
+        log_file_path,
+        maxBytes=max(0, max_bytes),
+        backupCount=max(0, backup_count),
+        encoding="utf-8",
+    )
+    file_handler.setFormatter(JsonLineFormatter(field_max_chars))
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue()
+    listener = logging.handlers.QueueListener(log_queue, file_handler, respect_handler_level=True)
+    listener.start()
+    return StructuredQueueHandler(log_queue), listener, log_queue
+
+
+def _stop_log_pipeline() -> None:
+    global _listener
+    with _pipeline_lock:
+        listener, _listener = _listener, None
+    if listener is not None:
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+
 class LogManager:
     """Manages application logging operations.
 
-    Provides session-based logging with automatic file rotation by date.
-    Logs user messages, AI responses, tool calls, and system events.
+    Provides session-based logging with daily log files rotated by size.
+    Logs user messages, AI responses, tool calls, and system events as JSON
+    lines written by a background thread.
     Supports optional forwarding of logs to the browser console.
     """
 
-    def __init__(self, logs_dir: str = "./logs/") -> None:
+    def __init__(self, logs_dir: Optional[str] = None) -> None:
         """Initialize LogManager with specified logs directory.
 
         Args:
-            logs_dir: Directory path for log files (default: './logs/')
+            logs_dir: Directory path for log files (default: LOG_DIR env var, else './logs/')
         """
-        self.logs_dir = logs_dir
+        self.logs_dir = logs_dir or os.getenv(LOG_DIR_ENV) or DEFAULT_LOGS_DIR
         self._logger: logging.Logger = logging.getLogger("mathud")
         self._setup_logging()
 
@@ -60,6 +264,7 @@ class LogManager:
         self._forward_to_browser: bool = self._should_forward_to_browser()
         self._forward_level_index: int = self._get_forward_level_index()
         self._pending_logs: List[Dict[str, str]] = []
+        self._pending_lock = threading.Lock()
 
     def _should_forward_to_browser(self) -> bool:
         """Determine if logs should be forwarded to browser.
@@ -88,75 +293,62 @@ class LogManager:
         """Get the log file name based on current date.
 
         Returns:
-            str: Date-based log filename (e.g., 'mathud_session_24_03_15.log')
+            str: Date-based log filename (e.g., 'mathud_session_24_03_15.jsonl')
         """
-        return datetime.now().strftime("mathud_session_%y_%m_%d.log")
+        return datetime.now().strftime("mathud_session_%y_%m_%d.jsonl")
 
     def _setup_logging(self) -> None:
         """Initialize logging configuration.
 
-        Creates logs directory if needed and configures daily log file rotation.
+        Creates logs directory if needed and starts the background JSONL writer.
+        The pipeline is process-wide: later LogManager instances reuse it.
         """
+        global _log_queue, _listener
         if not os.path.exists(self.logs_dir):
             os.makedirs(self.logs_dir)
 
-        log_file_path = os.path.join(self.logs_dir, self._get_log_file_name())
-
-        root_logger = logging.getLogger()
-        if not root_logger.handlers:
-            logging.basicConfig(
-                filename=log_file_path, level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s"
-            )
-
         self._logger.setLevel(logging.INFO)
         self._logger.propagate = False
-        if not self._logger.handlers:
-            handler = logging.FileHandler(log_file_path, encoding="utf-8")
-            handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
-            self._logger.addHandler(handler)
+        with _pipeline_lock:
+            if not self._logger.handlers:
+                log_file_path = os.path.join(self.logs_dir, self._get_log_file_name())
+                handler, _listener, _log_queue = start_log_pipeline(
+                    log_file_path,
+                    max_bytes=_env_int(LOG_MAX_BYTES_ENV, DEFAULT_MAX_BYTES),
+                    backup_count=_env_int(LOG_BACKUP_COUNT_ENV, DEFAULT_BACKUP_COUNT),
+                    field_max_chars=_env_int(LOG_FIELD_MAX_CHARS_ENV, DEFAULT_FIELD_MAX_CHARS),
+                )
+                # Only the application logger; the root logger stays the host's to configure
+                self._logger.addHandler(handler)
+                atexit.register(_stop_log_pipeline)
         self.log_new_session()
 
+    def flush(self) -> None:
+        """Block until every record queued so far has been written."""
+        log_queue = _log_queue
+        if log_queue is not None and _listener is not None:
+            log_queue.join()
+
+    def _log_event(self, event: str, fields: LogFields, level: int = logging.INFO) -> None:
+        self._logger.log(level, event, extra={"event": event, "fields": fields})
+
     def log_new_session(self) -> None:
         """Log a new session delimiter.
 
-        Creates a visual separator in the log file for new application sessions.
+        Writes a session_start record that marks a new application session.
         """
-        session_delimiter = f"\n\n###### SESSION {datetime.now().strftime('%H:%M:%S')} ######\n"
-        self._logger.info(session_delimiter)
+        self._log_event("session_start", {"started_at": datetime.now().strftime("%H:%M:%S")})
 
     def log_user_message(self, user_message: str) -> None:
         """Log user message and its components.
 
-        Parses and logs SVG state, canvas state, previous results, and user text.
+        The prompt JSON is parsed on the writer thread into SVG dimensions,
+        canvas state (de-duplicated by hash), previous results, and user text.
 
         Args:
             user_message: JSON string containing user interaction data
         """
-        try:
-            user_message_json_raw: JsonValue = json.loads(user_message)
-        except json.JSONDecodeError:
-            self._logger.error("Failed to decode user message JSON.")
-            return
-        if not isinstance(user_message_json_raw, dict):
-            self._logger.error("User message JSON is not an object.")
-            return
-        user_message_json: JsonObject = user_message_json_raw
-
-        svg_state = user_message_json.get("svg_state")
-        if isinstance(svg_state, dict):
-            self._logger.info(f"### SVG state dimensions: {svg_state.get('dimensions')}")
-
-        canvas_state = user_message_json.get("canvas_state")
-        if canvas_state is not None:
-            self._logger.info(f"### Canvas state: {canvas_state}")
-
-        previous_results = user_message_json.get("previous_results")
-        if previous_results is not None:
-            self._logger.info(f"### Previously calculated results: {previous_results}")
-
-        user_message_text = user_message_json.get("user_message")
-        if user_message_text is not None:
-            self._logger.info(f"### User message: {user_message_text}")
+        self._log_event("user_message", lambda: _user_message_fields(user_message))
 
     def log_ai_response(self, ai_message: str) -> None:
         """Log AI response message.
@@ -164,16 +356,20 @@ class LogManager:
         Args:
             ai_message: AI-generated response text
         """
-        self._logger.info(f"### AI response: {ai_message}")
+        self._log_event("ai_response", {"ai_message": ai_message})
 
     def log_ai_tool_calls(self, ai_tool_calls: Sequence[ProcessedToolCall] | Sequence[Dict[str, Any]] | None) -> None:
         """Log AI tool calls.
 
+        The calls are deep-copied, since callers keep mutating them (e.g. adding
+        results) while the record waits in the queue.
+
         Args:
             ai_tool_calls: List of AI-requested function calls (ProcessedToolCall or dict)
         """
         if ai_tool_calls is not None:
-            self._logger.info(f"### AI tool calls: {list(ai_tool_calls)}")
+            tool_calls = copy.deepcopy(list(ai_tool_calls))
+            self._log_event("ai_tool_calls", {"count": len(tool_calls), "tool_calls": tool_calls})
 
     def log_action_trace(self, trace_summary: Dict[str, Any]) -> None:
         """Log a structured action trace summary as a JSON line.
@@ -216,7 +412,8 @@ class LogManager:
         if source:
             entry["source"] = source
 
-        self._pending_logs.append(entry)
+        with self._pending_lock:
+            self._pending_logs.append(entry)
 
     def get_pending_logs(self) -> List[Dict[str, str]]:
         """Retrieve and clear all pending log entries for browser forwarding.
@@ -224,8 +421,9 @@ class LogManager:
         Returns:
             List of log entry dicts with 'level', 'message', and optional 'source'.
         """
-        logs = self._pending_logs
-        self._pending_logs = []
+        with self._pending_lock:
+            logs = self._pending_logs
+            self._pending_logs = []
         return logs
 
     def log_error(
@@ -20,7 +20,12 @@ from dotenv import load_dotenv
 from openai import OpenAI
 
 from static.ai_model import AIModel
-from static.canvas_state_summarizer import compare_canvas_states
+from static.canvas_state_summarizer import build_canvas_state_summary, measure_canvas_state_bytes
+from static.conversation_history import (
+    DEFAULT_KEEP_RECENT_TURNS,
+    DEFAULT_TOKEN_BUDGET,
+    ConversationHistory,
+)
 from static.functions_definitions import FUNCTIONS, FunctionDefinition
 from static.token_estimation import estimate_tokens_from_bytes
 
@@ -31,6 +36,9 @@ MessageContent = Union[str, List[Dict[str, Any]]]
 MessageDict = Dict[str, Any]
 StreamEvent = Dict[str, Any]
 
+# Where routes write the vision snapshot for the shared (default) conversation
+DEFAULT_CANVAS_SNAPSHOT_PATH = os.path.join("canvas_snapshots", "canvas.png")
+
 # Tool mode type
 ToolMode = Literal["full", "search"]
 
@@ -72,8 +80,18 @@ class OpenAIAPIBase:
     CANVAS_SUMMARY_MODE_ENV = "AI_CANVAS_SUMMARY_MODE"
     CANVAS_HYBRID_MAX_BYTES_ENV = "AI_CANVAS_HYBRID_FULL_MAX_BYTES"
     CANVAS_SUMMARY_TELEMETRY_ENV = "AI_CANVAS_SUMMARY_TELEMETRY"
+    CANVAS_SUMMARY_MAX_TOKENS_ENV = "AI_CANVAS_SUMMARY_MAX_TOKENS"
     DEFAULT_CANVAS_SUMMARY_MODE = "hybrid"
     DEFAULT_CANVAS_HYBRID_FULL_MAX_BYTES = 6000
+    DEFAULT_CANVAS_SUMMARY_MAX_TOKENS = 20000
+    HISTORY_TOKEN_BUDGET_ENV = "AI_HISTORY_TOKEN_BUDGET"
+    HISTORY_KEEP_TURNS_ENV = "AI_HISTORY_KEEP_TURNS"
+
+    # Vision snapshot read for this conversation; pooled sessions override it per instance.
+    canvas_snapshot_path: str = DEFAULT_CANVAS_SNAPSHOT_PATH
+    # PNG handed over in memory by the route for the request in flight. Empty bytes
+    # mean the route produced no image; only None (never handed over) reads the file.
+    canvas_snapshot_bytes: Optional[bytes] = None
 
     @staticmethod
     def _initialize_api_key() -> str:
@@ -107,6 +125,7 @@ class OpenAIAPIBase:
         tools: Optional[Sequence[FunctionDefinition]] = None,
         max_tokens: int = 16000,
         tool_mode: ToolMode = "full",
+        client: Optional[OpenAI] = None,
     ) -> None:
         """Initialize OpenAI API client and conversation state.
 
@@ -116,8 +135,9 @@ class OpenAIAPIBase:
             tools: Custom tool definitions. Defaults to all FUNCTIONS.
             max_tokens: Maximum tokens in response.
             tool_mode: Tool mode - "full" for all tools, "search" for search_tools + essentials.
+            client: Existing OpenAI client to share (it is thread-safe); a new one is created if omitted.
         """
-        self.client = OpenAI(api_key=self._initialize_api_key())
+        self.client = client if client is not None else OpenAI(api_key=self._initialize_api_key())
         self.model: AIModel = model if model is not None else AIModel.get_default_model()
         self.temperature = temperature
         self.max_tokens = max_tokens
@@ -243,59 +263,45 @@ class OpenAIAPIBase:
             print(msg)  # Console output
             _logger.info(msg)  # File logging
 
-    def _remove_canvas_state_from_user_messages(self) -> None:
-        """Remove canvas state from all user messages in the conversation history."""
-        for message in reversed(self.messages):
-            if message.get("role") == "user" and "content" in message:
-                content = message["content"]
-
-                if isinstance(content, list):
-                    for part in content:
-                        if isinstance(part, dict) and part.get("type") == "text":
-                            text_content = part.get("text", "")
-                            if "canvas_state" not in text_content:
-                                continue
-                            try:
-                                text_json = json.loads(text_content)
-                                if isinstance(text_json, dict):
-                                    text_json.pop("canvas_state", None)
-                                    text_json.pop("canvas_state_summary", None)
-                                    part["text"] = json.dumps(text_json)
-                            except json.JSONDecodeError:
-                                pass
-                    continue
-
-                if isinstance(content, str) and "canvas_state" in content:
-                    try:
-                        message_content_json = json.loads(content)
-                        if isinstance(message_content_json, dict):
-                            message_content_json.pop("canvas_state", None)
-                            message_content_json.pop("canvas_state_summary", None)
-                            message["content"] = json.dumps(message_content_json)
-                    except json.JSONDecodeError:
-                        pass
-
-    def _remove_images_from_user_messages(self) -> None:
-        """Remove image content from all user messages in the conversation history.
-
-        This reduces token usage for the fallback case when not using previous_response_id.
-        When using previous_response_id, OpenAI maintains the full context server-side.
+    @property
+    def history(self) -> ConversationHistory:
+        """Token-budgeted history manager for ``self.messages`` (created on first use).
+
+        Created lazily because provider subclasses do not all call this
+        class's ``__init__``.
         """
-        for message in reversed(self.messages):
-            if message.get("role") == "user" and "content" in message:
-                content = message["content"]
-                if not isinstance(content, list):
-                    continue
-                text_parts = [part for part in content if isinstance(part, dict) and part.get("type") == "text"]
-                if text_parts:
-                    text_part = text_parts[0]
-                    message["content"] = text_part.get("text", "")
+        manager: Optional[ConversationHistory] = self.__dict__.get("_history")
+        if manager is None:
+            manager = ConversationHistory(
+                token_budget=self._get_history_token_budget(),
+                keep_recent_turns=self._get_history_keep_turns(),
+            )
+            self._history = manager
+        return manager
+
+    def _get_history_token_budget(self) -> int:
+        raw_budget = os.getenv(self.HISTORY_TOKEN_BUDGET_ENV, str(DEFAULT_TOKEN_BUDGET))
+        try:
+            return int(raw_budget)
+        except (TypeError, ValueError):
+            return DEFAULT_TOKEN_BUDGET
+
+    def _get_history_keep_turns(self) -> int:
+        raw_turns = os.getenv(self.HISTORY_KEEP_TURNS_ENV, str(DEFAULT_KEEP_RECENT_TURNS))
+        try:
+            value = int(raw_turns)
+            if value <= 0:
+                raise ValueError
+            return value
+        except (TypeError, ValueError):
+            return DEFAULT_KEEP_RECENT_TURNS
 
     def _clean_conversation_history(self) -> None:
-        """Clean up the conversation history by removing canvas states and images."""
-        _logger.debug(f"All messages BEFORE removing canvas_state: \n{self.messages}\n\n")
-        self._remove_canvas_state_from_user_messages()
-        self._remove_images_from_user_messages()
+        """Settle the finished turn: clean its new messages once and enforce the history token budget.
+
+        Messages cleaned on earlier turns are not revisited; see ConversationHistory.
+        """
+        self.history.settle(self.messages)
 
     def _create_enhanced_prompt_with_image(
         self,
@@ -319,10 +325,16 @@ class OpenAIAPIBase:
         # Add canvas snapshot if vision is enabled
         if include_canvas_snapshot:
             try:
-                with open("canvas_snapshots/canvas.png", "rb") as image_file:
-                    image_data = base64.b64encode(image_file.read()).decode("utf-8")
+                png = self.canvas_snapshot_bytes
+                if png is None:
+                    with open(self.canvas_snapshot_path, "rb") as image_file:
+                        png = image_file.read()
+                if png:
+                    image_data = base64.b64encode(png).decode("utf-8")
                     content.append({"type": "image_url", "image_url": {"url": f"data:image/png;base64,{image_data}"}})
                     has_images = True
+                else:
+                    _logger.warning("Vision requested but no canvas snapshot was captured")
             except Exception as e:
                 error_msg = f"Failed to load canvas image: {e}"
                 print(error_msg)  # Console output
@@ -409,7 +421,7 @@ class OpenAIAPIBase:
             if self._should_include_full_state_in_hybrid(full_state_bytes):
                 return full_prompt
 
-        comparison = compare_canvas_states(canvas_state)
+        comparison = build_canvas_state_summary(canvas_state, max_tokens=self._get_canvas_summary_max_tokens())
         metrics = comparison.get("metrics", {})
         summary_state = comparison.get("summary", {})
         # If we reach this point, hybrid-under-threshold has already returned
@@ -446,14 +458,25 @@ class OpenAIAPIBase:
         except (TypeError, ValueError):
             return self.DEFAULT_CANVAS_HYBRID_FULL_MAX_BYTES
 
+    def _get_canvas_summary_max_tokens(self) -> int:
+        raw_limit = os.getenv(self.CANVAS_SUMMARY_MAX_TOKENS_ENV, str(self.DEFAULT_CANVAS_SUMMARY_MAX_TOKENS))
+        try:
+            value = int(raw_limit)
+            if value <= 0:
+                raise ValueError
+            return value
+        except (TypeError, ValueError):
+            return self.DEFAULT_CANVAS_SUMMARY_MAX_TOKENS
+
     def _should_include_full_state_in_hybrid(self, full_bytes: int) -> bool:
         if full_bytes <= 0:
             return False
         return full_bytes <= self._get_canvas_hybrid_full_max_bytes()
 
     def _measure_canvas_state_bytes(self, canvas_state: Dict[str, Any]) -> int:
+        # Only compared against the hybrid limit, so stop counting once past it
         try:
-            return len(json.dumps(canvas_state, separators=(",", ":"), sort_keys=True).encode("utf-8"))
+            return int(measure_canvas_state_bytes(canvas_state, limit=self._get_canvas_hybrid_full_max_bytes()))
         except (TypeError, ValueError):
             return 0
 
@@ -549,9 +572,10 @@ class OpenAIAPIBase:
             return
 
         results_str = json.dumps(results)
-        for message in reversed(self.messages):
-            if message.get("role") == "tool":
-                message["content"] = results_str
+        for index in range(len(self.messages) - 1, -1, -1):
+            if self.messages[index].get("role") == "tool":
+                self.messages[index]["content"] = results_str
+                self.history.note_updated(self.messages, index)
                 return
 
     def _parse_prompt_json(self, full_prompt: str) -> Optional[Dict[str, Any]]:
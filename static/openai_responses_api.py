@@ -13,6 +13,8 @@ from collections.abc import Iterator
 from types import SimpleNamespace
 from typing import Any, Dict, List, Optional
 
+from openai import OpenAI
+
 from static.openai_api_base import OpenAIAPIBase, MessageDict, StreamEvent
 
 # Use the shared MatHud logger for file logging
@@ -27,9 +29,9 @@ class OpenAIResponsesAPI(OpenAIAPIBase):
     across turns without manual stripping or context management.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, client: Optional[OpenAI] = None) -> None:
         """Initialize the Responses API with log deduplication and response ID tracking."""
-        super().__init__()
+        super().__init__(client=client)
         self._last_log_message: Optional[str] = None
         self._log_repeat_count: int = 0
         self._previous_response_id: Optional[str] = None
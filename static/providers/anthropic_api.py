@@ -3,16 +3,21 @@ MatHud Anthropic API Provider
 
 Anthropic Claude API implementation as a self-contained provider module.
 Inherits shared functionality from OpenAIAPIBase for message history management.
+
+Requests are built to make the most of Anthropic prompt caching: converted
+messages and tool definitions are reused across turns, and cache breakpoints
+mark the stable prefix (tools, system prompt, older history).
 """
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import os
 from collections.abc import Iterator, Sequence
 from types import SimpleNamespace
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, NamedTuple, Optional
 
 from dotenv import load_dotenv
 
@@ -23,6 +28,22 @@ from static.providers import PROVIDER_ANTHROPIC, ProviderRegistry
 
 _logger = logging.getLogger("mathud")
 
+# Marks the end of a prompt prefix that Anthropic caches for later requests
+CACHE_CONTROL: Dict[str, str] = {"type": "ephemeral"}
+
+# Converted tool sets kept at once (full, search, and recent injected sets)
+MAX_CACHED_TOOL_SETS = 8
+
+
+class _ConvertedMessage(NamedTuple):
+    """Bookkeeping for one history message already converted to Anthropic format."""
+
+    source: MessageDict
+    content: Any
+    tool_calls: Any
+    output_length: int
+    last_output: Optional[Dict[str, Any]]
+
 
 def _get_anthropic_api_key() -> str:
     """Get the Anthropic API key from environment."""
@@ -84,19 +105,46 @@ class AnthropicAPI(OpenAIAPIBase):
         self.messages: List[MessageDict] = []
         self._system_prompt = OpenAIAPIBase.DEV_MSG
 
+        # Incremental conversion state, see _convert_messages_to_anthropic()
+        self._converted_messages: List[Dict[str, Any]] = []
+        self._conversion_log: List[_ConvertedMessage] = []
+        self._converted_tool_sets: Dict[str, List[Dict[str, Any]]] = {}
+        self._converted_tools_source: Optional[Sequence[FunctionDefinition]] = None
+        self._converted_tools: List[Dict[str, Any]] = []
+
         # Dummy OpenAI client - not used but needed for base class compatibility
         self.client = None
 
     def reset_conversation(self) -> None:
         """Reset the conversation history."""
         self.messages = []
+        self._converted_messages = []
+        self._conversion_log = []
 
     def _convert_tools_to_anthropic(self) -> List[Dict[str, Any]]:
         """Convert OpenAI-style tools to Anthropic format.
 
         OpenAI: {"type": "function", "function": {"name": "x", "parameters": {...}}}
         Anthropic: {"name": "x", "input_schema": {...}}
+
+        Conversions are memoized per tool-set hash. Tool sets are replaced, never
+        mutated, so the hash is only recomputed when ``self.tools`` is reassigned.
         """
+        if self.tools is self._converted_tools_source:
+            return self._converted_tools
+
+        digest = hashlib.sha256(json.dumps(list(self.tools), sort_keys=True, default=str).encode("utf-8")).hexdigest()
+        converted = self._converted_tool_sets.get(digest)
+        if converted is None:
+            converted = self._build_anthropic_tools()
+            if len(self._converted_tool_sets) >= MAX_CACHED_TOOL_SETS:
+                del self._converted_tool_sets[next(iter(self._converted_tool_sets))]
+            self._converted_tool_sets[digest] = converted
+        self._converted_tools_source = self.tools
+        self._converted_tools = converted
+        return converted
+
+    def _build_anthropic_tools(self) -> List[Dict[str, Any]]:
         anthropic_tools = []
         for tool in self.tools:
             if not isinstance(tool, dict):
@@ -121,74 +169,114 @@ class AnthropicAPI(OpenAIAPIBase):
         - user messages → user messages
         - assistant messages with tool_calls → assistant with tool_use content blocks
         - tool messages → user messages with tool_result content blocks
+
+        Only messages after the longest unchanged prefix of ``self.messages`` are
+        converted; the prefix is reused from the previous call. A message is
+        unchanged while the same dict holds the same content and tool_calls
+        objects, because history cleaning, compaction, and tool results replace
+        those values instead of mutating them.
         """
+        reused = 0
+        for entry, msg in zip(self._conversion_log, self.messages):
+            if entry.source is not msg or entry.content is not msg.get("content"):
+                break
+            if entry.tool_calls is not msg.get("tool_calls"):
+                break
+            reused += 1
+        del self._conversion_log[reused:]
+
         anthropic_messages: List[Dict[str, Any]] = []
+        if reused:
+            last_entry = self._conversion_log[-1]
+            anthropic_messages = self._converted_messages[: last_entry.output_length]
+            if last_entry.last_output is not None:
+                # Undo tool results merged into this message by messages that changed since
+                anthropic_messages[-1] = last_entry.last_output
+
+        for msg in self.messages[reused:]:
+            self._append_anthropic_message(anthropic_messages, msg)
+            self._conversion_log.append(
+                _ConvertedMessage(
+                    source=msg,
+                    content=msg.get("content"),
+                    tool_calls=msg.get("tool_calls"),
+                    output_length=len(anthropic_messages),
+                    last_output=anthropic_messages[-1] if anthropic_messages else None,
+                )
+            )
 
-        for msg in self.messages:
-            role = msg.get("role", "")
-            content = msg.get("content", "")
+        self._converted_messages = anthropic_messages
+        return list(anthropic_messages)
 
-            if role == "developer" or role == "system":
-                # System messages are handled via system parameter
-                continue
+    def _append_anthropic_message(self, anthropic_messages: List[Dict[str, Any]], msg: MessageDict) -> None:
+        """Convert one message onto ``anthropic_messages``.
 
-            elif role == "user":
-                # Convert user message
-                if isinstance(content, str):
-                    anthropic_messages.append({"role": "user", "content": content})
-                elif isinstance(content, list):
-                    # Handle multi-modal content (images)
-                    anthropic_content = self._convert_content_blocks(content)
-                    anthropic_messages.append({"role": "user", "content": anthropic_content})
-
-            elif role == "assistant":
-                # Convert assistant message
-                tool_calls = msg.get("tool_calls", [])
-                if tool_calls:
-                    # Convert to tool_use content blocks
-                    content_blocks = []
-                    if content:
-                        content_blocks.append({"type": "text", "text": content})
-                    for tc in tool_calls:
-                        if not isinstance(tc, dict):
-                            continue
-                        func = tc.get("function", {})
-                        args_str = func.get("arguments", "{}")
-                        try:
-                            args = json.loads(args_str) if isinstance(args_str, str) else args_str
-                        except json.JSONDecodeError:
-                            args = {}
-                        content_blocks.append(
-                            {
-                                "type": "tool_use",
-                                "id": tc.get("id", ""),
-                                "name": func.get("name", ""),
-                                "input": args,
-                            }
-                        )
-                    anthropic_messages.append({"role": "assistant", "content": content_blocks})
-                else:
-                    anthropic_messages.append({"role": "assistant", "content": content or ""})
-
-            elif role == "tool":
-                # Convert tool result - Anthropic expects this as a user message with tool_result
-                tool_call_id = msg.get("tool_call_id", "")
-                tool_result = {
-                    "type": "tool_result",
-                    "tool_use_id": tool_call_id,
-                    "content": content if isinstance(content, str) else json.dumps(content),
-                }
-                # Check if last message is a user message with tool_results, merge if so
-                if anthropic_messages and anthropic_messages[-1].get("role") == "user":
-                    last_content = anthropic_messages[-1].get("content", [])
-                    if isinstance(last_content, list):
-                        last_content.append(tool_result)
-                    else:
-                        anthropic_messages[-1]["content"] = [{"type": "text", "text": last_content}, tool_result]
-                else:
-                    anthropic_messages.append({"role": "user", "content": [tool_result]})
+        Earlier converted messages are replaced rather than mutated, so prefixes
+        reused by _convert_messages_to_anthropic() are never affected.
+        """
+        role = msg.get("role", "")
+        content = msg.get("content", "")
 
-        return anthropic_messages
+        if role == "developer" or role == "system":
+            # System messages are handled via system parameter
+            return
+
+        if role == "user":
+            # Convert user message
+            if isinstance(content, str):
+                anthropic_messages.append({"role": "user", "content": content})
+            elif isinstance(content, list):
+                # Handle multi-modal content (images)
+                anthropic_content = self._convert_content_blocks(content)
+                anthropic_messages.append({"role": "user", "content": anthropic_content})
+
+        elif role == "assistant":
+            # Convert assistant message
+            tool_calls = msg.get("tool_calls", [])
+            if tool_calls:
+                # Convert to tool_use content blocks
+                content_blocks = []
+                if content:
+                    content_blocks.append({"type": "text", "text": content})
+                for tc in tool_calls:
+                    if not isinstance(tc, dict):
+                        continue
+                    func = tc.get("function", {})
+                    args_str = func.get("arguments", "{}")
+                    try:
+                        args = json.loads(args_str) if isinstance(args_str, str) else args_str
+                    except json.JSONDecodeError:
+                        args = {}
+                    content_blocks.append(
+                        {
+                            "type": "tool_use",
+                            "id": tc.get("id", ""),
+                            "name": func.get("name", ""),
+                            "input": args,
+                        }
+                    )
+                anthropic_messages.append({"role": "assistant", "content": content_blocks})
+            else:
+                anthropic_messages.append({"role": "assistant", "content": content or ""})
+
+        elif role == "tool":
+            # Convert tool result - Anthropic expects this as a user message with tool_result
+            tool_call_id = msg.get("tool_call_id", "")
+            tool_result = {
+                "type": "tool_result",
+                "tool_use_id": tool_call_id,
+                "content": content if isinstance(content, str) else json.dumps(content),
+            }
+            # Check if last message is a user message with tool_results, merge if so
+            if anthropic_messages and anthropic_messages[-1].get("role") == "user":
+                last_content = anthropic_messages[-1].get("content", [])
+                if isinstance(last_content, list):
+                    merged = last_content + [tool_result]
+                else:
+                    merged = [{"type": "text", "text": last_content}, tool_result]
+                anthropic_messages[-1] = {"role": "user", "content": merged}
+            else:
+                anthropic_messages.append({"role": "user", "content": [tool_result]})
 
     def _convert_content_blocks(self, content: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Convert OpenAI content blocks to Anthropic format."""
@@ -237,6 +325,88 @@ class AnthropicAPI(OpenAIAPIBase):
         message_content = self._prepare_message_content(full_prompt)
         return {"role": "user", "content": message_content}
 
+    def _build_request_kwargs(self) -> Dict[str, Any]:
+        """Build the messages API arguments with prompt-cache breakpoints.
+
+        Breakpoints end the tool definitions, the system prompt, the history
+        before the newest user prompt, and, inside a tool-call loop, the latest
+        tool results. Anthropic allows four per request.
+        """
+        anthropic_messages = self._mark_history_breakpoints(self._convert_messages_to_anthropic())
+        anthropic_tools = self._convert_tools_to_anthropic()
+
+        system: Any = self._system_prompt
+        if system:
+            system = [{"type": "text", "text": system, "cache_control": CACHE_CONTROL}]
+
+        request_kwargs: Dict[str, Any] = {
+            "model": self.model.id,
+            "max_tokens": self.max_tokens,
+            "system": system,
+            "messages": anthropic_messages,
+            "temperature": self.temperature,
+        }
+        # Anthropic API doesn't accept empty tools list - must be None or non-empty
+        if anthropic_tools:
+            request_kwargs["tools"] = anthropic_tools[:-1] + [{**anthropic_tools[-1], "cache_control": CACHE_CONTROL}]
+        return request_kwargs
+
+    def _mark_history_breakpoints(self, anthropic_messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Add cache breakpoints to a converted message list (marked messages are copies).
+
+        Older turns end right before the newest user prompt, so a new prompt reads
+        them from the cache. Messages holding only tool results are not prompts;
+        when the list ends with them, the request continues a tool-call loop and
+        they are marked too, so the next round reads them from the cache.
+        """
+        prompt_index: Optional[int] = None
+        for index in range(len(anthropic_messages) - 1, -1, -1):
+            message = anthropic_messages[index]
+            if message.get("role") == "user" and not self._is_tool_result_message(message):
+                prompt_index = index
+                break
+
+        if prompt_index is not None:
+            for index in range(prompt_index - 1, -1, -1):
+                marked = self._with_cache_breakpoint(anthropic_messages[index])
+                if marked is not None:
+                    anthropic_messages[index] = marked
+                    break
+
+        last_index = len(anthropic_messages) - 1
+        if last_index >= 0 and last_index != prompt_index and self._is_tool_result_message(anthropic_messages[-1]):
+            marked = self._with_cache_breakpoint(anthropic_messages[-1])
+            if marked is not None:
+                anthropic_messages[-1] = marked
+        return anthropic_messages
+
+    @staticmethod
+    def _is_tool_result_message(message: Dict[str, Any]) -> bool:
+        content = message.get("content")
+        if not isinstance(content, list) or not content:
+            return False
+        return all(isinstance(block, dict) and block.get("type") == "tool_result" for block in content)
+
+    @staticmethod
+    def _with_cache_breakpoint(message: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Return a copy of ``message`` whose last content block carries a breakpoint.
+
+        Returns None when the message has no block that can be marked (empty text).
+        """
+        content = message.get("content")
+        if isinstance(content, str):
+            if not content:
+                return None
+            blocks = [{"type": "text", "text": content, "cache_control": CACHE_CONTROL}]
+        elif isinstance(content, list) and content and isinstance(content[-1], dict):
+            last_block = content[-1]
+            if last_block.get("type") == "text" and not last_block.get("text"):
+                return None
+            blocks = content[:-1] + [{**last_block, "cache_control": CACHE_CONTROL}]
+        else:
+            return None
+        return {**message, "content": blocks}
+
     def create_chat_completion(self, full_prompt: str) -> Any:
         """Create chat completion with Anthropic API."""
         user_message = self._parse_and_prepare_message(full_prompt)
@@ -244,20 +414,7 @@ class AnthropicAPI(OpenAIAPIBase):
             self.messages.append(user_message)
 
         try:
-            anthropic_messages = self._convert_messages_to_anthropic()
-            anthropic_tools = self._convert_tools_to_anthropic()
-
-            # Anthropic API doesn't accept empty tools list - must be None or non-empty
-            create_kwargs = {
-                "model": self.model.id,
-                "max_tokens": self.max_tokens,
-                "system": self._system_prompt,
-                "messages": anthropic_messages,
-                "temperature": self.temperature,
-            }
-            if anthropic_tools:
-                create_kwargs["tools"] = anthropic_tools
-
+            create_kwargs = self._build_request_kwargs()
             response = self._anthropic_client.messages.create(**create_kwargs)
         except Exception as e:
             error_msg = f"[Anthropic API] Error during API call: {e}"
@@ -340,20 +497,7 @@ class AnthropicAPI(OpenAIAPIBase):
         finish_reason: Optional[str] = None
 
         try:
-            anthropic_messages = self._convert_messages_to_anthropic()
-            anthropic_tools = self._convert_tools_to_anthropic()
-
-            # Anthropic API doesn't accept empty tools list - must be None or non-empty
-            stream_kwargs = {
-                "model": self.model.id,
-                "max_tokens": self.max_tokens,
-                "system": self._system_prompt,
-                "messages": anthropic_messages,
-                "temperature": self.temperature,
-            }
-            if anthropic_tools:
-                stream_kwargs["tools"] = anthropic_tools
-
+            stream_kwargs = self._build_request_kwargs()
             with self._anthropic_client.messages.stream(**stream_kwargs) as stream:
                 for event in stream:
                     event_type = getattr(event, "type", "")
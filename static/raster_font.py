@@ -0,0 +1,147 @@
+"""
+MatHud Raster Font
+
+Fixed-width bitmap glyphs used by the server-side canvas rasterizer to draw
+labels without a font engine. Glyphs cover printable ASCII and a handful of
+math symbols, rasterized once from DejaVu Sans Mono at 15 px; characters
+outside the table fall back to a hollow box.
+
+Each glyph is GLYPH_HEIGHT rows of GLYPH_WIDTH bits, stored as three hex
+digits per row with the leftmost pixel in the highest bit.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Tuple
+
+GLYPH_WIDTH: int = 9
+GLYPH_HEIGHT: int = 16
+# Rows above the baseline; the remaining rows hold descenders
+GLYPH_ASCENT: int = 12
+# Nominal font size in pixels that a glyph renders at without scaling
+GLYPH_PIXEL_SIZE: int = 15
+
+_GLYPH_HEX: Dict[str, str] = {
+    " ": "000000000000000000000000000000000000000000000000",
+    "!": "000010010010010010010010010000010010000000000000",
+    '"': "00002806c06c06c000000000000000000000000000000000",
+    "#": "0000120160240ff06c02c06c1fe048058090000000000000",
+    "$": "0000100380740d00d007001c01601209607c010010000000",
+    "%": "0000000e01101100e201806401a01101300e000000000000",
+    "&": "0000780400400400600f009918b0860c607b000000000000",
+    "'": "000010010010010000000000000000000000000000000000",
+    "(": "000008018010010030030030030030010010018008000000",
+    ")": "000020030010018018018018018018010010030020000000",
+    "*": "00001001007c038054010010000000000000000000000000",
+    "+": "0000000000100100100100fe010010010000000000000000",
+    ",": "000000000000000000000000000000018010030020000000",
+    "-": "000000000000000000000038038000000000000000000000",
+    ".": "000000000000000000000000000000010010000000000000",
+    "/": "00000600400c0080180100300200200600400c0000000000",
+    "0": "0000380440c60c60c60d20c60c60c604407c000000000000",
+    "1": "00007807801801801801801801801801807e000000000000",
+    "2": "00007808c00600600400c0180300600c00fe000000000000",
+    "3": "00007800c00600603c03c0060060060860fc000000000000",
+    "4": "00000c01c01c02c06c04c08c0fe00c00c00c000000000000",
+    "5": "00007c0c00c00c00f800c00600600608c0f8000000000000",
+    "6": "00003c0600c00c00fc0c60c60c20c604607c000000000000",
+    "7": "0000fe00600400c008008018010030030020000000000000",
+    "8": "00007c0c60c60c606c07c0c60c20c20c607c000000000000",
+    "9": "0000780c40c60860860c607e00600600c078000000000000",
+    ":": "000000000000010010000000000000010010000000000000",
+    ";": "000000000000010010000000000000018010030020000000",
+    "<": "00000000000000601c0e00c007000e002000000000000000",
+    "=": "0000000000000000fe0000000fe000000000000000000000",
+    ">": "0000000000000c007000e00601c0e0080000000000000000",
+    "?": "00007c04400600400c018010010000010010000000000000",
+    "@": "00000003c04208309f13312112113309f08004003c000000",
+    "A": "00001803802802806c0440440fe0c6082183000000000000",
+    "B": "0000fc0c60c60c60cc0fc0c60c20c20c60fc000000000000",
+    "C": "00003e0620400c00c00c00c00c004006203e000000000000",
+    "D": "0000f80cc0c60c60c60c60c60c60c60cc0f8000000000000",
+    "E": "00007e0c00c00c00fc0fe0c00c00c00c00fe000000000000",
+    "F": "00007e04004004007c07c040040040040040000000000000",
+    "G": "00003c0620c00c008008e08e0820c206603e000000000000",
+    "H": "0000820c60c60c60fe0fe0c60c60c60c60c6000000000000",
+    "I": "00007c0100100100100100100100100100fe000000000000",
+    "J": "00003c00c00c00c00c00c00c00c00c08c0f8000000000000",
+    "K": "0000820c40cc0d80f00f00d80cc0c40c60c3000000000000",
+    "L": "00004004004004004004004004004004007e000000000000",
+    "M": "0000c60c60c60aa0aa0ba092082082082082000000000000",
+    "N": "0000c20c20e20e20f20d20da0ca0ce0c60c6000000000000",
+    "O": "00007c0440c60c60820820820c20c604407c000000000000",
+    "P": "00007c0c60c20c20c60fe0f80c00c00c00c0000000000000",
+    "Q": "00007c0440c60c60820820820c20c604407c00c004000000",
+    "R": "0000f80cc0c60c60c60fc0cc0c40c60c20c3000000000000",
+    "S": "00007c0c00800c00e007c0060020020860fc000000000000",
+    "T": "0001ff010010010010010010010010010010000000000000",
+    "U": "0000c20c60c60c60c60c60c60c60c60c607c000000000000",
+    "V": "0000820820c60c604404406c028028038038000000000000",
+    "W": "0001011831830930ba0ba0aa0ee0ee0c6044000000000000",
+    "X": "00008204606402803801803806c0440c6183000000000000",
+    "Y": "0000820c604406c038038010010010010010000000000000",
+    "Z": "0000fe00600600c0080180300200600c00ff000000000000",
+    "[": "00003803003003003003003003003003003003003c000000",
+    "\\": "0000800c004006002003001001800800c004006000000000",
+    "]": "000038018018018018018018018018018018018078000000",
+    "^": "000018038044082000000000000000000000000000000000",
+    "_": "0000000000000000000000000000000000000000000001ff",
+    "`": "060030010000000000000000000000000000000000000000",
+    "a": "00000000000007c00600607e0c60860c607e000000000000",
+    "b": "0000c00c00c00fc0c60c20c20c20c20c60fc000000000000",
+    "c": "00000000000003e0600400c00c004006003e000000000000",
+    "d": "00000600600607e0c60860860860c60c607e000000000000",
+    "e": "00000000000007c0c60c20fe0c00c004207e000000000000",
+    "f": "00001e0100300fe010010010010010010010000000000000",
+    "g": "00000000000007e0c60860860860c604e07e006004078000",
+    "h": "0000c00c00c00fc0c60c60c60c60c60c60c6000000000000",
+    "i": "0000100000000700100100100100100100fe000000000000",
+    "j": "0000180000000780180180180180180180180180180f0000",
+    "k": "00004004004004604c05007804804c046042000000000000",
+    "l": "0600f003003003003003003003003001001e000000000000",
+    "m": "0000000000000fe092092092092092092092000000000000",
+    "n": "0000000000000fc0c60c60c60c60c60c60c6000000000000",
+    "o": "00000000000007c0c60c60820820c604607c000000000000",
+    "p": "0000000000000fc0c60c20c20c20c20c60fc0c00c00c0000",
+    "q": "00000000000007e0c60c60860860c604607e006006006000",
+    "r": "00000000000002e030020020020020020020000000000000",
+    "s": "00000000000007c04004007800c00600407c000000000000",
+    "t": "0000000300300fc03003003003003003001e000000000000",
+    "u": "0000000000000c60c60c60c60c60c604607e000000000000",
+    "v": "0000000000000820c604404406c028038038000000000000",
+    "w": "0000000000001011830920920aa0ee06c044000000000000",
+    "x": "0000000000000c606c03801003806c044082000000000000",
+    "y": "0000000000000820c604406402c0280380100100300e0000",
+    "z": "00000000000007e0040080180300600400fe000000000000",
+    "{": "00001c01001001001003006003001001001001001c000000",
+    "|": "010010010010010010010010010010010010010010010010",
+    "}": "00007001001001001001800c018010010010010070000000",
+    "~": "0000000000000000000600fe000000000000000000000000",
+    # Math symbols that appear in angle, tick and formula labels
+    "°": "000038044044028010000000000000000000000000000000",
+    "π": "0000000000000ff044044044044044044047000000000000",
+    "θ": "00003806c0c60c60c60fe0c60c60c604403c000000000000",
+    "−": "0000000000000000000000fe000000000000000000000000",
+    "×": "0000000000000c606c03803806c0c6000000000000000000",
+    "·": "000000000000000000010010000000000000000000000000",
+    "√": "0020020020040040c4048048028038030030000000000000",
+    "∞": "0000000000000000ee1191111390ee000000000000000000",
+    "≤": "00000000000000201e0f00e003c0060000fe000000000000",
+    "≥": "0000000000000800f001e00e0780c00000fe000000000000",
+}
+
+_FALLBACK_GLYPH: Tuple[int, ...] = (0, 0, 0, 0x0FE, 0x082, 0x082, 0x082, 0x082, 0x082, 0x082, 0x082, 0x0FE, 0, 0, 0, 0)
+
+_decoded: Dict[str, Tuple[int, ...]] = {}
+
+
+def glyph_rows(char: str) -> Tuple[int, ...]:
+    """Return the bit rows for ``char``, decoding lazily and caching the result."""
+    rows = _decoded.get(char)
+    if rows is None:
+        encoded = _GLYPH_HEX.get(char)
+        if encoded is None:
+            return _FALLBACK_GLYPH
+        rows = tuple(int(encoded[i : i + 3], 16) for i in range(0, len(encoded), 3))
+        _decoded[char] = rows
+    return rows
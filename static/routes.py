@@ -18,9 +18,11 @@ import hmac
 import json
 import math
 import os
+import threading
 import time
 from collections.abc import Callable, Iterator, Set as AbstractSet
-from typing import Any, Dict, List, Optional, TypeVar, Union, cast
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional, Tuple, TypeVar, Union, cast
 
 from flask import Response, flash, jsonify, redirect, render_template, request, session, stream_with_context, url_for
 from flask.typing import ResponseReturnValue
@@ -28,6 +30,13 @@ from flask.typing import ResponseReturnValue
 from static.ai_model import AIModel, PROVIDER_OPENAI, PROVIDER_ANTHROPIC, PROVIDER_OPENROUTER, PROVIDER_OLLAMA
 from static.app_manager import AppManager, MatHudFlask
 from static.canvas_state_summarizer import compare_canvas_states
+from static.client_bundle import bundle_file_names, send_bundle_file
+from static.conversation_pool import (
+    DEFAULT_SESSION_ID,
+    SESSION_HEADER,
+    ConversationSession,
+    is_valid_session_id,
+)
 from static.openai_api_base import OpenAIAPIBase
 from static.providers import ProviderRegistry, create_provider_instance
 from static.tool_call_processor import ProcessedToolCall, ToolCallProcessor
@@ -46,29 +55,88 @@ login_attempts: Dict[str, float] = {}
 ToolCallList = List[ProcessedToolCall]
 CANVAS_SNAPSHOT_DIR = "canvas_snapshots"
 CANVAS_SNAPSHOT_PATH = os.path.join(CANVAS_SNAPSHOT_DIR, "canvas.png")
+# How long a request waits for another request on the same session to finish
+CONVERSATION_LOCK_TIMEOUT_SECONDS = 120.0
+# Concurrent vision requests must not each start their own WebDriver pool
+_webdriver_init_lock = threading.Lock()
 
 
-def get_provider_for_model(app: MatHudFlask, model_id: str) -> OpenAIAPIBase:
+def _request_session_id() -> Optional[str]:
+    """Return the client session id sent with the current request, if any."""
+    return request.headers.get(SESSION_HEADER) or None
+
+
+def _acquire_conversation(app: MatHudFlask) -> Tuple[Optional[ConversationSession], Callable[[], None]]:
+    """Check out and lock the conversation of the current request's session.
+
+    Returns (None, no-op) when another request holds the session for longer
+    than CONVERSATION_LOCK_TIMEOUT_SECONDS. The release callback is idempotent
+    so streaming routes can call it both when the generator finishes and when
+    the response is closed.
+    """
+    conversation = app.conversations.acquire(_request_session_id())
+    if not conversation.lock.acquire(timeout=CONVERSATION_LOCK_TIMEOUT_SECONDS):
+        app.conversations.release(conversation)
+        return None, lambda: None
+
+    released = False
+
+    def release() -> None:
+        nonlocal released
+        if released:
+            return
+        released = True
+        conversation.lock.release()
+        app.conversations.release(conversation)
+
+    return conversation, release
+
+
+@contextmanager
+def _locked_conversation(app: MatHudFlask) -> Iterator[Optional[ConversationSession]]:
+    """Context manager form of _acquire_conversation for non-streaming routes."""
+    conversation, release = _acquire_conversation(app)
+    try:
+        yield conversation
+    finally:
+        release()
+
+
+def _conversation_busy_response() -> ResponseReturnValue:
+    return AppManager.make_response(
+        message="This conversation is busy with another request. Try again shortly.",
+        status="error",
+        code=409,
+    )
+
+
+def get_provider_for_model(
+    app: MatHudFlask,
+    model_id: str,
+    conversation: Optional[ConversationSession] = None,
+) -> OpenAIAPIBase:
     """Get or create the appropriate provider instance for a model.
 
     Args:
         app: The Flask application instance
         model_id: The model identifier
+        conversation: Session whose providers to use (defaults to the shared conversation)
 
     Returns:
         The API provider instance for the model
     """
+    conversation = conversation or app.conversations.default
     model = AIModel.from_identifier(model_id)
     provider_name = model.provider
 
     # For OpenAI, use the existing api instances
     if provider_name == PROVIDER_OPENAI:
         if model.is_reasoning_model:
-            return app.responses_api
-        return app.ai_api
+            return conversation.responses_api
+        return conversation.ai_api
 
     # For other providers, use lazy-loaded instances
-    if provider_name not in app.providers:
+    if provider_name not in conversation.providers:
         create_kwargs: Dict[str, Any] = {"model": model}
         # Keep providers in search-first mode by default to reduce initial tool payload.
         if provider_name != PROVIDER_OLLAMA:
@@ -79,32 +147,78 @@ def get_provider_for_model(app: MatHudFlask, model_id: str) -> OpenAIAPIBase:
             raise ValueError(
                 f"Provider '{provider_name}' is not available. Check that the API key is configured in .env."
             )
-        app.providers[provider_name] = provider_instance
+        conversation.add_provider(provider_name, provider_instance)
 
     # Update the model on the cached provider instance
-    provider = app.providers[provider_name]
+    provider = conversation.providers[provider_name]
     provider.set_model(model_id)
     return provider
 
 
-def save_canvas_snapshot_from_data_url(data_url: str) -> bool:
+def save_canvas_snapshot_from_data_url(data_url: str, path: Optional[str] = None) -> bool:
+    """Decode a canvas data URL and write it to ``path`` (default CANVAS_SNAPSHOT_PATH)."""
+    image_bytes = _canvas_snapshot_from_data_url(data_url)
+    return image_bytes is not None and _write_canvas_snapshot(image_bytes, path)
+
+
+def _canvas_snapshot_from_data_url(data_url: str) -> Optional[bytes]:
     if not isinstance(data_url, str):
-        return False
+        return None
     parts = data_url.split(",", 1)
     if len(parts) != 2:
-        return False
+        return None
     metadata, encoded = parts
     metadata = metadata.strip().lower()
     if not metadata.startswith("data:image"):
-        return False
+        return None
     try:
-        image_bytes = base64.b64decode(encoded)
+        return base64.b64decode(encoded)
     except Exception as exc:
         print(f"Failed to decode canvas snapshot: {exc}")
-        return False
+        return None
+
+
+def _canvas_snapshot_from_state(
+    canvas_state: Dict[str, Any],
+    svg_state: Optional[Dict[str, Any]] = None,
+) -> Optional[bytes]:
+    """Rasterize a canvas state on the server and return the PNG bytes.
+
+    Returns None when the state contains drawables the server rasterizer
+    cannot reproduce, or rendering fails, so the caller can fall back to a
+    browser capture.
+    """
+    # Imported lazily: the rasterizer loads the client drawable modules.
+    from static.canvas_rasterizer import DEFAULT_RASTER_HEIGHT, DEFAULT_RASTER_WIDTH, CanvasRasterizer
+
+    width, height = DEFAULT_RASTER_WIDTH, DEFAULT_RASTER_HEIGHT
+    dimensions = svg_state.get("dimensions") if isinstance(svg_state, dict) else None
+    if isinstance(dimensions, dict):
+        try:
+            width = int(float(dimensions["width"])) or width
+            height = int(float(dimensions["height"])) or height
+        except (KeyError, TypeError, ValueError):
+            pass
+
+    rasterizer = CanvasRasterizer(width, height)
+    if rasterizer.unsupported_buckets(canvas_state):
+        return None
     try:
-        os.makedirs(CANVAS_SNAPSHOT_DIR, exist_ok=True)
-        with open(CANVAS_SNAPSHOT_PATH, "wb") as snapshot_file:
+        image_bytes: bytes = rasterizer.render_png(canvas_state)
+    except Exception as exc:
+        print(f"Server canvas rasterization failed: {exc}")
+        return None
+    if rasterizer.skipped_drawables:
+        # The image would be missing drawables the user can see; let the browser capture it.
+        return None
+    return image_bytes
+
+
+def _write_canvas_snapshot(image_bytes: bytes, path: Optional[str] = None) -> bool:
+    path = path or CANVAS_SNAPSHOT_PATH
+    try:
+        os.makedirs(os.path.dirname(path) or CANVAS_SNAPSHOT_DIR, exist_ok=True)
+        with open(path, "wb") as snapshot_file:
             snapshot_file.write(image_bytes)
         return True
     except Exception as exc:
@@ -112,6 +226,11 @@ def save_canvas_snapshot_from_data_url(data_url: str) -> bool:
         return False
 
 
+def is_server_canvas_raster_enabled() -> bool:
+    """Whether vision snapshots may be rendered on the server instead of via WebDriver."""
+    return os.getenv("SERVER_CANVAS_RASTER", "true").lower() in ("true", "1", "yes")
+
+
 def extract_vision_payload(
     request_payload: Dict[str, Any],
 ) -> tuple[Optional[Dict[str, Any]], Optional[str], Optional[str], Optional[List[str]]]:
@@ -161,14 +280,30 @@ def handle_vision_capture(
     svg_state: Optional[Dict[str, Any]],
     canvas_image: Optional[str],
     init_webdriver: Callable[[], ResponseReturnValue],
-) -> None:
+    canvas_state: Optional[Dict[str, Any]] = None,
+) -> Optional[bytes]:
+    """Produce the vision snapshot for a request and return it as PNG bytes.
+
+    Sources, in order: the client-supplied data URL, server rasterization of
+    the canvas state, then a capture from the WebDriver pool. The bytes are
+    handed to the providers in memory and never written to disk; None means
+    no snapshot could be produced for this request.
+    """
     if not use_vision:
-        return
-    if canvas_image and save_canvas_snapshot_from_data_url(canvas_image):
-        return
+        return None
+    if canvas_image:
+        image_bytes = _canvas_snapshot_from_data_url(canvas_image)
+        if image_bytes is not None:
+            return image_bytes
+
+    # Server-side rasterization needs no browser; WebDriver remains the fallback.
+    if canvas_state is not None and is_server_canvas_raster_enabled():
+        image_bytes = _canvas_snapshot_from_state(canvas_state, svg_state)
+        if image_bytes is not None:
+            return image_bytes
 
     if svg_state is None:
-        return
+        return None
 
     if app.webdriver_manager is None:
         try:
@@ -178,15 +313,23 @@ def handle_vision_capture(
 
     if app.webdriver_manager is not None:
         try:
-            app.webdriver_manager.capture_svg_state(cast(SvgState, svg_state))
+            png = app.webdriver_manager.capture_png(cast(SvgState, svg_state))
+            return png if isinstance(png, bytes) else None
         except Exception as exc:
             print(f"WebDriver capture failed: {exc}")
+    return None
+
+
+def _canvas_state_from_message(message_json: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    canvas_state = message_json.get("canvas_state")
+    return canvas_state if isinstance(canvas_state, dict) else None
 
 
 def _intercept_search_tools(
     app: MatHudFlask,
     tool_calls: List[Dict[str, Any]],
     provider: Optional[OpenAIAPIBase] = None,
+    conversation: Optional[ConversationSession] = None,
 ) -> List[Dict[str, Any]]:
     """Intercept search_tools calls and filter other tool calls.
 
@@ -199,6 +342,7 @@ def _intercept_search_tools(
         app: The Flask application instance.
         tool_calls: List of tool calls from the AI response.
         provider: The current API provider (uses its client/model for search).
+        conversation: Session whose APIs receive the injected tools (defaults to the shared conversation).
 
     Returns:
         Filtered list of tool calls (only allowed tools).
@@ -218,7 +362,8 @@ def _intercept_search_tools(
 
     # Execute search_tools server-side using the current provider's client/model
     try:
-        active_provider = provider or app.ai_api
+        conversation = conversation or app.conversations.default
+        active_provider = provider or conversation.ai_api
         service = ToolSearchService(
             client=active_provider.client,
             default_model=active_provider.get_model(),
@@ -227,11 +372,11 @@ def _intercept_search_tools(
 
         allowed_names = _collect_allowed_tool_names(result, ESSENTIAL_TOOLS)
 
-        # Inject tools into shared APIs and the active provider (if distinct).
+        # Inject tools into the session's APIs and the active provider (if distinct).
         if result:
-            app.ai_api.inject_tools(result, include_essentials=True)
-            app.responses_api.inject_tools(result, include_essentials=True)
-            if provider is not None and provider not in (app.ai_api, app.responses_api):
+            conversation.ai_api.inject_tools(result, include_essentials=True)
+            conversation.responses_api.inject_tools(result, include_essentials=True)
+            if provider is not None and provider not in (conversation.ai_api, conversation.responses_api):
                 provider.inject_tools(result, include_essentials=True)
 
         return _filter_tool_calls_by_allowed_names(tool_calls, allowed_names)
@@ -369,6 +514,29 @@ def require_auth(f: F) -> F:
     return cast(F, decorated_function)
 
 
+def require_valid_session(f: F) -> F:
+    """Decorator rejecting requests whose session header is not a valid session id.
+
+    Requests without the header keep using the default conversation; a
+    malformed id is a client error rather than a silent fallback to it.
+
+    Args:
+        f: The route function to protect
+
+    Returns:
+        Wrapped function that answers 400 for an invalid session id
+    """
+
+    @functools.wraps(f)
+    def decorated_function(*args: Any, **kwargs: Any) -> ResponseReturnValue:
+        session_id = _request_session_id()
+        if session_id is not None and session_id != DEFAULT_SESSION_ID and not is_valid_session_id(session_id):
+            return AppManager.make_response(message="Invalid session id", status="error", code=400)
+        return f(*args, **kwargs)
+
+    return cast(F, decorated_function)
+
+
 def register_routes(app: MatHudFlask) -> None:
     """Register all routes with the Flask application.
 
@@ -611,9 +779,13 @@ def register_routes(app: MatHudFlask) -> None:
     def debug_conversation() -> ResponseReturnValue:
         """Debug endpoint to view conversation history for all providers.
 
-        Returns the message history for debugging purposes.
+        Returns the message history for debugging purposes. The session is taken
+        from the session header or a ``session`` query parameter.
         """
         provider_name = request.args.get("provider")
+        conversation = app.conversations.peek(request.args.get("session") or _request_session_id())
+        if conversation is None:
+            return AppManager.make_response(message="Unknown session", status="error", code=404)
 
         def summarize_message(msg: Dict[str, Any]) -> Dict[str, Any]:
             """Summarize a message for display, truncating long content."""
@@ -647,19 +819,19 @@ def register_routes(app: MatHudFlask) -> None:
 
         # OpenAI APIs
         result["ai_api"] = {
-            "model": str(app.ai_api.model),
-            "message_count": len(app.ai_api.messages),
-            "messages": [summarize_message(m) for m in app.ai_api.messages[-20:]],
+            "model": str(conversation.ai_api.model),
+            "message_count": len(conversation.ai_api.messages),
+            "messages": [summarize_message(m) for m in conversation.ai_api.messages[-20:]],
         }
 
         result["responses_api"] = {
-            "model": str(app.responses_api.model),
-            "message_count": len(app.responses_api.messages),
-            "messages": [summarize_message(m) for m in app.responses_api.messages[-20:]],
+            "model": str(conversation.responses_api.model),
+            "message_count": len(conversation.responses_api.messages),
+            "messages": [summarize_message(m) for m in conversation.responses_api.messages[-20:]],
         }
 
         # Other providers
-        for name, provider in app.providers.items():
+        for name, provider in conversation.providers.items():
             if provider_name and name != provider_name:
                 continue
             result[name] = {
@@ -703,26 +875,57 @@ def register_routes(app: MatHudFlask) -> None:
     @app.route("/")
     @require_auth
     def get_index() -> ResponseReturnValue:
-        return render_template("index.html")
+        bundle = app.client_bundle
+        if bundle is None:
+            return render_template("index.html", client_bundle=None)
+        lazy_chunks = {
+            prefix: url_for("get_client_bundle_file", filename=entry["file"])
+            for entry in bundle["chunks"].values()
+            for prefix in entry["prefixes"]
+        }
+        return render_template(
+            "index.html",
+            client_bundle={
+                "core_url": url_for("get_client_bundle_file", filename=bundle["core"]),
+                "lazy_chunks": json.dumps(lazy_chunks),
+            },
+        )
+
+    @app.route("/client_bundle/<path:filename>")
+    def get_client_bundle_file(filename: str) -> ResponseReturnValue:
+        """Serve a hashed client bundle script with gzip and immutable caching."""
+        bundle = app.client_bundle
+        if bundle is None or filename not in bundle_file_names(bundle):
+            return AppManager.make_response(message="Unknown client bundle", status="error", code=404)
+        return send_bundle_file(app.client_bundle_dir, filename, request.headers.get("Accept-Encoding", ""))
 
     @app.route("/init_webdriver")
     @require_auth
     def init_webdriver_route() -> ResponseReturnValue:
-        """Route to initialize WebDriver after Flask has started"""
-        if not app.webdriver_manager:
-            try:
-                from static.webdriver_manager import WebDriverManager
+        """Route to initialize the WebDriver pool after Flask has started"""
+        with _webdriver_init_lock:
+            if not app.webdriver_manager:
+                try:
+                    from static.webdriver_manager import WebDriverPool
 
-                port = app.config.get("SERVER_PORT", 5000)
-                base_url = f"http://127.0.0.1:{port}/"
-                app.webdriver_manager = WebDriverManager(base_url=base_url)
-            except Exception as e:
-                print(f"Failed to initialize WebDriverManager: {str(e)}")
-                return AppManager.make_response(
-                    message=f"WebDriver initialization failed: {str(e)}", status="error", code=500
-                )
+                    port = app.config.get("SERVER_PORT", 5000)
+                    base_url = f"http://127.0.0.1:{port}/"
+                    app.webdriver_manager = WebDriverPool(base_url=base_url, size=WebDriverPool.size_from_env())
+                except Exception as e:
+                    print(f"Failed to initialize WebDriverPool: {str(e)}")
+                    return AppManager.make_response(
+                        message=f"WebDriver initialization failed: {str(e)}", status="error", code=500
+                    )
         return AppManager.make_response(message="WebDriver initialization successful")
 
+    @app.route("/api/debug/vision", methods=["GET"])
+    @require_auth
+    def debug_vision() -> ResponseReturnValue:
+        """Debug endpoint reporting WebDriver pool size and recent capture timings."""
+        if app.webdriver_manager is None:
+            return AppManager.make_response(data={"captures": 0, "drivers": 0})
+        return AppManager.make_response(data=cast(JsonValue, app.webdriver_manager.timing_summary()))
+
     @app.route("/save_workspace", methods=["POST"])
     @require_auth
     def save_workspace_route() -> ResponseReturnValue:
@@ -748,6 +951,7 @@ def register_routes(app: MatHudFlask) -> None:
 
     @app.route("/send_message_stream", methods=["POST"])
     @require_auth
+    @require_valid_session
     def send_message_stream() -> ResponseReturnValue:
         """Stream AI response tokens for the provided message payload.
 
@@ -806,42 +1010,53 @@ def register_routes(app: MatHudFlask) -> None:
         if isinstance(attached_images_raw, list):
             attached_images = [img for img in attached_images_raw if isinstance(img, str)]
 
-        # Get the provider for this model and update all relevant APIs
-        if ai_model:
-            app.ai_api.set_model(ai_model)
-            app.responses_api.set_model(ai_model)
-            # Get or create provider instance for this model
-            provider = get_provider_for_model(app, ai_model)
-        else:
-            # Use default OpenAI provider
-            provider = app.ai_api
-
-        app.log_manager.log_user_message(message)
+        conversation, release_conversation = _acquire_conversation(app)
+        if conversation is None:
+            return _conversation_busy_response()
 
-        # Log action trace if present (sent as top-level field, not in prompt)
-        action_trace_raw = request_payload.get("action_trace")
-        if isinstance(action_trace_raw, dict):
-            app.log_manager.log_action_trace(action_trace_raw)
-
-        handle_vision_capture(
-            app,
-            use_vision,
-            svg_state if isinstance(svg_state, dict) else None,
-            canvas_image_data,
-            init_webdriver_route,
-        )
-
-        # Check for search_tools results and inject tools if found
-        tool_call_results_raw = message_json.get("tool_call_results")
-        if isinstance(tool_call_results_raw, str) and tool_call_results_raw:
-            _maybe_inject_search_tools(app.ai_api, tool_call_results_raw)
-            _maybe_inject_search_tools(app.responses_api, tool_call_results_raw)
-            # Also inject into the active provider if different
-            if provider not in (app.ai_api, app.responses_api):
-                _maybe_inject_search_tools(provider, tool_call_results_raw)
+        try:
+            # Get the provider for this model and update all relevant APIs
+            if ai_model:
+                conversation.ai_api.set_model(ai_model)
+                conversation.responses_api.set_model(ai_model)
+                # Get or create provider instance for this model
+                provider = get_provider_for_model(app, ai_model, conversation)
+            else:
+                # Use default OpenAI provider
+                provider = conversation.ai_api
+
+            app.log_manager.log_user_message(message)
+
+            # Log action trace if present (sent as top-level field, not in prompt)
+            action_trace_raw = request_payload.get("action_trace")
+            if isinstance(action_trace_raw, dict):
+                app.log_manager.log_action_trace(action_trace_raw)
+
+            conversation.set_canvas_snapshot(
+                handle_vision_capture(
+                    app,
+                    use_vision,
+                    svg_state if isinstance(svg_state, dict) else None,
+                    canvas_image_data,
+                    init_webdriver_route,
+                    canvas_state=_canvas_state_from_message(message_json),
+                )
+            )
 
-        # Store attached images in app context for API access
-        app.current_attached_images = attached_images
+            # Check for search_tools results and inject tools if found
+            tool_call_results_raw = message_json.get("tool_call_results")
+            if isinstance(tool_call_results_raw, str) and tool_call_results_raw:
+                _maybe_inject_search_tools(conversation.ai_api, tool_call_results_raw)
+                _maybe_inject_search_tools(conversation.responses_api, tool_call_results_raw)
+                # Also inject into the active provider if different
+                if provider not in (conversation.ai_api, conversation.responses_api):
+                    _maybe_inject_search_tools(provider, tool_call_results_raw)
+
+            # Store attached images on the session for API access
+            conversation.attached_images = attached_images
+        except Exception:
+            release_conversation()
+            raise
 
         @stream_with_context
         def generate() -> Iterator[str]:
@@ -860,7 +1075,7 @@ def register_routes(app: MatHudFlask) -> None:
                 # Route to appropriate API based on model and provider
                 model = provider.get_model()
                 if model.provider == PROVIDER_OPENAI and model.is_reasoning_model:
-                    stream = app.responses_api.create_response_stream(message)
+                    stream = conversation.responses_api.create_response_stream(message)
                 else:
                     stream = provider.create_chat_completion_stream(message)
 
@@ -880,7 +1095,9 @@ def register_routes(app: MatHudFlask) -> None:
                                     ]
                                     # Intercept search_tools and filter other tool calls
                                     if dict_tool_calls:
-                                        filtered_calls = _intercept_search_tools(app, dict_tool_calls, provider)
+                                        filtered_calls = _intercept_search_tools(
+                                            app, dict_tool_calls, provider, conversation
+                                        )
                                         event_dict["ai_tool_calls"] = cast(JsonValue, filtered_calls)
                                         app.log_manager.log_ai_tool_calls(filtered_calls)
                             except Exception:
@@ -888,12 +1105,15 @@ def register_routes(app: MatHudFlask) -> None:
                             # Reset tools if AI finished (not requesting more tool calls)
                             finish_reason = event_dict.get("finish_reason")
                             if finish_reason != "tool_calls":
-                                if app.ai_api.has_injected_tools():
-                                    app.ai_api.reset_tools()
-                                if app.responses_api.has_injected_tools():
-                                    app.responses_api.reset_tools()
+                                if conversation.ai_api.has_injected_tools():
+                                    conversation.ai_api.reset_tools()
+                                if conversation.responses_api.has_injected_tools():
+                                    conversation.responses_api.reset_tools()
                                 # Reset tools on active provider if different
-                                if provider not in (app.ai_api, app.responses_api) and provider.has_injected_tools():
+                                if (
+                                    provider not in (conversation.ai_api, conversation.responses_api)
+                                    and provider.has_injected_tools()
+                                ):
                                     provider.reset_tools()
                         yield json.dumps(event_dict) + "\n"
                     else:
@@ -906,12 +1126,12 @@ def register_routes(app: MatHudFlask) -> None:
                 print(f"[Routes /send_message] {error_msg}")
                 app.log_manager.log_error(error_msg, source="routes")
                 # Reset tools on error
-                if app.ai_api.has_injected_tools():
-                    app.ai_api.reset_tools()
-                if app.responses_api.has_injected_tools():
-                    app.responses_api.reset_tools()
+                if conversation.ai_api.has_injected_tools():
+                    conversation.ai_api.reset_tools()
+                if conversation.responses_api.has_injected_tools():
+                    conversation.responses_api.reset_tools()
                 # Reset tools on active provider if different
-                if provider not in (app.ai_api, app.responses_api) and provider.has_injected_tools():
+                if provider not in (conversation.ai_api, conversation.responses_api) and provider.has_injected_tools():
                     provider.reset_tools()
                 # Yield pending logs so client sees them before error
                 yield from _yield_pending_logs()
@@ -936,8 +1156,12 @@ def register_routes(app: MatHudFlask) -> None:
                         "finish_reason": "error",
                     }
                     yield json.dumps(fallback_payload) + "\n"
+            finally:
+                # Free the session as soon as the stream ends; call_on_close covers unstarted streams.
+                release_conversation()
 
         response = Response(generate(), mimetype="application/x-ndjson")
+        response.call_on_close(release_conversation)
         # Headers to reduce buffering in some proxies
         response.headers["Cache-Control"] = "no-cache"
         response.headers["X-Accel-Buffering"] = "no"
@@ -986,14 +1210,15 @@ def register_routes(app: MatHudFlask) -> None:
 
     @app.route("/new_conversation", methods=["POST"])
     @require_auth
+    @require_valid_session
     def new_conversation_route() -> ResponseReturnValue:
         """Reset the AI conversation history for a new session."""
         try:
-            app.ai_api.reset_conversation()
-            app.responses_api.reset_conversation()
-            # Reset all cached providers
-            for provider in app.providers.values():
-                provider.reset_conversation()
+            with _locked_conversation(app) as conversation:
+                if conversation is None:
+                    return _conversation_busy_response()
+                # Reset the session's OpenAI APIs and cached providers
+                conversation.reset_conversation()
             app.log_manager.log_new_session()
             return AppManager.make_response(message="New conversation started.")
         except Exception as e:
@@ -1001,6 +1226,7 @@ def register_routes(app: MatHudFlask) -> None:
 
     @app.route("/save_partial_response", methods=["POST"])
     @require_auth
+    @require_valid_session
     def save_partial_response() -> ResponseReturnValue:
         """Save a partial AI response that was interrupted by the user."""
         try:
@@ -1020,13 +1246,14 @@ def register_routes(app: MatHudFlask) -> None:
                     code=400,
                 )
 
-            # Always notify all APIs so they can clear stale conversation
-            # state (e.g. previous_response_id after interrupted tool calls).
-            # The base class skips appending empty text to history.
-            app.ai_api.add_partial_assistant_message(partial_message)
-            app.responses_api.add_partial_assistant_message(partial_message)
-            for provider in app.providers.values():
-                provider.add_partial_assistant_message(partial_message)
+            # Always notify all of the session's APIs so they can clear stale
+            # conversation state (e.g. previous_response_id after interrupted
+            # tool calls). The base class skips appending empty text to history.
+            with _locked_conversation(app) as conversation:
+                if conversation is None:
+                    return _conversation_busy_response()
+                for provider in conversation.all_providers():
+                    provider.add_partial_assistant_message(partial_message)
 
             return AppManager.make_response(message="Partial response saved.")
         except Exception as e:
@@ -1059,7 +1286,14 @@ def register_routes(app: MatHudFlask) -> None:
 
     @app.route("/send_message", methods=["POST"])
     @require_auth
+    @require_valid_session
     def send_message() -> ResponseReturnValue:
+        with _locked_conversation(app) as conversation:
+            if conversation is None:
+                return _conversation_busy_response()
+            return _send_message_in_conversation(conversation)
+
+    def _send_message_in_conversation(conversation: ConversationSession) -> ResponseReturnValue:
         request_payload = request.get_json(silent=True)
         if not isinstance(request_payload, dict):
             return AppManager.make_response(
@@ -1105,13 +1339,13 @@ def register_routes(app: MatHudFlask) -> None:
 
         # Get the provider for this model and update all relevant APIs
         if ai_model:
-            app.ai_api.set_model(ai_model)
-            app.responses_api.set_model(ai_model)
+            conversation.ai_api.set_model(ai_model)
+            conversation.responses_api.set_model(ai_model)
             # Get or create provider instance for this model
-            provider = get_provider_for_model(app, ai_model)
+            provider = get_provider_for_model(app, ai_model, conversation)
         else:
             # Use default OpenAI provider
-            provider = app.ai_api
+            provider = conversation.ai_api
 
         app.log_manager.log_user_message(message)
 
@@ -1120,42 +1354,45 @@ def register_routes(app: MatHudFlask) -> None:
         if isinstance(action_trace_raw_legacy, dict):
             app.log_manager.log_action_trace(action_trace_raw_legacy)
 
-        handle_vision_capture(
-            app,
-            use_vision,
-            svg_state if isinstance(svg_state, dict) else None,
-            canvas_image_data,
-            init_webdriver_route,
+        conversation.set_canvas_snapshot(
+            handle_vision_capture(
+                app,
+                use_vision,
+                svg_state if isinstance(svg_state, dict) else None,
+                canvas_image_data,
+                init_webdriver_route,
+                canvas_state=_canvas_state_from_message(message_json_raw),
+            )
         )
 
         # Check for search_tools results and inject tools if found
         tool_call_results_raw = message_json_raw.get("tool_call_results")
         if isinstance(tool_call_results_raw, str) and tool_call_results_raw:
-            _maybe_inject_search_tools(app.ai_api, tool_call_results_raw)
-            _maybe_inject_search_tools(app.responses_api, tool_call_results_raw)
+            _maybe_inject_search_tools(conversation.ai_api, tool_call_results_raw)
+            _maybe_inject_search_tools(conversation.responses_api, tool_call_results_raw)
             # Also inject into the active provider if different
-            if provider not in (app.ai_api, app.responses_api):
+            if provider not in (conversation.ai_api, conversation.responses_api):
                 _maybe_inject_search_tools(provider, tool_call_results_raw)
 
-        # Store attached images in app context for API access
-        app.current_attached_images = attached_images
+        # Store attached images on the session for API access
+        conversation.attached_images = attached_images
 
         def _reset_tools_if_needed(finish_reason: Any) -> None:
             """Reset tools if AI finished (not requesting more tool calls)."""
             if finish_reason != "tool_calls":
-                if app.ai_api.has_injected_tools():
-                    app.ai_api.reset_tools()
-                if app.responses_api.has_injected_tools():
-                    app.responses_api.reset_tools()
+                if conversation.ai_api.has_injected_tools():
+                    conversation.ai_api.reset_tools()
+                if conversation.responses_api.has_injected_tools():
+                    conversation.responses_api.reset_tools()
                 # Reset tools on active provider if different
-                if provider not in (app.ai_api, app.responses_api) and provider.has_injected_tools():
+                if provider not in (conversation.ai_api, conversation.responses_api) and provider.has_injected_tools():
                     provider.reset_tools()
 
         try:
             # Route to appropriate API based on model and provider
             model = provider.get_model()
             if model.provider == PROVIDER_OPENAI and model.is_reasoning_model:
-                stream = app.responses_api.create_response_stream(message)
+                stream = conversation.responses_api.create_response_stream(message)
                 final_event: Optional[StreamEventDict] = None
                 for event in stream:
                     if isinstance(event, dict) and event.get("type") == "final":
@@ -1179,7 +1416,7 @@ def register_routes(app: MatHudFlask) -> None:
                 )
                 # Intercept search_tools and filter other tool calls
                 if ai_tool_calls:
-                    ai_tool_calls = _intercept_search_tools(app, ai_tool_calls, provider)
+                    ai_tool_calls = _intercept_search_tools(app, ai_tool_calls, provider, conversation)
                 finish_reason = final_event.get("finish_reason")
 
                 app.log_manager.log_ai_response(ai_message)
@@ -1202,7 +1439,7 @@ def register_routes(app: MatHudFlask) -> None:
             ai_tool_calls = cast(List[Dict[str, Any]], ai_tool_calls_processed)
             # Intercept search_tools and filter other tool calls
             if ai_tool_calls:
-                ai_tool_calls = _intercept_search_tools(app, ai_tool_calls, provider)
+                ai_tool_calls = _intercept_search_tools(app, ai_tool_calls, provider, conversation)
             finish_reason = getattr(choice, "finish_reason", None)
 
             _reset_tools_if_needed(finish_reason)
@@ -1356,6 +1593,86 @@ def register_routes(app: MatHudFlask) -> None:
             },
         )
 
+    @app.route("/api/tts/stream", methods=["POST"])
+    @require_auth
+    def start_tts_stream() -> ResponseReturnValue:
+        """Register text for streamed playback.
+
+        Request body:
+            text (str): Text to convert to speech
+            voice (str, optional): Voice ID (default: am_michael)
+
+        Returns:
+            JSON response with ``stream_id`` and the ``url`` an audio element
+            should load to play the speech as it is synthesized
+        """
+        request_payload = request.get_json(silent=True)
+        if not isinstance(request_payload, dict):
+            return AppManager.make_response(
+                message="Invalid request body",
+                status="error",
+                code=400,
+            )
+
+        text = request_payload.get("text")
+        if not isinstance(text, str) or not text.strip():
+            return AppManager.make_response(
+                message="Text is required",
+                status="error",
+                code=400,
+            )
+
+        voice_raw = request_payload.get("voice")
+        voice = voice_raw if isinstance(voice_raw, str) else None
+
+        tts_manager = get_tts_manager()
+
+        if not tts_manager.is_available():
+            return AppManager.make_response(
+                message="TTS service is not available. Kokoro may not be installed.",
+                status="error",
+                code=503,
+            )
+
+        stream_id = tts_manager.register_stream(text, voice)
+        return AppManager.make_response(data={"stream_id": stream_id, "url": f"/api/tts/stream/{stream_id}"})
+
+    @app.route("/api/tts/stream/<stream_id>", methods=["GET"])
+    @require_auth
+    def play_tts_stream(stream_id: str) -> ResponseReturnValue:
+        """Stream WAV audio for a registered request, one sentence at a time.
+
+        Returns:
+            audio/wav: Chunked WAV body; playback can begin after the first sentence
+            JSON error response if the stream id is unknown or TTS is unavailable
+        """
+        tts_manager = get_tts_manager()
+        stream_request = tts_manager.get_stream_request(stream_id)
+        if stream_request is None:
+            return AppManager.make_response(
+                message="Unknown or expired TTS stream",
+                status="error",
+                code=404,
+            )
+
+        text, voice = stream_request
+        try:
+            audio_stream = tts_manager.stream_speech(text, voice)
+        except ValueError as e:
+            return AppManager.make_response(message=str(e), status="error", code=400)
+        except RuntimeError as e:
+            return AppManager.make_response(message=str(e), status="error", code=503)
+
+        return Response(
+            audio_stream,
+            mimetype="audio/wav",
+            headers={
+                "Content-Type": "audio/wav",
+                "Content-Disposition": 'inline; filename="tts_output.wav"',
+                "Cache-Control": "no-store",
+            },
+        )
+
     @app.route("/api/tts/voices", methods=["GET"])
     @require_auth
     def get_tts_voices() -> ResponseReturnValue:
@@ -19,6 +19,7 @@ from __future__ import annotations
 
 import json
 import logging
+import math
 import os
 import re
 import time
@@ -42,25 +43,27 @@ EXCLUDED_FROM_SEARCH = frozenset({"search_tools"})
 CACHE_TTL = 300  # seconds
 CACHE_MAX_SIZE = 100
 
+# Insertion order doubles as recency order: hits are re-inserted at the end,
+# so the least recently used entry is always the first key.
 _search_cache: Dict[str, Tuple[float, List[FunctionDefinition]]] = {}
 
 
 def _cache_get(key: str) -> Optional[List[FunctionDefinition]]:
-    entry = _search_cache.get(key)
+    entry = _search_cache.pop(key, None)
     if entry is None:
         return None
     ts, results = entry
     if time.monotonic() - ts > CACHE_TTL:
-        _search_cache.pop(key, None)
         return None
+    _search_cache[key] = entry
     return results
 
 
 def _cache_put(key: str, results: List[FunctionDefinition]) -> None:
-    # Evict oldest if at capacity
-    if len(_search_cache) >= CACHE_MAX_SIZE and key not in _search_cache:
-        oldest_key = min(_search_cache, key=lambda k: _search_cache[k][0])
-        _search_cache.pop(oldest_key, None)
+    _search_cache.pop(key, None)
+    # Evict least recently used if at capacity
+    if len(_search_cache) >= CACHE_MAX_SIZE:
+        _search_cache.pop(next(iter(_search_cache)))
     _search_cache[key] = (time.monotonic(), results)
 
 
@@ -251,18 +254,9 @@ TOOL_CATEGORIES: Dict[str, CategoryEntry] = {
 }
 
 # ---------------------------------------------------------------------------
-# Inverted indices — built once at module load time
+# Tool lookups — built once at module load time
 # ---------------------------------------------------------------------------
 
-# token -> list of tool names whose *name* contains the token
-_TOOL_NAME_INDEX: Dict[str, List[str]] = defaultdict(list)
-
-# token -> list of tool names whose *description* contains the token
-_TOOL_DESC_INDEX: Dict[str, List[str]] = defaultdict(list)
-
-# keyword -> list of category names
-_CATEGORY_KEYWORD_INDEX: Dict[str, List[str]] = defaultdict(list)
-
 # tool_name -> FunctionDefinition (fast lookup)
 _TOOL_BY_NAME: Dict[str, FunctionDefinition] = {}
 
@@ -271,7 +265,7 @@ _ALL_TOOL_NAMES: frozenset[str] = frozenset()
 
 
 def _build_indices() -> None:
-    """Populate inverted indices from FUNCTIONS and TOOL_CATEGORIES."""
+    """Populate the tool lookups from FUNCTIONS."""
     global _ALL_TOOL_NAMES
 
     names: List[str] = []
@@ -283,37 +277,19 @@ def _build_indices() -> None:
         # Always register in the name lookup (used by get_tool_by_name)
         _TOOL_BY_NAME[name] = tool
 
-        # Skip meta-tools for search indices
+        # Skip meta-tools for search
         if name in EXCLUDED_FROM_SEARCH:
             continue
 
         names.append(name)
 
-        # Index name tokens
-        name_tokens = name.lower().replace("_", " ").split()
-        for token in name_tokens:
-            if token and len(token) > 1:
-                _TOOL_NAME_INDEX[token].append(name)
-
-        # Index description tokens
-        description = func.get("description", "")
-        desc_tokens = set(re.findall(r"[a-z0-9]+", description.lower()))
-        for token in desc_tokens:
-            if len(token) > 1:
-                _TOOL_DESC_INDEX[token].append(name)
-
     _ALL_TOOL_NAMES = frozenset(names)
 
-    # Build category keyword index
-    for cat_name, cat_entry in TOOL_CATEGORIES.items():
-        for keyword in cat_entry["keywords"]:
-            _CATEGORY_KEYWORD_INDEX[keyword.lower()].append(cat_name)
-
 
 _build_indices()
 
-# Confidence threshold for hybrid mode
-CONFIDENCE_THRESHOLD = 6.0
+# Confidence threshold for hybrid mode, on the BM25 score scale
+CONFIDENCE_THRESHOLD = 5.5
 
 # Action-verb to tool-name prefix mapping
 _ACTION_VERB_MAP: Dict[str, str] = {
@@ -333,6 +309,141 @@ _ACTION_VERB_MAP: Dict[str, str] = {
     "slide": "translate_",
 }
 
+# ---------------------------------------------------------------------------
+# Ranking tables — BM25 postings precomputed at module load time
+# ---------------------------------------------------------------------------
+
+# Okapi BM25 term-frequency saturation and document-length normalisation
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Per-field scale applied to BM25 weights; a term of average rarity in a
+# document of average length scores exactly this much.  Tool names and
+# descriptions are per-tool documents; keyword lists are per-category.
+_BM25_FIELD_WEIGHTS: Dict[str, float] = {
+    "name": 3.0,
+    "keywords": 4.0,
+    "description": 1.0,
+}
+
+_ACTION_VERB_WEIGHT = 2.0
+_EXACT_NAME_WEIGHT = 8.0
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9_]+")
+_DESC_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+_ARITHMETIC_PATTERN = re.compile(r"\d\s*[-+*/^]\s*\(?\d|sqrt\(")
+_VARIABLE_PATTERN = re.compile(r"\b[a-z]\b")
+
+# tool-name prefix ("create_", "delete_", ...) -> tools carrying that prefix
+_TOOLS_BY_PREFIX: Dict[str, Tuple[str, ...]] = {}
+
+# query token -> ((tool_name, weight), ...) with the name, description and
+# action-verb signals merged into one list
+_TOKEN_POSTINGS: Dict[str, Tuple[Tuple[str, float], ...]] = {}
+
+# keyword -> ((category_name, weight), ...)
+_CATEGORY_POSTINGS: Dict[str, Tuple[Tuple[str, float], ...]] = {}
+
+# category_name -> searchable tools in that category
+_CATEGORY_TOOLS: Dict[str, Tuple[str, ...]] = {}
+
+
+def _bm25_field_postings(
+    documents: Dict[str, Dict[str, int]],
+    field_weight: float,
+    b: float = BM25_B,
+) -> Dict[str, Dict[str, float]]:
+    """Return ``token -> {document: weight}`` for one field's term-frequency documents."""
+    if not documents:
+        return {}
+    doc_count = len(documents)
+    lengths = {name: sum(terms.values()) for name, terms in documents.items()}
+    avg_length = sum(lengths.values()) / doc_count or 1.0
+
+    doc_freq: Dict[str, int] = defaultdict(int)
+    for terms in documents.values():
+        for token in terms:
+            doc_freq[token] += 1
+    idf = {
+        token: math.log(1.0 + (doc_count - df + 0.5) / (df + 0.5))
+        for token, df in doc_freq.items()
+    }
+    # Normalise so an average-rarity term scores the field weight
+    mean_idf = sum(idf.values()) / len(idf)
+
+    postings: Dict[str, Dict[str, float]] = defaultdict(dict)
+    for name, terms in documents.items():
+        length_norm = 1.0 - b + b * lengths[name] / avg_length
+        for token, tf in terms.items():
+            saturation = tf * (BM25_K1 + 1.0) / (tf + BM25_K1 * length_norm)
+            postings[token][name] = field_weight * saturation * idf[token] / mean_idf
+    return postings
+
+
+def _build_ranking_tables() -> None:
+    """Populate prefix buckets and BM25 postings.
+
+    Name and description postings come from the searchable FUNCTIONS entries
+    (``_ALL_TOOL_NAMES``/``_TOOL_BY_NAME``); category postings from the
+    TOOL_CATEGORIES keywords.
+    """
+    prefix_buckets: Dict[str, List[str]] = defaultdict(list)
+    name_docs: Dict[str, Dict[str, int]] = {}
+    desc_docs: Dict[str, Dict[str, int]] = {}
+    keyword_docs: Dict[str, Dict[str, int]] = {}
+
+    for name in sorted(_ALL_TOOL_NAMES):
+        if "_" in name:
+            prefix_buckets[name.split("_", 1)[0] + "_"].append(name)
+
+        name_terms: Dict[str, int] = defaultdict(int)
+        for token in name.split("_"):
+            if len(token) > 1:
+                name_terms[token] += 1
+        name_docs[name] = name_terms
+
+        description = _TOOL_BY_NAME[name].get("function", {}).get("description", "")
+        desc_terms: Dict[str, int] = defaultdict(int)
+        for token in _DESC_TOKEN_PATTERN.findall(description.lower()):
+            if len(token) > 1:
+                desc_terms[token] += 1
+        desc_docs[name] = desc_terms
+
+    for cat_name, cat_entry in TOOL_CATEGORIES.items():
+        keyword_terms: Dict[str, int] = defaultdict(int)
+        for keyword in cat_entry["keywords"]:
+            keyword_terms[keyword.lower()] += 1
+        keyword_docs[cat_name] = keyword_terms
+
+    _TOOLS_BY_PREFIX.clear()
+    _TOOLS_BY_PREFIX.update({prefix: tuple(names) for prefix, names in prefix_buckets.items()})
+
+    _CATEGORY_TOOLS.clear()
+    _CATEGORY_TOOLS.update({
+        cat_name: tuple(name for name in cat_entry["tools"] if name in _ALL_TOOL_NAMES)
+        for cat_name, cat_entry in TOOL_CATEGORIES.items()
+    })
+    _CATEGORY_POSTINGS.clear()
+    _CATEGORY_POSTINGS.update({
+        token: tuple(sorted(weights.items()))
+        for token, weights in _bm25_field_postings(keyword_docs, _BM25_FIELD_WEIGHTS["keywords"], b=0.0).items()
+    })
+
+    merged: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
+    for field, documents in (("name", name_docs), ("description", desc_docs)):
+        for token, weights in _bm25_field_postings(documents, _BM25_FIELD_WEIGHTS[field]).items():
+            for tool_name, weight in weights.items():
+                merged[token][tool_name] += weight
+    for verb, prefix in _ACTION_VERB_MAP.items():
+        for tool_name in _TOOLS_BY_PREFIX.get(prefix, ()):
+            merged[verb][tool_name] += _ACTION_VERB_WEIGHT
+
+    _TOKEN_POSTINGS.clear()
+    _TOKEN_POSTINGS.update({token: tuple(sorted(weights.items())) for token, weights in merged.items()})
+
+
+_build_ranking_tables()
+
 
 class ToolSearchService:
     """Service for tool discovery via local keyword matching or AI-powered search.
@@ -528,12 +639,14 @@ Return a JSON array of up to {max_results} tool names. Example: ["create_circle"
         """Search for tools using fast local keyword/category matching.
 
         No API call is made. Scoring uses:
-        1. Category keyword boost (+5.0)
-        2. Inverted index name match (+3.0)
-        3. Inverted index description match (+1.0)
-        4. Exact tool name match (+8.0)
-        5. Action-verb alignment (+2.0)
-        6. Intent boosts for confusion clusters
+        1. Exact tool name match (+8.0)
+        2. BM25 over tool names, category keywords and descriptions
+           (scaled to about +3.0, +4.0 and +1.0 for a term of average rarity)
+        3. Action-verb alignment (+2.0)
+        4. Intent boosts for confusion clusters
+
+        Steps 2 and 3 are read from precomputed per-token postings, so a
+        query costs one dictionary lookup per token before the intent rules.
 
         Args:
             query: Description of what the user wants to accomplish.
@@ -548,50 +661,31 @@ Return a JSON array of up to {max_results} tool names. Example: ["create_circle"
 
         scores: Dict[str, float] = defaultdict(float)
 
-        # 1. Exact tool name match
-        query_lower = query.lower().strip()
-        for token in query_tokens:
-            if token in _ALL_TOOL_NAMES:
-                scores[token] += 8.0
-
-        # Also check underscore-joined bigrams/trigrams for multi-word tool names
+        # 1. Exact tool name match, including underscore-joined bigrams/trigrams
+        # for multi-word tool names
         for i in range(len(query_tokens)):
             for j in range(i + 1, min(i + 4, len(query_tokens) + 1)):
                 candidate = "_".join(query_tokens[i:j])
                 if candidate in _ALL_TOOL_NAMES:
-                    scores[candidate] += 8.0
+                    scores[candidate] += _EXACT_NAME_WEIGHT
 
-        # 2. Category keyword boost
-        matched_categories: set[str] = set()
+        # 2. Category keywords: each matched category boosts its tools once,
+        # at the weight of its most specific matched keyword
+        category_weights: Dict[str, float] = {}
         for token in query_tokens:
-            cats = _CATEGORY_KEYWORD_INDEX.get(token, [])
-            matched_categories.update(cats)
-
-        for cat_name in matched_categories:
-            cat_entry = TOOL_CATEGORIES[cat_name]
-            for tool_name in cat_entry["tools"]:
-                if tool_name in _ALL_TOOL_NAMES:
-                    scores[tool_name] += 5.0
-
-        # 3. Inverted index name match
-        for token in query_tokens:
-            for tool_name in _TOOL_NAME_INDEX.get(token, []):
-                scores[tool_name] += 3.0
-
-        # 4. Inverted index description match
-        for token in query_tokens:
-            for tool_name in _TOOL_DESC_INDEX.get(token, []):
-                scores[tool_name] += 1.0
-
-        # 5. Action-verb alignment
+            for cat_name, weight in _CATEGORY_POSTINGS.get(token, ()):
+                if weight > category_weights.get(cat_name, 0.0):
+                    category_weights[cat_name] = weight
+        for cat_name, weight in category_weights.items():
+            for tool_name in _CATEGORY_TOOLS[cat_name]:
+                scores[tool_name] += weight
+
+        # 3. Name/description BM25 and action-verb alignment
         for token in query_tokens:
-            prefix = _ACTION_VERB_MAP.get(token)
-            if prefix:
-                for tool_name in _ALL_TOOL_NAMES:
-                    if tool_name.startswith(prefix):
-                        scores[tool_name] += 2.0
+            for tool_name, weight in _TOKEN_POSTINGS.get(token, ()):
+                scores[tool_name] += weight
 
-        # 6. Intent boosts (same as existing _tool_score confusion boosts)
+        # 4. Intent boosts (same as existing _tool_score confusion boosts)
         self._apply_intent_boosts(query_tokens, scores, raw_query=query)
 
         # Sort by score descending, then alphabetically for ties
@@ -707,12 +801,11 @@ Return a JSON array of up to {max_results} tool names. Example: ["create_circle"
         # -- Delete with casual language --
         if "rid" in token_set:
             # "get rid of" is a common idiom for delete
-            for tool_name in _ALL_TOOL_NAMES:
-                if tool_name.startswith("delete_"):
-                    scores[tool_name] += 4.0
-                # Penalize create_ tools when intent is clearly delete
-                if tool_name.startswith("create_"):
-                    scores[tool_name] -= 6.0
+            for tool_name in _TOOLS_BY_PREFIX.get("delete_", ()):
+                scores[tool_name] += 4.0
+            # Penalize create_ tools when intent is clearly delete
+            for tool_name in _TOOLS_BY_PREFIX.get("create_", ()):
+                scores[tool_name] -= 6.0
 
         # -- Solve family --
         if token_set & {"solve", "find"} and token_set & {"system", "simultaneous", "equations"}:
@@ -746,7 +839,8 @@ Return a JSON array of up to {max_results} tool names. Example: ["create_circle"
             scores["solve"] += 3.0
 
         # -- Calculus --
-        if token_set & {"derivative", "differentiate", "diff", "d/dx"}:
+        # "d/dx" never survives tokenization, so match it in the raw query
+        if token_set & {"derivative", "differentiate", "diff"} or "d/dx" in raw_lower:
             scores["derive"] += 6.0
         if token_set & {"integral", "integrate", "integration"}:
             scores["integrate"] += 6.0
@@ -763,6 +857,9 @@ Return a JSON array of up to {max_results} tool names. Example: ["create_circle"
             token_set & {"area", "statistics", "descriptive", "stats", "mean", "median"}
         ):
             scores["evaluate_expression"] += 3.0
+        # Bare arithmetic ("sqrt(50) - 2^3") carries no keywords at all
+        if _ARITHMETIC_PATTERN.search(raw_lower) and not _VARIABLE_PATTERN.search(raw_lower):
+            scores["evaluate_expression"] += 5.0
 
         # -- Convert (unit vs coordinate) --
         if token_set & {"convert", "change"} and token_set & {
@@ -949,7 +1046,7 @@ Return a JSON array of up to {max_results} tool names. Example: ["create_circle"
 
     @classmethod
     def _tokenize(cls, text: str) -> List[str]:
-        tokens = [t for t in re.findall(r"[a-z0-9_]+", text.lower()) if t]
+        tokens = _TOKEN_PATTERN.findall(text.lower())
         return [t for t in tokens if t not in cls._STOPWORDS and len(t) > 1]
 
     @classmethod
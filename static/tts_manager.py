@@ -7,11 +7,19 @@ Features:
     - Lazy-loaded Kokoro pipeline for efficient resource usage
     - Multiple voice options (male and female)
     - WAV format output for browser playback
+    - Sentence-level synthesis streamed as a WAV body, so playback can
+      start after the first sentence
+    - Byte-bounded LRU cache of synthesized sentences keyed on
+      (normalized text, voice)
+    - Concurrent requests for an uncached sentence share one synthesis
+    - Configurable synthesis worker pool (TTS_WORKERS, TTS_CACHE_MB); Kokoro
+      pipelines are not thread-safe, so each worker gets its own pipeline
 
 Dependencies:
     - kokoro: Local TTS model
     - soundfile: Audio file I/O
     - numpy: Audio array operations
+    - struct: Streaming WAV header
 
 Note: Requires espeak-ng on Linux systems.
 """
@@ -19,11 +27,49 @@ Note: Requires espeak-ng on Linux systems.
 from __future__ import annotations
 
 import io
+import os
+import queue
+import re
+import struct
+import threading
+import uuid
+from collections import OrderedDict, deque
 from concurrent.futures import ThreadPoolExecutor, Future
-from typing import List, Optional, Tuple, Union
+from contextlib import contextmanager
+from typing import Callable, Deque, Dict, Iterator, List, Optional, Tuple, Union, cast
 
 import numpy as np
 
+DEFAULT_WORKERS = 1
+DEFAULT_CACHE_BYTES = 64 * 1024 * 1024
+# Sentences synthesized ahead of the one being streamed
+STREAM_LOOKAHEAD = 2
+# Pending /api/tts/stream requests remembered for the audio element's GET
+MAX_PENDING_STREAMS = 32
+# RIFF/data sizes for a WAV whose length is unknown while streaming
+_STREAMING_WAV_SIZE = 0xFFFFFFFF
+
+_SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?;:])\s+|\n\s*\n")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """Collapse whitespace so equivalent messages share cache entries."""
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+def split_sentences(text: str) -> List[str]:
+    """Split text into normalized sentence chunks for incremental synthesis."""
+    chunks = (normalize_text(part) for part in _SENTENCE_BOUNDARY.split(text))
+    return [chunk for chunk in chunks if chunk]
+
+
+def _load_kokoro_pipeline() -> object:
+    from kokoro import KPipeline
+
+    # Initialize Kokoro pipeline for American English
+    return KPipeline(lang_code="a", repo_id="hexgrad/Kokoro-82M")
+
 
 class TTSManager:
     """Manages text-to-speech generation using Kokoro.
@@ -49,12 +95,60 @@ class TTSManager:
     DEFAULT_VOICE: str = "am_michael"
     SAMPLE_RATE: int = 24000  # Kokoro's native sample rate
 
-    def __init__(self) -> None:
-        """Initialize TTS manager with lazy-loaded pipeline."""
-        self._pipeline: Optional[object] = None
+    def __init__(
+        self,
+        pipeline: Optional[object] = None,
+        max_workers: int = DEFAULT_WORKERS,
+        cache_bytes: int = DEFAULT_CACHE_BYTES,
+        pipeline_factory: Optional[Callable[[], object]] = None,
+    ) -> None:
+        """Initialize TTS manager with lazy-loaded pipeline.
+
+        Args:
+            pipeline: Callable with Kokoro's ``pipeline(text, voice=...)`` interface,
+                used by one synthesis at a time; when None, pipelines come from
+                ``pipeline_factory``
+            max_workers: Threads synthesizing concurrently across requests
+            cache_bytes: Upper bound on cached sentence audio (0 disables caching)
+            pipeline_factory: Builds one pipeline per worker, on first use
+                (default: load Kokoro)
+        """
+        self._pipeline: Optional[object] = pipeline
         self._pipeline_error: Optional[str] = None
+        self._pipeline_lock = threading.Lock()
+        self._pipeline_factory: Callable[[], object] = pipeline_factory or _load_kokoro_pipeline
+        # Pipelines are not thread-safe: each synthesis checks one out exclusively
+        self._idle_pipelines: queue.Queue[object] = queue.Queue()
+        self._pipeline_count = 0
+        self._max_pipelines = 1 if pipeline is not None else max(1, max_workers)
+        if pipeline is not None:
+            self._idle_pipelines.put(pipeline)
+            self._pipeline_count = 1
         # Thread pool for non-blocking TTS generation (allows Ctrl+C to work)
-        self._executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=1)
+        self._executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=max(1, max_workers))
+        self._cache: OrderedDict[Tuple[str, str], np.ndarray] = OrderedDict()
+        self._cache_bytes = 0
+        self._cache_limit = max(0, cache_bytes)
+        self._cache_lock = threading.Lock()
+        # Sentences being synthesized; later requests for them wait on the same result
+        self._inflight: Dict[Tuple[str, str], Future[np.ndarray]] = {}
+        self._pending_streams: OrderedDict[str, Tuple[str, str]] = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    @staticmethod
+    def settings_from_env() -> Tuple[int, int]:
+        """Read (max_workers, cache_bytes) from TTS_WORKERS / TTS_CACHE_MB."""
+        try:
+            max_workers = int(os.getenv("TTS_WORKERS", str(DEFAULT_WORKERS)))
+        except ValueError:
+            max_workers = DEFAULT_WORKERS
+        cache_mb = os.getenv("TTS_CACHE_MB")
+        try:
+            cache_bytes = DEFAULT_CACHE_BYTES if cache_mb is None else int(float(cache_mb) * 1024 * 1024)
+        except ValueError:
+            cache_bytes = DEFAULT_CACHE_BYTES
+        return max_workers, cache_bytes
 
     def _get_pipeline(self) -> Tuple[bool, Union[object, str]]:
         """Get or create the Kokoro pipeline.
@@ -68,20 +162,24 @@ class TTSManager:
         if self._pipeline is not None:
             return True, self._pipeline
 
-        try:
-            from kokoro import KPipeline
-
-            # Initialize Kokoro pipeline for American English
-            self._pipeline = KPipeline(lang_code="a", repo_id="hexgrad/Kokoro-82M")
-            return True, self._pipeline
-
-        except ImportError as e:
-            self._pipeline_error = f"Kokoro not installed: {e}"
-            return False, self._pipeline_error
-
-        except Exception as e:
-            self._pipeline_error = f"Failed to initialize Kokoro: {e}"
-            return False, self._pipeline_error
+        with self._pipeline_lock:
+            if self._pipeline is not None:
+                return True, self._pipeline
+            if self._pipeline_error is not None:
+                return False, self._pipeline_error
+            try:
+                self._pipeline = self._pipeline_factory()
+                self._pipeline_count += 1
+                self._idle_pipelines.put(self._pipeline)
+                return True, self._pipeline
+
+            except ImportError as e:
+                self._pipeline_error = f"Kokoro not installed: {e}"
+                return False, self._pipeline_error
+
+            except Exception as e:
+                self._pipeline_error = f"Failed to initialize Kokoro: {e}"
+                return False, self._pipeline_error
 
     def is_available(self) -> bool:
         """Check if TTS is available (Kokoro installed and working).
@@ -100,6 +198,10 @@ class TTSManager:
         """
         return self.VOICES.copy()
 
+    def resolve_voice(self, voice: Optional[str]) -> str:
+        """Return ``voice`` if it is known, otherwise the default voice."""
+        return voice if voice in self.VOICES else self.DEFAULT_VOICE
+
     def generate_speech(
         self,
         text: str,
@@ -119,25 +221,16 @@ class TTSManager:
             return False, "No text provided"
 
         # Validate voice
-        voice = voice or self.DEFAULT_VOICE
-        if voice not in self.VOICES:
-            voice = self.DEFAULT_VOICE
+        voice = self.resolve_voice(voice)
 
         # Get pipeline
         success, result = self._get_pipeline()
         if not success:
             return False, str(result)
 
-        pipeline = result
-
         try:
-            # Generate audio using Kokoro
-            # Kokoro returns a generator of (graphemes, phonemes, audio_chunk)
-            audio_chunks: List[np.ndarray] = []
-
-            for _, _, audio_chunk in pipeline(text, voice=voice):  # type: ignore
-                if audio_chunk is not None:
-                    audio_chunks.append(audio_chunk)
+            audio_chunks = [self._synthesize_sentence(sentence, voice) for sentence in split_sentences(text)]
+            audio_chunks = [chunk for chunk in audio_chunks if chunk.size]
 
             if not audio_chunks:
                 return False, "No audio generated"
@@ -145,10 +238,6 @@ class TTSManager:
             # Concatenate audio chunks
             audio = np.concatenate(audio_chunks)
 
-            # Ensure float32 format
-            if audio.dtype != np.float32:
-                audio = audio.astype(np.float32)
-
             # Normalize to -1 to 1 range if needed
             max_val = np.max(np.abs(audio))
             if max_val > 1.0:
@@ -162,6 +251,160 @@ class TTSManager:
         except Exception as e:
             return False, f"TTS generation failed: {e}"
 
+    def stream_speech(self, text: str, voice: Optional[str] = None) -> Iterator[bytes]:
+        """Yield a WAV stream: a header, then 16-bit PCM one sentence at a time.
+
+        Sentences are synthesized on the worker pool up to STREAM_LOOKAHEAD
+        ahead of the one being yielded. The header declares an unknown length,
+        which browsers accept for progressive playback. Errors after the header
+        end the stream early.
+
+        Raises:
+            ValueError: If the text is empty
+            RuntimeError: If the pipeline is unavailable
+        """
+        sentences = split_sentences(text or "")
+        if not sentences:
+            raise ValueError("No text provided")
+        voice = self.resolve_voice(voice)
+        success, result = self._get_pipeline()
+        if not success:
+            raise RuntimeError(str(result))
+        return self._stream_sentences(sentences, voice)
+
+    def _stream_sentences(self, sentences: List[str], voice: str) -> Iterator[bytes]:
+        yield self._streaming_wav_header(self.SAMPLE_RATE)
+        pending: Deque[Future[np.ndarray]] = deque()
+        remaining = iter(sentences)
+        try:
+            for sentence in remaining:
+                pending.append(self._executor.submit(self._synthesize_sentence, sentence, voice))
+                if len(pending) > STREAM_LOOKAHEAD:
+                    yield self._audio_to_pcm16(pending.popleft().result())
+            while pending:
+                yield self._audio_to_pcm16(pending.popleft().result())
+        except Exception as e:
+            print(f"TTS stream failed: {e}")
+        finally:
+            # Client disconnects close the generator; drop queued work for it.
+            for future in pending:
+                future.cancel()
+
+    def register_stream(self, text: str, voice: Optional[str] = None) -> str:
+        """Remember a streaming request so an audio element can GET it by id."""
+        stream_id = uuid.uuid4().hex
+        with self._cache_lock:
+            self._pending_streams[stream_id] = (text, self.resolve_voice(voice))
+            while len(self._pending_streams) > MAX_PENDING_STREAMS:
+                self._pending_streams.popitem(last=False)
+        return stream_id
+
+    def get_stream_request(self, stream_id: str) -> Optional[Tuple[str, str]]:
+        """Return the (text, voice) registered under ``stream_id``, if still known.
+
+        Entries are kept (not popped) because media elements may re-request
+        the same URL; repeats are served from the sentence cache.
+        """
+        with self._cache_lock:
+            return self._pending_streams.get(stream_id)
+
+    def _synthesize_sentence(self, sentence: str, voice: str) -> np.ndarray:
+        """Synthesize one normalized sentence, consulting the LRU cache first.
+
+        A sentence already being synthesized for another request is awaited
+        instead of synthesized again.
+        """
+        key = (sentence, voice)
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self.cache_hits += 1
+                return cached
+            inflight = self._inflight.get(key)
+            if inflight is None:
+                self.cache_misses += 1
+                owned: Future[np.ndarray] = Future()
+                self._inflight[key] = owned
+            else:
+                self.cache_hits += 1
+        if inflight is not None:
+            return inflight.result()
+
+        try:
+            audio = self._run_pipeline(sentence, voice)
+            self._cache_audio(key, audio)
+            owned.set_result(audio)
+            return audio
+        except Exception as e:
+            owned.set_exception(e)
+            raise
+        finally:
+            with self._cache_lock:
+                self._inflight.pop(key, None)
+
+    def _run_pipeline(self, sentence: str, voice: str) -> np.ndarray:
+        # Kokoro returns a generator of (graphemes, phonemes, audio_chunk)
+        audio_chunks: List[np.ndarray] = []
+        with self._checkout_pipeline() as pipeline:
+            for _, _, audio_chunk in pipeline(sentence, voice=voice):  # type: ignore
+                if audio_chunk is not None:
+                    audio_chunks.append(np.asarray(audio_chunk))
+        audio: np.ndarray = np.concatenate(audio_chunks) if audio_chunks else np.zeros(0, dtype=np.float32)
+
+        # Ensure float32 format
+        if audio.dtype != np.float32:
+            audio = audio.astype(np.float32)
+        return audio
+
+    @contextmanager
+    def _checkout_pipeline(self) -> Iterator[object]:
+        """Lend a pipeline to one synthesis, creating up to one per worker."""
+        success, result = self._get_pipeline()
+        if not success:
+            raise RuntimeError(str(result))
+        try:
+            pipeline = self._idle_pipelines.get_nowait()
+        except queue.Empty:
+            pipeline = self._add_or_wait_for_pipeline()
+        try:
+            yield pipeline
+        finally:
+            self._idle_pipelines.put(pipeline)
+
+    def _add_or_wait_for_pipeline(self) -> object:
+        with self._pipeline_lock:
+            create = self._pipeline_count < self._max_pipelines
+            if create:
+                self._pipeline_count += 1
+        if not create:
+            return self._idle_pipelines.get()
+        try:
+            return self._pipeline_factory()
+        except Exception:
+            with self._pipeline_lock:
+                self._pipeline_count -= 1
+            raise
+
+    def _cache_audio(self, key: Tuple[str, str], audio: np.ndarray) -> None:
+        if audio.nbytes > self._cache_limit:
+            return
+        with self._cache_lock:
+            previous = self._cache.pop(key, None)
+            if previous is not None:
+                self._cache_bytes -= previous.nbytes
+            self._cache[key] = audio
+            self._cache_bytes += audio.nbytes
+            while self._cache_bytes > self._cache_limit:
+                _, evicted = self._cache.popitem(last=False)
+                self._cache_bytes -= evicted.nbytes
+
+    def clear_cache(self) -> None:
+        """Drop all cached sentence audio."""
+        with self._cache_lock:
+            self._cache.clear()
+            self._cache_bytes = 0
+
     def generate_speech_threaded(
         self,
         text: str,
@@ -210,6 +453,28 @@ class TTSManager:
         buffer.seek(0)
         return buffer.read()
 
+    @staticmethod
+    def _audio_to_pcm16(audio: np.ndarray) -> bytes:
+        """Convert float samples to little-endian 16-bit PCM at unity gain.
+
+        Every sentence of a stream gets the same gain so loudness does not jump
+        between sentences; out-of-range peaks are clipped.
+        """
+        return cast(bytes, (np.clip(audio, -1.0, 1.0) * 32767.0).astype("<i2").tobytes())
+
+    @staticmethod
+    def _streaming_wav_header(sample_rate: int) -> bytes:
+        """Mono 16-bit PCM WAV header with unknown (maximal) RIFF and data sizes."""
+        byte_rate = sample_rate * 2
+        return (
+            b"RIFF"
+            + struct.pack("<I", _STREAMING_WAV_SIZE)
+            + b"WAVEfmt "
+            + struct.pack("<IHHIIHH", 16, 1, 1, sample_rate, byte_rate, 2, 16)
+            + b"data"
+            + struct.pack("<I", _STREAMING_WAV_SIZE)
+        )
+
 
 # Global TTS manager instance for reuse
 _tts_manager: Optional[TTSManager] = None
@@ -223,5 +488,6 @@ def get_tts_manager() -> TTSManager:
     """
     global _tts_manager
     if _tts_manager is None:
-        _tts_manager = TTSManager()
+        max_workers, cache_bytes = TTSManager.settings_from_env()
+        _tts_manager = TTSManager(max_workers=max_workers, cache_bytes=cache_bytes)
     return _tts_manager
@@ -3,22 +3,30 @@ MatHud Selenium WebDriver Management
 
 Manages headless Firefox WebDriver for capturing canvas images for vision system.
 Handles SVG state injection, page configuration, and screenshot capture operations.
+WebDriverPool keeps several pre-warmed drivers so concurrent vision requests
+are served from a queue; captures wait on a render-complete signal from the
+page instead of fixed sleeps and return PNG bytes with per-phase timings.
 
 Dependencies:
     - selenium: WebDriver automation framework
     - selenium.webdriver: Firefox WebDriver and configuration
     - selenium.webdriver.support: WebDriverWait and expected conditions
-    - logging: Error logging for WebDriver operations
+    - logging: Error logging and capture timing records
     - os: File system operations for screenshot storage
-    - time: Timing delays for WebDriver operations
+    - queue/threading: Idle driver queue and background warm-up
+    - time: Capture timing
 """
 
 from __future__ import annotations
 
+import json
 import logging
 import os
+import queue
+import threading
 import time
-from typing import Any, Optional, TypedDict, cast
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, TypedDict, cast
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -44,6 +52,28 @@ class SvgState(TypedDict, total=False):
     transform: Optional[str]
 
 
+CANVAS_SNAPSHOT_DIR = "canvas_snapshots"
+WEBDRIVER_POOL_SIZE_ENV = "WEBDRIVER_POOL_SIZE"
+DEFAULT_POOL_SIZE = 2
+DEFAULT_ACQUIRE_TIMEOUT_SECONDS = 30.0
+READY_TIMEOUT_SECONDS = 10
+# A failed warm-up is retried this many times, doubling the delay from WARMUP_BACKOFF_SECONDS.
+WARMUP_RETRIES = 4
+WARMUP_BACKOFF_SECONDS = 1.0
+WARMUP_BACKOFF_MAX_SECONDS = 30.0
+_TIMING_HISTORY = 100
+
+# Resolves once web fonts are loaded and two animation frames have passed,
+# i.e. after the browser has laid out and painted the injected SVG.
+_RENDER_COMPLETE_SCRIPT = """
+    const done = arguments[arguments.length - 1];
+    const fontsReady = document.fonts ? document.fonts.ready : Promise.resolve();
+    fontsReady.then(() => requestAnimationFrame(() => requestAnimationFrame(() => done(true))));
+"""
+
+_timing_logger = logging.getLogger("mathud")
+
+
 class WebDriverManager:
     """Manages Selenium WebDriver operations for capturing math visualizations.
 
@@ -60,6 +90,7 @@ class WebDriverManager:
         """
         self.base_url: str = base_url
         self.driver: Optional[WebDriver] = None
+        self.last_capture_timings: Dict[str, float] = {}
         self._setup_driver()
 
     def capture_svg_state(self, svg_state: SvgState) -> None:
@@ -78,6 +109,32 @@ class WebDriverManager:
             print(f"Failed to capture canvas: {str(e)}")
             logging.error(f"Failed to capture canvas: {str(e)}")
 
+    def capture_png(self, svg_state: SvgState) -> bytes:
+        """Inject an SVG state and return a PNG screenshot of the math container.
+
+        Records per-phase durations in ``last_capture_timings`` (inject_ms,
+        ready_ms, screenshot_ms, total_ms).
+
+        Raises:
+            Exception: If the driver is unavailable or the capture fails
+        """
+        start = time.perf_counter()
+        self.update_svg_state(svg_state)
+        injected = time.perf_counter()
+        dimensions = self._prepare_capture()
+        ready = time.perf_counter()
+        png = self._screenshot_container()
+        done = time.perf_counter()
+        self.last_capture_timings = {
+            "inject_ms": round((injected - start) * 1000.0, 2),
+            "ready_ms": round((ready - injected) * 1000.0, 2),
+            "screenshot_ms": round((done - ready) * 1000.0, 2),
+            "total_ms": round((done - start) * 1000.0, 2),
+            "width": float(dimensions["width"]),
+            "height": float(dimensions["height"]),
+        }
+        return png
+
     def update_svg_state(self, svg_state: SvgState) -> None:
         """Update the SVG content and attributes with the provided state.
 
@@ -115,7 +172,6 @@ class WebDriverManager:
         """,
             svg_state,
         )
-        time.sleep(1)  # Give time for the SVG to be redrawn
 
     def _setup_driver(self) -> None:
         """Initialize the Firefox WebDriver with headless mode.
@@ -134,10 +190,11 @@ class WebDriverManager:
                     self.driver = webdriver.Firefox(options=firefox_options)
                     print("WebDriver started successfully.")
 
-                time.sleep(3)  # Wait for initialization
-
                 print(f"Attempting to navigate (attempt {attempt + 1}/{max_retries})...")
                 self.driver.get(self.base_url)
+                WebDriverWait(self.driver, READY_TIMEOUT_SECONDS).until(
+                    EC.presence_of_element_located((By.CLASS_NAME, "math-container"))
+                )
 
                 self._configure_page_layout()
                 print("WebDriver navigation successful.")
@@ -183,28 +240,45 @@ class WebDriverManager:
         """
         print("\nStarting capture_canvas...")
         try:
-            snapshots_dir = "canvas_snapshots"
-            if not os.path.exists(snapshots_dir):
-                os.makedirs(snapshots_dir)
-
-            self._wait_for_svg_elements()
-            self._verify_svg_content()
-            dimensions = self._get_container_dimensions()
-            self._configure_svg_size(dimensions)
-
-            time.sleep(1)  # Give time for changes to take effect
-
-            canvas_path = os.path.join(snapshots_dir, "canvas.png")
-            if self.driver is None:
-                raise RuntimeError("WebDriver not initialized")
-            container = self.driver.find_element(By.CLASS_NAME, "math-container")
-            container.screenshot(canvas_path)
+            if not os.path.exists(CANVAS_SNAPSHOT_DIR):
+                os.makedirs(CANVAS_SNAPSHOT_DIR)
+
+            dimensions = self._prepare_capture()
+            png = self._screenshot_container()
+            with open(os.path.join(CANVAS_SNAPSHOT_DIR, "canvas.png"), "wb") as snapshot_file:
+                snapshot_file.write(png)
             print(f"Canvas capture completed successfully (dimensions: {dimensions['width']}x{dimensions['height']})")
 
         except Exception as e:
             print(f"Error in capture_canvas: {str(e)}")
             logging.error(f"Error in capture_canvas: {str(e)}")
 
+    def _prepare_capture(self) -> SvgDimensions:
+        """Wait for the injected SVG, size it to its container and wait for it to render."""
+        self._wait_for_svg_elements()
+        self._verify_svg_content()
+        dimensions = self._get_container_dimensions()
+        self._configure_svg_size(dimensions)
+        self._wait_for_render()
+        return dimensions
+
+    def _wait_for_render(self) -> None:
+        """Block until the browser has painted the latest DOM changes.
+
+        Replaces fixed sleeps with the page's own signal: web fonts loaded
+        plus two animation frames.
+        """
+        if self.driver is None:
+            raise RuntimeError("WebDriver not initialized")
+        self.driver.set_script_timeout(READY_TIMEOUT_SECONDS)
+        self.driver.execute_async_script(_RENDER_COMPLETE_SCRIPT)
+
+    def _screenshot_container(self) -> bytes:
+        if self.driver is None:
+            raise RuntimeError("WebDriver not initialized")
+        container = self.driver.find_element(By.CLASS_NAME, "math-container")
+        return cast(bytes, container.screenshot_as_png)
+
     def _wait_for_svg_elements(self) -> None:
         """Wait for SVG elements to be present and visible.
 
@@ -294,3 +368,195 @@ class WebDriverManager:
         if self.driver:
             self.driver.quit()
             self.driver = None
+
+
+DriverFactory = Callable[[str], WebDriverManager]
+
+
+class WebDriverPool:
+    """Queue of pre-warmed WebDriverManager instances for concurrent vision captures.
+
+    The first driver is started synchronously so configuration errors surface
+    immediately; the rest warm up on background threads and join the idle
+    queue when ready. A capture borrows an idle driver, and a driver whose
+    capture raises is discarded and replaced in the background.
+    Failed warm-ups retry with exponential backoff, and every capture tops the
+    pool back up to ``size``, so a bad browser start cannot shrink it for good.
+    """
+
+    def __init__(
+        self,
+        base_url: str = "http://127.0.0.1:5000/",
+        size: int = DEFAULT_POOL_SIZE,
+        driver_factory: DriverFactory = WebDriverManager,
+        acquire_timeout: float = DEFAULT_ACQUIRE_TIMEOUT_SECONDS,
+        warmup_backoff: float = WARMUP_BACKOFF_SECONDS,
+    ) -> None:
+        """Initialize the pool.
+
+        Args:
+            base_url: Base URL for the MatHud application
+            size: Number of drivers kept warm (at least 1)
+            driver_factory: Creates a ready driver for a base URL, injectable for tests
+            acquire_timeout: Seconds a capture waits for an idle driver
+            warmup_backoff: Seconds before the first warm-up retry; doubles per retry
+        """
+        self.base_url = base_url
+        self.size = max(1, size)
+        self.acquire_timeout = acquire_timeout
+        self.warmup_backoff = warmup_backoff
+        self._factory = driver_factory
+        self._idle: queue.Queue[WebDriverManager] = queue.Queue()
+        self._drivers: List[WebDriverManager] = []
+        self._lock = threading.Lock()
+        self._closed = False
+        self._stopped = threading.Event()
+        self._warming = 0
+        self._warm_failures = 0
+        self._timings: Deque[Dict[str, float]] = deque(maxlen=_TIMING_HISTORY)
+
+        self._add_driver(self._factory(base_url))
+        self._top_up()
+
+    @staticmethod
+    def size_from_env() -> int:
+        """Read the pool size from WEBDRIVER_POOL_SIZE."""
+        try:
+            return int(os.getenv(WEBDRIVER_POOL_SIZE_ENV, str(DEFAULT_POOL_SIZE)))
+        except ValueError:
+            return DEFAULT_POOL_SIZE
+
+    @property
+    def ready_count(self) -> int:
+        """Number of drivers started so far."""
+        with self._lock:
+            return len(self._drivers)
+
+    def capture_png(self, svg_state: SvgState) -> Optional[bytes]:
+        """Capture an SVG state on the next idle driver.
+
+        Returns:
+            PNG bytes, or None when no driver became idle in time or the capture failed
+        """
+        self._top_up()
+        start = time.perf_counter()
+        try:
+            driver = self._idle.get(timeout=self.acquire_timeout)
+        except queue.Empty:
+            print("WebDriver pool: no idle driver available for vision capture")
+            return None
+        queue_wait_ms = round((time.perf_counter() - start) * 1000.0, 2)
+
+        try:
+            png = driver.capture_png(svg_state)
+        except Exception as e:
+            print(f"Failed to capture canvas: {str(e)}")
+            logging.error(f"Failed to capture canvas: {str(e)}")
+            self._replace_driver(driver)
+            return None
+        self._idle.put(driver)
+
+        timings = dict(driver.last_capture_timings)
+        timings["queue_wait_ms"] = queue_wait_ms
+        timings["total_ms"] = round((time.perf_counter() - start) * 1000.0, 2)
+        with self._lock:
+            self._timings.append(timings)
+        _timing_logger.info("vision_capture %s", json.dumps(timings, sort_keys=True))
+        return png
+
+    def capture_svg_state(self, svg_state: SvgState) -> None:
+        """Capture and write canvas_snapshots/canvas.png, like WebDriverManager.capture_svg_state."""
+        png = self.capture_png(svg_state)
+        if png is None:
+            return
+        os.makedirs(CANVAS_SNAPSHOT_DIR, exist_ok=True)
+        with open(os.path.join(CANVAS_SNAPSHOT_DIR, "canvas.png"), "wb") as snapshot_file:
+            snapshot_file.write(png)
+
+    def timing_summary(self) -> Dict[str, Any]:
+        """Median and maximum of each capture phase over recent captures, plus the pool's driver shortfall."""
+        with self._lock:
+            history = list(self._timings)
+            drivers = len(self._drivers)
+            summary: Dict[str, Any] = {
+                "captures": len(history),
+                "drivers": drivers,
+                "size": self.size,
+                "missing": max(0, self.size - drivers),
+                "warming": self._warming,
+                "warm_failures": self._warm_failures,
+            }
+        if not history:
+            return summary
+        for phase in ("queue_wait_ms", "inject_ms", "ready_ms", "screenshot_ms", "total_ms"):
+            values = sorted(entry.get(phase, 0.0) for entry in history)
+            summary[phase] = {"p50": values[len(values) // 2], "max": values[-1]}
+        summary["last"] = history[-1]
+        return summary
+
+    def cleanup(self) -> None:
+        """Quit every driver in the pool."""
+        with self._lock:
+            self._closed = True
+            drivers, self._drivers = self._drivers, []
+        self._stopped.set()
+        for driver in drivers:
+            try:
+                driver.cleanup()
+            except Exception as e:
+                print(f"Error closing WebDriver: {e}")
+
+    def _add_driver(self, driver: WebDriverManager) -> None:
+        with self._lock:
+            if not self._closed:
+                self._drivers.append(driver)
+                self._idle.put(driver)
+                return
+        driver.cleanup()
+
+    def _top_up(self) -> None:
+        """Start warm-ups for drivers the pool is missing that are not already warming."""
+        with self._lock:
+            if self._closed:
+                return
+            missing = self.size - len(self._drivers) - self._warming
+            if missing <= 0:
+                return
+            self._warming += missing
+        for _ in range(missing):
+            self._warm_in_background()
+
+    def _warm_in_background(self) -> None:
+        """Start one driver on a background thread; callers have counted it in ``_warming``."""
+
+        def warm() -> None:
+            delay = self.warmup_backoff
+            try:
+                for attempt in range(WARMUP_RETRIES + 1):
+                    try:
+                        driver = self._factory(self.base_url)
+                    except Exception as e:
+                        with self._lock:
+                            self._warm_failures += 1
+                        print(f"WebDriver pool: failed to warm a driver (attempt {attempt + 1}): {e}")
+                        if attempt == WARMUP_RETRIES or self._stopped.wait(delay):
+                            return
+                        delay = min(delay * 2, WARMUP_BACKOFF_MAX_SECONDS)
+                        continue
+                    self._add_driver(driver)
+                    return
+            finally:
+                with self._lock:
+                    self._warming -= 1
+
+        threading.Thread(target=warm, name="webdriver-warmup", daemon=True).start()
+
+    def _replace_driver(self, driver: WebDriverManager) -> None:
+        with self._lock:
+            if driver in self._drivers:
+                self._drivers.remove(driver)
+        try:
+            driver.cleanup()
+        except Exception as e:
+            print(f"Error closing WebDriver: {e}")
+        self._top_up()
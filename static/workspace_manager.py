@@ -4,23 +4,109 @@ MatHud Server-Side Workspace Management
 Handles workspace file operations for saving and loading canvas states.
 Provides secure file operations with path validation and JSON-based storage.
 
+Each workspace directory keeps a small sidecar index (name, mtime, size,
+schema version, drawable counts per file) so listing and "load latest" never
+open workspace files that have not changed since they were last indexed.
+Index updates are serialized per directory. Files are written compactly,
+optionally gzip-compressed, via write-then-rename; loading never writes, so
+legacy files are migrated in memory and upgraded on disk when next saved.
+
 Dependencies:
     - os: File system operations and path validation
     - json: Workspace state serialization and deserialization
+    - gzip: Optional compressed workspace storage
+    - uuid: Unique temporary filenames for write-then-rename saves
     - re: Workspace name validation with regex
+    - threading / fcntl: Per-directory index locks (fcntl where available)
     - datetime: Timestamp generation for metadata
 """
 
 from __future__ import annotations
 
+import copy
+import gzip
 import json
 import os
 import re
+import threading
+import time
+import uuid
+from collections import OrderedDict
 from datetime import datetime
-from typing import Dict, List, Optional, TypedDict, Union, cast
+from typing import Dict, List, Optional, Tuple, TypedDict, Union, cast
+
+try:
+    import fcntl
+except ImportError:  # Windows: threads are still serialized, processes are not
+    fcntl = None  # type: ignore[assignment]
 
 WORKSPACES_DIR = "workspaces"
 CURRENT_WORKSPACE_SCHEMA_VERSION = 1
+WORKSPACE_INDEX_FILENAME = ".workspace_index"
+WORKSPACE_INDEX_VERSION = 1
+
+_JSON_SUFFIX = ".json"
+_GZIP_SUFFIX = ".json.gz"
+_CURRENT_WORKSPACE_PREFIX = "current_workspace_"
+_JSON_SEPARATORS = (",", ":")
+# A directory mtime is only trusted once the index scan happened this long
+# after it, so a change landing in the same timestamp tick is never missed.
+_INDEX_RACY_WINDOW_NS = 2_000_000_000
+# Autosaves are indexed from stat alone; their schema version is unknown until loaded.
+_UNREAD_SCHEMA_VERSION = -1
+# Migrated states of legacy-schema files kept per manager, keyed by (path, mtime_ns, size).
+_MIGRATED_STATE_CACHE_SIZE = 16
+
+WORKSPACE_INDEX_LOCK_FILENAME = ".workspace_index.lock"
+
+
+class _DirectoryLock:
+    """Serializes index read-modify-writes for one workspace directory.
+
+    Threads share one lock per directory; where ``fcntl`` is available the
+    outermost holder also takes an exclusive ``flock`` on a lock file, so other
+    server processes are excluded too.
+    """
+
+    def __init__(self, target_dir: str) -> None:
+        self._lock_path = os.path.join(target_dir, WORKSPACE_INDEX_LOCK_FILENAME)
+        self._lock = threading.RLock()
+        self._depth = 0
+        self._fd: Optional[int] = None
+
+    def __enter__(self) -> "_DirectoryLock":
+        self._lock.acquire()
+        if self._depth == 0 and fcntl is not None:
+            try:
+                fd = os.open(self._lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+            except OSError:
+                fd = None  # read-only directory: nothing will be written anyway
+            if fd is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                self._fd = fd
+        self._depth += 1
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._depth -= 1
+        if self._depth == 0 and self._fd is not None:
+            fd, self._fd = self._fd, None
+            fcntl.flock(fd, fcntl.LOCK_UN)
+            os.close(fd)
+        self._lock.release()
+
+
+_index_locks: Dict[str, _DirectoryLock] = {}
+_index_locks_guard = threading.Lock()
+
+
+def _index_lock(target_dir: str) -> _DirectoryLock:
+    """Return the process-wide lock for ``target_dir``, shared by every manager."""
+    with _index_locks_guard:
+        lock = _index_locks.get(target_dir)
+        if lock is None:
+            lock = _index_locks[target_dir] = _DirectoryLock(target_dir)
+        return lock
 
 JsonPrimitive = Union[str, int, float, bool, None]
 JsonValue = Union[JsonPrimitive, Dict[str, "JsonValue"], List["JsonValue"]]
@@ -39,6 +125,26 @@ class WorkspaceRecord(TypedDict):
     state: WorkspaceState
 
 
+class WorkspaceIndexEntry(TypedDict):
+    name: str
+    filename: str
+    mtime_ns: int
+    size: int
+    schema_version: int
+    last_modified: str
+    listable: bool
+    drawable_counts: Dict[str, int]
+
+
+class _DirectoryIndex:
+    """In-memory index of one workspace directory, keyed by filename."""
+
+    def __init__(self, entries: Dict[str, WorkspaceIndexEntry]):
+        self.entries = entries
+        self.dir_mtime_ns: Optional[int] = None
+        self.scanned_at_ns = 0
+
+
 class WorkspaceManager:
     """Server-side workspace file operations manager.
 
@@ -46,13 +152,17 @@ class WorkspaceManager:
     security validation and JSON-based state storage with metadata.
     """
 
-    def __init__(self, workspaces_dir: str = WORKSPACES_DIR):
+    def __init__(self, workspaces_dir: str = WORKSPACES_DIR, compress: bool = False):
         """Initialize the workspace manager.
 
         Args:
             workspaces_dir: Base directory for storing workspaces
+            compress: Save new workspaces gzip-compressed (``.json.gz``)
         """
         self.workspaces_dir = os.path.abspath(workspaces_dir)
+        self.compress = compress
+        self._indexes: Dict[str, _DirectoryIndex] = {}
+        self._migrated_states: "OrderedDict[Tuple[str, int, int], WorkspaceState]" = OrderedDict()
         self.ensure_workspaces_dir()
 
     def _is_safe_workspace_name(self, name: Optional[str]) -> bool:
@@ -163,14 +273,60 @@ class WorkspaceManager:
             }
 
             file_path = self.get_workspace_path(name, test_dir)
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(workspace_data, f, indent=2)
-
+            self._write_workspace_record(file_path, workspace_data, self.compress)
             return True
         except (ValueError, OSError) as e:
             print(f"Error saving workspace: {str(e)}")
             return False
 
+    def _write_workspace_record(self, json_path: str, record: WorkspaceRecord, compress: bool) -> None:
+        """Atomically write a record next to ``json_path`` and update the index.
+
+        The plain and gzip variants of a workspace never coexist: writing one
+        removes the other.
+        """
+        payload = json.dumps(record, separators=_JSON_SEPARATORS).encode("utf-8")
+        if compress:
+            payload = gzip.compress(payload, mtime=0)
+        target_path = json_path + ".gz" if compress else json_path
+        stale_path = json_path if compress else json_path + ".gz"
+        target_dir = os.path.dirname(target_path)
+
+        with _index_lock(target_dir):
+            self._atomic_write(target_path, payload)
+            if os.path.exists(stale_path):
+                os.remove(stale_path)
+
+            index = self._sync_index(target_dir)
+            index.entries.pop(os.path.basename(stale_path), None)
+            filename = os.path.basename(target_path)
+            index.entries[filename] = self._build_index_entry(filename, os.stat(target_path), cast(JsonValue, record))
+            if self._is_autosave(filename):
+                index.dir_mtime_ns = None
+            else:
+                self._persist_index(target_dir, index)
+
+    def _atomic_write(self, path: str, payload: bytes, durable: bool = True) -> None:
+        """Write ``payload`` to a temporary file in the same directory, then rename it over ``path``.
+
+        ``durable`` fsyncs before the rename; the rebuildable index skips it.
+        """
+        # Not tempfile.mkstemp: that creates the file 0600 instead of honouring the umask
+        temp_path = os.path.join(os.path.dirname(path), f".tmp_{os.path.basename(path)}.{uuid.uuid4().hex}")
+        try:
+            with open(temp_path, "xb") as f:
+                f.write(payload)
+                if durable:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(temp_path, path)
+        except BaseException:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            raise
+
     def _get_most_recent_current_workspace(self, test_dir: Optional[str] = None) -> str:
         """Get the path of the most recent current workspace.
 
@@ -184,18 +340,23 @@ class WorkspaceManager:
             FileNotFoundError: If no current workspace exists
         """
         target_dir = self.ensure_workspaces_dir(test_dir)
-        current_workspaces: List[str] = []
-
-        for filename in os.listdir(target_dir):
-            if filename.startswith("current_workspace_") and filename.endswith(".json"):
-                file_path = os.path.join(target_dir, filename)
-                current_workspaces.append(file_path)
+        with _index_lock(target_dir):
+            entries = list(self._get_index(target_dir).entries.values())
+        current_workspaces = [entry for entry in entries if self._is_autosave(entry["filename"])]
 
         if not current_workspaces:
             raise FileNotFoundError("No current workspace found")
 
-        current_workspaces.sort(key=lambda x: os.path.getmtime(x), reverse=True)
-        return current_workspaces[0]
+        latest = max(current_workspaces, key=lambda entry: entry["mtime_ns"])
+        return os.path.join(target_dir, latest["filename"])
+
+    def _resolve_workspace_file(self, name: str, test_dir: Optional[str] = None) -> str:
+        """Return the stored file for a named workspace, preferring the newer of ``.json``/``.json.gz``."""
+        json_path = self.get_workspace_path(name, test_dir)
+        candidates = [path for path in (json_path, json_path + ".gz") if os.path.exists(path)]
+        if not candidates:
+            return json_path
+        return max(candidates, key=lambda path: os.stat(path).st_mtime_ns)
 
     def load_workspace(self, name: Optional[str] = None, test_dir: Optional[str] = None) -> WorkspaceState:
         """Load a workspace state from a file.
@@ -211,26 +372,66 @@ class WorkspaceManager:
             if name is None:
                 file_path = self._get_most_recent_current_workspace(test_dir)
             else:
-                file_path = self.get_workspace_path(name, test_dir)
+                file_path = self._resolve_workspace_file(name, test_dir)
 
             if not os.path.exists(file_path):
                 raise FileNotFoundError(f"No workspace found at {file_path}")
 
-            with open(file_path, "r", encoding="utf-8") as f:
-                workspace_data_raw: JsonValue = json.load(f)
+            file_stat = os.stat(file_path)
+            target_dir = os.path.dirname(file_path)
+            filename = os.path.basename(file_path)
+            cache_key = (file_path, file_stat.st_mtime_ns, file_stat.st_size)
+            with _index_lock(target_dir):
+                migrated = self._migrated_states.get(cache_key)
+                if migrated is not None:
+                    self._migrated_states.move_to_end(cache_key)
+                    return copy.deepcopy(migrated)
+
+            workspace_data_raw = self._read_workspace_file(file_path)
 
             if not isinstance(workspace_data_raw, dict):
                 raise ValueError("Workspace file is not a JSON object")
+
+            with _index_lock(target_dir):
+                index = self._peek_index(target_dir)
+                entry = index.entries.get(filename)
+                if (
+                    entry is not None
+                    and entry["mtime_ns"] == file_stat.st_mtime_ns
+                    and entry["size"] == file_stat.st_size
+                    and entry["schema_version"] == CURRENT_WORKSPACE_SCHEMA_VERSION
+                    and isinstance(workspace_data_raw.get("metadata"), dict)
+                    and "state" in workspace_data_raw
+                ):
+                    # Already at the current schema; nothing to migrate.
+                    return cast(WorkspaceState, workspace_data_raw["state"])
+                # Remember what the file holds (in memory only): loading never writes
+                index.entries[filename] = self._build_index_entry(filename, file_stat, workspace_data_raw)
+
+            # Older schemas are migrated in memory once per file version; the file is
+            # only upgraded when the workspace is saved again
             normalized = self._normalize_and_migrate_workspace_record(
                 workspace_data_raw,
-                workspace_name=(name or "current"),
+                workspace_name=self._workspace_stem(filename) or "current",
             )
+            with _index_lock(target_dir):
+                self._migrated_states[cache_key] = copy.deepcopy(normalized["state"])
+                while len(self._migrated_states) > _MIGRATED_STATE_CACHE_SIZE:
+                    self._migrated_states.popitem(last=False)
             return normalized["state"]
         except FileNotFoundError:
             raise
         except Exception as e:
             raise ValueError(f"Error loading workspace: {str(e)}")
 
+    def _read_workspace_file(self, file_path: str) -> JsonValue:
+        """Parse a plain or gzip-compressed workspace file."""
+        if file_path.endswith(_GZIP_SUFFIX):
+            with gzip.open(file_path, "rt", encoding="utf-8") as f:
+                return cast(JsonValue, json.load(f))
+        with open(file_path, "r", encoding="utf-8") as f:
+            return cast(JsonValue, json.load(f))
+
     def _normalize_and_migrate_workspace_record(
         self,
         workspace_data_raw: JsonObject,
@@ -302,35 +503,190 @@ class WorkspaceManager:
         Returns:
             A list of workspace names (without .json extension)
         """
+        return [entry["name"] for entry in self.describe_workspaces(test_dir)]
+
+    def describe_workspaces(self, test_dir: Optional[str] = None) -> List[WorkspaceIndexEntry]:
+        """List index entries (size, mtime, schema version, drawable counts) for saved workspaces.
+
+        Answered from the directory index; only files changed since they were
+        last indexed are opened.
+
+        Args:
+            test_dir: Optional test directory path relative to workspaces_dir
+
+        Returns:
+            Index entries for named workspaces, sorted by name
+        """
         target_dir = self.ensure_workspaces_dir(test_dir)
-        workspaces: List[str] = []
+        with _index_lock(target_dir):
+            entries = list(self._get_index(target_dir).entries.values())
+        by_name: Dict[str, WorkspaceIndexEntry] = {}
+        for entry in entries:
+            if not entry["listable"] or self._is_autosave(entry["filename"]):
+                continue
+            existing = by_name.get(entry["name"])
+            if existing is None or entry["mtime_ns"] > existing["mtime_ns"]:
+                by_name[entry["name"]] = entry
+        return [by_name[name] for name in sorted(by_name)]
+
+    def _workspace_stem(self, filename: str) -> Optional[str]:
+        """Return the workspace name for a workspace filename, or None for other files."""
+        if filename.startswith("."):
+            return None
+        if filename.endswith(_GZIP_SUFFIX):
+            return filename[: -len(_GZIP_SUFFIX)]
+        if filename.endswith(_JSON_SUFFIX):
+            return filename[: -len(_JSON_SUFFIX)]
+        return None
+
+    def _is_autosave(self, filename: str) -> bool:
+        """Return True for timestamped ``current_workspace_*`` autosave files."""
+        return filename.startswith(_CURRENT_WORKSPACE_PREFIX)
+
+    def _build_index_entry(self, filename: str, file_stat: os.stat_result, data: JsonValue) -> WorkspaceIndexEntry:
+        """Summarize a parsed workspace file for the directory index."""
+        name = self._workspace_stem(filename) or filename
+        schema_version = 0
+        last_modified = ""
+        listable = False
+        drawable_counts: Dict[str, int] = {}
+        if isinstance(data, dict):
+            metadata = data.get("metadata")
+            state = data.get("state", data)
+            if isinstance(metadata, dict):
+                schema_version = self._parse_schema_version(metadata.get("schema_version"))
+                last_modified_raw = metadata.get("last_modified")
+                last_modified = last_modified_raw if isinstance(last_modified_raw, str) else ""
+                listable = "state" in data and metadata.get("name") == name
+            if isinstance(state, dict):
+                drawable_counts = {key: len(value) for key, value in state.items() if isinstance(value, list)}
+        return {
+            "name": name,
+            "filename": filename,
+            "mtime_ns": file_stat.st_mtime_ns,
+            "size": file_stat.st_size,
+            "schema_version": schema_version,
+            "last_modified": last_modified,
+            "listable": listable,
+            "drawable_counts": drawable_counts,
+        }
+
+    def _index_file(self, target_dir: str, filename: str, file_stat: os.stat_result) -> WorkspaceIndexEntry:
+        """Open and index one workspace file; unreadable files are indexed as unlistable.
 
-        for filename in os.listdir(target_dir):
-            if filename.endswith(".json"):
-                name_without_extension = filename[:-5]
-                if name_without_extension.startswith("current_workspace_"):
+        Autosaves are never listed and "load latest" only needs their mtime,
+        so they are indexed from ``file_stat`` without being opened.
+        """
+        if self._is_autosave(filename):
+            return {
+                "name": self._workspace_stem(filename) or filename,
+                "filename": filename,
+                "mtime_ns": file_stat.st_mtime_ns,
+                "size": file_stat.st_size,
+                "schema_version": _UNREAD_SCHEMA_VERSION,
+                "last_modified": "",
+                "listable": False,
+                "drawable_counts": {},
+            }
+        data: JsonValue = None
+        try:
+            data = self._read_workspace_file(os.path.join(target_dir, filename))
+        except json.JSONDecodeError:
+            pass
+        except Exception as e:
+            print(f"Skipping file {filename} due to error: {e}")
+        return self._build_index_entry(filename, file_stat, data)
+
+    def _peek_index(self, target_dir: str) -> _DirectoryIndex:
+        """Return the in-memory index for a directory without rescanning it."""
+        index = self._indexes.get(target_dir)
+        if index is None:
+            index = _DirectoryIndex(self._load_persisted_index(target_dir))
+            self._indexes[target_dir] = index
+        return index
+
+    def _sync_index(self, target_dir: str) -> _DirectoryIndex:
+        """Return the in-memory index plus entries other writers persisted since it was read.
+
+        Used before modifying and persisting the index, with ``_index_lock(target_dir)``
+        held, so entries saved by another manager or process are not dropped.
+        Merged entries are still checked against each file's mtime and size on rescan.
+        """
+        index = self._peek_index(target_dir)
+        for filename, entry in self._load_persisted_index(target_dir).items():
+            index.entries.setdefault(filename, entry)
+        return index
+
+    def _get_index(self, target_dir: str) -> _DirectoryIndex:
+        """Return the up-to-date index for a workspace directory.
+
+        While the directory mtime is unchanged (outside the racy window) the
+        cached index is returned as is. Otherwise the directory is rescanned:
+        files whose mtime and size match their entry keep it, and only new or
+        changed files are opened. Callers hold ``_index_lock(target_dir)``.
+        """
+        index = self._peek_index(target_dir)
+        scan_started_ns = time.time_ns()
+        dir_mtime_ns = os.stat(target_dir).st_mtime_ns
+        if index.dir_mtime_ns == dir_mtime_ns and index.scanned_at_ns - dir_mtime_ns > _INDEX_RACY_WINDOW_NS:
+            return index
+
+        entries: Dict[str, WorkspaceIndexEntry] = {}
+        changed = False
+        with os.scandir(target_dir) as it:
+            for dir_entry in it:
+                if self._workspace_stem(dir_entry.name) is None or not dir_entry.is_file():
                     continue
+                file_stat = dir_entry.stat()
+                cached = index.entries.get(dir_entry.name)
+                if (
+                    cached is not None
+                    and cached["mtime_ns"] == file_stat.st_mtime_ns
+                    and cached["size"] == file_stat.st_size
+                ):
+                    entries[dir_entry.name] = cached
+                else:
+                    entries[dir_entry.name] = self._index_file(target_dir, dir_entry.name, file_stat)
+                    changed = changed or not self._is_autosave(dir_entry.name)
+        changed = changed or any(
+            filename not in entries and not self._is_autosave(filename) for filename in index.entries
+        )
 
-                file_path = os.path.join(target_dir, filename)
-                try:
-                    with open(file_path, "r", encoding="utf-8") as f:
-                        data_raw: JsonValue = json.load(f)
-                    if isinstance(data_raw, dict):
-                        metadata_candidate = data_raw.get("metadata")
-                        has_state_key = "state" in data_raw
-                        if (
-                            isinstance(metadata_candidate, dict)
-                            and "name" in metadata_candidate
-                            and has_state_key
-                            and metadata_candidate.get("name") == name_without_extension
-                        ):
-                            workspaces.append(name_without_extension)
-                except json.JSONDecodeError:
-                    pass
-                except Exception as e:
-                    print(f"Skipping file {filename} due to error: {e}")
-                    pass
-        return workspaces
+        index.entries = entries
+        if changed:
+            self._persist_index(target_dir, index)
+        else:
+            index.dir_mtime_ns = dir_mtime_ns
+            index.scanned_at_ns = scan_started_ns
+        return index
+
+    def _load_persisted_index(self, target_dir: str) -> Dict[str, WorkspaceIndexEntry]:
+        """Read the sidecar index, returning no entries if it is missing, stale-format, or corrupt."""
+        try:
+            with open(os.path.join(target_dir, WORKSPACE_INDEX_FILENAME), "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != WORKSPACE_INDEX_VERSION:
+            return {}
+        entries = data.get("entries")
+        return cast(Dict[str, WorkspaceIndexEntry], entries) if isinstance(entries, dict) else {}
+
+    def _persist_index(self, target_dir: str, index: _DirectoryIndex) -> None:
+        """Write the sidecar index; the directory must be rescanned before its mtime is trusted again.
+
+        Autosave entries are left out: they are rebuilt from stat alone, and
+        keeping them out keeps the index small no matter how many accumulate.
+        """
+        index.dir_mtime_ns = None
+        entries = {filename: entry for filename, entry in index.entries.items() if not self._is_autosave(filename)}
+        payload = json.dumps(
+            {"version": WORKSPACE_INDEX_VERSION, "entries": entries}, separators=_JSON_SEPARATORS
+        ).encode("utf-8")
+        try:
+            self._atomic_write(os.path.join(target_dir, WORKSPACE_INDEX_FILENAME), payload, durable=False)
+        except OSError as e:
+            print(f"Could not write workspace index: {e}")
 
     def delete_workspace(self, name: str, test_dir: Optional[str] = None) -> bool:
         """Delete a workspace file.
@@ -346,14 +702,21 @@ class WorkspaceManager:
             if not self._is_safe_workspace_name(name):
                 return False
 
-            file_path = self.get_workspace_path(name, test_dir)
-            if not os.path.exists(file_path):
+            json_path = self.get_workspace_path(name, test_dir)
+            file_paths = [path for path in (json_path, json_path + ".gz") if os.path.exists(path)]
+            if not file_paths:
                 return False
 
-            if not self._is_path_in_workspace_dir(file_path):
+            if not all(self._is_path_in_workspace_dir(path) for path in file_paths):
                 return False
 
-            os.remove(file_path)
+            target_dir = os.path.dirname(json_path)
+            with _index_lock(target_dir):
+                index = self._sync_index(target_dir)
+                for path in file_paths:
+                    os.remove(path)
+                    index.entries.pop(os.path.basename(path), None)
+                self._persist_index(target_dir, index)
             return True
         except (ValueError, OSError) as e:
             print(f"Error deleting workspace: {str(e)}")